@@ -5,5625 +5,5627 @@
 
 /*
  * This is automatically generated contents. You are advised not to change
- * it manually. You can recreate it (with given parameter types and count)
- * using types_generate.py in Emulator/Main.
+ * it manually. You can recreate it (with given parameter types)
+ * using Tools/scripts/types_generate.py.
  */
 
-#define EMUL8_EXT_TYPE_func_string FuncString
-#define EMUL8_EXT_TYPE_action_int32_uint64_uint32 ActionInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_string FuncIntPtrIntPtrString
-#define EMUL8_EXT_TYPE_action_string_uint64_intptr ActionStringUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32 FuncIntPtrIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_intptr FuncUInt64UInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_intptr_intptr FuncStringUInt64IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_string FuncStringString
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_uint32 FuncUInt64UInt64UInt32UInt32
-#define EMUL8_EXT_TYPE_action_uint64_uint64_int32 ActionUInt64UInt64Int32
-#define EMUL8_EXT_TYPE_func_uint32_string_uint64_string FuncUInt32StringUInt64String
-#define EMUL8_EXT_TYPE_func_string_intptr_intptr_int32 FuncStringIntPtrIntPtrInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_int32_string FuncInt32IntPtrInt32String
-#define EMUL8_EXT_TYPE_func_string_string_intptr_uint64 FuncStringStringIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_uint64 FuncUInt64UInt64UInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint64_intptr_string FuncUInt64IntPtrString
-#define EMUL8_EXT_TYPE_func_string_string_uint64_uint32 FuncStringStringUInt64UInt32
-#define EMUL8_EXT_TYPE_func_int32_string_intptr FuncInt32StringIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint32_string_uint32 FuncUInt64UInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_int32_string_int32_string FuncInt32StringInt32String
-#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_uint32 FuncIntPtrUInt64IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64_string_string FuncInt32UInt64StringString
-#define EMUL8_EXT_TYPE_func_intptr_intptr_int32_int32 FuncIntPtrIntPtrInt32Int32
+#define EMUL8_EXT_TYPE_action Action
+#define EMUL8_EXT_TYPE_action_int32 ActionInt32
+#define EMUL8_EXT_TYPE_action_int32_int32 ActionInt32Int32
+#define EMUL8_EXT_TYPE_action_int32_int32_int32 ActionInt32Int32Int32
+#define EMUL8_EXT_TYPE_action_int32_int32_intptr ActionInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_action_int32_int32_string ActionInt32Int32String
+#define EMUL8_EXT_TYPE_action_int32_int32_uint32 ActionInt32Int32UInt32
 #define EMUL8_EXT_TYPE_action_int32_int32_uint64 ActionInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_int32_uint32_string_string FuncInt32UInt32StringString
-#define EMUL8_EXT_TYPE_func_string_uint64_uint32_int32 FuncStringUInt64UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_uint64 FuncUInt64IntPtrInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_intptr_string_int32 FuncUInt64IntPtrStringInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint64 FuncInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_string_uint64 FuncStringIntPtrStringUInt64
-#define EMUL8_EXT_TYPE_action_intptr_string_uint64 ActionIntPtrStringUInt64
-#define EMUL8_EXT_TYPE_action_intptr_intptr_intptr ActionIntPtrIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint32_uint64 FuncStringUInt32UInt64
-#define EMUL8_EXT_TYPE_action_uint32_intptr_uint64 ActionUInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_string FuncUInt64UInt64Int32String
-#define EMUL8_EXT_TYPE_func_string_intptr_uint64_uint64 FuncStringIntPtrUInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_int32 FuncUInt64IntPtrIntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_uint64 FuncUInt32UInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_action_uint32_uint64_intptr ActionUInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_intptr_string_uint32 FuncUInt64IntPtrStringUInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32 FuncUInt32Int32
-#define EMUL8_EXT_TYPE_func_int32_intptr_string_string FuncInt32IntPtrStringString
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_string FuncIntPtrUInt32UInt64String
-#define EMUL8_EXT_TYPE_func_string_intptr_uint32_intptr FuncStringIntPtrUInt32IntPtr
-#define EMUL8_EXT_TYPE_action_int32_intptr_uint64 ActionInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_action_uint32_intptr_intptr ActionUInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_action_uint64_uint64_uint64 ActionUInt64UInt64UInt64
-#define EMUL8_EXT_TYPE_func_intptr_string_intptr_uint64 FuncIntPtrStringIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_string_uint64_int32 FuncStringStringUInt64Int32
-#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_uint64 FuncInt32UInt64IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_uint32_uint64_uint32 FuncStringUInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_string_int32_uint32_uint32 FuncStringInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_uint64 FuncIntPtrIntPtrUInt32UInt64
+#define EMUL8_EXT_TYPE_action_int32_intptr ActionInt32IntPtr
 #define EMUL8_EXT_TYPE_action_int32_intptr_int32 ActionInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32 FuncUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32 FuncUInt64IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_intptr FuncIntPtrUInt64UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint32_string_uint64 FuncInt32UInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_uint64 FuncIntPtrIntPtrIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_int32_uint32_intptr_intptr FuncInt32UInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_string_uint32 FuncIntPtrStringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_intptr FuncIntPtrInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_string_string_uint32 FuncIntPtrStringStringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_string_string_int32 FuncIntPtrStringStringInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_intptr_intptr FuncInt32IntPtrIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_int32_string_string FuncStringInt32StringString
-#define EMUL8_EXT_TYPE_func_string_intptr_intptr_string FuncStringIntPtrIntPtrString
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_intptr FuncInt32IntPtrUInt32IntPtr
-#define EMUL8_EXT_TYPE_action_int32 ActionInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_intptr_string FuncInt32IntPtrIntPtrString
-#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_uint32 FuncUInt64UInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_string_intptr_uint32 FuncIntPtrStringIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_uint64 FuncUInt64Int32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_int32 FuncUInt64UInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_string_uint32 FuncUInt64UInt64StringUInt32
-#define EMUL8_EXT_TYPE_action_string_string_int32 ActionStringStringInt32
-#define EMUL8_EXT_TYPE_action_string_uint32 ActionStringUInt32
-#define EMUL8_EXT_TYPE_func_uint64_string_uint64 FuncUInt64StringUInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32 FuncUInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_uint64 FuncInt32UInt64UInt64UInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_uint64 FuncIntPtrUInt64UInt32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_string_uint32_string FuncIntPtrStringUInt32String
-#define EMUL8_EXT_TYPE_action_string_uint32_intptr ActionStringUInt32IntPtr
+#define EMUL8_EXT_TYPE_action_int32_intptr_intptr ActionInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_action_int32_intptr_string ActionInt32IntPtrString
+#define EMUL8_EXT_TYPE_action_int32_intptr_uint32 ActionInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_action_int32_intptr_uint64 ActionInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_action_int32_string ActionInt32String
+#define EMUL8_EXT_TYPE_action_int32_string_int32 ActionInt32StringInt32
+#define EMUL8_EXT_TYPE_action_int32_string_intptr ActionInt32StringIntPtr
+#define EMUL8_EXT_TYPE_action_int32_string_string ActionInt32StringString
+#define EMUL8_EXT_TYPE_action_int32_string_uint32 ActionInt32StringUInt32
+#define EMUL8_EXT_TYPE_action_int32_string_uint64 ActionInt32StringUInt64
+#define EMUL8_EXT_TYPE_action_int32_uint32 ActionInt32UInt32
+#define EMUL8_EXT_TYPE_action_int32_uint32_int32 ActionInt32UInt32Int32
+#define EMUL8_EXT_TYPE_action_int32_uint32_intptr ActionInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_action_int32_uint32_string ActionInt32UInt32String
+#define EMUL8_EXT_TYPE_action_int32_uint32_uint32 ActionInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_action_int32_uint32_uint64 ActionInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_action_int32_uint64 ActionInt32UInt64
+#define EMUL8_EXT_TYPE_action_int32_uint64_int32 ActionInt32UInt64Int32
+#define EMUL8_EXT_TYPE_action_int32_uint64_intptr ActionInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_action_int32_uint64_string ActionInt32UInt64String
+#define EMUL8_EXT_TYPE_action_int32_uint64_uint32 ActionInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_action_int32_uint64_uint64 ActionInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_action_intptr ActionIntPtr
+#define EMUL8_EXT_TYPE_action_intptr_int32 ActionIntPtrInt32
+#define EMUL8_EXT_TYPE_action_intptr_int32_int32 ActionIntPtrInt32Int32
+#define EMUL8_EXT_TYPE_action_intptr_int32_intptr ActionIntPtrInt32IntPtr
+#define EMUL8_EXT_TYPE_action_intptr_int32_string ActionIntPtrInt32String
+#define EMUL8_EXT_TYPE_action_intptr_int32_uint32 ActionIntPtrInt32UInt32
+#define EMUL8_EXT_TYPE_action_intptr_int32_uint64 ActionIntPtrInt32UInt64
+#define EMUL8_EXT_TYPE_action_intptr_intptr ActionIntPtrIntPtr
+#define EMUL8_EXT_TYPE_action_intptr_intptr_int32 ActionIntPtrIntPtrInt32
+#define EMUL8_EXT_TYPE_action_intptr_intptr_intptr ActionIntPtrIntPtrIntPtr
+#define EMUL8_EXT_TYPE_action_intptr_intptr_string ActionIntPtrIntPtrString
+#define EMUL8_EXT_TYPE_action_intptr_intptr_uint32 ActionIntPtrIntPtrUInt32
+#define EMUL8_EXT_TYPE_action_intptr_intptr_uint64 ActionIntPtrIntPtrUInt64
+#define EMUL8_EXT_TYPE_action_intptr_string ActionIntPtrString
+#define EMUL8_EXT_TYPE_action_intptr_string_int32 ActionIntPtrStringInt32
+#define EMUL8_EXT_TYPE_action_intptr_string_intptr ActionIntPtrStringIntPtr
+#define EMUL8_EXT_TYPE_action_intptr_string_string ActionIntPtrStringString
+#define EMUL8_EXT_TYPE_action_intptr_string_uint32 ActionIntPtrStringUInt32
+#define EMUL8_EXT_TYPE_action_intptr_string_uint64 ActionIntPtrStringUInt64
+#define EMUL8_EXT_TYPE_action_intptr_uint32 ActionIntPtrUInt32
+#define EMUL8_EXT_TYPE_action_intptr_uint32_int32 ActionIntPtrUInt32Int32
+#define EMUL8_EXT_TYPE_action_intptr_uint32_intptr ActionIntPtrUInt32IntPtr
+#define EMUL8_EXT_TYPE_action_intptr_uint32_string ActionIntPtrUInt32String
 #define EMUL8_EXT_TYPE_action_intptr_uint32_uint32 ActionIntPtrUInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_int32_int32 FuncStringUInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_intptr_int32_int32_uint64 FuncIntPtrInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_int32_string_string_uint64 FuncInt32StringStringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_uint32 FuncIntPtrUInt64Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_int32 FuncUInt32Int32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_int32 FuncUInt32Int32UInt64Int32
-#define EMUL8_EXT_TYPE_func_string_uint64_uint32 FuncStringUInt64UInt32
+#define EMUL8_EXT_TYPE_action_intptr_uint32_uint64 ActionIntPtrUInt32UInt64
+#define EMUL8_EXT_TYPE_action_intptr_uint64 ActionIntPtrUInt64
+#define EMUL8_EXT_TYPE_action_intptr_uint64_int32 ActionIntPtrUInt64Int32
+#define EMUL8_EXT_TYPE_action_intptr_uint64_intptr ActionIntPtrUInt64IntPtr
+#define EMUL8_EXT_TYPE_action_intptr_uint64_string ActionIntPtrUInt64String
 #define EMUL8_EXT_TYPE_action_intptr_uint64_uint32 ActionIntPtrUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_intptr FuncUInt64IntPtrUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_int32 FuncUInt32UInt32UInt64Int32
-#define EMUL8_EXT_TYPE_action_uint32_int32 ActionUInt32Int32
-#define EMUL8_EXT_TYPE_func_intptr_int32_string_string FuncIntPtrInt32StringString
-#define EMUL8_EXT_TYPE_func_uint64_string_string_uint64 FuncUInt64StringStringUInt64
-#define EMUL8_EXT_TYPE_func_uint64_intptr_string_string FuncUInt64IntPtrStringString
-#define EMUL8_EXT_TYPE_func_uint32_uint32 FuncUInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_uint64_int32 FuncStringUInt64Int32
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_intptr FuncInt32UInt64UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_string FuncUInt64UInt64IntPtrString
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_int32 FuncUInt64UInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_intptr_string_int32_intptr FuncIntPtrStringInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint32 FuncUInt32Int32UInt32
+#define EMUL8_EXT_TYPE_action_intptr_uint64_uint64 ActionIntPtrUInt64UInt64
+#define EMUL8_EXT_TYPE_action_string ActionString
+#define EMUL8_EXT_TYPE_action_string_int32 ActionStringInt32
+#define EMUL8_EXT_TYPE_action_string_int32_int32 ActionStringInt32Int32
+#define EMUL8_EXT_TYPE_action_string_int32_intptr ActionStringInt32IntPtr
+#define EMUL8_EXT_TYPE_action_string_int32_string ActionStringInt32String
+#define EMUL8_EXT_TYPE_action_string_int32_uint32 ActionStringInt32UInt32
+#define EMUL8_EXT_TYPE_action_string_int32_uint64 ActionStringInt32UInt64
+#define EMUL8_EXT_TYPE_action_string_intptr ActionStringIntPtr
+#define EMUL8_EXT_TYPE_action_string_intptr_int32 ActionStringIntPtrInt32
+#define EMUL8_EXT_TYPE_action_string_intptr_intptr ActionStringIntPtrIntPtr
+#define EMUL8_EXT_TYPE_action_string_intptr_string ActionStringIntPtrString
+#define EMUL8_EXT_TYPE_action_string_intptr_uint32 ActionStringIntPtrUInt32
+#define EMUL8_EXT_TYPE_action_string_intptr_uint64 ActionStringIntPtrUInt64
 #define EMUL8_EXT_TYPE_action_string_string ActionStringString
-#define EMUL8_EXT_TYPE_func_uint64_int32_int32_intptr FuncUInt64Int32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_int32_uint64 FuncStringUInt64Int32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_string FuncUInt64UInt32IntPtrString
-#define EMUL8_EXT_TYPE_func_string_int32_uint32_uint64 FuncStringInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_string FuncStringIntPtrString
-#define EMUL8_EXT_TYPE_func_int32_string_int32_int32 FuncInt32StringInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_string_intptr_intptr FuncUInt64StringIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint64 FuncIntPtrInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_int32_intptr FuncStringInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64 FuncIntPtrUInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_string_intptr FuncUInt32StringIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_intptr FuncUInt32UInt64UInt64IntPtr
-#define EMUL8_EXT_TYPE_action_intptr_uint32_string ActionIntPtrUInt32String
-#define EMUL8_EXT_TYPE_func_string_int32_uint64_intptr FuncStringInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_string_uint64_uint64 FuncUInt32StringUInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint32_string_string_uint32 FuncUInt32StringStringUInt32
-#define EMUL8_EXT_TYPE_func_uint64_string_uint64_uint64 FuncUInt64StringUInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint64_string_string FuncUInt64UInt64StringString
-#define EMUL8_EXT_TYPE_func_string_string_int32_uint64 FuncStringStringInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_uint32 FuncStringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_int32 FuncIntPtrIntPtrIntPtrInt32
-#define EMUL8_EXT_TYPE_action_intptr_uint64 ActionIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_uint32_uint64_intptr FuncStringUInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_int32_string_int32_intptr FuncInt32StringInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint64 FuncUInt64Int32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_uint32 FuncIntPtrUInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_uint32 FuncInt32UInt64UInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_int32_string FuncInt32Int32Int32String
-#define EMUL8_EXT_TYPE_func_string_intptr_string_uint32 FuncStringIntPtrStringUInt32
-#define EMUL8_EXT_TYPE_action_uint64_uint32_uint32 ActionUInt64UInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_uint64 FuncUInt32Int32UInt64UInt64
-#define EMUL8_EXT_TYPE_action_int32_uint32_int32 ActionInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_intptr_string_intptr_int32 FuncIntPtrStringIntPtrInt32
+#define EMUL8_EXT_TYPE_action_string_string_int32 ActionStringStringInt32
+#define EMUL8_EXT_TYPE_action_string_string_intptr ActionStringStringIntPtr
+#define EMUL8_EXT_TYPE_action_string_string_string ActionStringStringString
+#define EMUL8_EXT_TYPE_action_string_string_uint32 ActionStringStringUInt32
+#define EMUL8_EXT_TYPE_action_string_string_uint64 ActionStringStringUInt64
+#define EMUL8_EXT_TYPE_action_string_uint32 ActionStringUInt32
+#define EMUL8_EXT_TYPE_action_string_uint32_int32 ActionStringUInt32Int32
+#define EMUL8_EXT_TYPE_action_string_uint32_intptr ActionStringUInt32IntPtr
+#define EMUL8_EXT_TYPE_action_string_uint32_string ActionStringUInt32String
+#define EMUL8_EXT_TYPE_action_string_uint32_uint32 ActionStringUInt32UInt32
+#define EMUL8_EXT_TYPE_action_string_uint32_uint64 ActionStringUInt32UInt64
+#define EMUL8_EXT_TYPE_action_string_uint64 ActionStringUInt64
+#define EMUL8_EXT_TYPE_action_string_uint64_int32 ActionStringUInt64Int32
+#define EMUL8_EXT_TYPE_action_string_uint64_intptr ActionStringUInt64IntPtr
 #define EMUL8_EXT_TYPE_action_string_uint64_string ActionStringUInt64String
-#define EMUL8_EXT_TYPE_func_int32_uint64_int32_uint64 FuncInt32UInt64Int32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_int32_string_uint64 FuncUInt64Int32StringUInt64
-#define EMUL8_EXT_TYPE_action_uint64_intptr_int32 ActionUInt64IntPtrInt32
-#define EMUL8_EXT_TYPE_func_int32_uint32_intptr FuncInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_string_intptr_int32_uint32 FuncStringIntPtrInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_string_int32_int32 FuncStringStringInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32_int32_int32_uint64 FuncUInt32Int32Int32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_intptr FuncIntPtrUInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_action_int32_int32_int32 ActionInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_string_uint32_int32_string FuncStringUInt32Int32String
-#define EMUL8_EXT_TYPE_func_string_string_uint32_uint64 FuncStringStringUInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_uint32 FuncUInt32UInt64UInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_uint64 FuncUInt64UInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_int32 FuncUInt64IntPtrInt32Int32
-#define EMUL8_EXT_TYPE_action_int32_uint64_uint64 ActionInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_action_int32_intptr_uint32 ActionInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_uint64 FuncInt32IntPtrUInt32UInt64
-#define EMUL8_EXT_TYPE_action_intptr_intptr_uint64 ActionIntPtrIntPtrUInt64
-#define EMUL8_EXT_TYPE_action_uint64_uint32_int32 ActionUInt64UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32_string_intptr_uint64 FuncUInt32StringIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_uint32_uint64_uint64 FuncStringUInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_string_string_uint32_intptr FuncStringStringUInt32IntPtr
+#define EMUL8_EXT_TYPE_action_string_uint64_uint32 ActionStringUInt64UInt32
+#define EMUL8_EXT_TYPE_action_string_uint64_uint64 ActionStringUInt64UInt64
+#define EMUL8_EXT_TYPE_action_uint32 ActionUInt32
+#define EMUL8_EXT_TYPE_action_uint32_int32 ActionUInt32Int32
 #define EMUL8_EXT_TYPE_action_uint32_int32_int32 ActionUInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_int32_uint32 FuncIntPtrIntPtrInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_string FuncUInt32String
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_uint64 FuncUInt32IntPtrUInt64UInt64
-#define EMUL8_EXT_TYPE_action_uint32_uint32_string ActionUInt32UInt32String
-#define EMUL8_EXT_TYPE_action_int32_intptr_string ActionInt32IntPtrString
-#define EMUL8_EXT_TYPE_func_int32_string_uint32_intptr FuncInt32StringUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_uint32 FuncUInt64UInt64UInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_intptr FuncUInt32IntPtrInt32IntPtr
-#define EMUL8_EXT_TYPE_action_uint64_intptr_intptr ActionUInt64IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint64 FuncIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_intptr_string_intptr_intptr FuncIntPtrStringIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_int32_string_int32 FuncInt32StringInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_uint32 FuncUInt32UInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_action_int32_string_uint32 ActionInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_uint64_int32_int32_int32 FuncUInt64Int32Int32Int32
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint32_uint64 FuncInt32UInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_action_int32_uint32_string ActionInt32UInt32String
-#define EMUL8_EXT_TYPE_func_string_string_string_string FuncStringStringStringString
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_uint64 FuncIntPtrUInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_int32_uint64 FuncStringIntPtrInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_uint64_intptr FuncStringUInt64IntPtr
-#define EMUL8_EXT_TYPE_action_string_uint32_string ActionStringUInt32String
-#define EMUL8_EXT_TYPE_func_uint32_string_int32_uint64 FuncUInt32StringInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_intptr FuncUInt32Int32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_string_uint64_uint32 FuncUInt32StringUInt64UInt32
-#define EMUL8_EXT_TYPE_func_string_int32_intptr_int32 FuncStringInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_string_int32_int32_uint32 FuncStringInt32Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_string FuncUInt32IntPtrIntPtrString
-#define EMUL8_EXT_TYPE_func_string_uint32_string_uint64 FuncStringUInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_int32_uint64_int32_string FuncInt32UInt64Int32String
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint64_intptr FuncInt32UInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_int32_string_int32 FuncUInt64Int32StringInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_string_uint64 FuncIntPtrUInt64StringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_string FuncIntPtrIntPtrIntPtrString
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_string FuncUInt32UInt64UInt64String
-#define EMUL8_EXT_TYPE_action_uint32_uint64_string ActionUInt32UInt64String
-#define EMUL8_EXT_TYPE_func_intptr_intptr_string_int32 FuncIntPtrIntPtrStringInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint32_intptr FuncInt32Int32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_intptr FuncUInt32IntPtrUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_uint64_string FuncStringUInt64UInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_string FuncUInt64UInt32UInt32String
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_uint32 FuncIntPtrUInt64UInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_string_uint64 FuncInt32Int32StringUInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint64_string_uint64 FuncUInt64UInt64StringUInt64
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_string FuncUInt64Int32UInt64String
-#define EMUL8_EXT_TYPE_action_string_intptr_int32 ActionStringIntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_string FuncUInt64UInt32String
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32 FuncIntPtrUInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr FuncUInt64UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_int32_intptr_int32 FuncIntPtrInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_int32 FuncInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_int32 FuncUInt64UInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_string_uint32_intptr FuncStringUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_string FuncIntPtrUInt64Int32String
-#define EMUL8_EXT_TYPE_func_int32_uint32_string_uint32 FuncInt32UInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_string_intptr_int32 FuncStringIntPtrInt32
-#define EMUL8_EXT_TYPE_action_intptr_uint64_uint64 ActionIntPtrUInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint64_string_int32_string FuncUInt64StringInt32String
-#define EMUL8_EXT_TYPE_action_intptr_intptr ActionIntPtrIntPtr
-#define EMUL8_EXT_TYPE_action_string_uint64 ActionStringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_uint64 FuncIntPtrInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_uint64_string FuncStringUInt64String
-#define EMUL8_EXT_TYPE_func_uint32_intptr_string_int32 FuncUInt32IntPtrStringInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_intptr_uint32 FuncStringUInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_string FuncUInt32UInt32String
-#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_string FuncIntPtrUInt32IntPtrString
+#define EMUL8_EXT_TYPE_action_uint32_int32_intptr ActionUInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_action_uint32_int32_string ActionUInt32Int32String
+#define EMUL8_EXT_TYPE_action_uint32_int32_uint32 ActionUInt32Int32UInt32
+#define EMUL8_EXT_TYPE_action_uint32_int32_uint64 ActionUInt32Int32UInt64
+#define EMUL8_EXT_TYPE_action_uint32_intptr ActionUInt32IntPtr
+#define EMUL8_EXT_TYPE_action_uint32_intptr_int32 ActionUInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_action_uint32_intptr_intptr ActionUInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_action_uint32_intptr_string ActionUInt32IntPtrString
+#define EMUL8_EXT_TYPE_action_uint32_intptr_uint32 ActionUInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_action_uint32_intptr_uint64 ActionUInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_action_uint32_string ActionUInt32String
+#define EMUL8_EXT_TYPE_action_uint32_string_int32 ActionUInt32StringInt32
 #define EMUL8_EXT_TYPE_action_uint32_string_intptr ActionUInt32StringIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_intptr_string FuncUInt32IntPtrString
-#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_intptr FuncUInt64Int32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_int32 FuncIntPtrInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_string_uint64_intptr_int32 FuncStringUInt64IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_uint32 FuncUInt32IntPtrInt32UInt32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_string_uint32 FuncIntPtrIntPtrStringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr FuncIntPtrUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_int32 FuncUInt64Int32UInt64Int32
-#define EMUL8_EXT_TYPE_action_string_int32_uint64 ActionStringInt32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_intptr_int32 FuncIntPtrIntPtrInt32
-#define EMUL8_EXT_TYPE_action_uint64_intptr_uint64 ActionUInt64IntPtrUInt64
+#define EMUL8_EXT_TYPE_action_uint32_string_string ActionUInt32StringString
+#define EMUL8_EXT_TYPE_action_uint32_string_uint32 ActionUInt32StringUInt32
+#define EMUL8_EXT_TYPE_action_uint32_string_uint64 ActionUInt32StringUInt64
+#define EMUL8_EXT_TYPE_action_uint32_uint32 ActionUInt32UInt32
+#define EMUL8_EXT_TYPE_action_uint32_uint32_int32 ActionUInt32UInt32Int32
+#define EMUL8_EXT_TYPE_action_uint32_uint32_intptr ActionUInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_action_uint32_uint32_string ActionUInt32UInt32String
+#define EMUL8_EXT_TYPE_action_uint32_uint32_uint32 ActionUInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_action_uint32_uint32_uint64 ActionUInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_action_uint32_uint64 ActionUInt32UInt64
+#define EMUL8_EXT_TYPE_action_uint32_uint64_int32 ActionUInt32UInt64Int32
+#define EMUL8_EXT_TYPE_action_uint32_uint64_intptr ActionUInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_action_uint32_uint64_string ActionUInt32UInt64String
+#define EMUL8_EXT_TYPE_action_uint32_uint64_uint32 ActionUInt32UInt64UInt32
 #define EMUL8_EXT_TYPE_action_uint32_uint64_uint64 ActionUInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_action_uint64 ActionUInt64
+#define EMUL8_EXT_TYPE_action_uint64_int32 ActionUInt64Int32
+#define EMUL8_EXT_TYPE_action_uint64_int32_int32 ActionUInt64Int32Int32
+#define EMUL8_EXT_TYPE_action_uint64_int32_intptr ActionUInt64Int32IntPtr
+#define EMUL8_EXT_TYPE_action_uint64_int32_string ActionUInt64Int32String
+#define EMUL8_EXT_TYPE_action_uint64_int32_uint32 ActionUInt64Int32UInt32
+#define EMUL8_EXT_TYPE_action_uint64_int32_uint64 ActionUInt64Int32UInt64
+#define EMUL8_EXT_TYPE_action_uint64_intptr ActionUInt64IntPtr
+#define EMUL8_EXT_TYPE_action_uint64_intptr_int32 ActionUInt64IntPtrInt32
+#define EMUL8_EXT_TYPE_action_uint64_intptr_intptr ActionUInt64IntPtrIntPtr
+#define EMUL8_EXT_TYPE_action_uint64_intptr_string ActionUInt64IntPtrString
+#define EMUL8_EXT_TYPE_action_uint64_intptr_uint32 ActionUInt64IntPtrUInt32
+#define EMUL8_EXT_TYPE_action_uint64_intptr_uint64 ActionUInt64IntPtrUInt64
+#define EMUL8_EXT_TYPE_action_uint64_string ActionUInt64String
+#define EMUL8_EXT_TYPE_action_uint64_string_int32 ActionUInt64StringInt32
+#define EMUL8_EXT_TYPE_action_uint64_string_intptr ActionUInt64StringIntPtr
+#define EMUL8_EXT_TYPE_action_uint64_string_string ActionUInt64StringString
+#define EMUL8_EXT_TYPE_action_uint64_string_uint32 ActionUInt64StringUInt32
+#define EMUL8_EXT_TYPE_action_uint64_string_uint64 ActionUInt64StringUInt64
+#define EMUL8_EXT_TYPE_action_uint64_uint32 ActionUInt64UInt32
+#define EMUL8_EXT_TYPE_action_uint64_uint32_int32 ActionUInt64UInt32Int32
+#define EMUL8_EXT_TYPE_action_uint64_uint32_intptr ActionUInt64UInt32IntPtr
+#define EMUL8_EXT_TYPE_action_uint64_uint32_string ActionUInt64UInt32String
+#define EMUL8_EXT_TYPE_action_uint64_uint32_uint32 ActionUInt64UInt32UInt32
+#define EMUL8_EXT_TYPE_action_uint64_uint32_uint64 ActionUInt64UInt32UInt64
 #define EMUL8_EXT_TYPE_action_uint64_uint64 ActionUInt64UInt64
-#define EMUL8_EXT_TYPE_func_int32_uint64_int32_uint32 FuncInt32UInt64Int32UInt32
-#define EMUL8_EXT_TYPE_func_string_string_int32_intptr FuncStringStringInt32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint32 FuncInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_action_int32_uint32_uint32 ActionInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_action_uint32_uint32 ActionUInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_uint32_intptr_uint64 FuncInt32UInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint32 FuncIntPtrInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint64_int32 FuncUInt64Int32
-#define EMUL8_EXT_TYPE_func_intptr_int32_intptr_intptr FuncIntPtrInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_string_uint64_string FuncIntPtrStringUInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_intptr FuncUInt64UInt64UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_int32 FuncInt32UInt64IntPtrInt32
-#define EMUL8_EXT_TYPE_func_string_intptr_string_intptr FuncStringIntPtrStringIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint32_int32_intptr FuncStringUInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_int32_string FuncUInt64Int32String
-#define EMUL8_EXT_TYPE_func_intptr_int32_int32 FuncIntPtrInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_intptr FuncUInt64Int32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64 FuncUInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_string_intptr_string FuncUInt64StringIntPtrString
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_uint32 FuncIntPtrInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint64_uint64 FuncInt32Int32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_intptr_string_int32_int32 FuncIntPtrStringInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr FuncUInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_string_string_int32_uint32 FuncStringStringInt32UInt32
-#define EMUL8_EXT_TYPE_action_uint32_int32_uint32 ActionUInt32Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_string FuncUInt32UInt32UInt64String
-#define EMUL8_EXT_TYPE_func_int32_int32_intptr_int32 FuncInt32Int32IntPtrInt32
+#define EMUL8_EXT_TYPE_action_uint64_uint64_int32 ActionUInt64UInt64Int32
+#define EMUL8_EXT_TYPE_action_uint64_uint64_intptr ActionUInt64UInt64IntPtr
+#define EMUL8_EXT_TYPE_action_uint64_uint64_string ActionUInt64UInt64String
+#define EMUL8_EXT_TYPE_action_uint64_uint64_uint32 ActionUInt64UInt64UInt32
+#define EMUL8_EXT_TYPE_action_uint64_uint64_uint64 ActionUInt64UInt64UInt64
+#define EMUL8_EXT_TYPE_func_int32 FuncInt32
+#define EMUL8_EXT_TYPE_func_int32_int32 FuncInt32Int32
+#define EMUL8_EXT_TYPE_func_int32_int32_int32 FuncInt32Int32Int32
 #define EMUL8_EXT_TYPE_func_int32_int32_int32_int32 FuncInt32Int32Int32Int32
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_uint64 FuncInt32UInt64UInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_uint32_string FuncStringIntPtrUInt32String
-#define EMUL8_EXT_TYPE_func_string_int32_uint64_string FuncStringInt32UInt64String
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint64_string FuncIntPtrIntPtrUInt64String
-#define EMUL8_EXT_TYPE_func_string_int32_int32_int32 FuncStringInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_uint32_string_int32 FuncUInt32StringInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_uint32_string FuncStringUInt32UInt32String
-#define EMUL8_EXT_TYPE_func_intptr_int32_intptr FuncIntPtrInt32IntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_intptr_uint64 FuncStringUInt64IntPtrUInt64
-#define EMUL8_EXT_TYPE_action_intptr_intptr_uint32 ActionIntPtrIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_intptr_uint64 FuncInt32IntPtrIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_int32_string_string_int32 FuncInt32StringStringInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_uint64 FuncUInt64UInt64Int32UInt64
+#define EMUL8_EXT_TYPE_func_int32_int32_int32_intptr FuncInt32Int32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_int32_int32_string FuncInt32Int32Int32String
+#define EMUL8_EXT_TYPE_func_int32_int32_int32_uint32 FuncInt32Int32Int32UInt32
+#define EMUL8_EXT_TYPE_func_int32_int32_int32_uint64 FuncInt32Int32Int32UInt64
+#define EMUL8_EXT_TYPE_func_int32_int32_intptr FuncInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_int32_intptr_int32 FuncInt32Int32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_int32_int32_intptr_intptr FuncInt32Int32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_int32_int32_intptr_string FuncInt32Int32IntPtrString
+#define EMUL8_EXT_TYPE_func_int32_int32_intptr_uint32 FuncInt32Int32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_int32_int32_intptr_uint64 FuncInt32Int32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_int32_int32_string FuncInt32Int32String
+#define EMUL8_EXT_TYPE_func_int32_int32_string_int32 FuncInt32Int32StringInt32
+#define EMUL8_EXT_TYPE_func_int32_int32_string_intptr FuncInt32Int32StringIntPtr
+#define EMUL8_EXT_TYPE_func_int32_int32_string_string FuncInt32Int32StringString
 #define EMUL8_EXT_TYPE_func_int32_int32_string_uint32 FuncInt32Int32StringUInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_uint32_uint64 FuncStringUInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_uint64 FuncUInt32UInt64UInt64UInt64
-#define EMUL8_EXT_TYPE_action_intptr_int32_int32 ActionIntPtrInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_string_uint32_int32 FuncUInt64StringUInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_intptr FuncUInt32Int32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint32_string_string FuncStringUInt32StringString
-#define EMUL8_EXT_TYPE_action_uint64_intptr_string ActionUInt64IntPtrString
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_uint64 FuncUInt32UInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_int32_int32_uint64 FuncStringInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_string_uint32_uint64_int32 FuncStringUInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_string_intptr_uint32_uint64 FuncStringIntPtrUInt32UInt64
-#define EMUL8_EXT_TYPE_func_int32_uint64_string_intptr FuncInt32UInt64StringIntPtr
-#define EMUL8_EXT_TYPE_func_string_int32_intptr_uint32 FuncStringInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_string FuncIntPtrUInt64IntPtrString
-#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_uint64 FuncUInt32UInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_uint32 FuncInt32IntPtrUInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint32 FuncInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_action_uint64_int32_string ActionUInt64Int32String
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64 FuncIntPtrUInt64UInt64
-#define EMUL8_EXT_TYPE_func_int32_int32 FuncInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32 FuncUInt32
+#define EMUL8_EXT_TYPE_func_int32_int32_string_uint64 FuncInt32Int32StringUInt64
+#define EMUL8_EXT_TYPE_func_int32_int32_uint32 FuncInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_int32_int32_uint32_int32 FuncInt32Int32UInt32Int32
+#define EMUL8_EXT_TYPE_func_int32_int32_uint32_intptr FuncInt32Int32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_int32_uint32_string FuncInt32Int32UInt32String
+#define EMUL8_EXT_TYPE_func_int32_int32_uint32_uint32 FuncInt32Int32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_int32_uint32_uint64 FuncInt32Int32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_int32_uint64 FuncInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_int32_int32_uint64_int32 FuncInt32Int32UInt64Int32
+#define EMUL8_EXT_TYPE_func_int32_int32_uint64_intptr FuncInt32Int32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_int32_int32_uint64_string FuncInt32Int32UInt64String
+#define EMUL8_EXT_TYPE_func_int32_int32_uint64_uint32 FuncInt32Int32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_int32_int32_uint64_uint64 FuncInt32Int32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_int32_intptr FuncInt32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_intptr_int32 FuncInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_int32_intptr_int32_int32 FuncInt32IntPtrInt32Int32
+#define EMUL8_EXT_TYPE_func_int32_intptr_int32_intptr FuncInt32IntPtrInt32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_intptr_int32_string FuncInt32IntPtrInt32String
+#define EMUL8_EXT_TYPE_func_int32_intptr_int32_uint32 FuncInt32IntPtrInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_intptr_int32_uint64 FuncInt32IntPtrInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_intptr_intptr FuncInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_int32_intptr_intptr_int32 FuncInt32IntPtrIntPtrInt32
+#define EMUL8_EXT_TYPE_func_int32_intptr_intptr_intptr FuncInt32IntPtrIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_int32_intptr_intptr_string FuncInt32IntPtrIntPtrString
 #define EMUL8_EXT_TYPE_func_int32_intptr_intptr_uint32 FuncInt32IntPtrIntPtrUInt32
-#define EMUL8_EXT_TYPE_action_uint32 ActionUInt32
-#define EMUL8_EXT_TYPE_func_string_uint64_uint64_int32 FuncStringUInt64UInt64Int32
-#define EMUL8_EXT_TYPE_action_intptr_string_uint32 ActionIntPtrStringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_int32 FuncIntPtrUInt32Int32Int32
+#define EMUL8_EXT_TYPE_func_int32_intptr_intptr_uint64 FuncInt32IntPtrIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_int32_intptr_string FuncInt32IntPtrString
+#define EMUL8_EXT_TYPE_func_int32_intptr_string_int32 FuncInt32IntPtrStringInt32
+#define EMUL8_EXT_TYPE_func_int32_intptr_string_intptr FuncInt32IntPtrStringIntPtr
+#define EMUL8_EXT_TYPE_func_int32_intptr_string_string FuncInt32IntPtrStringString
+#define EMUL8_EXT_TYPE_func_int32_intptr_string_uint32 FuncInt32IntPtrStringUInt32
+#define EMUL8_EXT_TYPE_func_int32_intptr_string_uint64 FuncInt32IntPtrStringUInt64
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint32 FuncInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_int32 FuncInt32IntPtrUInt32Int32
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_intptr FuncInt32IntPtrUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_string FuncInt32IntPtrUInt32String
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_uint32 FuncInt32IntPtrUInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_uint64 FuncInt32IntPtrUInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint64 FuncInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint64_int32 FuncInt32IntPtrUInt64Int32
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint64_intptr FuncInt32IntPtrUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_int32_intptr_uint64_string FuncInt32IntPtrUInt64String
 #define EMUL8_EXT_TYPE_func_int32_intptr_uint64_uint32 FuncInt32IntPtrUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_uint32 FuncUInt32UInt64UInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_uint64 FuncUInt32Int32UInt32UInt64
-#define EMUL8_EXT_TYPE_action_string_int32 ActionStringInt32
-#define EMUL8_EXT_TYPE_func_string_int32_intptr_intptr FuncStringInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint32_int32 FuncUInt64UInt32Int32
-#define EMUL8_EXT_TYPE_action_string_string_uint32 ActionStringStringUInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_int32_int32 FuncUInt32Int32Int32Int32
-#define EMUL8_EXT_TYPE_func_string_uint32_int32_uint64 FuncStringUInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_int32_string_uint64_uint32 FuncInt32StringUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr FuncUInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_string_int32_uint32 FuncUInt32StringInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_int32 FuncStringUInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_intptr FuncUInt64UInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_int32 FuncUInt64Int32UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_string FuncUInt64Int32IntPtrString
-#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_intptr FuncUInt32UInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_intptr_uint64 FuncStringIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_uint32_string_uint32 FuncUInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_uint32 FuncUInt64UInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_intptr_uint64 FuncStringUInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_int32 FuncStringInt32
-#define EMUL8_EXT_TYPE_action_int32_int32 ActionInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_string FuncUInt64IntPtrInt32String
-#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_intptr FuncUInt64IntPtrInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_string FuncUInt64String
-#define EMUL8_EXT_TYPE_action_string_string_string ActionStringStringString
-#define EMUL8_EXT_TYPE_func_string_int32_uint64_uint64 FuncStringInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_intptr_string_intptr_string FuncIntPtrStringIntPtrString
-#define EMUL8_EXT_TYPE_func_int32_int32_uint32_string FuncInt32Int32UInt32String
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint64 FuncInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_string FuncIntPtrIntPtrUInt32String
-#define EMUL8_EXT_TYPE_func_intptr_uint64_int32 FuncIntPtrUInt64Int32
-#define EMUL8_EXT_TYPE_func_intptr_int32_string_intptr FuncIntPtrInt32StringIntPtr
-#define EMUL8_EXT_TYPE_action_string ActionString
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint32_uint32 FuncInt32UInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_uint64_string_uint32 FuncStringUInt64StringUInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_intptr_string FuncStringUInt32IntPtrString
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_int32 FuncUInt64UInt64UInt64Int32
-#define EMUL8_EXT_TYPE_func_string_string_string FuncStringStringString
-#define EMUL8_EXT_TYPE_action_string_intptr_uint64 ActionStringIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_int32_intptr_uint64 FuncStringInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_int32 FuncInt32IntPtrUInt32Int32
-#define EMUL8_EXT_TYPE_func_string_string_string_uint32 FuncStringStringStringUInt32
-#define EMUL8_EXT_TYPE_func_string_string_uint32 FuncStringStringUInt32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_int32 FuncUInt64IntPtrUInt64Int32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_string_string FuncUInt32UInt32StringString
-#define EMUL8_EXT_TYPE_func_intptr_int32 FuncIntPtrInt32
-#define EMUL8_EXT_TYPE_func_string_string_int32 FuncStringStringInt32
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint32_int32 FuncInt32UInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_uint64 FuncUInt64IntPtrUInt32UInt64
-#define EMUL8_EXT_TYPE_action_int32_intptr ActionInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64 FuncUInt64UInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_string_uint64_uint32 FuncUInt64StringUInt64UInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_string_int32 FuncIntPtrUInt64StringInt32
-#define EMUL8_EXT_TYPE_func_string_int32_string_intptr FuncStringInt32StringIntPtr
-#define EMUL8_EXT_TYPE_action_int32_int32_intptr ActionInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_int32 FuncUInt64UInt64UInt32Int32
-#define EMUL8_EXT_TYPE_func_string_uint64_intptr_string FuncStringUInt64IntPtrString
-#define EMUL8_EXT_TYPE_func_int32_uint32_intptr_string FuncInt32UInt32IntPtrString
-#define EMUL8_EXT_TYPE_action_string_intptr_uint32 ActionStringIntPtrUInt32
-#define EMUL8_EXT_TYPE_action_uint64_string_string ActionUInt64StringString
-#define EMUL8_EXT_TYPE_func_intptr_int32_intptr_uint64 FuncIntPtrInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_action_intptr_uint32_int32 ActionIntPtrUInt32Int32
-#define EMUL8_EXT_TYPE_func_string_intptr_uint64_int32 FuncStringIntPtrUInt64Int32
-#define EMUL8_EXT_TYPE_func_int32_uint32_int32_uint64 FuncInt32UInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_uint64 FuncUInt32UInt64UInt32UInt64
-#define EMUL8_EXT_TYPE_func_int32_uint64_intptr FuncInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_uint64 FuncUInt64UInt64UInt32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint64 FuncIntPtrIntPtrUInt64
-#define EMUL8_EXT_TYPE_action_string_intptr ActionStringIntPtr
-#define EMUL8_EXT_TYPE_func_int32_string_uint32_int32 FuncInt32StringUInt32Int32
-#define EMUL8_EXT_TYPE_action_uint64_uint32 ActionUInt64UInt32
-#define EMUL8_EXT_TYPE_func_string_int32_uint32_string FuncStringInt32UInt32String
-#define EMUL8_EXT_TYPE_func_uint32_int32_int32 FuncUInt32Int32Int32
-#define EMUL8_EXT_TYPE_action_uint32_uint64 ActionUInt32UInt64
-#define EMUL8_EXT_TYPE_action_uint64_string_intptr ActionUInt64StringIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_string FuncUInt64IntPtrUInt64String
-#define EMUL8_EXT_TYPE_action_uint32_uint64_uint32 ActionUInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_intptr_int32_string_uint32 FuncIntPtrInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_intptr FuncIntPtrIntPtrUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_string_string_uint64_string FuncStringStringUInt64String
-#define EMUL8_EXT_TYPE_func_string_uint64_uint32_uint64 FuncStringUInt64UInt32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_string_uint32_uint32 FuncIntPtrStringUInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_intptr_string FuncInt32Int32IntPtrString
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint32_string FuncInt32IntPtrUInt32String
-#define EMUL8_EXT_TYPE_func_intptr_string_uint32_intptr FuncIntPtrStringUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_int32_string FuncUInt32Int32String
-#define EMUL8_EXT_TYPE_func_int32_string_uint64 FuncInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_uint64 FuncUInt32IntPtrInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_string_uint64_intptr FuncUInt64StringUInt64IntPtr
-#define EMUL8_EXT_TYPE_action_uint32_int32_string ActionUInt32Int32String
-#define EMUL8_EXT_TYPE_func_uint32_string_string_int32 FuncUInt32StringStringInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint64_int32 FuncInt32Int32UInt64Int32
-#define EMUL8_EXT_TYPE_func_string_uint64_int32_intptr FuncStringUInt64Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_int32 FuncUInt32UInt64Int32Int32
-#define EMUL8_EXT_TYPE_func_uint64_string_uint64_string FuncUInt64StringUInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_int32 FuncUInt64UInt64IntPtrInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint64_uint32 FuncInt32Int32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_int32 FuncIntPtrUInt64Int32Int32
-#define EMUL8_EXT_TYPE_action_intptr_intptr_int32 ActionIntPtrIntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_string_uint64 FuncUInt32UInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_int32_int32_int32 FuncIntPtrInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_string_string FuncIntPtrIntPtrStringString
-#define EMUL8_EXT_TYPE_func_uint32_int32_string_int32 FuncUInt32Int32StringInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_string_string FuncUInt32Int32StringString
-#define EMUL8_EXT_TYPE_func_uint32_string_intptr_string FuncUInt32StringIntPtrString
-#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_uint64 FuncUInt64UInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_uint64_intptr_uint32 FuncStringUInt64IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_string FuncInt32UInt64UInt64String
-#define EMUL8_EXT_TYPE_func_string_uint32_intptr_intptr FuncStringUInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint32_string FuncStringUInt32String
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_string FuncUInt32IntPtrUInt32String
-#define EMUL8_EXT_TYPE_func_uint64_string_string FuncUInt64StringString
-#define EMUL8_EXT_TYPE_func_string_uint64_string_string FuncStringUInt64StringString
-#define EMUL8_EXT_TYPE_func_uint64_uint32_string_string FuncUInt64UInt32StringString
-#define EMUL8_EXT_TYPE_func_intptr_string_string FuncIntPtrStringString
-#define EMUL8_EXT_TYPE_func_uint64 FuncUInt64
-#define EMUL8_EXT_TYPE_action_int32_uint64_string ActionInt32UInt64String
-#define EMUL8_EXT_TYPE_func_uint32_intptr_int32 FuncUInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_int32 FuncIntPtrIntPtrUInt32Int32
-#define EMUL8_EXT_TYPE_action_uint32_string_string ActionUInt32StringString
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_uint32 FuncInt32UInt64UInt64UInt32
-#define EMUL8_EXT_TYPE_action_uint64_uint32_string ActionUInt64UInt32String
-#define EMUL8_EXT_TYPE_func_intptr_string_uint64_intptr FuncIntPtrStringUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_string_uint32 FuncUInt64StringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_int32 FuncIntPtrUInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_int32_string_intptr FuncUInt64Int32StringIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_int32_string FuncStringUInt64Int32String
-#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_string FuncUInt32Int32IntPtrString
-#define EMUL8_EXT_TYPE_func_intptr_string_uint64 FuncIntPtrStringUInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_string_string FuncStringIntPtrStringString
-#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_uint32 FuncUInt64Int32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint64_int32 FuncInt32IntPtrUInt64Int32
-#define EMUL8_EXT_TYPE_action_intptr_int32 ActionIntPtrInt32
-#define EMUL8_EXT_TYPE_func_intptr_string_int32_uint32 FuncIntPtrStringInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_int32 FuncUInt32IntPtrInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_uint32 FuncUInt64Int32UInt64UInt32
-#define EMUL8_EXT_TYPE_action_string_string_uint64 ActionStringStringUInt64
-#define EMUL8_EXT_TYPE_action_string_intptr_intptr ActionStringIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_uint64 FuncUInt32UInt64IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_string_uint32_string FuncStringStringUInt32String
-#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_intptr FuncUInt32UInt64IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_int32 FuncInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_uint64 FuncUInt64UInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_string_int32_int32_intptr FuncStringInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_action_uint64 ActionUInt64
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_uint64 FuncUInt32IntPtrUInt32UInt64
 #define EMUL8_EXT_TYPE_func_int32_intptr_uint64_uint64 FuncInt32IntPtrUInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint64_string FuncUInt64UInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr FuncUInt64UInt32IntPtr
-#define EMUL8_EXT_TYPE_action_uint64_uint32_intptr ActionUInt64UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_string_uint64_uint64 FuncIntPtrStringUInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint32_string_uint32_uint32 FuncUInt32StringUInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint64_string_int32_int32 FuncUInt64StringInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_int32_string_string FuncUInt64Int32StringString
-#define EMUL8_EXT_TYPE_func_int32_uint64_string_uint64 FuncInt32UInt64StringUInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_intptr FuncUInt32UInt64Int32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint64_string FuncIntPtrUInt64String
-#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_uint32 FuncUInt32IntPtrIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64_string_uint32 FuncInt32UInt64StringUInt32
-#define EMUL8_EXT_TYPE_action_int32_uint64 ActionInt32UInt64
-#define EMUL8_EXT_TYPE_func_int32_string_uint64_uint64 FuncInt32StringUInt64UInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_uint32_uint32 FuncStringIntPtrUInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint64_uint64 FuncInt32UInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint32_string_uint64_intptr FuncUInt32StringUInt64IntPtr
-#define EMUL8_EXT_TYPE_action_int32_string_int32 ActionInt32StringInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_string FuncUInt32UInt64IntPtrString
 #define EMUL8_EXT_TYPE_func_int32_string FuncInt32String
-#define EMUL8_EXT_TYPE_action_string_uint32_uint32 ActionStringUInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_string FuncUInt32UInt32IntPtrString
-#define EMUL8_EXT_TYPE_action_uint64_int32 ActionUInt64Int32
+#define EMUL8_EXT_TYPE_func_int32_string_int32 FuncInt32StringInt32
+#define EMUL8_EXT_TYPE_func_int32_string_int32_int32 FuncInt32StringInt32Int32
+#define EMUL8_EXT_TYPE_func_int32_string_int32_intptr FuncInt32StringInt32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_string_int32_string FuncInt32StringInt32String
+#define EMUL8_EXT_TYPE_func_int32_string_int32_uint32 FuncInt32StringInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_string_int32_uint64 FuncInt32StringInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_string_intptr FuncInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_int32_string_intptr_int32 FuncInt32StringIntPtrInt32
+#define EMUL8_EXT_TYPE_func_int32_string_intptr_intptr FuncInt32StringIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_int32_string_intptr_string FuncInt32StringIntPtrString
+#define EMUL8_EXT_TYPE_func_int32_string_intptr_uint32 FuncInt32StringIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_int32_string_intptr_uint64 FuncInt32StringIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_int32_string_string FuncInt32StringString
+#define EMUL8_EXT_TYPE_func_int32_string_string_int32 FuncInt32StringStringInt32
+#define EMUL8_EXT_TYPE_func_int32_string_string_intptr FuncInt32StringStringIntPtr
+#define EMUL8_EXT_TYPE_func_int32_string_string_string FuncInt32StringStringString
 #define EMUL8_EXT_TYPE_func_int32_string_string_uint32 FuncInt32StringStringUInt32
-#define EMUL8_EXT_TYPE_action_string_uint64_uint64 ActionStringUInt64UInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_uint64 FuncIntPtrUInt64Int32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_string_intptr_int32 FuncUInt64StringIntPtrInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_int32 FuncInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_uint32_string_int32_int32 FuncUInt32StringInt32Int32
-#define EMUL8_EXT_TYPE_func_int32_int32_int32_uint64 FuncInt32Int32Int32UInt64
+#define EMUL8_EXT_TYPE_func_int32_string_string_uint64 FuncInt32StringStringUInt64
+#define EMUL8_EXT_TYPE_func_int32_string_uint32 FuncInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_int32_string_uint32_int32 FuncInt32StringUInt32Int32
+#define EMUL8_EXT_TYPE_func_int32_string_uint32_intptr FuncInt32StringUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_string_uint32_string FuncInt32StringUInt32String
 #define EMUL8_EXT_TYPE_func_int32_string_uint32_uint32 FuncInt32StringUInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_intptr_intptr FuncStringIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_uint32_intptr FuncStringUInt64UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64 FuncUInt32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_string_string_intptr FuncIntPtrStringStringIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_string_uint64_int32 FuncUInt64StringUInt64Int32
+#define EMUL8_EXT_TYPE_func_int32_string_uint32_uint64 FuncInt32StringUInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_string_uint64 FuncInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_int32_string_uint64_int32 FuncInt32StringUInt64Int32
+#define EMUL8_EXT_TYPE_func_int32_string_uint64_intptr FuncInt32StringUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_int32_string_uint64_string FuncInt32StringUInt64String
+#define EMUL8_EXT_TYPE_func_int32_string_uint64_uint32 FuncInt32StringUInt64UInt32
+#define EMUL8_EXT_TYPE_func_int32_string_uint64_uint64 FuncInt32StringUInt64UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint32 FuncInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_int32 FuncInt32UInt32Int32
 #define EMUL8_EXT_TYPE_func_int32_uint32_int32_int32 FuncInt32UInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_string_intptr_intptr_intptr FuncStringIntPtrIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_int32_intptr_int32_uint64 FuncInt32IntPtrInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_intptr FuncUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_string_uint64 FuncUInt32UInt64StringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_int32_int32_string FuncIntPtrInt32Int32String
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32 FuncUInt64UInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_string FuncUInt64UInt64UInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_intptr FuncUInt64UInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_int32_uint64 FuncStringInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_string_string_intptr FuncUInt64StringStringIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_string_intptr_intptr FuncUInt32StringIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_string_string_uint64 FuncUInt32StringStringUInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_string FuncUInt64UInt32UInt64String
-#define EMUL8_EXT_TYPE_func_string_uint64 FuncStringUInt64
-#define EMUL8_EXT_TYPE_func_int32_string_uint32 FuncInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_int32 FuncUInt32Int32UInt32Int32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint64_intptr FuncInt32Int32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint32_string_int32 FuncInt32UInt32StringInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32 FuncUInt64UInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_string_uint64 FuncUInt32IntPtrStringUInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_string FuncUInt32UInt32UInt32String
-#define EMUL8_EXT_TYPE_func_int32_int32_string FuncInt32Int32String
-#define EMUL8_EXT_TYPE_func_uint64_int32_intptr FuncUInt64Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32 FuncUInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_int32 FuncUInt32UInt64UInt64Int32
-#define EMUL8_EXT_TYPE_func_intptr_int32_string_uint64 FuncIntPtrInt32StringUInt64
-#define EMUL8_EXT_TYPE_action_intptr_uint64_intptr ActionIntPtrUInt64IntPtr
-#define EMUL8_EXT_TYPE_action_int32_string_string ActionInt32StringString
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_intptr FuncIntPtrInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_string_intptr_string_int32 FuncStringIntPtrStringInt32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_string FuncUInt64IntPtrUInt32String
-#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_int32 FuncIntPtrUInt64IntPtrInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_string FuncIntPtrUInt64UInt64String
-#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr FuncIntPtrIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_int32 FuncUInt32IntPtrIntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint64_string_uint32_string FuncUInt64StringUInt32String
-#define EMUL8_EXT_TYPE_action_uint32_intptr_uint32 ActionUInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_string_string_string FuncIntPtrStringStringString
-#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_string FuncUInt32UInt64Int32String
-#define EMUL8_EXT_TYPE_func_int32_string_int32_uint32 FuncInt32StringInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint32_uint64 FuncInt32Int32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint32_int32_intptr FuncInt32UInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint32_int32_string FuncInt32UInt32Int32String
+#define EMUL8_EXT_TYPE_func_int32_uint32_int32_uint32 FuncInt32UInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_int32_uint64 FuncInt32UInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint32_intptr FuncInt32UInt32IntPtr
 #define EMUL8_EXT_TYPE_func_int32_uint32_intptr_int32 FuncInt32UInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_uint32 FuncUInt32UInt64Int32UInt32
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint64_string FuncInt32UInt32UInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_uint32 FuncUInt64UInt64IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_string_intptr_int32 FuncInt32StringIntPtrInt32
-#define EMUL8_EXT_TYPE_action_intptr_int32_uint64 ActionIntPtrInt32UInt64
-#define EMUL8_EXT_TYPE_action_int32_uint64_intptr ActionInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_int32 FuncUInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_uint32_string_uint32_int32 FuncUInt32StringUInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_uint32 FuncUInt64UInt32Int32UInt32
-#define EMUL8_EXT_TYPE_action_uint32_uint32_int32 ActionUInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_intptr FuncUInt64UInt64IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_string_intptr_intptr FuncStringStringIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_string_int32 FuncUInt32UInt64StringInt32
-#define EMUL8_EXT_TYPE_func_uint32_string_intptr_int32 FuncUInt32StringIntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_string FuncUInt64UInt32Int32String
-#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_intptr FuncIntPtrUInt64Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_string_intptr_uint64 FuncUInt64StringIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_uint32_uint32_int32 FuncStringUInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_int32 FuncUInt64UInt64Int32
-#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_string FuncInt32UInt64IntPtrString
-#define EMUL8_EXT_TYPE_func_string_uint64_uint32_uint32 FuncStringUInt64UInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_string_string_int32 FuncStringStringStringInt32
-#define EMUL8_EXT_TYPE_func_string_int32_string_uint64 FuncStringInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_int32_string_int32 FuncIntPtrInt32StringInt32
-#define EMUL8_EXT_TYPE_func_uint32_string_string FuncUInt32StringString
-#define EMUL8_EXT_TYPE_func_uint32_uint32_string_intptr FuncUInt32UInt32StringIntPtr
-#define EMUL8_EXT_TYPE_action_uint32_uint64_int32 ActionUInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_int32 FuncUInt64IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_string_int32 FuncUInt64UInt32StringInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_int32_uint32 FuncInt32Int32Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_uint32 FuncUInt32IntPtrUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint64_int32_int32_uint64 FuncUInt64Int32Int32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_string FuncUInt32Int32UInt64String
-#define EMUL8_EXT_TYPE_func_string_int32_int32 FuncStringInt32Int32
-#define EMUL8_EXT_TYPE_func_string_uint32_string_intptr FuncStringUInt32StringIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_string FuncUInt32UInt64UInt32String
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_intptr FuncUInt32IntPtrUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_string_int32 FuncIntPtrStringInt32
-#define EMUL8_EXT_TYPE_func_uint32_string_uint32_string FuncUInt32StringUInt32String
-#define EMUL8_EXT_TYPE_func_uint64_string_int32_uint32 FuncUInt64StringInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_string_uint64_uint64 FuncStringStringUInt64UInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint64_string_uint32 FuncIntPtrUInt64StringUInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_intptr_intptr FuncInt32UInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint32_intptr_string FuncInt32UInt32IntPtrString
 #define EMUL8_EXT_TYPE_func_int32_uint32_intptr_uint32 FuncInt32UInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_action_string_int32_int32 ActionStringInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_intptr FuncUInt64UInt64Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint64_string_int32 FuncUInt64UInt64StringInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_uint32_intptr FuncStringUInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_action_intptr_uint32_uint64 ActionIntPtrUInt32UInt64
-#define EMUL8_EXT_TYPE_action_uint64_string_uint64 ActionUInt64StringUInt64
-#define EMUL8_EXT_TYPE_action_int32_uint32_uint64 ActionInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_string_intptr_uint32 FuncStringStringIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_string_int32_uint64 FuncInt32StringInt32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_intptr FuncIntPtrIntPtrIntPtrIntPtr
-#define EMUL8_EXT_TYPE_action_intptr_uint64_int32 ActionIntPtrUInt64Int32
-#define EMUL8_EXT_TYPE_func_int32_intptr_int32_intptr FuncInt32IntPtrInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_int32 FuncUInt64UInt64Int32Int32
-#define EMUL8_EXT_TYPE_func_uint64_int32_int32 FuncUInt64Int32Int32
-#define EMUL8_EXT_TYPE_func_uint64_string_uint32_intptr FuncUInt64StringUInt32IntPtr
-#define EMUL8_EXT_TYPE_action_uint32_intptr_int32 ActionUInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_int32 FuncIntPtrUInt64UInt64Int32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_intptr FuncIntPtrUInt64IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr FuncUInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_action_intptr_string_intptr ActionIntPtrStringIntPtr
-#define EMUL8_EXT_TYPE_action_uint64_uint64_uint32 ActionUInt64UInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_string FuncUInt32IntPtrUInt64String
-#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_uint32 FuncInt32UInt64IntPtrUInt32
-#define EMUL8_EXT_TYPE_action_int32_intptr_intptr ActionInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_string_uint32_int32 FuncIntPtrStringUInt32Int32
-#define EMUL8_EXT_TYPE_func_string_uint32_uint32 FuncStringUInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_uint32 FuncUInt32Int32UInt32UInt32
-#define EMUL8_EXT_TYPE_action_uint32_uint32_intptr ActionUInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_uint32 FuncIntPtrInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_int32 FuncUInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_string_uint64 FuncUInt64IntPtrStringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_string FuncIntPtrString
-#define EMUL8_EXT_TYPE_action_string_uint64_uint32 ActionStringUInt64UInt32
-#define EMUL8_EXT_TYPE_action_string_string_intptr ActionStringStringIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint64 FuncUInt64UInt64
-#define EMUL8_EXT_TYPE_func_int32_intptr_string FuncInt32IntPtrString
-#define EMUL8_EXT_TYPE_func_string_intptr_intptr_uint64 FuncStringIntPtrIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_int32_uint64_int32_int32 FuncInt32UInt64Int32Int32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_uint32 FuncUInt64UInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_string_intptr FuncUInt32UInt64StringIntPtr
-#define EMUL8_EXT_TYPE_func_int32_intptr_int32_uint32 FuncInt32IntPtrInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_uint64_string_int32 FuncStringUInt64StringInt32
-#define EMUL8_EXT_TYPE_action_intptr ActionIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint32_string_uint64 FuncUInt64UInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_string_uint64_int32_uint32 FuncStringUInt64Int32UInt32
-#define EMUL8_EXT_TYPE_action_string_uint32_uint64 ActionStringUInt32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_string_int32_string FuncIntPtrStringInt32String
-#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_intptr FuncIntPtrUInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_int32 FuncUInt32IntPtrUInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_int32 FuncUInt64Int32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_intptr FuncUInt32UInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_int32_string_intptr FuncInt32Int32StringIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint64_uint32 FuncIntPtrIntPtrUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint32_string_uint32_intptr FuncUInt32StringUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr FuncUInt64IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint32_int32 FuncInt32UInt32Int32
-#define EMUL8_EXT_TYPE_func_string_uint64_uint64_uint32 FuncStringUInt64UInt64UInt32
-#define EMUL8_EXT_TYPE_action_uint64_int32_int32 ActionUInt64Int32Int32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_string_uint64 FuncIntPtrIntPtrStringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr FuncIntPtrUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_uint32 FuncUInt64IntPtrUInt64UInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_intptr FuncInt32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64 FuncUInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_string_string_uint64_intptr FuncStringStringUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_uint32 FuncIntPtrUInt64UInt64UInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_string_intptr FuncIntPtrUInt64StringIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_uint64_intptr FuncStringUInt64UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_int32_string FuncIntPtrInt32String
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_int32 FuncInt32UInt64UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_uint32 FuncUInt64UInt64Int32UInt32
-#define EMUL8_EXT_TYPE_action_intptr_string ActionIntPtrString
-#define EMUL8_EXT_TYPE_func_int32_int32_uint64_string FuncInt32Int32UInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64 FuncUInt64UInt64UInt64
-#define EMUL8_EXT_TYPE_func_string_string_uint32_uint32 FuncStringStringUInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_string_int32_intptr FuncUInt32StringInt32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_int32_uint32_uint32 FuncInt32Int32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint64_string_string_string FuncUInt64StringStringString
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_uint64 FuncIntPtrInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint32_int32_int32_intptr FuncUInt32Int32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_string_string_int32 FuncUInt64StringStringInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64_string_int32 FuncInt32UInt64StringInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_uint32 FuncIntPtrUInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_int32_int32_intptr FuncIntPtrInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_action_int32_string ActionInt32String
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_string FuncInt32UInt64UInt32String
-#define EMUL8_EXT_TYPE_action_uint64_intptr_uint32 ActionUInt64IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_uint32 FuncUInt32UInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_string FuncUInt32Int32UInt32String
-#define EMUL8_EXT_TYPE_func_string_intptr_intptr_uint32 FuncStringIntPtrIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_uint64 FuncIntPtrUInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_uint64 FuncUInt64UInt64IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_int32_intptr_string_intptr FuncInt32IntPtrStringIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_uint64 FuncIntPtrUInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_string_int32_uint32 FuncStringInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_intptr_uint64 FuncInt32UInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_int32_uint32_string FuncInt32UInt32String
+#define EMUL8_EXT_TYPE_func_int32_uint32_string_int32 FuncInt32UInt32StringInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_string_intptr FuncInt32UInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint32_string_string FuncInt32UInt32StringString
+#define EMUL8_EXT_TYPE_func_int32_uint32_string_uint32 FuncInt32UInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_string_uint64 FuncInt32UInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint32 FuncInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint32_int32 FuncInt32UInt32UInt32Int32
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint32_intptr FuncInt32UInt32UInt32IntPtr
 #define EMUL8_EXT_TYPE_func_int32_uint32_uint32_string FuncInt32UInt32UInt32String
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_int32 FuncUInt32UInt64UInt32Int32
-#define EMUL8_EXT_TYPE_func_string_uint64_uint64 FuncStringUInt64UInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_int32 FuncIntPtrUInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_string_uint64 FuncUInt32Int32StringUInt64
-#define EMUL8_EXT_TYPE_action_intptr_string_string ActionIntPtrStringString
-#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_int32 FuncUInt32UInt64IntPtrInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_string_uint32 FuncInt32IntPtrStringUInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint32_uint32 FuncInt32UInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint32_uint64 FuncInt32UInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint64 FuncInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint64_int32 FuncInt32UInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint64_intptr FuncInt32UInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint64_string FuncInt32UInt32UInt64String
 #define EMUL8_EXT_TYPE_func_int32_uint32_uint64_uint32 FuncInt32UInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint32_uint64_uint64 FuncInt32UInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint64 FuncInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint64_int32 FuncInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_int32_uint64_int32_int32 FuncInt32UInt64Int32Int32
+#define EMUL8_EXT_TYPE_func_int32_uint64_int32_intptr FuncInt32UInt64Int32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint64_int32_string FuncInt32UInt64Int32String
+#define EMUL8_EXT_TYPE_func_int32_uint64_int32_uint32 FuncInt32UInt64Int32UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint64_int32_uint64 FuncInt32UInt64Int32UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint64_intptr FuncInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_int32 FuncInt32UInt64IntPtrInt32
+#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_intptr FuncInt32UInt64IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_string FuncInt32UInt64IntPtrString
+#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_uint32 FuncInt32UInt64IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_uint64 FuncInt32UInt64IntPtrUInt64
 #define EMUL8_EXT_TYPE_func_int32_uint64_string FuncInt32UInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_uint64 FuncUInt64UInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_uint32_string_intptr FuncUInt64UInt32StringIntPtr
-#define EMUL8_EXT_TYPE_action_uint64_uint32_uint64 ActionUInt64UInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_uint32 FuncUInt32Int32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_uint32 FuncUInt64Int32UInt32UInt32
-#define EMUL8_EXT_TYPE_action Action
-#define EMUL8_EXT_TYPE_func_string_string_intptr FuncStringStringIntPtr
-#define EMUL8_EXT_TYPE_action_string_uint64_int32 ActionStringUInt64Int32
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint32 FuncUInt64Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_intptr FuncUInt32IntPtrIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_intptr FuncStringIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_int32_int32 FuncStringUInt64Int32Int32
-#define EMUL8_EXT_TYPE_func_string_string_intptr_string FuncStringStringIntPtrString
-#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_string FuncUInt32UInt32Int32String
-#define EMUL8_EXT_TYPE_action_intptr_intptr_string ActionIntPtrIntPtrString
-#define EMUL8_EXT_TYPE_func_int32_string_string FuncInt32StringString
-#define EMUL8_EXT_TYPE_func_int32_string_intptr_intptr FuncInt32StringIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_int32 FuncIntPtrUInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_uint64 FuncUInt32UInt32UInt64UInt64
-#define EMUL8_EXT_TYPE_action_uint32_string_int32 ActionUInt32StringInt32
-#define EMUL8_EXT_TYPE_func_uint32_string_string_intptr FuncUInt32StringStringIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_int32 FuncUInt64UInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32 FuncIntPtrUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_uint64 FuncUInt32Int32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_string FuncUInt64IntPtrIntPtrString
-#define EMUL8_EXT_TYPE_func_int32_int32_intptr_uint32 FuncInt32Int32IntPtrUInt32
-#define EMUL8_EXT_TYPE_action_string_int32_string ActionStringInt32String
-#define EMUL8_EXT_TYPE_action_uint64_int32_intptr ActionUInt64Int32IntPtr
-#define EMUL8_EXT_TYPE_action_uint64_intptr ActionUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_intptr_int32_uint64 FuncIntPtrIntPtrInt32UInt64
-#define EMUL8_EXT_TYPE_action_uint32_intptr_string ActionUInt32IntPtrString
-#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_intptr FuncUInt64IntPtrIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_string_int32_string_uint32 FuncStringInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_string_int32_uint32_int32 FuncStringInt32UInt32Int32
-#define EMUL8_EXT_TYPE_action_intptr_string_int32 ActionIntPtrStringInt32
-#define EMUL8_EXT_TYPE_func_uint32_string_intptr_uint32 FuncUInt32StringIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_string_intptr_uint32 FuncInt32StringIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_string_int32_intptr_string FuncStringInt32IntPtrString
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_uint64 FuncUInt64Int32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_int32_int32_uint32 FuncUInt64Int32Int32UInt32
-#define EMUL8_EXT_TYPE_action_intptr_uint32_intptr ActionIntPtrUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint64_string_int32 FuncInt32UInt64StringInt32
+#define EMUL8_EXT_TYPE_func_int32_uint64_string_intptr FuncInt32UInt64StringIntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint64_string_string FuncInt32UInt64StringString
+#define EMUL8_EXT_TYPE_func_int32_uint64_string_uint32 FuncInt32UInt64StringUInt32
+#define EMUL8_EXT_TYPE_func_int32_uint64_string_uint64 FuncInt32UInt64StringUInt64
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint32 FuncInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_int32 FuncInt32UInt64UInt32Int32
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_intptr FuncInt32UInt64UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_string FuncInt32UInt64UInt32String
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_uint32 FuncInt32UInt64UInt32UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint32_uint64 FuncInt32UInt64UInt32UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint64 FuncInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_int32 FuncInt32UInt64UInt64Int32
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_intptr FuncInt32UInt64UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_string FuncInt32UInt64UInt64String
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_uint32 FuncInt32UInt64UInt64UInt32
+#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_uint64 FuncInt32UInt64UInt64UInt64
+#define EMUL8_EXT_TYPE_func_intptr FuncIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_int32 FuncIntPtrInt32
+#define EMUL8_EXT_TYPE_func_intptr_int32_int32 FuncIntPtrInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_int32_int32_int32 FuncIntPtrInt32Int32Int32
+#define EMUL8_EXT_TYPE_func_intptr_int32_int32_intptr FuncIntPtrInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_int32_int32_string FuncIntPtrInt32Int32String
+#define EMUL8_EXT_TYPE_func_intptr_int32_int32_uint32 FuncIntPtrInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_int32_int32_uint64 FuncIntPtrInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_int32_intptr FuncIntPtrInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_int32_intptr_int32 FuncIntPtrInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_intptr_int32_intptr_intptr FuncIntPtrInt32IntPtrIntPtr
 #define EMUL8_EXT_TYPE_func_intptr_int32_intptr_string FuncIntPtrInt32IntPtrString
-#define EMUL8_EXT_TYPE_func_int32_string_uint64_string FuncInt32StringUInt64String
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_uint32 FuncIntPtrUInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_int32_int32_string FuncStringInt32Int32String
-#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_uint32 FuncUInt32Int32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_string FuncIntPtrUInt32UInt32String
-#define EMUL8_EXT_TYPE_action_uint32_string_uint32 ActionUInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_intptr FuncUInt32Int32UInt64IntPtr
-#define EMUL8_EXT_TYPE_action_uint64_string_uint32 ActionUInt64StringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_string FuncIntPtrUInt32String
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint32_intptr FuncInt32UInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_intptr_string_uint64 FuncInt32IntPtrStringUInt64
 #define EMUL8_EXT_TYPE_func_intptr_int32_intptr_uint32 FuncIntPtrInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_string_string_uint64 FuncStringStringUInt64
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_int32 FuncIntPtrUInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_string_string_int32_string FuncStringStringInt32String
-#define EMUL8_EXT_TYPE_action_uint64_uint64_string ActionUInt64UInt64String
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_int32 FuncUInt32IntPtrUInt64Int32
-#define EMUL8_EXT_TYPE_func_uint64_string_int32 FuncUInt64StringInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_int32 FuncInt32UInt64UInt64Int32
-#define EMUL8_EXT_TYPE_func_int32_string_uint32_uint64 FuncInt32StringUInt32UInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_uint64_intptr FuncStringIntPtrUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_uint32 FuncUInt64IntPtrUInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_string_uint32 FuncStringUInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_uint64_int32_string_uint32 FuncUInt64Int32StringUInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_string_int32 FuncUInt32UInt32StringInt32
-#define EMUL8_EXT_TYPE_func_uint32_string_uint64 FuncUInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_int32_string_intptr_uint64 FuncInt32StringIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_uint32_intptr_string_uint32 FuncUInt32IntPtrStringUInt32
-#define EMUL8_EXT_TYPE_action_int32_string_uint64 ActionInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_string_int32_string_int32 FuncStringInt32StringInt32
-#define EMUL8_EXT_TYPE_func_string_string_string_uint64 FuncStringStringStringUInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint32_string_uint32 FuncUInt32UInt32StringUInt32
-#define EMUL8_EXT_TYPE_action_intptr_int32_string ActionIntPtrInt32String
-#define EMUL8_EXT_TYPE_func_int32_string_uint64_intptr FuncInt32StringUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32 FuncIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64 FuncInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_int32_int32_string FuncUInt64Int32Int32String
-#define EMUL8_EXT_TYPE_action_uint64_int32_uint32 ActionUInt64Int32UInt32
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint64_int32 FuncInt32UInt32UInt64Int32
-#define EMUL8_EXT_TYPE_action_uint32_int32_intptr ActionUInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_string_intptr_uint32_int32 FuncStringIntPtrUInt32Int32
-#define EMUL8_EXT_TYPE_func_int32_uint32_int32_uint32 FuncInt32UInt32Int32UInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_uint64 FuncIntPtrUInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_uint64_uint64_uint64 FuncStringUInt64UInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint64_string_int32_uint64 FuncUInt64StringInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_intptr_string_intptr FuncUInt64IntPtrStringIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_string FuncUInt32IntPtrInt32String
-#define EMUL8_EXT_TYPE_func_uint64_string_string_uint32 FuncUInt64StringStringUInt32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint64_intptr FuncIntPtrIntPtrUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_uint32 FuncIntPtrUInt32Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_uint64 FuncUInt64IntPtrIntPtrUInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_uint64 FuncUInt32UInt64Int32UInt64
-#define EMUL8_EXT_TYPE_action_int32_int32_uint32 ActionInt32Int32UInt32
-#define EMUL8_EXT_TYPE_func_intptr_string_uint64_uint32 FuncIntPtrStringUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_intptr FuncUInt32UInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_string_int32_string FuncUInt32StringInt32String
-#define EMUL8_EXT_TYPE_action_intptr_int32_uint32 ActionIntPtrInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_intptr_intptr FuncInt32Int32IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_string_string_string FuncUInt32StringStringString
-#define EMUL8_EXT_TYPE_func_string_intptr_uint64_string FuncStringIntPtrUInt64String
-#define EMUL8_EXT_TYPE_action_uint32_intptr ActionUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_int32 FuncUInt32UInt32UInt32Int32
-#define EMUL8_EXT_TYPE_action_int32_uint32_intptr ActionInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_string_string_uint32_int32 FuncStringStringUInt32Int32
-#define EMUL8_EXT_TYPE_action_string_int32_intptr ActionStringInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint64_string_string FuncIntPtrUInt64StringString
-#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_int32 FuncUInt32UInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_func_int32_uint32_uint64 FuncInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_int32_intptr_intptr_int32 FuncInt32IntPtrIntPtrInt32
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_string FuncUInt64Int32UInt32String
-#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_uint32 FuncUInt64IntPtrInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_intptr_int32 FuncStringUInt32IntPtrInt32
-#define EMUL8_EXT_TYPE_action_uint64_uint64_intptr ActionUInt64UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_int32_intptr_uint64 FuncIntPtrInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_intptr_int32_string FuncIntPtrInt32String
+#define EMUL8_EXT_TYPE_func_intptr_int32_string_int32 FuncIntPtrInt32StringInt32
+#define EMUL8_EXT_TYPE_func_intptr_int32_string_intptr FuncIntPtrInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_int32_string_string FuncIntPtrInt32StringString
+#define EMUL8_EXT_TYPE_func_intptr_int32_string_uint32 FuncIntPtrInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_intptr_int32_string_uint64 FuncIntPtrInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint32 FuncIntPtrInt32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_int32 FuncIntPtrInt32UInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_intptr FuncIntPtrInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_string FuncIntPtrInt32UInt32String
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_uint32 FuncIntPtrInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_uint64 FuncIntPtrInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint64 FuncIntPtrInt32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_int32 FuncIntPtrInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_intptr FuncIntPtrInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_string FuncIntPtrInt32UInt64String
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_uint32 FuncIntPtrInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_uint64 FuncIntPtrInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_intptr_intptr FuncIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_intptr_int32 FuncIntPtrIntPtrInt32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_int32_int32 FuncIntPtrIntPtrInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_int32_intptr FuncIntPtrIntPtrInt32IntPtr
 #define EMUL8_EXT_TYPE_func_intptr_intptr_int32_string FuncIntPtrIntPtrInt32String
-#define EMUL8_EXT_TYPE_func_intptr_string_uint64_int32 FuncIntPtrStringUInt64Int32
-#define EMUL8_EXT_TYPE_func_int32_int32_string_int32 FuncInt32Int32StringInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_string FuncIntPtrUInt32Int32String
-#define EMUL8_EXT_TYPE_func_intptr_string_intptr FuncIntPtrStringIntPtr
-#define EMUL8_EXT_TYPE_action_string_uint32_int32 ActionStringUInt32Int32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_uint64 FuncIntPtrUInt64UInt64UInt64
-#define EMUL8_EXT_TYPE_func_int32_uint32_string FuncInt32UInt32String
+#define EMUL8_EXT_TYPE_func_intptr_intptr_int32_uint32 FuncIntPtrIntPtrInt32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_int32_uint64 FuncIntPtrIntPtrInt32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr FuncIntPtrIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_int32 FuncIntPtrIntPtrIntPtrInt32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_intptr FuncIntPtrIntPtrIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_string FuncIntPtrIntPtrIntPtrString
+#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_uint32 FuncIntPtrIntPtrIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_uint64 FuncIntPtrIntPtrIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_intptr_intptr_string FuncIntPtrIntPtrString
+#define EMUL8_EXT_TYPE_func_intptr_intptr_string_int32 FuncIntPtrIntPtrStringInt32
 #define EMUL8_EXT_TYPE_func_intptr_intptr_string_intptr FuncIntPtrIntPtrStringIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_int32_string_uint32 FuncUInt32Int32StringUInt32
-#define EMUL8_EXT_TYPE_func_int32_uint32_string_intptr FuncInt32UInt32StringIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_intptr FuncUInt64UInt64UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint64_int32_intptr FuncInt32UInt64Int32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint64_int32 FuncInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_int32_int32_int32_intptr FuncInt32Int32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_int32_string_string FuncInt32Int32StringString
-#define EMUL8_EXT_TYPE_func_uint32_string_uint64_int32 FuncUInt32StringUInt64Int32
-#define EMUL8_EXT_TYPE_func_uint32_int32_string_intptr FuncUInt32Int32StringIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_uint64 FuncIntPtrUInt64IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_intptr FuncUInt64IntPtrUInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_intptr FuncIntPtrUInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_int32 FuncIntPtrUInt64UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_int32 FuncUInt32UInt32Int32Int32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint32 FuncInt32Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_intptr FuncUInt64UInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_string_intptr_uint32 FuncUInt64StringIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_string_uint32_string FuncInt32StringUInt32String
-#define EMUL8_EXT_TYPE_func_intptr_intptr FuncIntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_int32_string_string_intptr FuncInt32StringStringIntPtr
-#define EMUL8_EXT_TYPE_func_string_uint64_string_intptr FuncStringUInt64StringIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_intptr_string_string FuncIntPtrIntPtrStringString
+#define EMUL8_EXT_TYPE_func_intptr_intptr_string_uint32 FuncIntPtrIntPtrStringUInt32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_string_uint64 FuncIntPtrIntPtrStringUInt64
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32 FuncIntPtrIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_int32 FuncIntPtrIntPtrUInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_intptr FuncIntPtrIntPtrUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_string FuncIntPtrIntPtrUInt32String
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_uint32 FuncIntPtrIntPtrUInt32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_uint64 FuncIntPtrIntPtrUInt32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint64 FuncIntPtrIntPtrUInt64
 #define EMUL8_EXT_TYPE_func_intptr_intptr_uint64_int32 FuncIntPtrIntPtrUInt64Int32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_int32_intptr FuncIntPtrIntPtrInt32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint64_intptr_intptr FuncInt32UInt64IntPtrIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_intptr FuncIntPtrUInt32UInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_string_uint32_uint64 FuncUInt32StringUInt32UInt64
-#define EMUL8_EXT_TYPE_action_uint64_string_int32 ActionUInt64StringInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_string_string FuncUInt32UInt64StringString
-#define EMUL8_EXT_TYPE_action_uint64_string ActionUInt64String
-#define EMUL8_EXT_TYPE_func_int32_string_intptr_string FuncInt32StringIntPtrString
-#define EMUL8_EXT_TYPE_func_uint64_string_uint32_uint64 FuncUInt64StringUInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_int32_intptr FuncUInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_int32 FuncIntPtrInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_uint32 FuncUInt32UInt32Int32UInt32
-#define EMUL8_EXT_TYPE_action_uint32_int32_uint64 ActionUInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_int32_string_uint64_int32 FuncInt32StringUInt64Int32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_string_intptr FuncIntPtrUInt32StringIntPtr
-#define EMUL8_EXT_TYPE_func_int32_intptr_string_int32 FuncInt32IntPtrStringInt32
-#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_uint32 FuncUInt64IntPtrIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_string_string_uint64 FuncIntPtrStringStringUInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_int32_int32 FuncStringIntPtrInt32Int32
-#define EMUL8_EXT_TYPE_func_int32_int32_intptr_uint64 FuncInt32Int32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint64 FuncInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_uint64 FuncUInt32IntPtrIntPtrUInt64
-#define EMUL8_EXT_TYPE_action_int32_uint32 ActionInt32UInt32
-#define EMUL8_EXT_TYPE_func_intptr FuncIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_string_uint32 FuncIntPtrUInt32StringUInt32
-#define EMUL8_EXT_TYPE_func_string_int32_uint64_uint32 FuncStringInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_string FuncIntPtrUInt64UInt32String
-#define EMUL8_EXT_TYPE_func_uint64_intptr FuncUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint64_intptr FuncIntPtrIntPtrUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint64_string FuncIntPtrIntPtrUInt64String
+#define EMUL8_EXT_TYPE_func_intptr_intptr_uint64_uint32 FuncIntPtrIntPtrUInt64UInt32
 #define EMUL8_EXT_TYPE_func_intptr_intptr_uint64_uint64 FuncIntPtrIntPtrUInt64UInt64
-#define EMUL8_EXT_TYPE_func_string_uint32_uint32_uint32 FuncStringUInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint32 FuncInt32UInt64UInt32
-#define EMUL8_EXT_TYPE_func_string_intptr_int32_string FuncStringIntPtrInt32String
-#define EMUL8_EXT_TYPE_action_uint32_uint32_uint64 ActionUInt32UInt32UInt64
-#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_intptr FuncUInt32UInt64UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint32_string FuncIntPtrInt32UInt32String
-#define EMUL8_EXT_TYPE_action_int32_string_intptr ActionInt32StringIntPtr
-#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_uint32 FuncUInt32UInt64IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_int32_uint32 FuncStringUInt32Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_intptr FuncUInt32UInt32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_string_int32_intptr FuncUInt64StringInt32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_uint64 FuncUInt64Int32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_intptr_uint64_uint32 FuncStringIntPtrUInt64UInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_string_uint32 FuncUInt32UInt64StringUInt32
-#define EMUL8_EXT_TYPE_action_int32_uint64_int32 ActionInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_intptr_intptr_intptr_uint32 FuncIntPtrIntPtrIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32 FuncUInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_int32_string FuncStringInt32String
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_uint64 FuncUInt64IntPtrUInt64UInt64
-#define EMUL8_EXT_TYPE_func_uint32_int32_int32_string FuncUInt32Int32Int32String
-#define EMUL8_EXT_TYPE_action_uint32_string_uint64 ActionUInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_uint32 FuncUInt32IntPtrUInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_uint64_string_uint64 FuncStringUInt64StringUInt64
-#define EMUL8_EXT_TYPE_action_string_intptr_string ActionStringIntPtrString
-#define EMUL8_EXT_TYPE_action_intptr_uint64_string ActionIntPtrUInt64String
-#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_string FuncUInt64UInt64UInt32String
-#define EMUL8_EXT_TYPE_func_string_int32_uint32_intptr FuncStringInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_string FuncIntPtrString
+#define EMUL8_EXT_TYPE_func_intptr_string_int32 FuncIntPtrStringInt32
+#define EMUL8_EXT_TYPE_func_intptr_string_int32_int32 FuncIntPtrStringInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_string_int32_intptr FuncIntPtrStringInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_string_int32_string FuncIntPtrStringInt32String
+#define EMUL8_EXT_TYPE_func_intptr_string_int32_uint32 FuncIntPtrStringInt32UInt32
 #define EMUL8_EXT_TYPE_func_intptr_string_int32_uint64 FuncIntPtrStringInt32UInt64
-#define EMUL8_EXT_TYPE_func_intptr_intptr_uint32_uint32 FuncIntPtrIntPtrUInt32UInt32
-#define EMUL8_EXT_TYPE_func_string_string_intptr_int32 FuncStringStringIntPtrInt32
-#define EMUL8_EXT_TYPE_func_string_uint32_string_int32 FuncStringUInt32StringInt32
-#define EMUL8_EXT_TYPE_action_uint32_string ActionUInt32String
-#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_intptr FuncUInt64Int32UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_uint32_int32_string FuncInt32UInt32Int32String
-#define EMUL8_EXT_TYPE_func_intptr_int32_int32_uint32 FuncIntPtrInt32Int32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_string_string FuncUInt32IntPtrStringString
-#define EMUL8_EXT_TYPE_func_string_intptr_uint32 FuncStringIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint64_intptr FuncInt32IntPtrUInt64IntPtr
-#define EMUL8_EXT_TYPE_func_uint32_int32_uint64 FuncUInt32Int32UInt64
-#define EMUL8_EXT_TYPE_func_int32_int32_intptr FuncInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_uint64_string_intptr FuncUInt64StringIntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_string_uint64 FuncIntPtrUInt32StringUInt64
-#define EMUL8_EXT_TYPE_func_int32_uint64_uint64_intptr FuncInt32UInt64UInt64IntPtr
-#define EMUL8_EXT_TYPE_action_uint64_int32_uint64 ActionUInt64Int32UInt64
-#define EMUL8_EXT_TYPE_func_uint64_string_uint32_uint32 FuncUInt64StringUInt32UInt32
-#define EMUL8_EXT_TYPE_action_string_int32_uint32 ActionStringInt32UInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_string_intptr FuncUInt32IntPtrStringIntPtr
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64 FuncUInt64IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_int32_uint32 FuncInt32UInt32
-#define EMUL8_EXT_TYPE_func_int32_int32_uint32_int32 FuncInt32Int32UInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_uint32 FuncUInt32UInt32IntPtrUInt32
-#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64 FuncUInt32IntPtrUInt64
-#define EMUL8_EXT_TYPE_func_string_int32_uint64_int32 FuncStringInt32UInt64Int32
-#define EMUL8_EXT_TYPE_func_uint64_uint64_string_intptr FuncUInt64UInt64StringIntPtr
-#define EMUL8_EXT_TYPE_func_int32_intptr FuncInt32IntPtr
-#define EMUL8_EXT_TYPE_func_int32_intptr_int32_int32 FuncInt32IntPtrInt32Int32
-#define EMUL8_EXT_TYPE_func_uint32_uint64_string FuncUInt32UInt64String
-#define EMUL8_EXT_TYPE_action_intptr_uint32 ActionIntPtrUInt32
-#define EMUL8_EXT_TYPE_func_intptr_uint32_string_string FuncIntPtrUInt32StringString
-#define EMUL8_EXT_TYPE_func_int32_intptr_uint64_string FuncInt32IntPtrUInt64String
-#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_int32 FuncUInt64IntPtrUInt32Int32
-#define EMUL8_EXT_TYPE_func_string_string_string_intptr FuncStringStringStringIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_string_intptr FuncIntPtrStringIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_string_intptr_int32 FuncIntPtrStringIntPtrInt32
+#define EMUL8_EXT_TYPE_func_intptr_string_intptr_intptr FuncIntPtrStringIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_string_intptr_string FuncIntPtrStringIntPtrString
+#define EMUL8_EXT_TYPE_func_intptr_string_intptr_uint32 FuncIntPtrStringIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_intptr_string_intptr_uint64 FuncIntPtrStringIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_intptr_string_string FuncIntPtrStringString
+#define EMUL8_EXT_TYPE_func_intptr_string_string_int32 FuncIntPtrStringStringInt32
+#define EMUL8_EXT_TYPE_func_intptr_string_string_intptr FuncIntPtrStringStringIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_string_string_string FuncIntPtrStringStringString
+#define EMUL8_EXT_TYPE_func_intptr_string_string_uint32 FuncIntPtrStringStringUInt32
+#define EMUL8_EXT_TYPE_func_intptr_string_string_uint64 FuncIntPtrStringStringUInt64
+#define EMUL8_EXT_TYPE_func_intptr_string_uint32 FuncIntPtrStringUInt32
+#define EMUL8_EXT_TYPE_func_intptr_string_uint32_int32 FuncIntPtrStringUInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_string_uint32_intptr FuncIntPtrStringUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_string_uint32_string FuncIntPtrStringUInt32String
+#define EMUL8_EXT_TYPE_func_intptr_string_uint32_uint32 FuncIntPtrStringUInt32UInt32
 #define EMUL8_EXT_TYPE_func_intptr_string_uint32_uint64 FuncIntPtrStringUInt32UInt64
-#define EMUL8_EXT_TYPE_func_int32_string_string_string FuncInt32StringStringString
-#define EMUL8_EXT_TYPE_func_string_intptr_int32_intptr FuncStringIntPtrInt32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint32_string_int32 FuncIntPtrUInt32StringInt32
-#define EMUL8_EXT_TYPE_func_string_uint64_uint32_string FuncStringUInt64UInt32String
-#define EMUL8_EXT_TYPE_action_uint32_uint32_uint32 ActionUInt32UInt32UInt32
-#define EMUL8_EXT_TYPE_func_intptr_int32_uint64_string FuncIntPtrInt32UInt64String
-#define EMUL8_EXT_TYPE_func_uint32_int32_int32_uint32 FuncUInt32Int32Int32UInt32
-#define EMUL8_EXT_TYPE_action_int32_int32_string ActionInt32Int32String
-#define EMUL8_EXT_TYPE_func_int32_uint32_int32_intptr FuncInt32UInt32Int32IntPtr
-#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_intptr FuncIntPtrUInt64UInt32IntPtr
-#define EMUL8_EXT_TYPE_func_string_uint32_uint64_string FuncStringUInt32UInt64String
-#define EMUL8_EXT_TYPE_action_intptr_int32_intptr ActionIntPtrInt32IntPtr
-typedef void (*action_uint64)(uint64_t);
-typedef uint64_t (*func_uint64_uint64)(uint64_t);
-typedef int32_t (*func_int32_uint64)(uint64_t);
-typedef char * (*func_string_uint64)(uint64_t);
-typedef uint32_t (*func_uint32_uint64)(uint64_t);
-typedef void * (*func_intptr_uint64)(uint64_t);
-typedef void (*action_int32)(int32_t);
-typedef uint64_t (*func_uint64_int32)(int32_t);
-typedef int32_t (*func_int32_int32)(int32_t);
-typedef char * (*func_string_int32)(int32_t);
-typedef uint32_t (*func_uint32_int32)(int32_t);
-typedef void * (*func_intptr_int32)(int32_t);
-typedef void (*action_string)(char *);
-typedef uint64_t (*func_uint64_string)(char *);
-typedef int32_t (*func_int32_string)(char *);
-typedef char * (*func_string_string)(char *);
-typedef uint32_t (*func_uint32_string)(char *);
-typedef void * (*func_intptr_string)(char *);
-typedef void (*action_uint32)(uint32_t);
-typedef uint64_t (*func_uint64_uint32)(uint32_t);
-typedef int32_t (*func_int32_uint32)(uint32_t);
-typedef char * (*func_string_uint32)(uint32_t);
-typedef uint32_t (*func_uint32_uint32)(uint32_t);
-typedef void * (*func_intptr_uint32)(uint32_t);
-typedef void (*action_intptr)(void *);
-typedef uint64_t (*func_uint64_intptr)(void *);
-typedef int32_t (*func_int32_intptr)(void *);
-typedef char * (*func_string_intptr)(void *);
-typedef uint32_t (*func_uint32_intptr)(void *);
-typedef void * (*func_intptr_intptr)(void *);
-typedef void (*action_uint64_uint64)(uint64_t, uint64_t);
-typedef uint64_t (*func_uint64_uint64_uint64)(uint64_t, uint64_t);
-typedef int32_t (*func_int32_uint64_uint64)(uint64_t, uint64_t);
-typedef char * (*func_string_uint64_uint64)(uint64_t, uint64_t);
-typedef uint32_t (*func_uint32_uint64_uint64)(uint64_t, uint64_t);
-typedef void * (*func_intptr_uint64_uint64)(uint64_t, uint64_t);
-typedef void (*action_uint64_int32)(uint64_t, int32_t);
-typedef uint64_t (*func_uint64_uint64_int32)(uint64_t, int32_t);
-typedef int32_t (*func_int32_uint64_int32)(uint64_t, int32_t);
-typedef char * (*func_string_uint64_int32)(uint64_t, int32_t);
-typedef uint32_t (*func_uint32_uint64_int32)(uint64_t, int32_t);
-typedef void * (*func_intptr_uint64_int32)(uint64_t, int32_t);
-typedef void (*action_uint64_string)(uint64_t, char *);
-typedef uint64_t (*func_uint64_uint64_string)(uint64_t, char *);
-typedef int32_t (*func_int32_uint64_string)(uint64_t, char *);
-typedef char * (*func_string_uint64_string)(uint64_t, char *);
-typedef uint32_t (*func_uint32_uint64_string)(uint64_t, char *);
-typedef void * (*func_intptr_uint64_string)(uint64_t, char *);
-typedef void (*action_uint64_uint32)(uint64_t, uint32_t);
-typedef uint64_t (*func_uint64_uint64_uint32)(uint64_t, uint32_t);
-typedef int32_t (*func_int32_uint64_uint32)(uint64_t, uint32_t);
-typedef char * (*func_string_uint64_uint32)(uint64_t, uint32_t);
-typedef uint32_t (*func_uint32_uint64_uint32)(uint64_t, uint32_t);
-typedef void * (*func_intptr_uint64_uint32)(uint64_t, uint32_t);
-typedef void (*action_uint64_intptr)(uint64_t, void *);
-typedef uint64_t (*func_uint64_uint64_intptr)(uint64_t, void *);
-typedef int32_t (*func_int32_uint64_intptr)(uint64_t, void *);
-typedef char * (*func_string_uint64_intptr)(uint64_t, void *);
-typedef uint32_t (*func_uint32_uint64_intptr)(uint64_t, void *);
-typedef void * (*func_intptr_uint64_intptr)(uint64_t, void *);
-typedef void (*action_int32_uint64)(int32_t, uint64_t);
-typedef uint64_t (*func_uint64_int32_uint64)(int32_t, uint64_t);
-typedef int32_t (*func_int32_int32_uint64)(int32_t, uint64_t);
-typedef char * (*func_string_int32_uint64)(int32_t, uint64_t);
-typedef uint32_t (*func_uint32_int32_uint64)(int32_t, uint64_t);
-typedef void * (*func_intptr_int32_uint64)(int32_t, uint64_t);
+#define EMUL8_EXT_TYPE_func_intptr_string_uint64 FuncIntPtrStringUInt64
+#define EMUL8_EXT_TYPE_func_intptr_string_uint64_int32 FuncIntPtrStringUInt64Int32
+#define EMUL8_EXT_TYPE_func_intptr_string_uint64_intptr FuncIntPtrStringUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_string_uint64_string FuncIntPtrStringUInt64String
+#define EMUL8_EXT_TYPE_func_intptr_string_uint64_uint32 FuncIntPtrStringUInt64UInt32
+#define EMUL8_EXT_TYPE_func_intptr_string_uint64_uint64 FuncIntPtrStringUInt64UInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint32 FuncIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_int32 FuncIntPtrUInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_int32 FuncIntPtrUInt32Int32Int32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_intptr FuncIntPtrUInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_string FuncIntPtrUInt32Int32String
+#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_uint32 FuncIntPtrUInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_int32_uint64 FuncIntPtrUInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr FuncIntPtrUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_int32 FuncIntPtrUInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_intptr FuncIntPtrUInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_string FuncIntPtrUInt32IntPtrString
+#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_uint32 FuncIntPtrUInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_intptr_uint64 FuncIntPtrUInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint32_string FuncIntPtrUInt32String
+#define EMUL8_EXT_TYPE_func_intptr_uint32_string_int32 FuncIntPtrUInt32StringInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_string_intptr FuncIntPtrUInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint32_string_string FuncIntPtrUInt32StringString
+#define EMUL8_EXT_TYPE_func_intptr_uint32_string_uint32 FuncIntPtrUInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_string_uint64 FuncIntPtrUInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32 FuncIntPtrUInt32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_int32 FuncIntPtrUInt32UInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_intptr FuncIntPtrUInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_string FuncIntPtrUInt32UInt32String
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_uint32 FuncIntPtrUInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint32_uint64 FuncIntPtrUInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64 FuncIntPtrUInt32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_int32 FuncIntPtrUInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_intptr FuncIntPtrUInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_string FuncIntPtrUInt32UInt64String
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_uint32 FuncIntPtrUInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint32_uint64_uint64 FuncIntPtrUInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint64 FuncIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint64_int32 FuncIntPtrUInt64Int32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_int32 FuncIntPtrUInt64Int32Int32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_intptr FuncIntPtrUInt64Int32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_string FuncIntPtrUInt64Int32String
+#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_uint32 FuncIntPtrUInt64Int32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_int32_uint64 FuncIntPtrUInt64Int32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr FuncIntPtrUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_int32 FuncIntPtrUInt64IntPtrInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_intptr FuncIntPtrUInt64IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_string FuncIntPtrUInt64IntPtrString
+#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_uint32 FuncIntPtrUInt64IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_intptr_uint64 FuncIntPtrUInt64IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint64_string FuncIntPtrUInt64String
+#define EMUL8_EXT_TYPE_func_intptr_uint64_string_int32 FuncIntPtrUInt64StringInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_string_intptr FuncIntPtrUInt64StringIntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint64_string_string FuncIntPtrUInt64StringString
+#define EMUL8_EXT_TYPE_func_intptr_uint64_string_uint32 FuncIntPtrUInt64StringUInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_string_uint64 FuncIntPtrUInt64StringUInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32 FuncIntPtrUInt64UInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_int32 FuncIntPtrUInt64UInt32Int32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_intptr FuncIntPtrUInt64UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_string FuncIntPtrUInt64UInt32String
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_uint32 FuncIntPtrUInt64UInt32UInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint32_uint64 FuncIntPtrUInt64UInt32UInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64 FuncIntPtrUInt64UInt64
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_int32 FuncIntPtrUInt64UInt64Int32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_intptr FuncIntPtrUInt64UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_string FuncIntPtrUInt64UInt64String
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_uint32 FuncIntPtrUInt64UInt64UInt32
+#define EMUL8_EXT_TYPE_func_intptr_uint64_uint64_uint64 FuncIntPtrUInt64UInt64UInt64
+#define EMUL8_EXT_TYPE_func_string FuncString
+#define EMUL8_EXT_TYPE_func_string_int32 FuncStringInt32
+#define EMUL8_EXT_TYPE_func_string_int32_int32 FuncStringInt32Int32
+#define EMUL8_EXT_TYPE_func_string_int32_int32_int32 FuncStringInt32Int32Int32
+#define EMUL8_EXT_TYPE_func_string_int32_int32_intptr FuncStringInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_string_int32_int32_string FuncStringInt32Int32String
+#define EMUL8_EXT_TYPE_func_string_int32_int32_uint32 FuncStringInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_string_int32_int32_uint64 FuncStringInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_string_int32_intptr FuncStringInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_int32_intptr_int32 FuncStringInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_string_int32_intptr_intptr FuncStringInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_string_int32_intptr_string FuncStringInt32IntPtrString
+#define EMUL8_EXT_TYPE_func_string_int32_intptr_uint32 FuncStringInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_string_int32_intptr_uint64 FuncStringInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_string_int32_string FuncStringInt32String
+#define EMUL8_EXT_TYPE_func_string_int32_string_int32 FuncStringInt32StringInt32
+#define EMUL8_EXT_TYPE_func_string_int32_string_intptr FuncStringInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_string_int32_string_string FuncStringInt32StringString
+#define EMUL8_EXT_TYPE_func_string_int32_string_uint32 FuncStringInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_string_int32_string_uint64 FuncStringInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_string_int32_uint32 FuncStringInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_int32_uint32_int32 FuncStringInt32UInt32Int32
+#define EMUL8_EXT_TYPE_func_string_int32_uint32_intptr FuncStringInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_int32_uint32_string FuncStringInt32UInt32String
+#define EMUL8_EXT_TYPE_func_string_int32_uint32_uint32 FuncStringInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_int32_uint32_uint64 FuncStringInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_int32_uint64 FuncStringInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_int32_uint64_int32 FuncStringInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_string_int32_uint64_intptr FuncStringInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_string_int32_uint64_string FuncStringInt32UInt64String
+#define EMUL8_EXT_TYPE_func_string_int32_uint64_uint32 FuncStringInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_string_int32_uint64_uint64 FuncStringInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_string_intptr FuncStringIntPtr
+#define EMUL8_EXT_TYPE_func_string_intptr_int32 FuncStringIntPtrInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_int32_int32 FuncStringIntPtrInt32Int32
+#define EMUL8_EXT_TYPE_func_string_intptr_int32_intptr FuncStringIntPtrInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_intptr_int32_string FuncStringIntPtrInt32String
+#define EMUL8_EXT_TYPE_func_string_intptr_int32_uint32 FuncStringIntPtrInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_int32_uint64 FuncStringIntPtrInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_intptr_intptr FuncStringIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_string_intptr_intptr_int32 FuncStringIntPtrIntPtrInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_intptr_intptr FuncStringIntPtrIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_string_intptr_intptr_string FuncStringIntPtrIntPtrString
+#define EMUL8_EXT_TYPE_func_string_intptr_intptr_uint32 FuncStringIntPtrIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_intptr_uint64 FuncStringIntPtrIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_string_intptr_string FuncStringIntPtrString
+#define EMUL8_EXT_TYPE_func_string_intptr_string_int32 FuncStringIntPtrStringInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_string_intptr FuncStringIntPtrStringIntPtr
+#define EMUL8_EXT_TYPE_func_string_intptr_string_string FuncStringIntPtrStringString
+#define EMUL8_EXT_TYPE_func_string_intptr_string_uint32 FuncStringIntPtrStringUInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_string_uint64 FuncStringIntPtrStringUInt64
+#define EMUL8_EXT_TYPE_func_string_intptr_uint32 FuncStringIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_uint32_int32 FuncStringIntPtrUInt32Int32
+#define EMUL8_EXT_TYPE_func_string_intptr_uint32_intptr FuncStringIntPtrUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_intptr_uint32_string FuncStringIntPtrUInt32String
+#define EMUL8_EXT_TYPE_func_string_intptr_uint32_uint32 FuncStringIntPtrUInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_uint32_uint64 FuncStringIntPtrUInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_intptr_uint64 FuncStringIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_string_intptr_uint64_int32 FuncStringIntPtrUInt64Int32
+#define EMUL8_EXT_TYPE_func_string_intptr_uint64_intptr FuncStringIntPtrUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_string_intptr_uint64_string FuncStringIntPtrUInt64String
+#define EMUL8_EXT_TYPE_func_string_intptr_uint64_uint32 FuncStringIntPtrUInt64UInt32
+#define EMUL8_EXT_TYPE_func_string_intptr_uint64_uint64 FuncStringIntPtrUInt64UInt64
+#define EMUL8_EXT_TYPE_func_string_string FuncStringString
+#define EMUL8_EXT_TYPE_func_string_string_int32 FuncStringStringInt32
+#define EMUL8_EXT_TYPE_func_string_string_int32_int32 FuncStringStringInt32Int32
+#define EMUL8_EXT_TYPE_func_string_string_int32_intptr FuncStringStringInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_string_int32_string FuncStringStringInt32String
+#define EMUL8_EXT_TYPE_func_string_string_int32_uint32 FuncStringStringInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_string_int32_uint64 FuncStringStringInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_string_intptr FuncStringStringIntPtr
+#define EMUL8_EXT_TYPE_func_string_string_intptr_int32 FuncStringStringIntPtrInt32
+#define EMUL8_EXT_TYPE_func_string_string_intptr_intptr FuncStringStringIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_string_string_intptr_string FuncStringStringIntPtrString
+#define EMUL8_EXT_TYPE_func_string_string_intptr_uint32 FuncStringStringIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_string_string_intptr_uint64 FuncStringStringIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_string_string_string FuncStringStringString
+#define EMUL8_EXT_TYPE_func_string_string_string_int32 FuncStringStringStringInt32
+#define EMUL8_EXT_TYPE_func_string_string_string_intptr FuncStringStringStringIntPtr
+#define EMUL8_EXT_TYPE_func_string_string_string_string FuncStringStringStringString
+#define EMUL8_EXT_TYPE_func_string_string_string_uint32 FuncStringStringStringUInt32
+#define EMUL8_EXT_TYPE_func_string_string_string_uint64 FuncStringStringStringUInt64
+#define EMUL8_EXT_TYPE_func_string_string_uint32 FuncStringStringUInt32
+#define EMUL8_EXT_TYPE_func_string_string_uint32_int32 FuncStringStringUInt32Int32
+#define EMUL8_EXT_TYPE_func_string_string_uint32_intptr FuncStringStringUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_string_uint32_string FuncStringStringUInt32String
+#define EMUL8_EXT_TYPE_func_string_string_uint32_uint32 FuncStringStringUInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_string_uint32_uint64 FuncStringStringUInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_string_uint64 FuncStringStringUInt64
+#define EMUL8_EXT_TYPE_func_string_string_uint64_int32 FuncStringStringUInt64Int32
+#define EMUL8_EXT_TYPE_func_string_string_uint64_intptr FuncStringStringUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_string_string_uint64_string FuncStringStringUInt64String
+#define EMUL8_EXT_TYPE_func_string_string_uint64_uint32 FuncStringStringUInt64UInt32
+#define EMUL8_EXT_TYPE_func_string_string_uint64_uint64 FuncStringStringUInt64UInt64
+#define EMUL8_EXT_TYPE_func_string_uint32 FuncStringUInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_int32 FuncStringUInt32Int32
+#define EMUL8_EXT_TYPE_func_string_uint32_int32_int32 FuncStringUInt32Int32Int32
+#define EMUL8_EXT_TYPE_func_string_uint32_int32_intptr FuncStringUInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_string_uint32_int32_string FuncStringUInt32Int32String
+#define EMUL8_EXT_TYPE_func_string_uint32_int32_uint32 FuncStringUInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_int32_uint64 FuncStringUInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_string_uint32_intptr FuncStringUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_uint32_intptr_int32 FuncStringUInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_intptr_intptr FuncStringUInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_string_uint32_intptr_string FuncStringUInt32IntPtrString
+#define EMUL8_EXT_TYPE_func_string_uint32_intptr_uint32 FuncStringUInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_intptr_uint64 FuncStringUInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_string_uint32_string FuncStringUInt32String
+#define EMUL8_EXT_TYPE_func_string_uint32_string_int32 FuncStringUInt32StringInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_string_intptr FuncStringUInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_string_uint32_string_string FuncStringUInt32StringString
+#define EMUL8_EXT_TYPE_func_string_uint32_string_uint32 FuncStringUInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_string_uint64 FuncStringUInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_string_uint32_uint32 FuncStringUInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_uint32_int32 FuncStringUInt32UInt32Int32
+#define EMUL8_EXT_TYPE_func_string_uint32_uint32_intptr FuncStringUInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_uint32_uint32_string FuncStringUInt32UInt32String
+#define EMUL8_EXT_TYPE_func_string_uint32_uint32_uint32 FuncStringUInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_uint32_uint64 FuncStringUInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_uint32_uint64 FuncStringUInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_uint32_uint64_int32 FuncStringUInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_string_uint32_uint64_intptr FuncStringUInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_string_uint32_uint64_string FuncStringUInt32UInt64String
+#define EMUL8_EXT_TYPE_func_string_uint32_uint64_uint32 FuncStringUInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_string_uint32_uint64_uint64 FuncStringUInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_string_uint64 FuncStringUInt64
+#define EMUL8_EXT_TYPE_func_string_uint64_int32 FuncStringUInt64Int32
+#define EMUL8_EXT_TYPE_func_string_uint64_int32_int32 FuncStringUInt64Int32Int32
+#define EMUL8_EXT_TYPE_func_string_uint64_int32_intptr FuncStringUInt64Int32IntPtr
+#define EMUL8_EXT_TYPE_func_string_uint64_int32_string FuncStringUInt64Int32String
+#define EMUL8_EXT_TYPE_func_string_uint64_int32_uint32 FuncStringUInt64Int32UInt32
+#define EMUL8_EXT_TYPE_func_string_uint64_int32_uint64 FuncStringUInt64Int32UInt64
+#define EMUL8_EXT_TYPE_func_string_uint64_intptr FuncStringUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_string_uint64_intptr_int32 FuncStringUInt64IntPtrInt32
+#define EMUL8_EXT_TYPE_func_string_uint64_intptr_intptr FuncStringUInt64IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_string_uint64_intptr_string FuncStringUInt64IntPtrString
+#define EMUL8_EXT_TYPE_func_string_uint64_intptr_uint32 FuncStringUInt64IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_string_uint64_intptr_uint64 FuncStringUInt64IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_string_uint64_string FuncStringUInt64String
+#define EMUL8_EXT_TYPE_func_string_uint64_string_int32 FuncStringUInt64StringInt32
+#define EMUL8_EXT_TYPE_func_string_uint64_string_intptr FuncStringUInt64StringIntPtr
+#define EMUL8_EXT_TYPE_func_string_uint64_string_string FuncStringUInt64StringString
+#define EMUL8_EXT_TYPE_func_string_uint64_string_uint32 FuncStringUInt64StringUInt32
+#define EMUL8_EXT_TYPE_func_string_uint64_string_uint64 FuncStringUInt64StringUInt64
+#define EMUL8_EXT_TYPE_func_string_uint64_uint32 FuncStringUInt64UInt32
+#define EMUL8_EXT_TYPE_func_string_uint64_uint32_int32 FuncStringUInt64UInt32Int32
+#define EMUL8_EXT_TYPE_func_string_uint64_uint32_intptr FuncStringUInt64UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_string_uint64_uint32_string FuncStringUInt64UInt32String
+#define EMUL8_EXT_TYPE_func_string_uint64_uint32_uint32 FuncStringUInt64UInt32UInt32
+#define EMUL8_EXT_TYPE_func_string_uint64_uint32_uint64 FuncStringUInt64UInt32UInt64
+#define EMUL8_EXT_TYPE_func_string_uint64_uint64 FuncStringUInt64UInt64
+#define EMUL8_EXT_TYPE_func_string_uint64_uint64_int32 FuncStringUInt64UInt64Int32
+#define EMUL8_EXT_TYPE_func_string_uint64_uint64_intptr FuncStringUInt64UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_string_uint64_uint64_string FuncStringUInt64UInt64String
+#define EMUL8_EXT_TYPE_func_string_uint64_uint64_uint32 FuncStringUInt64UInt64UInt32
+#define EMUL8_EXT_TYPE_func_string_uint64_uint64_uint64 FuncStringUInt64UInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint32 FuncUInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32 FuncUInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_int32_int32 FuncUInt32Int32Int32
+#define EMUL8_EXT_TYPE_func_uint32_int32_int32_int32 FuncUInt32Int32Int32Int32
+#define EMUL8_EXT_TYPE_func_uint32_int32_int32_intptr FuncUInt32Int32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_int32_int32_string FuncUInt32Int32Int32String
+#define EMUL8_EXT_TYPE_func_uint32_int32_int32_uint32 FuncUInt32Int32Int32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32_int32_uint64 FuncUInt32Int32Int32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_int32_intptr FuncUInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_int32 FuncUInt32Int32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_intptr FuncUInt32Int32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_string FuncUInt32Int32IntPtrString
+#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_uint32 FuncUInt32Int32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32_intptr_uint64 FuncUInt32Int32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint32_int32_string FuncUInt32Int32String
+#define EMUL8_EXT_TYPE_func_uint32_int32_string_int32 FuncUInt32Int32StringInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32_string_intptr FuncUInt32Int32StringIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_int32_string_string FuncUInt32Int32StringString
+#define EMUL8_EXT_TYPE_func_uint32_int32_string_uint32 FuncUInt32Int32StringUInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32_string_uint64 FuncUInt32Int32StringUInt64
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint32 FuncUInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_int32 FuncUInt32Int32UInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_intptr FuncUInt32Int32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_string FuncUInt32Int32UInt32String
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_uint32 FuncUInt32Int32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint32_uint64 FuncUInt32Int32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint64 FuncUInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_int32 FuncUInt32Int32UInt64Int32
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_intptr FuncUInt32Int32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_string FuncUInt32Int32UInt64String
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_uint32 FuncUInt32Int32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint32_int32_uint64_uint64 FuncUInt32Int32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint32_intptr FuncUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_intptr_int32 FuncUInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_int32 FuncUInt32IntPtrInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_intptr FuncUInt32IntPtrInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_string FuncUInt32IntPtrInt32String
+#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_uint32 FuncUInt32IntPtrInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_int32_uint64 FuncUInt32IntPtrInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr FuncUInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_int32 FuncUInt32IntPtrIntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_intptr FuncUInt32IntPtrIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_string FuncUInt32IntPtrIntPtrString
+#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_uint32 FuncUInt32IntPtrIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_intptr_uint64 FuncUInt32IntPtrIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint32_intptr_string FuncUInt32IntPtrString
+#define EMUL8_EXT_TYPE_func_uint32_intptr_string_int32 FuncUInt32IntPtrStringInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_string_intptr FuncUInt32IntPtrStringIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_intptr_string_string FuncUInt32IntPtrStringString
+#define EMUL8_EXT_TYPE_func_uint32_intptr_string_uint32 FuncUInt32IntPtrStringUInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_string_uint64 FuncUInt32IntPtrStringUInt64
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32 FuncUInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_int32 FuncUInt32IntPtrUInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_intptr FuncUInt32IntPtrUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_string FuncUInt32IntPtrUInt32String
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_uint32 FuncUInt32IntPtrUInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint32_uint64 FuncUInt32IntPtrUInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64 FuncUInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_int32 FuncUInt32IntPtrUInt64Int32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_intptr FuncUInt32IntPtrUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_string FuncUInt32IntPtrUInt64String
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_uint32 FuncUInt32IntPtrUInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint32_intptr_uint64_uint64 FuncUInt32IntPtrUInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint32_string FuncUInt32String
+#define EMUL8_EXT_TYPE_func_uint32_string_int32 FuncUInt32StringInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_int32_int32 FuncUInt32StringInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_string_int32_intptr FuncUInt32StringInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_string_int32_string FuncUInt32StringInt32String
+#define EMUL8_EXT_TYPE_func_uint32_string_int32_uint32 FuncUInt32StringInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_int32_uint64 FuncUInt32StringInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_string_intptr FuncUInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_string_intptr_int32 FuncUInt32StringIntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_intptr_intptr FuncUInt32StringIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_string_intptr_string FuncUInt32StringIntPtrString
+#define EMUL8_EXT_TYPE_func_uint32_string_intptr_uint32 FuncUInt32StringIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_intptr_uint64 FuncUInt32StringIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint32_string_string FuncUInt32StringString
+#define EMUL8_EXT_TYPE_func_uint32_string_string_int32 FuncUInt32StringStringInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_string_intptr FuncUInt32StringStringIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_string_string_string FuncUInt32StringStringString
+#define EMUL8_EXT_TYPE_func_uint32_string_string_uint32 FuncUInt32StringStringUInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_string_uint64 FuncUInt32StringStringUInt64
+#define EMUL8_EXT_TYPE_func_uint32_string_uint32 FuncUInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_uint32_int32 FuncUInt32StringUInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_string_uint32_intptr FuncUInt32StringUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_string_uint32_string FuncUInt32StringUInt32String
+#define EMUL8_EXT_TYPE_func_uint32_string_uint32_uint32 FuncUInt32StringUInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_uint32_uint64 FuncUInt32StringUInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_string_uint64 FuncUInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_uint32_string_uint64_int32 FuncUInt32StringUInt64Int32
+#define EMUL8_EXT_TYPE_func_uint32_string_uint64_intptr FuncUInt32StringUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_string_uint64_string FuncUInt32StringUInt64String
+#define EMUL8_EXT_TYPE_func_uint32_string_uint64_uint32 FuncUInt32StringUInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint32_string_uint64_uint64 FuncUInt32StringUInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint32 FuncUInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_int32 FuncUInt32UInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_int32 FuncUInt32UInt32Int32Int32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_intptr FuncUInt32UInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_string FuncUInt32UInt32Int32String
+#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_uint32 FuncUInt32UInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_int32_uint64 FuncUInt32UInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr FuncUInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_int32 FuncUInt32UInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_intptr FuncUInt32UInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_string FuncUInt32UInt32IntPtrString
+#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_uint32 FuncUInt32UInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_intptr_uint64 FuncUInt32UInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint32_string FuncUInt32UInt32String
+#define EMUL8_EXT_TYPE_func_uint32_uint32_string_int32 FuncUInt32UInt32StringInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_string_intptr FuncUInt32UInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint32_string_string FuncUInt32UInt32StringString
+#define EMUL8_EXT_TYPE_func_uint32_uint32_string_uint32 FuncUInt32UInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_string_uint64 FuncUInt32UInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32 FuncUInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_int32 FuncUInt32UInt32UInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_intptr FuncUInt32UInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_string FuncUInt32UInt32UInt32String
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_uint32 FuncUInt32UInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint32_uint64 FuncUInt32UInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64 FuncUInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_int32 FuncUInt32UInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_intptr FuncUInt32UInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_string FuncUInt32UInt32UInt64String
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_uint32 FuncUInt32UInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint32_uint64_uint64 FuncUInt32UInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint64 FuncUInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint64_int32 FuncUInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_int32 FuncUInt32UInt64Int32Int32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_intptr FuncUInt32UInt64Int32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_string FuncUInt32UInt64Int32String
+#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_uint32 FuncUInt32UInt64Int32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_int32_uint64 FuncUInt32UInt64Int32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr FuncUInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_int32 FuncUInt32UInt64IntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_intptr FuncUInt32UInt64IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_string FuncUInt32UInt64IntPtrString
+#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_uint32 FuncUInt32UInt64IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_intptr_uint64 FuncUInt32UInt64IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint64_string FuncUInt32UInt64String
+#define EMUL8_EXT_TYPE_func_uint32_uint64_string_int32 FuncUInt32UInt64StringInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_string_intptr FuncUInt32UInt64StringIntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint64_string_string FuncUInt32UInt64StringString
+#define EMUL8_EXT_TYPE_func_uint32_uint64_string_uint32 FuncUInt32UInt64StringUInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_string_uint64 FuncUInt32UInt64StringUInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32 FuncUInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_int32 FuncUInt32UInt64UInt32Int32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_intptr FuncUInt32UInt64UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_string FuncUInt32UInt64UInt32String
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_uint32 FuncUInt32UInt64UInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint32_uint64 FuncUInt32UInt64UInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64 FuncUInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_int32 FuncUInt32UInt64UInt64Int32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_intptr FuncUInt32UInt64UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_string FuncUInt32UInt64UInt64String
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_uint32 FuncUInt32UInt64UInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint32_uint64_uint64_uint64 FuncUInt32UInt64UInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint64 FuncUInt64
+#define EMUL8_EXT_TYPE_func_uint64_int32 FuncUInt64Int32
+#define EMUL8_EXT_TYPE_func_uint64_int32_int32 FuncUInt64Int32Int32
+#define EMUL8_EXT_TYPE_func_uint64_int32_int32_int32 FuncUInt64Int32Int32Int32
+#define EMUL8_EXT_TYPE_func_uint64_int32_int32_intptr FuncUInt64Int32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_int32_int32_string FuncUInt64Int32Int32String
+#define EMUL8_EXT_TYPE_func_uint64_int32_int32_uint32 FuncUInt64Int32Int32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_int32_int32_uint64 FuncUInt64Int32Int32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_int32_intptr FuncUInt64Int32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_int32 FuncUInt64Int32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_intptr FuncUInt64Int32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_string FuncUInt64Int32IntPtrString
+#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_uint32 FuncUInt64Int32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint64_int32_intptr_uint64 FuncUInt64Int32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint64_int32_string FuncUInt64Int32String
+#define EMUL8_EXT_TYPE_func_uint64_int32_string_int32 FuncUInt64Int32StringInt32
+#define EMUL8_EXT_TYPE_func_uint64_int32_string_intptr FuncUInt64Int32StringIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_int32_string_string FuncUInt64Int32StringString
+#define EMUL8_EXT_TYPE_func_uint64_int32_string_uint32 FuncUInt64Int32StringUInt32
+#define EMUL8_EXT_TYPE_func_uint64_int32_string_uint64 FuncUInt64Int32StringUInt64
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint32 FuncUInt64Int32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_int32 FuncUInt64Int32UInt32Int32
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_intptr FuncUInt64Int32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_string FuncUInt64Int32UInt32String
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_uint32 FuncUInt64Int32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint32_uint64 FuncUInt64Int32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint64 FuncUInt64Int32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_int32 FuncUInt64Int32UInt64Int32
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_intptr FuncUInt64Int32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_string FuncUInt64Int32UInt64String
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_uint32 FuncUInt64Int32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint64_int32_uint64_uint64 FuncUInt64Int32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint64_intptr FuncUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_intptr_int32 FuncUInt64IntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_int32 FuncUInt64IntPtrInt32Int32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_intptr FuncUInt64IntPtrInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_string FuncUInt64IntPtrInt32String
+#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_uint32 FuncUInt64IntPtrInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_int32_uint64 FuncUInt64IntPtrInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr FuncUInt64IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_int32 FuncUInt64IntPtrIntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_intptr FuncUInt64IntPtrIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_string FuncUInt64IntPtrIntPtrString
+#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_uint32 FuncUInt64IntPtrIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_intptr_uint64 FuncUInt64IntPtrIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint64_intptr_string FuncUInt64IntPtrString
+#define EMUL8_EXT_TYPE_func_uint64_intptr_string_int32 FuncUInt64IntPtrStringInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_string_intptr FuncUInt64IntPtrStringIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_intptr_string_string FuncUInt64IntPtrStringString
+#define EMUL8_EXT_TYPE_func_uint64_intptr_string_uint32 FuncUInt64IntPtrStringUInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_string_uint64 FuncUInt64IntPtrStringUInt64
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32 FuncUInt64IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_int32 FuncUInt64IntPtrUInt32Int32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_intptr FuncUInt64IntPtrUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_string FuncUInt64IntPtrUInt32String
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_uint32 FuncUInt64IntPtrUInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint32_uint64 FuncUInt64IntPtrUInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64 FuncUInt64IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_int32 FuncUInt64IntPtrUInt64Int32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_intptr FuncUInt64IntPtrUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_string FuncUInt64IntPtrUInt64String
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_uint32 FuncUInt64IntPtrUInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint64_intptr_uint64_uint64 FuncUInt64IntPtrUInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint64_string FuncUInt64String
+#define EMUL8_EXT_TYPE_func_uint64_string_int32 FuncUInt64StringInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_int32_int32 FuncUInt64StringInt32Int32
+#define EMUL8_EXT_TYPE_func_uint64_string_int32_intptr FuncUInt64StringInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_string_int32_string FuncUInt64StringInt32String
+#define EMUL8_EXT_TYPE_func_uint64_string_int32_uint32 FuncUInt64StringInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_int32_uint64 FuncUInt64StringInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_string_intptr FuncUInt64StringIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_string_intptr_int32 FuncUInt64StringIntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_intptr_intptr FuncUInt64StringIntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_string_intptr_string FuncUInt64StringIntPtrString
+#define EMUL8_EXT_TYPE_func_uint64_string_intptr_uint32 FuncUInt64StringIntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_intptr_uint64 FuncUInt64StringIntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint64_string_string FuncUInt64StringString
+#define EMUL8_EXT_TYPE_func_uint64_string_string_int32 FuncUInt64StringStringInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_string_intptr FuncUInt64StringStringIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_string_string_string FuncUInt64StringStringString
+#define EMUL8_EXT_TYPE_func_uint64_string_string_uint32 FuncUInt64StringStringUInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_string_uint64 FuncUInt64StringStringUInt64
+#define EMUL8_EXT_TYPE_func_uint64_string_uint32 FuncUInt64StringUInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_uint32_int32 FuncUInt64StringUInt32Int32
+#define EMUL8_EXT_TYPE_func_uint64_string_uint32_intptr FuncUInt64StringUInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_string_uint32_string FuncUInt64StringUInt32String
+#define EMUL8_EXT_TYPE_func_uint64_string_uint32_uint32 FuncUInt64StringUInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_uint32_uint64 FuncUInt64StringUInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_string_uint64 FuncUInt64StringUInt64
+#define EMUL8_EXT_TYPE_func_uint64_string_uint64_int32 FuncUInt64StringUInt64Int32
+#define EMUL8_EXT_TYPE_func_uint64_string_uint64_intptr FuncUInt64StringUInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_string_uint64_string FuncUInt64StringUInt64String
+#define EMUL8_EXT_TYPE_func_uint64_string_uint64_uint32 FuncUInt64StringUInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint64_string_uint64_uint64 FuncUInt64StringUInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint32 FuncUInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_int32 FuncUInt64UInt32Int32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_int32 FuncUInt64UInt32Int32Int32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_intptr FuncUInt64UInt32Int32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_string FuncUInt64UInt32Int32String
+#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_uint32 FuncUInt64UInt32Int32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_int32_uint64 FuncUInt64UInt32Int32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr FuncUInt64UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_int32 FuncUInt64UInt32IntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_intptr FuncUInt64UInt32IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_string FuncUInt64UInt32IntPtrString
+#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_uint32 FuncUInt64UInt32IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_intptr_uint64 FuncUInt64UInt32IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint32_string FuncUInt64UInt32String
+#define EMUL8_EXT_TYPE_func_uint64_uint32_string_int32 FuncUInt64UInt32StringInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_string_intptr FuncUInt64UInt32StringIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint32_string_string FuncUInt64UInt32StringString
+#define EMUL8_EXT_TYPE_func_uint64_uint32_string_uint32 FuncUInt64UInt32StringUInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_string_uint64 FuncUInt64UInt32StringUInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32 FuncUInt64UInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_int32 FuncUInt64UInt32UInt32Int32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_intptr FuncUInt64UInt32UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_string FuncUInt64UInt32UInt32String
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_uint32 FuncUInt64UInt32UInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint32_uint64 FuncUInt64UInt32UInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64 FuncUInt64UInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_int32 FuncUInt64UInt32UInt64Int32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_intptr FuncUInt64UInt32UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_string FuncUInt64UInt32UInt64String
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_uint32 FuncUInt64UInt32UInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint32_uint64_uint64 FuncUInt64UInt32UInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint64 FuncUInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint64_int32 FuncUInt64UInt64Int32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_int32 FuncUInt64UInt64Int32Int32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_intptr FuncUInt64UInt64Int32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_string FuncUInt64UInt64Int32String
+#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_uint32 FuncUInt64UInt64Int32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_int32_uint64 FuncUInt64UInt64Int32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr FuncUInt64UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_int32 FuncUInt64UInt64IntPtrInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_intptr FuncUInt64UInt64IntPtrIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_string FuncUInt64UInt64IntPtrString
+#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_uint32 FuncUInt64UInt64IntPtrUInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_intptr_uint64 FuncUInt64UInt64IntPtrUInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint64_string FuncUInt64UInt64String
+#define EMUL8_EXT_TYPE_func_uint64_uint64_string_int32 FuncUInt64UInt64StringInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_string_intptr FuncUInt64UInt64StringIntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint64_string_string FuncUInt64UInt64StringString
+#define EMUL8_EXT_TYPE_func_uint64_uint64_string_uint32 FuncUInt64UInt64StringUInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_string_uint64 FuncUInt64UInt64StringUInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32 FuncUInt64UInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_int32 FuncUInt64UInt64UInt32Int32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_intptr FuncUInt64UInt64UInt32IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_string FuncUInt64UInt64UInt32String
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_uint32 FuncUInt64UInt64UInt32UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint32_uint64 FuncUInt64UInt64UInt32UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64 FuncUInt64UInt64UInt64
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_int32 FuncUInt64UInt64UInt64Int32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_intptr FuncUInt64UInt64UInt64IntPtr
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_string FuncUInt64UInt64UInt64String
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_uint32 FuncUInt64UInt64UInt64UInt32
+#define EMUL8_EXT_TYPE_func_uint64_uint64_uint64_uint64 FuncUInt64UInt64UInt64UInt64
+
+typedef void (*action)(void);
+typedef void (*action_int32)(int32_t);
 typedef void (*action_int32_int32)(int32_t, int32_t);
-typedef uint64_t (*func_uint64_int32_int32)(int32_t, int32_t);
-typedef int32_t (*func_int32_int32_int32)(int32_t, int32_t);
-typedef char * (*func_string_int32_int32)(int32_t, int32_t);
-typedef uint32_t (*func_uint32_int32_int32)(int32_t, int32_t);
-typedef void * (*func_intptr_int32_int32)(int32_t, int32_t);
+typedef void (*action_int32_int32_int32)(int32_t, int32_t, int32_t);
+typedef void (*action_int32_int32_intptr)(int32_t, int32_t, void *);
+typedef void (*action_int32_int32_string)(int32_t, int32_t, char *);
+typedef void (*action_int32_int32_uint32)(int32_t, int32_t, uint32_t);
+typedef void (*action_int32_int32_uint64)(int32_t, int32_t, uint64_t);
+typedef void (*action_int32_intptr)(int32_t, void *);
+typedef void (*action_int32_intptr_int32)(int32_t, void *, int32_t);
+typedef void (*action_int32_intptr_intptr)(int32_t, void *, void *);
+typedef void (*action_int32_intptr_string)(int32_t, void *, char *);
+typedef void (*action_int32_intptr_uint32)(int32_t, void *, uint32_t);
+typedef void (*action_int32_intptr_uint64)(int32_t, void *, uint64_t);
 typedef void (*action_int32_string)(int32_t, char *);
-typedef uint64_t (*func_uint64_int32_string)(int32_t, char *);
-typedef int32_t (*func_int32_int32_string)(int32_t, char *);
-typedef char * (*func_string_int32_string)(int32_t, char *);
-typedef uint32_t (*func_uint32_int32_string)(int32_t, char *);
-typedef void * (*func_intptr_int32_string)(int32_t, char *);
+typedef void (*action_int32_string_int32)(int32_t, char *, int32_t);
+typedef void (*action_int32_string_intptr)(int32_t, char *, void *);
+typedef void (*action_int32_string_string)(int32_t, char *, char *);
+typedef void (*action_int32_string_uint32)(int32_t, char *, uint32_t);
+typedef void (*action_int32_string_uint64)(int32_t, char *, uint64_t);
 typedef void (*action_int32_uint32)(int32_t, uint32_t);
-typedef uint64_t (*func_uint64_int32_uint32)(int32_t, uint32_t);
-typedef int32_t (*func_int32_int32_uint32)(int32_t, uint32_t);
-typedef char * (*func_string_int32_uint32)(int32_t, uint32_t);
-typedef uint32_t (*func_uint32_int32_uint32)(int32_t, uint32_t);
-typedef void * (*func_intptr_int32_uint32)(int32_t, uint32_t);
-typedef void (*action_int32_intptr)(int32_t, void *);
-typedef uint64_t (*func_uint64_int32_intptr)(int32_t, void *);
-typedef int32_t (*func_int32_int32_intptr)(int32_t, void *);
-typedef char * (*func_string_int32_intptr)(int32_t, void *);
-typedef uint32_t (*func_uint32_int32_intptr)(int32_t, void *);
-typedef void * (*func_intptr_int32_intptr)(int32_t, void *);
-typedef void (*action_string_uint64)(char *, uint64_t);
-typedef uint64_t (*func_uint64_string_uint64)(char *, uint64_t);
-typedef int32_t (*func_int32_string_uint64)(char *, uint64_t);
-typedef char * (*func_string_string_uint64)(char *, uint64_t);
-typedef uint32_t (*func_uint32_string_uint64)(char *, uint64_t);
-typedef void * (*func_intptr_string_uint64)(char *, uint64_t);
+typedef void (*action_int32_uint32_int32)(int32_t, uint32_t, int32_t);
+typedef void (*action_int32_uint32_intptr)(int32_t, uint32_t, void *);
+typedef void (*action_int32_uint32_string)(int32_t, uint32_t, char *);
+typedef void (*action_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
+typedef void (*action_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
+typedef void (*action_int32_uint64)(int32_t, uint64_t);
+typedef void (*action_int32_uint64_int32)(int32_t, uint64_t, int32_t);
+typedef void (*action_int32_uint64_intptr)(int32_t, uint64_t, void *);
+typedef void (*action_int32_uint64_string)(int32_t, uint64_t, char *);
+typedef void (*action_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
+typedef void (*action_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
+typedef void (*action_intptr)(void *);
+typedef void (*action_intptr_int32)(void *, int32_t);
+typedef void (*action_intptr_int32_int32)(void *, int32_t, int32_t);
+typedef void (*action_intptr_int32_intptr)(void *, int32_t, void *);
+typedef void (*action_intptr_int32_string)(void *, int32_t, char *);
+typedef void (*action_intptr_int32_uint32)(void *, int32_t, uint32_t);
+typedef void (*action_intptr_int32_uint64)(void *, int32_t, uint64_t);
+typedef void (*action_intptr_intptr)(void *, void *);
+typedef void (*action_intptr_intptr_int32)(void *, void *, int32_t);
+typedef void (*action_intptr_intptr_intptr)(void *, void *, void *);
+typedef void (*action_intptr_intptr_string)(void *, void *, char *);
+typedef void (*action_intptr_intptr_uint32)(void *, void *, uint32_t);
+typedef void (*action_intptr_intptr_uint64)(void *, void *, uint64_t);
+typedef void (*action_intptr_string)(void *, char *);
+typedef void (*action_intptr_string_int32)(void *, char *, int32_t);
+typedef void (*action_intptr_string_intptr)(void *, char *, void *);
+typedef void (*action_intptr_string_string)(void *, char *, char *);
+typedef void (*action_intptr_string_uint32)(void *, char *, uint32_t);
+typedef void (*action_intptr_string_uint64)(void *, char *, uint64_t);
+typedef void (*action_intptr_uint32)(void *, uint32_t);
+typedef void (*action_intptr_uint32_int32)(void *, uint32_t, int32_t);
+typedef void (*action_intptr_uint32_intptr)(void *, uint32_t, void *);
+typedef void (*action_intptr_uint32_string)(void *, uint32_t, char *);
+typedef void (*action_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
+typedef void (*action_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
+typedef void (*action_intptr_uint64)(void *, uint64_t);
+typedef void (*action_intptr_uint64_int32)(void *, uint64_t, int32_t);
+typedef void (*action_intptr_uint64_intptr)(void *, uint64_t, void *);
+typedef void (*action_intptr_uint64_string)(void *, uint64_t, char *);
+typedef void (*action_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
+typedef void (*action_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
+typedef void (*action_string)(char *);
 typedef void (*action_string_int32)(char *, int32_t);
-typedef uint64_t (*func_uint64_string_int32)(char *, int32_t);
-typedef int32_t (*func_int32_string_int32)(char *, int32_t);
-typedef char * (*func_string_string_int32)(char *, int32_t);
-typedef uint32_t (*func_uint32_string_int32)(char *, int32_t);
-typedef void * (*func_intptr_string_int32)(char *, int32_t);
+typedef void (*action_string_int32_int32)(char *, int32_t, int32_t);
+typedef void (*action_string_int32_intptr)(char *, int32_t, void *);
+typedef void (*action_string_int32_string)(char *, int32_t, char *);
+typedef void (*action_string_int32_uint32)(char *, int32_t, uint32_t);
+typedef void (*action_string_int32_uint64)(char *, int32_t, uint64_t);
+typedef void (*action_string_intptr)(char *, void *);
+typedef void (*action_string_intptr_int32)(char *, void *, int32_t);
+typedef void (*action_string_intptr_intptr)(char *, void *, void *);
+typedef void (*action_string_intptr_string)(char *, void *, char *);
+typedef void (*action_string_intptr_uint32)(char *, void *, uint32_t);
+typedef void (*action_string_intptr_uint64)(char *, void *, uint64_t);
 typedef void (*action_string_string)(char *, char *);
-typedef uint64_t (*func_uint64_string_string)(char *, char *);
-typedef int32_t (*func_int32_string_string)(char *, char *);
-typedef char * (*func_string_string_string)(char *, char *);
-typedef uint32_t (*func_uint32_string_string)(char *, char *);
-typedef void * (*func_intptr_string_string)(char *, char *);
+typedef void (*action_string_string_int32)(char *, char *, int32_t);
+typedef void (*action_string_string_intptr)(char *, char *, void *);
+typedef void (*action_string_string_string)(char *, char *, char *);
+typedef void (*action_string_string_uint32)(char *, char *, uint32_t);
+typedef void (*action_string_string_uint64)(char *, char *, uint64_t);
 typedef void (*action_string_uint32)(char *, uint32_t);
-typedef uint64_t (*func_uint64_string_uint32)(char *, uint32_t);
-typedef int32_t (*func_int32_string_uint32)(char *, uint32_t);
-typedef char * (*func_string_string_uint32)(char *, uint32_t);
-typedef uint32_t (*func_uint32_string_uint32)(char *, uint32_t);
-typedef void * (*func_intptr_string_uint32)(char *, uint32_t);
-typedef void (*action_string_intptr)(char *, void *);
-typedef uint64_t (*func_uint64_string_intptr)(char *, void *);
-typedef int32_t (*func_int32_string_intptr)(char *, void *);
-typedef char * (*func_string_string_intptr)(char *, void *);
-typedef uint32_t (*func_uint32_string_intptr)(char *, void *);
-typedef void * (*func_intptr_string_intptr)(char *, void *);
-typedef void (*action_uint32_uint64)(uint32_t, uint64_t);
-typedef uint64_t (*func_uint64_uint32_uint64)(uint32_t, uint64_t);
-typedef int32_t (*func_int32_uint32_uint64)(uint32_t, uint64_t);
-typedef char * (*func_string_uint32_uint64)(uint32_t, uint64_t);
-typedef uint32_t (*func_uint32_uint32_uint64)(uint32_t, uint64_t);
-typedef void * (*func_intptr_uint32_uint64)(uint32_t, uint64_t);
+typedef void (*action_string_uint32_int32)(char *, uint32_t, int32_t);
+typedef void (*action_string_uint32_intptr)(char *, uint32_t, void *);
+typedef void (*action_string_uint32_string)(char *, uint32_t, char *);
+typedef void (*action_string_uint32_uint32)(char *, uint32_t, uint32_t);
+typedef void (*action_string_uint32_uint64)(char *, uint32_t, uint64_t);
+typedef void (*action_string_uint64)(char *, uint64_t);
+typedef void (*action_string_uint64_int32)(char *, uint64_t, int32_t);
+typedef void (*action_string_uint64_intptr)(char *, uint64_t, void *);
+typedef void (*action_string_uint64_string)(char *, uint64_t, char *);
+typedef void (*action_string_uint64_uint32)(char *, uint64_t, uint32_t);
+typedef void (*action_string_uint64_uint64)(char *, uint64_t, uint64_t);
+typedef void (*action_uint32)(uint32_t);
 typedef void (*action_uint32_int32)(uint32_t, int32_t);
-typedef uint64_t (*func_uint64_uint32_int32)(uint32_t, int32_t);
-typedef int32_t (*func_int32_uint32_int32)(uint32_t, int32_t);
-typedef char * (*func_string_uint32_int32)(uint32_t, int32_t);
-typedef uint32_t (*func_uint32_uint32_int32)(uint32_t, int32_t);
-typedef void * (*func_intptr_uint32_int32)(uint32_t, int32_t);
-typedef void (*action_uint32_string)(uint32_t, char *);
-typedef uint64_t (*func_uint64_uint32_string)(uint32_t, char *);
-typedef int32_t (*func_int32_uint32_string)(uint32_t, char *);
-typedef char * (*func_string_uint32_string)(uint32_t, char *);
-typedef uint32_t (*func_uint32_uint32_string)(uint32_t, char *);
-typedef void * (*func_intptr_uint32_string)(uint32_t, char *);
-typedef void (*action_uint32_uint32)(uint32_t, uint32_t);
-typedef uint64_t (*func_uint64_uint32_uint32)(uint32_t, uint32_t);
-typedef int32_t (*func_int32_uint32_uint32)(uint32_t, uint32_t);
-typedef char * (*func_string_uint32_uint32)(uint32_t, uint32_t);
-typedef uint32_t (*func_uint32_uint32_uint32)(uint32_t, uint32_t);
-typedef void * (*func_intptr_uint32_uint32)(uint32_t, uint32_t);
+typedef void (*action_uint32_int32_int32)(uint32_t, int32_t, int32_t);
+typedef void (*action_uint32_int32_intptr)(uint32_t, int32_t, void *);
+typedef void (*action_uint32_int32_string)(uint32_t, int32_t, char *);
+typedef void (*action_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
+typedef void (*action_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
 typedef void (*action_uint32_intptr)(uint32_t, void *);
-typedef uint64_t (*func_uint64_uint32_intptr)(uint32_t, void *);
-typedef int32_t (*func_int32_uint32_intptr)(uint32_t, void *);
-typedef char * (*func_string_uint32_intptr)(uint32_t, void *);
-typedef uint32_t (*func_uint32_uint32_intptr)(uint32_t, void *);
-typedef void * (*func_intptr_uint32_intptr)(uint32_t, void *);
-typedef void (*action_intptr_uint64)(void *, uint64_t);
-typedef uint64_t (*func_uint64_intptr_uint64)(void *, uint64_t);
-typedef int32_t (*func_int32_intptr_uint64)(void *, uint64_t);
-typedef char * (*func_string_intptr_uint64)(void *, uint64_t);
-typedef uint32_t (*func_uint32_intptr_uint64)(void *, uint64_t);
-typedef void * (*func_intptr_intptr_uint64)(void *, uint64_t);
-typedef void (*action_intptr_int32)(void *, int32_t);
-typedef uint64_t (*func_uint64_intptr_int32)(void *, int32_t);
-typedef int32_t (*func_int32_intptr_int32)(void *, int32_t);
-typedef char * (*func_string_intptr_int32)(void *, int32_t);
-typedef uint32_t (*func_uint32_intptr_int32)(void *, int32_t);
-typedef void * (*func_intptr_intptr_int32)(void *, int32_t);
-typedef void (*action_intptr_string)(void *, char *);
-typedef uint64_t (*func_uint64_intptr_string)(void *, char *);
-typedef int32_t (*func_int32_intptr_string)(void *, char *);
-typedef char * (*func_string_intptr_string)(void *, char *);
-typedef uint32_t (*func_uint32_intptr_string)(void *, char *);
-typedef void * (*func_intptr_intptr_string)(void *, char *);
-typedef void (*action_intptr_uint32)(void *, uint32_t);
-typedef uint64_t (*func_uint64_intptr_uint32)(void *, uint32_t);
-typedef int32_t (*func_int32_intptr_uint32)(void *, uint32_t);
-typedef char * (*func_string_intptr_uint32)(void *, uint32_t);
-typedef uint32_t (*func_uint32_intptr_uint32)(void *, uint32_t);
-typedef void * (*func_intptr_intptr_uint32)(void *, uint32_t);
-typedef void (*action_intptr_intptr)(void *, void *);
-typedef uint64_t (*func_uint64_intptr_intptr)(void *, void *);
-typedef int32_t (*func_int32_intptr_intptr)(void *, void *);
-typedef char * (*func_string_intptr_intptr)(void *, void *);
-typedef uint32_t (*func_uint32_intptr_intptr)(void *, void *);
-typedef void * (*func_intptr_intptr_intptr)(void *, void *);
-typedef void (*action_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
-typedef uint64_t (*func_uint64_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
-typedef int32_t (*func_int32_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
-typedef char * (*func_string_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
-typedef uint32_t (*func_uint32_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
-typedef void * (*func_intptr_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
-typedef void (*action_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
-typedef uint64_t (*func_uint64_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
-typedef int32_t (*func_int32_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
-typedef char * (*func_string_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
-typedef uint32_t (*func_uint32_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
-typedef void * (*func_intptr_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
-typedef void (*action_uint64_uint64_string)(uint64_t, uint64_t, char *);
-typedef uint64_t (*func_uint64_uint64_uint64_string)(uint64_t, uint64_t, char *);
-typedef int32_t (*func_int32_uint64_uint64_string)(uint64_t, uint64_t, char *);
-typedef char * (*func_string_uint64_uint64_string)(uint64_t, uint64_t, char *);
-typedef uint32_t (*func_uint32_uint64_uint64_string)(uint64_t, uint64_t, char *);
-typedef void * (*func_intptr_uint64_uint64_string)(uint64_t, uint64_t, char *);
-typedef void (*action_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
-typedef uint64_t (*func_uint64_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
-typedef int32_t (*func_int32_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
-typedef char * (*func_string_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
-typedef uint32_t (*func_uint32_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
-typedef void * (*func_intptr_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
-typedef void (*action_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
-typedef uint64_t (*func_uint64_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
-typedef int32_t (*func_int32_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
-typedef char * (*func_string_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
-typedef uint32_t (*func_uint32_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
-typedef void * (*func_intptr_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
-typedef void (*action_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
-typedef uint64_t (*func_uint64_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
-typedef int32_t (*func_int32_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
-typedef char * (*func_string_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
-typedef uint32_t (*func_uint32_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
-typedef void * (*func_intptr_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
+typedef void (*action_uint32_intptr_int32)(uint32_t, void *, int32_t);
+typedef void (*action_uint32_intptr_intptr)(uint32_t, void *, void *);
+typedef void (*action_uint32_intptr_string)(uint32_t, void *, char *);
+typedef void (*action_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
+typedef void (*action_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
+typedef void (*action_uint32_string)(uint32_t, char *);
+typedef void (*action_uint32_string_int32)(uint32_t, char *, int32_t);
+typedef void (*action_uint32_string_intptr)(uint32_t, char *, void *);
+typedef void (*action_uint32_string_string)(uint32_t, char *, char *);
+typedef void (*action_uint32_string_uint32)(uint32_t, char *, uint32_t);
+typedef void (*action_uint32_string_uint64)(uint32_t, char *, uint64_t);
+typedef void (*action_uint32_uint32)(uint32_t, uint32_t);
+typedef void (*action_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
+typedef void (*action_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
+typedef void (*action_uint32_uint32_string)(uint32_t, uint32_t, char *);
+typedef void (*action_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
+typedef void (*action_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
+typedef void (*action_uint32_uint64)(uint32_t, uint64_t);
+typedef void (*action_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
+typedef void (*action_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
+typedef void (*action_uint32_uint64_string)(uint32_t, uint64_t, char *);
+typedef void (*action_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
+typedef void (*action_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
+typedef void (*action_uint64)(uint64_t);
+typedef void (*action_uint64_int32)(uint64_t, int32_t);
 typedef void (*action_uint64_int32_int32)(uint64_t, int32_t, int32_t);
-typedef uint64_t (*func_uint64_uint64_int32_int32)(uint64_t, int32_t, int32_t);
-typedef int32_t (*func_int32_uint64_int32_int32)(uint64_t, int32_t, int32_t);
-typedef char * (*func_string_uint64_int32_int32)(uint64_t, int32_t, int32_t);
-typedef uint32_t (*func_uint32_uint64_int32_int32)(uint64_t, int32_t, int32_t);
-typedef void * (*func_intptr_uint64_int32_int32)(uint64_t, int32_t, int32_t);
+typedef void (*action_uint64_int32_intptr)(uint64_t, int32_t, void *);
 typedef void (*action_uint64_int32_string)(uint64_t, int32_t, char *);
-typedef uint64_t (*func_uint64_uint64_int32_string)(uint64_t, int32_t, char *);
-typedef int32_t (*func_int32_uint64_int32_string)(uint64_t, int32_t, char *);
-typedef char * (*func_string_uint64_int32_string)(uint64_t, int32_t, char *);
-typedef uint32_t (*func_uint32_uint64_int32_string)(uint64_t, int32_t, char *);
-typedef void * (*func_intptr_uint64_int32_string)(uint64_t, int32_t, char *);
 typedef void (*action_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
-typedef uint64_t (*func_uint64_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
-typedef int32_t (*func_int32_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
-typedef char * (*func_string_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
-typedef uint32_t (*func_uint32_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
-typedef void * (*func_intptr_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
-typedef void (*action_uint64_int32_intptr)(uint64_t, int32_t, void *);
-typedef uint64_t (*func_uint64_uint64_int32_intptr)(uint64_t, int32_t, void *);
-typedef int32_t (*func_int32_uint64_int32_intptr)(uint64_t, int32_t, void *);
-typedef char * (*func_string_uint64_int32_intptr)(uint64_t, int32_t, void *);
-typedef uint32_t (*func_uint32_uint64_int32_intptr)(uint64_t, int32_t, void *);
-typedef void * (*func_intptr_uint64_int32_intptr)(uint64_t, int32_t, void *);
-typedef void (*action_uint64_string_uint64)(uint64_t, char *, uint64_t);
-typedef uint64_t (*func_uint64_uint64_string_uint64)(uint64_t, char *, uint64_t);
-typedef int32_t (*func_int32_uint64_string_uint64)(uint64_t, char *, uint64_t);
-typedef char * (*func_string_uint64_string_uint64)(uint64_t, char *, uint64_t);
-typedef uint32_t (*func_uint32_uint64_string_uint64)(uint64_t, char *, uint64_t);
-typedef void * (*func_intptr_uint64_string_uint64)(uint64_t, char *, uint64_t);
+typedef void (*action_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
+typedef void (*action_uint64_intptr)(uint64_t, void *);
+typedef void (*action_uint64_intptr_int32)(uint64_t, void *, int32_t);
+typedef void (*action_uint64_intptr_intptr)(uint64_t, void *, void *);
+typedef void (*action_uint64_intptr_string)(uint64_t, void *, char *);
+typedef void (*action_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
+typedef void (*action_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
+typedef void (*action_uint64_string)(uint64_t, char *);
 typedef void (*action_uint64_string_int32)(uint64_t, char *, int32_t);
-typedef uint64_t (*func_uint64_uint64_string_int32)(uint64_t, char *, int32_t);
-typedef int32_t (*func_int32_uint64_string_int32)(uint64_t, char *, int32_t);
-typedef char * (*func_string_uint64_string_int32)(uint64_t, char *, int32_t);
-typedef uint32_t (*func_uint32_uint64_string_int32)(uint64_t, char *, int32_t);
-typedef void * (*func_intptr_uint64_string_int32)(uint64_t, char *, int32_t);
+typedef void (*action_uint64_string_intptr)(uint64_t, char *, void *);
 typedef void (*action_uint64_string_string)(uint64_t, char *, char *);
-typedef uint64_t (*func_uint64_uint64_string_string)(uint64_t, char *, char *);
-typedef int32_t (*func_int32_uint64_string_string)(uint64_t, char *, char *);
-typedef char * (*func_string_uint64_string_string)(uint64_t, char *, char *);
-typedef uint32_t (*func_uint32_uint64_string_string)(uint64_t, char *, char *);
-typedef void * (*func_intptr_uint64_string_string)(uint64_t, char *, char *);
 typedef void (*action_uint64_string_uint32)(uint64_t, char *, uint32_t);
-typedef uint64_t (*func_uint64_uint64_string_uint32)(uint64_t, char *, uint32_t);
-typedef int32_t (*func_int32_uint64_string_uint32)(uint64_t, char *, uint32_t);
-typedef char * (*func_string_uint64_string_uint32)(uint64_t, char *, uint32_t);
-typedef uint32_t (*func_uint32_uint64_string_uint32)(uint64_t, char *, uint32_t);
-typedef void * (*func_intptr_uint64_string_uint32)(uint64_t, char *, uint32_t);
-typedef void (*action_uint64_string_intptr)(uint64_t, char *, void *);
-typedef uint64_t (*func_uint64_uint64_string_intptr)(uint64_t, char *, void *);
-typedef int32_t (*func_int32_uint64_string_intptr)(uint64_t, char *, void *);
-typedef char * (*func_string_uint64_string_intptr)(uint64_t, char *, void *);
-typedef uint32_t (*func_uint32_uint64_string_intptr)(uint64_t, char *, void *);
-typedef void * (*func_intptr_uint64_string_intptr)(uint64_t, char *, void *);
-typedef void (*action_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
-typedef uint64_t (*func_uint64_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
-typedef int32_t (*func_int32_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
-typedef char * (*func_string_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
-typedef uint32_t (*func_uint32_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
-typedef void * (*func_intptr_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
+typedef void (*action_uint64_string_uint64)(uint64_t, char *, uint64_t);
+typedef void (*action_uint64_uint32)(uint64_t, uint32_t);
 typedef void (*action_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
-typedef uint64_t (*func_uint64_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
-typedef int32_t (*func_int32_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
-typedef char * (*func_string_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
-typedef uint32_t (*func_uint32_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
-typedef void * (*func_intptr_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
+typedef void (*action_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
 typedef void (*action_uint64_uint32_string)(uint64_t, uint32_t, char *);
-typedef uint64_t (*func_uint64_uint64_uint32_string)(uint64_t, uint32_t, char *);
-typedef int32_t (*func_int32_uint64_uint32_string)(uint64_t, uint32_t, char *);
-typedef char * (*func_string_uint64_uint32_string)(uint64_t, uint32_t, char *);
-typedef uint32_t (*func_uint32_uint64_uint32_string)(uint64_t, uint32_t, char *);
-typedef void * (*func_intptr_uint64_uint32_string)(uint64_t, uint32_t, char *);
 typedef void (*action_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
-typedef uint64_t (*func_uint64_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
-typedef int32_t (*func_int32_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
-typedef char * (*func_string_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
-typedef uint32_t (*func_uint32_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
-typedef void * (*func_intptr_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
-typedef void (*action_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
-typedef uint64_t (*func_uint64_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
-typedef int32_t (*func_int32_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
-typedef char * (*func_string_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
-typedef uint32_t (*func_uint32_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
-typedef void * (*func_intptr_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
-typedef void (*action_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
-typedef uint64_t (*func_uint64_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
-typedef int32_t (*func_int32_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
-typedef char * (*func_string_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
-typedef uint32_t (*func_uint32_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
-typedef void * (*func_intptr_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
-typedef void (*action_uint64_intptr_int32)(uint64_t, void *, int32_t);
-typedef uint64_t (*func_uint64_uint64_intptr_int32)(uint64_t, void *, int32_t);
+typedef void (*action_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
+typedef void (*action_uint64_uint64)(uint64_t, uint64_t);
+typedef void (*action_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
+typedef void (*action_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
+typedef void (*action_uint64_uint64_string)(uint64_t, uint64_t, char *);
+typedef void (*action_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
+typedef void (*action_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
+typedef int32_t (*func_int32)(void);
+typedef int32_t (*func_int32_int32)(int32_t);
+typedef int32_t (*func_int32_int32_int32)(int32_t, int32_t);
+typedef int32_t (*func_int32_int32_int32_int32)(int32_t, int32_t, int32_t);
+typedef int32_t (*func_int32_int32_int32_intptr)(int32_t, int32_t, void *);
+typedef int32_t (*func_int32_int32_int32_string)(int32_t, int32_t, char *);
+typedef int32_t (*func_int32_int32_int32_uint32)(int32_t, int32_t, uint32_t);
+typedef int32_t (*func_int32_int32_int32_uint64)(int32_t, int32_t, uint64_t);
+typedef int32_t (*func_int32_int32_intptr)(int32_t, void *);
+typedef int32_t (*func_int32_int32_intptr_int32)(int32_t, void *, int32_t);
+typedef int32_t (*func_int32_int32_intptr_intptr)(int32_t, void *, void *);
+typedef int32_t (*func_int32_int32_intptr_string)(int32_t, void *, char *);
+typedef int32_t (*func_int32_int32_intptr_uint32)(int32_t, void *, uint32_t);
+typedef int32_t (*func_int32_int32_intptr_uint64)(int32_t, void *, uint64_t);
+typedef int32_t (*func_int32_int32_string)(int32_t, char *);
+typedef int32_t (*func_int32_int32_string_int32)(int32_t, char *, int32_t);
+typedef int32_t (*func_int32_int32_string_intptr)(int32_t, char *, void *);
+typedef int32_t (*func_int32_int32_string_string)(int32_t, char *, char *);
+typedef int32_t (*func_int32_int32_string_uint32)(int32_t, char *, uint32_t);
+typedef int32_t (*func_int32_int32_string_uint64)(int32_t, char *, uint64_t);
+typedef int32_t (*func_int32_int32_uint32)(int32_t, uint32_t);
+typedef int32_t (*func_int32_int32_uint32_int32)(int32_t, uint32_t, int32_t);
+typedef int32_t (*func_int32_int32_uint32_intptr)(int32_t, uint32_t, void *);
+typedef int32_t (*func_int32_int32_uint32_string)(int32_t, uint32_t, char *);
+typedef int32_t (*func_int32_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
+typedef int32_t (*func_int32_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
+typedef int32_t (*func_int32_int32_uint64)(int32_t, uint64_t);
+typedef int32_t (*func_int32_int32_uint64_int32)(int32_t, uint64_t, int32_t);
+typedef int32_t (*func_int32_int32_uint64_intptr)(int32_t, uint64_t, void *);
+typedef int32_t (*func_int32_int32_uint64_string)(int32_t, uint64_t, char *);
+typedef int32_t (*func_int32_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
+typedef int32_t (*func_int32_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
+typedef int32_t (*func_int32_intptr)(void *);
+typedef int32_t (*func_int32_intptr_int32)(void *, int32_t);
+typedef int32_t (*func_int32_intptr_int32_int32)(void *, int32_t, int32_t);
+typedef int32_t (*func_int32_intptr_int32_intptr)(void *, int32_t, void *);
+typedef int32_t (*func_int32_intptr_int32_string)(void *, int32_t, char *);
+typedef int32_t (*func_int32_intptr_int32_uint32)(void *, int32_t, uint32_t);
+typedef int32_t (*func_int32_intptr_int32_uint64)(void *, int32_t, uint64_t);
+typedef int32_t (*func_int32_intptr_intptr)(void *, void *);
+typedef int32_t (*func_int32_intptr_intptr_int32)(void *, void *, int32_t);
+typedef int32_t (*func_int32_intptr_intptr_intptr)(void *, void *, void *);
+typedef int32_t (*func_int32_intptr_intptr_string)(void *, void *, char *);
+typedef int32_t (*func_int32_intptr_intptr_uint32)(void *, void *, uint32_t);
+typedef int32_t (*func_int32_intptr_intptr_uint64)(void *, void *, uint64_t);
+typedef int32_t (*func_int32_intptr_string)(void *, char *);
+typedef int32_t (*func_int32_intptr_string_int32)(void *, char *, int32_t);
+typedef int32_t (*func_int32_intptr_string_intptr)(void *, char *, void *);
+typedef int32_t (*func_int32_intptr_string_string)(void *, char *, char *);
+typedef int32_t (*func_int32_intptr_string_uint32)(void *, char *, uint32_t);
+typedef int32_t (*func_int32_intptr_string_uint64)(void *, char *, uint64_t);
+typedef int32_t (*func_int32_intptr_uint32)(void *, uint32_t);
+typedef int32_t (*func_int32_intptr_uint32_int32)(void *, uint32_t, int32_t);
+typedef int32_t (*func_int32_intptr_uint32_intptr)(void *, uint32_t, void *);
+typedef int32_t (*func_int32_intptr_uint32_string)(void *, uint32_t, char *);
+typedef int32_t (*func_int32_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
+typedef int32_t (*func_int32_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
+typedef int32_t (*func_int32_intptr_uint64)(void *, uint64_t);
+typedef int32_t (*func_int32_intptr_uint64_int32)(void *, uint64_t, int32_t);
+typedef int32_t (*func_int32_intptr_uint64_intptr)(void *, uint64_t, void *);
+typedef int32_t (*func_int32_intptr_uint64_string)(void *, uint64_t, char *);
+typedef int32_t (*func_int32_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
+typedef int32_t (*func_int32_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
+typedef int32_t (*func_int32_string)(char *);
+typedef int32_t (*func_int32_string_int32)(char *, int32_t);
+typedef int32_t (*func_int32_string_int32_int32)(char *, int32_t, int32_t);
+typedef int32_t (*func_int32_string_int32_intptr)(char *, int32_t, void *);
+typedef int32_t (*func_int32_string_int32_string)(char *, int32_t, char *);
+typedef int32_t (*func_int32_string_int32_uint32)(char *, int32_t, uint32_t);
+typedef int32_t (*func_int32_string_int32_uint64)(char *, int32_t, uint64_t);
+typedef int32_t (*func_int32_string_intptr)(char *, void *);
+typedef int32_t (*func_int32_string_intptr_int32)(char *, void *, int32_t);
+typedef int32_t (*func_int32_string_intptr_intptr)(char *, void *, void *);
+typedef int32_t (*func_int32_string_intptr_string)(char *, void *, char *);
+typedef int32_t (*func_int32_string_intptr_uint32)(char *, void *, uint32_t);
+typedef int32_t (*func_int32_string_intptr_uint64)(char *, void *, uint64_t);
+typedef int32_t (*func_int32_string_string)(char *, char *);
+typedef int32_t (*func_int32_string_string_int32)(char *, char *, int32_t);
+typedef int32_t (*func_int32_string_string_intptr)(char *, char *, void *);
+typedef int32_t (*func_int32_string_string_string)(char *, char *, char *);
+typedef int32_t (*func_int32_string_string_uint32)(char *, char *, uint32_t);
+typedef int32_t (*func_int32_string_string_uint64)(char *, char *, uint64_t);
+typedef int32_t (*func_int32_string_uint32)(char *, uint32_t);
+typedef int32_t (*func_int32_string_uint32_int32)(char *, uint32_t, int32_t);
+typedef int32_t (*func_int32_string_uint32_intptr)(char *, uint32_t, void *);
+typedef int32_t (*func_int32_string_uint32_string)(char *, uint32_t, char *);
+typedef int32_t (*func_int32_string_uint32_uint32)(char *, uint32_t, uint32_t);
+typedef int32_t (*func_int32_string_uint32_uint64)(char *, uint32_t, uint64_t);
+typedef int32_t (*func_int32_string_uint64)(char *, uint64_t);
+typedef int32_t (*func_int32_string_uint64_int32)(char *, uint64_t, int32_t);
+typedef int32_t (*func_int32_string_uint64_intptr)(char *, uint64_t, void *);
+typedef int32_t (*func_int32_string_uint64_string)(char *, uint64_t, char *);
+typedef int32_t (*func_int32_string_uint64_uint32)(char *, uint64_t, uint32_t);
+typedef int32_t (*func_int32_string_uint64_uint64)(char *, uint64_t, uint64_t);
+typedef int32_t (*func_int32_uint32)(uint32_t);
+typedef int32_t (*func_int32_uint32_int32)(uint32_t, int32_t);
+typedef int32_t (*func_int32_uint32_int32_int32)(uint32_t, int32_t, int32_t);
+typedef int32_t (*func_int32_uint32_int32_intptr)(uint32_t, int32_t, void *);
+typedef int32_t (*func_int32_uint32_int32_string)(uint32_t, int32_t, char *);
+typedef int32_t (*func_int32_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
+typedef int32_t (*func_int32_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
+typedef int32_t (*func_int32_uint32_intptr)(uint32_t, void *);
+typedef int32_t (*func_int32_uint32_intptr_int32)(uint32_t, void *, int32_t);
+typedef int32_t (*func_int32_uint32_intptr_intptr)(uint32_t, void *, void *);
+typedef int32_t (*func_int32_uint32_intptr_string)(uint32_t, void *, char *);
+typedef int32_t (*func_int32_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
+typedef int32_t (*func_int32_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
+typedef int32_t (*func_int32_uint32_string)(uint32_t, char *);
+typedef int32_t (*func_int32_uint32_string_int32)(uint32_t, char *, int32_t);
+typedef int32_t (*func_int32_uint32_string_intptr)(uint32_t, char *, void *);
+typedef int32_t (*func_int32_uint32_string_string)(uint32_t, char *, char *);
+typedef int32_t (*func_int32_uint32_string_uint32)(uint32_t, char *, uint32_t);
+typedef int32_t (*func_int32_uint32_string_uint64)(uint32_t, char *, uint64_t);
+typedef int32_t (*func_int32_uint32_uint32)(uint32_t, uint32_t);
+typedef int32_t (*func_int32_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
+typedef int32_t (*func_int32_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
+typedef int32_t (*func_int32_uint32_uint32_string)(uint32_t, uint32_t, char *);
+typedef int32_t (*func_int32_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
+typedef int32_t (*func_int32_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
+typedef int32_t (*func_int32_uint32_uint64)(uint32_t, uint64_t);
+typedef int32_t (*func_int32_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
+typedef int32_t (*func_int32_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
+typedef int32_t (*func_int32_uint32_uint64_string)(uint32_t, uint64_t, char *);
+typedef int32_t (*func_int32_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
+typedef int32_t (*func_int32_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
+typedef int32_t (*func_int32_uint64)(uint64_t);
+typedef int32_t (*func_int32_uint64_int32)(uint64_t, int32_t);
+typedef int32_t (*func_int32_uint64_int32_int32)(uint64_t, int32_t, int32_t);
+typedef int32_t (*func_int32_uint64_int32_intptr)(uint64_t, int32_t, void *);
+typedef int32_t (*func_int32_uint64_int32_string)(uint64_t, int32_t, char *);
+typedef int32_t (*func_int32_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
+typedef int32_t (*func_int32_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
+typedef int32_t (*func_int32_uint64_intptr)(uint64_t, void *);
 typedef int32_t (*func_int32_uint64_intptr_int32)(uint64_t, void *, int32_t);
-typedef char * (*func_string_uint64_intptr_int32)(uint64_t, void *, int32_t);
-typedef uint32_t (*func_uint32_uint64_intptr_int32)(uint64_t, void *, int32_t);
-typedef void * (*func_intptr_uint64_intptr_int32)(uint64_t, void *, int32_t);
-typedef void (*action_uint64_intptr_string)(uint64_t, void *, char *);
-typedef uint64_t (*func_uint64_uint64_intptr_string)(uint64_t, void *, char *);
+typedef int32_t (*func_int32_uint64_intptr_intptr)(uint64_t, void *, void *);
 typedef int32_t (*func_int32_uint64_intptr_string)(uint64_t, void *, char *);
-typedef char * (*func_string_uint64_intptr_string)(uint64_t, void *, char *);
-typedef uint32_t (*func_uint32_uint64_intptr_string)(uint64_t, void *, char *);
-typedef void * (*func_intptr_uint64_intptr_string)(uint64_t, void *, char *);
-typedef void (*action_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
-typedef uint64_t (*func_uint64_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
 typedef int32_t (*func_int32_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
-typedef char * (*func_string_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
-typedef uint32_t (*func_uint32_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
-typedef void * (*func_intptr_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
-typedef void (*action_uint64_intptr_intptr)(uint64_t, void *, void *);
-typedef uint64_t (*func_uint64_uint64_intptr_intptr)(uint64_t, void *, void *);
-typedef int32_t (*func_int32_uint64_intptr_intptr)(uint64_t, void *, void *);
-typedef char * (*func_string_uint64_intptr_intptr)(uint64_t, void *, void *);
-typedef uint32_t (*func_uint32_uint64_intptr_intptr)(uint64_t, void *, void *);
-typedef void * (*func_intptr_uint64_intptr_intptr)(uint64_t, void *, void *);
-typedef void (*action_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
-typedef uint64_t (*func_uint64_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
-typedef int32_t (*func_int32_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
-typedef char * (*func_string_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
-typedef uint32_t (*func_uint32_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
-typedef void * (*func_intptr_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
-typedef void (*action_int32_uint64_int32)(int32_t, uint64_t, int32_t);
-typedef uint64_t (*func_uint64_int32_uint64_int32)(int32_t, uint64_t, int32_t);
-typedef int32_t (*func_int32_int32_uint64_int32)(int32_t, uint64_t, int32_t);
-typedef char * (*func_string_int32_uint64_int32)(int32_t, uint64_t, int32_t);
-typedef uint32_t (*func_uint32_int32_uint64_int32)(int32_t, uint64_t, int32_t);
-typedef void * (*func_intptr_int32_uint64_int32)(int32_t, uint64_t, int32_t);
-typedef void (*action_int32_uint64_string)(int32_t, uint64_t, char *);
-typedef uint64_t (*func_uint64_int32_uint64_string)(int32_t, uint64_t, char *);
-typedef int32_t (*func_int32_int32_uint64_string)(int32_t, uint64_t, char *);
-typedef char * (*func_string_int32_uint64_string)(int32_t, uint64_t, char *);
-typedef uint32_t (*func_uint32_int32_uint64_string)(int32_t, uint64_t, char *);
-typedef void * (*func_intptr_int32_uint64_string)(int32_t, uint64_t, char *);
-typedef void (*action_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
-typedef uint64_t (*func_uint64_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
-typedef int32_t (*func_int32_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
-typedef char * (*func_string_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
-typedef uint32_t (*func_uint32_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
-typedef void * (*func_intptr_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
-typedef void (*action_int32_uint64_intptr)(int32_t, uint64_t, void *);
-typedef uint64_t (*func_uint64_int32_uint64_intptr)(int32_t, uint64_t, void *);
-typedef int32_t (*func_int32_int32_uint64_intptr)(int32_t, uint64_t, void *);
-typedef char * (*func_string_int32_uint64_intptr)(int32_t, uint64_t, void *);
-typedef uint32_t (*func_uint32_int32_uint64_intptr)(int32_t, uint64_t, void *);
-typedef void * (*func_intptr_int32_uint64_intptr)(int32_t, uint64_t, void *);
-typedef void (*action_int32_int32_uint64)(int32_t, int32_t, uint64_t);
-typedef uint64_t (*func_uint64_int32_int32_uint64)(int32_t, int32_t, uint64_t);
-typedef int32_t (*func_int32_int32_int32_uint64)(int32_t, int32_t, uint64_t);
-typedef char * (*func_string_int32_int32_uint64)(int32_t, int32_t, uint64_t);
-typedef uint32_t (*func_uint32_int32_int32_uint64)(int32_t, int32_t, uint64_t);
-typedef void * (*func_intptr_int32_int32_uint64)(int32_t, int32_t, uint64_t);
-typedef void (*action_int32_int32_int32)(int32_t, int32_t, int32_t);
-typedef uint64_t (*func_uint64_int32_int32_int32)(int32_t, int32_t, int32_t);
-typedef int32_t (*func_int32_int32_int32_int32)(int32_t, int32_t, int32_t);
-typedef char * (*func_string_int32_int32_int32)(int32_t, int32_t, int32_t);
-typedef uint32_t (*func_uint32_int32_int32_int32)(int32_t, int32_t, int32_t);
+typedef int32_t (*func_int32_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
+typedef int32_t (*func_int32_uint64_string)(uint64_t, char *);
+typedef int32_t (*func_int32_uint64_string_int32)(uint64_t, char *, int32_t);
+typedef int32_t (*func_int32_uint64_string_intptr)(uint64_t, char *, void *);
+typedef int32_t (*func_int32_uint64_string_string)(uint64_t, char *, char *);
+typedef int32_t (*func_int32_uint64_string_uint32)(uint64_t, char *, uint32_t);
+typedef int32_t (*func_int32_uint64_string_uint64)(uint64_t, char *, uint64_t);
+typedef int32_t (*func_int32_uint64_uint32)(uint64_t, uint32_t);
+typedef int32_t (*func_int32_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
+typedef int32_t (*func_int32_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
+typedef int32_t (*func_int32_uint64_uint32_string)(uint64_t, uint32_t, char *);
+typedef int32_t (*func_int32_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
+typedef int32_t (*func_int32_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
+typedef int32_t (*func_int32_uint64_uint64)(uint64_t, uint64_t);
+typedef int32_t (*func_int32_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
+typedef int32_t (*func_int32_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
+typedef int32_t (*func_int32_uint64_uint64_string)(uint64_t, uint64_t, char *);
+typedef int32_t (*func_int32_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
+typedef int32_t (*func_int32_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
+typedef void * (*func_intptr)(void);
+typedef void * (*func_intptr_int32)(int32_t);
+typedef void * (*func_intptr_int32_int32)(int32_t, int32_t);
 typedef void * (*func_intptr_int32_int32_int32)(int32_t, int32_t, int32_t);
-typedef void (*action_int32_int32_string)(int32_t, int32_t, char *);
-typedef uint64_t (*func_uint64_int32_int32_string)(int32_t, int32_t, char *);
-typedef int32_t (*func_int32_int32_int32_string)(int32_t, int32_t, char *);
-typedef char * (*func_string_int32_int32_string)(int32_t, int32_t, char *);
-typedef uint32_t (*func_uint32_int32_int32_string)(int32_t, int32_t, char *);
+typedef void * (*func_intptr_int32_int32_intptr)(int32_t, int32_t, void *);
 typedef void * (*func_intptr_int32_int32_string)(int32_t, int32_t, char *);
-typedef void (*action_int32_int32_uint32)(int32_t, int32_t, uint32_t);
-typedef uint64_t (*func_uint64_int32_int32_uint32)(int32_t, int32_t, uint32_t);
-typedef int32_t (*func_int32_int32_int32_uint32)(int32_t, int32_t, uint32_t);
-typedef char * (*func_string_int32_int32_uint32)(int32_t, int32_t, uint32_t);
-typedef uint32_t (*func_uint32_int32_int32_uint32)(int32_t, int32_t, uint32_t);
 typedef void * (*func_intptr_int32_int32_uint32)(int32_t, int32_t, uint32_t);
-typedef void (*action_int32_int32_intptr)(int32_t, int32_t, void *);
-typedef uint64_t (*func_uint64_int32_int32_intptr)(int32_t, int32_t, void *);
-typedef int32_t (*func_int32_int32_int32_intptr)(int32_t, int32_t, void *);
-typedef char * (*func_string_int32_int32_intptr)(int32_t, int32_t, void *);
-typedef uint32_t (*func_uint32_int32_int32_intptr)(int32_t, int32_t, void *);
-typedef void * (*func_intptr_int32_int32_intptr)(int32_t, int32_t, void *);
-typedef void (*action_int32_string_uint64)(int32_t, char *, uint64_t);
-typedef uint64_t (*func_uint64_int32_string_uint64)(int32_t, char *, uint64_t);
-typedef int32_t (*func_int32_int32_string_uint64)(int32_t, char *, uint64_t);
-typedef char * (*func_string_int32_string_uint64)(int32_t, char *, uint64_t);
-typedef uint32_t (*func_uint32_int32_string_uint64)(int32_t, char *, uint64_t);
-typedef void * (*func_intptr_int32_string_uint64)(int32_t, char *, uint64_t);
-typedef void (*action_int32_string_int32)(int32_t, char *, int32_t);
-typedef uint64_t (*func_uint64_int32_string_int32)(int32_t, char *, int32_t);
-typedef int32_t (*func_int32_int32_string_int32)(int32_t, char *, int32_t);
-typedef char * (*func_string_int32_string_int32)(int32_t, char *, int32_t);
-typedef uint32_t (*func_uint32_int32_string_int32)(int32_t, char *, int32_t);
+typedef void * (*func_intptr_int32_int32_uint64)(int32_t, int32_t, uint64_t);
+typedef void * (*func_intptr_int32_intptr)(int32_t, void *);
+typedef void * (*func_intptr_int32_intptr_int32)(int32_t, void *, int32_t);
+typedef void * (*func_intptr_int32_intptr_intptr)(int32_t, void *, void *);
+typedef void * (*func_intptr_int32_intptr_string)(int32_t, void *, char *);
+typedef void * (*func_intptr_int32_intptr_uint32)(int32_t, void *, uint32_t);
+typedef void * (*func_intptr_int32_intptr_uint64)(int32_t, void *, uint64_t);
+typedef void * (*func_intptr_int32_string)(int32_t, char *);
 typedef void * (*func_intptr_int32_string_int32)(int32_t, char *, int32_t);
-typedef void (*action_int32_string_string)(int32_t, char *, char *);
-typedef uint64_t (*func_uint64_int32_string_string)(int32_t, char *, char *);
-typedef int32_t (*func_int32_int32_string_string)(int32_t, char *, char *);
-typedef char * (*func_string_int32_string_string)(int32_t, char *, char *);
-typedef uint32_t (*func_uint32_int32_string_string)(int32_t, char *, char *);
+typedef void * (*func_intptr_int32_string_intptr)(int32_t, char *, void *);
 typedef void * (*func_intptr_int32_string_string)(int32_t, char *, char *);
-typedef void (*action_int32_string_uint32)(int32_t, char *, uint32_t);
-typedef uint64_t (*func_uint64_int32_string_uint32)(int32_t, char *, uint32_t);
-typedef int32_t (*func_int32_int32_string_uint32)(int32_t, char *, uint32_t);
-typedef char * (*func_string_int32_string_uint32)(int32_t, char *, uint32_t);
-typedef uint32_t (*func_uint32_int32_string_uint32)(int32_t, char *, uint32_t);
 typedef void * (*func_intptr_int32_string_uint32)(int32_t, char *, uint32_t);
-typedef void (*action_int32_string_intptr)(int32_t, char *, void *);
-typedef uint64_t (*func_uint64_int32_string_intptr)(int32_t, char *, void *);
-typedef int32_t (*func_int32_int32_string_intptr)(int32_t, char *, void *);
-typedef char * (*func_string_int32_string_intptr)(int32_t, char *, void *);
-typedef uint32_t (*func_uint32_int32_string_intptr)(int32_t, char *, void *);
-typedef void * (*func_intptr_int32_string_intptr)(int32_t, char *, void *);
-typedef void (*action_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
-typedef uint64_t (*func_uint64_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
-typedef int32_t (*func_int32_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
-typedef char * (*func_string_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
-typedef uint32_t (*func_uint32_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
-typedef void * (*func_intptr_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
-typedef void (*action_int32_uint32_int32)(int32_t, uint32_t, int32_t);
-typedef uint64_t (*func_uint64_int32_uint32_int32)(int32_t, uint32_t, int32_t);
-typedef int32_t (*func_int32_int32_uint32_int32)(int32_t, uint32_t, int32_t);
-typedef char * (*func_string_int32_uint32_int32)(int32_t, uint32_t, int32_t);
-typedef uint32_t (*func_uint32_int32_uint32_int32)(int32_t, uint32_t, int32_t);
+typedef void * (*func_intptr_int32_string_uint64)(int32_t, char *, uint64_t);
+typedef void * (*func_intptr_int32_uint32)(int32_t, uint32_t);
 typedef void * (*func_intptr_int32_uint32_int32)(int32_t, uint32_t, int32_t);
-typedef void (*action_int32_uint32_string)(int32_t, uint32_t, char *);
-typedef uint64_t (*func_uint64_int32_uint32_string)(int32_t, uint32_t, char *);
-typedef int32_t (*func_int32_int32_uint32_string)(int32_t, uint32_t, char *);
-typedef char * (*func_string_int32_uint32_string)(int32_t, uint32_t, char *);
-typedef uint32_t (*func_uint32_int32_uint32_string)(int32_t, uint32_t, char *);
+typedef void * (*func_intptr_int32_uint32_intptr)(int32_t, uint32_t, void *);
 typedef void * (*func_intptr_int32_uint32_string)(int32_t, uint32_t, char *);
-typedef void (*action_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
-typedef uint64_t (*func_uint64_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
-typedef int32_t (*func_int32_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
-typedef char * (*func_string_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
-typedef uint32_t (*func_uint32_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
 typedef void * (*func_intptr_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
-typedef void (*action_int32_uint32_intptr)(int32_t, uint32_t, void *);
-typedef uint64_t (*func_uint64_int32_uint32_intptr)(int32_t, uint32_t, void *);
-typedef int32_t (*func_int32_int32_uint32_intptr)(int32_t, uint32_t, void *);
-typedef char * (*func_string_int32_uint32_intptr)(int32_t, uint32_t, void *);
-typedef uint32_t (*func_uint32_int32_uint32_intptr)(int32_t, uint32_t, void *);
-typedef void * (*func_intptr_int32_uint32_intptr)(int32_t, uint32_t, void *);
-typedef void (*action_int32_intptr_uint64)(int32_t, void *, uint64_t);
-typedef uint64_t (*func_uint64_int32_intptr_uint64)(int32_t, void *, uint64_t);
-typedef int32_t (*func_int32_int32_intptr_uint64)(int32_t, void *, uint64_t);
-typedef char * (*func_string_int32_intptr_uint64)(int32_t, void *, uint64_t);
-typedef uint32_t (*func_uint32_int32_intptr_uint64)(int32_t, void *, uint64_t);
-typedef void * (*func_intptr_int32_intptr_uint64)(int32_t, void *, uint64_t);
-typedef void (*action_int32_intptr_int32)(int32_t, void *, int32_t);
-typedef uint64_t (*func_uint64_int32_intptr_int32)(int32_t, void *, int32_t);
-typedef int32_t (*func_int32_int32_intptr_int32)(int32_t, void *, int32_t);
-typedef char * (*func_string_int32_intptr_int32)(int32_t, void *, int32_t);
-typedef uint32_t (*func_uint32_int32_intptr_int32)(int32_t, void *, int32_t);
-typedef void * (*func_intptr_int32_intptr_int32)(int32_t, void *, int32_t);
-typedef void (*action_int32_intptr_string)(int32_t, void *, char *);
-typedef uint64_t (*func_uint64_int32_intptr_string)(int32_t, void *, char *);
-typedef int32_t (*func_int32_int32_intptr_string)(int32_t, void *, char *);
-typedef char * (*func_string_int32_intptr_string)(int32_t, void *, char *);
-typedef uint32_t (*func_uint32_int32_intptr_string)(int32_t, void *, char *);
-typedef void * (*func_intptr_int32_intptr_string)(int32_t, void *, char *);
-typedef void (*action_int32_intptr_uint32)(int32_t, void *, uint32_t);
-typedef uint64_t (*func_uint64_int32_intptr_uint32)(int32_t, void *, uint32_t);
-typedef int32_t (*func_int32_int32_intptr_uint32)(int32_t, void *, uint32_t);
-typedef char * (*func_string_int32_intptr_uint32)(int32_t, void *, uint32_t);
-typedef uint32_t (*func_uint32_int32_intptr_uint32)(int32_t, void *, uint32_t);
-typedef void * (*func_intptr_int32_intptr_uint32)(int32_t, void *, uint32_t);
-typedef void (*action_int32_intptr_intptr)(int32_t, void *, void *);
-typedef uint64_t (*func_uint64_int32_intptr_intptr)(int32_t, void *, void *);
-typedef int32_t (*func_int32_int32_intptr_intptr)(int32_t, void *, void *);
-typedef char * (*func_string_int32_intptr_intptr)(int32_t, void *, void *);
-typedef uint32_t (*func_uint32_int32_intptr_intptr)(int32_t, void *, void *);
-typedef void * (*func_intptr_int32_intptr_intptr)(int32_t, void *, void *);
-typedef void (*action_string_uint64_uint64)(char *, uint64_t, uint64_t);
-typedef uint64_t (*func_uint64_string_uint64_uint64)(char *, uint64_t, uint64_t);
-typedef int32_t (*func_int32_string_uint64_uint64)(char *, uint64_t, uint64_t);
-typedef char * (*func_string_string_uint64_uint64)(char *, uint64_t, uint64_t);
-typedef uint32_t (*func_uint32_string_uint64_uint64)(char *, uint64_t, uint64_t);
-typedef void * (*func_intptr_string_uint64_uint64)(char *, uint64_t, uint64_t);
-typedef void (*action_string_uint64_int32)(char *, uint64_t, int32_t);
-typedef uint64_t (*func_uint64_string_uint64_int32)(char *, uint64_t, int32_t);
-typedef int32_t (*func_int32_string_uint64_int32)(char *, uint64_t, int32_t);
-typedef char * (*func_string_string_uint64_int32)(char *, uint64_t, int32_t);
-typedef uint32_t (*func_uint32_string_uint64_int32)(char *, uint64_t, int32_t);
-typedef void * (*func_intptr_string_uint64_int32)(char *, uint64_t, int32_t);
-typedef void (*action_string_uint64_string)(char *, uint64_t, char *);
-typedef uint64_t (*func_uint64_string_uint64_string)(char *, uint64_t, char *);
-typedef int32_t (*func_int32_string_uint64_string)(char *, uint64_t, char *);
-typedef char * (*func_string_string_uint64_string)(char *, uint64_t, char *);
-typedef uint32_t (*func_uint32_string_uint64_string)(char *, uint64_t, char *);
-typedef void * (*func_intptr_string_uint64_string)(char *, uint64_t, char *);
-typedef void (*action_string_uint64_uint32)(char *, uint64_t, uint32_t);
-typedef uint64_t (*func_uint64_string_uint64_uint32)(char *, uint64_t, uint32_t);
-typedef int32_t (*func_int32_string_uint64_uint32)(char *, uint64_t, uint32_t);
-typedef char * (*func_string_string_uint64_uint32)(char *, uint64_t, uint32_t);
-typedef uint32_t (*func_uint32_string_uint64_uint32)(char *, uint64_t, uint32_t);
-typedef void * (*func_intptr_string_uint64_uint32)(char *, uint64_t, uint32_t);
-typedef void (*action_string_uint64_intptr)(char *, uint64_t, void *);
-typedef uint64_t (*func_uint64_string_uint64_intptr)(char *, uint64_t, void *);
-typedef int32_t (*func_int32_string_uint64_intptr)(char *, uint64_t, void *);
-typedef char * (*func_string_string_uint64_intptr)(char *, uint64_t, void *);
-typedef uint32_t (*func_uint32_string_uint64_intptr)(char *, uint64_t, void *);
-typedef void * (*func_intptr_string_uint64_intptr)(char *, uint64_t, void *);
-typedef void (*action_string_int32_uint64)(char *, int32_t, uint64_t);
-typedef uint64_t (*func_uint64_string_int32_uint64)(char *, int32_t, uint64_t);
-typedef int32_t (*func_int32_string_int32_uint64)(char *, int32_t, uint64_t);
-typedef char * (*func_string_string_int32_uint64)(char *, int32_t, uint64_t);
-typedef uint32_t (*func_uint32_string_int32_uint64)(char *, int32_t, uint64_t);
-typedef void * (*func_intptr_string_int32_uint64)(char *, int32_t, uint64_t);
-typedef void (*action_string_int32_int32)(char *, int32_t, int32_t);
-typedef uint64_t (*func_uint64_string_int32_int32)(char *, int32_t, int32_t);
-typedef int32_t (*func_int32_string_int32_int32)(char *, int32_t, int32_t);
-typedef char * (*func_string_string_int32_int32)(char *, int32_t, int32_t);
-typedef uint32_t (*func_uint32_string_int32_int32)(char *, int32_t, int32_t);
+typedef void * (*func_intptr_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
+typedef void * (*func_intptr_int32_uint64)(int32_t, uint64_t);
+typedef void * (*func_intptr_int32_uint64_int32)(int32_t, uint64_t, int32_t);
+typedef void * (*func_intptr_int32_uint64_intptr)(int32_t, uint64_t, void *);
+typedef void * (*func_intptr_int32_uint64_string)(int32_t, uint64_t, char *);
+typedef void * (*func_intptr_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
+typedef void * (*func_intptr_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
+typedef void * (*func_intptr_intptr)(void *);
+typedef void * (*func_intptr_intptr_int32)(void *, int32_t);
+typedef void * (*func_intptr_intptr_int32_int32)(void *, int32_t, int32_t);
+typedef void * (*func_intptr_intptr_int32_intptr)(void *, int32_t, void *);
+typedef void * (*func_intptr_intptr_int32_string)(void *, int32_t, char *);
+typedef void * (*func_intptr_intptr_int32_uint32)(void *, int32_t, uint32_t);
+typedef void * (*func_intptr_intptr_int32_uint64)(void *, int32_t, uint64_t);
+typedef void * (*func_intptr_intptr_intptr)(void *, void *);
+typedef void * (*func_intptr_intptr_intptr_int32)(void *, void *, int32_t);
+typedef void * (*func_intptr_intptr_intptr_intptr)(void *, void *, void *);
+typedef void * (*func_intptr_intptr_intptr_string)(void *, void *, char *);
+typedef void * (*func_intptr_intptr_intptr_uint32)(void *, void *, uint32_t);
+typedef void * (*func_intptr_intptr_intptr_uint64)(void *, void *, uint64_t);
+typedef void * (*func_intptr_intptr_string)(void *, char *);
+typedef void * (*func_intptr_intptr_string_int32)(void *, char *, int32_t);
+typedef void * (*func_intptr_intptr_string_intptr)(void *, char *, void *);
+typedef void * (*func_intptr_intptr_string_string)(void *, char *, char *);
+typedef void * (*func_intptr_intptr_string_uint32)(void *, char *, uint32_t);
+typedef void * (*func_intptr_intptr_string_uint64)(void *, char *, uint64_t);
+typedef void * (*func_intptr_intptr_uint32)(void *, uint32_t);
+typedef void * (*func_intptr_intptr_uint32_int32)(void *, uint32_t, int32_t);
+typedef void * (*func_intptr_intptr_uint32_intptr)(void *, uint32_t, void *);
+typedef void * (*func_intptr_intptr_uint32_string)(void *, uint32_t, char *);
+typedef void * (*func_intptr_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
+typedef void * (*func_intptr_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
+typedef void * (*func_intptr_intptr_uint64)(void *, uint64_t);
+typedef void * (*func_intptr_intptr_uint64_int32)(void *, uint64_t, int32_t);
+typedef void * (*func_intptr_intptr_uint64_intptr)(void *, uint64_t, void *);
+typedef void * (*func_intptr_intptr_uint64_string)(void *, uint64_t, char *);
+typedef void * (*func_intptr_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
+typedef void * (*func_intptr_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
+typedef void * (*func_intptr_string)(char *);
+typedef void * (*func_intptr_string_int32)(char *, int32_t);
 typedef void * (*func_intptr_string_int32_int32)(char *, int32_t, int32_t);
-typedef void (*action_string_int32_string)(char *, int32_t, char *);
-typedef uint64_t (*func_uint64_string_int32_string)(char *, int32_t, char *);
-typedef int32_t (*func_int32_string_int32_string)(char *, int32_t, char *);
-typedef char * (*func_string_string_int32_string)(char *, int32_t, char *);
-typedef uint32_t (*func_uint32_string_int32_string)(char *, int32_t, char *);
+typedef void * (*func_intptr_string_int32_intptr)(char *, int32_t, void *);
 typedef void * (*func_intptr_string_int32_string)(char *, int32_t, char *);
-typedef void (*action_string_int32_uint32)(char *, int32_t, uint32_t);
-typedef uint64_t (*func_uint64_string_int32_uint32)(char *, int32_t, uint32_t);
-typedef int32_t (*func_int32_string_int32_uint32)(char *, int32_t, uint32_t);
-typedef char * (*func_string_string_int32_uint32)(char *, int32_t, uint32_t);
-typedef uint32_t (*func_uint32_string_int32_uint32)(char *, int32_t, uint32_t);
 typedef void * (*func_intptr_string_int32_uint32)(char *, int32_t, uint32_t);
-typedef void (*action_string_int32_intptr)(char *, int32_t, void *);
-typedef uint64_t (*func_uint64_string_int32_intptr)(char *, int32_t, void *);
-typedef int32_t (*func_int32_string_int32_intptr)(char *, int32_t, void *);
-typedef char * (*func_string_string_int32_intptr)(char *, int32_t, void *);
-typedef uint32_t (*func_uint32_string_int32_intptr)(char *, int32_t, void *);
-typedef void * (*func_intptr_string_int32_intptr)(char *, int32_t, void *);
-typedef void (*action_string_string_uint64)(char *, char *, uint64_t);
-typedef uint64_t (*func_uint64_string_string_uint64)(char *, char *, uint64_t);
-typedef int32_t (*func_int32_string_string_uint64)(char *, char *, uint64_t);
-typedef char * (*func_string_string_string_uint64)(char *, char *, uint64_t);
-typedef uint32_t (*func_uint32_string_string_uint64)(char *, char *, uint64_t);
-typedef void * (*func_intptr_string_string_uint64)(char *, char *, uint64_t);
-typedef void (*action_string_string_int32)(char *, char *, int32_t);
-typedef uint64_t (*func_uint64_string_string_int32)(char *, char *, int32_t);
-typedef int32_t (*func_int32_string_string_int32)(char *, char *, int32_t);
-typedef char * (*func_string_string_string_int32)(char *, char *, int32_t);
-typedef uint32_t (*func_uint32_string_string_int32)(char *, char *, int32_t);
+typedef void * (*func_intptr_string_int32_uint64)(char *, int32_t, uint64_t);
+typedef void * (*func_intptr_string_intptr)(char *, void *);
+typedef void * (*func_intptr_string_intptr_int32)(char *, void *, int32_t);
+typedef void * (*func_intptr_string_intptr_intptr)(char *, void *, void *);
+typedef void * (*func_intptr_string_intptr_string)(char *, void *, char *);
+typedef void * (*func_intptr_string_intptr_uint32)(char *, void *, uint32_t);
+typedef void * (*func_intptr_string_intptr_uint64)(char *, void *, uint64_t);
+typedef void * (*func_intptr_string_string)(char *, char *);
 typedef void * (*func_intptr_string_string_int32)(char *, char *, int32_t);
-typedef void (*action_string_string_string)(char *, char *, char *);
-typedef uint64_t (*func_uint64_string_string_string)(char *, char *, char *);
-typedef int32_t (*func_int32_string_string_string)(char *, char *, char *);
-typedef char * (*func_string_string_string_string)(char *, char *, char *);
-typedef uint32_t (*func_uint32_string_string_string)(char *, char *, char *);
+typedef void * (*func_intptr_string_string_intptr)(char *, char *, void *);
 typedef void * (*func_intptr_string_string_string)(char *, char *, char *);
-typedef void (*action_string_string_uint32)(char *, char *, uint32_t);
-typedef uint64_t (*func_uint64_string_string_uint32)(char *, char *, uint32_t);
-typedef int32_t (*func_int32_string_string_uint32)(char *, char *, uint32_t);
-typedef char * (*func_string_string_string_uint32)(char *, char *, uint32_t);
-typedef uint32_t (*func_uint32_string_string_uint32)(char *, char *, uint32_t);
 typedef void * (*func_intptr_string_string_uint32)(char *, char *, uint32_t);
-typedef void (*action_string_string_intptr)(char *, char *, void *);
-typedef uint64_t (*func_uint64_string_string_intptr)(char *, char *, void *);
-typedef int32_t (*func_int32_string_string_intptr)(char *, char *, void *);
-typedef char * (*func_string_string_string_intptr)(char *, char *, void *);
-typedef uint32_t (*func_uint32_string_string_intptr)(char *, char *, void *);
-typedef void * (*func_intptr_string_string_intptr)(char *, char *, void *);
-typedef void (*action_string_uint32_uint64)(char *, uint32_t, uint64_t);
-typedef uint64_t (*func_uint64_string_uint32_uint64)(char *, uint32_t, uint64_t);
-typedef int32_t (*func_int32_string_uint32_uint64)(char *, uint32_t, uint64_t);
-typedef char * (*func_string_string_uint32_uint64)(char *, uint32_t, uint64_t);
-typedef uint32_t (*func_uint32_string_uint32_uint64)(char *, uint32_t, uint64_t);
-typedef void * (*func_intptr_string_uint32_uint64)(char *, uint32_t, uint64_t);
-typedef void (*action_string_uint32_int32)(char *, uint32_t, int32_t);
-typedef uint64_t (*func_uint64_string_uint32_int32)(char *, uint32_t, int32_t);
-typedef int32_t (*func_int32_string_uint32_int32)(char *, uint32_t, int32_t);
-typedef char * (*func_string_string_uint32_int32)(char *, uint32_t, int32_t);
-typedef uint32_t (*func_uint32_string_uint32_int32)(char *, uint32_t, int32_t);
+typedef void * (*func_intptr_string_string_uint64)(char *, char *, uint64_t);
+typedef void * (*func_intptr_string_uint32)(char *, uint32_t);
 typedef void * (*func_intptr_string_uint32_int32)(char *, uint32_t, int32_t);
-typedef void (*action_string_uint32_string)(char *, uint32_t, char *);
-typedef uint64_t (*func_uint64_string_uint32_string)(char *, uint32_t, char *);
-typedef int32_t (*func_int32_string_uint32_string)(char *, uint32_t, char *);
-typedef char * (*func_string_string_uint32_string)(char *, uint32_t, char *);
-typedef uint32_t (*func_uint32_string_uint32_string)(char *, uint32_t, char *);
+typedef void * (*func_intptr_string_uint32_intptr)(char *, uint32_t, void *);
 typedef void * (*func_intptr_string_uint32_string)(char *, uint32_t, char *);
-typedef void (*action_string_uint32_uint32)(char *, uint32_t, uint32_t);
-typedef uint64_t (*func_uint64_string_uint32_uint32)(char *, uint32_t, uint32_t);
-typedef int32_t (*func_int32_string_uint32_uint32)(char *, uint32_t, uint32_t);
-typedef char * (*func_string_string_uint32_uint32)(char *, uint32_t, uint32_t);
-typedef uint32_t (*func_uint32_string_uint32_uint32)(char *, uint32_t, uint32_t);
 typedef void * (*func_intptr_string_uint32_uint32)(char *, uint32_t, uint32_t);
-typedef void (*action_string_uint32_intptr)(char *, uint32_t, void *);
-typedef uint64_t (*func_uint64_string_uint32_intptr)(char *, uint32_t, void *);
-typedef int32_t (*func_int32_string_uint32_intptr)(char *, uint32_t, void *);
-typedef char * (*func_string_string_uint32_intptr)(char *, uint32_t, void *);
-typedef uint32_t (*func_uint32_string_uint32_intptr)(char *, uint32_t, void *);
-typedef void * (*func_intptr_string_uint32_intptr)(char *, uint32_t, void *);
-typedef void (*action_string_intptr_uint64)(char *, void *, uint64_t);
-typedef uint64_t (*func_uint64_string_intptr_uint64)(char *, void *, uint64_t);
-typedef int32_t (*func_int32_string_intptr_uint64)(char *, void *, uint64_t);
-typedef char * (*func_string_string_intptr_uint64)(char *, void *, uint64_t);
-typedef uint32_t (*func_uint32_string_intptr_uint64)(char *, void *, uint64_t);
-typedef void * (*func_intptr_string_intptr_uint64)(char *, void *, uint64_t);
-typedef void (*action_string_intptr_int32)(char *, void *, int32_t);
-typedef uint64_t (*func_uint64_string_intptr_int32)(char *, void *, int32_t);
-typedef int32_t (*func_int32_string_intptr_int32)(char *, void *, int32_t);
-typedef char * (*func_string_string_intptr_int32)(char *, void *, int32_t);
-typedef uint32_t (*func_uint32_string_intptr_int32)(char *, void *, int32_t);
-typedef void * (*func_intptr_string_intptr_int32)(char *, void *, int32_t);
-typedef void (*action_string_intptr_string)(char *, void *, char *);
-typedef uint64_t (*func_uint64_string_intptr_string)(char *, void *, char *);
-typedef int32_t (*func_int32_string_intptr_string)(char *, void *, char *);
+typedef void * (*func_intptr_string_uint32_uint64)(char *, uint32_t, uint64_t);
+typedef void * (*func_intptr_string_uint64)(char *, uint64_t);
+typedef void * (*func_intptr_string_uint64_int32)(char *, uint64_t, int32_t);
+typedef void * (*func_intptr_string_uint64_intptr)(char *, uint64_t, void *);
+typedef void * (*func_intptr_string_uint64_string)(char *, uint64_t, char *);
+typedef void * (*func_intptr_string_uint64_uint32)(char *, uint64_t, uint32_t);
+typedef void * (*func_intptr_string_uint64_uint64)(char *, uint64_t, uint64_t);
+typedef void * (*func_intptr_uint32)(uint32_t);
+typedef void * (*func_intptr_uint32_int32)(uint32_t, int32_t);
+typedef void * (*func_intptr_uint32_int32_int32)(uint32_t, int32_t, int32_t);
+typedef void * (*func_intptr_uint32_int32_intptr)(uint32_t, int32_t, void *);
+typedef void * (*func_intptr_uint32_int32_string)(uint32_t, int32_t, char *);
+typedef void * (*func_intptr_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
+typedef void * (*func_intptr_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
+typedef void * (*func_intptr_uint32_intptr)(uint32_t, void *);
+typedef void * (*func_intptr_uint32_intptr_int32)(uint32_t, void *, int32_t);
+typedef void * (*func_intptr_uint32_intptr_intptr)(uint32_t, void *, void *);
+typedef void * (*func_intptr_uint32_intptr_string)(uint32_t, void *, char *);
+typedef void * (*func_intptr_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
+typedef void * (*func_intptr_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
+typedef void * (*func_intptr_uint32_string)(uint32_t, char *);
+typedef void * (*func_intptr_uint32_string_int32)(uint32_t, char *, int32_t);
+typedef void * (*func_intptr_uint32_string_intptr)(uint32_t, char *, void *);
+typedef void * (*func_intptr_uint32_string_string)(uint32_t, char *, char *);
+typedef void * (*func_intptr_uint32_string_uint32)(uint32_t, char *, uint32_t);
+typedef void * (*func_intptr_uint32_string_uint64)(uint32_t, char *, uint64_t);
+typedef void * (*func_intptr_uint32_uint32)(uint32_t, uint32_t);
+typedef void * (*func_intptr_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
+typedef void * (*func_intptr_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
+typedef void * (*func_intptr_uint32_uint32_string)(uint32_t, uint32_t, char *);
+typedef void * (*func_intptr_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
+typedef void * (*func_intptr_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
+typedef void * (*func_intptr_uint32_uint64)(uint32_t, uint64_t);
+typedef void * (*func_intptr_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
+typedef void * (*func_intptr_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
+typedef void * (*func_intptr_uint32_uint64_string)(uint32_t, uint64_t, char *);
+typedef void * (*func_intptr_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
+typedef void * (*func_intptr_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
+typedef void * (*func_intptr_uint64)(uint64_t);
+typedef void * (*func_intptr_uint64_int32)(uint64_t, int32_t);
+typedef void * (*func_intptr_uint64_int32_int32)(uint64_t, int32_t, int32_t);
+typedef void * (*func_intptr_uint64_int32_intptr)(uint64_t, int32_t, void *);
+typedef void * (*func_intptr_uint64_int32_string)(uint64_t, int32_t, char *);
+typedef void * (*func_intptr_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
+typedef void * (*func_intptr_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
+typedef void * (*func_intptr_uint64_intptr)(uint64_t, void *);
+typedef void * (*func_intptr_uint64_intptr_int32)(uint64_t, void *, int32_t);
+typedef void * (*func_intptr_uint64_intptr_intptr)(uint64_t, void *, void *);
+typedef void * (*func_intptr_uint64_intptr_string)(uint64_t, void *, char *);
+typedef void * (*func_intptr_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
+typedef void * (*func_intptr_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
+typedef void * (*func_intptr_uint64_string)(uint64_t, char *);
+typedef void * (*func_intptr_uint64_string_int32)(uint64_t, char *, int32_t);
+typedef void * (*func_intptr_uint64_string_intptr)(uint64_t, char *, void *);
+typedef void * (*func_intptr_uint64_string_string)(uint64_t, char *, char *);
+typedef void * (*func_intptr_uint64_string_uint32)(uint64_t, char *, uint32_t);
+typedef void * (*func_intptr_uint64_string_uint64)(uint64_t, char *, uint64_t);
+typedef void * (*func_intptr_uint64_uint32)(uint64_t, uint32_t);
+typedef void * (*func_intptr_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
+typedef void * (*func_intptr_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
+typedef void * (*func_intptr_uint64_uint32_string)(uint64_t, uint32_t, char *);
+typedef void * (*func_intptr_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
+typedef void * (*func_intptr_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
+typedef void * (*func_intptr_uint64_uint64)(uint64_t, uint64_t);
+typedef void * (*func_intptr_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
+typedef void * (*func_intptr_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
+typedef void * (*func_intptr_uint64_uint64_string)(uint64_t, uint64_t, char *);
+typedef void * (*func_intptr_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
+typedef void * (*func_intptr_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
+typedef char * (*func_string)(void);
+typedef char * (*func_string_int32)(int32_t);
+typedef char * (*func_string_int32_int32)(int32_t, int32_t);
+typedef char * (*func_string_int32_int32_int32)(int32_t, int32_t, int32_t);
+typedef char * (*func_string_int32_int32_intptr)(int32_t, int32_t, void *);
+typedef char * (*func_string_int32_int32_string)(int32_t, int32_t, char *);
+typedef char * (*func_string_int32_int32_uint32)(int32_t, int32_t, uint32_t);
+typedef char * (*func_string_int32_int32_uint64)(int32_t, int32_t, uint64_t);
+typedef char * (*func_string_int32_intptr)(int32_t, void *);
+typedef char * (*func_string_int32_intptr_int32)(int32_t, void *, int32_t);
+typedef char * (*func_string_int32_intptr_intptr)(int32_t, void *, void *);
+typedef char * (*func_string_int32_intptr_string)(int32_t, void *, char *);
+typedef char * (*func_string_int32_intptr_uint32)(int32_t, void *, uint32_t);
+typedef char * (*func_string_int32_intptr_uint64)(int32_t, void *, uint64_t);
+typedef char * (*func_string_int32_string)(int32_t, char *);
+typedef char * (*func_string_int32_string_int32)(int32_t, char *, int32_t);
+typedef char * (*func_string_int32_string_intptr)(int32_t, char *, void *);
+typedef char * (*func_string_int32_string_string)(int32_t, char *, char *);
+typedef char * (*func_string_int32_string_uint32)(int32_t, char *, uint32_t);
+typedef char * (*func_string_int32_string_uint64)(int32_t, char *, uint64_t);
+typedef char * (*func_string_int32_uint32)(int32_t, uint32_t);
+typedef char * (*func_string_int32_uint32_int32)(int32_t, uint32_t, int32_t);
+typedef char * (*func_string_int32_uint32_intptr)(int32_t, uint32_t, void *);
+typedef char * (*func_string_int32_uint32_string)(int32_t, uint32_t, char *);
+typedef char * (*func_string_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
+typedef char * (*func_string_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
+typedef char * (*func_string_int32_uint64)(int32_t, uint64_t);
+typedef char * (*func_string_int32_uint64_int32)(int32_t, uint64_t, int32_t);
+typedef char * (*func_string_int32_uint64_intptr)(int32_t, uint64_t, void *);
+typedef char * (*func_string_int32_uint64_string)(int32_t, uint64_t, char *);
+typedef char * (*func_string_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
+typedef char * (*func_string_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
+typedef char * (*func_string_intptr)(void *);
+typedef char * (*func_string_intptr_int32)(void *, int32_t);
+typedef char * (*func_string_intptr_int32_int32)(void *, int32_t, int32_t);
+typedef char * (*func_string_intptr_int32_intptr)(void *, int32_t, void *);
+typedef char * (*func_string_intptr_int32_string)(void *, int32_t, char *);
+typedef char * (*func_string_intptr_int32_uint32)(void *, int32_t, uint32_t);
+typedef char * (*func_string_intptr_int32_uint64)(void *, int32_t, uint64_t);
+typedef char * (*func_string_intptr_intptr)(void *, void *);
+typedef char * (*func_string_intptr_intptr_int32)(void *, void *, int32_t);
+typedef char * (*func_string_intptr_intptr_intptr)(void *, void *, void *);
+typedef char * (*func_string_intptr_intptr_string)(void *, void *, char *);
+typedef char * (*func_string_intptr_intptr_uint32)(void *, void *, uint32_t);
+typedef char * (*func_string_intptr_intptr_uint64)(void *, void *, uint64_t);
+typedef char * (*func_string_intptr_string)(void *, char *);
+typedef char * (*func_string_intptr_string_int32)(void *, char *, int32_t);
+typedef char * (*func_string_intptr_string_intptr)(void *, char *, void *);
+typedef char * (*func_string_intptr_string_string)(void *, char *, char *);
+typedef char * (*func_string_intptr_string_uint32)(void *, char *, uint32_t);
+typedef char * (*func_string_intptr_string_uint64)(void *, char *, uint64_t);
+typedef char * (*func_string_intptr_uint32)(void *, uint32_t);
+typedef char * (*func_string_intptr_uint32_int32)(void *, uint32_t, int32_t);
+typedef char * (*func_string_intptr_uint32_intptr)(void *, uint32_t, void *);
+typedef char * (*func_string_intptr_uint32_string)(void *, uint32_t, char *);
+typedef char * (*func_string_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
+typedef char * (*func_string_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
+typedef char * (*func_string_intptr_uint64)(void *, uint64_t);
+typedef char * (*func_string_intptr_uint64_int32)(void *, uint64_t, int32_t);
+typedef char * (*func_string_intptr_uint64_intptr)(void *, uint64_t, void *);
+typedef char * (*func_string_intptr_uint64_string)(void *, uint64_t, char *);
+typedef char * (*func_string_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
+typedef char * (*func_string_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
+typedef char * (*func_string_string)(char *);
+typedef char * (*func_string_string_int32)(char *, int32_t);
+typedef char * (*func_string_string_int32_int32)(char *, int32_t, int32_t);
+typedef char * (*func_string_string_int32_intptr)(char *, int32_t, void *);
+typedef char * (*func_string_string_int32_string)(char *, int32_t, char *);
+typedef char * (*func_string_string_int32_uint32)(char *, int32_t, uint32_t);
+typedef char * (*func_string_string_int32_uint64)(char *, int32_t, uint64_t);
+typedef char * (*func_string_string_intptr)(char *, void *);
+typedef char * (*func_string_string_intptr_int32)(char *, void *, int32_t);
+typedef char * (*func_string_string_intptr_intptr)(char *, void *, void *);
 typedef char * (*func_string_string_intptr_string)(char *, void *, char *);
-typedef uint32_t (*func_uint32_string_intptr_string)(char *, void *, char *);
-typedef void * (*func_intptr_string_intptr_string)(char *, void *, char *);
-typedef void (*action_string_intptr_uint32)(char *, void *, uint32_t);
-typedef uint64_t (*func_uint64_string_intptr_uint32)(char *, void *, uint32_t);
-typedef int32_t (*func_int32_string_intptr_uint32)(char *, void *, uint32_t);
 typedef char * (*func_string_string_intptr_uint32)(char *, void *, uint32_t);
-typedef uint32_t (*func_uint32_string_intptr_uint32)(char *, void *, uint32_t);
-typedef void * (*func_intptr_string_intptr_uint32)(char *, void *, uint32_t);
-typedef void (*action_string_intptr_intptr)(char *, void *, void *);
-typedef uint64_t (*func_uint64_string_intptr_intptr)(char *, void *, void *);
-typedef int32_t (*func_int32_string_intptr_intptr)(char *, void *, void *);
-typedef char * (*func_string_string_intptr_intptr)(char *, void *, void *);
-typedef uint32_t (*func_uint32_string_intptr_intptr)(char *, void *, void *);
-typedef void * (*func_intptr_string_intptr_intptr)(char *, void *, void *);
-typedef void (*action_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
-typedef uint64_t (*func_uint64_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
-typedef int32_t (*func_int32_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
-typedef char * (*func_string_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
-typedef uint32_t (*func_uint32_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
-typedef void * (*func_intptr_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
-typedef void (*action_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
-typedef uint64_t (*func_uint64_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
-typedef int32_t (*func_int32_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
-typedef char * (*func_string_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
-typedef uint32_t (*func_uint32_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
-typedef void * (*func_intptr_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
-typedef void (*action_uint32_uint64_string)(uint32_t, uint64_t, char *);
-typedef uint64_t (*func_uint64_uint32_uint64_string)(uint32_t, uint64_t, char *);
-typedef int32_t (*func_int32_uint32_uint64_string)(uint32_t, uint64_t, char *);
-typedef char * (*func_string_uint32_uint64_string)(uint32_t, uint64_t, char *);
-typedef uint32_t (*func_uint32_uint32_uint64_string)(uint32_t, uint64_t, char *);
-typedef void * (*func_intptr_uint32_uint64_string)(uint32_t, uint64_t, char *);
-typedef void (*action_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
-typedef uint64_t (*func_uint64_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
-typedef int32_t (*func_int32_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
-typedef char * (*func_string_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
-typedef uint32_t (*func_uint32_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
-typedef void * (*func_intptr_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
-typedef void (*action_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
-typedef uint64_t (*func_uint64_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
-typedef int32_t (*func_int32_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
-typedef char * (*func_string_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
-typedef uint32_t (*func_uint32_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
-typedef void * (*func_intptr_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
-typedef void (*action_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
-typedef uint64_t (*func_uint64_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
-typedef int32_t (*func_int32_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
-typedef char * (*func_string_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
-typedef uint32_t (*func_uint32_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
-typedef void * (*func_intptr_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
-typedef void (*action_uint32_int32_int32)(uint32_t, int32_t, int32_t);
-typedef uint64_t (*func_uint64_uint32_int32_int32)(uint32_t, int32_t, int32_t);
-typedef int32_t (*func_int32_uint32_int32_int32)(uint32_t, int32_t, int32_t);
+typedef char * (*func_string_string_intptr_uint64)(char *, void *, uint64_t);
+typedef char * (*func_string_string_string)(char *, char *);
+typedef char * (*func_string_string_string_int32)(char *, char *, int32_t);
+typedef char * (*func_string_string_string_intptr)(char *, char *, void *);
+typedef char * (*func_string_string_string_string)(char *, char *, char *);
+typedef char * (*func_string_string_string_uint32)(char *, char *, uint32_t);
+typedef char * (*func_string_string_string_uint64)(char *, char *, uint64_t);
+typedef char * (*func_string_string_uint32)(char *, uint32_t);
+typedef char * (*func_string_string_uint32_int32)(char *, uint32_t, int32_t);
+typedef char * (*func_string_string_uint32_intptr)(char *, uint32_t, void *);
+typedef char * (*func_string_string_uint32_string)(char *, uint32_t, char *);
+typedef char * (*func_string_string_uint32_uint32)(char *, uint32_t, uint32_t);
+typedef char * (*func_string_string_uint32_uint64)(char *, uint32_t, uint64_t);
+typedef char * (*func_string_string_uint64)(char *, uint64_t);
+typedef char * (*func_string_string_uint64_int32)(char *, uint64_t, int32_t);
+typedef char * (*func_string_string_uint64_intptr)(char *, uint64_t, void *);
+typedef char * (*func_string_string_uint64_string)(char *, uint64_t, char *);
+typedef char * (*func_string_string_uint64_uint32)(char *, uint64_t, uint32_t);
+typedef char * (*func_string_string_uint64_uint64)(char *, uint64_t, uint64_t);
+typedef char * (*func_string_uint32)(uint32_t);
+typedef char * (*func_string_uint32_int32)(uint32_t, int32_t);
 typedef char * (*func_string_uint32_int32_int32)(uint32_t, int32_t, int32_t);
-typedef uint32_t (*func_uint32_uint32_int32_int32)(uint32_t, int32_t, int32_t);
-typedef void * (*func_intptr_uint32_int32_int32)(uint32_t, int32_t, int32_t);
-typedef void (*action_uint32_int32_string)(uint32_t, int32_t, char *);
-typedef uint64_t (*func_uint64_uint32_int32_string)(uint32_t, int32_t, char *);
-typedef int32_t (*func_int32_uint32_int32_string)(uint32_t, int32_t, char *);
+typedef char * (*func_string_uint32_int32_intptr)(uint32_t, int32_t, void *);
 typedef char * (*func_string_uint32_int32_string)(uint32_t, int32_t, char *);
-typedef uint32_t (*func_uint32_uint32_int32_string)(uint32_t, int32_t, char *);
-typedef void * (*func_intptr_uint32_int32_string)(uint32_t, int32_t, char *);
-typedef void (*action_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
-typedef uint64_t (*func_uint64_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
-typedef int32_t (*func_int32_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
 typedef char * (*func_string_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
-typedef uint32_t (*func_uint32_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
-typedef void * (*func_intptr_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
-typedef void (*action_uint32_int32_intptr)(uint32_t, int32_t, void *);
-typedef uint64_t (*func_uint64_uint32_int32_intptr)(uint32_t, int32_t, void *);
-typedef int32_t (*func_int32_uint32_int32_intptr)(uint32_t, int32_t, void *);
-typedef char * (*func_string_uint32_int32_intptr)(uint32_t, int32_t, void *);
-typedef uint32_t (*func_uint32_uint32_int32_intptr)(uint32_t, int32_t, void *);
-typedef void * (*func_intptr_uint32_int32_intptr)(uint32_t, int32_t, void *);
-typedef void (*action_uint32_string_uint64)(uint32_t, char *, uint64_t);
-typedef uint64_t (*func_uint64_uint32_string_uint64)(uint32_t, char *, uint64_t);
-typedef int32_t (*func_int32_uint32_string_uint64)(uint32_t, char *, uint64_t);
-typedef char * (*func_string_uint32_string_uint64)(uint32_t, char *, uint64_t);
-typedef uint32_t (*func_uint32_uint32_string_uint64)(uint32_t, char *, uint64_t);
-typedef void * (*func_intptr_uint32_string_uint64)(uint32_t, char *, uint64_t);
-typedef void (*action_uint32_string_int32)(uint32_t, char *, int32_t);
-typedef uint64_t (*func_uint64_uint32_string_int32)(uint32_t, char *, int32_t);
-typedef int32_t (*func_int32_uint32_string_int32)(uint32_t, char *, int32_t);
+typedef char * (*func_string_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
+typedef char * (*func_string_uint32_intptr)(uint32_t, void *);
+typedef char * (*func_string_uint32_intptr_int32)(uint32_t, void *, int32_t);
+typedef char * (*func_string_uint32_intptr_intptr)(uint32_t, void *, void *);
+typedef char * (*func_string_uint32_intptr_string)(uint32_t, void *, char *);
+typedef char * (*func_string_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
+typedef char * (*func_string_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
+typedef char * (*func_string_uint32_string)(uint32_t, char *);
 typedef char * (*func_string_uint32_string_int32)(uint32_t, char *, int32_t);
-typedef uint32_t (*func_uint32_uint32_string_int32)(uint32_t, char *, int32_t);
-typedef void * (*func_intptr_uint32_string_int32)(uint32_t, char *, int32_t);
-typedef void (*action_uint32_string_string)(uint32_t, char *, char *);
-typedef uint64_t (*func_uint64_uint32_string_string)(uint32_t, char *, char *);
-typedef int32_t (*func_int32_uint32_string_string)(uint32_t, char *, char *);
+typedef char * (*func_string_uint32_string_intptr)(uint32_t, char *, void *);
 typedef char * (*func_string_uint32_string_string)(uint32_t, char *, char *);
-typedef uint32_t (*func_uint32_uint32_string_string)(uint32_t, char *, char *);
-typedef void * (*func_intptr_uint32_string_string)(uint32_t, char *, char *);
-typedef void (*action_uint32_string_uint32)(uint32_t, char *, uint32_t);
-typedef uint64_t (*func_uint64_uint32_string_uint32)(uint32_t, char *, uint32_t);
-typedef int32_t (*func_int32_uint32_string_uint32)(uint32_t, char *, uint32_t);
 typedef char * (*func_string_uint32_string_uint32)(uint32_t, char *, uint32_t);
-typedef uint32_t (*func_uint32_uint32_string_uint32)(uint32_t, char *, uint32_t);
-typedef void * (*func_intptr_uint32_string_uint32)(uint32_t, char *, uint32_t);
-typedef void (*action_uint32_string_intptr)(uint32_t, char *, void *);
-typedef uint64_t (*func_uint64_uint32_string_intptr)(uint32_t, char *, void *);
-typedef int32_t (*func_int32_uint32_string_intptr)(uint32_t, char *, void *);
-typedef char * (*func_string_uint32_string_intptr)(uint32_t, char *, void *);
-typedef uint32_t (*func_uint32_uint32_string_intptr)(uint32_t, char *, void *);
-typedef void * (*func_intptr_uint32_string_intptr)(uint32_t, char *, void *);
-typedef void (*action_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
-typedef uint64_t (*func_uint64_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
-typedef int32_t (*func_int32_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
-typedef char * (*func_string_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
-typedef uint32_t (*func_uint32_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
-typedef void * (*func_intptr_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
-typedef void (*action_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
-typedef uint64_t (*func_uint64_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
-typedef int32_t (*func_int32_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
+typedef char * (*func_string_uint32_string_uint64)(uint32_t, char *, uint64_t);
+typedef char * (*func_string_uint32_uint32)(uint32_t, uint32_t);
 typedef char * (*func_string_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
-typedef uint32_t (*func_uint32_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
-typedef void * (*func_intptr_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
-typedef void (*action_uint32_uint32_string)(uint32_t, uint32_t, char *);
-typedef uint64_t (*func_uint64_uint32_uint32_string)(uint32_t, uint32_t, char *);
-typedef int32_t (*func_int32_uint32_uint32_string)(uint32_t, uint32_t, char *);
+typedef char * (*func_string_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
 typedef char * (*func_string_uint32_uint32_string)(uint32_t, uint32_t, char *);
-typedef uint32_t (*func_uint32_uint32_uint32_string)(uint32_t, uint32_t, char *);
-typedef void * (*func_intptr_uint32_uint32_string)(uint32_t, uint32_t, char *);
-typedef void (*action_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
-typedef uint64_t (*func_uint64_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
-typedef int32_t (*func_int32_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
 typedef char * (*func_string_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
-typedef uint32_t (*func_uint32_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
-typedef void * (*func_intptr_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
-typedef void (*action_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
-typedef uint64_t (*func_uint64_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
-typedef int32_t (*func_int32_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
-typedef char * (*func_string_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
-typedef uint32_t (*func_uint32_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
-typedef void * (*func_intptr_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
-typedef void (*action_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
-typedef uint64_t (*func_uint64_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
-typedef int32_t (*func_int32_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
-typedef char * (*func_string_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
-typedef uint32_t (*func_uint32_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
-typedef void * (*func_intptr_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
-typedef void (*action_uint32_intptr_int32)(uint32_t, void *, int32_t);
-typedef uint64_t (*func_uint64_uint32_intptr_int32)(uint32_t, void *, int32_t);
-typedef int32_t (*func_int32_uint32_intptr_int32)(uint32_t, void *, int32_t);
-typedef char * (*func_string_uint32_intptr_int32)(uint32_t, void *, int32_t);
-typedef uint32_t (*func_uint32_uint32_intptr_int32)(uint32_t, void *, int32_t);
-typedef void * (*func_intptr_uint32_intptr_int32)(uint32_t, void *, int32_t);
-typedef void (*action_uint32_intptr_string)(uint32_t, void *, char *);
-typedef uint64_t (*func_uint64_uint32_intptr_string)(uint32_t, void *, char *);
-typedef int32_t (*func_int32_uint32_intptr_string)(uint32_t, void *, char *);
-typedef char * (*func_string_uint32_intptr_string)(uint32_t, void *, char *);
-typedef uint32_t (*func_uint32_uint32_intptr_string)(uint32_t, void *, char *);
-typedef void * (*func_intptr_uint32_intptr_string)(uint32_t, void *, char *);
-typedef void (*action_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
-typedef uint64_t (*func_uint64_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
-typedef int32_t (*func_int32_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
-typedef char * (*func_string_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
-typedef uint32_t (*func_uint32_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
-typedef void * (*func_intptr_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
-typedef void (*action_uint32_intptr_intptr)(uint32_t, void *, void *);
-typedef uint64_t (*func_uint64_uint32_intptr_intptr)(uint32_t, void *, void *);
-typedef int32_t (*func_int32_uint32_intptr_intptr)(uint32_t, void *, void *);
-typedef char * (*func_string_uint32_intptr_intptr)(uint32_t, void *, void *);
-typedef uint32_t (*func_uint32_uint32_intptr_intptr)(uint32_t, void *, void *);
-typedef void * (*func_intptr_uint32_intptr_intptr)(uint32_t, void *, void *);
-typedef void (*action_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
-typedef uint64_t (*func_uint64_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
-typedef int32_t (*func_int32_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
-typedef char * (*func_string_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
-typedef uint32_t (*func_uint32_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
-typedef void * (*func_intptr_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
-typedef void (*action_intptr_uint64_int32)(void *, uint64_t, int32_t);
-typedef uint64_t (*func_uint64_intptr_uint64_int32)(void *, uint64_t, int32_t);
-typedef int32_t (*func_int32_intptr_uint64_int32)(void *, uint64_t, int32_t);
-typedef char * (*func_string_intptr_uint64_int32)(void *, uint64_t, int32_t);
-typedef uint32_t (*func_uint32_intptr_uint64_int32)(void *, uint64_t, int32_t);
-typedef void * (*func_intptr_intptr_uint64_int32)(void *, uint64_t, int32_t);
-typedef void (*action_intptr_uint64_string)(void *, uint64_t, char *);
-typedef uint64_t (*func_uint64_intptr_uint64_string)(void *, uint64_t, char *);
-typedef int32_t (*func_int32_intptr_uint64_string)(void *, uint64_t, char *);
-typedef char * (*func_string_intptr_uint64_string)(void *, uint64_t, char *);
-typedef uint32_t (*func_uint32_intptr_uint64_string)(void *, uint64_t, char *);
-typedef void * (*func_intptr_intptr_uint64_string)(void *, uint64_t, char *);
-typedef void (*action_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
-typedef uint64_t (*func_uint64_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
-typedef int32_t (*func_int32_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
-typedef char * (*func_string_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
-typedef uint32_t (*func_uint32_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
-typedef void * (*func_intptr_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
-typedef void (*action_intptr_uint64_intptr)(void *, uint64_t, void *);
-typedef uint64_t (*func_uint64_intptr_uint64_intptr)(void *, uint64_t, void *);
-typedef int32_t (*func_int32_intptr_uint64_intptr)(void *, uint64_t, void *);
-typedef char * (*func_string_intptr_uint64_intptr)(void *, uint64_t, void *);
-typedef uint32_t (*func_uint32_intptr_uint64_intptr)(void *, uint64_t, void *);
-typedef void * (*func_intptr_intptr_uint64_intptr)(void *, uint64_t, void *);
-typedef void (*action_intptr_int32_uint64)(void *, int32_t, uint64_t);
-typedef uint64_t (*func_uint64_intptr_int32_uint64)(void *, int32_t, uint64_t);
-typedef int32_t (*func_int32_intptr_int32_uint64)(void *, int32_t, uint64_t);
-typedef char * (*func_string_intptr_int32_uint64)(void *, int32_t, uint64_t);
-typedef uint32_t (*func_uint32_intptr_int32_uint64)(void *, int32_t, uint64_t);
-typedef void * (*func_intptr_intptr_int32_uint64)(void *, int32_t, uint64_t);
-typedef void (*action_intptr_int32_int32)(void *, int32_t, int32_t);
-typedef uint64_t (*func_uint64_intptr_int32_int32)(void *, int32_t, int32_t);
-typedef int32_t (*func_int32_intptr_int32_int32)(void *, int32_t, int32_t);
-typedef char * (*func_string_intptr_int32_int32)(void *, int32_t, int32_t);
+typedef char * (*func_string_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
+typedef char * (*func_string_uint32_uint64)(uint32_t, uint64_t);
+typedef char * (*func_string_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
+typedef char * (*func_string_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
+typedef char * (*func_string_uint32_uint64_string)(uint32_t, uint64_t, char *);
+typedef char * (*func_string_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
+typedef char * (*func_string_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
+typedef char * (*func_string_uint64)(uint64_t);
+typedef char * (*func_string_uint64_int32)(uint64_t, int32_t);
+typedef char * (*func_string_uint64_int32_int32)(uint64_t, int32_t, int32_t);
+typedef char * (*func_string_uint64_int32_intptr)(uint64_t, int32_t, void *);
+typedef char * (*func_string_uint64_int32_string)(uint64_t, int32_t, char *);
+typedef char * (*func_string_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
+typedef char * (*func_string_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
+typedef char * (*func_string_uint64_intptr)(uint64_t, void *);
+typedef char * (*func_string_uint64_intptr_int32)(uint64_t, void *, int32_t);
+typedef char * (*func_string_uint64_intptr_intptr)(uint64_t, void *, void *);
+typedef char * (*func_string_uint64_intptr_string)(uint64_t, void *, char *);
+typedef char * (*func_string_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
+typedef char * (*func_string_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
+typedef char * (*func_string_uint64_string)(uint64_t, char *);
+typedef char * (*func_string_uint64_string_int32)(uint64_t, char *, int32_t);
+typedef char * (*func_string_uint64_string_intptr)(uint64_t, char *, void *);
+typedef char * (*func_string_uint64_string_string)(uint64_t, char *, char *);
+typedef char * (*func_string_uint64_string_uint32)(uint64_t, char *, uint32_t);
+typedef char * (*func_string_uint64_string_uint64)(uint64_t, char *, uint64_t);
+typedef char * (*func_string_uint64_uint32)(uint64_t, uint32_t);
+typedef char * (*func_string_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
+typedef char * (*func_string_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
+typedef char * (*func_string_uint64_uint32_string)(uint64_t, uint32_t, char *);
+typedef char * (*func_string_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
+typedef char * (*func_string_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
+typedef char * (*func_string_uint64_uint64)(uint64_t, uint64_t);
+typedef char * (*func_string_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
+typedef char * (*func_string_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
+typedef char * (*func_string_uint64_uint64_string)(uint64_t, uint64_t, char *);
+typedef char * (*func_string_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
+typedef char * (*func_string_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
+typedef uint32_t (*func_uint32)(void);
+typedef uint32_t (*func_uint32_int32)(int32_t);
+typedef uint32_t (*func_uint32_int32_int32)(int32_t, int32_t);
+typedef uint32_t (*func_uint32_int32_int32_int32)(int32_t, int32_t, int32_t);
+typedef uint32_t (*func_uint32_int32_int32_intptr)(int32_t, int32_t, void *);
+typedef uint32_t (*func_uint32_int32_int32_string)(int32_t, int32_t, char *);
+typedef uint32_t (*func_uint32_int32_int32_uint32)(int32_t, int32_t, uint32_t);
+typedef uint32_t (*func_uint32_int32_int32_uint64)(int32_t, int32_t, uint64_t);
+typedef uint32_t (*func_uint32_int32_intptr)(int32_t, void *);
+typedef uint32_t (*func_uint32_int32_intptr_int32)(int32_t, void *, int32_t);
+typedef uint32_t (*func_uint32_int32_intptr_intptr)(int32_t, void *, void *);
+typedef uint32_t (*func_uint32_int32_intptr_string)(int32_t, void *, char *);
+typedef uint32_t (*func_uint32_int32_intptr_uint32)(int32_t, void *, uint32_t);
+typedef uint32_t (*func_uint32_int32_intptr_uint64)(int32_t, void *, uint64_t);
+typedef uint32_t (*func_uint32_int32_string)(int32_t, char *);
+typedef uint32_t (*func_uint32_int32_string_int32)(int32_t, char *, int32_t);
+typedef uint32_t (*func_uint32_int32_string_intptr)(int32_t, char *, void *);
+typedef uint32_t (*func_uint32_int32_string_string)(int32_t, char *, char *);
+typedef uint32_t (*func_uint32_int32_string_uint32)(int32_t, char *, uint32_t);
+typedef uint32_t (*func_uint32_int32_string_uint64)(int32_t, char *, uint64_t);
+typedef uint32_t (*func_uint32_int32_uint32)(int32_t, uint32_t);
+typedef uint32_t (*func_uint32_int32_uint32_int32)(int32_t, uint32_t, int32_t);
+typedef uint32_t (*func_uint32_int32_uint32_intptr)(int32_t, uint32_t, void *);
+typedef uint32_t (*func_uint32_int32_uint32_string)(int32_t, uint32_t, char *);
+typedef uint32_t (*func_uint32_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
+typedef uint32_t (*func_uint32_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
+typedef uint32_t (*func_uint32_int32_uint64)(int32_t, uint64_t);
+typedef uint32_t (*func_uint32_int32_uint64_int32)(int32_t, uint64_t, int32_t);
+typedef uint32_t (*func_uint32_int32_uint64_intptr)(int32_t, uint64_t, void *);
+typedef uint32_t (*func_uint32_int32_uint64_string)(int32_t, uint64_t, char *);
+typedef uint32_t (*func_uint32_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
+typedef uint32_t (*func_uint32_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
+typedef uint32_t (*func_uint32_intptr)(void *);
+typedef uint32_t (*func_uint32_intptr_int32)(void *, int32_t);
 typedef uint32_t (*func_uint32_intptr_int32_int32)(void *, int32_t, int32_t);
-typedef void * (*func_intptr_intptr_int32_int32)(void *, int32_t, int32_t);
-typedef void (*action_intptr_int32_string)(void *, int32_t, char *);
-typedef uint64_t (*func_uint64_intptr_int32_string)(void *, int32_t, char *);
-typedef int32_t (*func_int32_intptr_int32_string)(void *, int32_t, char *);
-typedef char * (*func_string_intptr_int32_string)(void *, int32_t, char *);
+typedef uint32_t (*func_uint32_intptr_int32_intptr)(void *, int32_t, void *);
 typedef uint32_t (*func_uint32_intptr_int32_string)(void *, int32_t, char *);
-typedef void * (*func_intptr_intptr_int32_string)(void *, int32_t, char *);
-typedef void (*action_intptr_int32_uint32)(void *, int32_t, uint32_t);
-typedef uint64_t (*func_uint64_intptr_int32_uint32)(void *, int32_t, uint32_t);
-typedef int32_t (*func_int32_intptr_int32_uint32)(void *, int32_t, uint32_t);
-typedef char * (*func_string_intptr_int32_uint32)(void *, int32_t, uint32_t);
 typedef uint32_t (*func_uint32_intptr_int32_uint32)(void *, int32_t, uint32_t);
-typedef void * (*func_intptr_intptr_int32_uint32)(void *, int32_t, uint32_t);
-typedef void (*action_intptr_int32_intptr)(void *, int32_t, void *);
-typedef uint64_t (*func_uint64_intptr_int32_intptr)(void *, int32_t, void *);
-typedef int32_t (*func_int32_intptr_int32_intptr)(void *, int32_t, void *);
-typedef char * (*func_string_intptr_int32_intptr)(void *, int32_t, void *);
-typedef uint32_t (*func_uint32_intptr_int32_intptr)(void *, int32_t, void *);
-typedef void * (*func_intptr_intptr_int32_intptr)(void *, int32_t, void *);
-typedef void (*action_intptr_string_uint64)(void *, char *, uint64_t);
-typedef uint64_t (*func_uint64_intptr_string_uint64)(void *, char *, uint64_t);
-typedef int32_t (*func_int32_intptr_string_uint64)(void *, char *, uint64_t);
-typedef char * (*func_string_intptr_string_uint64)(void *, char *, uint64_t);
-typedef uint32_t (*func_uint32_intptr_string_uint64)(void *, char *, uint64_t);
-typedef void * (*func_intptr_intptr_string_uint64)(void *, char *, uint64_t);
-typedef void (*action_intptr_string_int32)(void *, char *, int32_t);
-typedef uint64_t (*func_uint64_intptr_string_int32)(void *, char *, int32_t);
-typedef int32_t (*func_int32_intptr_string_int32)(void *, char *, int32_t);
-typedef char * (*func_string_intptr_string_int32)(void *, char *, int32_t);
+typedef uint32_t (*func_uint32_intptr_int32_uint64)(void *, int32_t, uint64_t);
+typedef uint32_t (*func_uint32_intptr_intptr)(void *, void *);
+typedef uint32_t (*func_uint32_intptr_intptr_int32)(void *, void *, int32_t);
+typedef uint32_t (*func_uint32_intptr_intptr_intptr)(void *, void *, void *);
+typedef uint32_t (*func_uint32_intptr_intptr_string)(void *, void *, char *);
+typedef uint32_t (*func_uint32_intptr_intptr_uint32)(void *, void *, uint32_t);
+typedef uint32_t (*func_uint32_intptr_intptr_uint64)(void *, void *, uint64_t);
+typedef uint32_t (*func_uint32_intptr_string)(void *, char *);
 typedef uint32_t (*func_uint32_intptr_string_int32)(void *, char *, int32_t);
-typedef void * (*func_intptr_intptr_string_int32)(void *, char *, int32_t);
-typedef void (*action_intptr_string_string)(void *, char *, char *);
-typedef uint64_t (*func_uint64_intptr_string_string)(void *, char *, char *);
-typedef int32_t (*func_int32_intptr_string_string)(void *, char *, char *);
-typedef char * (*func_string_intptr_string_string)(void *, char *, char *);
+typedef uint32_t (*func_uint32_intptr_string_intptr)(void *, char *, void *);
 typedef uint32_t (*func_uint32_intptr_string_string)(void *, char *, char *);
-typedef void * (*func_intptr_intptr_string_string)(void *, char *, char *);
-typedef void (*action_intptr_string_uint32)(void *, char *, uint32_t);
-typedef uint64_t (*func_uint64_intptr_string_uint32)(void *, char *, uint32_t);
-typedef int32_t (*func_int32_intptr_string_uint32)(void *, char *, uint32_t);
-typedef char * (*func_string_intptr_string_uint32)(void *, char *, uint32_t);
 typedef uint32_t (*func_uint32_intptr_string_uint32)(void *, char *, uint32_t);
-typedef void * (*func_intptr_intptr_string_uint32)(void *, char *, uint32_t);
-typedef void (*action_intptr_string_intptr)(void *, char *, void *);
-typedef uint64_t (*func_uint64_intptr_string_intptr)(void *, char *, void *);
-typedef int32_t (*func_int32_intptr_string_intptr)(void *, char *, void *);
-typedef char * (*func_string_intptr_string_intptr)(void *, char *, void *);
-typedef uint32_t (*func_uint32_intptr_string_intptr)(void *, char *, void *);
-typedef void * (*func_intptr_intptr_string_intptr)(void *, char *, void *);
-typedef void (*action_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
-typedef uint64_t (*func_uint64_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
-typedef int32_t (*func_int32_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
-typedef char * (*func_string_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
-typedef uint32_t (*func_uint32_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
-typedef void * (*func_intptr_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
-typedef void (*action_intptr_uint32_int32)(void *, uint32_t, int32_t);
-typedef uint64_t (*func_uint64_intptr_uint32_int32)(void *, uint32_t, int32_t);
-typedef int32_t (*func_int32_intptr_uint32_int32)(void *, uint32_t, int32_t);
-typedef char * (*func_string_intptr_uint32_int32)(void *, uint32_t, int32_t);
+typedef uint32_t (*func_uint32_intptr_string_uint64)(void *, char *, uint64_t);
+typedef uint32_t (*func_uint32_intptr_uint32)(void *, uint32_t);
 typedef uint32_t (*func_uint32_intptr_uint32_int32)(void *, uint32_t, int32_t);
-typedef void * (*func_intptr_intptr_uint32_int32)(void *, uint32_t, int32_t);
-typedef void (*action_intptr_uint32_string)(void *, uint32_t, char *);
-typedef uint64_t (*func_uint64_intptr_uint32_string)(void *, uint32_t, char *);
-typedef int32_t (*func_int32_intptr_uint32_string)(void *, uint32_t, char *);
-typedef char * (*func_string_intptr_uint32_string)(void *, uint32_t, char *);
+typedef uint32_t (*func_uint32_intptr_uint32_intptr)(void *, uint32_t, void *);
 typedef uint32_t (*func_uint32_intptr_uint32_string)(void *, uint32_t, char *);
-typedef void * (*func_intptr_intptr_uint32_string)(void *, uint32_t, char *);
-typedef void (*action_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
-typedef uint64_t (*func_uint64_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
-typedef int32_t (*func_int32_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
-typedef char * (*func_string_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
 typedef uint32_t (*func_uint32_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
-typedef void * (*func_intptr_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
-typedef void (*action_intptr_uint32_intptr)(void *, uint32_t, void *);
-typedef uint64_t (*func_uint64_intptr_uint32_intptr)(void *, uint32_t, void *);
-typedef int32_t (*func_int32_intptr_uint32_intptr)(void *, uint32_t, void *);
-typedef char * (*func_string_intptr_uint32_intptr)(void *, uint32_t, void *);
-typedef uint32_t (*func_uint32_intptr_uint32_intptr)(void *, uint32_t, void *);
-typedef void * (*func_intptr_intptr_uint32_intptr)(void *, uint32_t, void *);
-typedef void (*action_intptr_intptr_uint64)(void *, void *, uint64_t);
-typedef uint64_t (*func_uint64_intptr_intptr_uint64)(void *, void *, uint64_t);
-typedef int32_t (*func_int32_intptr_intptr_uint64)(void *, void *, uint64_t);
-typedef char * (*func_string_intptr_intptr_uint64)(void *, void *, uint64_t);
-typedef uint32_t (*func_uint32_intptr_intptr_uint64)(void *, void *, uint64_t);
-typedef void * (*func_intptr_intptr_intptr_uint64)(void *, void *, uint64_t);
-typedef void (*action_intptr_intptr_int32)(void *, void *, int32_t);
+typedef uint32_t (*func_uint32_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
+typedef uint32_t (*func_uint32_intptr_uint64)(void *, uint64_t);
+typedef uint32_t (*func_uint32_intptr_uint64_int32)(void *, uint64_t, int32_t);
+typedef uint32_t (*func_uint32_intptr_uint64_intptr)(void *, uint64_t, void *);
+typedef uint32_t (*func_uint32_intptr_uint64_string)(void *, uint64_t, char *);
+typedef uint32_t (*func_uint32_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
+typedef uint32_t (*func_uint32_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
+typedef uint32_t (*func_uint32_string)(char *);
+typedef uint32_t (*func_uint32_string_int32)(char *, int32_t);
+typedef uint32_t (*func_uint32_string_int32_int32)(char *, int32_t, int32_t);
+typedef uint32_t (*func_uint32_string_int32_intptr)(char *, int32_t, void *);
+typedef uint32_t (*func_uint32_string_int32_string)(char *, int32_t, char *);
+typedef uint32_t (*func_uint32_string_int32_uint32)(char *, int32_t, uint32_t);
+typedef uint32_t (*func_uint32_string_int32_uint64)(char *, int32_t, uint64_t);
+typedef uint32_t (*func_uint32_string_intptr)(char *, void *);
+typedef uint32_t (*func_uint32_string_intptr_int32)(char *, void *, int32_t);
+typedef uint32_t (*func_uint32_string_intptr_intptr)(char *, void *, void *);
+typedef uint32_t (*func_uint32_string_intptr_string)(char *, void *, char *);
+typedef uint32_t (*func_uint32_string_intptr_uint32)(char *, void *, uint32_t);
+typedef uint32_t (*func_uint32_string_intptr_uint64)(char *, void *, uint64_t);
+typedef uint32_t (*func_uint32_string_string)(char *, char *);
+typedef uint32_t (*func_uint32_string_string_int32)(char *, char *, int32_t);
+typedef uint32_t (*func_uint32_string_string_intptr)(char *, char *, void *);
+typedef uint32_t (*func_uint32_string_string_string)(char *, char *, char *);
+typedef uint32_t (*func_uint32_string_string_uint32)(char *, char *, uint32_t);
+typedef uint32_t (*func_uint32_string_string_uint64)(char *, char *, uint64_t);
+typedef uint32_t (*func_uint32_string_uint32)(char *, uint32_t);
+typedef uint32_t (*func_uint32_string_uint32_int32)(char *, uint32_t, int32_t);
+typedef uint32_t (*func_uint32_string_uint32_intptr)(char *, uint32_t, void *);
+typedef uint32_t (*func_uint32_string_uint32_string)(char *, uint32_t, char *);
+typedef uint32_t (*func_uint32_string_uint32_uint32)(char *, uint32_t, uint32_t);
+typedef uint32_t (*func_uint32_string_uint32_uint64)(char *, uint32_t, uint64_t);
+typedef uint32_t (*func_uint32_string_uint64)(char *, uint64_t);
+typedef uint32_t (*func_uint32_string_uint64_int32)(char *, uint64_t, int32_t);
+typedef uint32_t (*func_uint32_string_uint64_intptr)(char *, uint64_t, void *);
+typedef uint32_t (*func_uint32_string_uint64_string)(char *, uint64_t, char *);
+typedef uint32_t (*func_uint32_string_uint64_uint32)(char *, uint64_t, uint32_t);
+typedef uint32_t (*func_uint32_string_uint64_uint64)(char *, uint64_t, uint64_t);
+typedef uint32_t (*func_uint32_uint32)(uint32_t);
+typedef uint32_t (*func_uint32_uint32_int32)(uint32_t, int32_t);
+typedef uint32_t (*func_uint32_uint32_int32_int32)(uint32_t, int32_t, int32_t);
+typedef uint32_t (*func_uint32_uint32_int32_intptr)(uint32_t, int32_t, void *);
+typedef uint32_t (*func_uint32_uint32_int32_string)(uint32_t, int32_t, char *);
+typedef uint32_t (*func_uint32_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
+typedef uint32_t (*func_uint32_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
+typedef uint32_t (*func_uint32_uint32_intptr)(uint32_t, void *);
+typedef uint32_t (*func_uint32_uint32_intptr_int32)(uint32_t, void *, int32_t);
+typedef uint32_t (*func_uint32_uint32_intptr_intptr)(uint32_t, void *, void *);
+typedef uint32_t (*func_uint32_uint32_intptr_string)(uint32_t, void *, char *);
+typedef uint32_t (*func_uint32_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
+typedef uint32_t (*func_uint32_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
+typedef uint32_t (*func_uint32_uint32_string)(uint32_t, char *);
+typedef uint32_t (*func_uint32_uint32_string_int32)(uint32_t, char *, int32_t);
+typedef uint32_t (*func_uint32_uint32_string_intptr)(uint32_t, char *, void *);
+typedef uint32_t (*func_uint32_uint32_string_string)(uint32_t, char *, char *);
+typedef uint32_t (*func_uint32_uint32_string_uint32)(uint32_t, char *, uint32_t);
+typedef uint32_t (*func_uint32_uint32_string_uint64)(uint32_t, char *, uint64_t);
+typedef uint32_t (*func_uint32_uint32_uint32)(uint32_t, uint32_t);
+typedef uint32_t (*func_uint32_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
+typedef uint32_t (*func_uint32_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
+typedef uint32_t (*func_uint32_uint32_uint32_string)(uint32_t, uint32_t, char *);
+typedef uint32_t (*func_uint32_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
+typedef uint32_t (*func_uint32_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
+typedef uint32_t (*func_uint32_uint32_uint64)(uint32_t, uint64_t);
+typedef uint32_t (*func_uint32_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
+typedef uint32_t (*func_uint32_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
+typedef uint32_t (*func_uint32_uint32_uint64_string)(uint32_t, uint64_t, char *);
+typedef uint32_t (*func_uint32_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
+typedef uint32_t (*func_uint32_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
+typedef uint32_t (*func_uint32_uint64)(uint64_t);
+typedef uint32_t (*func_uint32_uint64_int32)(uint64_t, int32_t);
+typedef uint32_t (*func_uint32_uint64_int32_int32)(uint64_t, int32_t, int32_t);
+typedef uint32_t (*func_uint32_uint64_int32_intptr)(uint64_t, int32_t, void *);
+typedef uint32_t (*func_uint32_uint64_int32_string)(uint64_t, int32_t, char *);
+typedef uint32_t (*func_uint32_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
+typedef uint32_t (*func_uint32_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
+typedef uint32_t (*func_uint32_uint64_intptr)(uint64_t, void *);
+typedef uint32_t (*func_uint32_uint64_intptr_int32)(uint64_t, void *, int32_t);
+typedef uint32_t (*func_uint32_uint64_intptr_intptr)(uint64_t, void *, void *);
+typedef uint32_t (*func_uint32_uint64_intptr_string)(uint64_t, void *, char *);
+typedef uint32_t (*func_uint32_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
+typedef uint32_t (*func_uint32_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
+typedef uint32_t (*func_uint32_uint64_string)(uint64_t, char *);
+typedef uint32_t (*func_uint32_uint64_string_int32)(uint64_t, char *, int32_t);
+typedef uint32_t (*func_uint32_uint64_string_intptr)(uint64_t, char *, void *);
+typedef uint32_t (*func_uint32_uint64_string_string)(uint64_t, char *, char *);
+typedef uint32_t (*func_uint32_uint64_string_uint32)(uint64_t, char *, uint32_t);
+typedef uint32_t (*func_uint32_uint64_string_uint64)(uint64_t, char *, uint64_t);
+typedef uint32_t (*func_uint32_uint64_uint32)(uint64_t, uint32_t);
+typedef uint32_t (*func_uint32_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
+typedef uint32_t (*func_uint32_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
+typedef uint32_t (*func_uint32_uint64_uint32_string)(uint64_t, uint32_t, char *);
+typedef uint32_t (*func_uint32_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
+typedef uint32_t (*func_uint32_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
+typedef uint32_t (*func_uint32_uint64_uint64)(uint64_t, uint64_t);
+typedef uint32_t (*func_uint32_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
+typedef uint32_t (*func_uint32_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
+typedef uint32_t (*func_uint32_uint64_uint64_string)(uint64_t, uint64_t, char *);
+typedef uint32_t (*func_uint32_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
+typedef uint32_t (*func_uint32_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
+typedef uint64_t (*func_uint64)(void);
+typedef uint64_t (*func_uint64_int32)(int32_t);
+typedef uint64_t (*func_uint64_int32_int32)(int32_t, int32_t);
+typedef uint64_t (*func_uint64_int32_int32_int32)(int32_t, int32_t, int32_t);
+typedef uint64_t (*func_uint64_int32_int32_intptr)(int32_t, int32_t, void *);
+typedef uint64_t (*func_uint64_int32_int32_string)(int32_t, int32_t, char *);
+typedef uint64_t (*func_uint64_int32_int32_uint32)(int32_t, int32_t, uint32_t);
+typedef uint64_t (*func_uint64_int32_int32_uint64)(int32_t, int32_t, uint64_t);
+typedef uint64_t (*func_uint64_int32_intptr)(int32_t, void *);
+typedef uint64_t (*func_uint64_int32_intptr_int32)(int32_t, void *, int32_t);
+typedef uint64_t (*func_uint64_int32_intptr_intptr)(int32_t, void *, void *);
+typedef uint64_t (*func_uint64_int32_intptr_string)(int32_t, void *, char *);
+typedef uint64_t (*func_uint64_int32_intptr_uint32)(int32_t, void *, uint32_t);
+typedef uint64_t (*func_uint64_int32_intptr_uint64)(int32_t, void *, uint64_t);
+typedef uint64_t (*func_uint64_int32_string)(int32_t, char *);
+typedef uint64_t (*func_uint64_int32_string_int32)(int32_t, char *, int32_t);
+typedef uint64_t (*func_uint64_int32_string_intptr)(int32_t, char *, void *);
+typedef uint64_t (*func_uint64_int32_string_string)(int32_t, char *, char *);
+typedef uint64_t (*func_uint64_int32_string_uint32)(int32_t, char *, uint32_t);
+typedef uint64_t (*func_uint64_int32_string_uint64)(int32_t, char *, uint64_t);
+typedef uint64_t (*func_uint64_int32_uint32)(int32_t, uint32_t);
+typedef uint64_t (*func_uint64_int32_uint32_int32)(int32_t, uint32_t, int32_t);
+typedef uint64_t (*func_uint64_int32_uint32_intptr)(int32_t, uint32_t, void *);
+typedef uint64_t (*func_uint64_int32_uint32_string)(int32_t, uint32_t, char *);
+typedef uint64_t (*func_uint64_int32_uint32_uint32)(int32_t, uint32_t, uint32_t);
+typedef uint64_t (*func_uint64_int32_uint32_uint64)(int32_t, uint32_t, uint64_t);
+typedef uint64_t (*func_uint64_int32_uint64)(int32_t, uint64_t);
+typedef uint64_t (*func_uint64_int32_uint64_int32)(int32_t, uint64_t, int32_t);
+typedef uint64_t (*func_uint64_int32_uint64_intptr)(int32_t, uint64_t, void *);
+typedef uint64_t (*func_uint64_int32_uint64_string)(int32_t, uint64_t, char *);
+typedef uint64_t (*func_uint64_int32_uint64_uint32)(int32_t, uint64_t, uint32_t);
+typedef uint64_t (*func_uint64_int32_uint64_uint64)(int32_t, uint64_t, uint64_t);
+typedef uint64_t (*func_uint64_intptr)(void *);
+typedef uint64_t (*func_uint64_intptr_int32)(void *, int32_t);
+typedef uint64_t (*func_uint64_intptr_int32_int32)(void *, int32_t, int32_t);
+typedef uint64_t (*func_uint64_intptr_int32_intptr)(void *, int32_t, void *);
+typedef uint64_t (*func_uint64_intptr_int32_string)(void *, int32_t, char *);
+typedef uint64_t (*func_uint64_intptr_int32_uint32)(void *, int32_t, uint32_t);
+typedef uint64_t (*func_uint64_intptr_int32_uint64)(void *, int32_t, uint64_t);
+typedef uint64_t (*func_uint64_intptr_intptr)(void *, void *);
 typedef uint64_t (*func_uint64_intptr_intptr_int32)(void *, void *, int32_t);
-typedef int32_t (*func_int32_intptr_intptr_int32)(void *, void *, int32_t);
-typedef char * (*func_string_intptr_intptr_int32)(void *, void *, int32_t);
-typedef uint32_t (*func_uint32_intptr_intptr_int32)(void *, void *, int32_t);
-typedef void * (*func_intptr_intptr_intptr_int32)(void *, void *, int32_t);
-typedef void (*action_intptr_intptr_string)(void *, void *, char *);
+typedef uint64_t (*func_uint64_intptr_intptr_intptr)(void *, void *, void *);
 typedef uint64_t (*func_uint64_intptr_intptr_string)(void *, void *, char *);
-typedef int32_t (*func_int32_intptr_intptr_string)(void *, void *, char *);
-typedef char * (*func_string_intptr_intptr_string)(void *, void *, char *);
-typedef uint32_t (*func_uint32_intptr_intptr_string)(void *, void *, char *);
-typedef void * (*func_intptr_intptr_intptr_string)(void *, void *, char *);
-typedef void (*action_intptr_intptr_uint32)(void *, void *, uint32_t);
 typedef uint64_t (*func_uint64_intptr_intptr_uint32)(void *, void *, uint32_t);
-typedef int32_t (*func_int32_intptr_intptr_uint32)(void *, void *, uint32_t);
-typedef char * (*func_string_intptr_intptr_uint32)(void *, void *, uint32_t);
-typedef uint32_t (*func_uint32_intptr_intptr_uint32)(void *, void *, uint32_t);
-typedef void * (*func_intptr_intptr_intptr_uint32)(void *, void *, uint32_t);
-typedef void (*action_intptr_intptr_intptr)(void *, void *, void *);
-typedef uint64_t (*func_uint64_intptr_intptr_intptr)(void *, void *, void *);
-typedef int32_t (*func_int32_intptr_intptr_intptr)(void *, void *, void *);
-typedef char * (*func_string_intptr_intptr_intptr)(void *, void *, void *);
-typedef uint32_t (*func_uint32_intptr_intptr_intptr)(void *, void *, void *);
-typedef void * (*func_intptr_intptr_intptr_intptr)(void *, void *, void *);
-typedef void (*action)(void);
-typedef uint64_t (*func_uint64)(void);
-typedef int32_t (*func_int32)(void);
-typedef char * (*func_string)(void);
-typedef uint32_t (*func_uint32)(void);
-typedef void * (*func_intptr)(void);
-#define action_uint64_return$ void
-#define func_uint64_uint64_return$ uint64_t
-#define func_int32_uint64_return$ int32_t
-#define func_string_uint64_return$ char *
-#define func_uint32_uint64_return$ uint32_t
-#define func_intptr_uint64_return$ void *
+typedef uint64_t (*func_uint64_intptr_intptr_uint64)(void *, void *, uint64_t);
+typedef uint64_t (*func_uint64_intptr_string)(void *, char *);
+typedef uint64_t (*func_uint64_intptr_string_int32)(void *, char *, int32_t);
+typedef uint64_t (*func_uint64_intptr_string_intptr)(void *, char *, void *);
+typedef uint64_t (*func_uint64_intptr_string_string)(void *, char *, char *);
+typedef uint64_t (*func_uint64_intptr_string_uint32)(void *, char *, uint32_t);
+typedef uint64_t (*func_uint64_intptr_string_uint64)(void *, char *, uint64_t);
+typedef uint64_t (*func_uint64_intptr_uint32)(void *, uint32_t);
+typedef uint64_t (*func_uint64_intptr_uint32_int32)(void *, uint32_t, int32_t);
+typedef uint64_t (*func_uint64_intptr_uint32_intptr)(void *, uint32_t, void *);
+typedef uint64_t (*func_uint64_intptr_uint32_string)(void *, uint32_t, char *);
+typedef uint64_t (*func_uint64_intptr_uint32_uint32)(void *, uint32_t, uint32_t);
+typedef uint64_t (*func_uint64_intptr_uint32_uint64)(void *, uint32_t, uint64_t);
+typedef uint64_t (*func_uint64_intptr_uint64)(void *, uint64_t);
+typedef uint64_t (*func_uint64_intptr_uint64_int32)(void *, uint64_t, int32_t);
+typedef uint64_t (*func_uint64_intptr_uint64_intptr)(void *, uint64_t, void *);
+typedef uint64_t (*func_uint64_intptr_uint64_string)(void *, uint64_t, char *);
+typedef uint64_t (*func_uint64_intptr_uint64_uint32)(void *, uint64_t, uint32_t);
+typedef uint64_t (*func_uint64_intptr_uint64_uint64)(void *, uint64_t, uint64_t);
+typedef uint64_t (*func_uint64_string)(char *);
+typedef uint64_t (*func_uint64_string_int32)(char *, int32_t);
+typedef uint64_t (*func_uint64_string_int32_int32)(char *, int32_t, int32_t);
+typedef uint64_t (*func_uint64_string_int32_intptr)(char *, int32_t, void *);
+typedef uint64_t (*func_uint64_string_int32_string)(char *, int32_t, char *);
+typedef uint64_t (*func_uint64_string_int32_uint32)(char *, int32_t, uint32_t);
+typedef uint64_t (*func_uint64_string_int32_uint64)(char *, int32_t, uint64_t);
+typedef uint64_t (*func_uint64_string_intptr)(char *, void *);
+typedef uint64_t (*func_uint64_string_intptr_int32)(char *, void *, int32_t);
+typedef uint64_t (*func_uint64_string_intptr_intptr)(char *, void *, void *);
+typedef uint64_t (*func_uint64_string_intptr_string)(char *, void *, char *);
+typedef uint64_t (*func_uint64_string_intptr_uint32)(char *, void *, uint32_t);
+typedef uint64_t (*func_uint64_string_intptr_uint64)(char *, void *, uint64_t);
+typedef uint64_t (*func_uint64_string_string)(char *, char *);
+typedef uint64_t (*func_uint64_string_string_int32)(char *, char *, int32_t);
+typedef uint64_t (*func_uint64_string_string_intptr)(char *, char *, void *);
+typedef uint64_t (*func_uint64_string_string_string)(char *, char *, char *);
+typedef uint64_t (*func_uint64_string_string_uint32)(char *, char *, uint32_t);
+typedef uint64_t (*func_uint64_string_string_uint64)(char *, char *, uint64_t);
+typedef uint64_t (*func_uint64_string_uint32)(char *, uint32_t);
+typedef uint64_t (*func_uint64_string_uint32_int32)(char *, uint32_t, int32_t);
+typedef uint64_t (*func_uint64_string_uint32_intptr)(char *, uint32_t, void *);
+typedef uint64_t (*func_uint64_string_uint32_string)(char *, uint32_t, char *);
+typedef uint64_t (*func_uint64_string_uint32_uint32)(char *, uint32_t, uint32_t);
+typedef uint64_t (*func_uint64_string_uint32_uint64)(char *, uint32_t, uint64_t);
+typedef uint64_t (*func_uint64_string_uint64)(char *, uint64_t);
+typedef uint64_t (*func_uint64_string_uint64_int32)(char *, uint64_t, int32_t);
+typedef uint64_t (*func_uint64_string_uint64_intptr)(char *, uint64_t, void *);
+typedef uint64_t (*func_uint64_string_uint64_string)(char *, uint64_t, char *);
+typedef uint64_t (*func_uint64_string_uint64_uint32)(char *, uint64_t, uint32_t);
+typedef uint64_t (*func_uint64_string_uint64_uint64)(char *, uint64_t, uint64_t);
+typedef uint64_t (*func_uint64_uint32)(uint32_t);
+typedef uint64_t (*func_uint64_uint32_int32)(uint32_t, int32_t);
+typedef uint64_t (*func_uint64_uint32_int32_int32)(uint32_t, int32_t, int32_t);
+typedef uint64_t (*func_uint64_uint32_int32_intptr)(uint32_t, int32_t, void *);
+typedef uint64_t (*func_uint64_uint32_int32_string)(uint32_t, int32_t, char *);
+typedef uint64_t (*func_uint64_uint32_int32_uint32)(uint32_t, int32_t, uint32_t);
+typedef uint64_t (*func_uint64_uint32_int32_uint64)(uint32_t, int32_t, uint64_t);
+typedef uint64_t (*func_uint64_uint32_intptr)(uint32_t, void *);
+typedef uint64_t (*func_uint64_uint32_intptr_int32)(uint32_t, void *, int32_t);
+typedef uint64_t (*func_uint64_uint32_intptr_intptr)(uint32_t, void *, void *);
+typedef uint64_t (*func_uint64_uint32_intptr_string)(uint32_t, void *, char *);
+typedef uint64_t (*func_uint64_uint32_intptr_uint32)(uint32_t, void *, uint32_t);
+typedef uint64_t (*func_uint64_uint32_intptr_uint64)(uint32_t, void *, uint64_t);
+typedef uint64_t (*func_uint64_uint32_string)(uint32_t, char *);
+typedef uint64_t (*func_uint64_uint32_string_int32)(uint32_t, char *, int32_t);
+typedef uint64_t (*func_uint64_uint32_string_intptr)(uint32_t, char *, void *);
+typedef uint64_t (*func_uint64_uint32_string_string)(uint32_t, char *, char *);
+typedef uint64_t (*func_uint64_uint32_string_uint32)(uint32_t, char *, uint32_t);
+typedef uint64_t (*func_uint64_uint32_string_uint64)(uint32_t, char *, uint64_t);
+typedef uint64_t (*func_uint64_uint32_uint32)(uint32_t, uint32_t);
+typedef uint64_t (*func_uint64_uint32_uint32_int32)(uint32_t, uint32_t, int32_t);
+typedef uint64_t (*func_uint64_uint32_uint32_intptr)(uint32_t, uint32_t, void *);
+typedef uint64_t (*func_uint64_uint32_uint32_string)(uint32_t, uint32_t, char *);
+typedef uint64_t (*func_uint64_uint32_uint32_uint32)(uint32_t, uint32_t, uint32_t);
+typedef uint64_t (*func_uint64_uint32_uint32_uint64)(uint32_t, uint32_t, uint64_t);
+typedef uint64_t (*func_uint64_uint32_uint64)(uint32_t, uint64_t);
+typedef uint64_t (*func_uint64_uint32_uint64_int32)(uint32_t, uint64_t, int32_t);
+typedef uint64_t (*func_uint64_uint32_uint64_intptr)(uint32_t, uint64_t, void *);
+typedef uint64_t (*func_uint64_uint32_uint64_string)(uint32_t, uint64_t, char *);
+typedef uint64_t (*func_uint64_uint32_uint64_uint32)(uint32_t, uint64_t, uint32_t);
+typedef uint64_t (*func_uint64_uint32_uint64_uint64)(uint32_t, uint64_t, uint64_t);
+typedef uint64_t (*func_uint64_uint64)(uint64_t);
+typedef uint64_t (*func_uint64_uint64_int32)(uint64_t, int32_t);
+typedef uint64_t (*func_uint64_uint64_int32_int32)(uint64_t, int32_t, int32_t);
+typedef uint64_t (*func_uint64_uint64_int32_intptr)(uint64_t, int32_t, void *);
+typedef uint64_t (*func_uint64_uint64_int32_string)(uint64_t, int32_t, char *);
+typedef uint64_t (*func_uint64_uint64_int32_uint32)(uint64_t, int32_t, uint32_t);
+typedef uint64_t (*func_uint64_uint64_int32_uint64)(uint64_t, int32_t, uint64_t);
+typedef uint64_t (*func_uint64_uint64_intptr)(uint64_t, void *);
+typedef uint64_t (*func_uint64_uint64_intptr_int32)(uint64_t, void *, int32_t);
+typedef uint64_t (*func_uint64_uint64_intptr_intptr)(uint64_t, void *, void *);
+typedef uint64_t (*func_uint64_uint64_intptr_string)(uint64_t, void *, char *);
+typedef uint64_t (*func_uint64_uint64_intptr_uint32)(uint64_t, void *, uint32_t);
+typedef uint64_t (*func_uint64_uint64_intptr_uint64)(uint64_t, void *, uint64_t);
+typedef uint64_t (*func_uint64_uint64_string)(uint64_t, char *);
+typedef uint64_t (*func_uint64_uint64_string_int32)(uint64_t, char *, int32_t);
+typedef uint64_t (*func_uint64_uint64_string_intptr)(uint64_t, char *, void *);
+typedef uint64_t (*func_uint64_uint64_string_string)(uint64_t, char *, char *);
+typedef uint64_t (*func_uint64_uint64_string_uint32)(uint64_t, char *, uint32_t);
+typedef uint64_t (*func_uint64_uint64_string_uint64)(uint64_t, char *, uint64_t);
+typedef uint64_t (*func_uint64_uint64_uint32)(uint64_t, uint32_t);
+typedef uint64_t (*func_uint64_uint64_uint32_int32)(uint64_t, uint32_t, int32_t);
+typedef uint64_t (*func_uint64_uint64_uint32_intptr)(uint64_t, uint32_t, void *);
+typedef uint64_t (*func_uint64_uint64_uint32_string)(uint64_t, uint32_t, char *);
+typedef uint64_t (*func_uint64_uint64_uint32_uint32)(uint64_t, uint32_t, uint32_t);
+typedef uint64_t (*func_uint64_uint64_uint32_uint64)(uint64_t, uint32_t, uint64_t);
+typedef uint64_t (*func_uint64_uint64_uint64)(uint64_t, uint64_t);
+typedef uint64_t (*func_uint64_uint64_uint64_int32)(uint64_t, uint64_t, int32_t);
+typedef uint64_t (*func_uint64_uint64_uint64_intptr)(uint64_t, uint64_t, void *);
+typedef uint64_t (*func_uint64_uint64_uint64_string)(uint64_t, uint64_t, char *);
+typedef uint64_t (*func_uint64_uint64_uint64_uint32)(uint64_t, uint64_t, uint32_t);
+typedef uint64_t (*func_uint64_uint64_uint64_uint64)(uint64_t, uint64_t, uint64_t);
+
+#define action_return$ void
 #define action_int32_return$ void
-#define func_uint64_int32_return$ uint64_t
-#define func_int32_int32_return$ int32_t
-#define func_string_int32_return$ char *
-#define func_uint32_int32_return$ uint32_t
-#define func_intptr_int32_return$ void *
-#define action_string_return$ void
-#define func_uint64_string_return$ uint64_t
-#define func_int32_string_return$ int32_t
-#define func_string_string_return$ char *
-#define func_uint32_string_return$ uint32_t
-#define func_intptr_string_return$ void *
-#define action_uint32_return$ void
-#define func_uint64_uint32_return$ uint64_t
-#define func_int32_uint32_return$ int32_t
-#define func_string_uint32_return$ char *
-#define func_uint32_uint32_return$ uint32_t
-#define func_intptr_uint32_return$ void *
-#define action_intptr_return$ void
-#define func_uint64_intptr_return$ uint64_t
-#define func_int32_intptr_return$ int32_t
-#define func_string_intptr_return$ char *
-#define func_uint32_intptr_return$ uint32_t
-#define func_intptr_intptr_return$ void *
-#define action_uint64_uint64_return$ void
-#define func_uint64_uint64_uint64_return$ uint64_t
-#define func_int32_uint64_uint64_return$ int32_t
-#define func_string_uint64_uint64_return$ char *
-#define func_uint32_uint64_uint64_return$ uint32_t
-#define func_intptr_uint64_uint64_return$ void *
-#define action_uint64_int32_return$ void
-#define func_uint64_uint64_int32_return$ uint64_t
-#define func_int32_uint64_int32_return$ int32_t
-#define func_string_uint64_int32_return$ char *
-#define func_uint32_uint64_int32_return$ uint32_t
-#define func_intptr_uint64_int32_return$ void *
-#define action_uint64_string_return$ void
-#define func_uint64_uint64_string_return$ uint64_t
-#define func_int32_uint64_string_return$ int32_t
-#define func_string_uint64_string_return$ char *
-#define func_uint32_uint64_string_return$ uint32_t
-#define func_intptr_uint64_string_return$ void *
-#define action_uint64_uint32_return$ void
-#define func_uint64_uint64_uint32_return$ uint64_t
-#define func_int32_uint64_uint32_return$ int32_t
-#define func_string_uint64_uint32_return$ char *
-#define func_uint32_uint64_uint32_return$ uint32_t
-#define func_intptr_uint64_uint32_return$ void *
-#define action_uint64_intptr_return$ void
-#define func_uint64_uint64_intptr_return$ uint64_t
-#define func_int32_uint64_intptr_return$ int32_t
-#define func_string_uint64_intptr_return$ char *
-#define func_uint32_uint64_intptr_return$ uint32_t
-#define func_intptr_uint64_intptr_return$ void *
-#define action_int32_uint64_return$ void
-#define func_uint64_int32_uint64_return$ uint64_t
-#define func_int32_int32_uint64_return$ int32_t
-#define func_string_int32_uint64_return$ char *
-#define func_uint32_int32_uint64_return$ uint32_t
-#define func_intptr_int32_uint64_return$ void *
 #define action_int32_int32_return$ void
-#define func_uint64_int32_int32_return$ uint64_t
-#define func_int32_int32_int32_return$ int32_t
-#define func_string_int32_int32_return$ char *
-#define func_uint32_int32_int32_return$ uint32_t
-#define func_intptr_int32_int32_return$ void *
+#define action_int32_int32_int32_return$ void
+#define action_int32_int32_intptr_return$ void
+#define action_int32_int32_string_return$ void
+#define action_int32_int32_uint32_return$ void
+#define action_int32_int32_uint64_return$ void
+#define action_int32_intptr_return$ void
+#define action_int32_intptr_int32_return$ void
+#define action_int32_intptr_intptr_return$ void
+#define action_int32_intptr_string_return$ void
+#define action_int32_intptr_uint32_return$ void
+#define action_int32_intptr_uint64_return$ void
 #define action_int32_string_return$ void
-#define func_uint64_int32_string_return$ uint64_t
-#define func_int32_int32_string_return$ int32_t
-#define func_string_int32_string_return$ char *
-#define func_uint32_int32_string_return$ uint32_t
-#define func_intptr_int32_string_return$ void *
+#define action_int32_string_int32_return$ void
+#define action_int32_string_intptr_return$ void
+#define action_int32_string_string_return$ void
+#define action_int32_string_uint32_return$ void
+#define action_int32_string_uint64_return$ void
 #define action_int32_uint32_return$ void
-#define func_uint64_int32_uint32_return$ uint64_t
-#define func_int32_int32_uint32_return$ int32_t
-#define func_string_int32_uint32_return$ char *
-#define func_uint32_int32_uint32_return$ uint32_t
-#define func_intptr_int32_uint32_return$ void *
-#define action_int32_intptr_return$ void
-#define func_uint64_int32_intptr_return$ uint64_t
-#define func_int32_int32_intptr_return$ int32_t
-#define func_string_int32_intptr_return$ char *
-#define func_uint32_int32_intptr_return$ uint32_t
-#define func_intptr_int32_intptr_return$ void *
-#define action_string_uint64_return$ void
-#define func_uint64_string_uint64_return$ uint64_t
-#define func_int32_string_uint64_return$ int32_t
-#define func_string_string_uint64_return$ char *
-#define func_uint32_string_uint64_return$ uint32_t
-#define func_intptr_string_uint64_return$ void *
+#define action_int32_uint32_int32_return$ void
+#define action_int32_uint32_intptr_return$ void
+#define action_int32_uint32_string_return$ void
+#define action_int32_uint32_uint32_return$ void
+#define action_int32_uint32_uint64_return$ void
+#define action_int32_uint64_return$ void
+#define action_int32_uint64_int32_return$ void
+#define action_int32_uint64_intptr_return$ void
+#define action_int32_uint64_string_return$ void
+#define action_int32_uint64_uint32_return$ void
+#define action_int32_uint64_uint64_return$ void
+#define action_intptr_return$ void
+#define action_intptr_int32_return$ void
+#define action_intptr_int32_int32_return$ void
+#define action_intptr_int32_intptr_return$ void
+#define action_intptr_int32_string_return$ void
+#define action_intptr_int32_uint32_return$ void
+#define action_intptr_int32_uint64_return$ void
+#define action_intptr_intptr_return$ void
+#define action_intptr_intptr_int32_return$ void
+#define action_intptr_intptr_intptr_return$ void
+#define action_intptr_intptr_string_return$ void
+#define action_intptr_intptr_uint32_return$ void
+#define action_intptr_intptr_uint64_return$ void
+#define action_intptr_string_return$ void
+#define action_intptr_string_int32_return$ void
+#define action_intptr_string_intptr_return$ void
+#define action_intptr_string_string_return$ void
+#define action_intptr_string_uint32_return$ void
+#define action_intptr_string_uint64_return$ void
+#define action_intptr_uint32_return$ void
+#define action_intptr_uint32_int32_return$ void
+#define action_intptr_uint32_intptr_return$ void
+#define action_intptr_uint32_string_return$ void
+#define action_intptr_uint32_uint32_return$ void
+#define action_intptr_uint32_uint64_return$ void
+#define action_intptr_uint64_return$ void
+#define action_intptr_uint64_int32_return$ void
+#define action_intptr_uint64_intptr_return$ void
+#define action_intptr_uint64_string_return$ void
+#define action_intptr_uint64_uint32_return$ void
+#define action_intptr_uint64_uint64_return$ void
+#define action_string_return$ void
 #define action_string_int32_return$ void
-#define func_uint64_string_int32_return$ uint64_t
-#define func_int32_string_int32_return$ int32_t
-#define func_string_string_int32_return$ char *
-#define func_uint32_string_int32_return$ uint32_t
-#define func_intptr_string_int32_return$ void *
+#define action_string_int32_int32_return$ void
+#define action_string_int32_intptr_return$ void
+#define action_string_int32_string_return$ void
+#define action_string_int32_uint32_return$ void
+#define action_string_int32_uint64_return$ void
+#define action_string_intptr_return$ void
+#define action_string_intptr_int32_return$ void
+#define action_string_intptr_intptr_return$ void
+#define action_string_intptr_string_return$ void
+#define action_string_intptr_uint32_return$ void
+#define action_string_intptr_uint64_return$ void
 #define action_string_string_return$ void
-#define func_uint64_string_string_return$ uint64_t
-#define func_int32_string_string_return$ int32_t
-#define func_string_string_string_return$ char *
-#define func_uint32_string_string_return$ uint32_t
-#define func_intptr_string_string_return$ void *
+#define action_string_string_int32_return$ void
+#define action_string_string_intptr_return$ void
+#define action_string_string_string_return$ void
+#define action_string_string_uint32_return$ void
+#define action_string_string_uint64_return$ void
 #define action_string_uint32_return$ void
-#define func_uint64_string_uint32_return$ uint64_t
-#define func_int32_string_uint32_return$ int32_t
-#define func_string_string_uint32_return$ char *
-#define func_uint32_string_uint32_return$ uint32_t
-#define func_intptr_string_uint32_return$ void *
-#define action_string_intptr_return$ void
-#define func_uint64_string_intptr_return$ uint64_t
-#define func_int32_string_intptr_return$ int32_t
-#define func_string_string_intptr_return$ char *
-#define func_uint32_string_intptr_return$ uint32_t
-#define func_intptr_string_intptr_return$ void *
-#define action_uint32_uint64_return$ void
-#define func_uint64_uint32_uint64_return$ uint64_t
-#define func_int32_uint32_uint64_return$ int32_t
-#define func_string_uint32_uint64_return$ char *
-#define func_uint32_uint32_uint64_return$ uint32_t
-#define func_intptr_uint32_uint64_return$ void *
+#define action_string_uint32_int32_return$ void
+#define action_string_uint32_intptr_return$ void
+#define action_string_uint32_string_return$ void
+#define action_string_uint32_uint32_return$ void
+#define action_string_uint32_uint64_return$ void
+#define action_string_uint64_return$ void
+#define action_string_uint64_int32_return$ void
+#define action_string_uint64_intptr_return$ void
+#define action_string_uint64_string_return$ void
+#define action_string_uint64_uint32_return$ void
+#define action_string_uint64_uint64_return$ void
+#define action_uint32_return$ void
 #define action_uint32_int32_return$ void
-#define func_uint64_uint32_int32_return$ uint64_t
-#define func_int32_uint32_int32_return$ int32_t
-#define func_string_uint32_int32_return$ char *
-#define func_uint32_uint32_int32_return$ uint32_t
-#define func_intptr_uint32_int32_return$ void *
+#define action_uint32_int32_int32_return$ void
+#define action_uint32_int32_intptr_return$ void
+#define action_uint32_int32_string_return$ void
+#define action_uint32_int32_uint32_return$ void
+#define action_uint32_int32_uint64_return$ void
+#define action_uint32_intptr_return$ void
+#define action_uint32_intptr_int32_return$ void
+#define action_uint32_intptr_intptr_return$ void
+#define action_uint32_intptr_string_return$ void
+#define action_uint32_intptr_uint32_return$ void
+#define action_uint32_intptr_uint64_return$ void
 #define action_uint32_string_return$ void
-#define func_uint64_uint32_string_return$ uint64_t
-#define func_int32_uint32_string_return$ int32_t
-#define func_string_uint32_string_return$ char *
-#define func_uint32_uint32_string_return$ uint32_t
-#define func_intptr_uint32_string_return$ void *
+#define action_uint32_string_int32_return$ void
+#define action_uint32_string_intptr_return$ void
+#define action_uint32_string_string_return$ void
+#define action_uint32_string_uint32_return$ void
+#define action_uint32_string_uint64_return$ void
 #define action_uint32_uint32_return$ void
-#define func_uint64_uint32_uint32_return$ uint64_t
-#define func_int32_uint32_uint32_return$ int32_t
-#define func_string_uint32_uint32_return$ char *
-#define func_uint32_uint32_uint32_return$ uint32_t
-#define func_intptr_uint32_uint32_return$ void *
-#define action_uint32_intptr_return$ void
-#define func_uint64_uint32_intptr_return$ uint64_t
-#define func_int32_uint32_intptr_return$ int32_t
-#define func_string_uint32_intptr_return$ char *
-#define func_uint32_uint32_intptr_return$ uint32_t
-#define func_intptr_uint32_intptr_return$ void *
-#define action_intptr_uint64_return$ void
-#define func_uint64_intptr_uint64_return$ uint64_t
-#define func_int32_intptr_uint64_return$ int32_t
-#define func_string_intptr_uint64_return$ char *
-#define func_uint32_intptr_uint64_return$ uint32_t
-#define func_intptr_intptr_uint64_return$ void *
-#define action_intptr_int32_return$ void
-#define func_uint64_intptr_int32_return$ uint64_t
-#define func_int32_intptr_int32_return$ int32_t
-#define func_string_intptr_int32_return$ char *
-#define func_uint32_intptr_int32_return$ uint32_t
-#define func_intptr_intptr_int32_return$ void *
-#define action_intptr_string_return$ void
-#define func_uint64_intptr_string_return$ uint64_t
-#define func_int32_intptr_string_return$ int32_t
-#define func_string_intptr_string_return$ char *
-#define func_uint32_intptr_string_return$ uint32_t
-#define func_intptr_intptr_string_return$ void *
-#define action_intptr_uint32_return$ void
-#define func_uint64_intptr_uint32_return$ uint64_t
-#define func_int32_intptr_uint32_return$ int32_t
-#define func_string_intptr_uint32_return$ char *
-#define func_uint32_intptr_uint32_return$ uint32_t
-#define func_intptr_intptr_uint32_return$ void *
-#define action_intptr_intptr_return$ void
-#define func_uint64_intptr_intptr_return$ uint64_t
-#define func_int32_intptr_intptr_return$ int32_t
-#define func_string_intptr_intptr_return$ char *
-#define func_uint32_intptr_intptr_return$ uint32_t
-#define func_intptr_intptr_intptr_return$ void *
-#define action_uint64_uint64_uint64_return$ void
-#define func_uint64_uint64_uint64_uint64_return$ uint64_t
-#define func_int32_uint64_uint64_uint64_return$ int32_t
-#define func_string_uint64_uint64_uint64_return$ char *
-#define func_uint32_uint64_uint64_uint64_return$ uint32_t
-#define func_intptr_uint64_uint64_uint64_return$ void *
-#define action_uint64_uint64_int32_return$ void
-#define func_uint64_uint64_uint64_int32_return$ uint64_t
-#define func_int32_uint64_uint64_int32_return$ int32_t
-#define func_string_uint64_uint64_int32_return$ char *
-#define func_uint32_uint64_uint64_int32_return$ uint32_t
-#define func_intptr_uint64_uint64_int32_return$ void *
-#define action_uint64_uint64_string_return$ void
-#define func_uint64_uint64_uint64_string_return$ uint64_t
-#define func_int32_uint64_uint64_string_return$ int32_t
-#define func_string_uint64_uint64_string_return$ char *
-#define func_uint32_uint64_uint64_string_return$ uint32_t
-#define func_intptr_uint64_uint64_string_return$ void *
-#define action_uint64_uint64_uint32_return$ void
-#define func_uint64_uint64_uint64_uint32_return$ uint64_t
-#define func_int32_uint64_uint64_uint32_return$ int32_t
-#define func_string_uint64_uint64_uint32_return$ char *
-#define func_uint32_uint64_uint64_uint32_return$ uint32_t
-#define func_intptr_uint64_uint64_uint32_return$ void *
-#define action_uint64_uint64_intptr_return$ void
-#define func_uint64_uint64_uint64_intptr_return$ uint64_t
-#define func_int32_uint64_uint64_intptr_return$ int32_t
-#define func_string_uint64_uint64_intptr_return$ char *
-#define func_uint32_uint64_uint64_intptr_return$ uint32_t
-#define func_intptr_uint64_uint64_intptr_return$ void *
-#define action_uint64_int32_uint64_return$ void
-#define func_uint64_uint64_int32_uint64_return$ uint64_t
-#define func_int32_uint64_int32_uint64_return$ int32_t
-#define func_string_uint64_int32_uint64_return$ char *
-#define func_uint32_uint64_int32_uint64_return$ uint32_t
-#define func_intptr_uint64_int32_uint64_return$ void *
-#define action_uint64_int32_int32_return$ void
-#define func_uint64_uint64_int32_int32_return$ uint64_t
-#define func_int32_uint64_int32_int32_return$ int32_t
-#define func_string_uint64_int32_int32_return$ char *
-#define func_uint32_uint64_int32_int32_return$ uint32_t
-#define func_intptr_uint64_int32_int32_return$ void *
-#define action_uint64_int32_string_return$ void
-#define func_uint64_uint64_int32_string_return$ uint64_t
-#define func_int32_uint64_int32_string_return$ int32_t
-#define func_string_uint64_int32_string_return$ char *
-#define func_uint32_uint64_int32_string_return$ uint32_t
-#define func_intptr_uint64_int32_string_return$ void *
-#define action_uint64_int32_uint32_return$ void
-#define func_uint64_uint64_int32_uint32_return$ uint64_t
-#define func_int32_uint64_int32_uint32_return$ int32_t
-#define func_string_uint64_int32_uint32_return$ char *
-#define func_uint32_uint64_int32_uint32_return$ uint32_t
-#define func_intptr_uint64_int32_uint32_return$ void *
-#define action_uint64_int32_intptr_return$ void
-#define func_uint64_uint64_int32_intptr_return$ uint64_t
-#define func_int32_uint64_int32_intptr_return$ int32_t
-#define func_string_uint64_int32_intptr_return$ char *
-#define func_uint32_uint64_int32_intptr_return$ uint32_t
-#define func_intptr_uint64_int32_intptr_return$ void *
-#define action_uint64_string_uint64_return$ void
-#define func_uint64_uint64_string_uint64_return$ uint64_t
-#define func_int32_uint64_string_uint64_return$ int32_t
-#define func_string_uint64_string_uint64_return$ char *
-#define func_uint32_uint64_string_uint64_return$ uint32_t
-#define func_intptr_uint64_string_uint64_return$ void *
+#define action_uint32_uint32_int32_return$ void
+#define action_uint32_uint32_intptr_return$ void
+#define action_uint32_uint32_string_return$ void
+#define action_uint32_uint32_uint32_return$ void
+#define action_uint32_uint32_uint64_return$ void
+#define action_uint32_uint64_return$ void
+#define action_uint32_uint64_int32_return$ void
+#define action_uint32_uint64_intptr_return$ void
+#define action_uint32_uint64_string_return$ void
+#define action_uint32_uint64_uint32_return$ void
+#define action_uint32_uint64_uint64_return$ void
+#define action_uint64_return$ void
+#define action_uint64_int32_return$ void
+#define action_uint64_int32_int32_return$ void
+#define action_uint64_int32_intptr_return$ void
+#define action_uint64_int32_string_return$ void
+#define action_uint64_int32_uint32_return$ void
+#define action_uint64_int32_uint64_return$ void
+#define action_uint64_intptr_return$ void
+#define action_uint64_intptr_int32_return$ void
+#define action_uint64_intptr_intptr_return$ void
+#define action_uint64_intptr_string_return$ void
+#define action_uint64_intptr_uint32_return$ void
+#define action_uint64_intptr_uint64_return$ void
+#define action_uint64_string_return$ void
 #define action_uint64_string_int32_return$ void
-#define func_uint64_uint64_string_int32_return$ uint64_t
-#define func_int32_uint64_string_int32_return$ int32_t
-#define func_string_uint64_string_int32_return$ char *
-#define func_uint32_uint64_string_int32_return$ uint32_t
-#define func_intptr_uint64_string_int32_return$ void *
+#define action_uint64_string_intptr_return$ void
 #define action_uint64_string_string_return$ void
-#define func_uint64_uint64_string_string_return$ uint64_t
-#define func_int32_uint64_string_string_return$ int32_t
-#define func_string_uint64_string_string_return$ char *
-#define func_uint32_uint64_string_string_return$ uint32_t
-#define func_intptr_uint64_string_string_return$ void *
 #define action_uint64_string_uint32_return$ void
-#define func_uint64_uint64_string_uint32_return$ uint64_t
-#define func_int32_uint64_string_uint32_return$ int32_t
-#define func_string_uint64_string_uint32_return$ char *
-#define func_uint32_uint64_string_uint32_return$ uint32_t
-#define func_intptr_uint64_string_uint32_return$ void *
-#define action_uint64_string_intptr_return$ void
-#define func_uint64_uint64_string_intptr_return$ uint64_t
-#define func_int32_uint64_string_intptr_return$ int32_t
-#define func_string_uint64_string_intptr_return$ char *
-#define func_uint32_uint64_string_intptr_return$ uint32_t
-#define func_intptr_uint64_string_intptr_return$ void *
-#define action_uint64_uint32_uint64_return$ void
-#define func_uint64_uint64_uint32_uint64_return$ uint64_t
-#define func_int32_uint64_uint32_uint64_return$ int32_t
-#define func_string_uint64_uint32_uint64_return$ char *
-#define func_uint32_uint64_uint32_uint64_return$ uint32_t
-#define func_intptr_uint64_uint32_uint64_return$ void *
+#define action_uint64_string_uint64_return$ void
+#define action_uint64_uint32_return$ void
 #define action_uint64_uint32_int32_return$ void
-#define func_uint64_uint64_uint32_int32_return$ uint64_t
-#define func_int32_uint64_uint32_int32_return$ int32_t
-#define func_string_uint64_uint32_int32_return$ char *
-#define func_uint32_uint64_uint32_int32_return$ uint32_t
-#define func_intptr_uint64_uint32_int32_return$ void *
+#define action_uint64_uint32_intptr_return$ void
 #define action_uint64_uint32_string_return$ void
-#define func_uint64_uint64_uint32_string_return$ uint64_t
-#define func_int32_uint64_uint32_string_return$ int32_t
-#define func_string_uint64_uint32_string_return$ char *
-#define func_uint32_uint64_uint32_string_return$ uint32_t
-#define func_intptr_uint64_uint32_string_return$ void *
 #define action_uint64_uint32_uint32_return$ void
-#define func_uint64_uint64_uint32_uint32_return$ uint64_t
-#define func_int32_uint64_uint32_uint32_return$ int32_t
-#define func_string_uint64_uint32_uint32_return$ char *
-#define func_uint32_uint64_uint32_uint32_return$ uint32_t
-#define func_intptr_uint64_uint32_uint32_return$ void *
-#define action_uint64_uint32_intptr_return$ void
-#define func_uint64_uint64_uint32_intptr_return$ uint64_t
-#define func_int32_uint64_uint32_intptr_return$ int32_t
-#define func_string_uint64_uint32_intptr_return$ char *
-#define func_uint32_uint64_uint32_intptr_return$ uint32_t
-#define func_intptr_uint64_uint32_intptr_return$ void *
-#define action_uint64_intptr_uint64_return$ void
-#define func_uint64_uint64_intptr_uint64_return$ uint64_t
-#define func_int32_uint64_intptr_uint64_return$ int32_t
-#define func_string_uint64_intptr_uint64_return$ char *
-#define func_uint32_uint64_intptr_uint64_return$ uint32_t
-#define func_intptr_uint64_intptr_uint64_return$ void *
-#define action_uint64_intptr_int32_return$ void
-#define func_uint64_uint64_intptr_int32_return$ uint64_t
-#define func_int32_uint64_intptr_int32_return$ int32_t
-#define func_string_uint64_intptr_int32_return$ char *
-#define func_uint32_uint64_intptr_int32_return$ uint32_t
-#define func_intptr_uint64_intptr_int32_return$ void *
-#define action_uint64_intptr_string_return$ void
-#define func_uint64_uint64_intptr_string_return$ uint64_t
-#define func_int32_uint64_intptr_string_return$ int32_t
-#define func_string_uint64_intptr_string_return$ char *
-#define func_uint32_uint64_intptr_string_return$ uint32_t
-#define func_intptr_uint64_intptr_string_return$ void *
-#define action_uint64_intptr_uint32_return$ void
-#define func_uint64_uint64_intptr_uint32_return$ uint64_t
-#define func_int32_uint64_intptr_uint32_return$ int32_t
-#define func_string_uint64_intptr_uint32_return$ char *
-#define func_uint32_uint64_intptr_uint32_return$ uint32_t
-#define func_intptr_uint64_intptr_uint32_return$ void *
-#define action_uint64_intptr_intptr_return$ void
-#define func_uint64_uint64_intptr_intptr_return$ uint64_t
-#define func_int32_uint64_intptr_intptr_return$ int32_t
-#define func_string_uint64_intptr_intptr_return$ char *
-#define func_uint32_uint64_intptr_intptr_return$ uint32_t
-#define func_intptr_uint64_intptr_intptr_return$ void *
-#define action_int32_uint64_uint64_return$ void
-#define func_uint64_int32_uint64_uint64_return$ uint64_t
-#define func_int32_int32_uint64_uint64_return$ int32_t
-#define func_string_int32_uint64_uint64_return$ char *
-#define func_uint32_int32_uint64_uint64_return$ uint32_t
-#define func_intptr_int32_uint64_uint64_return$ void *
-#define action_int32_uint64_int32_return$ void
-#define func_uint64_int32_uint64_int32_return$ uint64_t
+#define action_uint64_uint32_uint64_return$ void
+#define action_uint64_uint64_return$ void
+#define action_uint64_uint64_int32_return$ void
+#define action_uint64_uint64_intptr_return$ void
+#define action_uint64_uint64_string_return$ void
+#define action_uint64_uint64_uint32_return$ void
+#define action_uint64_uint64_uint64_return$ void
+#define func_int32_return$ int32_t
+#define func_int32_int32_return$ int32_t
+#define func_int32_int32_int32_return$ int32_t
+#define func_int32_int32_int32_int32_return$ int32_t
+#define func_int32_int32_int32_intptr_return$ int32_t
+#define func_int32_int32_int32_string_return$ int32_t
+#define func_int32_int32_int32_uint32_return$ int32_t
+#define func_int32_int32_int32_uint64_return$ int32_t
+#define func_int32_int32_intptr_return$ int32_t
+#define func_int32_int32_intptr_int32_return$ int32_t
+#define func_int32_int32_intptr_intptr_return$ int32_t
+#define func_int32_int32_intptr_string_return$ int32_t
+#define func_int32_int32_intptr_uint32_return$ int32_t
+#define func_int32_int32_intptr_uint64_return$ int32_t
+#define func_int32_int32_string_return$ int32_t
+#define func_int32_int32_string_int32_return$ int32_t
+#define func_int32_int32_string_intptr_return$ int32_t
+#define func_int32_int32_string_string_return$ int32_t
+#define func_int32_int32_string_uint32_return$ int32_t
+#define func_int32_int32_string_uint64_return$ int32_t
+#define func_int32_int32_uint32_return$ int32_t
+#define func_int32_int32_uint32_int32_return$ int32_t
+#define func_int32_int32_uint32_intptr_return$ int32_t
+#define func_int32_int32_uint32_string_return$ int32_t
+#define func_int32_int32_uint32_uint32_return$ int32_t
+#define func_int32_int32_uint32_uint64_return$ int32_t
+#define func_int32_int32_uint64_return$ int32_t
 #define func_int32_int32_uint64_int32_return$ int32_t
-#define func_string_int32_uint64_int32_return$ char *
-#define func_uint32_int32_uint64_int32_return$ uint32_t
-#define func_intptr_int32_uint64_int32_return$ void *
-#define action_int32_uint64_string_return$ void
-#define func_uint64_int32_uint64_string_return$ uint64_t
+#define func_int32_int32_uint64_intptr_return$ int32_t
 #define func_int32_int32_uint64_string_return$ int32_t
-#define func_string_int32_uint64_string_return$ char *
-#define func_uint32_int32_uint64_string_return$ uint32_t
-#define func_intptr_int32_uint64_string_return$ void *
-#define action_int32_uint64_uint32_return$ void
-#define func_uint64_int32_uint64_uint32_return$ uint64_t
 #define func_int32_int32_uint64_uint32_return$ int32_t
-#define func_string_int32_uint64_uint32_return$ char *
-#define func_uint32_int32_uint64_uint32_return$ uint32_t
-#define func_intptr_int32_uint64_uint32_return$ void *
-#define action_int32_uint64_intptr_return$ void
-#define func_uint64_int32_uint64_intptr_return$ uint64_t
-#define func_int32_int32_uint64_intptr_return$ int32_t
-#define func_string_int32_uint64_intptr_return$ char *
-#define func_uint32_int32_uint64_intptr_return$ uint32_t
-#define func_intptr_int32_uint64_intptr_return$ void *
-#define action_int32_int32_uint64_return$ void
-#define func_uint64_int32_int32_uint64_return$ uint64_t
-#define func_int32_int32_int32_uint64_return$ int32_t
-#define func_string_int32_int32_uint64_return$ char *
-#define func_uint32_int32_int32_uint64_return$ uint32_t
-#define func_intptr_int32_int32_uint64_return$ void *
-#define action_int32_int32_int32_return$ void
-#define func_uint64_int32_int32_int32_return$ uint64_t
-#define func_int32_int32_int32_int32_return$ int32_t
-#define func_string_int32_int32_int32_return$ char *
-#define func_uint32_int32_int32_int32_return$ uint32_t
+#define func_int32_int32_uint64_uint64_return$ int32_t
+#define func_int32_intptr_return$ int32_t
+#define func_int32_intptr_int32_return$ int32_t
+#define func_int32_intptr_int32_int32_return$ int32_t
+#define func_int32_intptr_int32_intptr_return$ int32_t
+#define func_int32_intptr_int32_string_return$ int32_t
+#define func_int32_intptr_int32_uint32_return$ int32_t
+#define func_int32_intptr_int32_uint64_return$ int32_t
+#define func_int32_intptr_intptr_return$ int32_t
+#define func_int32_intptr_intptr_int32_return$ int32_t
+#define func_int32_intptr_intptr_intptr_return$ int32_t
+#define func_int32_intptr_intptr_string_return$ int32_t
+#define func_int32_intptr_intptr_uint32_return$ int32_t
+#define func_int32_intptr_intptr_uint64_return$ int32_t
+#define func_int32_intptr_string_return$ int32_t
+#define func_int32_intptr_string_int32_return$ int32_t
+#define func_int32_intptr_string_intptr_return$ int32_t
+#define func_int32_intptr_string_string_return$ int32_t
+#define func_int32_intptr_string_uint32_return$ int32_t
+#define func_int32_intptr_string_uint64_return$ int32_t
+#define func_int32_intptr_uint32_return$ int32_t
+#define func_int32_intptr_uint32_int32_return$ int32_t
+#define func_int32_intptr_uint32_intptr_return$ int32_t
+#define func_int32_intptr_uint32_string_return$ int32_t
+#define func_int32_intptr_uint32_uint32_return$ int32_t
+#define func_int32_intptr_uint32_uint64_return$ int32_t
+#define func_int32_intptr_uint64_return$ int32_t
+#define func_int32_intptr_uint64_int32_return$ int32_t
+#define func_int32_intptr_uint64_intptr_return$ int32_t
+#define func_int32_intptr_uint64_string_return$ int32_t
+#define func_int32_intptr_uint64_uint32_return$ int32_t
+#define func_int32_intptr_uint64_uint64_return$ int32_t
+#define func_int32_string_return$ int32_t
+#define func_int32_string_int32_return$ int32_t
+#define func_int32_string_int32_int32_return$ int32_t
+#define func_int32_string_int32_intptr_return$ int32_t
+#define func_int32_string_int32_string_return$ int32_t
+#define func_int32_string_int32_uint32_return$ int32_t
+#define func_int32_string_int32_uint64_return$ int32_t
+#define func_int32_string_intptr_return$ int32_t
+#define func_int32_string_intptr_int32_return$ int32_t
+#define func_int32_string_intptr_intptr_return$ int32_t
+#define func_int32_string_intptr_string_return$ int32_t
+#define func_int32_string_intptr_uint32_return$ int32_t
+#define func_int32_string_intptr_uint64_return$ int32_t
+#define func_int32_string_string_return$ int32_t
+#define func_int32_string_string_int32_return$ int32_t
+#define func_int32_string_string_intptr_return$ int32_t
+#define func_int32_string_string_string_return$ int32_t
+#define func_int32_string_string_uint32_return$ int32_t
+#define func_int32_string_string_uint64_return$ int32_t
+#define func_int32_string_uint32_return$ int32_t
+#define func_int32_string_uint32_int32_return$ int32_t
+#define func_int32_string_uint32_intptr_return$ int32_t
+#define func_int32_string_uint32_string_return$ int32_t
+#define func_int32_string_uint32_uint32_return$ int32_t
+#define func_int32_string_uint32_uint64_return$ int32_t
+#define func_int32_string_uint64_return$ int32_t
+#define func_int32_string_uint64_int32_return$ int32_t
+#define func_int32_string_uint64_intptr_return$ int32_t
+#define func_int32_string_uint64_string_return$ int32_t
+#define func_int32_string_uint64_uint32_return$ int32_t
+#define func_int32_string_uint64_uint64_return$ int32_t
+#define func_int32_uint32_return$ int32_t
+#define func_int32_uint32_int32_return$ int32_t
+#define func_int32_uint32_int32_int32_return$ int32_t
+#define func_int32_uint32_int32_intptr_return$ int32_t
+#define func_int32_uint32_int32_string_return$ int32_t
+#define func_int32_uint32_int32_uint32_return$ int32_t
+#define func_int32_uint32_int32_uint64_return$ int32_t
+#define func_int32_uint32_intptr_return$ int32_t
+#define func_int32_uint32_intptr_int32_return$ int32_t
+#define func_int32_uint32_intptr_intptr_return$ int32_t
+#define func_int32_uint32_intptr_string_return$ int32_t
+#define func_int32_uint32_intptr_uint32_return$ int32_t
+#define func_int32_uint32_intptr_uint64_return$ int32_t
+#define func_int32_uint32_string_return$ int32_t
+#define func_int32_uint32_string_int32_return$ int32_t
+#define func_int32_uint32_string_intptr_return$ int32_t
+#define func_int32_uint32_string_string_return$ int32_t
+#define func_int32_uint32_string_uint32_return$ int32_t
+#define func_int32_uint32_string_uint64_return$ int32_t
+#define func_int32_uint32_uint32_return$ int32_t
+#define func_int32_uint32_uint32_int32_return$ int32_t
+#define func_int32_uint32_uint32_intptr_return$ int32_t
+#define func_int32_uint32_uint32_string_return$ int32_t
+#define func_int32_uint32_uint32_uint32_return$ int32_t
+#define func_int32_uint32_uint32_uint64_return$ int32_t
+#define func_int32_uint32_uint64_return$ int32_t
+#define func_int32_uint32_uint64_int32_return$ int32_t
+#define func_int32_uint32_uint64_intptr_return$ int32_t
+#define func_int32_uint32_uint64_string_return$ int32_t
+#define func_int32_uint32_uint64_uint32_return$ int32_t
+#define func_int32_uint32_uint64_uint64_return$ int32_t
+#define func_int32_uint64_return$ int32_t
+#define func_int32_uint64_int32_return$ int32_t
+#define func_int32_uint64_int32_int32_return$ int32_t
+#define func_int32_uint64_int32_intptr_return$ int32_t
+#define func_int32_uint64_int32_string_return$ int32_t
+#define func_int32_uint64_int32_uint32_return$ int32_t
+#define func_int32_uint64_int32_uint64_return$ int32_t
+#define func_int32_uint64_intptr_return$ int32_t
+#define func_int32_uint64_intptr_int32_return$ int32_t
+#define func_int32_uint64_intptr_intptr_return$ int32_t
+#define func_int32_uint64_intptr_string_return$ int32_t
+#define func_int32_uint64_intptr_uint32_return$ int32_t
+#define func_int32_uint64_intptr_uint64_return$ int32_t
+#define func_int32_uint64_string_return$ int32_t
+#define func_int32_uint64_string_int32_return$ int32_t
+#define func_int32_uint64_string_intptr_return$ int32_t
+#define func_int32_uint64_string_string_return$ int32_t
+#define func_int32_uint64_string_uint32_return$ int32_t
+#define func_int32_uint64_string_uint64_return$ int32_t
+#define func_int32_uint64_uint32_return$ int32_t
+#define func_int32_uint64_uint32_int32_return$ int32_t
+#define func_int32_uint64_uint32_intptr_return$ int32_t
+#define func_int32_uint64_uint32_string_return$ int32_t
+#define func_int32_uint64_uint32_uint32_return$ int32_t
+#define func_int32_uint64_uint32_uint64_return$ int32_t
+#define func_int32_uint64_uint64_return$ int32_t
+#define func_int32_uint64_uint64_int32_return$ int32_t
+#define func_int32_uint64_uint64_intptr_return$ int32_t
+#define func_int32_uint64_uint64_string_return$ int32_t
+#define func_int32_uint64_uint64_uint32_return$ int32_t
+#define func_int32_uint64_uint64_uint64_return$ int32_t
+#define func_intptr_return$ void *
+#define func_intptr_int32_return$ void *
+#define func_intptr_int32_int32_return$ void *
 #define func_intptr_int32_int32_int32_return$ void *
-#define action_int32_int32_string_return$ void
-#define func_uint64_int32_int32_string_return$ uint64_t
-#define func_int32_int32_int32_string_return$ int32_t
-#define func_string_int32_int32_string_return$ char *
-#define func_uint32_int32_int32_string_return$ uint32_t
+#define func_intptr_int32_int32_intptr_return$ void *
 #define func_intptr_int32_int32_string_return$ void *
-#define action_int32_int32_uint32_return$ void
-#define func_uint64_int32_int32_uint32_return$ uint64_t
-#define func_int32_int32_int32_uint32_return$ int32_t
-#define func_string_int32_int32_uint32_return$ char *
-#define func_uint32_int32_int32_uint32_return$ uint32_t
 #define func_intptr_int32_int32_uint32_return$ void *
-#define action_int32_int32_intptr_return$ void
-#define func_uint64_int32_int32_intptr_return$ uint64_t
-#define func_int32_int32_int32_intptr_return$ int32_t
-#define func_string_int32_int32_intptr_return$ char *
-#define func_uint32_int32_int32_intptr_return$ uint32_t
-#define func_intptr_int32_int32_intptr_return$ void *
-#define action_int32_string_uint64_return$ void
-#define func_uint64_int32_string_uint64_return$ uint64_t
-#define func_int32_int32_string_uint64_return$ int32_t
-#define func_string_int32_string_uint64_return$ char *
-#define func_uint32_int32_string_uint64_return$ uint32_t
-#define func_intptr_int32_string_uint64_return$ void *
-#define action_int32_string_int32_return$ void
-#define func_uint64_int32_string_int32_return$ uint64_t
-#define func_int32_int32_string_int32_return$ int32_t
-#define func_string_int32_string_int32_return$ char *
-#define func_uint32_int32_string_int32_return$ uint32_t
+#define func_intptr_int32_int32_uint64_return$ void *
+#define func_intptr_int32_intptr_return$ void *
+#define func_intptr_int32_intptr_int32_return$ void *
+#define func_intptr_int32_intptr_intptr_return$ void *
+#define func_intptr_int32_intptr_string_return$ void *
+#define func_intptr_int32_intptr_uint32_return$ void *
+#define func_intptr_int32_intptr_uint64_return$ void *
+#define func_intptr_int32_string_return$ void *
 #define func_intptr_int32_string_int32_return$ void *
-#define action_int32_string_string_return$ void
-#define func_uint64_int32_string_string_return$ uint64_t
-#define func_int32_int32_string_string_return$ int32_t
-#define func_string_int32_string_string_return$ char *
-#define func_uint32_int32_string_string_return$ uint32_t
+#define func_intptr_int32_string_intptr_return$ void *
 #define func_intptr_int32_string_string_return$ void *
-#define action_int32_string_uint32_return$ void
-#define func_uint64_int32_string_uint32_return$ uint64_t
-#define func_int32_int32_string_uint32_return$ int32_t
-#define func_string_int32_string_uint32_return$ char *
-#define func_uint32_int32_string_uint32_return$ uint32_t
 #define func_intptr_int32_string_uint32_return$ void *
-#define action_int32_string_intptr_return$ void
-#define func_uint64_int32_string_intptr_return$ uint64_t
-#define func_int32_int32_string_intptr_return$ int32_t
-#define func_string_int32_string_intptr_return$ char *
-#define func_uint32_int32_string_intptr_return$ uint32_t
-#define func_intptr_int32_string_intptr_return$ void *
-#define action_int32_uint32_uint64_return$ void
-#define func_uint64_int32_uint32_uint64_return$ uint64_t
-#define func_int32_int32_uint32_uint64_return$ int32_t
-#define func_string_int32_uint32_uint64_return$ char *
-#define func_uint32_int32_uint32_uint64_return$ uint32_t
-#define func_intptr_int32_uint32_uint64_return$ void *
-#define action_int32_uint32_int32_return$ void
-#define func_uint64_int32_uint32_int32_return$ uint64_t
-#define func_int32_int32_uint32_int32_return$ int32_t
-#define func_string_int32_uint32_int32_return$ char *
-#define func_uint32_int32_uint32_int32_return$ uint32_t
+#define func_intptr_int32_string_uint64_return$ void *
+#define func_intptr_int32_uint32_return$ void *
 #define func_intptr_int32_uint32_int32_return$ void *
-#define action_int32_uint32_string_return$ void
-#define func_uint64_int32_uint32_string_return$ uint64_t
-#define func_int32_int32_uint32_string_return$ int32_t
-#define func_string_int32_uint32_string_return$ char *
-#define func_uint32_int32_uint32_string_return$ uint32_t
+#define func_intptr_int32_uint32_intptr_return$ void *
 #define func_intptr_int32_uint32_string_return$ void *
-#define action_int32_uint32_uint32_return$ void
-#define func_uint64_int32_uint32_uint32_return$ uint64_t
-#define func_int32_int32_uint32_uint32_return$ int32_t
-#define func_string_int32_uint32_uint32_return$ char *
-#define func_uint32_int32_uint32_uint32_return$ uint32_t
 #define func_intptr_int32_uint32_uint32_return$ void *
-#define action_int32_uint32_intptr_return$ void
-#define func_uint64_int32_uint32_intptr_return$ uint64_t
-#define func_int32_int32_uint32_intptr_return$ int32_t
-#define func_string_int32_uint32_intptr_return$ char *
-#define func_uint32_int32_uint32_intptr_return$ uint32_t
-#define func_intptr_int32_uint32_intptr_return$ void *
-#define action_int32_intptr_uint64_return$ void
-#define func_uint64_int32_intptr_uint64_return$ uint64_t
-#define func_int32_int32_intptr_uint64_return$ int32_t
-#define func_string_int32_intptr_uint64_return$ char *
-#define func_uint32_int32_intptr_uint64_return$ uint32_t
-#define func_intptr_int32_intptr_uint64_return$ void *
-#define action_int32_intptr_int32_return$ void
-#define func_uint64_int32_intptr_int32_return$ uint64_t
-#define func_int32_int32_intptr_int32_return$ int32_t
-#define func_string_int32_intptr_int32_return$ char *
-#define func_uint32_int32_intptr_int32_return$ uint32_t
-#define func_intptr_int32_intptr_int32_return$ void *
-#define action_int32_intptr_string_return$ void
-#define func_uint64_int32_intptr_string_return$ uint64_t
-#define func_int32_int32_intptr_string_return$ int32_t
-#define func_string_int32_intptr_string_return$ char *
-#define func_uint32_int32_intptr_string_return$ uint32_t
-#define func_intptr_int32_intptr_string_return$ void *
-#define action_int32_intptr_uint32_return$ void
-#define func_uint64_int32_intptr_uint32_return$ uint64_t
-#define func_int32_int32_intptr_uint32_return$ int32_t
-#define func_string_int32_intptr_uint32_return$ char *
-#define func_uint32_int32_intptr_uint32_return$ uint32_t
-#define func_intptr_int32_intptr_uint32_return$ void *
-#define action_int32_intptr_intptr_return$ void
-#define func_uint64_int32_intptr_intptr_return$ uint64_t
-#define func_int32_int32_intptr_intptr_return$ int32_t
-#define func_string_int32_intptr_intptr_return$ char *
-#define func_uint32_int32_intptr_intptr_return$ uint32_t
-#define func_intptr_int32_intptr_intptr_return$ void *
-#define action_string_uint64_uint64_return$ void
-#define func_uint64_string_uint64_uint64_return$ uint64_t
-#define func_int32_string_uint64_uint64_return$ int32_t
-#define func_string_string_uint64_uint64_return$ char *
-#define func_uint32_string_uint64_uint64_return$ uint32_t
-#define func_intptr_string_uint64_uint64_return$ void *
-#define action_string_uint64_int32_return$ void
-#define func_uint64_string_uint64_int32_return$ uint64_t
-#define func_int32_string_uint64_int32_return$ int32_t
-#define func_string_string_uint64_int32_return$ char *
-#define func_uint32_string_uint64_int32_return$ uint32_t
-#define func_intptr_string_uint64_int32_return$ void *
-#define action_string_uint64_string_return$ void
-#define func_uint64_string_uint64_string_return$ uint64_t
-#define func_int32_string_uint64_string_return$ int32_t
-#define func_string_string_uint64_string_return$ char *
-#define func_uint32_string_uint64_string_return$ uint32_t
-#define func_intptr_string_uint64_string_return$ void *
-#define action_string_uint64_uint32_return$ void
-#define func_uint64_string_uint64_uint32_return$ uint64_t
-#define func_int32_string_uint64_uint32_return$ int32_t
-#define func_string_string_uint64_uint32_return$ char *
-#define func_uint32_string_uint64_uint32_return$ uint32_t
-#define func_intptr_string_uint64_uint32_return$ void *
-#define action_string_uint64_intptr_return$ void
-#define func_uint64_string_uint64_intptr_return$ uint64_t
-#define func_int32_string_uint64_intptr_return$ int32_t
-#define func_string_string_uint64_intptr_return$ char *
-#define func_uint32_string_uint64_intptr_return$ uint32_t
-#define func_intptr_string_uint64_intptr_return$ void *
-#define action_string_int32_uint64_return$ void
-#define func_uint64_string_int32_uint64_return$ uint64_t
-#define func_int32_string_int32_uint64_return$ int32_t
-#define func_string_string_int32_uint64_return$ char *
-#define func_uint32_string_int32_uint64_return$ uint32_t
-#define func_intptr_string_int32_uint64_return$ void *
-#define action_string_int32_int32_return$ void
-#define func_uint64_string_int32_int32_return$ uint64_t
-#define func_int32_string_int32_int32_return$ int32_t
-#define func_string_string_int32_int32_return$ char *
-#define func_uint32_string_int32_int32_return$ uint32_t
-#define func_intptr_string_int32_int32_return$ void *
-#define action_string_int32_string_return$ void
-#define func_uint64_string_int32_string_return$ uint64_t
-#define func_int32_string_int32_string_return$ int32_t
-#define func_string_string_int32_string_return$ char *
-#define func_uint32_string_int32_string_return$ uint32_t
-#define func_intptr_string_int32_string_return$ void *
-#define action_string_int32_uint32_return$ void
-#define func_uint64_string_int32_uint32_return$ uint64_t
-#define func_int32_string_int32_uint32_return$ int32_t
-#define func_string_string_int32_uint32_return$ char *
-#define func_uint32_string_int32_uint32_return$ uint32_t
-#define func_intptr_string_int32_uint32_return$ void *
-#define action_string_int32_intptr_return$ void
-#define func_uint64_string_int32_intptr_return$ uint64_t
-#define func_int32_string_int32_intptr_return$ int32_t
-#define func_string_string_int32_intptr_return$ char *
-#define func_uint32_string_int32_intptr_return$ uint32_t
+#define func_intptr_int32_uint32_uint64_return$ void *
+#define func_intptr_int32_uint64_return$ void *
+#define func_intptr_int32_uint64_int32_return$ void *
+#define func_intptr_int32_uint64_intptr_return$ void *
+#define func_intptr_int32_uint64_string_return$ void *
+#define func_intptr_int32_uint64_uint32_return$ void *
+#define func_intptr_int32_uint64_uint64_return$ void *
+#define func_intptr_intptr_return$ void *
+#define func_intptr_intptr_int32_return$ void *
+#define func_intptr_intptr_int32_int32_return$ void *
+#define func_intptr_intptr_int32_intptr_return$ void *
+#define func_intptr_intptr_int32_string_return$ void *
+#define func_intptr_intptr_int32_uint32_return$ void *
+#define func_intptr_intptr_int32_uint64_return$ void *
+#define func_intptr_intptr_intptr_return$ void *
+#define func_intptr_intptr_intptr_int32_return$ void *
+#define func_intptr_intptr_intptr_intptr_return$ void *
+#define func_intptr_intptr_intptr_string_return$ void *
+#define func_intptr_intptr_intptr_uint32_return$ void *
+#define func_intptr_intptr_intptr_uint64_return$ void *
+#define func_intptr_intptr_string_return$ void *
+#define func_intptr_intptr_string_int32_return$ void *
+#define func_intptr_intptr_string_intptr_return$ void *
+#define func_intptr_intptr_string_string_return$ void *
+#define func_intptr_intptr_string_uint32_return$ void *
+#define func_intptr_intptr_string_uint64_return$ void *
+#define func_intptr_intptr_uint32_return$ void *
+#define func_intptr_intptr_uint32_int32_return$ void *
+#define func_intptr_intptr_uint32_intptr_return$ void *
+#define func_intptr_intptr_uint32_string_return$ void *
+#define func_intptr_intptr_uint32_uint32_return$ void *
+#define func_intptr_intptr_uint32_uint64_return$ void *
+#define func_intptr_intptr_uint64_return$ void *
+#define func_intptr_intptr_uint64_int32_return$ void *
+#define func_intptr_intptr_uint64_intptr_return$ void *
+#define func_intptr_intptr_uint64_string_return$ void *
+#define func_intptr_intptr_uint64_uint32_return$ void *
+#define func_intptr_intptr_uint64_uint64_return$ void *
+#define func_intptr_string_return$ void *
+#define func_intptr_string_int32_return$ void *
+#define func_intptr_string_int32_int32_return$ void *
 #define func_intptr_string_int32_intptr_return$ void *
-#define action_string_string_uint64_return$ void
-#define func_uint64_string_string_uint64_return$ uint64_t
-#define func_int32_string_string_uint64_return$ int32_t
-#define func_string_string_string_uint64_return$ char *
-#define func_uint32_string_string_uint64_return$ uint32_t
-#define func_intptr_string_string_uint64_return$ void *
-#define action_string_string_int32_return$ void
-#define func_uint64_string_string_int32_return$ uint64_t
-#define func_int32_string_string_int32_return$ int32_t
-#define func_string_string_string_int32_return$ char *
-#define func_uint32_string_string_int32_return$ uint32_t
+#define func_intptr_string_int32_string_return$ void *
+#define func_intptr_string_int32_uint32_return$ void *
+#define func_intptr_string_int32_uint64_return$ void *
+#define func_intptr_string_intptr_return$ void *
+#define func_intptr_string_intptr_int32_return$ void *
+#define func_intptr_string_intptr_intptr_return$ void *
+#define func_intptr_string_intptr_string_return$ void *
+#define func_intptr_string_intptr_uint32_return$ void *
+#define func_intptr_string_intptr_uint64_return$ void *
+#define func_intptr_string_string_return$ void *
 #define func_intptr_string_string_int32_return$ void *
-#define action_string_string_string_return$ void
-#define func_uint64_string_string_string_return$ uint64_t
-#define func_int32_string_string_string_return$ int32_t
-#define func_string_string_string_string_return$ char *
-#define func_uint32_string_string_string_return$ uint32_t
+#define func_intptr_string_string_intptr_return$ void *
 #define func_intptr_string_string_string_return$ void *
-#define action_string_string_uint32_return$ void
-#define func_uint64_string_string_uint32_return$ uint64_t
-#define func_int32_string_string_uint32_return$ int32_t
-#define func_string_string_string_uint32_return$ char *
-#define func_uint32_string_string_uint32_return$ uint32_t
 #define func_intptr_string_string_uint32_return$ void *
-#define action_string_string_intptr_return$ void
-#define func_uint64_string_string_intptr_return$ uint64_t
-#define func_int32_string_string_intptr_return$ int32_t
-#define func_string_string_string_intptr_return$ char *
-#define func_uint32_string_string_intptr_return$ uint32_t
-#define func_intptr_string_string_intptr_return$ void *
-#define action_string_uint32_uint64_return$ void
-#define func_uint64_string_uint32_uint64_return$ uint64_t
-#define func_int32_string_uint32_uint64_return$ int32_t
-#define func_string_string_uint32_uint64_return$ char *
-#define func_uint32_string_uint32_uint64_return$ uint32_t
-#define func_intptr_string_uint32_uint64_return$ void *
-#define action_string_uint32_int32_return$ void
-#define func_uint64_string_uint32_int32_return$ uint64_t
-#define func_int32_string_uint32_int32_return$ int32_t
-#define func_string_string_uint32_int32_return$ char *
-#define func_uint32_string_uint32_int32_return$ uint32_t
+#define func_intptr_string_string_uint64_return$ void *
+#define func_intptr_string_uint32_return$ void *
 #define func_intptr_string_uint32_int32_return$ void *
-#define action_string_uint32_string_return$ void
-#define func_uint64_string_uint32_string_return$ uint64_t
-#define func_int32_string_uint32_string_return$ int32_t
-#define func_string_string_uint32_string_return$ char *
-#define func_uint32_string_uint32_string_return$ uint32_t
+#define func_intptr_string_uint32_intptr_return$ void *
 #define func_intptr_string_uint32_string_return$ void *
-#define action_string_uint32_uint32_return$ void
-#define func_uint64_string_uint32_uint32_return$ uint64_t
-#define func_int32_string_uint32_uint32_return$ int32_t
-#define func_string_string_uint32_uint32_return$ char *
-#define func_uint32_string_uint32_uint32_return$ uint32_t
 #define func_intptr_string_uint32_uint32_return$ void *
-#define action_string_uint32_intptr_return$ void
-#define func_uint64_string_uint32_intptr_return$ uint64_t
-#define func_int32_string_uint32_intptr_return$ int32_t
-#define func_string_string_uint32_intptr_return$ char *
-#define func_uint32_string_uint32_intptr_return$ uint32_t
-#define func_intptr_string_uint32_intptr_return$ void *
-#define action_string_intptr_uint64_return$ void
-#define func_uint64_string_intptr_uint64_return$ uint64_t
-#define func_int32_string_intptr_uint64_return$ int32_t
-#define func_string_string_intptr_uint64_return$ char *
-#define func_uint32_string_intptr_uint64_return$ uint32_t
-#define func_intptr_string_intptr_uint64_return$ void *
-#define action_string_intptr_int32_return$ void
-#define func_uint64_string_intptr_int32_return$ uint64_t
-#define func_int32_string_intptr_int32_return$ int32_t
-#define func_string_string_intptr_int32_return$ char *
-#define func_uint32_string_intptr_int32_return$ uint32_t
-#define func_intptr_string_intptr_int32_return$ void *
-#define action_string_intptr_string_return$ void
-#define func_uint64_string_intptr_string_return$ uint64_t
-#define func_int32_string_intptr_string_return$ int32_t
-#define func_string_string_intptr_string_return$ char *
-#define func_uint32_string_intptr_string_return$ uint32_t
-#define func_intptr_string_intptr_string_return$ void *
-#define action_string_intptr_uint32_return$ void
-#define func_uint64_string_intptr_uint32_return$ uint64_t
-#define func_int32_string_intptr_uint32_return$ int32_t
-#define func_string_string_intptr_uint32_return$ char *
-#define func_uint32_string_intptr_uint32_return$ uint32_t
-#define func_intptr_string_intptr_uint32_return$ void *
-#define action_string_intptr_intptr_return$ void
-#define func_uint64_string_intptr_intptr_return$ uint64_t
-#define func_int32_string_intptr_intptr_return$ int32_t
-#define func_string_string_intptr_intptr_return$ char *
-#define func_uint32_string_intptr_intptr_return$ uint32_t
-#define func_intptr_string_intptr_intptr_return$ void *
-#define action_uint32_uint64_uint64_return$ void
-#define func_uint64_uint32_uint64_uint64_return$ uint64_t
-#define func_int32_uint32_uint64_uint64_return$ int32_t
-#define func_string_uint32_uint64_uint64_return$ char *
-#define func_uint32_uint32_uint64_uint64_return$ uint32_t
-#define func_intptr_uint32_uint64_uint64_return$ void *
-#define action_uint32_uint64_int32_return$ void
-#define func_uint64_uint32_uint64_int32_return$ uint64_t
-#define func_int32_uint32_uint64_int32_return$ int32_t
-#define func_string_uint32_uint64_int32_return$ char *
-#define func_uint32_uint32_uint64_int32_return$ uint32_t
+#define func_intptr_string_uint32_uint64_return$ void *
+#define func_intptr_string_uint64_return$ void *
+#define func_intptr_string_uint64_int32_return$ void *
+#define func_intptr_string_uint64_intptr_return$ void *
+#define func_intptr_string_uint64_string_return$ void *
+#define func_intptr_string_uint64_uint32_return$ void *
+#define func_intptr_string_uint64_uint64_return$ void *
+#define func_intptr_uint32_return$ void *
+#define func_intptr_uint32_int32_return$ void *
+#define func_intptr_uint32_int32_int32_return$ void *
+#define func_intptr_uint32_int32_intptr_return$ void *
+#define func_intptr_uint32_int32_string_return$ void *
+#define func_intptr_uint32_int32_uint32_return$ void *
+#define func_intptr_uint32_int32_uint64_return$ void *
+#define func_intptr_uint32_intptr_return$ void *
+#define func_intptr_uint32_intptr_int32_return$ void *
+#define func_intptr_uint32_intptr_intptr_return$ void *
+#define func_intptr_uint32_intptr_string_return$ void *
+#define func_intptr_uint32_intptr_uint32_return$ void *
+#define func_intptr_uint32_intptr_uint64_return$ void *
+#define func_intptr_uint32_string_return$ void *
+#define func_intptr_uint32_string_int32_return$ void *
+#define func_intptr_uint32_string_intptr_return$ void *
+#define func_intptr_uint32_string_string_return$ void *
+#define func_intptr_uint32_string_uint32_return$ void *
+#define func_intptr_uint32_string_uint64_return$ void *
+#define func_intptr_uint32_uint32_return$ void *
+#define func_intptr_uint32_uint32_int32_return$ void *
+#define func_intptr_uint32_uint32_intptr_return$ void *
+#define func_intptr_uint32_uint32_string_return$ void *
+#define func_intptr_uint32_uint32_uint32_return$ void *
+#define func_intptr_uint32_uint32_uint64_return$ void *
+#define func_intptr_uint32_uint64_return$ void *
 #define func_intptr_uint32_uint64_int32_return$ void *
-#define action_uint32_uint64_string_return$ void
-#define func_uint64_uint32_uint64_string_return$ uint64_t
-#define func_int32_uint32_uint64_string_return$ int32_t
-#define func_string_uint32_uint64_string_return$ char *
-#define func_uint32_uint32_uint64_string_return$ uint32_t
+#define func_intptr_uint32_uint64_intptr_return$ void *
 #define func_intptr_uint32_uint64_string_return$ void *
-#define action_uint32_uint64_uint32_return$ void
-#define func_uint64_uint32_uint64_uint32_return$ uint64_t
-#define func_int32_uint32_uint64_uint32_return$ int32_t
-#define func_string_uint32_uint64_uint32_return$ char *
-#define func_uint32_uint32_uint64_uint32_return$ uint32_t
 #define func_intptr_uint32_uint64_uint32_return$ void *
-#define action_uint32_uint64_intptr_return$ void
-#define func_uint64_uint32_uint64_intptr_return$ uint64_t
-#define func_int32_uint32_uint64_intptr_return$ int32_t
-#define func_string_uint32_uint64_intptr_return$ char *
-#define func_uint32_uint32_uint64_intptr_return$ uint32_t
-#define func_intptr_uint32_uint64_intptr_return$ void *
-#define action_uint32_int32_uint64_return$ void
-#define func_uint64_uint32_int32_uint64_return$ uint64_t
-#define func_int32_uint32_int32_uint64_return$ int32_t
-#define func_string_uint32_int32_uint64_return$ char *
-#define func_uint32_uint32_int32_uint64_return$ uint32_t
-#define func_intptr_uint32_int32_uint64_return$ void *
-#define action_uint32_int32_int32_return$ void
-#define func_uint64_uint32_int32_int32_return$ uint64_t
-#define func_int32_uint32_int32_int32_return$ int32_t
+#define func_intptr_uint32_uint64_uint64_return$ void *
+#define func_intptr_uint64_return$ void *
+#define func_intptr_uint64_int32_return$ void *
+#define func_intptr_uint64_int32_int32_return$ void *
+#define func_intptr_uint64_int32_intptr_return$ void *
+#define func_intptr_uint64_int32_string_return$ void *
+#define func_intptr_uint64_int32_uint32_return$ void *
+#define func_intptr_uint64_int32_uint64_return$ void *
+#define func_intptr_uint64_intptr_return$ void *
+#define func_intptr_uint64_intptr_int32_return$ void *
+#define func_intptr_uint64_intptr_intptr_return$ void *
+#define func_intptr_uint64_intptr_string_return$ void *
+#define func_intptr_uint64_intptr_uint32_return$ void *
+#define func_intptr_uint64_intptr_uint64_return$ void *
+#define func_intptr_uint64_string_return$ void *
+#define func_intptr_uint64_string_int32_return$ void *
+#define func_intptr_uint64_string_intptr_return$ void *
+#define func_intptr_uint64_string_string_return$ void *
+#define func_intptr_uint64_string_uint32_return$ void *
+#define func_intptr_uint64_string_uint64_return$ void *
+#define func_intptr_uint64_uint32_return$ void *
+#define func_intptr_uint64_uint32_int32_return$ void *
+#define func_intptr_uint64_uint32_intptr_return$ void *
+#define func_intptr_uint64_uint32_string_return$ void *
+#define func_intptr_uint64_uint32_uint32_return$ void *
+#define func_intptr_uint64_uint32_uint64_return$ void *
+#define func_intptr_uint64_uint64_return$ void *
+#define func_intptr_uint64_uint64_int32_return$ void *
+#define func_intptr_uint64_uint64_intptr_return$ void *
+#define func_intptr_uint64_uint64_string_return$ void *
+#define func_intptr_uint64_uint64_uint32_return$ void *
+#define func_intptr_uint64_uint64_uint64_return$ void *
+#define func_string_return$ char *
+#define func_string_int32_return$ char *
+#define func_string_int32_int32_return$ char *
+#define func_string_int32_int32_int32_return$ char *
+#define func_string_int32_int32_intptr_return$ char *
+#define func_string_int32_int32_string_return$ char *
+#define func_string_int32_int32_uint32_return$ char *
+#define func_string_int32_int32_uint64_return$ char *
+#define func_string_int32_intptr_return$ char *
+#define func_string_int32_intptr_int32_return$ char *
+#define func_string_int32_intptr_intptr_return$ char *
+#define func_string_int32_intptr_string_return$ char *
+#define func_string_int32_intptr_uint32_return$ char *
+#define func_string_int32_intptr_uint64_return$ char *
+#define func_string_int32_string_return$ char *
+#define func_string_int32_string_int32_return$ char *
+#define func_string_int32_string_intptr_return$ char *
+#define func_string_int32_string_string_return$ char *
+#define func_string_int32_string_uint32_return$ char *
+#define func_string_int32_string_uint64_return$ char *
+#define func_string_int32_uint32_return$ char *
+#define func_string_int32_uint32_int32_return$ char *
+#define func_string_int32_uint32_intptr_return$ char *
+#define func_string_int32_uint32_string_return$ char *
+#define func_string_int32_uint32_uint32_return$ char *
+#define func_string_int32_uint32_uint64_return$ char *
+#define func_string_int32_uint64_return$ char *
+#define func_string_int32_uint64_int32_return$ char *
+#define func_string_int32_uint64_intptr_return$ char *
+#define func_string_int32_uint64_string_return$ char *
+#define func_string_int32_uint64_uint32_return$ char *
+#define func_string_int32_uint64_uint64_return$ char *
+#define func_string_intptr_return$ char *
+#define func_string_intptr_int32_return$ char *
+#define func_string_intptr_int32_int32_return$ char *
+#define func_string_intptr_int32_intptr_return$ char *
+#define func_string_intptr_int32_string_return$ char *
+#define func_string_intptr_int32_uint32_return$ char *
+#define func_string_intptr_int32_uint64_return$ char *
+#define func_string_intptr_intptr_return$ char *
+#define func_string_intptr_intptr_int32_return$ char *
+#define func_string_intptr_intptr_intptr_return$ char *
+#define func_string_intptr_intptr_string_return$ char *
+#define func_string_intptr_intptr_uint32_return$ char *
+#define func_string_intptr_intptr_uint64_return$ char *
+#define func_string_intptr_string_return$ char *
+#define func_string_intptr_string_int32_return$ char *
+#define func_string_intptr_string_intptr_return$ char *
+#define func_string_intptr_string_string_return$ char *
+#define func_string_intptr_string_uint32_return$ char *
+#define func_string_intptr_string_uint64_return$ char *
+#define func_string_intptr_uint32_return$ char *
+#define func_string_intptr_uint32_int32_return$ char *
+#define func_string_intptr_uint32_intptr_return$ char *
+#define func_string_intptr_uint32_string_return$ char *
+#define func_string_intptr_uint32_uint32_return$ char *
+#define func_string_intptr_uint32_uint64_return$ char *
+#define func_string_intptr_uint64_return$ char *
+#define func_string_intptr_uint64_int32_return$ char *
+#define func_string_intptr_uint64_intptr_return$ char *
+#define func_string_intptr_uint64_string_return$ char *
+#define func_string_intptr_uint64_uint32_return$ char *
+#define func_string_intptr_uint64_uint64_return$ char *
+#define func_string_string_return$ char *
+#define func_string_string_int32_return$ char *
+#define func_string_string_int32_int32_return$ char *
+#define func_string_string_int32_intptr_return$ char *
+#define func_string_string_int32_string_return$ char *
+#define func_string_string_int32_uint32_return$ char *
+#define func_string_string_int32_uint64_return$ char *
+#define func_string_string_intptr_return$ char *
+#define func_string_string_intptr_int32_return$ char *
+#define func_string_string_intptr_intptr_return$ char *
+#define func_string_string_intptr_string_return$ char *
+#define func_string_string_intptr_uint32_return$ char *
+#define func_string_string_intptr_uint64_return$ char *
+#define func_string_string_string_return$ char *
+#define func_string_string_string_int32_return$ char *
+#define func_string_string_string_intptr_return$ char *
+#define func_string_string_string_string_return$ char *
+#define func_string_string_string_uint32_return$ char *
+#define func_string_string_string_uint64_return$ char *
+#define func_string_string_uint32_return$ char *
+#define func_string_string_uint32_int32_return$ char *
+#define func_string_string_uint32_intptr_return$ char *
+#define func_string_string_uint32_string_return$ char *
+#define func_string_string_uint32_uint32_return$ char *
+#define func_string_string_uint32_uint64_return$ char *
+#define func_string_string_uint64_return$ char *
+#define func_string_string_uint64_int32_return$ char *
+#define func_string_string_uint64_intptr_return$ char *
+#define func_string_string_uint64_string_return$ char *
+#define func_string_string_uint64_uint32_return$ char *
+#define func_string_string_uint64_uint64_return$ char *
+#define func_string_uint32_return$ char *
+#define func_string_uint32_int32_return$ char *
 #define func_string_uint32_int32_int32_return$ char *
-#define func_uint32_uint32_int32_int32_return$ uint32_t
-#define func_intptr_uint32_int32_int32_return$ void *
-#define action_uint32_int32_string_return$ void
-#define func_uint64_uint32_int32_string_return$ uint64_t
-#define func_int32_uint32_int32_string_return$ int32_t
+#define func_string_uint32_int32_intptr_return$ char *
 #define func_string_uint32_int32_string_return$ char *
-#define func_uint32_uint32_int32_string_return$ uint32_t
-#define func_intptr_uint32_int32_string_return$ void *
-#define action_uint32_int32_uint32_return$ void
-#define func_uint64_uint32_int32_uint32_return$ uint64_t
-#define func_int32_uint32_int32_uint32_return$ int32_t
 #define func_string_uint32_int32_uint32_return$ char *
-#define func_uint32_uint32_int32_uint32_return$ uint32_t
-#define func_intptr_uint32_int32_uint32_return$ void *
-#define action_uint32_int32_intptr_return$ void
-#define func_uint64_uint32_int32_intptr_return$ uint64_t
-#define func_int32_uint32_int32_intptr_return$ int32_t
-#define func_string_uint32_int32_intptr_return$ char *
-#define func_uint32_uint32_int32_intptr_return$ uint32_t
-#define func_intptr_uint32_int32_intptr_return$ void *
-#define action_uint32_string_uint64_return$ void
-#define func_uint64_uint32_string_uint64_return$ uint64_t
-#define func_int32_uint32_string_uint64_return$ int32_t
-#define func_string_uint32_string_uint64_return$ char *
-#define func_uint32_uint32_string_uint64_return$ uint32_t
-#define func_intptr_uint32_string_uint64_return$ void *
-#define action_uint32_string_int32_return$ void
-#define func_uint64_uint32_string_int32_return$ uint64_t
-#define func_int32_uint32_string_int32_return$ int32_t
+#define func_string_uint32_int32_uint64_return$ char *
+#define func_string_uint32_intptr_return$ char *
+#define func_string_uint32_intptr_int32_return$ char *
+#define func_string_uint32_intptr_intptr_return$ char *
+#define func_string_uint32_intptr_string_return$ char *
+#define func_string_uint32_intptr_uint32_return$ char *
+#define func_string_uint32_intptr_uint64_return$ char *
+#define func_string_uint32_string_return$ char *
 #define func_string_uint32_string_int32_return$ char *
-#define func_uint32_uint32_string_int32_return$ uint32_t
-#define func_intptr_uint32_string_int32_return$ void *
-#define action_uint32_string_string_return$ void
-#define func_uint64_uint32_string_string_return$ uint64_t
-#define func_int32_uint32_string_string_return$ int32_t
+#define func_string_uint32_string_intptr_return$ char *
 #define func_string_uint32_string_string_return$ char *
-#define func_uint32_uint32_string_string_return$ uint32_t
-#define func_intptr_uint32_string_string_return$ void *
-#define action_uint32_string_uint32_return$ void
-#define func_uint64_uint32_string_uint32_return$ uint64_t
-#define func_int32_uint32_string_uint32_return$ int32_t
 #define func_string_uint32_string_uint32_return$ char *
-#define func_uint32_uint32_string_uint32_return$ uint32_t
-#define func_intptr_uint32_string_uint32_return$ void *
-#define action_uint32_string_intptr_return$ void
-#define func_uint64_uint32_string_intptr_return$ uint64_t
-#define func_int32_uint32_string_intptr_return$ int32_t
-#define func_string_uint32_string_intptr_return$ char *
-#define func_uint32_uint32_string_intptr_return$ uint32_t
-#define func_intptr_uint32_string_intptr_return$ void *
-#define action_uint32_uint32_uint64_return$ void
-#define func_uint64_uint32_uint32_uint64_return$ uint64_t
-#define func_int32_uint32_uint32_uint64_return$ int32_t
-#define func_string_uint32_uint32_uint64_return$ char *
-#define func_uint32_uint32_uint32_uint64_return$ uint32_t
-#define func_intptr_uint32_uint32_uint64_return$ void *
-#define action_uint32_uint32_int32_return$ void
-#define func_uint64_uint32_uint32_int32_return$ uint64_t
-#define func_int32_uint32_uint32_int32_return$ int32_t
+#define func_string_uint32_string_uint64_return$ char *
+#define func_string_uint32_uint32_return$ char *
 #define func_string_uint32_uint32_int32_return$ char *
-#define func_uint32_uint32_uint32_int32_return$ uint32_t
-#define func_intptr_uint32_uint32_int32_return$ void *
-#define action_uint32_uint32_string_return$ void
-#define func_uint64_uint32_uint32_string_return$ uint64_t
-#define func_int32_uint32_uint32_string_return$ int32_t
+#define func_string_uint32_uint32_intptr_return$ char *
 #define func_string_uint32_uint32_string_return$ char *
-#define func_uint32_uint32_uint32_string_return$ uint32_t
-#define func_intptr_uint32_uint32_string_return$ void *
-#define action_uint32_uint32_uint32_return$ void
-#define func_uint64_uint32_uint32_uint32_return$ uint64_t
-#define func_int32_uint32_uint32_uint32_return$ int32_t
 #define func_string_uint32_uint32_uint32_return$ char *
-#define func_uint32_uint32_uint32_uint32_return$ uint32_t
-#define func_intptr_uint32_uint32_uint32_return$ void *
-#define action_uint32_uint32_intptr_return$ void
-#define func_uint64_uint32_uint32_intptr_return$ uint64_t
-#define func_int32_uint32_uint32_intptr_return$ int32_t
-#define func_string_uint32_uint32_intptr_return$ char *
-#define func_uint32_uint32_uint32_intptr_return$ uint32_t
-#define func_intptr_uint32_uint32_intptr_return$ void *
-#define action_uint32_intptr_uint64_return$ void
-#define func_uint64_uint32_intptr_uint64_return$ uint64_t
-#define func_int32_uint32_intptr_uint64_return$ int32_t
-#define func_string_uint32_intptr_uint64_return$ char *
-#define func_uint32_uint32_intptr_uint64_return$ uint32_t
-#define func_intptr_uint32_intptr_uint64_return$ void *
-#define action_uint32_intptr_int32_return$ void
-#define func_uint64_uint32_intptr_int32_return$ uint64_t
-#define func_int32_uint32_intptr_int32_return$ int32_t
-#define func_string_uint32_intptr_int32_return$ char *
-#define func_uint32_uint32_intptr_int32_return$ uint32_t
-#define func_intptr_uint32_intptr_int32_return$ void *
-#define action_uint32_intptr_string_return$ void
-#define func_uint64_uint32_intptr_string_return$ uint64_t
-#define func_int32_uint32_intptr_string_return$ int32_t
-#define func_string_uint32_intptr_string_return$ char *
-#define func_uint32_uint32_intptr_string_return$ uint32_t
-#define func_intptr_uint32_intptr_string_return$ void *
-#define action_uint32_intptr_uint32_return$ void
-#define func_uint64_uint32_intptr_uint32_return$ uint64_t
-#define func_int32_uint32_intptr_uint32_return$ int32_t
-#define func_string_uint32_intptr_uint32_return$ char *
-#define func_uint32_uint32_intptr_uint32_return$ uint32_t
-#define func_intptr_uint32_intptr_uint32_return$ void *
-#define action_uint32_intptr_intptr_return$ void
-#define func_uint64_uint32_intptr_intptr_return$ uint64_t
-#define func_int32_uint32_intptr_intptr_return$ int32_t
-#define func_string_uint32_intptr_intptr_return$ char *
-#define func_uint32_uint32_intptr_intptr_return$ uint32_t
-#define func_intptr_uint32_intptr_intptr_return$ void *
-#define action_intptr_uint64_uint64_return$ void
-#define func_uint64_intptr_uint64_uint64_return$ uint64_t
-#define func_int32_intptr_uint64_uint64_return$ int32_t
-#define func_string_intptr_uint64_uint64_return$ char *
-#define func_uint32_intptr_uint64_uint64_return$ uint32_t
-#define func_intptr_intptr_uint64_uint64_return$ void *
-#define action_intptr_uint64_int32_return$ void
-#define func_uint64_intptr_uint64_int32_return$ uint64_t
-#define func_int32_intptr_uint64_int32_return$ int32_t
-#define func_string_intptr_uint64_int32_return$ char *
-#define func_uint32_intptr_uint64_int32_return$ uint32_t
-#define func_intptr_intptr_uint64_int32_return$ void *
-#define action_intptr_uint64_string_return$ void
-#define func_uint64_intptr_uint64_string_return$ uint64_t
-#define func_int32_intptr_uint64_string_return$ int32_t
-#define func_string_intptr_uint64_string_return$ char *
-#define func_uint32_intptr_uint64_string_return$ uint32_t
-#define func_intptr_intptr_uint64_string_return$ void *
-#define action_intptr_uint64_uint32_return$ void
-#define func_uint64_intptr_uint64_uint32_return$ uint64_t
-#define func_int32_intptr_uint64_uint32_return$ int32_t
-#define func_string_intptr_uint64_uint32_return$ char *
-#define func_uint32_intptr_uint64_uint32_return$ uint32_t
-#define func_intptr_intptr_uint64_uint32_return$ void *
-#define action_intptr_uint64_intptr_return$ void
-#define func_uint64_intptr_uint64_intptr_return$ uint64_t
-#define func_int32_intptr_uint64_intptr_return$ int32_t
-#define func_string_intptr_uint64_intptr_return$ char *
-#define func_uint32_intptr_uint64_intptr_return$ uint32_t
-#define func_intptr_intptr_uint64_intptr_return$ void *
-#define action_intptr_int32_uint64_return$ void
-#define func_uint64_intptr_int32_uint64_return$ uint64_t
-#define func_int32_intptr_int32_uint64_return$ int32_t
-#define func_string_intptr_int32_uint64_return$ char *
-#define func_uint32_intptr_int32_uint64_return$ uint32_t
-#define func_intptr_intptr_int32_uint64_return$ void *
-#define action_intptr_int32_int32_return$ void
-#define func_uint64_intptr_int32_int32_return$ uint64_t
-#define func_int32_intptr_int32_int32_return$ int32_t
-#define func_string_intptr_int32_int32_return$ char *
+#define func_string_uint32_uint32_uint64_return$ char *
+#define func_string_uint32_uint64_return$ char *
+#define func_string_uint32_uint64_int32_return$ char *
+#define func_string_uint32_uint64_intptr_return$ char *
+#define func_string_uint32_uint64_string_return$ char *
+#define func_string_uint32_uint64_uint32_return$ char *
+#define func_string_uint32_uint64_uint64_return$ char *
+#define func_string_uint64_return$ char *
+#define func_string_uint64_int32_return$ char *
+#define func_string_uint64_int32_int32_return$ char *
+#define func_string_uint64_int32_intptr_return$ char *
+#define func_string_uint64_int32_string_return$ char *
+#define func_string_uint64_int32_uint32_return$ char *
+#define func_string_uint64_int32_uint64_return$ char *
+#define func_string_uint64_intptr_return$ char *
+#define func_string_uint64_intptr_int32_return$ char *
+#define func_string_uint64_intptr_intptr_return$ char *
+#define func_string_uint64_intptr_string_return$ char *
+#define func_string_uint64_intptr_uint32_return$ char *
+#define func_string_uint64_intptr_uint64_return$ char *
+#define func_string_uint64_string_return$ char *
+#define func_string_uint64_string_int32_return$ char *
+#define func_string_uint64_string_intptr_return$ char *
+#define func_string_uint64_string_string_return$ char *
+#define func_string_uint64_string_uint32_return$ char *
+#define func_string_uint64_string_uint64_return$ char *
+#define func_string_uint64_uint32_return$ char *
+#define func_string_uint64_uint32_int32_return$ char *
+#define func_string_uint64_uint32_intptr_return$ char *
+#define func_string_uint64_uint32_string_return$ char *
+#define func_string_uint64_uint32_uint32_return$ char *
+#define func_string_uint64_uint32_uint64_return$ char *
+#define func_string_uint64_uint64_return$ char *
+#define func_string_uint64_uint64_int32_return$ char *
+#define func_string_uint64_uint64_intptr_return$ char *
+#define func_string_uint64_uint64_string_return$ char *
+#define func_string_uint64_uint64_uint32_return$ char *
+#define func_string_uint64_uint64_uint64_return$ char *
+#define func_uint32_return$ uint32_t
+#define func_uint32_int32_return$ uint32_t
+#define func_uint32_int32_int32_return$ uint32_t
+#define func_uint32_int32_int32_int32_return$ uint32_t
+#define func_uint32_int32_int32_intptr_return$ uint32_t
+#define func_uint32_int32_int32_string_return$ uint32_t
+#define func_uint32_int32_int32_uint32_return$ uint32_t
+#define func_uint32_int32_int32_uint64_return$ uint32_t
+#define func_uint32_int32_intptr_return$ uint32_t
+#define func_uint32_int32_intptr_int32_return$ uint32_t
+#define func_uint32_int32_intptr_intptr_return$ uint32_t
+#define func_uint32_int32_intptr_string_return$ uint32_t
+#define func_uint32_int32_intptr_uint32_return$ uint32_t
+#define func_uint32_int32_intptr_uint64_return$ uint32_t
+#define func_uint32_int32_string_return$ uint32_t
+#define func_uint32_int32_string_int32_return$ uint32_t
+#define func_uint32_int32_string_intptr_return$ uint32_t
+#define func_uint32_int32_string_string_return$ uint32_t
+#define func_uint32_int32_string_uint32_return$ uint32_t
+#define func_uint32_int32_string_uint64_return$ uint32_t
+#define func_uint32_int32_uint32_return$ uint32_t
+#define func_uint32_int32_uint32_int32_return$ uint32_t
+#define func_uint32_int32_uint32_intptr_return$ uint32_t
+#define func_uint32_int32_uint32_string_return$ uint32_t
+#define func_uint32_int32_uint32_uint32_return$ uint32_t
+#define func_uint32_int32_uint32_uint64_return$ uint32_t
+#define func_uint32_int32_uint64_return$ uint32_t
+#define func_uint32_int32_uint64_int32_return$ uint32_t
+#define func_uint32_int32_uint64_intptr_return$ uint32_t
+#define func_uint32_int32_uint64_string_return$ uint32_t
+#define func_uint32_int32_uint64_uint32_return$ uint32_t
+#define func_uint32_int32_uint64_uint64_return$ uint32_t
+#define func_uint32_intptr_return$ uint32_t
+#define func_uint32_intptr_int32_return$ uint32_t
 #define func_uint32_intptr_int32_int32_return$ uint32_t
-#define func_intptr_intptr_int32_int32_return$ void *
-#define action_intptr_int32_string_return$ void
-#define func_uint64_intptr_int32_string_return$ uint64_t
-#define func_int32_intptr_int32_string_return$ int32_t
-#define func_string_intptr_int32_string_return$ char *
+#define func_uint32_intptr_int32_intptr_return$ uint32_t
 #define func_uint32_intptr_int32_string_return$ uint32_t
-#define func_intptr_intptr_int32_string_return$ void *
-#define action_intptr_int32_uint32_return$ void
-#define func_uint64_intptr_int32_uint32_return$ uint64_t
-#define func_int32_intptr_int32_uint32_return$ int32_t
-#define func_string_intptr_int32_uint32_return$ char *
 #define func_uint32_intptr_int32_uint32_return$ uint32_t
-#define func_intptr_intptr_int32_uint32_return$ void *
-#define action_intptr_int32_intptr_return$ void
-#define func_uint64_intptr_int32_intptr_return$ uint64_t
-#define func_int32_intptr_int32_intptr_return$ int32_t
-#define func_string_intptr_int32_intptr_return$ char *
-#define func_uint32_intptr_int32_intptr_return$ uint32_t
-#define func_intptr_intptr_int32_intptr_return$ void *
-#define action_intptr_string_uint64_return$ void
-#define func_uint64_intptr_string_uint64_return$ uint64_t
-#define func_int32_intptr_string_uint64_return$ int32_t
-#define func_string_intptr_string_uint64_return$ char *
-#define func_uint32_intptr_string_uint64_return$ uint32_t
-#define func_intptr_intptr_string_uint64_return$ void *
-#define action_intptr_string_int32_return$ void
-#define func_uint64_intptr_string_int32_return$ uint64_t
-#define func_int32_intptr_string_int32_return$ int32_t
-#define func_string_intptr_string_int32_return$ char *
+#define func_uint32_intptr_int32_uint64_return$ uint32_t
+#define func_uint32_intptr_intptr_return$ uint32_t
+#define func_uint32_intptr_intptr_int32_return$ uint32_t
+#define func_uint32_intptr_intptr_intptr_return$ uint32_t
+#define func_uint32_intptr_intptr_string_return$ uint32_t
+#define func_uint32_intptr_intptr_uint32_return$ uint32_t
+#define func_uint32_intptr_intptr_uint64_return$ uint32_t
+#define func_uint32_intptr_string_return$ uint32_t
 #define func_uint32_intptr_string_int32_return$ uint32_t
-#define func_intptr_intptr_string_int32_return$ void *
-#define action_intptr_string_string_return$ void
-#define func_uint64_intptr_string_string_return$ uint64_t
-#define func_int32_intptr_string_string_return$ int32_t
-#define func_string_intptr_string_string_return$ char *
+#define func_uint32_intptr_string_intptr_return$ uint32_t
 #define func_uint32_intptr_string_string_return$ uint32_t
-#define func_intptr_intptr_string_string_return$ void *
-#define action_intptr_string_uint32_return$ void
-#define func_uint64_intptr_string_uint32_return$ uint64_t
-#define func_int32_intptr_string_uint32_return$ int32_t
-#define func_string_intptr_string_uint32_return$ char *
 #define func_uint32_intptr_string_uint32_return$ uint32_t
-#define func_intptr_intptr_string_uint32_return$ void *
-#define action_intptr_string_intptr_return$ void
-#define func_uint64_intptr_string_intptr_return$ uint64_t
-#define func_int32_intptr_string_intptr_return$ int32_t
-#define func_string_intptr_string_intptr_return$ char *
-#define func_uint32_intptr_string_intptr_return$ uint32_t
-#define func_intptr_intptr_string_intptr_return$ void *
-#define action_intptr_uint32_uint64_return$ void
-#define func_uint64_intptr_uint32_uint64_return$ uint64_t
-#define func_int32_intptr_uint32_uint64_return$ int32_t
-#define func_string_intptr_uint32_uint64_return$ char *
-#define func_uint32_intptr_uint32_uint64_return$ uint32_t
-#define func_intptr_intptr_uint32_uint64_return$ void *
-#define action_intptr_uint32_int32_return$ void
-#define func_uint64_intptr_uint32_int32_return$ uint64_t
-#define func_int32_intptr_uint32_int32_return$ int32_t
-#define func_string_intptr_uint32_int32_return$ char *
+#define func_uint32_intptr_string_uint64_return$ uint32_t
+#define func_uint32_intptr_uint32_return$ uint32_t
 #define func_uint32_intptr_uint32_int32_return$ uint32_t
-#define func_intptr_intptr_uint32_int32_return$ void *
-#define action_intptr_uint32_string_return$ void
-#define func_uint64_intptr_uint32_string_return$ uint64_t
-#define func_int32_intptr_uint32_string_return$ int32_t
-#define func_string_intptr_uint32_string_return$ char *
+#define func_uint32_intptr_uint32_intptr_return$ uint32_t
 #define func_uint32_intptr_uint32_string_return$ uint32_t
-#define func_intptr_intptr_uint32_string_return$ void *
-#define action_intptr_uint32_uint32_return$ void
-#define func_uint64_intptr_uint32_uint32_return$ uint64_t
-#define func_int32_intptr_uint32_uint32_return$ int32_t
-#define func_string_intptr_uint32_uint32_return$ char *
 #define func_uint32_intptr_uint32_uint32_return$ uint32_t
-#define func_intptr_intptr_uint32_uint32_return$ void *
-#define action_intptr_uint32_intptr_return$ void
-#define func_uint64_intptr_uint32_intptr_return$ uint64_t
-#define func_int32_intptr_uint32_intptr_return$ int32_t
-#define func_string_intptr_uint32_intptr_return$ char *
-#define func_uint32_intptr_uint32_intptr_return$ uint32_t
-#define func_intptr_intptr_uint32_intptr_return$ void *
-#define action_intptr_intptr_uint64_return$ void
-#define func_uint64_intptr_intptr_uint64_return$ uint64_t
-#define func_int32_intptr_intptr_uint64_return$ int32_t
-#define func_string_intptr_intptr_uint64_return$ char *
-#define func_uint32_intptr_intptr_uint64_return$ uint32_t
-#define func_intptr_intptr_intptr_uint64_return$ void *
-#define action_intptr_intptr_int32_return$ void
-#define func_uint64_intptr_intptr_int32_return$ uint64_t
-#define func_int32_intptr_intptr_int32_return$ int32_t
-#define func_string_intptr_intptr_int32_return$ char *
-#define func_uint32_intptr_intptr_int32_return$ uint32_t
-#define func_intptr_intptr_intptr_int32_return$ void *
-#define action_intptr_intptr_string_return$ void
-#define func_uint64_intptr_intptr_string_return$ uint64_t
-#define func_int32_intptr_intptr_string_return$ int32_t
-#define func_string_intptr_intptr_string_return$ char *
-#define func_uint32_intptr_intptr_string_return$ uint32_t
-#define func_intptr_intptr_intptr_string_return$ void *
-#define action_intptr_intptr_uint32_return$ void
-#define func_uint64_intptr_intptr_uint32_return$ uint64_t
-#define func_int32_intptr_intptr_uint32_return$ int32_t
-#define func_string_intptr_intptr_uint32_return$ char *
-#define func_uint32_intptr_intptr_uint32_return$ uint32_t
-#define func_intptr_intptr_intptr_uint32_return$ void *
-#define action_intptr_intptr_intptr_return$ void
+#define func_uint32_intptr_uint32_uint64_return$ uint32_t
+#define func_uint32_intptr_uint64_return$ uint32_t
+#define func_uint32_intptr_uint64_int32_return$ uint32_t
+#define func_uint32_intptr_uint64_intptr_return$ uint32_t
+#define func_uint32_intptr_uint64_string_return$ uint32_t
+#define func_uint32_intptr_uint64_uint32_return$ uint32_t
+#define func_uint32_intptr_uint64_uint64_return$ uint32_t
+#define func_uint32_string_return$ uint32_t
+#define func_uint32_string_int32_return$ uint32_t
+#define func_uint32_string_int32_int32_return$ uint32_t
+#define func_uint32_string_int32_intptr_return$ uint32_t
+#define func_uint32_string_int32_string_return$ uint32_t
+#define func_uint32_string_int32_uint32_return$ uint32_t
+#define func_uint32_string_int32_uint64_return$ uint32_t
+#define func_uint32_string_intptr_return$ uint32_t
+#define func_uint32_string_intptr_int32_return$ uint32_t
+#define func_uint32_string_intptr_intptr_return$ uint32_t
+#define func_uint32_string_intptr_string_return$ uint32_t
+#define func_uint32_string_intptr_uint32_return$ uint32_t
+#define func_uint32_string_intptr_uint64_return$ uint32_t
+#define func_uint32_string_string_return$ uint32_t
+#define func_uint32_string_string_int32_return$ uint32_t
+#define func_uint32_string_string_intptr_return$ uint32_t
+#define func_uint32_string_string_string_return$ uint32_t
+#define func_uint32_string_string_uint32_return$ uint32_t
+#define func_uint32_string_string_uint64_return$ uint32_t
+#define func_uint32_string_uint32_return$ uint32_t
+#define func_uint32_string_uint32_int32_return$ uint32_t
+#define func_uint32_string_uint32_intptr_return$ uint32_t
+#define func_uint32_string_uint32_string_return$ uint32_t
+#define func_uint32_string_uint32_uint32_return$ uint32_t
+#define func_uint32_string_uint32_uint64_return$ uint32_t
+#define func_uint32_string_uint64_return$ uint32_t
+#define func_uint32_string_uint64_int32_return$ uint32_t
+#define func_uint32_string_uint64_intptr_return$ uint32_t
+#define func_uint32_string_uint64_string_return$ uint32_t
+#define func_uint32_string_uint64_uint32_return$ uint32_t
+#define func_uint32_string_uint64_uint64_return$ uint32_t
+#define func_uint32_uint32_return$ uint32_t
+#define func_uint32_uint32_int32_return$ uint32_t
+#define func_uint32_uint32_int32_int32_return$ uint32_t
+#define func_uint32_uint32_int32_intptr_return$ uint32_t
+#define func_uint32_uint32_int32_string_return$ uint32_t
+#define func_uint32_uint32_int32_uint32_return$ uint32_t
+#define func_uint32_uint32_int32_uint64_return$ uint32_t
+#define func_uint32_uint32_intptr_return$ uint32_t
+#define func_uint32_uint32_intptr_int32_return$ uint32_t
+#define func_uint32_uint32_intptr_intptr_return$ uint32_t
+#define func_uint32_uint32_intptr_string_return$ uint32_t
+#define func_uint32_uint32_intptr_uint32_return$ uint32_t
+#define func_uint32_uint32_intptr_uint64_return$ uint32_t
+#define func_uint32_uint32_string_return$ uint32_t
+#define func_uint32_uint32_string_int32_return$ uint32_t
+#define func_uint32_uint32_string_intptr_return$ uint32_t
+#define func_uint32_uint32_string_string_return$ uint32_t
+#define func_uint32_uint32_string_uint32_return$ uint32_t
+#define func_uint32_uint32_string_uint64_return$ uint32_t
+#define func_uint32_uint32_uint32_return$ uint32_t
+#define func_uint32_uint32_uint32_int32_return$ uint32_t
+#define func_uint32_uint32_uint32_intptr_return$ uint32_t
+#define func_uint32_uint32_uint32_string_return$ uint32_t
+#define func_uint32_uint32_uint32_uint32_return$ uint32_t
+#define func_uint32_uint32_uint32_uint64_return$ uint32_t
+#define func_uint32_uint32_uint64_return$ uint32_t
+#define func_uint32_uint32_uint64_int32_return$ uint32_t
+#define func_uint32_uint32_uint64_intptr_return$ uint32_t
+#define func_uint32_uint32_uint64_string_return$ uint32_t
+#define func_uint32_uint32_uint64_uint32_return$ uint32_t
+#define func_uint32_uint32_uint64_uint64_return$ uint32_t
+#define func_uint32_uint64_return$ uint32_t
+#define func_uint32_uint64_int32_return$ uint32_t
+#define func_uint32_uint64_int32_int32_return$ uint32_t
+#define func_uint32_uint64_int32_intptr_return$ uint32_t
+#define func_uint32_uint64_int32_string_return$ uint32_t
+#define func_uint32_uint64_int32_uint32_return$ uint32_t
+#define func_uint32_uint64_int32_uint64_return$ uint32_t
+#define func_uint32_uint64_intptr_return$ uint32_t
+#define func_uint32_uint64_intptr_int32_return$ uint32_t
+#define func_uint32_uint64_intptr_intptr_return$ uint32_t
+#define func_uint32_uint64_intptr_string_return$ uint32_t
+#define func_uint32_uint64_intptr_uint32_return$ uint32_t
+#define func_uint32_uint64_intptr_uint64_return$ uint32_t
+#define func_uint32_uint64_string_return$ uint32_t
+#define func_uint32_uint64_string_int32_return$ uint32_t
+#define func_uint32_uint64_string_intptr_return$ uint32_t
+#define func_uint32_uint64_string_string_return$ uint32_t
+#define func_uint32_uint64_string_uint32_return$ uint32_t
+#define func_uint32_uint64_string_uint64_return$ uint32_t
+#define func_uint32_uint64_uint32_return$ uint32_t
+#define func_uint32_uint64_uint32_int32_return$ uint32_t
+#define func_uint32_uint64_uint32_intptr_return$ uint32_t
+#define func_uint32_uint64_uint32_string_return$ uint32_t
+#define func_uint32_uint64_uint32_uint32_return$ uint32_t
+#define func_uint32_uint64_uint32_uint64_return$ uint32_t
+#define func_uint32_uint64_uint64_return$ uint32_t
+#define func_uint32_uint64_uint64_int32_return$ uint32_t
+#define func_uint32_uint64_uint64_intptr_return$ uint32_t
+#define func_uint32_uint64_uint64_string_return$ uint32_t
+#define func_uint32_uint64_uint64_uint32_return$ uint32_t
+#define func_uint32_uint64_uint64_uint64_return$ uint32_t
+#define func_uint64_return$ uint64_t
+#define func_uint64_int32_return$ uint64_t
+#define func_uint64_int32_int32_return$ uint64_t
+#define func_uint64_int32_int32_int32_return$ uint64_t
+#define func_uint64_int32_int32_intptr_return$ uint64_t
+#define func_uint64_int32_int32_string_return$ uint64_t
+#define func_uint64_int32_int32_uint32_return$ uint64_t
+#define func_uint64_int32_int32_uint64_return$ uint64_t
+#define func_uint64_int32_intptr_return$ uint64_t
+#define func_uint64_int32_intptr_int32_return$ uint64_t
+#define func_uint64_int32_intptr_intptr_return$ uint64_t
+#define func_uint64_int32_intptr_string_return$ uint64_t
+#define func_uint64_int32_intptr_uint32_return$ uint64_t
+#define func_uint64_int32_intptr_uint64_return$ uint64_t
+#define func_uint64_int32_string_return$ uint64_t
+#define func_uint64_int32_string_int32_return$ uint64_t
+#define func_uint64_int32_string_intptr_return$ uint64_t
+#define func_uint64_int32_string_string_return$ uint64_t
+#define func_uint64_int32_string_uint32_return$ uint64_t
+#define func_uint64_int32_string_uint64_return$ uint64_t
+#define func_uint64_int32_uint32_return$ uint64_t
+#define func_uint64_int32_uint32_int32_return$ uint64_t
+#define func_uint64_int32_uint32_intptr_return$ uint64_t
+#define func_uint64_int32_uint32_string_return$ uint64_t
+#define func_uint64_int32_uint32_uint32_return$ uint64_t
+#define func_uint64_int32_uint32_uint64_return$ uint64_t
+#define func_uint64_int32_uint64_return$ uint64_t
+#define func_uint64_int32_uint64_int32_return$ uint64_t
+#define func_uint64_int32_uint64_intptr_return$ uint64_t
+#define func_uint64_int32_uint64_string_return$ uint64_t
+#define func_uint64_int32_uint64_uint32_return$ uint64_t
+#define func_uint64_int32_uint64_uint64_return$ uint64_t
+#define func_uint64_intptr_return$ uint64_t
+#define func_uint64_intptr_int32_return$ uint64_t
+#define func_uint64_intptr_int32_int32_return$ uint64_t
+#define func_uint64_intptr_int32_intptr_return$ uint64_t
+#define func_uint64_intptr_int32_string_return$ uint64_t
+#define func_uint64_intptr_int32_uint32_return$ uint64_t
+#define func_uint64_intptr_int32_uint64_return$ uint64_t
+#define func_uint64_intptr_intptr_return$ uint64_t
+#define func_uint64_intptr_intptr_int32_return$ uint64_t
 #define func_uint64_intptr_intptr_intptr_return$ uint64_t
-#define func_int32_intptr_intptr_intptr_return$ int32_t
-#define func_string_intptr_intptr_intptr_return$ char *
-#define func_uint32_intptr_intptr_intptr_return$ uint32_t
-#define func_intptr_intptr_intptr_intptr_return$ void *
-#define action_return$ void
-#define func_uint64_return$ uint64_t
-#define func_int32_return$ int32_t
-#define func_string_return$ char *
-#define func_uint32_return$ uint32_t
-#define func_intptr_return$ void *
-#define action_uint64_keyword$
-#define func_uint64_uint64_keyword$ return
-#define func_int32_uint64_keyword$ return
-#define func_string_uint64_keyword$ return
-#define func_uint32_uint64_keyword$ return
-#define func_intptr_uint64_keyword$ return
+#define func_uint64_intptr_intptr_string_return$ uint64_t
+#define func_uint64_intptr_intptr_uint32_return$ uint64_t
+#define func_uint64_intptr_intptr_uint64_return$ uint64_t
+#define func_uint64_intptr_string_return$ uint64_t
+#define func_uint64_intptr_string_int32_return$ uint64_t
+#define func_uint64_intptr_string_intptr_return$ uint64_t
+#define func_uint64_intptr_string_string_return$ uint64_t
+#define func_uint64_intptr_string_uint32_return$ uint64_t
+#define func_uint64_intptr_string_uint64_return$ uint64_t
+#define func_uint64_intptr_uint32_return$ uint64_t
+#define func_uint64_intptr_uint32_int32_return$ uint64_t
+#define func_uint64_intptr_uint32_intptr_return$ uint64_t
+#define func_uint64_intptr_uint32_string_return$ uint64_t
+#define func_uint64_intptr_uint32_uint32_return$ uint64_t
+#define func_uint64_intptr_uint32_uint64_return$ uint64_t
+#define func_uint64_intptr_uint64_return$ uint64_t
+#define func_uint64_intptr_uint64_int32_return$ uint64_t
+#define func_uint64_intptr_uint64_intptr_return$ uint64_t
+#define func_uint64_intptr_uint64_string_return$ uint64_t
+#define func_uint64_intptr_uint64_uint32_return$ uint64_t
+#define func_uint64_intptr_uint64_uint64_return$ uint64_t
+#define func_uint64_string_return$ uint64_t
+#define func_uint64_string_int32_return$ uint64_t
+#define func_uint64_string_int32_int32_return$ uint64_t
+#define func_uint64_string_int32_intptr_return$ uint64_t
+#define func_uint64_string_int32_string_return$ uint64_t
+#define func_uint64_string_int32_uint32_return$ uint64_t
+#define func_uint64_string_int32_uint64_return$ uint64_t
+#define func_uint64_string_intptr_return$ uint64_t
+#define func_uint64_string_intptr_int32_return$ uint64_t
+#define func_uint64_string_intptr_intptr_return$ uint64_t
+#define func_uint64_string_intptr_string_return$ uint64_t
+#define func_uint64_string_intptr_uint32_return$ uint64_t
+#define func_uint64_string_intptr_uint64_return$ uint64_t
+#define func_uint64_string_string_return$ uint64_t
+#define func_uint64_string_string_int32_return$ uint64_t
+#define func_uint64_string_string_intptr_return$ uint64_t
+#define func_uint64_string_string_string_return$ uint64_t
+#define func_uint64_string_string_uint32_return$ uint64_t
+#define func_uint64_string_string_uint64_return$ uint64_t
+#define func_uint64_string_uint32_return$ uint64_t
+#define func_uint64_string_uint32_int32_return$ uint64_t
+#define func_uint64_string_uint32_intptr_return$ uint64_t
+#define func_uint64_string_uint32_string_return$ uint64_t
+#define func_uint64_string_uint32_uint32_return$ uint64_t
+#define func_uint64_string_uint32_uint64_return$ uint64_t
+#define func_uint64_string_uint64_return$ uint64_t
+#define func_uint64_string_uint64_int32_return$ uint64_t
+#define func_uint64_string_uint64_intptr_return$ uint64_t
+#define func_uint64_string_uint64_string_return$ uint64_t
+#define func_uint64_string_uint64_uint32_return$ uint64_t
+#define func_uint64_string_uint64_uint64_return$ uint64_t
+#define func_uint64_uint32_return$ uint64_t
+#define func_uint64_uint32_int32_return$ uint64_t
+#define func_uint64_uint32_int32_int32_return$ uint64_t
+#define func_uint64_uint32_int32_intptr_return$ uint64_t
+#define func_uint64_uint32_int32_string_return$ uint64_t
+#define func_uint64_uint32_int32_uint32_return$ uint64_t
+#define func_uint64_uint32_int32_uint64_return$ uint64_t
+#define func_uint64_uint32_intptr_return$ uint64_t
+#define func_uint64_uint32_intptr_int32_return$ uint64_t
+#define func_uint64_uint32_intptr_intptr_return$ uint64_t
+#define func_uint64_uint32_intptr_string_return$ uint64_t
+#define func_uint64_uint32_intptr_uint32_return$ uint64_t
+#define func_uint64_uint32_intptr_uint64_return$ uint64_t
+#define func_uint64_uint32_string_return$ uint64_t
+#define func_uint64_uint32_string_int32_return$ uint64_t
+#define func_uint64_uint32_string_intptr_return$ uint64_t
+#define func_uint64_uint32_string_string_return$ uint64_t
+#define func_uint64_uint32_string_uint32_return$ uint64_t
+#define func_uint64_uint32_string_uint64_return$ uint64_t
+#define func_uint64_uint32_uint32_return$ uint64_t
+#define func_uint64_uint32_uint32_int32_return$ uint64_t
+#define func_uint64_uint32_uint32_intptr_return$ uint64_t
+#define func_uint64_uint32_uint32_string_return$ uint64_t
+#define func_uint64_uint32_uint32_uint32_return$ uint64_t
+#define func_uint64_uint32_uint32_uint64_return$ uint64_t
+#define func_uint64_uint32_uint64_return$ uint64_t
+#define func_uint64_uint32_uint64_int32_return$ uint64_t
+#define func_uint64_uint32_uint64_intptr_return$ uint64_t
+#define func_uint64_uint32_uint64_string_return$ uint64_t
+#define func_uint64_uint32_uint64_uint32_return$ uint64_t
+#define func_uint64_uint32_uint64_uint64_return$ uint64_t
+#define func_uint64_uint64_return$ uint64_t
+#define func_uint64_uint64_int32_return$ uint64_t
+#define func_uint64_uint64_int32_int32_return$ uint64_t
+#define func_uint64_uint64_int32_intptr_return$ uint64_t
+#define func_uint64_uint64_int32_string_return$ uint64_t
+#define func_uint64_uint64_int32_uint32_return$ uint64_t
+#define func_uint64_uint64_int32_uint64_return$ uint64_t
+#define func_uint64_uint64_intptr_return$ uint64_t
+#define func_uint64_uint64_intptr_int32_return$ uint64_t
+#define func_uint64_uint64_intptr_intptr_return$ uint64_t
+#define func_uint64_uint64_intptr_string_return$ uint64_t
+#define func_uint64_uint64_intptr_uint32_return$ uint64_t
+#define func_uint64_uint64_intptr_uint64_return$ uint64_t
+#define func_uint64_uint64_string_return$ uint64_t
+#define func_uint64_uint64_string_int32_return$ uint64_t
+#define func_uint64_uint64_string_intptr_return$ uint64_t
+#define func_uint64_uint64_string_string_return$ uint64_t
+#define func_uint64_uint64_string_uint32_return$ uint64_t
+#define func_uint64_uint64_string_uint64_return$ uint64_t
+#define func_uint64_uint64_uint32_return$ uint64_t
+#define func_uint64_uint64_uint32_int32_return$ uint64_t
+#define func_uint64_uint64_uint32_intptr_return$ uint64_t
+#define func_uint64_uint64_uint32_string_return$ uint64_t
+#define func_uint64_uint64_uint32_uint32_return$ uint64_t
+#define func_uint64_uint64_uint32_uint64_return$ uint64_t
+#define func_uint64_uint64_uint64_return$ uint64_t
+#define func_uint64_uint64_uint64_int32_return$ uint64_t
+#define func_uint64_uint64_uint64_intptr_return$ uint64_t
+#define func_uint64_uint64_uint64_string_return$ uint64_t
+#define func_uint64_uint64_uint64_uint32_return$ uint64_t
+#define func_uint64_uint64_uint64_uint64_return$ uint64_t
+#define action_keyword$
 #define action_int32_keyword$
-#define func_uint64_int32_keyword$ return
-#define func_int32_int32_keyword$ return
-#define func_string_int32_keyword$ return
-#define func_uint32_int32_keyword$ return
-#define func_intptr_int32_keyword$ return
-#define action_string_keyword$
-#define func_uint64_string_keyword$ return
-#define func_int32_string_keyword$ return
-#define func_string_string_keyword$ return
-#define func_uint32_string_keyword$ return
-#define func_intptr_string_keyword$ return
-#define action_uint32_keyword$
-#define func_uint64_uint32_keyword$ return
-#define func_int32_uint32_keyword$ return
-#define func_string_uint32_keyword$ return
-#define func_uint32_uint32_keyword$ return
-#define func_intptr_uint32_keyword$ return
+#define action_int32_int32_keyword$
+#define action_int32_int32_int32_keyword$
+#define action_int32_int32_intptr_keyword$
+#define action_int32_int32_string_keyword$
+#define action_int32_int32_uint32_keyword$
+#define action_int32_int32_uint64_keyword$
+#define action_int32_intptr_keyword$
+#define action_int32_intptr_int32_keyword$
+#define action_int32_intptr_intptr_keyword$
+#define action_int32_intptr_string_keyword$
+#define action_int32_intptr_uint32_keyword$
+#define action_int32_intptr_uint64_keyword$
+#define action_int32_string_keyword$
+#define action_int32_string_int32_keyword$
+#define action_int32_string_intptr_keyword$
+#define action_int32_string_string_keyword$
+#define action_int32_string_uint32_keyword$
+#define action_int32_string_uint64_keyword$
+#define action_int32_uint32_keyword$
+#define action_int32_uint32_int32_keyword$
+#define action_int32_uint32_intptr_keyword$
+#define action_int32_uint32_string_keyword$
+#define action_int32_uint32_uint32_keyword$
+#define action_int32_uint32_uint64_keyword$
+#define action_int32_uint64_keyword$
+#define action_int32_uint64_int32_keyword$
+#define action_int32_uint64_intptr_keyword$
+#define action_int32_uint64_string_keyword$
+#define action_int32_uint64_uint32_keyword$
+#define action_int32_uint64_uint64_keyword$
 #define action_intptr_keyword$
-#define func_uint64_intptr_keyword$ return
-#define func_int32_intptr_keyword$ return
-#define func_string_intptr_keyword$ return
-#define func_uint32_intptr_keyword$ return
-#define func_intptr_intptr_keyword$ return
-#define action_uint64_uint64_keyword$
-#define func_uint64_uint64_uint64_keyword$ return
-#define func_int32_uint64_uint64_keyword$ return
-#define func_string_uint64_uint64_keyword$ return
-#define func_uint32_uint64_uint64_keyword$ return
-#define func_intptr_uint64_uint64_keyword$ return
+#define action_intptr_int32_keyword$
+#define action_intptr_int32_int32_keyword$
+#define action_intptr_int32_intptr_keyword$
+#define action_intptr_int32_string_keyword$
+#define action_intptr_int32_uint32_keyword$
+#define action_intptr_int32_uint64_keyword$
+#define action_intptr_intptr_keyword$
+#define action_intptr_intptr_int32_keyword$
+#define action_intptr_intptr_intptr_keyword$
+#define action_intptr_intptr_string_keyword$
+#define action_intptr_intptr_uint32_keyword$
+#define action_intptr_intptr_uint64_keyword$
+#define action_intptr_string_keyword$
+#define action_intptr_string_int32_keyword$
+#define action_intptr_string_intptr_keyword$
+#define action_intptr_string_string_keyword$
+#define action_intptr_string_uint32_keyword$
+#define action_intptr_string_uint64_keyword$
+#define action_intptr_uint32_keyword$
+#define action_intptr_uint32_int32_keyword$
+#define action_intptr_uint32_intptr_keyword$
+#define action_intptr_uint32_string_keyword$
+#define action_intptr_uint32_uint32_keyword$
+#define action_intptr_uint32_uint64_keyword$
+#define action_intptr_uint64_keyword$
+#define action_intptr_uint64_int32_keyword$
+#define action_intptr_uint64_intptr_keyword$
+#define action_intptr_uint64_string_keyword$
+#define action_intptr_uint64_uint32_keyword$
+#define action_intptr_uint64_uint64_keyword$
+#define action_string_keyword$
+#define action_string_int32_keyword$
+#define action_string_int32_int32_keyword$
+#define action_string_int32_intptr_keyword$
+#define action_string_int32_string_keyword$
+#define action_string_int32_uint32_keyword$
+#define action_string_int32_uint64_keyword$
+#define action_string_intptr_keyword$
+#define action_string_intptr_int32_keyword$
+#define action_string_intptr_intptr_keyword$
+#define action_string_intptr_string_keyword$
+#define action_string_intptr_uint32_keyword$
+#define action_string_intptr_uint64_keyword$
+#define action_string_string_keyword$
+#define action_string_string_int32_keyword$
+#define action_string_string_intptr_keyword$
+#define action_string_string_string_keyword$
+#define action_string_string_uint32_keyword$
+#define action_string_string_uint64_keyword$
+#define action_string_uint32_keyword$
+#define action_string_uint32_int32_keyword$
+#define action_string_uint32_intptr_keyword$
+#define action_string_uint32_string_keyword$
+#define action_string_uint32_uint32_keyword$
+#define action_string_uint32_uint64_keyword$
+#define action_string_uint64_keyword$
+#define action_string_uint64_int32_keyword$
+#define action_string_uint64_intptr_keyword$
+#define action_string_uint64_string_keyword$
+#define action_string_uint64_uint32_keyword$
+#define action_string_uint64_uint64_keyword$
+#define action_uint32_keyword$
+#define action_uint32_int32_keyword$
+#define action_uint32_int32_int32_keyword$
+#define action_uint32_int32_intptr_keyword$
+#define action_uint32_int32_string_keyword$
+#define action_uint32_int32_uint32_keyword$
+#define action_uint32_int32_uint64_keyword$
+#define action_uint32_intptr_keyword$
+#define action_uint32_intptr_int32_keyword$
+#define action_uint32_intptr_intptr_keyword$
+#define action_uint32_intptr_string_keyword$
+#define action_uint32_intptr_uint32_keyword$
+#define action_uint32_intptr_uint64_keyword$
+#define action_uint32_string_keyword$
+#define action_uint32_string_int32_keyword$
+#define action_uint32_string_intptr_keyword$
+#define action_uint32_string_string_keyword$
+#define action_uint32_string_uint32_keyword$
+#define action_uint32_string_uint64_keyword$
+#define action_uint32_uint32_keyword$
+#define action_uint32_uint32_int32_keyword$
+#define action_uint32_uint32_intptr_keyword$
+#define action_uint32_uint32_string_keyword$
+#define action_uint32_uint32_uint32_keyword$
+#define action_uint32_uint32_uint64_keyword$
+#define action_uint32_uint64_keyword$
+#define action_uint32_uint64_int32_keyword$
+#define action_uint32_uint64_intptr_keyword$
+#define action_uint32_uint64_string_keyword$
+#define action_uint32_uint64_uint32_keyword$
+#define action_uint32_uint64_uint64_keyword$
+#define action_uint64_keyword$
 #define action_uint64_int32_keyword$
-#define func_uint64_uint64_int32_keyword$ return
-#define func_int32_uint64_int32_keyword$ return
-#define func_string_uint64_int32_keyword$ return
-#define func_uint32_uint64_int32_keyword$ return
-#define func_intptr_uint64_int32_keyword$ return
+#define action_uint64_int32_int32_keyword$
+#define action_uint64_int32_intptr_keyword$
+#define action_uint64_int32_string_keyword$
+#define action_uint64_int32_uint32_keyword$
+#define action_uint64_int32_uint64_keyword$
+#define action_uint64_intptr_keyword$
+#define action_uint64_intptr_int32_keyword$
+#define action_uint64_intptr_intptr_keyword$
+#define action_uint64_intptr_string_keyword$
+#define action_uint64_intptr_uint32_keyword$
+#define action_uint64_intptr_uint64_keyword$
 #define action_uint64_string_keyword$
-#define func_uint64_uint64_string_keyword$ return
-#define func_int32_uint64_string_keyword$ return
-#define func_string_uint64_string_keyword$ return
-#define func_uint32_uint64_string_keyword$ return
-#define func_intptr_uint64_string_keyword$ return
+#define action_uint64_string_int32_keyword$
+#define action_uint64_string_intptr_keyword$
+#define action_uint64_string_string_keyword$
+#define action_uint64_string_uint32_keyword$
+#define action_uint64_string_uint64_keyword$
 #define action_uint64_uint32_keyword$
-#define func_uint64_uint64_uint32_keyword$ return
-#define func_int32_uint64_uint32_keyword$ return
-#define func_string_uint64_uint32_keyword$ return
-#define func_uint32_uint64_uint32_keyword$ return
-#define func_intptr_uint64_uint32_keyword$ return
-#define action_uint64_intptr_keyword$
-#define func_uint64_uint64_intptr_keyword$ return
-#define func_int32_uint64_intptr_keyword$ return
-#define func_string_uint64_intptr_keyword$ return
-#define func_uint32_uint64_intptr_keyword$ return
-#define func_intptr_uint64_intptr_keyword$ return
-#define action_int32_uint64_keyword$
-#define func_uint64_int32_uint64_keyword$ return
-#define func_int32_int32_uint64_keyword$ return
-#define func_string_int32_uint64_keyword$ return
-#define func_uint32_int32_uint64_keyword$ return
-#define func_intptr_int32_uint64_keyword$ return
-#define action_int32_int32_keyword$
-#define func_uint64_int32_int32_keyword$ return
+#define action_uint64_uint32_int32_keyword$
+#define action_uint64_uint32_intptr_keyword$
+#define action_uint64_uint32_string_keyword$
+#define action_uint64_uint32_uint32_keyword$
+#define action_uint64_uint32_uint64_keyword$
+#define action_uint64_uint64_keyword$
+#define action_uint64_uint64_int32_keyword$
+#define action_uint64_uint64_intptr_keyword$
+#define action_uint64_uint64_string_keyword$
+#define action_uint64_uint64_uint32_keyword$
+#define action_uint64_uint64_uint64_keyword$
+#define func_int32_keyword$ return
+#define func_int32_int32_keyword$ return
 #define func_int32_int32_int32_keyword$ return
-#define func_string_int32_int32_keyword$ return
-#define func_uint32_int32_int32_keyword$ return
-#define func_intptr_int32_int32_keyword$ return
-#define action_int32_string_keyword$
-#define func_uint64_int32_string_keyword$ return
+#define func_int32_int32_int32_int32_keyword$ return
+#define func_int32_int32_int32_intptr_keyword$ return
+#define func_int32_int32_int32_string_keyword$ return
+#define func_int32_int32_int32_uint32_keyword$ return
+#define func_int32_int32_int32_uint64_keyword$ return
+#define func_int32_int32_intptr_keyword$ return
+#define func_int32_int32_intptr_int32_keyword$ return
+#define func_int32_int32_intptr_intptr_keyword$ return
+#define func_int32_int32_intptr_string_keyword$ return
+#define func_int32_int32_intptr_uint32_keyword$ return
+#define func_int32_int32_intptr_uint64_keyword$ return
 #define func_int32_int32_string_keyword$ return
-#define func_string_int32_string_keyword$ return
-#define func_uint32_int32_string_keyword$ return
-#define func_intptr_int32_string_keyword$ return
-#define action_int32_uint32_keyword$
-#define func_uint64_int32_uint32_keyword$ return
+#define func_int32_int32_string_int32_keyword$ return
+#define func_int32_int32_string_intptr_keyword$ return
+#define func_int32_int32_string_string_keyword$ return
+#define func_int32_int32_string_uint32_keyword$ return
+#define func_int32_int32_string_uint64_keyword$ return
 #define func_int32_int32_uint32_keyword$ return
-#define func_string_int32_uint32_keyword$ return
-#define func_uint32_int32_uint32_keyword$ return
-#define func_intptr_int32_uint32_keyword$ return
-#define action_int32_intptr_keyword$
-#define func_uint64_int32_intptr_keyword$ return
-#define func_int32_int32_intptr_keyword$ return
-#define func_string_int32_intptr_keyword$ return
-#define func_uint32_int32_intptr_keyword$ return
-#define func_intptr_int32_intptr_keyword$ return
-#define action_string_uint64_keyword$
-#define func_uint64_string_uint64_keyword$ return
-#define func_int32_string_uint64_keyword$ return
-#define func_string_string_uint64_keyword$ return
-#define func_uint32_string_uint64_keyword$ return
-#define func_intptr_string_uint64_keyword$ return
-#define action_string_int32_keyword$
-#define func_uint64_string_int32_keyword$ return
+#define func_int32_int32_uint32_int32_keyword$ return
+#define func_int32_int32_uint32_intptr_keyword$ return
+#define func_int32_int32_uint32_string_keyword$ return
+#define func_int32_int32_uint32_uint32_keyword$ return
+#define func_int32_int32_uint32_uint64_keyword$ return
+#define func_int32_int32_uint64_keyword$ return
+#define func_int32_int32_uint64_int32_keyword$ return
+#define func_int32_int32_uint64_intptr_keyword$ return
+#define func_int32_int32_uint64_string_keyword$ return
+#define func_int32_int32_uint64_uint32_keyword$ return
+#define func_int32_int32_uint64_uint64_keyword$ return
+#define func_int32_intptr_keyword$ return
+#define func_int32_intptr_int32_keyword$ return
+#define func_int32_intptr_int32_int32_keyword$ return
+#define func_int32_intptr_int32_intptr_keyword$ return
+#define func_int32_intptr_int32_string_keyword$ return
+#define func_int32_intptr_int32_uint32_keyword$ return
+#define func_int32_intptr_int32_uint64_keyword$ return
+#define func_int32_intptr_intptr_keyword$ return
+#define func_int32_intptr_intptr_int32_keyword$ return
+#define func_int32_intptr_intptr_intptr_keyword$ return
+#define func_int32_intptr_intptr_string_keyword$ return
+#define func_int32_intptr_intptr_uint32_keyword$ return
+#define func_int32_intptr_intptr_uint64_keyword$ return
+#define func_int32_intptr_string_keyword$ return
+#define func_int32_intptr_string_int32_keyword$ return
+#define func_int32_intptr_string_intptr_keyword$ return
+#define func_int32_intptr_string_string_keyword$ return
+#define func_int32_intptr_string_uint32_keyword$ return
+#define func_int32_intptr_string_uint64_keyword$ return
+#define func_int32_intptr_uint32_keyword$ return
+#define func_int32_intptr_uint32_int32_keyword$ return
+#define func_int32_intptr_uint32_intptr_keyword$ return
+#define func_int32_intptr_uint32_string_keyword$ return
+#define func_int32_intptr_uint32_uint32_keyword$ return
+#define func_int32_intptr_uint32_uint64_keyword$ return
+#define func_int32_intptr_uint64_keyword$ return
+#define func_int32_intptr_uint64_int32_keyword$ return
+#define func_int32_intptr_uint64_intptr_keyword$ return
+#define func_int32_intptr_uint64_string_keyword$ return
+#define func_int32_intptr_uint64_uint32_keyword$ return
+#define func_int32_intptr_uint64_uint64_keyword$ return
+#define func_int32_string_keyword$ return
 #define func_int32_string_int32_keyword$ return
-#define func_string_string_int32_keyword$ return
-#define func_uint32_string_int32_keyword$ return
-#define func_intptr_string_int32_keyword$ return
-#define action_string_string_keyword$
-#define func_uint64_string_string_keyword$ return
+#define func_int32_string_int32_int32_keyword$ return
+#define func_int32_string_int32_intptr_keyword$ return
+#define func_int32_string_int32_string_keyword$ return
+#define func_int32_string_int32_uint32_keyword$ return
+#define func_int32_string_int32_uint64_keyword$ return
+#define func_int32_string_intptr_keyword$ return
+#define func_int32_string_intptr_int32_keyword$ return
+#define func_int32_string_intptr_intptr_keyword$ return
+#define func_int32_string_intptr_string_keyword$ return
+#define func_int32_string_intptr_uint32_keyword$ return
+#define func_int32_string_intptr_uint64_keyword$ return
 #define func_int32_string_string_keyword$ return
-#define func_string_string_string_keyword$ return
-#define func_uint32_string_string_keyword$ return
-#define func_intptr_string_string_keyword$ return
-#define action_string_uint32_keyword$
-#define func_uint64_string_uint32_keyword$ return
+#define func_int32_string_string_int32_keyword$ return
+#define func_int32_string_string_intptr_keyword$ return
+#define func_int32_string_string_string_keyword$ return
+#define func_int32_string_string_uint32_keyword$ return
+#define func_int32_string_string_uint64_keyword$ return
 #define func_int32_string_uint32_keyword$ return
-#define func_string_string_uint32_keyword$ return
-#define func_uint32_string_uint32_keyword$ return
-#define func_intptr_string_uint32_keyword$ return
-#define action_string_intptr_keyword$
-#define func_uint64_string_intptr_keyword$ return
-#define func_int32_string_intptr_keyword$ return
-#define func_string_string_intptr_keyword$ return
-#define func_uint32_string_intptr_keyword$ return
-#define func_intptr_string_intptr_keyword$ return
-#define action_uint32_uint64_keyword$
-#define func_uint64_uint32_uint64_keyword$ return
-#define func_int32_uint32_uint64_keyword$ return
-#define func_string_uint32_uint64_keyword$ return
-#define func_uint32_uint32_uint64_keyword$ return
-#define func_intptr_uint32_uint64_keyword$ return
-#define action_uint32_int32_keyword$
-#define func_uint64_uint32_int32_keyword$ return
+#define func_int32_string_uint32_int32_keyword$ return
+#define func_int32_string_uint32_intptr_keyword$ return
+#define func_int32_string_uint32_string_keyword$ return
+#define func_int32_string_uint32_uint32_keyword$ return
+#define func_int32_string_uint32_uint64_keyword$ return
+#define func_int32_string_uint64_keyword$ return
+#define func_int32_string_uint64_int32_keyword$ return
+#define func_int32_string_uint64_intptr_keyword$ return
+#define func_int32_string_uint64_string_keyword$ return
+#define func_int32_string_uint64_uint32_keyword$ return
+#define func_int32_string_uint64_uint64_keyword$ return
+#define func_int32_uint32_keyword$ return
 #define func_int32_uint32_int32_keyword$ return
-#define func_string_uint32_int32_keyword$ return
-#define func_uint32_uint32_int32_keyword$ return
-#define func_intptr_uint32_int32_keyword$ return
-#define action_uint32_string_keyword$
-#define func_uint64_uint32_string_keyword$ return
+#define func_int32_uint32_int32_int32_keyword$ return
+#define func_int32_uint32_int32_intptr_keyword$ return
+#define func_int32_uint32_int32_string_keyword$ return
+#define func_int32_uint32_int32_uint32_keyword$ return
+#define func_int32_uint32_int32_uint64_keyword$ return
+#define func_int32_uint32_intptr_keyword$ return
+#define func_int32_uint32_intptr_int32_keyword$ return
+#define func_int32_uint32_intptr_intptr_keyword$ return
+#define func_int32_uint32_intptr_string_keyword$ return
+#define func_int32_uint32_intptr_uint32_keyword$ return
+#define func_int32_uint32_intptr_uint64_keyword$ return
 #define func_int32_uint32_string_keyword$ return
-#define func_string_uint32_string_keyword$ return
-#define func_uint32_uint32_string_keyword$ return
-#define func_intptr_uint32_string_keyword$ return
-#define action_uint32_uint32_keyword$
-#define func_uint64_uint32_uint32_keyword$ return
+#define func_int32_uint32_string_int32_keyword$ return
+#define func_int32_uint32_string_intptr_keyword$ return
+#define func_int32_uint32_string_string_keyword$ return
+#define func_int32_uint32_string_uint32_keyword$ return
+#define func_int32_uint32_string_uint64_keyword$ return
 #define func_int32_uint32_uint32_keyword$ return
-#define func_string_uint32_uint32_keyword$ return
-#define func_uint32_uint32_uint32_keyword$ return
-#define func_intptr_uint32_uint32_keyword$ return
-#define action_uint32_intptr_keyword$
-#define func_uint64_uint32_intptr_keyword$ return
-#define func_int32_uint32_intptr_keyword$ return
-#define func_string_uint32_intptr_keyword$ return
-#define func_uint32_uint32_intptr_keyword$ return
-#define func_intptr_uint32_intptr_keyword$ return
-#define action_intptr_uint64_keyword$
-#define func_uint64_intptr_uint64_keyword$ return
-#define func_int32_intptr_uint64_keyword$ return
-#define func_string_intptr_uint64_keyword$ return
-#define func_uint32_intptr_uint64_keyword$ return
-#define func_intptr_intptr_uint64_keyword$ return
-#define action_intptr_int32_keyword$
-#define func_uint64_intptr_int32_keyword$ return
-#define func_int32_intptr_int32_keyword$ return
-#define func_string_intptr_int32_keyword$ return
-#define func_uint32_intptr_int32_keyword$ return
-#define func_intptr_intptr_int32_keyword$ return
-#define action_intptr_string_keyword$
-#define func_uint64_intptr_string_keyword$ return
-#define func_int32_intptr_string_keyword$ return
-#define func_string_intptr_string_keyword$ return
-#define func_uint32_intptr_string_keyword$ return
-#define func_intptr_intptr_string_keyword$ return
-#define action_intptr_uint32_keyword$
-#define func_uint64_intptr_uint32_keyword$ return
-#define func_int32_intptr_uint32_keyword$ return
-#define func_string_intptr_uint32_keyword$ return
-#define func_uint32_intptr_uint32_keyword$ return
-#define func_intptr_intptr_uint32_keyword$ return
-#define action_intptr_intptr_keyword$
-#define func_uint64_intptr_intptr_keyword$ return
-#define func_int32_intptr_intptr_keyword$ return
-#define func_string_intptr_intptr_keyword$ return
-#define func_uint32_intptr_intptr_keyword$ return
-#define func_intptr_intptr_intptr_keyword$ return
-#define action_uint64_uint64_uint64_keyword$
-#define func_uint64_uint64_uint64_uint64_keyword$ return
-#define func_int32_uint64_uint64_uint64_keyword$ return
-#define func_string_uint64_uint64_uint64_keyword$ return
-#define func_uint32_uint64_uint64_uint64_keyword$ return
-#define func_intptr_uint64_uint64_uint64_keyword$ return
-#define action_uint64_uint64_int32_keyword$
-#define func_uint64_uint64_uint64_int32_keyword$ return
-#define func_int32_uint64_uint64_int32_keyword$ return
-#define func_string_uint64_uint64_int32_keyword$ return
-#define func_uint32_uint64_uint64_int32_keyword$ return
-#define func_intptr_uint64_uint64_int32_keyword$ return
-#define action_uint64_uint64_string_keyword$
-#define func_uint64_uint64_uint64_string_keyword$ return
-#define func_int32_uint64_uint64_string_keyword$ return
-#define func_string_uint64_uint64_string_keyword$ return
-#define func_uint32_uint64_uint64_string_keyword$ return
-#define func_intptr_uint64_uint64_string_keyword$ return
-#define action_uint64_uint64_uint32_keyword$
-#define func_uint64_uint64_uint64_uint32_keyword$ return
-#define func_int32_uint64_uint64_uint32_keyword$ return
-#define func_string_uint64_uint64_uint32_keyword$ return
-#define func_uint32_uint64_uint64_uint32_keyword$ return
-#define func_intptr_uint64_uint64_uint32_keyword$ return
-#define action_uint64_uint64_intptr_keyword$
-#define func_uint64_uint64_uint64_intptr_keyword$ return
-#define func_int32_uint64_uint64_intptr_keyword$ return
-#define func_string_uint64_uint64_intptr_keyword$ return
-#define func_uint32_uint64_uint64_intptr_keyword$ return
-#define func_intptr_uint64_uint64_intptr_keyword$ return
-#define action_uint64_int32_uint64_keyword$
-#define func_uint64_uint64_int32_uint64_keyword$ return
-#define func_int32_uint64_int32_uint64_keyword$ return
-#define func_string_uint64_int32_uint64_keyword$ return
-#define func_uint32_uint64_int32_uint64_keyword$ return
-#define func_intptr_uint64_int32_uint64_keyword$ return
-#define action_uint64_int32_int32_keyword$
-#define func_uint64_uint64_int32_int32_keyword$ return
+#define func_int32_uint32_uint32_int32_keyword$ return
+#define func_int32_uint32_uint32_intptr_keyword$ return
+#define func_int32_uint32_uint32_string_keyword$ return
+#define func_int32_uint32_uint32_uint32_keyword$ return
+#define func_int32_uint32_uint32_uint64_keyword$ return
+#define func_int32_uint32_uint64_keyword$ return
+#define func_int32_uint32_uint64_int32_keyword$ return
+#define func_int32_uint32_uint64_intptr_keyword$ return
+#define func_int32_uint32_uint64_string_keyword$ return
+#define func_int32_uint32_uint64_uint32_keyword$ return
+#define func_int32_uint32_uint64_uint64_keyword$ return
+#define func_int32_uint64_keyword$ return
+#define func_int32_uint64_int32_keyword$ return
 #define func_int32_uint64_int32_int32_keyword$ return
-#define func_string_uint64_int32_int32_keyword$ return
-#define func_uint32_uint64_int32_int32_keyword$ return
-#define func_intptr_uint64_int32_int32_keyword$ return
-#define action_uint64_int32_string_keyword$
-#define func_uint64_uint64_int32_string_keyword$ return
+#define func_int32_uint64_int32_intptr_keyword$ return
 #define func_int32_uint64_int32_string_keyword$ return
-#define func_string_uint64_int32_string_keyword$ return
-#define func_uint32_uint64_int32_string_keyword$ return
-#define func_intptr_uint64_int32_string_keyword$ return
-#define action_uint64_int32_uint32_keyword$
-#define func_uint64_uint64_int32_uint32_keyword$ return
 #define func_int32_uint64_int32_uint32_keyword$ return
-#define func_string_uint64_int32_uint32_keyword$ return
-#define func_uint32_uint64_int32_uint32_keyword$ return
-#define func_intptr_uint64_int32_uint32_keyword$ return
-#define action_uint64_int32_intptr_keyword$
-#define func_uint64_uint64_int32_intptr_keyword$ return
-#define func_int32_uint64_int32_intptr_keyword$ return
-#define func_string_uint64_int32_intptr_keyword$ return
-#define func_uint32_uint64_int32_intptr_keyword$ return
-#define func_intptr_uint64_int32_intptr_keyword$ return
-#define action_uint64_string_uint64_keyword$
-#define func_uint64_uint64_string_uint64_keyword$ return
-#define func_int32_uint64_string_uint64_keyword$ return
-#define func_string_uint64_string_uint64_keyword$ return
-#define func_uint32_uint64_string_uint64_keyword$ return
-#define func_intptr_uint64_string_uint64_keyword$ return
-#define action_uint64_string_int32_keyword$
-#define func_uint64_uint64_string_int32_keyword$ return
+#define func_int32_uint64_int32_uint64_keyword$ return
+#define func_int32_uint64_intptr_keyword$ return
+#define func_int32_uint64_intptr_int32_keyword$ return
+#define func_int32_uint64_intptr_intptr_keyword$ return
+#define func_int32_uint64_intptr_string_keyword$ return
+#define func_int32_uint64_intptr_uint32_keyword$ return
+#define func_int32_uint64_intptr_uint64_keyword$ return
+#define func_int32_uint64_string_keyword$ return
 #define func_int32_uint64_string_int32_keyword$ return
-#define func_string_uint64_string_int32_keyword$ return
-#define func_uint32_uint64_string_int32_keyword$ return
-#define func_intptr_uint64_string_int32_keyword$ return
-#define action_uint64_string_string_keyword$
-#define func_uint64_uint64_string_string_keyword$ return
+#define func_int32_uint64_string_intptr_keyword$ return
 #define func_int32_uint64_string_string_keyword$ return
-#define func_string_uint64_string_string_keyword$ return
-#define func_uint32_uint64_string_string_keyword$ return
-#define func_intptr_uint64_string_string_keyword$ return
-#define action_uint64_string_uint32_keyword$
-#define func_uint64_uint64_string_uint32_keyword$ return
 #define func_int32_uint64_string_uint32_keyword$ return
-#define func_string_uint64_string_uint32_keyword$ return
-#define func_uint32_uint64_string_uint32_keyword$ return
-#define func_intptr_uint64_string_uint32_keyword$ return
-#define action_uint64_string_intptr_keyword$
-#define func_uint64_uint64_string_intptr_keyword$ return
-#define func_int32_uint64_string_intptr_keyword$ return
-#define func_string_uint64_string_intptr_keyword$ return
-#define func_uint32_uint64_string_intptr_keyword$ return
-#define func_intptr_uint64_string_intptr_keyword$ return
-#define action_uint64_uint32_uint64_keyword$
-#define func_uint64_uint64_uint32_uint64_keyword$ return
-#define func_int32_uint64_uint32_uint64_keyword$ return
-#define func_string_uint64_uint32_uint64_keyword$ return
-#define func_uint32_uint64_uint32_uint64_keyword$ return
-#define func_intptr_uint64_uint32_uint64_keyword$ return
-#define action_uint64_uint32_int32_keyword$
-#define func_uint64_uint64_uint32_int32_keyword$ return
+#define func_int32_uint64_string_uint64_keyword$ return
+#define func_int32_uint64_uint32_keyword$ return
 #define func_int32_uint64_uint32_int32_keyword$ return
-#define func_string_uint64_uint32_int32_keyword$ return
-#define func_uint32_uint64_uint32_int32_keyword$ return
-#define func_intptr_uint64_uint32_int32_keyword$ return
-#define action_uint64_uint32_string_keyword$
-#define func_uint64_uint64_uint32_string_keyword$ return
+#define func_int32_uint64_uint32_intptr_keyword$ return
 #define func_int32_uint64_uint32_string_keyword$ return
-#define func_string_uint64_uint32_string_keyword$ return
-#define func_uint32_uint64_uint32_string_keyword$ return
-#define func_intptr_uint64_uint32_string_keyword$ return
-#define action_uint64_uint32_uint32_keyword$
-#define func_uint64_uint64_uint32_uint32_keyword$ return
 #define func_int32_uint64_uint32_uint32_keyword$ return
-#define func_string_uint64_uint32_uint32_keyword$ return
-#define func_uint32_uint64_uint32_uint32_keyword$ return
-#define func_intptr_uint64_uint32_uint32_keyword$ return
-#define action_uint64_uint32_intptr_keyword$
-#define func_uint64_uint64_uint32_intptr_keyword$ return
-#define func_int32_uint64_uint32_intptr_keyword$ return
-#define func_string_uint64_uint32_intptr_keyword$ return
-#define func_uint32_uint64_uint32_intptr_keyword$ return
-#define func_intptr_uint64_uint32_intptr_keyword$ return
-#define action_uint64_intptr_uint64_keyword$
-#define func_uint64_uint64_intptr_uint64_keyword$ return
-#define func_int32_uint64_intptr_uint64_keyword$ return
-#define func_string_uint64_intptr_uint64_keyword$ return
-#define func_uint32_uint64_intptr_uint64_keyword$ return
-#define func_intptr_uint64_intptr_uint64_keyword$ return
-#define action_uint64_intptr_int32_keyword$
-#define func_uint64_uint64_intptr_int32_keyword$ return
-#define func_int32_uint64_intptr_int32_keyword$ return
-#define func_string_uint64_intptr_int32_keyword$ return
-#define func_uint32_uint64_intptr_int32_keyword$ return
-#define func_intptr_uint64_intptr_int32_keyword$ return
-#define action_uint64_intptr_string_keyword$
-#define func_uint64_uint64_intptr_string_keyword$ return
-#define func_int32_uint64_intptr_string_keyword$ return
-#define func_string_uint64_intptr_string_keyword$ return
-#define func_uint32_uint64_intptr_string_keyword$ return
-#define func_intptr_uint64_intptr_string_keyword$ return
-#define action_uint64_intptr_uint32_keyword$
-#define func_uint64_uint64_intptr_uint32_keyword$ return
-#define func_int32_uint64_intptr_uint32_keyword$ return
-#define func_string_uint64_intptr_uint32_keyword$ return
-#define func_uint32_uint64_intptr_uint32_keyword$ return
-#define func_intptr_uint64_intptr_uint32_keyword$ return
-#define action_uint64_intptr_intptr_keyword$
-#define func_uint64_uint64_intptr_intptr_keyword$ return
-#define func_int32_uint64_intptr_intptr_keyword$ return
-#define func_string_uint64_intptr_intptr_keyword$ return
-#define func_uint32_uint64_intptr_intptr_keyword$ return
-#define func_intptr_uint64_intptr_intptr_keyword$ return
-#define action_int32_uint64_uint64_keyword$
-#define func_uint64_int32_uint64_uint64_keyword$ return
-#define func_int32_int32_uint64_uint64_keyword$ return
-#define func_string_int32_uint64_uint64_keyword$ return
-#define func_uint32_int32_uint64_uint64_keyword$ return
-#define func_intptr_int32_uint64_uint64_keyword$ return
-#define action_int32_uint64_int32_keyword$
-#define func_uint64_int32_uint64_int32_keyword$ return
-#define func_int32_int32_uint64_int32_keyword$ return
-#define func_string_int32_uint64_int32_keyword$ return
-#define func_uint32_int32_uint64_int32_keyword$ return
-#define func_intptr_int32_uint64_int32_keyword$ return
-#define action_int32_uint64_string_keyword$
-#define func_uint64_int32_uint64_string_keyword$ return
-#define func_int32_int32_uint64_string_keyword$ return
-#define func_string_int32_uint64_string_keyword$ return
-#define func_uint32_int32_uint64_string_keyword$ return
-#define func_intptr_int32_uint64_string_keyword$ return
-#define action_int32_uint64_uint32_keyword$
-#define func_uint64_int32_uint64_uint32_keyword$ return
-#define func_int32_int32_uint64_uint32_keyword$ return
-#define func_string_int32_uint64_uint32_keyword$ return
-#define func_uint32_int32_uint64_uint32_keyword$ return
-#define func_intptr_int32_uint64_uint32_keyword$ return
-#define action_int32_uint64_intptr_keyword$
-#define func_uint64_int32_uint64_intptr_keyword$ return
-#define func_int32_int32_uint64_intptr_keyword$ return
-#define func_string_int32_uint64_intptr_keyword$ return
-#define func_uint32_int32_uint64_intptr_keyword$ return
-#define func_intptr_int32_uint64_intptr_keyword$ return
-#define action_int32_int32_uint64_keyword$
-#define func_uint64_int32_int32_uint64_keyword$ return
-#define func_int32_int32_int32_uint64_keyword$ return
-#define func_string_int32_int32_uint64_keyword$ return
-#define func_uint32_int32_int32_uint64_keyword$ return
-#define func_intptr_int32_int32_uint64_keyword$ return
-#define action_int32_int32_int32_keyword$
-#define func_uint64_int32_int32_int32_keyword$ return
-#define func_int32_int32_int32_int32_keyword$ return
-#define func_string_int32_int32_int32_keyword$ return
-#define func_uint32_int32_int32_int32_keyword$ return
+#define func_int32_uint64_uint32_uint64_keyword$ return
+#define func_int32_uint64_uint64_keyword$ return
+#define func_int32_uint64_uint64_int32_keyword$ return
+#define func_int32_uint64_uint64_intptr_keyword$ return
+#define func_int32_uint64_uint64_string_keyword$ return
+#define func_int32_uint64_uint64_uint32_keyword$ return
+#define func_int32_uint64_uint64_uint64_keyword$ return
+#define func_intptr_keyword$ return
+#define func_intptr_int32_keyword$ return
+#define func_intptr_int32_int32_keyword$ return
 #define func_intptr_int32_int32_int32_keyword$ return
-#define action_int32_int32_string_keyword$
-#define func_uint64_int32_int32_string_keyword$ return
-#define func_int32_int32_int32_string_keyword$ return
-#define func_string_int32_int32_string_keyword$ return
-#define func_uint32_int32_int32_string_keyword$ return
+#define func_intptr_int32_int32_intptr_keyword$ return
 #define func_intptr_int32_int32_string_keyword$ return
-#define action_int32_int32_uint32_keyword$
-#define func_uint64_int32_int32_uint32_keyword$ return
-#define func_int32_int32_int32_uint32_keyword$ return
-#define func_string_int32_int32_uint32_keyword$ return
-#define func_uint32_int32_int32_uint32_keyword$ return
 #define func_intptr_int32_int32_uint32_keyword$ return
-#define action_int32_int32_intptr_keyword$
-#define func_uint64_int32_int32_intptr_keyword$ return
-#define func_int32_int32_int32_intptr_keyword$ return
-#define func_string_int32_int32_intptr_keyword$ return
-#define func_uint32_int32_int32_intptr_keyword$ return
-#define func_intptr_int32_int32_intptr_keyword$ return
-#define action_int32_string_uint64_keyword$
-#define func_uint64_int32_string_uint64_keyword$ return
-#define func_int32_int32_string_uint64_keyword$ return
-#define func_string_int32_string_uint64_keyword$ return
-#define func_uint32_int32_string_uint64_keyword$ return
-#define func_intptr_int32_string_uint64_keyword$ return
-#define action_int32_string_int32_keyword$
-#define func_uint64_int32_string_int32_keyword$ return
-#define func_int32_int32_string_int32_keyword$ return
-#define func_string_int32_string_int32_keyword$ return
-#define func_uint32_int32_string_int32_keyword$ return
+#define func_intptr_int32_int32_uint64_keyword$ return
+#define func_intptr_int32_intptr_keyword$ return
+#define func_intptr_int32_intptr_int32_keyword$ return
+#define func_intptr_int32_intptr_intptr_keyword$ return
+#define func_intptr_int32_intptr_string_keyword$ return
+#define func_intptr_int32_intptr_uint32_keyword$ return
+#define func_intptr_int32_intptr_uint64_keyword$ return
+#define func_intptr_int32_string_keyword$ return
 #define func_intptr_int32_string_int32_keyword$ return
-#define action_int32_string_string_keyword$
-#define func_uint64_int32_string_string_keyword$ return
-#define func_int32_int32_string_string_keyword$ return
-#define func_string_int32_string_string_keyword$ return
-#define func_uint32_int32_string_string_keyword$ return
+#define func_intptr_int32_string_intptr_keyword$ return
 #define func_intptr_int32_string_string_keyword$ return
-#define action_int32_string_uint32_keyword$
-#define func_uint64_int32_string_uint32_keyword$ return
-#define func_int32_int32_string_uint32_keyword$ return
-#define func_string_int32_string_uint32_keyword$ return
-#define func_uint32_int32_string_uint32_keyword$ return
 #define func_intptr_int32_string_uint32_keyword$ return
-#define action_int32_string_intptr_keyword$
-#define func_uint64_int32_string_intptr_keyword$ return
-#define func_int32_int32_string_intptr_keyword$ return
-#define func_string_int32_string_intptr_keyword$ return
-#define func_uint32_int32_string_intptr_keyword$ return
-#define func_intptr_int32_string_intptr_keyword$ return
-#define action_int32_uint32_uint64_keyword$
-#define func_uint64_int32_uint32_uint64_keyword$ return
-#define func_int32_int32_uint32_uint64_keyword$ return
-#define func_string_int32_uint32_uint64_keyword$ return
-#define func_uint32_int32_uint32_uint64_keyword$ return
-#define func_intptr_int32_uint32_uint64_keyword$ return
-#define action_int32_uint32_int32_keyword$
-#define func_uint64_int32_uint32_int32_keyword$ return
-#define func_int32_int32_uint32_int32_keyword$ return
-#define func_string_int32_uint32_int32_keyword$ return
-#define func_uint32_int32_uint32_int32_keyword$ return
+#define func_intptr_int32_string_uint64_keyword$ return
+#define func_intptr_int32_uint32_keyword$ return
 #define func_intptr_int32_uint32_int32_keyword$ return
-#define action_int32_uint32_string_keyword$
-#define func_uint64_int32_uint32_string_keyword$ return
-#define func_int32_int32_uint32_string_keyword$ return
-#define func_string_int32_uint32_string_keyword$ return
-#define func_uint32_int32_uint32_string_keyword$ return
+#define func_intptr_int32_uint32_intptr_keyword$ return
 #define func_intptr_int32_uint32_string_keyword$ return
-#define action_int32_uint32_uint32_keyword$
-#define func_uint64_int32_uint32_uint32_keyword$ return
-#define func_int32_int32_uint32_uint32_keyword$ return
-#define func_string_int32_uint32_uint32_keyword$ return
-#define func_uint32_int32_uint32_uint32_keyword$ return
 #define func_intptr_int32_uint32_uint32_keyword$ return
-#define action_int32_uint32_intptr_keyword$
-#define func_uint64_int32_uint32_intptr_keyword$ return
-#define func_int32_int32_uint32_intptr_keyword$ return
-#define func_string_int32_uint32_intptr_keyword$ return
-#define func_uint32_int32_uint32_intptr_keyword$ return
-#define func_intptr_int32_uint32_intptr_keyword$ return
-#define action_int32_intptr_uint64_keyword$
-#define func_uint64_int32_intptr_uint64_keyword$ return
-#define func_int32_int32_intptr_uint64_keyword$ return
-#define func_string_int32_intptr_uint64_keyword$ return
-#define func_uint32_int32_intptr_uint64_keyword$ return
-#define func_intptr_int32_intptr_uint64_keyword$ return
-#define action_int32_intptr_int32_keyword$
-#define func_uint64_int32_intptr_int32_keyword$ return
-#define func_int32_int32_intptr_int32_keyword$ return
-#define func_string_int32_intptr_int32_keyword$ return
-#define func_uint32_int32_intptr_int32_keyword$ return
-#define func_intptr_int32_intptr_int32_keyword$ return
-#define action_int32_intptr_string_keyword$
-#define func_uint64_int32_intptr_string_keyword$ return
-#define func_int32_int32_intptr_string_keyword$ return
-#define func_string_int32_intptr_string_keyword$ return
-#define func_uint32_int32_intptr_string_keyword$ return
-#define func_intptr_int32_intptr_string_keyword$ return
-#define action_int32_intptr_uint32_keyword$
-#define func_uint64_int32_intptr_uint32_keyword$ return
-#define func_int32_int32_intptr_uint32_keyword$ return
-#define func_string_int32_intptr_uint32_keyword$ return
-#define func_uint32_int32_intptr_uint32_keyword$ return
-#define func_intptr_int32_intptr_uint32_keyword$ return
-#define action_int32_intptr_intptr_keyword$
-#define func_uint64_int32_intptr_intptr_keyword$ return
-#define func_int32_int32_intptr_intptr_keyword$ return
-#define func_string_int32_intptr_intptr_keyword$ return
-#define func_uint32_int32_intptr_intptr_keyword$ return
-#define func_intptr_int32_intptr_intptr_keyword$ return
-#define action_string_uint64_uint64_keyword$
-#define func_uint64_string_uint64_uint64_keyword$ return
-#define func_int32_string_uint64_uint64_keyword$ return
-#define func_string_string_uint64_uint64_keyword$ return
-#define func_uint32_string_uint64_uint64_keyword$ return
-#define func_intptr_string_uint64_uint64_keyword$ return
-#define action_string_uint64_int32_keyword$
-#define func_uint64_string_uint64_int32_keyword$ return
-#define func_int32_string_uint64_int32_keyword$ return
-#define func_string_string_uint64_int32_keyword$ return
-#define func_uint32_string_uint64_int32_keyword$ return
+#define func_intptr_int32_uint32_uint64_keyword$ return
+#define func_intptr_int32_uint64_keyword$ return
+#define func_intptr_int32_uint64_int32_keyword$ return
+#define func_intptr_int32_uint64_intptr_keyword$ return
+#define func_intptr_int32_uint64_string_keyword$ return
+#define func_intptr_int32_uint64_uint32_keyword$ return
+#define func_intptr_int32_uint64_uint64_keyword$ return
+#define func_intptr_intptr_keyword$ return
+#define func_intptr_intptr_int32_keyword$ return
+#define func_intptr_intptr_int32_int32_keyword$ return
+#define func_intptr_intptr_int32_intptr_keyword$ return
+#define func_intptr_intptr_int32_string_keyword$ return
+#define func_intptr_intptr_int32_uint32_keyword$ return
+#define func_intptr_intptr_int32_uint64_keyword$ return
+#define func_intptr_intptr_intptr_keyword$ return
+#define func_intptr_intptr_intptr_int32_keyword$ return
+#define func_intptr_intptr_intptr_intptr_keyword$ return
+#define func_intptr_intptr_intptr_string_keyword$ return
+#define func_intptr_intptr_intptr_uint32_keyword$ return
+#define func_intptr_intptr_intptr_uint64_keyword$ return
+#define func_intptr_intptr_string_keyword$ return
+#define func_intptr_intptr_string_int32_keyword$ return
+#define func_intptr_intptr_string_intptr_keyword$ return
+#define func_intptr_intptr_string_string_keyword$ return
+#define func_intptr_intptr_string_uint32_keyword$ return
+#define func_intptr_intptr_string_uint64_keyword$ return
+#define func_intptr_intptr_uint32_keyword$ return
+#define func_intptr_intptr_uint32_int32_keyword$ return
+#define func_intptr_intptr_uint32_intptr_keyword$ return
+#define func_intptr_intptr_uint32_string_keyword$ return
+#define func_intptr_intptr_uint32_uint32_keyword$ return
+#define func_intptr_intptr_uint32_uint64_keyword$ return
+#define func_intptr_intptr_uint64_keyword$ return
+#define func_intptr_intptr_uint64_int32_keyword$ return
+#define func_intptr_intptr_uint64_intptr_keyword$ return
+#define func_intptr_intptr_uint64_string_keyword$ return
+#define func_intptr_intptr_uint64_uint32_keyword$ return
+#define func_intptr_intptr_uint64_uint64_keyword$ return
+#define func_intptr_string_keyword$ return
+#define func_intptr_string_int32_keyword$ return
+#define func_intptr_string_int32_int32_keyword$ return
+#define func_intptr_string_int32_intptr_keyword$ return
+#define func_intptr_string_int32_string_keyword$ return
+#define func_intptr_string_int32_uint32_keyword$ return
+#define func_intptr_string_int32_uint64_keyword$ return
+#define func_intptr_string_intptr_keyword$ return
+#define func_intptr_string_intptr_int32_keyword$ return
+#define func_intptr_string_intptr_intptr_keyword$ return
+#define func_intptr_string_intptr_string_keyword$ return
+#define func_intptr_string_intptr_uint32_keyword$ return
+#define func_intptr_string_intptr_uint64_keyword$ return
+#define func_intptr_string_string_keyword$ return
+#define func_intptr_string_string_int32_keyword$ return
+#define func_intptr_string_string_intptr_keyword$ return
+#define func_intptr_string_string_string_keyword$ return
+#define func_intptr_string_string_uint32_keyword$ return
+#define func_intptr_string_string_uint64_keyword$ return
+#define func_intptr_string_uint32_keyword$ return
+#define func_intptr_string_uint32_int32_keyword$ return
+#define func_intptr_string_uint32_intptr_keyword$ return
+#define func_intptr_string_uint32_string_keyword$ return
+#define func_intptr_string_uint32_uint32_keyword$ return
+#define func_intptr_string_uint32_uint64_keyword$ return
+#define func_intptr_string_uint64_keyword$ return
 #define func_intptr_string_uint64_int32_keyword$ return
-#define action_string_uint64_string_keyword$
-#define func_uint64_string_uint64_string_keyword$ return
-#define func_int32_string_uint64_string_keyword$ return
-#define func_string_string_uint64_string_keyword$ return
-#define func_uint32_string_uint64_string_keyword$ return
+#define func_intptr_string_uint64_intptr_keyword$ return
 #define func_intptr_string_uint64_string_keyword$ return
-#define action_string_uint64_uint32_keyword$
-#define func_uint64_string_uint64_uint32_keyword$ return
-#define func_int32_string_uint64_uint32_keyword$ return
-#define func_string_string_uint64_uint32_keyword$ return
-#define func_uint32_string_uint64_uint32_keyword$ return
 #define func_intptr_string_uint64_uint32_keyword$ return
-#define action_string_uint64_intptr_keyword$
-#define func_uint64_string_uint64_intptr_keyword$ return
-#define func_int32_string_uint64_intptr_keyword$ return
-#define func_string_string_uint64_intptr_keyword$ return
-#define func_uint32_string_uint64_intptr_keyword$ return
-#define func_intptr_string_uint64_intptr_keyword$ return
-#define action_string_int32_uint64_keyword$
-#define func_uint64_string_int32_uint64_keyword$ return
-#define func_int32_string_int32_uint64_keyword$ return
-#define func_string_string_int32_uint64_keyword$ return
-#define func_uint32_string_int32_uint64_keyword$ return
-#define func_intptr_string_int32_uint64_keyword$ return
-#define action_string_int32_int32_keyword$
-#define func_uint64_string_int32_int32_keyword$ return
-#define func_int32_string_int32_int32_keyword$ return
+#define func_intptr_string_uint64_uint64_keyword$ return
+#define func_intptr_uint32_keyword$ return
+#define func_intptr_uint32_int32_keyword$ return
+#define func_intptr_uint32_int32_int32_keyword$ return
+#define func_intptr_uint32_int32_intptr_keyword$ return
+#define func_intptr_uint32_int32_string_keyword$ return
+#define func_intptr_uint32_int32_uint32_keyword$ return
+#define func_intptr_uint32_int32_uint64_keyword$ return
+#define func_intptr_uint32_intptr_keyword$ return
+#define func_intptr_uint32_intptr_int32_keyword$ return
+#define func_intptr_uint32_intptr_intptr_keyword$ return
+#define func_intptr_uint32_intptr_string_keyword$ return
+#define func_intptr_uint32_intptr_uint32_keyword$ return
+#define func_intptr_uint32_intptr_uint64_keyword$ return
+#define func_intptr_uint32_string_keyword$ return
+#define func_intptr_uint32_string_int32_keyword$ return
+#define func_intptr_uint32_string_intptr_keyword$ return
+#define func_intptr_uint32_string_string_keyword$ return
+#define func_intptr_uint32_string_uint32_keyword$ return
+#define func_intptr_uint32_string_uint64_keyword$ return
+#define func_intptr_uint32_uint32_keyword$ return
+#define func_intptr_uint32_uint32_int32_keyword$ return
+#define func_intptr_uint32_uint32_intptr_keyword$ return
+#define func_intptr_uint32_uint32_string_keyword$ return
+#define func_intptr_uint32_uint32_uint32_keyword$ return
+#define func_intptr_uint32_uint32_uint64_keyword$ return
+#define func_intptr_uint32_uint64_keyword$ return
+#define func_intptr_uint32_uint64_int32_keyword$ return
+#define func_intptr_uint32_uint64_intptr_keyword$ return
+#define func_intptr_uint32_uint64_string_keyword$ return
+#define func_intptr_uint32_uint64_uint32_keyword$ return
+#define func_intptr_uint32_uint64_uint64_keyword$ return
+#define func_intptr_uint64_keyword$ return
+#define func_intptr_uint64_int32_keyword$ return
+#define func_intptr_uint64_int32_int32_keyword$ return
+#define func_intptr_uint64_int32_intptr_keyword$ return
+#define func_intptr_uint64_int32_string_keyword$ return
+#define func_intptr_uint64_int32_uint32_keyword$ return
+#define func_intptr_uint64_int32_uint64_keyword$ return
+#define func_intptr_uint64_intptr_keyword$ return
+#define func_intptr_uint64_intptr_int32_keyword$ return
+#define func_intptr_uint64_intptr_intptr_keyword$ return
+#define func_intptr_uint64_intptr_string_keyword$ return
+#define func_intptr_uint64_intptr_uint32_keyword$ return
+#define func_intptr_uint64_intptr_uint64_keyword$ return
+#define func_intptr_uint64_string_keyword$ return
+#define func_intptr_uint64_string_int32_keyword$ return
+#define func_intptr_uint64_string_intptr_keyword$ return
+#define func_intptr_uint64_string_string_keyword$ return
+#define func_intptr_uint64_string_uint32_keyword$ return
+#define func_intptr_uint64_string_uint64_keyword$ return
+#define func_intptr_uint64_uint32_keyword$ return
+#define func_intptr_uint64_uint32_int32_keyword$ return
+#define func_intptr_uint64_uint32_intptr_keyword$ return
+#define func_intptr_uint64_uint32_string_keyword$ return
+#define func_intptr_uint64_uint32_uint32_keyword$ return
+#define func_intptr_uint64_uint32_uint64_keyword$ return
+#define func_intptr_uint64_uint64_keyword$ return
+#define func_intptr_uint64_uint64_int32_keyword$ return
+#define func_intptr_uint64_uint64_intptr_keyword$ return
+#define func_intptr_uint64_uint64_string_keyword$ return
+#define func_intptr_uint64_uint64_uint32_keyword$ return
+#define func_intptr_uint64_uint64_uint64_keyword$ return
+#define func_string_keyword$ return
+#define func_string_int32_keyword$ return
+#define func_string_int32_int32_keyword$ return
+#define func_string_int32_int32_int32_keyword$ return
+#define func_string_int32_int32_intptr_keyword$ return
+#define func_string_int32_int32_string_keyword$ return
+#define func_string_int32_int32_uint32_keyword$ return
+#define func_string_int32_int32_uint64_keyword$ return
+#define func_string_int32_intptr_keyword$ return
+#define func_string_int32_intptr_int32_keyword$ return
+#define func_string_int32_intptr_intptr_keyword$ return
+#define func_string_int32_intptr_string_keyword$ return
+#define func_string_int32_intptr_uint32_keyword$ return
+#define func_string_int32_intptr_uint64_keyword$ return
+#define func_string_int32_string_keyword$ return
+#define func_string_int32_string_int32_keyword$ return
+#define func_string_int32_string_intptr_keyword$ return
+#define func_string_int32_string_string_keyword$ return
+#define func_string_int32_string_uint32_keyword$ return
+#define func_string_int32_string_uint64_keyword$ return
+#define func_string_int32_uint32_keyword$ return
+#define func_string_int32_uint32_int32_keyword$ return
+#define func_string_int32_uint32_intptr_keyword$ return
+#define func_string_int32_uint32_string_keyword$ return
+#define func_string_int32_uint32_uint32_keyword$ return
+#define func_string_int32_uint32_uint64_keyword$ return
+#define func_string_int32_uint64_keyword$ return
+#define func_string_int32_uint64_int32_keyword$ return
+#define func_string_int32_uint64_intptr_keyword$ return
+#define func_string_int32_uint64_string_keyword$ return
+#define func_string_int32_uint64_uint32_keyword$ return
+#define func_string_int32_uint64_uint64_keyword$ return
+#define func_string_intptr_keyword$ return
+#define func_string_intptr_int32_keyword$ return
+#define func_string_intptr_int32_int32_keyword$ return
+#define func_string_intptr_int32_intptr_keyword$ return
+#define func_string_intptr_int32_string_keyword$ return
+#define func_string_intptr_int32_uint32_keyword$ return
+#define func_string_intptr_int32_uint64_keyword$ return
+#define func_string_intptr_intptr_keyword$ return
+#define func_string_intptr_intptr_int32_keyword$ return
+#define func_string_intptr_intptr_intptr_keyword$ return
+#define func_string_intptr_intptr_string_keyword$ return
+#define func_string_intptr_intptr_uint32_keyword$ return
+#define func_string_intptr_intptr_uint64_keyword$ return
+#define func_string_intptr_string_keyword$ return
+#define func_string_intptr_string_int32_keyword$ return
+#define func_string_intptr_string_intptr_keyword$ return
+#define func_string_intptr_string_string_keyword$ return
+#define func_string_intptr_string_uint32_keyword$ return
+#define func_string_intptr_string_uint64_keyword$ return
+#define func_string_intptr_uint32_keyword$ return
+#define func_string_intptr_uint32_int32_keyword$ return
+#define func_string_intptr_uint32_intptr_keyword$ return
+#define func_string_intptr_uint32_string_keyword$ return
+#define func_string_intptr_uint32_uint32_keyword$ return
+#define func_string_intptr_uint32_uint64_keyword$ return
+#define func_string_intptr_uint64_keyword$ return
+#define func_string_intptr_uint64_int32_keyword$ return
+#define func_string_intptr_uint64_intptr_keyword$ return
+#define func_string_intptr_uint64_string_keyword$ return
+#define func_string_intptr_uint64_uint32_keyword$ return
+#define func_string_intptr_uint64_uint64_keyword$ return
+#define func_string_string_keyword$ return
+#define func_string_string_int32_keyword$ return
 #define func_string_string_int32_int32_keyword$ return
-#define func_uint32_string_int32_int32_keyword$ return
-#define func_intptr_string_int32_int32_keyword$ return
-#define action_string_int32_string_keyword$
-#define func_uint64_string_int32_string_keyword$ return
-#define func_int32_string_int32_string_keyword$ return
+#define func_string_string_int32_intptr_keyword$ return
 #define func_string_string_int32_string_keyword$ return
-#define func_uint32_string_int32_string_keyword$ return
-#define func_intptr_string_int32_string_keyword$ return
-#define action_string_int32_uint32_keyword$
-#define func_uint64_string_int32_uint32_keyword$ return
-#define func_int32_string_int32_uint32_keyword$ return
 #define func_string_string_int32_uint32_keyword$ return
-#define func_uint32_string_int32_uint32_keyword$ return
-#define func_intptr_string_int32_uint32_keyword$ return
-#define action_string_int32_intptr_keyword$
-#define func_uint64_string_int32_intptr_keyword$ return
-#define func_int32_string_int32_intptr_keyword$ return
-#define func_string_string_int32_intptr_keyword$ return
-#define func_uint32_string_int32_intptr_keyword$ return
-#define func_intptr_string_int32_intptr_keyword$ return
-#define action_string_string_uint64_keyword$
-#define func_uint64_string_string_uint64_keyword$ return
-#define func_int32_string_string_uint64_keyword$ return
-#define func_string_string_string_uint64_keyword$ return
-#define func_uint32_string_string_uint64_keyword$ return
-#define func_intptr_string_string_uint64_keyword$ return
-#define action_string_string_int32_keyword$
-#define func_uint64_string_string_int32_keyword$ return
-#define func_int32_string_string_int32_keyword$ return
+#define func_string_string_int32_uint64_keyword$ return
+#define func_string_string_intptr_keyword$ return
+#define func_string_string_intptr_int32_keyword$ return
+#define func_string_string_intptr_intptr_keyword$ return
+#define func_string_string_intptr_string_keyword$ return
+#define func_string_string_intptr_uint32_keyword$ return
+#define func_string_string_intptr_uint64_keyword$ return
+#define func_string_string_string_keyword$ return
 #define func_string_string_string_int32_keyword$ return
-#define func_uint32_string_string_int32_keyword$ return
-#define func_intptr_string_string_int32_keyword$ return
-#define action_string_string_string_keyword$
-#define func_uint64_string_string_string_keyword$ return
-#define func_int32_string_string_string_keyword$ return
+#define func_string_string_string_intptr_keyword$ return
 #define func_string_string_string_string_keyword$ return
-#define func_uint32_string_string_string_keyword$ return
-#define func_intptr_string_string_string_keyword$ return
-#define action_string_string_uint32_keyword$
-#define func_uint64_string_string_uint32_keyword$ return
-#define func_int32_string_string_uint32_keyword$ return
 #define func_string_string_string_uint32_keyword$ return
-#define func_uint32_string_string_uint32_keyword$ return
-#define func_intptr_string_string_uint32_keyword$ return
-#define action_string_string_intptr_keyword$
-#define func_uint64_string_string_intptr_keyword$ return
-#define func_int32_string_string_intptr_keyword$ return
-#define func_string_string_string_intptr_keyword$ return
-#define func_uint32_string_string_intptr_keyword$ return
-#define func_intptr_string_string_intptr_keyword$ return
-#define action_string_uint32_uint64_keyword$
-#define func_uint64_string_uint32_uint64_keyword$ return
-#define func_int32_string_uint32_uint64_keyword$ return
-#define func_string_string_uint32_uint64_keyword$ return
-#define func_uint32_string_uint32_uint64_keyword$ return
-#define func_intptr_string_uint32_uint64_keyword$ return
-#define action_string_uint32_int32_keyword$
-#define func_uint64_string_uint32_int32_keyword$ return
-#define func_int32_string_uint32_int32_keyword$ return
+#define func_string_string_string_uint64_keyword$ return
+#define func_string_string_uint32_keyword$ return
 #define func_string_string_uint32_int32_keyword$ return
-#define func_uint32_string_uint32_int32_keyword$ return
-#define func_intptr_string_uint32_int32_keyword$ return
-#define action_string_uint32_string_keyword$
-#define func_uint64_string_uint32_string_keyword$ return
-#define func_int32_string_uint32_string_keyword$ return
+#define func_string_string_uint32_intptr_keyword$ return
 #define func_string_string_uint32_string_keyword$ return
-#define func_uint32_string_uint32_string_keyword$ return
-#define func_intptr_string_uint32_string_keyword$ return
-#define action_string_uint32_uint32_keyword$
-#define func_uint64_string_uint32_uint32_keyword$ return
-#define func_int32_string_uint32_uint32_keyword$ return
 #define func_string_string_uint32_uint32_keyword$ return
-#define func_uint32_string_uint32_uint32_keyword$ return
-#define func_intptr_string_uint32_uint32_keyword$ return
-#define action_string_uint32_intptr_keyword$
-#define func_uint64_string_uint32_intptr_keyword$ return
-#define func_int32_string_uint32_intptr_keyword$ return
-#define func_string_string_uint32_intptr_keyword$ return
-#define func_uint32_string_uint32_intptr_keyword$ return
-#define func_intptr_string_uint32_intptr_keyword$ return
-#define action_string_intptr_uint64_keyword$
-#define func_uint64_string_intptr_uint64_keyword$ return
-#define func_int32_string_intptr_uint64_keyword$ return
-#define func_string_string_intptr_uint64_keyword$ return
-#define func_uint32_string_intptr_uint64_keyword$ return
-#define func_intptr_string_intptr_uint64_keyword$ return
-#define action_string_intptr_int32_keyword$
-#define func_uint64_string_intptr_int32_keyword$ return
-#define func_int32_string_intptr_int32_keyword$ return
-#define func_string_string_intptr_int32_keyword$ return
-#define func_uint32_string_intptr_int32_keyword$ return
-#define func_intptr_string_intptr_int32_keyword$ return
-#define action_string_intptr_string_keyword$
-#define func_uint64_string_intptr_string_keyword$ return
-#define func_int32_string_intptr_string_keyword$ return
-#define func_string_string_intptr_string_keyword$ return
-#define func_uint32_string_intptr_string_keyword$ return
-#define func_intptr_string_intptr_string_keyword$ return
-#define action_string_intptr_uint32_keyword$
-#define func_uint64_string_intptr_uint32_keyword$ return
-#define func_int32_string_intptr_uint32_keyword$ return
-#define func_string_string_intptr_uint32_keyword$ return
-#define func_uint32_string_intptr_uint32_keyword$ return
-#define func_intptr_string_intptr_uint32_keyword$ return
-#define action_string_intptr_intptr_keyword$
-#define func_uint64_string_intptr_intptr_keyword$ return
-#define func_int32_string_intptr_intptr_keyword$ return
-#define func_string_string_intptr_intptr_keyword$ return
-#define func_uint32_string_intptr_intptr_keyword$ return
-#define func_intptr_string_intptr_intptr_keyword$ return
-#define action_uint32_uint64_uint64_keyword$
-#define func_uint64_uint32_uint64_uint64_keyword$ return
-#define func_int32_uint32_uint64_uint64_keyword$ return
-#define func_string_uint32_uint64_uint64_keyword$ return
-#define func_uint32_uint32_uint64_uint64_keyword$ return
-#define func_intptr_uint32_uint64_uint64_keyword$ return
-#define action_uint32_uint64_int32_keyword$
-#define func_uint64_uint32_uint64_int32_keyword$ return
-#define func_int32_uint32_uint64_int32_keyword$ return
-#define func_string_uint32_uint64_int32_keyword$ return
-#define func_uint32_uint32_uint64_int32_keyword$ return
-#define func_intptr_uint32_uint64_int32_keyword$ return
-#define action_uint32_uint64_string_keyword$
-#define func_uint64_uint32_uint64_string_keyword$ return
-#define func_int32_uint32_uint64_string_keyword$ return
-#define func_string_uint32_uint64_string_keyword$ return
-#define func_uint32_uint32_uint64_string_keyword$ return
-#define func_intptr_uint32_uint64_string_keyword$ return
-#define action_uint32_uint64_uint32_keyword$
-#define func_uint64_uint32_uint64_uint32_keyword$ return
-#define func_int32_uint32_uint64_uint32_keyword$ return
-#define func_string_uint32_uint64_uint32_keyword$ return
-#define func_uint32_uint32_uint64_uint32_keyword$ return
-#define func_intptr_uint32_uint64_uint32_keyword$ return
-#define action_uint32_uint64_intptr_keyword$
-#define func_uint64_uint32_uint64_intptr_keyword$ return
-#define func_int32_uint32_uint64_intptr_keyword$ return
-#define func_string_uint32_uint64_intptr_keyword$ return
-#define func_uint32_uint32_uint64_intptr_keyword$ return
-#define func_intptr_uint32_uint64_intptr_keyword$ return
-#define action_uint32_int32_uint64_keyword$
-#define func_uint64_uint32_int32_uint64_keyword$ return
-#define func_int32_uint32_int32_uint64_keyword$ return
-#define func_string_uint32_int32_uint64_keyword$ return
-#define func_uint32_uint32_int32_uint64_keyword$ return
-#define func_intptr_uint32_int32_uint64_keyword$ return
-#define action_uint32_int32_int32_keyword$
-#define func_uint64_uint32_int32_int32_keyword$ return
-#define func_int32_uint32_int32_int32_keyword$ return
+#define func_string_string_uint32_uint64_keyword$ return
+#define func_string_string_uint64_keyword$ return
+#define func_string_string_uint64_int32_keyword$ return
+#define func_string_string_uint64_intptr_keyword$ return
+#define func_string_string_uint64_string_keyword$ return
+#define func_string_string_uint64_uint32_keyword$ return
+#define func_string_string_uint64_uint64_keyword$ return
+#define func_string_uint32_keyword$ return
+#define func_string_uint32_int32_keyword$ return
 #define func_string_uint32_int32_int32_keyword$ return
-#define func_uint32_uint32_int32_int32_keyword$ return
-#define func_intptr_uint32_int32_int32_keyword$ return
-#define action_uint32_int32_string_keyword$
-#define func_uint64_uint32_int32_string_keyword$ return
-#define func_int32_uint32_int32_string_keyword$ return
+#define func_string_uint32_int32_intptr_keyword$ return
 #define func_string_uint32_int32_string_keyword$ return
-#define func_uint32_uint32_int32_string_keyword$ return
-#define func_intptr_uint32_int32_string_keyword$ return
-#define action_uint32_int32_uint32_keyword$
-#define func_uint64_uint32_int32_uint32_keyword$ return
-#define func_int32_uint32_int32_uint32_keyword$ return
 #define func_string_uint32_int32_uint32_keyword$ return
-#define func_uint32_uint32_int32_uint32_keyword$ return
-#define func_intptr_uint32_int32_uint32_keyword$ return
-#define action_uint32_int32_intptr_keyword$
-#define func_uint64_uint32_int32_intptr_keyword$ return
-#define func_int32_uint32_int32_intptr_keyword$ return
-#define func_string_uint32_int32_intptr_keyword$ return
-#define func_uint32_uint32_int32_intptr_keyword$ return
-#define func_intptr_uint32_int32_intptr_keyword$ return
-#define action_uint32_string_uint64_keyword$
-#define func_uint64_uint32_string_uint64_keyword$ return
-#define func_int32_uint32_string_uint64_keyword$ return
-#define func_string_uint32_string_uint64_keyword$ return
-#define func_uint32_uint32_string_uint64_keyword$ return
-#define func_intptr_uint32_string_uint64_keyword$ return
-#define action_uint32_string_int32_keyword$
-#define func_uint64_uint32_string_int32_keyword$ return
-#define func_int32_uint32_string_int32_keyword$ return
+#define func_string_uint32_int32_uint64_keyword$ return
+#define func_string_uint32_intptr_keyword$ return
+#define func_string_uint32_intptr_int32_keyword$ return
+#define func_string_uint32_intptr_intptr_keyword$ return
+#define func_string_uint32_intptr_string_keyword$ return
+#define func_string_uint32_intptr_uint32_keyword$ return
+#define func_string_uint32_intptr_uint64_keyword$ return
+#define func_string_uint32_string_keyword$ return
 #define func_string_uint32_string_int32_keyword$ return
-#define func_uint32_uint32_string_int32_keyword$ return
-#define func_intptr_uint32_string_int32_keyword$ return
-#define action_uint32_string_string_keyword$
-#define func_uint64_uint32_string_string_keyword$ return
-#define func_int32_uint32_string_string_keyword$ return
+#define func_string_uint32_string_intptr_keyword$ return
 #define func_string_uint32_string_string_keyword$ return
-#define func_uint32_uint32_string_string_keyword$ return
-#define func_intptr_uint32_string_string_keyword$ return
-#define action_uint32_string_uint32_keyword$
-#define func_uint64_uint32_string_uint32_keyword$ return
-#define func_int32_uint32_string_uint32_keyword$ return
 #define func_string_uint32_string_uint32_keyword$ return
-#define func_uint32_uint32_string_uint32_keyword$ return
-#define func_intptr_uint32_string_uint32_keyword$ return
-#define action_uint32_string_intptr_keyword$
-#define func_uint64_uint32_string_intptr_keyword$ return
-#define func_int32_uint32_string_intptr_keyword$ return
-#define func_string_uint32_string_intptr_keyword$ return
-#define func_uint32_uint32_string_intptr_keyword$ return
-#define func_intptr_uint32_string_intptr_keyword$ return
-#define action_uint32_uint32_uint64_keyword$
-#define func_uint64_uint32_uint32_uint64_keyword$ return
-#define func_int32_uint32_uint32_uint64_keyword$ return
-#define func_string_uint32_uint32_uint64_keyword$ return
-#define func_uint32_uint32_uint32_uint64_keyword$ return
-#define func_intptr_uint32_uint32_uint64_keyword$ return
-#define action_uint32_uint32_int32_keyword$
-#define func_uint64_uint32_uint32_int32_keyword$ return
-#define func_int32_uint32_uint32_int32_keyword$ return
+#define func_string_uint32_string_uint64_keyword$ return
+#define func_string_uint32_uint32_keyword$ return
 #define func_string_uint32_uint32_int32_keyword$ return
-#define func_uint32_uint32_uint32_int32_keyword$ return
-#define func_intptr_uint32_uint32_int32_keyword$ return
-#define action_uint32_uint32_string_keyword$
-#define func_uint64_uint32_uint32_string_keyword$ return
-#define func_int32_uint32_uint32_string_keyword$ return
+#define func_string_uint32_uint32_intptr_keyword$ return
 #define func_string_uint32_uint32_string_keyword$ return
-#define func_uint32_uint32_uint32_string_keyword$ return
-#define func_intptr_uint32_uint32_string_keyword$ return
-#define action_uint32_uint32_uint32_keyword$
-#define func_uint64_uint32_uint32_uint32_keyword$ return
-#define func_int32_uint32_uint32_uint32_keyword$ return
 #define func_string_uint32_uint32_uint32_keyword$ return
-#define func_uint32_uint32_uint32_uint32_keyword$ return
-#define func_intptr_uint32_uint32_uint32_keyword$ return
-#define action_uint32_uint32_intptr_keyword$
-#define func_uint64_uint32_uint32_intptr_keyword$ return
-#define func_int32_uint32_uint32_intptr_keyword$ return
-#define func_string_uint32_uint32_intptr_keyword$ return
-#define func_uint32_uint32_uint32_intptr_keyword$ return
-#define func_intptr_uint32_uint32_intptr_keyword$ return
-#define action_uint32_intptr_uint64_keyword$
-#define func_uint64_uint32_intptr_uint64_keyword$ return
-#define func_int32_uint32_intptr_uint64_keyword$ return
-#define func_string_uint32_intptr_uint64_keyword$ return
-#define func_uint32_uint32_intptr_uint64_keyword$ return
-#define func_intptr_uint32_intptr_uint64_keyword$ return
-#define action_uint32_intptr_int32_keyword$
-#define func_uint64_uint32_intptr_int32_keyword$ return
-#define func_int32_uint32_intptr_int32_keyword$ return
-#define func_string_uint32_intptr_int32_keyword$ return
-#define func_uint32_uint32_intptr_int32_keyword$ return
-#define func_intptr_uint32_intptr_int32_keyword$ return
-#define action_uint32_intptr_string_keyword$
-#define func_uint64_uint32_intptr_string_keyword$ return
-#define func_int32_uint32_intptr_string_keyword$ return
-#define func_string_uint32_intptr_string_keyword$ return
-#define func_uint32_uint32_intptr_string_keyword$ return
-#define func_intptr_uint32_intptr_string_keyword$ return
-#define action_uint32_intptr_uint32_keyword$
-#define func_uint64_uint32_intptr_uint32_keyword$ return
-#define func_int32_uint32_intptr_uint32_keyword$ return
-#define func_string_uint32_intptr_uint32_keyword$ return
-#define func_uint32_uint32_intptr_uint32_keyword$ return
-#define func_intptr_uint32_intptr_uint32_keyword$ return
-#define action_uint32_intptr_intptr_keyword$
-#define func_uint64_uint32_intptr_intptr_keyword$ return
-#define func_int32_uint32_intptr_intptr_keyword$ return
-#define func_string_uint32_intptr_intptr_keyword$ return
-#define func_uint32_uint32_intptr_intptr_keyword$ return
-#define func_intptr_uint32_intptr_intptr_keyword$ return
-#define action_intptr_uint64_uint64_keyword$
-#define func_uint64_intptr_uint64_uint64_keyword$ return
-#define func_int32_intptr_uint64_uint64_keyword$ return
-#define func_string_intptr_uint64_uint64_keyword$ return
-#define func_uint32_intptr_uint64_uint64_keyword$ return
-#define func_intptr_intptr_uint64_uint64_keyword$ return
-#define action_intptr_uint64_int32_keyword$
-#define func_uint64_intptr_uint64_int32_keyword$ return
-#define func_int32_intptr_uint64_int32_keyword$ return
-#define func_string_intptr_uint64_int32_keyword$ return
-#define func_uint32_intptr_uint64_int32_keyword$ return
-#define func_intptr_intptr_uint64_int32_keyword$ return
-#define action_intptr_uint64_string_keyword$
-#define func_uint64_intptr_uint64_string_keyword$ return
-#define func_int32_intptr_uint64_string_keyword$ return
-#define func_string_intptr_uint64_string_keyword$ return
-#define func_uint32_intptr_uint64_string_keyword$ return
-#define func_intptr_intptr_uint64_string_keyword$ return
-#define action_intptr_uint64_uint32_keyword$
-#define func_uint64_intptr_uint64_uint32_keyword$ return
-#define func_int32_intptr_uint64_uint32_keyword$ return
-#define func_string_intptr_uint64_uint32_keyword$ return
-#define func_uint32_intptr_uint64_uint32_keyword$ return
-#define func_intptr_intptr_uint64_uint32_keyword$ return
-#define action_intptr_uint64_intptr_keyword$
-#define func_uint64_intptr_uint64_intptr_keyword$ return
-#define func_int32_intptr_uint64_intptr_keyword$ return
-#define func_string_intptr_uint64_intptr_keyword$ return
-#define func_uint32_intptr_uint64_intptr_keyword$ return
-#define func_intptr_intptr_uint64_intptr_keyword$ return
-#define action_intptr_int32_uint64_keyword$
-#define func_uint64_intptr_int32_uint64_keyword$ return
-#define func_int32_intptr_int32_uint64_keyword$ return
-#define func_string_intptr_int32_uint64_keyword$ return
-#define func_uint32_intptr_int32_uint64_keyword$ return
-#define func_intptr_intptr_int32_uint64_keyword$ return
-#define action_intptr_int32_int32_keyword$
-#define func_uint64_intptr_int32_int32_keyword$ return
-#define func_int32_intptr_int32_int32_keyword$ return
-#define func_string_intptr_int32_int32_keyword$ return
+#define func_string_uint32_uint32_uint64_keyword$ return
+#define func_string_uint32_uint64_keyword$ return
+#define func_string_uint32_uint64_int32_keyword$ return
+#define func_string_uint32_uint64_intptr_keyword$ return
+#define func_string_uint32_uint64_string_keyword$ return
+#define func_string_uint32_uint64_uint32_keyword$ return
+#define func_string_uint32_uint64_uint64_keyword$ return
+#define func_string_uint64_keyword$ return
+#define func_string_uint64_int32_keyword$ return
+#define func_string_uint64_int32_int32_keyword$ return
+#define func_string_uint64_int32_intptr_keyword$ return
+#define func_string_uint64_int32_string_keyword$ return
+#define func_string_uint64_int32_uint32_keyword$ return
+#define func_string_uint64_int32_uint64_keyword$ return
+#define func_string_uint64_intptr_keyword$ return
+#define func_string_uint64_intptr_int32_keyword$ return
+#define func_string_uint64_intptr_intptr_keyword$ return
+#define func_string_uint64_intptr_string_keyword$ return
+#define func_string_uint64_intptr_uint32_keyword$ return
+#define func_string_uint64_intptr_uint64_keyword$ return
+#define func_string_uint64_string_keyword$ return
+#define func_string_uint64_string_int32_keyword$ return
+#define func_string_uint64_string_intptr_keyword$ return
+#define func_string_uint64_string_string_keyword$ return
+#define func_string_uint64_string_uint32_keyword$ return
+#define func_string_uint64_string_uint64_keyword$ return
+#define func_string_uint64_uint32_keyword$ return
+#define func_string_uint64_uint32_int32_keyword$ return
+#define func_string_uint64_uint32_intptr_keyword$ return
+#define func_string_uint64_uint32_string_keyword$ return
+#define func_string_uint64_uint32_uint32_keyword$ return
+#define func_string_uint64_uint32_uint64_keyword$ return
+#define func_string_uint64_uint64_keyword$ return
+#define func_string_uint64_uint64_int32_keyword$ return
+#define func_string_uint64_uint64_intptr_keyword$ return
+#define func_string_uint64_uint64_string_keyword$ return
+#define func_string_uint64_uint64_uint32_keyword$ return
+#define func_string_uint64_uint64_uint64_keyword$ return
+#define func_uint32_keyword$ return
+#define func_uint32_int32_keyword$ return
+#define func_uint32_int32_int32_keyword$ return
+#define func_uint32_int32_int32_int32_keyword$ return
+#define func_uint32_int32_int32_intptr_keyword$ return
+#define func_uint32_int32_int32_string_keyword$ return
+#define func_uint32_int32_int32_uint32_keyword$ return
+#define func_uint32_int32_int32_uint64_keyword$ return
+#define func_uint32_int32_intptr_keyword$ return
+#define func_uint32_int32_intptr_int32_keyword$ return
+#define func_uint32_int32_intptr_intptr_keyword$ return
+#define func_uint32_int32_intptr_string_keyword$ return
+#define func_uint32_int32_intptr_uint32_keyword$ return
+#define func_uint32_int32_intptr_uint64_keyword$ return
+#define func_uint32_int32_string_keyword$ return
+#define func_uint32_int32_string_int32_keyword$ return
+#define func_uint32_int32_string_intptr_keyword$ return
+#define func_uint32_int32_string_string_keyword$ return
+#define func_uint32_int32_string_uint32_keyword$ return
+#define func_uint32_int32_string_uint64_keyword$ return
+#define func_uint32_int32_uint32_keyword$ return
+#define func_uint32_int32_uint32_int32_keyword$ return
+#define func_uint32_int32_uint32_intptr_keyword$ return
+#define func_uint32_int32_uint32_string_keyword$ return
+#define func_uint32_int32_uint32_uint32_keyword$ return
+#define func_uint32_int32_uint32_uint64_keyword$ return
+#define func_uint32_int32_uint64_keyword$ return
+#define func_uint32_int32_uint64_int32_keyword$ return
+#define func_uint32_int32_uint64_intptr_keyword$ return
+#define func_uint32_int32_uint64_string_keyword$ return
+#define func_uint32_int32_uint64_uint32_keyword$ return
+#define func_uint32_int32_uint64_uint64_keyword$ return
+#define func_uint32_intptr_keyword$ return
+#define func_uint32_intptr_int32_keyword$ return
 #define func_uint32_intptr_int32_int32_keyword$ return
-#define func_intptr_intptr_int32_int32_keyword$ return
-#define action_intptr_int32_string_keyword$
-#define func_uint64_intptr_int32_string_keyword$ return
-#define func_int32_intptr_int32_string_keyword$ return
-#define func_string_intptr_int32_string_keyword$ return
+#define func_uint32_intptr_int32_intptr_keyword$ return
 #define func_uint32_intptr_int32_string_keyword$ return
-#define func_intptr_intptr_int32_string_keyword$ return
-#define action_intptr_int32_uint32_keyword$
-#define func_uint64_intptr_int32_uint32_keyword$ return
-#define func_int32_intptr_int32_uint32_keyword$ return
-#define func_string_intptr_int32_uint32_keyword$ return
 #define func_uint32_intptr_int32_uint32_keyword$ return
-#define func_intptr_intptr_int32_uint32_keyword$ return
-#define action_intptr_int32_intptr_keyword$
-#define func_uint64_intptr_int32_intptr_keyword$ return
-#define func_int32_intptr_int32_intptr_keyword$ return
-#define func_string_intptr_int32_intptr_keyword$ return
-#define func_uint32_intptr_int32_intptr_keyword$ return
-#define func_intptr_intptr_int32_intptr_keyword$ return
-#define action_intptr_string_uint64_keyword$
-#define func_uint64_intptr_string_uint64_keyword$ return
-#define func_int32_intptr_string_uint64_keyword$ return
-#define func_string_intptr_string_uint64_keyword$ return
-#define func_uint32_intptr_string_uint64_keyword$ return
-#define func_intptr_intptr_string_uint64_keyword$ return
-#define action_intptr_string_int32_keyword$
-#define func_uint64_intptr_string_int32_keyword$ return
-#define func_int32_intptr_string_int32_keyword$ return
-#define func_string_intptr_string_int32_keyword$ return
+#define func_uint32_intptr_int32_uint64_keyword$ return
+#define func_uint32_intptr_intptr_keyword$ return
+#define func_uint32_intptr_intptr_int32_keyword$ return
+#define func_uint32_intptr_intptr_intptr_keyword$ return
+#define func_uint32_intptr_intptr_string_keyword$ return
+#define func_uint32_intptr_intptr_uint32_keyword$ return
+#define func_uint32_intptr_intptr_uint64_keyword$ return
+#define func_uint32_intptr_string_keyword$ return
 #define func_uint32_intptr_string_int32_keyword$ return
-#define func_intptr_intptr_string_int32_keyword$ return
-#define action_intptr_string_string_keyword$
-#define func_uint64_intptr_string_string_keyword$ return
-#define func_int32_intptr_string_string_keyword$ return
-#define func_string_intptr_string_string_keyword$ return
+#define func_uint32_intptr_string_intptr_keyword$ return
 #define func_uint32_intptr_string_string_keyword$ return
-#define func_intptr_intptr_string_string_keyword$ return
-#define action_intptr_string_uint32_keyword$
-#define func_uint64_intptr_string_uint32_keyword$ return
-#define func_int32_intptr_string_uint32_keyword$ return
-#define func_string_intptr_string_uint32_keyword$ return
 #define func_uint32_intptr_string_uint32_keyword$ return
-#define func_intptr_intptr_string_uint32_keyword$ return
-#define action_intptr_string_intptr_keyword$
-#define func_uint64_intptr_string_intptr_keyword$ return
-#define func_int32_intptr_string_intptr_keyword$ return
-#define func_string_intptr_string_intptr_keyword$ return
-#define func_uint32_intptr_string_intptr_keyword$ return
-#define func_intptr_intptr_string_intptr_keyword$ return
-#define action_intptr_uint32_uint64_keyword$
-#define func_uint64_intptr_uint32_uint64_keyword$ return
-#define func_int32_intptr_uint32_uint64_keyword$ return
-#define func_string_intptr_uint32_uint64_keyword$ return
-#define func_uint32_intptr_uint32_uint64_keyword$ return
-#define func_intptr_intptr_uint32_uint64_keyword$ return
-#define action_intptr_uint32_int32_keyword$
-#define func_uint64_intptr_uint32_int32_keyword$ return
-#define func_int32_intptr_uint32_int32_keyword$ return
-#define func_string_intptr_uint32_int32_keyword$ return
+#define func_uint32_intptr_string_uint64_keyword$ return
+#define func_uint32_intptr_uint32_keyword$ return
 #define func_uint32_intptr_uint32_int32_keyword$ return
-#define func_intptr_intptr_uint32_int32_keyword$ return
-#define action_intptr_uint32_string_keyword$
-#define func_uint64_intptr_uint32_string_keyword$ return
-#define func_int32_intptr_uint32_string_keyword$ return
-#define func_string_intptr_uint32_string_keyword$ return
+#define func_uint32_intptr_uint32_intptr_keyword$ return
 #define func_uint32_intptr_uint32_string_keyword$ return
-#define func_intptr_intptr_uint32_string_keyword$ return
-#define action_intptr_uint32_uint32_keyword$
-#define func_uint64_intptr_uint32_uint32_keyword$ return
-#define func_int32_intptr_uint32_uint32_keyword$ return
-#define func_string_intptr_uint32_uint32_keyword$ return
 #define func_uint32_intptr_uint32_uint32_keyword$ return
-#define func_intptr_intptr_uint32_uint32_keyword$ return
-#define action_intptr_uint32_intptr_keyword$
-#define func_uint64_intptr_uint32_intptr_keyword$ return
-#define func_int32_intptr_uint32_intptr_keyword$ return
-#define func_string_intptr_uint32_intptr_keyword$ return
-#define func_uint32_intptr_uint32_intptr_keyword$ return
-#define func_intptr_intptr_uint32_intptr_keyword$ return
-#define action_intptr_intptr_uint64_keyword$
-#define func_uint64_intptr_intptr_uint64_keyword$ return
-#define func_int32_intptr_intptr_uint64_keyword$ return
-#define func_string_intptr_intptr_uint64_keyword$ return
-#define func_uint32_intptr_intptr_uint64_keyword$ return
-#define func_intptr_intptr_intptr_uint64_keyword$ return
-#define action_intptr_intptr_int32_keyword$
+#define func_uint32_intptr_uint32_uint64_keyword$ return
+#define func_uint32_intptr_uint64_keyword$ return
+#define func_uint32_intptr_uint64_int32_keyword$ return
+#define func_uint32_intptr_uint64_intptr_keyword$ return
+#define func_uint32_intptr_uint64_string_keyword$ return
+#define func_uint32_intptr_uint64_uint32_keyword$ return
+#define func_uint32_intptr_uint64_uint64_keyword$ return
+#define func_uint32_string_keyword$ return
+#define func_uint32_string_int32_keyword$ return
+#define func_uint32_string_int32_int32_keyword$ return
+#define func_uint32_string_int32_intptr_keyword$ return
+#define func_uint32_string_int32_string_keyword$ return
+#define func_uint32_string_int32_uint32_keyword$ return
+#define func_uint32_string_int32_uint64_keyword$ return
+#define func_uint32_string_intptr_keyword$ return
+#define func_uint32_string_intptr_int32_keyword$ return
+#define func_uint32_string_intptr_intptr_keyword$ return
+#define func_uint32_string_intptr_string_keyword$ return
+#define func_uint32_string_intptr_uint32_keyword$ return
+#define func_uint32_string_intptr_uint64_keyword$ return
+#define func_uint32_string_string_keyword$ return
+#define func_uint32_string_string_int32_keyword$ return
+#define func_uint32_string_string_intptr_keyword$ return
+#define func_uint32_string_string_string_keyword$ return
+#define func_uint32_string_string_uint32_keyword$ return
+#define func_uint32_string_string_uint64_keyword$ return
+#define func_uint32_string_uint32_keyword$ return
+#define func_uint32_string_uint32_int32_keyword$ return
+#define func_uint32_string_uint32_intptr_keyword$ return
+#define func_uint32_string_uint32_string_keyword$ return
+#define func_uint32_string_uint32_uint32_keyword$ return
+#define func_uint32_string_uint32_uint64_keyword$ return
+#define func_uint32_string_uint64_keyword$ return
+#define func_uint32_string_uint64_int32_keyword$ return
+#define func_uint32_string_uint64_intptr_keyword$ return
+#define func_uint32_string_uint64_string_keyword$ return
+#define func_uint32_string_uint64_uint32_keyword$ return
+#define func_uint32_string_uint64_uint64_keyword$ return
+#define func_uint32_uint32_keyword$ return
+#define func_uint32_uint32_int32_keyword$ return
+#define func_uint32_uint32_int32_int32_keyword$ return
+#define func_uint32_uint32_int32_intptr_keyword$ return
+#define func_uint32_uint32_int32_string_keyword$ return
+#define func_uint32_uint32_int32_uint32_keyword$ return
+#define func_uint32_uint32_int32_uint64_keyword$ return
+#define func_uint32_uint32_intptr_keyword$ return
+#define func_uint32_uint32_intptr_int32_keyword$ return
+#define func_uint32_uint32_intptr_intptr_keyword$ return
+#define func_uint32_uint32_intptr_string_keyword$ return
+#define func_uint32_uint32_intptr_uint32_keyword$ return
+#define func_uint32_uint32_intptr_uint64_keyword$ return
+#define func_uint32_uint32_string_keyword$ return
+#define func_uint32_uint32_string_int32_keyword$ return
+#define func_uint32_uint32_string_intptr_keyword$ return
+#define func_uint32_uint32_string_string_keyword$ return
+#define func_uint32_uint32_string_uint32_keyword$ return
+#define func_uint32_uint32_string_uint64_keyword$ return
+#define func_uint32_uint32_uint32_keyword$ return
+#define func_uint32_uint32_uint32_int32_keyword$ return
+#define func_uint32_uint32_uint32_intptr_keyword$ return
+#define func_uint32_uint32_uint32_string_keyword$ return
+#define func_uint32_uint32_uint32_uint32_keyword$ return
+#define func_uint32_uint32_uint32_uint64_keyword$ return
+#define func_uint32_uint32_uint64_keyword$ return
+#define func_uint32_uint32_uint64_int32_keyword$ return
+#define func_uint32_uint32_uint64_intptr_keyword$ return
+#define func_uint32_uint32_uint64_string_keyword$ return
+#define func_uint32_uint32_uint64_uint32_keyword$ return
+#define func_uint32_uint32_uint64_uint64_keyword$ return
+#define func_uint32_uint64_keyword$ return
+#define func_uint32_uint64_int32_keyword$ return
+#define func_uint32_uint64_int32_int32_keyword$ return
+#define func_uint32_uint64_int32_intptr_keyword$ return
+#define func_uint32_uint64_int32_string_keyword$ return
+#define func_uint32_uint64_int32_uint32_keyword$ return
+#define func_uint32_uint64_int32_uint64_keyword$ return
+#define func_uint32_uint64_intptr_keyword$ return
+#define func_uint32_uint64_intptr_int32_keyword$ return
+#define func_uint32_uint64_intptr_intptr_keyword$ return
+#define func_uint32_uint64_intptr_string_keyword$ return
+#define func_uint32_uint64_intptr_uint32_keyword$ return
+#define func_uint32_uint64_intptr_uint64_keyword$ return
+#define func_uint32_uint64_string_keyword$ return
+#define func_uint32_uint64_string_int32_keyword$ return
+#define func_uint32_uint64_string_intptr_keyword$ return
+#define func_uint32_uint64_string_string_keyword$ return
+#define func_uint32_uint64_string_uint32_keyword$ return
+#define func_uint32_uint64_string_uint64_keyword$ return
+#define func_uint32_uint64_uint32_keyword$ return
+#define func_uint32_uint64_uint32_int32_keyword$ return
+#define func_uint32_uint64_uint32_intptr_keyword$ return
+#define func_uint32_uint64_uint32_string_keyword$ return
+#define func_uint32_uint64_uint32_uint32_keyword$ return
+#define func_uint32_uint64_uint32_uint64_keyword$ return
+#define func_uint32_uint64_uint64_keyword$ return
+#define func_uint32_uint64_uint64_int32_keyword$ return
+#define func_uint32_uint64_uint64_intptr_keyword$ return
+#define func_uint32_uint64_uint64_string_keyword$ return
+#define func_uint32_uint64_uint64_uint32_keyword$ return
+#define func_uint32_uint64_uint64_uint64_keyword$ return
+#define func_uint64_keyword$ return
+#define func_uint64_int32_keyword$ return
+#define func_uint64_int32_int32_keyword$ return
+#define func_uint64_int32_int32_int32_keyword$ return
+#define func_uint64_int32_int32_intptr_keyword$ return
+#define func_uint64_int32_int32_string_keyword$ return
+#define func_uint64_int32_int32_uint32_keyword$ return
+#define func_uint64_int32_int32_uint64_keyword$ return
+#define func_uint64_int32_intptr_keyword$ return
+#define func_uint64_int32_intptr_int32_keyword$ return
+#define func_uint64_int32_intptr_intptr_keyword$ return
+#define func_uint64_int32_intptr_string_keyword$ return
+#define func_uint64_int32_intptr_uint32_keyword$ return
+#define func_uint64_int32_intptr_uint64_keyword$ return
+#define func_uint64_int32_string_keyword$ return
+#define func_uint64_int32_string_int32_keyword$ return
+#define func_uint64_int32_string_intptr_keyword$ return
+#define func_uint64_int32_string_string_keyword$ return
+#define func_uint64_int32_string_uint32_keyword$ return
+#define func_uint64_int32_string_uint64_keyword$ return
+#define func_uint64_int32_uint32_keyword$ return
+#define func_uint64_int32_uint32_int32_keyword$ return
+#define func_uint64_int32_uint32_intptr_keyword$ return
+#define func_uint64_int32_uint32_string_keyword$ return
+#define func_uint64_int32_uint32_uint32_keyword$ return
+#define func_uint64_int32_uint32_uint64_keyword$ return
+#define func_uint64_int32_uint64_keyword$ return
+#define func_uint64_int32_uint64_int32_keyword$ return
+#define func_uint64_int32_uint64_intptr_keyword$ return
+#define func_uint64_int32_uint64_string_keyword$ return
+#define func_uint64_int32_uint64_uint32_keyword$ return
+#define func_uint64_int32_uint64_uint64_keyword$ return
+#define func_uint64_intptr_keyword$ return
+#define func_uint64_intptr_int32_keyword$ return
+#define func_uint64_intptr_int32_int32_keyword$ return
+#define func_uint64_intptr_int32_intptr_keyword$ return
+#define func_uint64_intptr_int32_string_keyword$ return
+#define func_uint64_intptr_int32_uint32_keyword$ return
+#define func_uint64_intptr_int32_uint64_keyword$ return
+#define func_uint64_intptr_intptr_keyword$ return
 #define func_uint64_intptr_intptr_int32_keyword$ return
-#define func_int32_intptr_intptr_int32_keyword$ return
-#define func_string_intptr_intptr_int32_keyword$ return
-#define func_uint32_intptr_intptr_int32_keyword$ return
-#define func_intptr_intptr_intptr_int32_keyword$ return
-#define action_intptr_intptr_string_keyword$
+#define func_uint64_intptr_intptr_intptr_keyword$ return
 #define func_uint64_intptr_intptr_string_keyword$ return
-#define func_int32_intptr_intptr_string_keyword$ return
-#define func_string_intptr_intptr_string_keyword$ return
-#define func_uint32_intptr_intptr_string_keyword$ return
-#define func_intptr_intptr_intptr_string_keyword$ return
-#define action_intptr_intptr_uint32_keyword$
 #define func_uint64_intptr_intptr_uint32_keyword$ return
-#define func_int32_intptr_intptr_uint32_keyword$ return
-#define func_string_intptr_intptr_uint32_keyword$ return
-#define func_uint32_intptr_intptr_uint32_keyword$ return
-#define func_intptr_intptr_intptr_uint32_keyword$ return
-#define action_intptr_intptr_intptr_keyword$
-#define func_uint64_intptr_intptr_intptr_keyword$ return
-#define func_int32_intptr_intptr_intptr_keyword$ return
-#define func_string_intptr_intptr_intptr_keyword$ return
-#define func_uint32_intptr_intptr_intptr_keyword$ return
-#define func_intptr_intptr_intptr_intptr_keyword$ return
-#define action_keyword$
-#define func_uint64_keyword$ return
-#define func_int32_keyword$ return
-#define func_string_keyword$ return
-#define func_uint32_keyword$ return
-#define func_intptr_keyword$ return
-#define action_uint64_vars$ a
-#define func_uint64_uint64_vars$ a
-#define func_int32_uint64_vars$ a
-#define func_string_uint64_vars$ a
-#define func_uint32_uint64_vars$ a
-#define func_intptr_uint64_vars$ a
+#define func_uint64_intptr_intptr_uint64_keyword$ return
+#define func_uint64_intptr_string_keyword$ return
+#define func_uint64_intptr_string_int32_keyword$ return
+#define func_uint64_intptr_string_intptr_keyword$ return
+#define func_uint64_intptr_string_string_keyword$ return
+#define func_uint64_intptr_string_uint32_keyword$ return
+#define func_uint64_intptr_string_uint64_keyword$ return
+#define func_uint64_intptr_uint32_keyword$ return
+#define func_uint64_intptr_uint32_int32_keyword$ return
+#define func_uint64_intptr_uint32_intptr_keyword$ return
+#define func_uint64_intptr_uint32_string_keyword$ return
+#define func_uint64_intptr_uint32_uint32_keyword$ return
+#define func_uint64_intptr_uint32_uint64_keyword$ return
+#define func_uint64_intptr_uint64_keyword$ return
+#define func_uint64_intptr_uint64_int32_keyword$ return
+#define func_uint64_intptr_uint64_intptr_keyword$ return
+#define func_uint64_intptr_uint64_string_keyword$ return
+#define func_uint64_intptr_uint64_uint32_keyword$ return
+#define func_uint64_intptr_uint64_uint64_keyword$ return
+#define func_uint64_string_keyword$ return
+#define func_uint64_string_int32_keyword$ return
+#define func_uint64_string_int32_int32_keyword$ return
+#define func_uint64_string_int32_intptr_keyword$ return
+#define func_uint64_string_int32_string_keyword$ return
+#define func_uint64_string_int32_uint32_keyword$ return
+#define func_uint64_string_int32_uint64_keyword$ return
+#define func_uint64_string_intptr_keyword$ return
+#define func_uint64_string_intptr_int32_keyword$ return
+#define func_uint64_string_intptr_intptr_keyword$ return
+#define func_uint64_string_intptr_string_keyword$ return
+#define func_uint64_string_intptr_uint32_keyword$ return
+#define func_uint64_string_intptr_uint64_keyword$ return
+#define func_uint64_string_string_keyword$ return
+#define func_uint64_string_string_int32_keyword$ return
+#define func_uint64_string_string_intptr_keyword$ return
+#define func_uint64_string_string_string_keyword$ return
+#define func_uint64_string_string_uint32_keyword$ return
+#define func_uint64_string_string_uint64_keyword$ return
+#define func_uint64_string_uint32_keyword$ return
+#define func_uint64_string_uint32_int32_keyword$ return
+#define func_uint64_string_uint32_intptr_keyword$ return
+#define func_uint64_string_uint32_string_keyword$ return
+#define func_uint64_string_uint32_uint32_keyword$ return
+#define func_uint64_string_uint32_uint64_keyword$ return
+#define func_uint64_string_uint64_keyword$ return
+#define func_uint64_string_uint64_int32_keyword$ return
+#define func_uint64_string_uint64_intptr_keyword$ return
+#define func_uint64_string_uint64_string_keyword$ return
+#define func_uint64_string_uint64_uint32_keyword$ return
+#define func_uint64_string_uint64_uint64_keyword$ return
+#define func_uint64_uint32_keyword$ return
+#define func_uint64_uint32_int32_keyword$ return
+#define func_uint64_uint32_int32_int32_keyword$ return
+#define func_uint64_uint32_int32_intptr_keyword$ return
+#define func_uint64_uint32_int32_string_keyword$ return
+#define func_uint64_uint32_int32_uint32_keyword$ return
+#define func_uint64_uint32_int32_uint64_keyword$ return
+#define func_uint64_uint32_intptr_keyword$ return
+#define func_uint64_uint32_intptr_int32_keyword$ return
+#define func_uint64_uint32_intptr_intptr_keyword$ return
+#define func_uint64_uint32_intptr_string_keyword$ return
+#define func_uint64_uint32_intptr_uint32_keyword$ return
+#define func_uint64_uint32_intptr_uint64_keyword$ return
+#define func_uint64_uint32_string_keyword$ return
+#define func_uint64_uint32_string_int32_keyword$ return
+#define func_uint64_uint32_string_intptr_keyword$ return
+#define func_uint64_uint32_string_string_keyword$ return
+#define func_uint64_uint32_string_uint32_keyword$ return
+#define func_uint64_uint32_string_uint64_keyword$ return
+#define func_uint64_uint32_uint32_keyword$ return
+#define func_uint64_uint32_uint32_int32_keyword$ return
+#define func_uint64_uint32_uint32_intptr_keyword$ return
+#define func_uint64_uint32_uint32_string_keyword$ return
+#define func_uint64_uint32_uint32_uint32_keyword$ return
+#define func_uint64_uint32_uint32_uint64_keyword$ return
+#define func_uint64_uint32_uint64_keyword$ return
+#define func_uint64_uint32_uint64_int32_keyword$ return
+#define func_uint64_uint32_uint64_intptr_keyword$ return
+#define func_uint64_uint32_uint64_string_keyword$ return
+#define func_uint64_uint32_uint64_uint32_keyword$ return
+#define func_uint64_uint32_uint64_uint64_keyword$ return
+#define func_uint64_uint64_keyword$ return
+#define func_uint64_uint64_int32_keyword$ return
+#define func_uint64_uint64_int32_int32_keyword$ return
+#define func_uint64_uint64_int32_intptr_keyword$ return
+#define func_uint64_uint64_int32_string_keyword$ return
+#define func_uint64_uint64_int32_uint32_keyword$ return
+#define func_uint64_uint64_int32_uint64_keyword$ return
+#define func_uint64_uint64_intptr_keyword$ return
+#define func_uint64_uint64_intptr_int32_keyword$ return
+#define func_uint64_uint64_intptr_intptr_keyword$ return
+#define func_uint64_uint64_intptr_string_keyword$ return
+#define func_uint64_uint64_intptr_uint32_keyword$ return
+#define func_uint64_uint64_intptr_uint64_keyword$ return
+#define func_uint64_uint64_string_keyword$ return
+#define func_uint64_uint64_string_int32_keyword$ return
+#define func_uint64_uint64_string_intptr_keyword$ return
+#define func_uint64_uint64_string_string_keyword$ return
+#define func_uint64_uint64_string_uint32_keyword$ return
+#define func_uint64_uint64_string_uint64_keyword$ return
+#define func_uint64_uint64_uint32_keyword$ return
+#define func_uint64_uint64_uint32_int32_keyword$ return
+#define func_uint64_uint64_uint32_intptr_keyword$ return
+#define func_uint64_uint64_uint32_string_keyword$ return
+#define func_uint64_uint64_uint32_uint32_keyword$ return
+#define func_uint64_uint64_uint32_uint64_keyword$ return
+#define func_uint64_uint64_uint64_keyword$ return
+#define func_uint64_uint64_uint64_int32_keyword$ return
+#define func_uint64_uint64_uint64_intptr_keyword$ return
+#define func_uint64_uint64_uint64_string_keyword$ return
+#define func_uint64_uint64_uint64_uint32_keyword$ return
+#define func_uint64_uint64_uint64_uint64_keyword$ return
+#define action_vars$ 
 #define action_int32_vars$ a
-#define func_uint64_int32_vars$ a
-#define func_int32_int32_vars$ a
-#define func_string_int32_vars$ a
-#define func_uint32_int32_vars$ a
-#define func_intptr_int32_vars$ a
-#define action_string_vars$ a
-#define func_uint64_string_vars$ a
-#define func_int32_string_vars$ a
-#define func_string_string_vars$ a
-#define func_uint32_string_vars$ a
-#define func_intptr_string_vars$ a
-#define action_uint32_vars$ a
-#define func_uint64_uint32_vars$ a
-#define func_int32_uint32_vars$ a
-#define func_string_uint32_vars$ a
-#define func_uint32_uint32_vars$ a
-#define func_intptr_uint32_vars$ a
-#define action_intptr_vars$ a
-#define func_uint64_intptr_vars$ a
-#define func_int32_intptr_vars$ a
-#define func_string_intptr_vars$ a
-#define func_uint32_intptr_vars$ a
-#define func_intptr_intptr_vars$ a
-#define action_uint64_uint64_vars$ a, b
-#define func_uint64_uint64_uint64_vars$ a, b
-#define func_int32_uint64_uint64_vars$ a, b
-#define func_string_uint64_uint64_vars$ a, b
-#define func_uint32_uint64_uint64_vars$ a, b
-#define func_intptr_uint64_uint64_vars$ a, b
-#define action_uint64_int32_vars$ a, b
-#define func_uint64_uint64_int32_vars$ a, b
-#define func_int32_uint64_int32_vars$ a, b
-#define func_string_uint64_int32_vars$ a, b
-#define func_uint32_uint64_int32_vars$ a, b
-#define func_intptr_uint64_int32_vars$ a, b
-#define action_uint64_string_vars$ a, b
-#define func_uint64_uint64_string_vars$ a, b
-#define func_int32_uint64_string_vars$ a, b
-#define func_string_uint64_string_vars$ a, b
-#define func_uint32_uint64_string_vars$ a, b
-#define func_intptr_uint64_string_vars$ a, b
-#define action_uint64_uint32_vars$ a, b
-#define func_uint64_uint64_uint32_vars$ a, b
-#define func_int32_uint64_uint32_vars$ a, b
-#define func_string_uint64_uint32_vars$ a, b
-#define func_uint32_uint64_uint32_vars$ a, b
-#define func_intptr_uint64_uint32_vars$ a, b
-#define action_uint64_intptr_vars$ a, b
-#define func_uint64_uint64_intptr_vars$ a, b
-#define func_int32_uint64_intptr_vars$ a, b
-#define func_string_uint64_intptr_vars$ a, b
-#define func_uint32_uint64_intptr_vars$ a, b
-#define func_intptr_uint64_intptr_vars$ a, b
-#define action_int32_uint64_vars$ a, b
-#define func_uint64_int32_uint64_vars$ a, b
-#define func_int32_int32_uint64_vars$ a, b
-#define func_string_int32_uint64_vars$ a, b
-#define func_uint32_int32_uint64_vars$ a, b
-#define func_intptr_int32_uint64_vars$ a, b
 #define action_int32_int32_vars$ a, b
-#define func_uint64_int32_int32_vars$ a, b
-#define func_int32_int32_int32_vars$ a, b
-#define func_string_int32_int32_vars$ a, b
-#define func_uint32_int32_int32_vars$ a, b
-#define func_intptr_int32_int32_vars$ a, b
+#define action_int32_int32_int32_vars$ a, b, c
+#define action_int32_int32_intptr_vars$ a, b, c
+#define action_int32_int32_string_vars$ a, b, c
+#define action_int32_int32_uint32_vars$ a, b, c
+#define action_int32_int32_uint64_vars$ a, b, c
+#define action_int32_intptr_vars$ a, b
+#define action_int32_intptr_int32_vars$ a, b, c
+#define action_int32_intptr_intptr_vars$ a, b, c
+#define action_int32_intptr_string_vars$ a, b, c
+#define action_int32_intptr_uint32_vars$ a, b, c
+#define action_int32_intptr_uint64_vars$ a, b, c
 #define action_int32_string_vars$ a, b
-#define func_uint64_int32_string_vars$ a, b
-#define func_int32_int32_string_vars$ a, b
-#define func_string_int32_string_vars$ a, b
-#define func_uint32_int32_string_vars$ a, b
-#define func_intptr_int32_string_vars$ a, b
+#define action_int32_string_int32_vars$ a, b, c
+#define action_int32_string_intptr_vars$ a, b, c
+#define action_int32_string_string_vars$ a, b, c
+#define action_int32_string_uint32_vars$ a, b, c
+#define action_int32_string_uint64_vars$ a, b, c
 #define action_int32_uint32_vars$ a, b
-#define func_uint64_int32_uint32_vars$ a, b
-#define func_int32_int32_uint32_vars$ a, b
-#define func_string_int32_uint32_vars$ a, b
-#define func_uint32_int32_uint32_vars$ a, b
-#define func_intptr_int32_uint32_vars$ a, b
-#define action_int32_intptr_vars$ a, b
-#define func_uint64_int32_intptr_vars$ a, b
-#define func_int32_int32_intptr_vars$ a, b
-#define func_string_int32_intptr_vars$ a, b
-#define func_uint32_int32_intptr_vars$ a, b
-#define func_intptr_int32_intptr_vars$ a, b
-#define action_string_uint64_vars$ a, b
-#define func_uint64_string_uint64_vars$ a, b
-#define func_int32_string_uint64_vars$ a, b
-#define func_string_string_uint64_vars$ a, b
-#define func_uint32_string_uint64_vars$ a, b
-#define func_intptr_string_uint64_vars$ a, b
+#define action_int32_uint32_int32_vars$ a, b, c
+#define action_int32_uint32_intptr_vars$ a, b, c
+#define action_int32_uint32_string_vars$ a, b, c
+#define action_int32_uint32_uint32_vars$ a, b, c
+#define action_int32_uint32_uint64_vars$ a, b, c
+#define action_int32_uint64_vars$ a, b
+#define action_int32_uint64_int32_vars$ a, b, c
+#define action_int32_uint64_intptr_vars$ a, b, c
+#define action_int32_uint64_string_vars$ a, b, c
+#define action_int32_uint64_uint32_vars$ a, b, c
+#define action_int32_uint64_uint64_vars$ a, b, c
+#define action_intptr_vars$ a
+#define action_intptr_int32_vars$ a, b
+#define action_intptr_int32_int32_vars$ a, b, c
+#define action_intptr_int32_intptr_vars$ a, b, c
+#define action_intptr_int32_string_vars$ a, b, c
+#define action_intptr_int32_uint32_vars$ a, b, c
+#define action_intptr_int32_uint64_vars$ a, b, c
+#define action_intptr_intptr_vars$ a, b
+#define action_intptr_intptr_int32_vars$ a, b, c
+#define action_intptr_intptr_intptr_vars$ a, b, c
+#define action_intptr_intptr_string_vars$ a, b, c
+#define action_intptr_intptr_uint32_vars$ a, b, c
+#define action_intptr_intptr_uint64_vars$ a, b, c
+#define action_intptr_string_vars$ a, b
+#define action_intptr_string_int32_vars$ a, b, c
+#define action_intptr_string_intptr_vars$ a, b, c
+#define action_intptr_string_string_vars$ a, b, c
+#define action_intptr_string_uint32_vars$ a, b, c
+#define action_intptr_string_uint64_vars$ a, b, c
+#define action_intptr_uint32_vars$ a, b
+#define action_intptr_uint32_int32_vars$ a, b, c
+#define action_intptr_uint32_intptr_vars$ a, b, c
+#define action_intptr_uint32_string_vars$ a, b, c
+#define action_intptr_uint32_uint32_vars$ a, b, c
+#define action_intptr_uint32_uint64_vars$ a, b, c
+#define action_intptr_uint64_vars$ a, b
+#define action_intptr_uint64_int32_vars$ a, b, c
+#define action_intptr_uint64_intptr_vars$ a, b, c
+#define action_intptr_uint64_string_vars$ a, b, c
+#define action_intptr_uint64_uint32_vars$ a, b, c
+#define action_intptr_uint64_uint64_vars$ a, b, c
+#define action_string_vars$ a
 #define action_string_int32_vars$ a, b
-#define func_uint64_string_int32_vars$ a, b
-#define func_int32_string_int32_vars$ a, b
-#define func_string_string_int32_vars$ a, b
-#define func_uint32_string_int32_vars$ a, b
-#define func_intptr_string_int32_vars$ a, b
+#define action_string_int32_int32_vars$ a, b, c
+#define action_string_int32_intptr_vars$ a, b, c
+#define action_string_int32_string_vars$ a, b, c
+#define action_string_int32_uint32_vars$ a, b, c
+#define action_string_int32_uint64_vars$ a, b, c
+#define action_string_intptr_vars$ a, b
+#define action_string_intptr_int32_vars$ a, b, c
+#define action_string_intptr_intptr_vars$ a, b, c
+#define action_string_intptr_string_vars$ a, b, c
+#define action_string_intptr_uint32_vars$ a, b, c
+#define action_string_intptr_uint64_vars$ a, b, c
 #define action_string_string_vars$ a, b
-#define func_uint64_string_string_vars$ a, b
-#define func_int32_string_string_vars$ a, b
-#define func_string_string_string_vars$ a, b
-#define func_uint32_string_string_vars$ a, b
-#define func_intptr_string_string_vars$ a, b
+#define action_string_string_int32_vars$ a, b, c
+#define action_string_string_intptr_vars$ a, b, c
+#define action_string_string_string_vars$ a, b, c
+#define action_string_string_uint32_vars$ a, b, c
+#define action_string_string_uint64_vars$ a, b, c
 #define action_string_uint32_vars$ a, b
-#define func_uint64_string_uint32_vars$ a, b
-#define func_int32_string_uint32_vars$ a, b
-#define func_string_string_uint32_vars$ a, b
-#define func_uint32_string_uint32_vars$ a, b
-#define func_intptr_string_uint32_vars$ a, b
-#define action_string_intptr_vars$ a, b
-#define func_uint64_string_intptr_vars$ a, b
-#define func_int32_string_intptr_vars$ a, b
-#define func_string_string_intptr_vars$ a, b
-#define func_uint32_string_intptr_vars$ a, b
-#define func_intptr_string_intptr_vars$ a, b
-#define action_uint32_uint64_vars$ a, b
-#define func_uint64_uint32_uint64_vars$ a, b
-#define func_int32_uint32_uint64_vars$ a, b
-#define func_string_uint32_uint64_vars$ a, b
-#define func_uint32_uint32_uint64_vars$ a, b
-#define func_intptr_uint32_uint64_vars$ a, b
+#define action_string_uint32_int32_vars$ a, b, c
+#define action_string_uint32_intptr_vars$ a, b, c
+#define action_string_uint32_string_vars$ a, b, c
+#define action_string_uint32_uint32_vars$ a, b, c
+#define action_string_uint32_uint64_vars$ a, b, c
+#define action_string_uint64_vars$ a, b
+#define action_string_uint64_int32_vars$ a, b, c
+#define action_string_uint64_intptr_vars$ a, b, c
+#define action_string_uint64_string_vars$ a, b, c
+#define action_string_uint64_uint32_vars$ a, b, c
+#define action_string_uint64_uint64_vars$ a, b, c
+#define action_uint32_vars$ a
 #define action_uint32_int32_vars$ a, b
-#define func_uint64_uint32_int32_vars$ a, b
-#define func_int32_uint32_int32_vars$ a, b
-#define func_string_uint32_int32_vars$ a, b
-#define func_uint32_uint32_int32_vars$ a, b
-#define func_intptr_uint32_int32_vars$ a, b
+#define action_uint32_int32_int32_vars$ a, b, c
+#define action_uint32_int32_intptr_vars$ a, b, c
+#define action_uint32_int32_string_vars$ a, b, c
+#define action_uint32_int32_uint32_vars$ a, b, c
+#define action_uint32_int32_uint64_vars$ a, b, c
+#define action_uint32_intptr_vars$ a, b
+#define action_uint32_intptr_int32_vars$ a, b, c
+#define action_uint32_intptr_intptr_vars$ a, b, c
+#define action_uint32_intptr_string_vars$ a, b, c
+#define action_uint32_intptr_uint32_vars$ a, b, c
+#define action_uint32_intptr_uint64_vars$ a, b, c
 #define action_uint32_string_vars$ a, b
-#define func_uint64_uint32_string_vars$ a, b
-#define func_int32_uint32_string_vars$ a, b
-#define func_string_uint32_string_vars$ a, b
-#define func_uint32_uint32_string_vars$ a, b
-#define func_intptr_uint32_string_vars$ a, b
+#define action_uint32_string_int32_vars$ a, b, c
+#define action_uint32_string_intptr_vars$ a, b, c
+#define action_uint32_string_string_vars$ a, b, c
+#define action_uint32_string_uint32_vars$ a, b, c
+#define action_uint32_string_uint64_vars$ a, b, c
 #define action_uint32_uint32_vars$ a, b
-#define func_uint64_uint32_uint32_vars$ a, b
-#define func_int32_uint32_uint32_vars$ a, b
-#define func_string_uint32_uint32_vars$ a, b
-#define func_uint32_uint32_uint32_vars$ a, b
-#define func_intptr_uint32_uint32_vars$ a, b
-#define action_uint32_intptr_vars$ a, b
-#define func_uint64_uint32_intptr_vars$ a, b
-#define func_int32_uint32_intptr_vars$ a, b
-#define func_string_uint32_intptr_vars$ a, b
-#define func_uint32_uint32_intptr_vars$ a, b
-#define func_intptr_uint32_intptr_vars$ a, b
-#define action_intptr_uint64_vars$ a, b
-#define func_uint64_intptr_uint64_vars$ a, b
-#define func_int32_intptr_uint64_vars$ a, b
-#define func_string_intptr_uint64_vars$ a, b
-#define func_uint32_intptr_uint64_vars$ a, b
-#define func_intptr_intptr_uint64_vars$ a, b
-#define action_intptr_int32_vars$ a, b
-#define func_uint64_intptr_int32_vars$ a, b
-#define func_int32_intptr_int32_vars$ a, b
-#define func_string_intptr_int32_vars$ a, b
-#define func_uint32_intptr_int32_vars$ a, b
-#define func_intptr_intptr_int32_vars$ a, b
-#define action_intptr_string_vars$ a, b
-#define func_uint64_intptr_string_vars$ a, b
-#define func_int32_intptr_string_vars$ a, b
-#define func_string_intptr_string_vars$ a, b
-#define func_uint32_intptr_string_vars$ a, b
-#define func_intptr_intptr_string_vars$ a, b
-#define action_intptr_uint32_vars$ a, b
-#define func_uint64_intptr_uint32_vars$ a, b
-#define func_int32_intptr_uint32_vars$ a, b
-#define func_string_intptr_uint32_vars$ a, b
-#define func_uint32_intptr_uint32_vars$ a, b
-#define func_intptr_intptr_uint32_vars$ a, b
-#define action_intptr_intptr_vars$ a, b
-#define func_uint64_intptr_intptr_vars$ a, b
-#define func_int32_intptr_intptr_vars$ a, b
-#define func_string_intptr_intptr_vars$ a, b
-#define func_uint32_intptr_intptr_vars$ a, b
-#define func_intptr_intptr_intptr_vars$ a, b
-#define action_uint64_uint64_uint64_vars$ a, b, c
-#define func_uint64_uint64_uint64_uint64_vars$ a, b, c
-#define func_int32_uint64_uint64_uint64_vars$ a, b, c
-#define func_string_uint64_uint64_uint64_vars$ a, b, c
-#define func_uint32_uint64_uint64_uint64_vars$ a, b, c
-#define func_intptr_uint64_uint64_uint64_vars$ a, b, c
+#define action_uint32_uint32_int32_vars$ a, b, c
+#define action_uint32_uint32_intptr_vars$ a, b, c
+#define action_uint32_uint32_string_vars$ a, b, c
+#define action_uint32_uint32_uint32_vars$ a, b, c
+#define action_uint32_uint32_uint64_vars$ a, b, c
+#define action_uint32_uint64_vars$ a, b
+#define action_uint32_uint64_int32_vars$ a, b, c
+#define action_uint32_uint64_intptr_vars$ a, b, c
+#define action_uint32_uint64_string_vars$ a, b, c
+#define action_uint32_uint64_uint32_vars$ a, b, c
+#define action_uint32_uint64_uint64_vars$ a, b, c
+#define action_uint64_vars$ a
+#define action_uint64_int32_vars$ a, b
+#define action_uint64_int32_int32_vars$ a, b, c
+#define action_uint64_int32_intptr_vars$ a, b, c
+#define action_uint64_int32_string_vars$ a, b, c
+#define action_uint64_int32_uint32_vars$ a, b, c
+#define action_uint64_int32_uint64_vars$ a, b, c
+#define action_uint64_intptr_vars$ a, b
+#define action_uint64_intptr_int32_vars$ a, b, c
+#define action_uint64_intptr_intptr_vars$ a, b, c
+#define action_uint64_intptr_string_vars$ a, b, c
+#define action_uint64_intptr_uint32_vars$ a, b, c
+#define action_uint64_intptr_uint64_vars$ a, b, c
+#define action_uint64_string_vars$ a, b
+#define action_uint64_string_int32_vars$ a, b, c
+#define action_uint64_string_intptr_vars$ a, b, c
+#define action_uint64_string_string_vars$ a, b, c
+#define action_uint64_string_uint32_vars$ a, b, c
+#define action_uint64_string_uint64_vars$ a, b, c
+#define action_uint64_uint32_vars$ a, b
+#define action_uint64_uint32_int32_vars$ a, b, c
+#define action_uint64_uint32_intptr_vars$ a, b, c
+#define action_uint64_uint32_string_vars$ a, b, c
+#define action_uint64_uint32_uint32_vars$ a, b, c
+#define action_uint64_uint32_uint64_vars$ a, b, c
+#define action_uint64_uint64_vars$ a, b
 #define action_uint64_uint64_int32_vars$ a, b, c
-#define func_uint64_uint64_uint64_int32_vars$ a, b, c
-#define func_int32_uint64_uint64_int32_vars$ a, b, c
-#define func_string_uint64_uint64_int32_vars$ a, b, c
-#define func_uint32_uint64_uint64_int32_vars$ a, b, c
-#define func_intptr_uint64_uint64_int32_vars$ a, b, c
+#define action_uint64_uint64_intptr_vars$ a, b, c
 #define action_uint64_uint64_string_vars$ a, b, c
-#define func_uint64_uint64_uint64_string_vars$ a, b, c
-#define func_int32_uint64_uint64_string_vars$ a, b, c
-#define func_string_uint64_uint64_string_vars$ a, b, c
-#define func_uint32_uint64_uint64_string_vars$ a, b, c
-#define func_intptr_uint64_uint64_string_vars$ a, b, c
 #define action_uint64_uint64_uint32_vars$ a, b, c
-#define func_uint64_uint64_uint64_uint32_vars$ a, b, c
-#define func_int32_uint64_uint64_uint32_vars$ a, b, c
-#define func_string_uint64_uint64_uint32_vars$ a, b, c
-#define func_uint32_uint64_uint64_uint32_vars$ a, b, c
-#define func_intptr_uint64_uint64_uint32_vars$ a, b, c
-#define action_uint64_uint64_intptr_vars$ a, b, c
-#define func_uint64_uint64_uint64_intptr_vars$ a, b, c
-#define func_int32_uint64_uint64_intptr_vars$ a, b, c
-#define func_string_uint64_uint64_intptr_vars$ a, b, c
-#define func_uint32_uint64_uint64_intptr_vars$ a, b, c
-#define func_intptr_uint64_uint64_intptr_vars$ a, b, c
-#define action_uint64_int32_uint64_vars$ a, b, c
-#define func_uint64_uint64_int32_uint64_vars$ a, b, c
-#define func_int32_uint64_int32_uint64_vars$ a, b, c
-#define func_string_uint64_int32_uint64_vars$ a, b, c
-#define func_uint32_uint64_int32_uint64_vars$ a, b, c
-#define func_intptr_uint64_int32_uint64_vars$ a, b, c
-#define action_uint64_int32_int32_vars$ a, b, c
-#define func_uint64_uint64_int32_int32_vars$ a, b, c
+#define action_uint64_uint64_uint64_vars$ a, b, c
+#define func_int32_vars$ 
+#define func_int32_int32_vars$ a
+#define func_int32_int32_int32_vars$ a, b
+#define func_int32_int32_int32_int32_vars$ a, b, c
+#define func_int32_int32_int32_intptr_vars$ a, b, c
+#define func_int32_int32_int32_string_vars$ a, b, c
+#define func_int32_int32_int32_uint32_vars$ a, b, c
+#define func_int32_int32_int32_uint64_vars$ a, b, c
+#define func_int32_int32_intptr_vars$ a, b
+#define func_int32_int32_intptr_int32_vars$ a, b, c
+#define func_int32_int32_intptr_intptr_vars$ a, b, c
+#define func_int32_int32_intptr_string_vars$ a, b, c
+#define func_int32_int32_intptr_uint32_vars$ a, b, c
+#define func_int32_int32_intptr_uint64_vars$ a, b, c
+#define func_int32_int32_string_vars$ a, b
+#define func_int32_int32_string_int32_vars$ a, b, c
+#define func_int32_int32_string_intptr_vars$ a, b, c
+#define func_int32_int32_string_string_vars$ a, b, c
+#define func_int32_int32_string_uint32_vars$ a, b, c
+#define func_int32_int32_string_uint64_vars$ a, b, c
+#define func_int32_int32_uint32_vars$ a, b
+#define func_int32_int32_uint32_int32_vars$ a, b, c
+#define func_int32_int32_uint32_intptr_vars$ a, b, c
+#define func_int32_int32_uint32_string_vars$ a, b, c
+#define func_int32_int32_uint32_uint32_vars$ a, b, c
+#define func_int32_int32_uint32_uint64_vars$ a, b, c
+#define func_int32_int32_uint64_vars$ a, b
+#define func_int32_int32_uint64_int32_vars$ a, b, c
+#define func_int32_int32_uint64_intptr_vars$ a, b, c
+#define func_int32_int32_uint64_string_vars$ a, b, c
+#define func_int32_int32_uint64_uint32_vars$ a, b, c
+#define func_int32_int32_uint64_uint64_vars$ a, b, c
+#define func_int32_intptr_vars$ a
+#define func_int32_intptr_int32_vars$ a, b
+#define func_int32_intptr_int32_int32_vars$ a, b, c
+#define func_int32_intptr_int32_intptr_vars$ a, b, c
+#define func_int32_intptr_int32_string_vars$ a, b, c
+#define func_int32_intptr_int32_uint32_vars$ a, b, c
+#define func_int32_intptr_int32_uint64_vars$ a, b, c
+#define func_int32_intptr_intptr_vars$ a, b
+#define func_int32_intptr_intptr_int32_vars$ a, b, c
+#define func_int32_intptr_intptr_intptr_vars$ a, b, c
+#define func_int32_intptr_intptr_string_vars$ a, b, c
+#define func_int32_intptr_intptr_uint32_vars$ a, b, c
+#define func_int32_intptr_intptr_uint64_vars$ a, b, c
+#define func_int32_intptr_string_vars$ a, b
+#define func_int32_intptr_string_int32_vars$ a, b, c
+#define func_int32_intptr_string_intptr_vars$ a, b, c
+#define func_int32_intptr_string_string_vars$ a, b, c
+#define func_int32_intptr_string_uint32_vars$ a, b, c
+#define func_int32_intptr_string_uint64_vars$ a, b, c
+#define func_int32_intptr_uint32_vars$ a, b
+#define func_int32_intptr_uint32_int32_vars$ a, b, c
+#define func_int32_intptr_uint32_intptr_vars$ a, b, c
+#define func_int32_intptr_uint32_string_vars$ a, b, c
+#define func_int32_intptr_uint32_uint32_vars$ a, b, c
+#define func_int32_intptr_uint32_uint64_vars$ a, b, c
+#define func_int32_intptr_uint64_vars$ a, b
+#define func_int32_intptr_uint64_int32_vars$ a, b, c
+#define func_int32_intptr_uint64_intptr_vars$ a, b, c
+#define func_int32_intptr_uint64_string_vars$ a, b, c
+#define func_int32_intptr_uint64_uint32_vars$ a, b, c
+#define func_int32_intptr_uint64_uint64_vars$ a, b, c
+#define func_int32_string_vars$ a
+#define func_int32_string_int32_vars$ a, b
+#define func_int32_string_int32_int32_vars$ a, b, c
+#define func_int32_string_int32_intptr_vars$ a, b, c
+#define func_int32_string_int32_string_vars$ a, b, c
+#define func_int32_string_int32_uint32_vars$ a, b, c
+#define func_int32_string_int32_uint64_vars$ a, b, c
+#define func_int32_string_intptr_vars$ a, b
+#define func_int32_string_intptr_int32_vars$ a, b, c
+#define func_int32_string_intptr_intptr_vars$ a, b, c
+#define func_int32_string_intptr_string_vars$ a, b, c
+#define func_int32_string_intptr_uint32_vars$ a, b, c
+#define func_int32_string_intptr_uint64_vars$ a, b, c
+#define func_int32_string_string_vars$ a, b
+#define func_int32_string_string_int32_vars$ a, b, c
+#define func_int32_string_string_intptr_vars$ a, b, c
+#define func_int32_string_string_string_vars$ a, b, c
+#define func_int32_string_string_uint32_vars$ a, b, c
+#define func_int32_string_string_uint64_vars$ a, b, c
+#define func_int32_string_uint32_vars$ a, b
+#define func_int32_string_uint32_int32_vars$ a, b, c
+#define func_int32_string_uint32_intptr_vars$ a, b, c
+#define func_int32_string_uint32_string_vars$ a, b, c
+#define func_int32_string_uint32_uint32_vars$ a, b, c
+#define func_int32_string_uint32_uint64_vars$ a, b, c
+#define func_int32_string_uint64_vars$ a, b
+#define func_int32_string_uint64_int32_vars$ a, b, c
+#define func_int32_string_uint64_intptr_vars$ a, b, c
+#define func_int32_string_uint64_string_vars$ a, b, c
+#define func_int32_string_uint64_uint32_vars$ a, b, c
+#define func_int32_string_uint64_uint64_vars$ a, b, c
+#define func_int32_uint32_vars$ a
+#define func_int32_uint32_int32_vars$ a, b
+#define func_int32_uint32_int32_int32_vars$ a, b, c
+#define func_int32_uint32_int32_intptr_vars$ a, b, c
+#define func_int32_uint32_int32_string_vars$ a, b, c
+#define func_int32_uint32_int32_uint32_vars$ a, b, c
+#define func_int32_uint32_int32_uint64_vars$ a, b, c
+#define func_int32_uint32_intptr_vars$ a, b
+#define func_int32_uint32_intptr_int32_vars$ a, b, c
+#define func_int32_uint32_intptr_intptr_vars$ a, b, c
+#define func_int32_uint32_intptr_string_vars$ a, b, c
+#define func_int32_uint32_intptr_uint32_vars$ a, b, c
+#define func_int32_uint32_intptr_uint64_vars$ a, b, c
+#define func_int32_uint32_string_vars$ a, b
+#define func_int32_uint32_string_int32_vars$ a, b, c
+#define func_int32_uint32_string_intptr_vars$ a, b, c
+#define func_int32_uint32_string_string_vars$ a, b, c
+#define func_int32_uint32_string_uint32_vars$ a, b, c
+#define func_int32_uint32_string_uint64_vars$ a, b, c
+#define func_int32_uint32_uint32_vars$ a, b
+#define func_int32_uint32_uint32_int32_vars$ a, b, c
+#define func_int32_uint32_uint32_intptr_vars$ a, b, c
+#define func_int32_uint32_uint32_string_vars$ a, b, c
+#define func_int32_uint32_uint32_uint32_vars$ a, b, c
+#define func_int32_uint32_uint32_uint64_vars$ a, b, c
+#define func_int32_uint32_uint64_vars$ a, b
+#define func_int32_uint32_uint64_int32_vars$ a, b, c
+#define func_int32_uint32_uint64_intptr_vars$ a, b, c
+#define func_int32_uint32_uint64_string_vars$ a, b, c
+#define func_int32_uint32_uint64_uint32_vars$ a, b, c
+#define func_int32_uint32_uint64_uint64_vars$ a, b, c
+#define func_int32_uint64_vars$ a
+#define func_int32_uint64_int32_vars$ a, b
 #define func_int32_uint64_int32_int32_vars$ a, b, c
-#define func_string_uint64_int32_int32_vars$ a, b, c
-#define func_uint32_uint64_int32_int32_vars$ a, b, c
-#define func_intptr_uint64_int32_int32_vars$ a, b, c
-#define action_uint64_int32_string_vars$ a, b, c
-#define func_uint64_uint64_int32_string_vars$ a, b, c
+#define func_int32_uint64_int32_intptr_vars$ a, b, c
 #define func_int32_uint64_int32_string_vars$ a, b, c
-#define func_string_uint64_int32_string_vars$ a, b, c
-#define func_uint32_uint64_int32_string_vars$ a, b, c
-#define func_intptr_uint64_int32_string_vars$ a, b, c
-#define action_uint64_int32_uint32_vars$ a, b, c
-#define func_uint64_uint64_int32_uint32_vars$ a, b, c
 #define func_int32_uint64_int32_uint32_vars$ a, b, c
-#define func_string_uint64_int32_uint32_vars$ a, b, c
-#define func_uint32_uint64_int32_uint32_vars$ a, b, c
-#define func_intptr_uint64_int32_uint32_vars$ a, b, c
-#define action_uint64_int32_intptr_vars$ a, b, c
-#define func_uint64_uint64_int32_intptr_vars$ a, b, c
-#define func_int32_uint64_int32_intptr_vars$ a, b, c
-#define func_string_uint64_int32_intptr_vars$ a, b, c
-#define func_uint32_uint64_int32_intptr_vars$ a, b, c
-#define func_intptr_uint64_int32_intptr_vars$ a, b, c
-#define action_uint64_string_uint64_vars$ a, b, c
-#define func_uint64_uint64_string_uint64_vars$ a, b, c
-#define func_int32_uint64_string_uint64_vars$ a, b, c
-#define func_string_uint64_string_uint64_vars$ a, b, c
-#define func_uint32_uint64_string_uint64_vars$ a, b, c
-#define func_intptr_uint64_string_uint64_vars$ a, b, c
-#define action_uint64_string_int32_vars$ a, b, c
-#define func_uint64_uint64_string_int32_vars$ a, b, c
+#define func_int32_uint64_int32_uint64_vars$ a, b, c
+#define func_int32_uint64_intptr_vars$ a, b
+#define func_int32_uint64_intptr_int32_vars$ a, b, c
+#define func_int32_uint64_intptr_intptr_vars$ a, b, c
+#define func_int32_uint64_intptr_string_vars$ a, b, c
+#define func_int32_uint64_intptr_uint32_vars$ a, b, c
+#define func_int32_uint64_intptr_uint64_vars$ a, b, c
+#define func_int32_uint64_string_vars$ a, b
 #define func_int32_uint64_string_int32_vars$ a, b, c
-#define func_string_uint64_string_int32_vars$ a, b, c
-#define func_uint32_uint64_string_int32_vars$ a, b, c
-#define func_intptr_uint64_string_int32_vars$ a, b, c
-#define action_uint64_string_string_vars$ a, b, c
-#define func_uint64_uint64_string_string_vars$ a, b, c
+#define func_int32_uint64_string_intptr_vars$ a, b, c
 #define func_int32_uint64_string_string_vars$ a, b, c
-#define func_string_uint64_string_string_vars$ a, b, c
-#define func_uint32_uint64_string_string_vars$ a, b, c
-#define func_intptr_uint64_string_string_vars$ a, b, c
-#define action_uint64_string_uint32_vars$ a, b, c
-#define func_uint64_uint64_string_uint32_vars$ a, b, c
 #define func_int32_uint64_string_uint32_vars$ a, b, c
-#define func_string_uint64_string_uint32_vars$ a, b, c
-#define func_uint32_uint64_string_uint32_vars$ a, b, c
-#define func_intptr_uint64_string_uint32_vars$ a, b, c
-#define action_uint64_string_intptr_vars$ a, b, c
-#define func_uint64_uint64_string_intptr_vars$ a, b, c
-#define func_int32_uint64_string_intptr_vars$ a, b, c
-#define func_string_uint64_string_intptr_vars$ a, b, c
-#define func_uint32_uint64_string_intptr_vars$ a, b, c
-#define func_intptr_uint64_string_intptr_vars$ a, b, c
-#define action_uint64_uint32_uint64_vars$ a, b, c
-#define func_uint64_uint64_uint32_uint64_vars$ a, b, c
-#define func_int32_uint64_uint32_uint64_vars$ a, b, c
-#define func_string_uint64_uint32_uint64_vars$ a, b, c
-#define func_uint32_uint64_uint32_uint64_vars$ a, b, c
-#define func_intptr_uint64_uint32_uint64_vars$ a, b, c
-#define action_uint64_uint32_int32_vars$ a, b, c
-#define func_uint64_uint64_uint32_int32_vars$ a, b, c
+#define func_int32_uint64_string_uint64_vars$ a, b, c
+#define func_int32_uint64_uint32_vars$ a, b
 #define func_int32_uint64_uint32_int32_vars$ a, b, c
-#define func_string_uint64_uint32_int32_vars$ a, b, c
-#define func_uint32_uint64_uint32_int32_vars$ a, b, c
-#define func_intptr_uint64_uint32_int32_vars$ a, b, c
-#define action_uint64_uint32_string_vars$ a, b, c
-#define func_uint64_uint64_uint32_string_vars$ a, b, c
+#define func_int32_uint64_uint32_intptr_vars$ a, b, c
 #define func_int32_uint64_uint32_string_vars$ a, b, c
-#define func_string_uint64_uint32_string_vars$ a, b, c
-#define func_uint32_uint64_uint32_string_vars$ a, b, c
-#define func_intptr_uint64_uint32_string_vars$ a, b, c
-#define action_uint64_uint32_uint32_vars$ a, b, c
-#define func_uint64_uint64_uint32_uint32_vars$ a, b, c
 #define func_int32_uint64_uint32_uint32_vars$ a, b, c
-#define func_string_uint64_uint32_uint32_vars$ a, b, c
-#define func_uint32_uint64_uint32_uint32_vars$ a, b, c
-#define func_intptr_uint64_uint32_uint32_vars$ a, b, c
-#define action_uint64_uint32_intptr_vars$ a, b, c
-#define func_uint64_uint64_uint32_intptr_vars$ a, b, c
-#define func_int32_uint64_uint32_intptr_vars$ a, b, c
-#define func_string_uint64_uint32_intptr_vars$ a, b, c
-#define func_uint32_uint64_uint32_intptr_vars$ a, b, c
-#define func_intptr_uint64_uint32_intptr_vars$ a, b, c
-#define action_uint64_intptr_uint64_vars$ a, b, c
-#define func_uint64_uint64_intptr_uint64_vars$ a, b, c
-#define func_int32_uint64_intptr_uint64_vars$ a, b, c
-#define func_string_uint64_intptr_uint64_vars$ a, b, c
-#define func_uint32_uint64_intptr_uint64_vars$ a, b, c
-#define func_intptr_uint64_intptr_uint64_vars$ a, b, c
-#define action_uint64_intptr_int32_vars$ a, b, c
-#define func_uint64_uint64_intptr_int32_vars$ a, b, c
-#define func_int32_uint64_intptr_int32_vars$ a, b, c
-#define func_string_uint64_intptr_int32_vars$ a, b, c
-#define func_uint32_uint64_intptr_int32_vars$ a, b, c
+#define func_int32_uint64_uint32_uint64_vars$ a, b, c
+#define func_int32_uint64_uint64_vars$ a, b
+#define func_int32_uint64_uint64_int32_vars$ a, b, c
+#define func_int32_uint64_uint64_intptr_vars$ a, b, c
+#define func_int32_uint64_uint64_string_vars$ a, b, c
+#define func_int32_uint64_uint64_uint32_vars$ a, b, c
+#define func_int32_uint64_uint64_uint64_vars$ a, b, c
+#define func_intptr_vars$ 
+#define func_intptr_int32_vars$ a
+#define func_intptr_int32_int32_vars$ a, b
+#define func_intptr_int32_int32_int32_vars$ a, b, c
+#define func_intptr_int32_int32_intptr_vars$ a, b, c
+#define func_intptr_int32_int32_string_vars$ a, b, c
+#define func_intptr_int32_int32_uint32_vars$ a, b, c
+#define func_intptr_int32_int32_uint64_vars$ a, b, c
+#define func_intptr_int32_intptr_vars$ a, b
+#define func_intptr_int32_intptr_int32_vars$ a, b, c
+#define func_intptr_int32_intptr_intptr_vars$ a, b, c
+#define func_intptr_int32_intptr_string_vars$ a, b, c
+#define func_intptr_int32_intptr_uint32_vars$ a, b, c
+#define func_intptr_int32_intptr_uint64_vars$ a, b, c
+#define func_intptr_int32_string_vars$ a, b
+#define func_intptr_int32_string_int32_vars$ a, b, c
+#define func_intptr_int32_string_intptr_vars$ a, b, c
+#define func_intptr_int32_string_string_vars$ a, b, c
+#define func_intptr_int32_string_uint32_vars$ a, b, c
+#define func_intptr_int32_string_uint64_vars$ a, b, c
+#define func_intptr_int32_uint32_vars$ a, b
+#define func_intptr_int32_uint32_int32_vars$ a, b, c
+#define func_intptr_int32_uint32_intptr_vars$ a, b, c
+#define func_intptr_int32_uint32_string_vars$ a, b, c
+#define func_intptr_int32_uint32_uint32_vars$ a, b, c
+#define func_intptr_int32_uint32_uint64_vars$ a, b, c
+#define func_intptr_int32_uint64_vars$ a, b
+#define func_intptr_int32_uint64_int32_vars$ a, b, c
+#define func_intptr_int32_uint64_intptr_vars$ a, b, c
+#define func_intptr_int32_uint64_string_vars$ a, b, c
+#define func_intptr_int32_uint64_uint32_vars$ a, b, c
+#define func_intptr_int32_uint64_uint64_vars$ a, b, c
+#define func_intptr_intptr_vars$ a
+#define func_intptr_intptr_int32_vars$ a, b
+#define func_intptr_intptr_int32_int32_vars$ a, b, c
+#define func_intptr_intptr_int32_intptr_vars$ a, b, c
+#define func_intptr_intptr_int32_string_vars$ a, b, c
+#define func_intptr_intptr_int32_uint32_vars$ a, b, c
+#define func_intptr_intptr_int32_uint64_vars$ a, b, c
+#define func_intptr_intptr_intptr_vars$ a, b
+#define func_intptr_intptr_intptr_int32_vars$ a, b, c
+#define func_intptr_intptr_intptr_intptr_vars$ a, b, c
+#define func_intptr_intptr_intptr_string_vars$ a, b, c
+#define func_intptr_intptr_intptr_uint32_vars$ a, b, c
+#define func_intptr_intptr_intptr_uint64_vars$ a, b, c
+#define func_intptr_intptr_string_vars$ a, b
+#define func_intptr_intptr_string_int32_vars$ a, b, c
+#define func_intptr_intptr_string_intptr_vars$ a, b, c
+#define func_intptr_intptr_string_string_vars$ a, b, c
+#define func_intptr_intptr_string_uint32_vars$ a, b, c
+#define func_intptr_intptr_string_uint64_vars$ a, b, c
+#define func_intptr_intptr_uint32_vars$ a, b
+#define func_intptr_intptr_uint32_int32_vars$ a, b, c
+#define func_intptr_intptr_uint32_intptr_vars$ a, b, c
+#define func_intptr_intptr_uint32_string_vars$ a, b, c
+#define func_intptr_intptr_uint32_uint32_vars$ a, b, c
+#define func_intptr_intptr_uint32_uint64_vars$ a, b, c
+#define func_intptr_intptr_uint64_vars$ a, b
+#define func_intptr_intptr_uint64_int32_vars$ a, b, c
+#define func_intptr_intptr_uint64_intptr_vars$ a, b, c
+#define func_intptr_intptr_uint64_string_vars$ a, b, c
+#define func_intptr_intptr_uint64_uint32_vars$ a, b, c
+#define func_intptr_intptr_uint64_uint64_vars$ a, b, c
+#define func_intptr_string_vars$ a
+#define func_intptr_string_int32_vars$ a, b
+#define func_intptr_string_int32_int32_vars$ a, b, c
+#define func_intptr_string_int32_intptr_vars$ a, b, c
+#define func_intptr_string_int32_string_vars$ a, b, c
+#define func_intptr_string_int32_uint32_vars$ a, b, c
+#define func_intptr_string_int32_uint64_vars$ a, b, c
+#define func_intptr_string_intptr_vars$ a, b
+#define func_intptr_string_intptr_int32_vars$ a, b, c
+#define func_intptr_string_intptr_intptr_vars$ a, b, c
+#define func_intptr_string_intptr_string_vars$ a, b, c
+#define func_intptr_string_intptr_uint32_vars$ a, b, c
+#define func_intptr_string_intptr_uint64_vars$ a, b, c
+#define func_intptr_string_string_vars$ a, b
+#define func_intptr_string_string_int32_vars$ a, b, c
+#define func_intptr_string_string_intptr_vars$ a, b, c
+#define func_intptr_string_string_string_vars$ a, b, c
+#define func_intptr_string_string_uint32_vars$ a, b, c
+#define func_intptr_string_string_uint64_vars$ a, b, c
+#define func_intptr_string_uint32_vars$ a, b
+#define func_intptr_string_uint32_int32_vars$ a, b, c
+#define func_intptr_string_uint32_intptr_vars$ a, b, c
+#define func_intptr_string_uint32_string_vars$ a, b, c
+#define func_intptr_string_uint32_uint32_vars$ a, b, c
+#define func_intptr_string_uint32_uint64_vars$ a, b, c
+#define func_intptr_string_uint64_vars$ a, b
+#define func_intptr_string_uint64_int32_vars$ a, b, c
+#define func_intptr_string_uint64_intptr_vars$ a, b, c
+#define func_intptr_string_uint64_string_vars$ a, b, c
+#define func_intptr_string_uint64_uint32_vars$ a, b, c
+#define func_intptr_string_uint64_uint64_vars$ a, b, c
+#define func_intptr_uint32_vars$ a
+#define func_intptr_uint32_int32_vars$ a, b
+#define func_intptr_uint32_int32_int32_vars$ a, b, c
+#define func_intptr_uint32_int32_intptr_vars$ a, b, c
+#define func_intptr_uint32_int32_string_vars$ a, b, c
+#define func_intptr_uint32_int32_uint32_vars$ a, b, c
+#define func_intptr_uint32_int32_uint64_vars$ a, b, c
+#define func_intptr_uint32_intptr_vars$ a, b
+#define func_intptr_uint32_intptr_int32_vars$ a, b, c
+#define func_intptr_uint32_intptr_intptr_vars$ a, b, c
+#define func_intptr_uint32_intptr_string_vars$ a, b, c
+#define func_intptr_uint32_intptr_uint32_vars$ a, b, c
+#define func_intptr_uint32_intptr_uint64_vars$ a, b, c
+#define func_intptr_uint32_string_vars$ a, b
+#define func_intptr_uint32_string_int32_vars$ a, b, c
+#define func_intptr_uint32_string_intptr_vars$ a, b, c
+#define func_intptr_uint32_string_string_vars$ a, b, c
+#define func_intptr_uint32_string_uint32_vars$ a, b, c
+#define func_intptr_uint32_string_uint64_vars$ a, b, c
+#define func_intptr_uint32_uint32_vars$ a, b
+#define func_intptr_uint32_uint32_int32_vars$ a, b, c
+#define func_intptr_uint32_uint32_intptr_vars$ a, b, c
+#define func_intptr_uint32_uint32_string_vars$ a, b, c
+#define func_intptr_uint32_uint32_uint32_vars$ a, b, c
+#define func_intptr_uint32_uint32_uint64_vars$ a, b, c
+#define func_intptr_uint32_uint64_vars$ a, b
+#define func_intptr_uint32_uint64_int32_vars$ a, b, c
+#define func_intptr_uint32_uint64_intptr_vars$ a, b, c
+#define func_intptr_uint32_uint64_string_vars$ a, b, c
+#define func_intptr_uint32_uint64_uint32_vars$ a, b, c
+#define func_intptr_uint32_uint64_uint64_vars$ a, b, c
+#define func_intptr_uint64_vars$ a
+#define func_intptr_uint64_int32_vars$ a, b
+#define func_intptr_uint64_int32_int32_vars$ a, b, c
+#define func_intptr_uint64_int32_intptr_vars$ a, b, c
+#define func_intptr_uint64_int32_string_vars$ a, b, c
+#define func_intptr_uint64_int32_uint32_vars$ a, b, c
+#define func_intptr_uint64_int32_uint64_vars$ a, b, c
+#define func_intptr_uint64_intptr_vars$ a, b
 #define func_intptr_uint64_intptr_int32_vars$ a, b, c
-#define action_uint64_intptr_string_vars$ a, b, c
-#define func_uint64_uint64_intptr_string_vars$ a, b, c
-#define func_int32_uint64_intptr_string_vars$ a, b, c
-#define func_string_uint64_intptr_string_vars$ a, b, c
-#define func_uint32_uint64_intptr_string_vars$ a, b, c
+#define func_intptr_uint64_intptr_intptr_vars$ a, b, c
 #define func_intptr_uint64_intptr_string_vars$ a, b, c
-#define action_uint64_intptr_uint32_vars$ a, b, c
-#define func_uint64_uint64_intptr_uint32_vars$ a, b, c
-#define func_int32_uint64_intptr_uint32_vars$ a, b, c
-#define func_string_uint64_intptr_uint32_vars$ a, b, c
-#define func_uint32_uint64_intptr_uint32_vars$ a, b, c
 #define func_intptr_uint64_intptr_uint32_vars$ a, b, c
-#define action_uint64_intptr_intptr_vars$ a, b, c
-#define func_uint64_uint64_intptr_intptr_vars$ a, b, c
-#define func_int32_uint64_intptr_intptr_vars$ a, b, c
-#define func_string_uint64_intptr_intptr_vars$ a, b, c
-#define func_uint32_uint64_intptr_intptr_vars$ a, b, c
-#define func_intptr_uint64_intptr_intptr_vars$ a, b, c
-#define action_int32_uint64_uint64_vars$ a, b, c
-#define func_uint64_int32_uint64_uint64_vars$ a, b, c
-#define func_int32_int32_uint64_uint64_vars$ a, b, c
-#define func_string_int32_uint64_uint64_vars$ a, b, c
-#define func_uint32_int32_uint64_uint64_vars$ a, b, c
-#define func_intptr_int32_uint64_uint64_vars$ a, b, c
-#define action_int32_uint64_int32_vars$ a, b, c
-#define func_uint64_int32_uint64_int32_vars$ a, b, c
-#define func_int32_int32_uint64_int32_vars$ a, b, c
-#define func_string_int32_uint64_int32_vars$ a, b, c
-#define func_uint32_int32_uint64_int32_vars$ a, b, c
-#define func_intptr_int32_uint64_int32_vars$ a, b, c
-#define action_int32_uint64_string_vars$ a, b, c
-#define func_uint64_int32_uint64_string_vars$ a, b, c
-#define func_int32_int32_uint64_string_vars$ a, b, c
-#define func_string_int32_uint64_string_vars$ a, b, c
-#define func_uint32_int32_uint64_string_vars$ a, b, c
-#define func_intptr_int32_uint64_string_vars$ a, b, c
-#define action_int32_uint64_uint32_vars$ a, b, c
-#define func_uint64_int32_uint64_uint32_vars$ a, b, c
-#define func_int32_int32_uint64_uint32_vars$ a, b, c
-#define func_string_int32_uint64_uint32_vars$ a, b, c
-#define func_uint32_int32_uint64_uint32_vars$ a, b, c
-#define func_intptr_int32_uint64_uint32_vars$ a, b, c
-#define action_int32_uint64_intptr_vars$ a, b, c
-#define func_uint64_int32_uint64_intptr_vars$ a, b, c
-#define func_int32_int32_uint64_intptr_vars$ a, b, c
-#define func_string_int32_uint64_intptr_vars$ a, b, c
-#define func_uint32_int32_uint64_intptr_vars$ a, b, c
-#define func_intptr_int32_uint64_intptr_vars$ a, b, c
-#define action_int32_int32_uint64_vars$ a, b, c
-#define func_uint64_int32_int32_uint64_vars$ a, b, c
-#define func_int32_int32_int32_uint64_vars$ a, b, c
-#define func_string_int32_int32_uint64_vars$ a, b, c
-#define func_uint32_int32_int32_uint64_vars$ a, b, c
-#define func_intptr_int32_int32_uint64_vars$ a, b, c
-#define action_int32_int32_int32_vars$ a, b, c
-#define func_uint64_int32_int32_int32_vars$ a, b, c
-#define func_int32_int32_int32_int32_vars$ a, b, c
+#define func_intptr_uint64_intptr_uint64_vars$ a, b, c
+#define func_intptr_uint64_string_vars$ a, b
+#define func_intptr_uint64_string_int32_vars$ a, b, c
+#define func_intptr_uint64_string_intptr_vars$ a, b, c
+#define func_intptr_uint64_string_string_vars$ a, b, c
+#define func_intptr_uint64_string_uint32_vars$ a, b, c
+#define func_intptr_uint64_string_uint64_vars$ a, b, c
+#define func_intptr_uint64_uint32_vars$ a, b
+#define func_intptr_uint64_uint32_int32_vars$ a, b, c
+#define func_intptr_uint64_uint32_intptr_vars$ a, b, c
+#define func_intptr_uint64_uint32_string_vars$ a, b, c
+#define func_intptr_uint64_uint32_uint32_vars$ a, b, c
+#define func_intptr_uint64_uint32_uint64_vars$ a, b, c
+#define func_intptr_uint64_uint64_vars$ a, b
+#define func_intptr_uint64_uint64_int32_vars$ a, b, c
+#define func_intptr_uint64_uint64_intptr_vars$ a, b, c
+#define func_intptr_uint64_uint64_string_vars$ a, b, c
+#define func_intptr_uint64_uint64_uint32_vars$ a, b, c
+#define func_intptr_uint64_uint64_uint64_vars$ a, b, c
+#define func_string_vars$ 
+#define func_string_int32_vars$ a
+#define func_string_int32_int32_vars$ a, b
 #define func_string_int32_int32_int32_vars$ a, b, c
-#define func_uint32_int32_int32_int32_vars$ a, b, c
-#define func_intptr_int32_int32_int32_vars$ a, b, c
-#define action_int32_int32_string_vars$ a, b, c
-#define func_uint64_int32_int32_string_vars$ a, b, c
-#define func_int32_int32_int32_string_vars$ a, b, c
+#define func_string_int32_int32_intptr_vars$ a, b, c
 #define func_string_int32_int32_string_vars$ a, b, c
-#define func_uint32_int32_int32_string_vars$ a, b, c
-#define func_intptr_int32_int32_string_vars$ a, b, c
-#define action_int32_int32_uint32_vars$ a, b, c
-#define func_uint64_int32_int32_uint32_vars$ a, b, c
-#define func_int32_int32_int32_uint32_vars$ a, b, c
 #define func_string_int32_int32_uint32_vars$ a, b, c
-#define func_uint32_int32_int32_uint32_vars$ a, b, c
-#define func_intptr_int32_int32_uint32_vars$ a, b, c
-#define action_int32_int32_intptr_vars$ a, b, c
-#define func_uint64_int32_int32_intptr_vars$ a, b, c
-#define func_int32_int32_int32_intptr_vars$ a, b, c
-#define func_string_int32_int32_intptr_vars$ a, b, c
-#define func_uint32_int32_int32_intptr_vars$ a, b, c
-#define func_intptr_int32_int32_intptr_vars$ a, b, c
-#define action_int32_string_uint64_vars$ a, b, c
-#define func_uint64_int32_string_uint64_vars$ a, b, c
-#define func_int32_int32_string_uint64_vars$ a, b, c
-#define func_string_int32_string_uint64_vars$ a, b, c
-#define func_uint32_int32_string_uint64_vars$ a, b, c
-#define func_intptr_int32_string_uint64_vars$ a, b, c
-#define action_int32_string_int32_vars$ a, b, c
-#define func_uint64_int32_string_int32_vars$ a, b, c
-#define func_int32_int32_string_int32_vars$ a, b, c
-#define func_string_int32_string_int32_vars$ a, b, c
-#define func_uint32_int32_string_int32_vars$ a, b, c
-#define func_intptr_int32_string_int32_vars$ a, b, c
-#define action_int32_string_string_vars$ a, b, c
-#define func_uint64_int32_string_string_vars$ a, b, c
-#define func_int32_int32_string_string_vars$ a, b, c
-#define func_string_int32_string_string_vars$ a, b, c
-#define func_uint32_int32_string_string_vars$ a, b, c
-#define func_intptr_int32_string_string_vars$ a, b, c
-#define action_int32_string_uint32_vars$ a, b, c
-#define func_uint64_int32_string_uint32_vars$ a, b, c
-#define func_int32_int32_string_uint32_vars$ a, b, c
-#define func_string_int32_string_uint32_vars$ a, b, c
-#define func_uint32_int32_string_uint32_vars$ a, b, c
-#define func_intptr_int32_string_uint32_vars$ a, b, c
-#define action_int32_string_intptr_vars$ a, b, c
-#define func_uint64_int32_string_intptr_vars$ a, b, c
-#define func_int32_int32_string_intptr_vars$ a, b, c
-#define func_string_int32_string_intptr_vars$ a, b, c
-#define func_uint32_int32_string_intptr_vars$ a, b, c
-#define func_intptr_int32_string_intptr_vars$ a, b, c
-#define action_int32_uint32_uint64_vars$ a, b, c
-#define func_uint64_int32_uint32_uint64_vars$ a, b, c
-#define func_int32_int32_uint32_uint64_vars$ a, b, c
-#define func_string_int32_uint32_uint64_vars$ a, b, c
-#define func_uint32_int32_uint32_uint64_vars$ a, b, c
-#define func_intptr_int32_uint32_uint64_vars$ a, b, c
-#define action_int32_uint32_int32_vars$ a, b, c
-#define func_uint64_int32_uint32_int32_vars$ a, b, c
-#define func_int32_int32_uint32_int32_vars$ a, b, c
-#define func_string_int32_uint32_int32_vars$ a, b, c
-#define func_uint32_int32_uint32_int32_vars$ a, b, c
-#define func_intptr_int32_uint32_int32_vars$ a, b, c
-#define action_int32_uint32_string_vars$ a, b, c
-#define func_uint64_int32_uint32_string_vars$ a, b, c
-#define func_int32_int32_uint32_string_vars$ a, b, c
-#define func_string_int32_uint32_string_vars$ a, b, c
-#define func_uint32_int32_uint32_string_vars$ a, b, c
-#define func_intptr_int32_uint32_string_vars$ a, b, c
-#define action_int32_uint32_uint32_vars$ a, b, c
-#define func_uint64_int32_uint32_uint32_vars$ a, b, c
-#define func_int32_int32_uint32_uint32_vars$ a, b, c
-#define func_string_int32_uint32_uint32_vars$ a, b, c
-#define func_uint32_int32_uint32_uint32_vars$ a, b, c
-#define func_intptr_int32_uint32_uint32_vars$ a, b, c
-#define action_int32_uint32_intptr_vars$ a, b, c
-#define func_uint64_int32_uint32_intptr_vars$ a, b, c
-#define func_int32_int32_uint32_intptr_vars$ a, b, c
-#define func_string_int32_uint32_intptr_vars$ a, b, c
-#define func_uint32_int32_uint32_intptr_vars$ a, b, c
-#define func_intptr_int32_uint32_intptr_vars$ a, b, c
-#define action_int32_intptr_uint64_vars$ a, b, c
-#define func_uint64_int32_intptr_uint64_vars$ a, b, c
-#define func_int32_int32_intptr_uint64_vars$ a, b, c
-#define func_string_int32_intptr_uint64_vars$ a, b, c
-#define func_uint32_int32_intptr_uint64_vars$ a, b, c
-#define func_intptr_int32_intptr_uint64_vars$ a, b, c
-#define action_int32_intptr_int32_vars$ a, b, c
-#define func_uint64_int32_intptr_int32_vars$ a, b, c
-#define func_int32_int32_intptr_int32_vars$ a, b, c
+#define func_string_int32_int32_uint64_vars$ a, b, c
+#define func_string_int32_intptr_vars$ a, b
 #define func_string_int32_intptr_int32_vars$ a, b, c
-#define func_uint32_int32_intptr_int32_vars$ a, b, c
-#define func_intptr_int32_intptr_int32_vars$ a, b, c
-#define action_int32_intptr_string_vars$ a, b, c
-#define func_uint64_int32_intptr_string_vars$ a, b, c
-#define func_int32_int32_intptr_string_vars$ a, b, c
+#define func_string_int32_intptr_intptr_vars$ a, b, c
 #define func_string_int32_intptr_string_vars$ a, b, c
-#define func_uint32_int32_intptr_string_vars$ a, b, c
-#define func_intptr_int32_intptr_string_vars$ a, b, c
-#define action_int32_intptr_uint32_vars$ a, b, c
-#define func_uint64_int32_intptr_uint32_vars$ a, b, c
-#define func_int32_int32_intptr_uint32_vars$ a, b, c
 #define func_string_int32_intptr_uint32_vars$ a, b, c
-#define func_uint32_int32_intptr_uint32_vars$ a, b, c
-#define func_intptr_int32_intptr_uint32_vars$ a, b, c
-#define action_int32_intptr_intptr_vars$ a, b, c
-#define func_uint64_int32_intptr_intptr_vars$ a, b, c
-#define func_int32_int32_intptr_intptr_vars$ a, b, c
-#define func_string_int32_intptr_intptr_vars$ a, b, c
-#define func_uint32_int32_intptr_intptr_vars$ a, b, c
-#define func_intptr_int32_intptr_intptr_vars$ a, b, c
-#define action_string_uint64_uint64_vars$ a, b, c
-#define func_uint64_string_uint64_uint64_vars$ a, b, c
-#define func_int32_string_uint64_uint64_vars$ a, b, c
-#define func_string_string_uint64_uint64_vars$ a, b, c
-#define func_uint32_string_uint64_uint64_vars$ a, b, c
-#define func_intptr_string_uint64_uint64_vars$ a, b, c
-#define action_string_uint64_int32_vars$ a, b, c
-#define func_uint64_string_uint64_int32_vars$ a, b, c
-#define func_int32_string_uint64_int32_vars$ a, b, c
-#define func_string_string_uint64_int32_vars$ a, b, c
-#define func_uint32_string_uint64_int32_vars$ a, b, c
-#define func_intptr_string_uint64_int32_vars$ a, b, c
-#define action_string_uint64_string_vars$ a, b, c
-#define func_uint64_string_uint64_string_vars$ a, b, c
-#define func_int32_string_uint64_string_vars$ a, b, c
-#define func_string_string_uint64_string_vars$ a, b, c
-#define func_uint32_string_uint64_string_vars$ a, b, c
-#define func_intptr_string_uint64_string_vars$ a, b, c
-#define action_string_uint64_uint32_vars$ a, b, c
-#define func_uint64_string_uint64_uint32_vars$ a, b, c
-#define func_int32_string_uint64_uint32_vars$ a, b, c
-#define func_string_string_uint64_uint32_vars$ a, b, c
-#define func_uint32_string_uint64_uint32_vars$ a, b, c
-#define func_intptr_string_uint64_uint32_vars$ a, b, c
-#define action_string_uint64_intptr_vars$ a, b, c
-#define func_uint64_string_uint64_intptr_vars$ a, b, c
-#define func_int32_string_uint64_intptr_vars$ a, b, c
-#define func_string_string_uint64_intptr_vars$ a, b, c
-#define func_uint32_string_uint64_intptr_vars$ a, b, c
-#define func_intptr_string_uint64_intptr_vars$ a, b, c
-#define action_string_int32_uint64_vars$ a, b, c
-#define func_uint64_string_int32_uint64_vars$ a, b, c
-#define func_int32_string_int32_uint64_vars$ a, b, c
-#define func_string_string_int32_uint64_vars$ a, b, c
-#define func_uint32_string_int32_uint64_vars$ a, b, c
-#define func_intptr_string_int32_uint64_vars$ a, b, c
-#define action_string_int32_int32_vars$ a, b, c
-#define func_uint64_string_int32_int32_vars$ a, b, c
-#define func_int32_string_int32_int32_vars$ a, b, c
+#define func_string_int32_intptr_uint64_vars$ a, b, c
+#define func_string_int32_string_vars$ a, b
+#define func_string_int32_string_int32_vars$ a, b, c
+#define func_string_int32_string_intptr_vars$ a, b, c
+#define func_string_int32_string_string_vars$ a, b, c
+#define func_string_int32_string_uint32_vars$ a, b, c
+#define func_string_int32_string_uint64_vars$ a, b, c
+#define func_string_int32_uint32_vars$ a, b
+#define func_string_int32_uint32_int32_vars$ a, b, c
+#define func_string_int32_uint32_intptr_vars$ a, b, c
+#define func_string_int32_uint32_string_vars$ a, b, c
+#define func_string_int32_uint32_uint32_vars$ a, b, c
+#define func_string_int32_uint32_uint64_vars$ a, b, c
+#define func_string_int32_uint64_vars$ a, b
+#define func_string_int32_uint64_int32_vars$ a, b, c
+#define func_string_int32_uint64_intptr_vars$ a, b, c
+#define func_string_int32_uint64_string_vars$ a, b, c
+#define func_string_int32_uint64_uint32_vars$ a, b, c
+#define func_string_int32_uint64_uint64_vars$ a, b, c
+#define func_string_intptr_vars$ a
+#define func_string_intptr_int32_vars$ a, b
+#define func_string_intptr_int32_int32_vars$ a, b, c
+#define func_string_intptr_int32_intptr_vars$ a, b, c
+#define func_string_intptr_int32_string_vars$ a, b, c
+#define func_string_intptr_int32_uint32_vars$ a, b, c
+#define func_string_intptr_int32_uint64_vars$ a, b, c
+#define func_string_intptr_intptr_vars$ a, b
+#define func_string_intptr_intptr_int32_vars$ a, b, c
+#define func_string_intptr_intptr_intptr_vars$ a, b, c
+#define func_string_intptr_intptr_string_vars$ a, b, c
+#define func_string_intptr_intptr_uint32_vars$ a, b, c
+#define func_string_intptr_intptr_uint64_vars$ a, b, c
+#define func_string_intptr_string_vars$ a, b
+#define func_string_intptr_string_int32_vars$ a, b, c
+#define func_string_intptr_string_intptr_vars$ a, b, c
+#define func_string_intptr_string_string_vars$ a, b, c
+#define func_string_intptr_string_uint32_vars$ a, b, c
+#define func_string_intptr_string_uint64_vars$ a, b, c
+#define func_string_intptr_uint32_vars$ a, b
+#define func_string_intptr_uint32_int32_vars$ a, b, c
+#define func_string_intptr_uint32_intptr_vars$ a, b, c
+#define func_string_intptr_uint32_string_vars$ a, b, c
+#define func_string_intptr_uint32_uint32_vars$ a, b, c
+#define func_string_intptr_uint32_uint64_vars$ a, b, c
+#define func_string_intptr_uint64_vars$ a, b
+#define func_string_intptr_uint64_int32_vars$ a, b, c
+#define func_string_intptr_uint64_intptr_vars$ a, b, c
+#define func_string_intptr_uint64_string_vars$ a, b, c
+#define func_string_intptr_uint64_uint32_vars$ a, b, c
+#define func_string_intptr_uint64_uint64_vars$ a, b, c
+#define func_string_string_vars$ a
+#define func_string_string_int32_vars$ a, b
 #define func_string_string_int32_int32_vars$ a, b, c
-#define func_uint32_string_int32_int32_vars$ a, b, c
-#define func_intptr_string_int32_int32_vars$ a, b, c
-#define action_string_int32_string_vars$ a, b, c
-#define func_uint64_string_int32_string_vars$ a, b, c
-#define func_int32_string_int32_string_vars$ a, b, c
+#define func_string_string_int32_intptr_vars$ a, b, c
 #define func_string_string_int32_string_vars$ a, b, c
-#define func_uint32_string_int32_string_vars$ a, b, c
-#define func_intptr_string_int32_string_vars$ a, b, c
-#define action_string_int32_uint32_vars$ a, b, c
-#define func_uint64_string_int32_uint32_vars$ a, b, c
-#define func_int32_string_int32_uint32_vars$ a, b, c
 #define func_string_string_int32_uint32_vars$ a, b, c
-#define func_uint32_string_int32_uint32_vars$ a, b, c
-#define func_intptr_string_int32_uint32_vars$ a, b, c
-#define action_string_int32_intptr_vars$ a, b, c
-#define func_uint64_string_int32_intptr_vars$ a, b, c
-#define func_int32_string_int32_intptr_vars$ a, b, c
-#define func_string_string_int32_intptr_vars$ a, b, c
-#define func_uint32_string_int32_intptr_vars$ a, b, c
-#define func_intptr_string_int32_intptr_vars$ a, b, c
-#define action_string_string_uint64_vars$ a, b, c
-#define func_uint64_string_string_uint64_vars$ a, b, c
-#define func_int32_string_string_uint64_vars$ a, b, c
-#define func_string_string_string_uint64_vars$ a, b, c
-#define func_uint32_string_string_uint64_vars$ a, b, c
-#define func_intptr_string_string_uint64_vars$ a, b, c
-#define action_string_string_int32_vars$ a, b, c
-#define func_uint64_string_string_int32_vars$ a, b, c
-#define func_int32_string_string_int32_vars$ a, b, c
+#define func_string_string_int32_uint64_vars$ a, b, c
+#define func_string_string_intptr_vars$ a, b
+#define func_string_string_intptr_int32_vars$ a, b, c
+#define func_string_string_intptr_intptr_vars$ a, b, c
+#define func_string_string_intptr_string_vars$ a, b, c
+#define func_string_string_intptr_uint32_vars$ a, b, c
+#define func_string_string_intptr_uint64_vars$ a, b, c
+#define func_string_string_string_vars$ a, b
 #define func_string_string_string_int32_vars$ a, b, c
-#define func_uint32_string_string_int32_vars$ a, b, c
-#define func_intptr_string_string_int32_vars$ a, b, c
-#define action_string_string_string_vars$ a, b, c
-#define func_uint64_string_string_string_vars$ a, b, c
-#define func_int32_string_string_string_vars$ a, b, c
+#define func_string_string_string_intptr_vars$ a, b, c
 #define func_string_string_string_string_vars$ a, b, c
-#define func_uint32_string_string_string_vars$ a, b, c
-#define func_intptr_string_string_string_vars$ a, b, c
-#define action_string_string_uint32_vars$ a, b, c
-#define func_uint64_string_string_uint32_vars$ a, b, c
-#define func_int32_string_string_uint32_vars$ a, b, c
 #define func_string_string_string_uint32_vars$ a, b, c
-#define func_uint32_string_string_uint32_vars$ a, b, c
-#define func_intptr_string_string_uint32_vars$ a, b, c
-#define action_string_string_intptr_vars$ a, b, c
-#define func_uint64_string_string_intptr_vars$ a, b, c
-#define func_int32_string_string_intptr_vars$ a, b, c
-#define func_string_string_string_intptr_vars$ a, b, c
-#define func_uint32_string_string_intptr_vars$ a, b, c
-#define func_intptr_string_string_intptr_vars$ a, b, c
-#define action_string_uint32_uint64_vars$ a, b, c
-#define func_uint64_string_uint32_uint64_vars$ a, b, c
-#define func_int32_string_uint32_uint64_vars$ a, b, c
-#define func_string_string_uint32_uint64_vars$ a, b, c
-#define func_uint32_string_uint32_uint64_vars$ a, b, c
-#define func_intptr_string_uint32_uint64_vars$ a, b, c
-#define action_string_uint32_int32_vars$ a, b, c
-#define func_uint64_string_uint32_int32_vars$ a, b, c
-#define func_int32_string_uint32_int32_vars$ a, b, c
+#define func_string_string_string_uint64_vars$ a, b, c
+#define func_string_string_uint32_vars$ a, b
 #define func_string_string_uint32_int32_vars$ a, b, c
-#define func_uint32_string_uint32_int32_vars$ a, b, c
-#define func_intptr_string_uint32_int32_vars$ a, b, c
-#define action_string_uint32_string_vars$ a, b, c
-#define func_uint64_string_uint32_string_vars$ a, b, c
-#define func_int32_string_uint32_string_vars$ a, b, c
+#define func_string_string_uint32_intptr_vars$ a, b, c
 #define func_string_string_uint32_string_vars$ a, b, c
-#define func_uint32_string_uint32_string_vars$ a, b, c
-#define func_intptr_string_uint32_string_vars$ a, b, c
-#define action_string_uint32_uint32_vars$ a, b, c
-#define func_uint64_string_uint32_uint32_vars$ a, b, c
-#define func_int32_string_uint32_uint32_vars$ a, b, c
 #define func_string_string_uint32_uint32_vars$ a, b, c
-#define func_uint32_string_uint32_uint32_vars$ a, b, c
-#define func_intptr_string_uint32_uint32_vars$ a, b, c
-#define action_string_uint32_intptr_vars$ a, b, c
-#define func_uint64_string_uint32_intptr_vars$ a, b, c
-#define func_int32_string_uint32_intptr_vars$ a, b, c
-#define func_string_string_uint32_intptr_vars$ a, b, c
-#define func_uint32_string_uint32_intptr_vars$ a, b, c
-#define func_intptr_string_uint32_intptr_vars$ a, b, c
-#define action_string_intptr_uint64_vars$ a, b, c
-#define func_uint64_string_intptr_uint64_vars$ a, b, c
-#define func_int32_string_intptr_uint64_vars$ a, b, c
-#define func_string_string_intptr_uint64_vars$ a, b, c
-#define func_uint32_string_intptr_uint64_vars$ a, b, c
-#define func_intptr_string_intptr_uint64_vars$ a, b, c
-#define action_string_intptr_int32_vars$ a, b, c
-#define func_uint64_string_intptr_int32_vars$ a, b, c
-#define func_int32_string_intptr_int32_vars$ a, b, c
-#define func_string_string_intptr_int32_vars$ a, b, c
+#define func_string_string_uint32_uint64_vars$ a, b, c
+#define func_string_string_uint64_vars$ a, b
+#define func_string_string_uint64_int32_vars$ a, b, c
+#define func_string_string_uint64_intptr_vars$ a, b, c
+#define func_string_string_uint64_string_vars$ a, b, c
+#define func_string_string_uint64_uint32_vars$ a, b, c
+#define func_string_string_uint64_uint64_vars$ a, b, c
+#define func_string_uint32_vars$ a
+#define func_string_uint32_int32_vars$ a, b
+#define func_string_uint32_int32_int32_vars$ a, b, c
+#define func_string_uint32_int32_intptr_vars$ a, b, c
+#define func_string_uint32_int32_string_vars$ a, b, c
+#define func_string_uint32_int32_uint32_vars$ a, b, c
+#define func_string_uint32_int32_uint64_vars$ a, b, c
+#define func_string_uint32_intptr_vars$ a, b
+#define func_string_uint32_intptr_int32_vars$ a, b, c
+#define func_string_uint32_intptr_intptr_vars$ a, b, c
+#define func_string_uint32_intptr_string_vars$ a, b, c
+#define func_string_uint32_intptr_uint32_vars$ a, b, c
+#define func_string_uint32_intptr_uint64_vars$ a, b, c
+#define func_string_uint32_string_vars$ a, b
+#define func_string_uint32_string_int32_vars$ a, b, c
+#define func_string_uint32_string_intptr_vars$ a, b, c
+#define func_string_uint32_string_string_vars$ a, b, c
+#define func_string_uint32_string_uint32_vars$ a, b, c
+#define func_string_uint32_string_uint64_vars$ a, b, c
+#define func_string_uint32_uint32_vars$ a, b
+#define func_string_uint32_uint32_int32_vars$ a, b, c
+#define func_string_uint32_uint32_intptr_vars$ a, b, c
+#define func_string_uint32_uint32_string_vars$ a, b, c
+#define func_string_uint32_uint32_uint32_vars$ a, b, c
+#define func_string_uint32_uint32_uint64_vars$ a, b, c
+#define func_string_uint32_uint64_vars$ a, b
+#define func_string_uint32_uint64_int32_vars$ a, b, c
+#define func_string_uint32_uint64_intptr_vars$ a, b, c
+#define func_string_uint32_uint64_string_vars$ a, b, c
+#define func_string_uint32_uint64_uint32_vars$ a, b, c
+#define func_string_uint32_uint64_uint64_vars$ a, b, c
+#define func_string_uint64_vars$ a
+#define func_string_uint64_int32_vars$ a, b
+#define func_string_uint64_int32_int32_vars$ a, b, c
+#define func_string_uint64_int32_intptr_vars$ a, b, c
+#define func_string_uint64_int32_string_vars$ a, b, c
+#define func_string_uint64_int32_uint32_vars$ a, b, c
+#define func_string_uint64_int32_uint64_vars$ a, b, c
+#define func_string_uint64_intptr_vars$ a, b
+#define func_string_uint64_intptr_int32_vars$ a, b, c
+#define func_string_uint64_intptr_intptr_vars$ a, b, c
+#define func_string_uint64_intptr_string_vars$ a, b, c
+#define func_string_uint64_intptr_uint32_vars$ a, b, c
+#define func_string_uint64_intptr_uint64_vars$ a, b, c
+#define func_string_uint64_string_vars$ a, b
+#define func_string_uint64_string_int32_vars$ a, b, c
+#define func_string_uint64_string_intptr_vars$ a, b, c
+#define func_string_uint64_string_string_vars$ a, b, c
+#define func_string_uint64_string_uint32_vars$ a, b, c
+#define func_string_uint64_string_uint64_vars$ a, b, c
+#define func_string_uint64_uint32_vars$ a, b
+#define func_string_uint64_uint32_int32_vars$ a, b, c
+#define func_string_uint64_uint32_intptr_vars$ a, b, c
+#define func_string_uint64_uint32_string_vars$ a, b, c
+#define func_string_uint64_uint32_uint32_vars$ a, b, c
+#define func_string_uint64_uint32_uint64_vars$ a, b, c
+#define func_string_uint64_uint64_vars$ a, b
+#define func_string_uint64_uint64_int32_vars$ a, b, c
+#define func_string_uint64_uint64_intptr_vars$ a, b, c
+#define func_string_uint64_uint64_string_vars$ a, b, c
+#define func_string_uint64_uint64_uint32_vars$ a, b, c
+#define func_string_uint64_uint64_uint64_vars$ a, b, c
+#define func_uint32_vars$ 
+#define func_uint32_int32_vars$ a
+#define func_uint32_int32_int32_vars$ a, b
+#define func_uint32_int32_int32_int32_vars$ a, b, c
+#define func_uint32_int32_int32_intptr_vars$ a, b, c
+#define func_uint32_int32_int32_string_vars$ a, b, c
+#define func_uint32_int32_int32_uint32_vars$ a, b, c
+#define func_uint32_int32_int32_uint64_vars$ a, b, c
+#define func_uint32_int32_intptr_vars$ a, b
+#define func_uint32_int32_intptr_int32_vars$ a, b, c
+#define func_uint32_int32_intptr_intptr_vars$ a, b, c
+#define func_uint32_int32_intptr_string_vars$ a, b, c
+#define func_uint32_int32_intptr_uint32_vars$ a, b, c
+#define func_uint32_int32_intptr_uint64_vars$ a, b, c
+#define func_uint32_int32_string_vars$ a, b
+#define func_uint32_int32_string_int32_vars$ a, b, c
+#define func_uint32_int32_string_intptr_vars$ a, b, c
+#define func_uint32_int32_string_string_vars$ a, b, c
+#define func_uint32_int32_string_uint32_vars$ a, b, c
+#define func_uint32_int32_string_uint64_vars$ a, b, c
+#define func_uint32_int32_uint32_vars$ a, b
+#define func_uint32_int32_uint32_int32_vars$ a, b, c
+#define func_uint32_int32_uint32_intptr_vars$ a, b, c
+#define func_uint32_int32_uint32_string_vars$ a, b, c
+#define func_uint32_int32_uint32_uint32_vars$ a, b, c
+#define func_uint32_int32_uint32_uint64_vars$ a, b, c
+#define func_uint32_int32_uint64_vars$ a, b
+#define func_uint32_int32_uint64_int32_vars$ a, b, c
+#define func_uint32_int32_uint64_intptr_vars$ a, b, c
+#define func_uint32_int32_uint64_string_vars$ a, b, c
+#define func_uint32_int32_uint64_uint32_vars$ a, b, c
+#define func_uint32_int32_uint64_uint64_vars$ a, b, c
+#define func_uint32_intptr_vars$ a
+#define func_uint32_intptr_int32_vars$ a, b
+#define func_uint32_intptr_int32_int32_vars$ a, b, c
+#define func_uint32_intptr_int32_intptr_vars$ a, b, c
+#define func_uint32_intptr_int32_string_vars$ a, b, c
+#define func_uint32_intptr_int32_uint32_vars$ a, b, c
+#define func_uint32_intptr_int32_uint64_vars$ a, b, c
+#define func_uint32_intptr_intptr_vars$ a, b
+#define func_uint32_intptr_intptr_int32_vars$ a, b, c
+#define func_uint32_intptr_intptr_intptr_vars$ a, b, c
+#define func_uint32_intptr_intptr_string_vars$ a, b, c
+#define func_uint32_intptr_intptr_uint32_vars$ a, b, c
+#define func_uint32_intptr_intptr_uint64_vars$ a, b, c
+#define func_uint32_intptr_string_vars$ a, b
+#define func_uint32_intptr_string_int32_vars$ a, b, c
+#define func_uint32_intptr_string_intptr_vars$ a, b, c
+#define func_uint32_intptr_string_string_vars$ a, b, c
+#define func_uint32_intptr_string_uint32_vars$ a, b, c
+#define func_uint32_intptr_string_uint64_vars$ a, b, c
+#define func_uint32_intptr_uint32_vars$ a, b
+#define func_uint32_intptr_uint32_int32_vars$ a, b, c
+#define func_uint32_intptr_uint32_intptr_vars$ a, b, c
+#define func_uint32_intptr_uint32_string_vars$ a, b, c
+#define func_uint32_intptr_uint32_uint32_vars$ a, b, c
+#define func_uint32_intptr_uint32_uint64_vars$ a, b, c
+#define func_uint32_intptr_uint64_vars$ a, b
+#define func_uint32_intptr_uint64_int32_vars$ a, b, c
+#define func_uint32_intptr_uint64_intptr_vars$ a, b, c
+#define func_uint32_intptr_uint64_string_vars$ a, b, c
+#define func_uint32_intptr_uint64_uint32_vars$ a, b, c
+#define func_uint32_intptr_uint64_uint64_vars$ a, b, c
+#define func_uint32_string_vars$ a
+#define func_uint32_string_int32_vars$ a, b
+#define func_uint32_string_int32_int32_vars$ a, b, c
+#define func_uint32_string_int32_intptr_vars$ a, b, c
+#define func_uint32_string_int32_string_vars$ a, b, c
+#define func_uint32_string_int32_uint32_vars$ a, b, c
+#define func_uint32_string_int32_uint64_vars$ a, b, c
+#define func_uint32_string_intptr_vars$ a, b
 #define func_uint32_string_intptr_int32_vars$ a, b, c
-#define func_intptr_string_intptr_int32_vars$ a, b, c
-#define action_string_intptr_string_vars$ a, b, c
-#define func_uint64_string_intptr_string_vars$ a, b, c
-#define func_int32_string_intptr_string_vars$ a, b, c
-#define func_string_string_intptr_string_vars$ a, b, c
+#define func_uint32_string_intptr_intptr_vars$ a, b, c
 #define func_uint32_string_intptr_string_vars$ a, b, c
-#define func_intptr_string_intptr_string_vars$ a, b, c
-#define action_string_intptr_uint32_vars$ a, b, c
-#define func_uint64_string_intptr_uint32_vars$ a, b, c
-#define func_int32_string_intptr_uint32_vars$ a, b, c
-#define func_string_string_intptr_uint32_vars$ a, b, c
 #define func_uint32_string_intptr_uint32_vars$ a, b, c
-#define func_intptr_string_intptr_uint32_vars$ a, b, c
-#define action_string_intptr_intptr_vars$ a, b, c
-#define func_uint64_string_intptr_intptr_vars$ a, b, c
-#define func_int32_string_intptr_intptr_vars$ a, b, c
-#define func_string_string_intptr_intptr_vars$ a, b, c
-#define func_uint32_string_intptr_intptr_vars$ a, b, c
-#define func_intptr_string_intptr_intptr_vars$ a, b, c
-#define action_uint32_uint64_uint64_vars$ a, b, c
-#define func_uint64_uint32_uint64_uint64_vars$ a, b, c
-#define func_int32_uint32_uint64_uint64_vars$ a, b, c
-#define func_string_uint32_uint64_uint64_vars$ a, b, c
-#define func_uint32_uint32_uint64_uint64_vars$ a, b, c
-#define func_intptr_uint32_uint64_uint64_vars$ a, b, c
-#define action_uint32_uint64_int32_vars$ a, b, c
-#define func_uint64_uint32_uint64_int32_vars$ a, b, c
-#define func_int32_uint32_uint64_int32_vars$ a, b, c
-#define func_string_uint32_uint64_int32_vars$ a, b, c
-#define func_uint32_uint32_uint64_int32_vars$ a, b, c
-#define func_intptr_uint32_uint64_int32_vars$ a, b, c
-#define action_uint32_uint64_string_vars$ a, b, c
-#define func_uint64_uint32_uint64_string_vars$ a, b, c
-#define func_int32_uint32_uint64_string_vars$ a, b, c
-#define func_string_uint32_uint64_string_vars$ a, b, c
-#define func_uint32_uint32_uint64_string_vars$ a, b, c
-#define func_intptr_uint32_uint64_string_vars$ a, b, c
-#define action_uint32_uint64_uint32_vars$ a, b, c
-#define func_uint64_uint32_uint64_uint32_vars$ a, b, c
-#define func_int32_uint32_uint64_uint32_vars$ a, b, c
-#define func_string_uint32_uint64_uint32_vars$ a, b, c
-#define func_uint32_uint32_uint64_uint32_vars$ a, b, c
-#define func_intptr_uint32_uint64_uint32_vars$ a, b, c
-#define action_uint32_uint64_intptr_vars$ a, b, c
-#define func_uint64_uint32_uint64_intptr_vars$ a, b, c
-#define func_int32_uint32_uint64_intptr_vars$ a, b, c
-#define func_string_uint32_uint64_intptr_vars$ a, b, c
-#define func_uint32_uint32_uint64_intptr_vars$ a, b, c
-#define func_intptr_uint32_uint64_intptr_vars$ a, b, c
-#define action_uint32_int32_uint64_vars$ a, b, c
-#define func_uint64_uint32_int32_uint64_vars$ a, b, c
-#define func_int32_uint32_int32_uint64_vars$ a, b, c
-#define func_string_uint32_int32_uint64_vars$ a, b, c
-#define func_uint32_uint32_int32_uint64_vars$ a, b, c
-#define func_intptr_uint32_int32_uint64_vars$ a, b, c
-#define action_uint32_int32_int32_vars$ a, b, c
-#define func_uint64_uint32_int32_int32_vars$ a, b, c
-#define func_int32_uint32_int32_int32_vars$ a, b, c
-#define func_string_uint32_int32_int32_vars$ a, b, c
+#define func_uint32_string_intptr_uint64_vars$ a, b, c
+#define func_uint32_string_string_vars$ a, b
+#define func_uint32_string_string_int32_vars$ a, b, c
+#define func_uint32_string_string_intptr_vars$ a, b, c
+#define func_uint32_string_string_string_vars$ a, b, c
+#define func_uint32_string_string_uint32_vars$ a, b, c
+#define func_uint32_string_string_uint64_vars$ a, b, c
+#define func_uint32_string_uint32_vars$ a, b
+#define func_uint32_string_uint32_int32_vars$ a, b, c
+#define func_uint32_string_uint32_intptr_vars$ a, b, c
+#define func_uint32_string_uint32_string_vars$ a, b, c
+#define func_uint32_string_uint32_uint32_vars$ a, b, c
+#define func_uint32_string_uint32_uint64_vars$ a, b, c
+#define func_uint32_string_uint64_vars$ a, b
+#define func_uint32_string_uint64_int32_vars$ a, b, c
+#define func_uint32_string_uint64_intptr_vars$ a, b, c
+#define func_uint32_string_uint64_string_vars$ a, b, c
+#define func_uint32_string_uint64_uint32_vars$ a, b, c
+#define func_uint32_string_uint64_uint64_vars$ a, b, c
+#define func_uint32_uint32_vars$ a
+#define func_uint32_uint32_int32_vars$ a, b
 #define func_uint32_uint32_int32_int32_vars$ a, b, c
-#define func_intptr_uint32_int32_int32_vars$ a, b, c
-#define action_uint32_int32_string_vars$ a, b, c
-#define func_uint64_uint32_int32_string_vars$ a, b, c
-#define func_int32_uint32_int32_string_vars$ a, b, c
-#define func_string_uint32_int32_string_vars$ a, b, c
+#define func_uint32_uint32_int32_intptr_vars$ a, b, c
 #define func_uint32_uint32_int32_string_vars$ a, b, c
-#define func_intptr_uint32_int32_string_vars$ a, b, c
-#define action_uint32_int32_uint32_vars$ a, b, c
-#define func_uint64_uint32_int32_uint32_vars$ a, b, c
-#define func_int32_uint32_int32_uint32_vars$ a, b, c
-#define func_string_uint32_int32_uint32_vars$ a, b, c
 #define func_uint32_uint32_int32_uint32_vars$ a, b, c
-#define func_intptr_uint32_int32_uint32_vars$ a, b, c
-#define action_uint32_int32_intptr_vars$ a, b, c
-#define func_uint64_uint32_int32_intptr_vars$ a, b, c
-#define func_int32_uint32_int32_intptr_vars$ a, b, c
-#define func_string_uint32_int32_intptr_vars$ a, b, c
-#define func_uint32_uint32_int32_intptr_vars$ a, b, c
-#define func_intptr_uint32_int32_intptr_vars$ a, b, c
-#define action_uint32_string_uint64_vars$ a, b, c
-#define func_uint64_uint32_string_uint64_vars$ a, b, c
-#define func_int32_uint32_string_uint64_vars$ a, b, c
-#define func_string_uint32_string_uint64_vars$ a, b, c
-#define func_uint32_uint32_string_uint64_vars$ a, b, c
-#define func_intptr_uint32_string_uint64_vars$ a, b, c
-#define action_uint32_string_int32_vars$ a, b, c
-#define func_uint64_uint32_string_int32_vars$ a, b, c
-#define func_int32_uint32_string_int32_vars$ a, b, c
-#define func_string_uint32_string_int32_vars$ a, b, c
-#define func_uint32_uint32_string_int32_vars$ a, b, c
-#define func_intptr_uint32_string_int32_vars$ a, b, c
-#define action_uint32_string_string_vars$ a, b, c
-#define func_uint64_uint32_string_string_vars$ a, b, c
-#define func_int32_uint32_string_string_vars$ a, b, c
-#define func_string_uint32_string_string_vars$ a, b, c
-#define func_uint32_uint32_string_string_vars$ a, b, c
-#define func_intptr_uint32_string_string_vars$ a, b, c
-#define action_uint32_string_uint32_vars$ a, b, c
-#define func_uint64_uint32_string_uint32_vars$ a, b, c
-#define func_int32_uint32_string_uint32_vars$ a, b, c
-#define func_string_uint32_string_uint32_vars$ a, b, c
-#define func_uint32_uint32_string_uint32_vars$ a, b, c
-#define func_intptr_uint32_string_uint32_vars$ a, b, c
-#define action_uint32_string_intptr_vars$ a, b, c
-#define func_uint64_uint32_string_intptr_vars$ a, b, c
-#define func_int32_uint32_string_intptr_vars$ a, b, c
-#define func_string_uint32_string_intptr_vars$ a, b, c
-#define func_uint32_uint32_string_intptr_vars$ a, b, c
-#define func_intptr_uint32_string_intptr_vars$ a, b, c
-#define action_uint32_uint32_uint64_vars$ a, b, c
-#define func_uint64_uint32_uint32_uint64_vars$ a, b, c
-#define func_int32_uint32_uint32_uint64_vars$ a, b, c
-#define func_string_uint32_uint32_uint64_vars$ a, b, c
-#define func_uint32_uint32_uint32_uint64_vars$ a, b, c
-#define func_intptr_uint32_uint32_uint64_vars$ a, b, c
-#define action_uint32_uint32_int32_vars$ a, b, c
-#define func_uint64_uint32_uint32_int32_vars$ a, b, c
-#define func_int32_uint32_uint32_int32_vars$ a, b, c
-#define func_string_uint32_uint32_int32_vars$ a, b, c
-#define func_uint32_uint32_uint32_int32_vars$ a, b, c
-#define func_intptr_uint32_uint32_int32_vars$ a, b, c
-#define action_uint32_uint32_string_vars$ a, b, c
-#define func_uint64_uint32_uint32_string_vars$ a, b, c
-#define func_int32_uint32_uint32_string_vars$ a, b, c
-#define func_string_uint32_uint32_string_vars$ a, b, c
-#define func_uint32_uint32_uint32_string_vars$ a, b, c
-#define func_intptr_uint32_uint32_string_vars$ a, b, c
-#define action_uint32_uint32_uint32_vars$ a, b, c
-#define func_uint64_uint32_uint32_uint32_vars$ a, b, c
-#define func_int32_uint32_uint32_uint32_vars$ a, b, c
-#define func_string_uint32_uint32_uint32_vars$ a, b, c
-#define func_uint32_uint32_uint32_uint32_vars$ a, b, c
-#define func_intptr_uint32_uint32_uint32_vars$ a, b, c
-#define action_uint32_uint32_intptr_vars$ a, b, c
-#define func_uint64_uint32_uint32_intptr_vars$ a, b, c
-#define func_int32_uint32_uint32_intptr_vars$ a, b, c
-#define func_string_uint32_uint32_intptr_vars$ a, b, c
-#define func_uint32_uint32_uint32_intptr_vars$ a, b, c
-#define func_intptr_uint32_uint32_intptr_vars$ a, b, c
-#define action_uint32_intptr_uint64_vars$ a, b, c
-#define func_uint64_uint32_intptr_uint64_vars$ a, b, c
-#define func_int32_uint32_intptr_uint64_vars$ a, b, c
-#define func_string_uint32_intptr_uint64_vars$ a, b, c
-#define func_uint32_uint32_intptr_uint64_vars$ a, b, c
-#define func_intptr_uint32_intptr_uint64_vars$ a, b, c
-#define action_uint32_intptr_int32_vars$ a, b, c
-#define func_uint64_uint32_intptr_int32_vars$ a, b, c
-#define func_int32_uint32_intptr_int32_vars$ a, b, c
-#define func_string_uint32_intptr_int32_vars$ a, b, c
+#define func_uint32_uint32_int32_uint64_vars$ a, b, c
+#define func_uint32_uint32_intptr_vars$ a, b
 #define func_uint32_uint32_intptr_int32_vars$ a, b, c
-#define func_intptr_uint32_intptr_int32_vars$ a, b, c
-#define action_uint32_intptr_string_vars$ a, b, c
-#define func_uint64_uint32_intptr_string_vars$ a, b, c
-#define func_int32_uint32_intptr_string_vars$ a, b, c
-#define func_string_uint32_intptr_string_vars$ a, b, c
+#define func_uint32_uint32_intptr_intptr_vars$ a, b, c
 #define func_uint32_uint32_intptr_string_vars$ a, b, c
-#define func_intptr_uint32_intptr_string_vars$ a, b, c
-#define action_uint32_intptr_uint32_vars$ a, b, c
-#define func_uint64_uint32_intptr_uint32_vars$ a, b, c
-#define func_int32_uint32_intptr_uint32_vars$ a, b, c
-#define func_string_uint32_intptr_uint32_vars$ a, b, c
 #define func_uint32_uint32_intptr_uint32_vars$ a, b, c
-#define func_intptr_uint32_intptr_uint32_vars$ a, b, c
-#define action_uint32_intptr_intptr_vars$ a, b, c
-#define func_uint64_uint32_intptr_intptr_vars$ a, b, c
-#define func_int32_uint32_intptr_intptr_vars$ a, b, c
-#define func_string_uint32_intptr_intptr_vars$ a, b, c
-#define func_uint32_uint32_intptr_intptr_vars$ a, b, c
-#define func_intptr_uint32_intptr_intptr_vars$ a, b, c
-#define action_intptr_uint64_uint64_vars$ a, b, c
-#define func_uint64_intptr_uint64_uint64_vars$ a, b, c
-#define func_int32_intptr_uint64_uint64_vars$ a, b, c
-#define func_string_intptr_uint64_uint64_vars$ a, b, c
-#define func_uint32_intptr_uint64_uint64_vars$ a, b, c
-#define func_intptr_intptr_uint64_uint64_vars$ a, b, c
-#define action_intptr_uint64_int32_vars$ a, b, c
-#define func_uint64_intptr_uint64_int32_vars$ a, b, c
-#define func_int32_intptr_uint64_int32_vars$ a, b, c
-#define func_string_intptr_uint64_int32_vars$ a, b, c
-#define func_uint32_intptr_uint64_int32_vars$ a, b, c
-#define func_intptr_intptr_uint64_int32_vars$ a, b, c
-#define action_intptr_uint64_string_vars$ a, b, c
-#define func_uint64_intptr_uint64_string_vars$ a, b, c
-#define func_int32_intptr_uint64_string_vars$ a, b, c
-#define func_string_intptr_uint64_string_vars$ a, b, c
-#define func_uint32_intptr_uint64_string_vars$ a, b, c
-#define func_intptr_intptr_uint64_string_vars$ a, b, c
-#define action_intptr_uint64_uint32_vars$ a, b, c
-#define func_uint64_intptr_uint64_uint32_vars$ a, b, c
-#define func_int32_intptr_uint64_uint32_vars$ a, b, c
-#define func_string_intptr_uint64_uint32_vars$ a, b, c
-#define func_uint32_intptr_uint64_uint32_vars$ a, b, c
-#define func_intptr_intptr_uint64_uint32_vars$ a, b, c
-#define action_intptr_uint64_intptr_vars$ a, b, c
-#define func_uint64_intptr_uint64_intptr_vars$ a, b, c
-#define func_int32_intptr_uint64_intptr_vars$ a, b, c
-#define func_string_intptr_uint64_intptr_vars$ a, b, c
-#define func_uint32_intptr_uint64_intptr_vars$ a, b, c
-#define func_intptr_intptr_uint64_intptr_vars$ a, b, c
-#define action_intptr_int32_uint64_vars$ a, b, c
-#define func_uint64_intptr_int32_uint64_vars$ a, b, c
-#define func_int32_intptr_int32_uint64_vars$ a, b, c
-#define func_string_intptr_int32_uint64_vars$ a, b, c
-#define func_uint32_intptr_int32_uint64_vars$ a, b, c
-#define func_intptr_intptr_int32_uint64_vars$ a, b, c
-#define action_intptr_int32_int32_vars$ a, b, c
+#define func_uint32_uint32_intptr_uint64_vars$ a, b, c
+#define func_uint32_uint32_string_vars$ a, b
+#define func_uint32_uint32_string_int32_vars$ a, b, c
+#define func_uint32_uint32_string_intptr_vars$ a, b, c
+#define func_uint32_uint32_string_string_vars$ a, b, c
+#define func_uint32_uint32_string_uint32_vars$ a, b, c
+#define func_uint32_uint32_string_uint64_vars$ a, b, c
+#define func_uint32_uint32_uint32_vars$ a, b
+#define func_uint32_uint32_uint32_int32_vars$ a, b, c
+#define func_uint32_uint32_uint32_intptr_vars$ a, b, c
+#define func_uint32_uint32_uint32_string_vars$ a, b, c
+#define func_uint32_uint32_uint32_uint32_vars$ a, b, c
+#define func_uint32_uint32_uint32_uint64_vars$ a, b, c
+#define func_uint32_uint32_uint64_vars$ a, b
+#define func_uint32_uint32_uint64_int32_vars$ a, b, c
+#define func_uint32_uint32_uint64_intptr_vars$ a, b, c
+#define func_uint32_uint32_uint64_string_vars$ a, b, c
+#define func_uint32_uint32_uint64_uint32_vars$ a, b, c
+#define func_uint32_uint32_uint64_uint64_vars$ a, b, c
+#define func_uint32_uint64_vars$ a
+#define func_uint32_uint64_int32_vars$ a, b
+#define func_uint32_uint64_int32_int32_vars$ a, b, c
+#define func_uint32_uint64_int32_intptr_vars$ a, b, c
+#define func_uint32_uint64_int32_string_vars$ a, b, c
+#define func_uint32_uint64_int32_uint32_vars$ a, b, c
+#define func_uint32_uint64_int32_uint64_vars$ a, b, c
+#define func_uint32_uint64_intptr_vars$ a, b
+#define func_uint32_uint64_intptr_int32_vars$ a, b, c
+#define func_uint32_uint64_intptr_intptr_vars$ a, b, c
+#define func_uint32_uint64_intptr_string_vars$ a, b, c
+#define func_uint32_uint64_intptr_uint32_vars$ a, b, c
+#define func_uint32_uint64_intptr_uint64_vars$ a, b, c
+#define func_uint32_uint64_string_vars$ a, b
+#define func_uint32_uint64_string_int32_vars$ a, b, c
+#define func_uint32_uint64_string_intptr_vars$ a, b, c
+#define func_uint32_uint64_string_string_vars$ a, b, c
+#define func_uint32_uint64_string_uint32_vars$ a, b, c
+#define func_uint32_uint64_string_uint64_vars$ a, b, c
+#define func_uint32_uint64_uint32_vars$ a, b
+#define func_uint32_uint64_uint32_int32_vars$ a, b, c
+#define func_uint32_uint64_uint32_intptr_vars$ a, b, c
+#define func_uint32_uint64_uint32_string_vars$ a, b, c
+#define func_uint32_uint64_uint32_uint32_vars$ a, b, c
+#define func_uint32_uint64_uint32_uint64_vars$ a, b, c
+#define func_uint32_uint64_uint64_vars$ a, b
+#define func_uint32_uint64_uint64_int32_vars$ a, b, c
+#define func_uint32_uint64_uint64_intptr_vars$ a, b, c
+#define func_uint32_uint64_uint64_string_vars$ a, b, c
+#define func_uint32_uint64_uint64_uint32_vars$ a, b, c
+#define func_uint32_uint64_uint64_uint64_vars$ a, b, c
+#define func_uint64_vars$ 
+#define func_uint64_int32_vars$ a
+#define func_uint64_int32_int32_vars$ a, b
+#define func_uint64_int32_int32_int32_vars$ a, b, c
+#define func_uint64_int32_int32_intptr_vars$ a, b, c
+#define func_uint64_int32_int32_string_vars$ a, b, c
+#define func_uint64_int32_int32_uint32_vars$ a, b, c
+#define func_uint64_int32_int32_uint64_vars$ a, b, c
+#define func_uint64_int32_intptr_vars$ a, b
+#define func_uint64_int32_intptr_int32_vars$ a, b, c
+#define func_uint64_int32_intptr_intptr_vars$ a, b, c
+#define func_uint64_int32_intptr_string_vars$ a, b, c
+#define func_uint64_int32_intptr_uint32_vars$ a, b, c
+#define func_uint64_int32_intptr_uint64_vars$ a, b, c
+#define func_uint64_int32_string_vars$ a, b
+#define func_uint64_int32_string_int32_vars$ a, b, c
+#define func_uint64_int32_string_intptr_vars$ a, b, c
+#define func_uint64_int32_string_string_vars$ a, b, c
+#define func_uint64_int32_string_uint32_vars$ a, b, c
+#define func_uint64_int32_string_uint64_vars$ a, b, c
+#define func_uint64_int32_uint32_vars$ a, b
+#define func_uint64_int32_uint32_int32_vars$ a, b, c
+#define func_uint64_int32_uint32_intptr_vars$ a, b, c
+#define func_uint64_int32_uint32_string_vars$ a, b, c
+#define func_uint64_int32_uint32_uint32_vars$ a, b, c
+#define func_uint64_int32_uint32_uint64_vars$ a, b, c
+#define func_uint64_int32_uint64_vars$ a, b
+#define func_uint64_int32_uint64_int32_vars$ a, b, c
+#define func_uint64_int32_uint64_intptr_vars$ a, b, c
+#define func_uint64_int32_uint64_string_vars$ a, b, c
+#define func_uint64_int32_uint64_uint32_vars$ a, b, c
+#define func_uint64_int32_uint64_uint64_vars$ a, b, c
+#define func_uint64_intptr_vars$ a
+#define func_uint64_intptr_int32_vars$ a, b
 #define func_uint64_intptr_int32_int32_vars$ a, b, c
-#define func_int32_intptr_int32_int32_vars$ a, b, c
-#define func_string_intptr_int32_int32_vars$ a, b, c
-#define func_uint32_intptr_int32_int32_vars$ a, b, c
-#define func_intptr_intptr_int32_int32_vars$ a, b, c
-#define action_intptr_int32_string_vars$ a, b, c
+#define func_uint64_intptr_int32_intptr_vars$ a, b, c
 #define func_uint64_intptr_int32_string_vars$ a, b, c
-#define func_int32_intptr_int32_string_vars$ a, b, c
-#define func_string_intptr_int32_string_vars$ a, b, c
-#define func_uint32_intptr_int32_string_vars$ a, b, c
-#define func_intptr_intptr_int32_string_vars$ a, b, c
-#define action_intptr_int32_uint32_vars$ a, b, c
 #define func_uint64_intptr_int32_uint32_vars$ a, b, c
-#define func_int32_intptr_int32_uint32_vars$ a, b, c
-#define func_string_intptr_int32_uint32_vars$ a, b, c
-#define func_uint32_intptr_int32_uint32_vars$ a, b, c
-#define func_intptr_intptr_int32_uint32_vars$ a, b, c
-#define action_intptr_int32_intptr_vars$ a, b, c
-#define func_uint64_intptr_int32_intptr_vars$ a, b, c
-#define func_int32_intptr_int32_intptr_vars$ a, b, c
-#define func_string_intptr_int32_intptr_vars$ a, b, c
-#define func_uint32_intptr_int32_intptr_vars$ a, b, c
-#define func_intptr_intptr_int32_intptr_vars$ a, b, c
-#define action_intptr_string_uint64_vars$ a, b, c
-#define func_uint64_intptr_string_uint64_vars$ a, b, c
-#define func_int32_intptr_string_uint64_vars$ a, b, c
-#define func_string_intptr_string_uint64_vars$ a, b, c
-#define func_uint32_intptr_string_uint64_vars$ a, b, c
-#define func_intptr_intptr_string_uint64_vars$ a, b, c
-#define action_intptr_string_int32_vars$ a, b, c
+#define func_uint64_intptr_int32_uint64_vars$ a, b, c
+#define func_uint64_intptr_intptr_vars$ a, b
+#define func_uint64_intptr_intptr_int32_vars$ a, b, c
+#define func_uint64_intptr_intptr_intptr_vars$ a, b, c
+#define func_uint64_intptr_intptr_string_vars$ a, b, c
+#define func_uint64_intptr_intptr_uint32_vars$ a, b, c
+#define func_uint64_intptr_intptr_uint64_vars$ a, b, c
+#define func_uint64_intptr_string_vars$ a, b
 #define func_uint64_intptr_string_int32_vars$ a, b, c
-#define func_int32_intptr_string_int32_vars$ a, b, c
-#define func_string_intptr_string_int32_vars$ a, b, c
-#define func_uint32_intptr_string_int32_vars$ a, b, c
-#define func_intptr_intptr_string_int32_vars$ a, b, c
-#define action_intptr_string_string_vars$ a, b, c
+#define func_uint64_intptr_string_intptr_vars$ a, b, c
 #define func_uint64_intptr_string_string_vars$ a, b, c
-#define func_int32_intptr_string_string_vars$ a, b, c
-#define func_string_intptr_string_string_vars$ a, b, c
-#define func_uint32_intptr_string_string_vars$ a, b, c
-#define func_intptr_intptr_string_string_vars$ a, b, c
-#define action_intptr_string_uint32_vars$ a, b, c
 #define func_uint64_intptr_string_uint32_vars$ a, b, c
-#define func_int32_intptr_string_uint32_vars$ a, b, c
-#define func_string_intptr_string_uint32_vars$ a, b, c
-#define func_uint32_intptr_string_uint32_vars$ a, b, c
-#define func_intptr_intptr_string_uint32_vars$ a, b, c
-#define action_intptr_string_intptr_vars$ a, b, c
-#define func_uint64_intptr_string_intptr_vars$ a, b, c
-#define func_int32_intptr_string_intptr_vars$ a, b, c
-#define func_string_intptr_string_intptr_vars$ a, b, c
-#define func_uint32_intptr_string_intptr_vars$ a, b, c
-#define func_intptr_intptr_string_intptr_vars$ a, b, c
-#define action_intptr_uint32_uint64_vars$ a, b, c
-#define func_uint64_intptr_uint32_uint64_vars$ a, b, c
-#define func_int32_intptr_uint32_uint64_vars$ a, b, c
-#define func_string_intptr_uint32_uint64_vars$ a, b, c
-#define func_uint32_intptr_uint32_uint64_vars$ a, b, c
-#define func_intptr_intptr_uint32_uint64_vars$ a, b, c
-#define action_intptr_uint32_int32_vars$ a, b, c
+#define func_uint64_intptr_string_uint64_vars$ a, b, c
+#define func_uint64_intptr_uint32_vars$ a, b
 #define func_uint64_intptr_uint32_int32_vars$ a, b, c
-#define func_int32_intptr_uint32_int32_vars$ a, b, c
-#define func_string_intptr_uint32_int32_vars$ a, b, c
-#define func_uint32_intptr_uint32_int32_vars$ a, b, c
-#define func_intptr_intptr_uint32_int32_vars$ a, b, c
-#define action_intptr_uint32_string_vars$ a, b, c
+#define func_uint64_intptr_uint32_intptr_vars$ a, b, c
 #define func_uint64_intptr_uint32_string_vars$ a, b, c
-#define func_int32_intptr_uint32_string_vars$ a, b, c
-#define func_string_intptr_uint32_string_vars$ a, b, c
-#define func_uint32_intptr_uint32_string_vars$ a, b, c
-#define func_intptr_intptr_uint32_string_vars$ a, b, c
-#define action_intptr_uint32_uint32_vars$ a, b, c
 #define func_uint64_intptr_uint32_uint32_vars$ a, b, c
-#define func_int32_intptr_uint32_uint32_vars$ a, b, c
-#define func_string_intptr_uint32_uint32_vars$ a, b, c
-#define func_uint32_intptr_uint32_uint32_vars$ a, b, c
-#define func_intptr_intptr_uint32_uint32_vars$ a, b, c
-#define action_intptr_uint32_intptr_vars$ a, b, c
-#define func_uint64_intptr_uint32_intptr_vars$ a, b, c
-#define func_int32_intptr_uint32_intptr_vars$ a, b, c
-#define func_string_intptr_uint32_intptr_vars$ a, b, c
-#define func_uint32_intptr_uint32_intptr_vars$ a, b, c
-#define func_intptr_intptr_uint32_intptr_vars$ a, b, c
-#define action_intptr_intptr_uint64_vars$ a, b, c
-#define func_uint64_intptr_intptr_uint64_vars$ a, b, c
-#define func_int32_intptr_intptr_uint64_vars$ a, b, c
-#define func_string_intptr_intptr_uint64_vars$ a, b, c
-#define func_uint32_intptr_intptr_uint64_vars$ a, b, c
-#define func_intptr_intptr_intptr_uint64_vars$ a, b, c
-#define action_intptr_intptr_int32_vars$ a, b, c
-#define func_uint64_intptr_intptr_int32_vars$ a, b, c
-#define func_int32_intptr_intptr_int32_vars$ a, b, c
-#define func_string_intptr_intptr_int32_vars$ a, b, c
-#define func_uint32_intptr_intptr_int32_vars$ a, b, c
-#define func_intptr_intptr_intptr_int32_vars$ a, b, c
-#define action_intptr_intptr_string_vars$ a, b, c
-#define func_uint64_intptr_intptr_string_vars$ a, b, c
-#define func_int32_intptr_intptr_string_vars$ a, b, c
-#define func_string_intptr_intptr_string_vars$ a, b, c
-#define func_uint32_intptr_intptr_string_vars$ a, b, c
-#define func_intptr_intptr_intptr_string_vars$ a, b, c
-#define action_intptr_intptr_uint32_vars$ a, b, c
-#define func_uint64_intptr_intptr_uint32_vars$ a, b, c
-#define func_int32_intptr_intptr_uint32_vars$ a, b, c
-#define func_string_intptr_intptr_uint32_vars$ a, b, c
-#define func_uint32_intptr_intptr_uint32_vars$ a, b, c
-#define func_intptr_intptr_intptr_uint32_vars$ a, b, c
-#define action_intptr_intptr_intptr_vars$ a, b, c
-#define func_uint64_intptr_intptr_intptr_vars$ a, b, c
-#define func_int32_intptr_intptr_intptr_vars$ a, b, c
-#define func_string_intptr_intptr_intptr_vars$ a, b, c
-#define func_uint32_intptr_intptr_intptr_vars$ a, b, c
-#define func_intptr_intptr_intptr_intptr_vars$ a, b, c
-#define action_vars$ 
-#define func_uint64_vars$ 
-#define func_int32_vars$ 
-#define func_string_vars$ 
-#define func_uint32_vars$ 
-#define func_intptr_vars$ 
-#define action_uint64_args$ uint64_t a
-#define func_uint64_uint64_args$ uint64_t a
-#define func_int32_uint64_args$ uint64_t a
-#define func_string_uint64_args$ uint64_t a
-#define func_uint32_uint64_args$ uint64_t a
-#define func_intptr_uint64_args$ uint64_t a
+#define func_uint64_intptr_uint32_uint64_vars$ a, b, c
+#define func_uint64_intptr_uint64_vars$ a, b
+#define func_uint64_intptr_uint64_int32_vars$ a, b, c
+#define func_uint64_intptr_uint64_intptr_vars$ a, b, c
+#define func_uint64_intptr_uint64_string_vars$ a, b, c
+#define func_uint64_intptr_uint64_uint32_vars$ a, b, c
+#define func_uint64_intptr_uint64_uint64_vars$ a, b, c
+#define func_uint64_string_vars$ a
+#define func_uint64_string_int32_vars$ a, b
+#define func_uint64_string_int32_int32_vars$ a, b, c
+#define func_uint64_string_int32_intptr_vars$ a, b, c
+#define func_uint64_string_int32_string_vars$ a, b, c
+#define func_uint64_string_int32_uint32_vars$ a, b, c
+#define func_uint64_string_int32_uint64_vars$ a, b, c
+#define func_uint64_string_intptr_vars$ a, b
+#define func_uint64_string_intptr_int32_vars$ a, b, c
+#define func_uint64_string_intptr_intptr_vars$ a, b, c
+#define func_uint64_string_intptr_string_vars$ a, b, c
+#define func_uint64_string_intptr_uint32_vars$ a, b, c
+#define func_uint64_string_intptr_uint64_vars$ a, b, c
+#define func_uint64_string_string_vars$ a, b
+#define func_uint64_string_string_int32_vars$ a, b, c
+#define func_uint64_string_string_intptr_vars$ a, b, c
+#define func_uint64_string_string_string_vars$ a, b, c
+#define func_uint64_string_string_uint32_vars$ a, b, c
+#define func_uint64_string_string_uint64_vars$ a, b, c
+#define func_uint64_string_uint32_vars$ a, b
+#define func_uint64_string_uint32_int32_vars$ a, b, c
+#define func_uint64_string_uint32_intptr_vars$ a, b, c
+#define func_uint64_string_uint32_string_vars$ a, b, c
+#define func_uint64_string_uint32_uint32_vars$ a, b, c
+#define func_uint64_string_uint32_uint64_vars$ a, b, c
+#define func_uint64_string_uint64_vars$ a, b
+#define func_uint64_string_uint64_int32_vars$ a, b, c
+#define func_uint64_string_uint64_intptr_vars$ a, b, c
+#define func_uint64_string_uint64_string_vars$ a, b, c
+#define func_uint64_string_uint64_uint32_vars$ a, b, c
+#define func_uint64_string_uint64_uint64_vars$ a, b, c
+#define func_uint64_uint32_vars$ a
+#define func_uint64_uint32_int32_vars$ a, b
+#define func_uint64_uint32_int32_int32_vars$ a, b, c
+#define func_uint64_uint32_int32_intptr_vars$ a, b, c
+#define func_uint64_uint32_int32_string_vars$ a, b, c
+#define func_uint64_uint32_int32_uint32_vars$ a, b, c
+#define func_uint64_uint32_int32_uint64_vars$ a, b, c
+#define func_uint64_uint32_intptr_vars$ a, b
+#define func_uint64_uint32_intptr_int32_vars$ a, b, c
+#define func_uint64_uint32_intptr_intptr_vars$ a, b, c
+#define func_uint64_uint32_intptr_string_vars$ a, b, c
+#define func_uint64_uint32_intptr_uint32_vars$ a, b, c
+#define func_uint64_uint32_intptr_uint64_vars$ a, b, c
+#define func_uint64_uint32_string_vars$ a, b
+#define func_uint64_uint32_string_int32_vars$ a, b, c
+#define func_uint64_uint32_string_intptr_vars$ a, b, c
+#define func_uint64_uint32_string_string_vars$ a, b, c
+#define func_uint64_uint32_string_uint32_vars$ a, b, c
+#define func_uint64_uint32_string_uint64_vars$ a, b, c
+#define func_uint64_uint32_uint32_vars$ a, b
+#define func_uint64_uint32_uint32_int32_vars$ a, b, c
+#define func_uint64_uint32_uint32_intptr_vars$ a, b, c
+#define func_uint64_uint32_uint32_string_vars$ a, b, c
+#define func_uint64_uint32_uint32_uint32_vars$ a, b, c
+#define func_uint64_uint32_uint32_uint64_vars$ a, b, c
+#define func_uint64_uint32_uint64_vars$ a, b
+#define func_uint64_uint32_uint64_int32_vars$ a, b, c
+#define func_uint64_uint32_uint64_intptr_vars$ a, b, c
+#define func_uint64_uint32_uint64_string_vars$ a, b, c
+#define func_uint64_uint32_uint64_uint32_vars$ a, b, c
+#define func_uint64_uint32_uint64_uint64_vars$ a, b, c
+#define func_uint64_uint64_vars$ a
+#define func_uint64_uint64_int32_vars$ a, b
+#define func_uint64_uint64_int32_int32_vars$ a, b, c
+#define func_uint64_uint64_int32_intptr_vars$ a, b, c
+#define func_uint64_uint64_int32_string_vars$ a, b, c
+#define func_uint64_uint64_int32_uint32_vars$ a, b, c
+#define func_uint64_uint64_int32_uint64_vars$ a, b, c
+#define func_uint64_uint64_intptr_vars$ a, b
+#define func_uint64_uint64_intptr_int32_vars$ a, b, c
+#define func_uint64_uint64_intptr_intptr_vars$ a, b, c
+#define func_uint64_uint64_intptr_string_vars$ a, b, c
+#define func_uint64_uint64_intptr_uint32_vars$ a, b, c
+#define func_uint64_uint64_intptr_uint64_vars$ a, b, c
+#define func_uint64_uint64_string_vars$ a, b
+#define func_uint64_uint64_string_int32_vars$ a, b, c
+#define func_uint64_uint64_string_intptr_vars$ a, b, c
+#define func_uint64_uint64_string_string_vars$ a, b, c
+#define func_uint64_uint64_string_uint32_vars$ a, b, c
+#define func_uint64_uint64_string_uint64_vars$ a, b, c
+#define func_uint64_uint64_uint32_vars$ a, b
+#define func_uint64_uint64_uint32_int32_vars$ a, b, c
+#define func_uint64_uint64_uint32_intptr_vars$ a, b, c
+#define func_uint64_uint64_uint32_string_vars$ a, b, c
+#define func_uint64_uint64_uint32_uint32_vars$ a, b, c
+#define func_uint64_uint64_uint32_uint64_vars$ a, b, c
+#define func_uint64_uint64_uint64_vars$ a, b
+#define func_uint64_uint64_uint64_int32_vars$ a, b, c
+#define func_uint64_uint64_uint64_intptr_vars$ a, b, c
+#define func_uint64_uint64_uint64_string_vars$ a, b, c
+#define func_uint64_uint64_uint64_uint32_vars$ a, b, c
+#define func_uint64_uint64_uint64_uint64_vars$ a, b, c
+#define action_args$ 
 #define action_int32_args$ int32_t a
-#define func_uint64_int32_args$ int32_t a
-#define func_int32_int32_args$ int32_t a
-#define func_string_int32_args$ int32_t a
-#define func_uint32_int32_args$ int32_t a
-#define func_intptr_int32_args$ int32_t a
+#define action_int32_int32_args$ int32_t a, int32_t b
+#define action_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
+#define action_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
+#define action_int32_int32_string_args$ int32_t a, int32_t b, char * c
+#define action_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
+#define action_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
+#define action_int32_intptr_args$ int32_t a, void * b
+#define action_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
+#define action_int32_intptr_intptr_args$ int32_t a, void * b, void * c
+#define action_int32_intptr_string_args$ int32_t a, void * b, char * c
+#define action_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
+#define action_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
+#define action_int32_string_args$ int32_t a, char * b
+#define action_int32_string_int32_args$ int32_t a, char * b, int32_t c
+#define action_int32_string_intptr_args$ int32_t a, char * b, void * c
+#define action_int32_string_string_args$ int32_t a, char * b, char * c
+#define action_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
+#define action_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
+#define action_int32_uint32_args$ int32_t a, uint32_t b
+#define action_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
+#define action_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
+#define action_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
+#define action_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
+#define action_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
+#define action_int32_uint64_args$ int32_t a, uint64_t b
+#define action_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
+#define action_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
+#define action_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
+#define action_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
+#define action_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
+#define action_intptr_args$ void * a
+#define action_intptr_int32_args$ void * a, int32_t b
+#define action_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
+#define action_intptr_int32_intptr_args$ void * a, int32_t b, void * c
+#define action_intptr_int32_string_args$ void * a, int32_t b, char * c
+#define action_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
+#define action_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
+#define action_intptr_intptr_args$ void * a, void * b
+#define action_intptr_intptr_int32_args$ void * a, void * b, int32_t c
+#define action_intptr_intptr_intptr_args$ void * a, void * b, void * c
+#define action_intptr_intptr_string_args$ void * a, void * b, char * c
+#define action_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
+#define action_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
+#define action_intptr_string_args$ void * a, char * b
+#define action_intptr_string_int32_args$ void * a, char * b, int32_t c
+#define action_intptr_string_intptr_args$ void * a, char * b, void * c
+#define action_intptr_string_string_args$ void * a, char * b, char * c
+#define action_intptr_string_uint32_args$ void * a, char * b, uint32_t c
+#define action_intptr_string_uint64_args$ void * a, char * b, uint64_t c
+#define action_intptr_uint32_args$ void * a, uint32_t b
+#define action_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
+#define action_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
+#define action_intptr_uint32_string_args$ void * a, uint32_t b, char * c
+#define action_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
+#define action_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
+#define action_intptr_uint64_args$ void * a, uint64_t b
+#define action_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
+#define action_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
+#define action_intptr_uint64_string_args$ void * a, uint64_t b, char * c
+#define action_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
+#define action_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
 #define action_string_args$ char * a
-#define func_uint64_string_args$ char * a
-#define func_int32_string_args$ char * a
-#define func_string_string_args$ char * a
-#define func_uint32_string_args$ char * a
-#define func_intptr_string_args$ char * a
+#define action_string_int32_args$ char * a, int32_t b
+#define action_string_int32_int32_args$ char * a, int32_t b, int32_t c
+#define action_string_int32_intptr_args$ char * a, int32_t b, void * c
+#define action_string_int32_string_args$ char * a, int32_t b, char * c
+#define action_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
+#define action_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
+#define action_string_intptr_args$ char * a, void * b
+#define action_string_intptr_int32_args$ char * a, void * b, int32_t c
+#define action_string_intptr_intptr_args$ char * a, void * b, void * c
+#define action_string_intptr_string_args$ char * a, void * b, char * c
+#define action_string_intptr_uint32_args$ char * a, void * b, uint32_t c
+#define action_string_intptr_uint64_args$ char * a, void * b, uint64_t c
+#define action_string_string_args$ char * a, char * b
+#define action_string_string_int32_args$ char * a, char * b, int32_t c
+#define action_string_string_intptr_args$ char * a, char * b, void * c
+#define action_string_string_string_args$ char * a, char * b, char * c
+#define action_string_string_uint32_args$ char * a, char * b, uint32_t c
+#define action_string_string_uint64_args$ char * a, char * b, uint64_t c
+#define action_string_uint32_args$ char * a, uint32_t b
+#define action_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
+#define action_string_uint32_intptr_args$ char * a, uint32_t b, void * c
+#define action_string_uint32_string_args$ char * a, uint32_t b, char * c
+#define action_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
+#define action_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
+#define action_string_uint64_args$ char * a, uint64_t b
+#define action_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
+#define action_string_uint64_intptr_args$ char * a, uint64_t b, void * c
+#define action_string_uint64_string_args$ char * a, uint64_t b, char * c
+#define action_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
+#define action_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
 #define action_uint32_args$ uint32_t a
-#define func_uint64_uint32_args$ uint32_t a
-#define func_int32_uint32_args$ uint32_t a
-#define func_string_uint32_args$ uint32_t a
-#define func_uint32_uint32_args$ uint32_t a
-#define func_intptr_uint32_args$ uint32_t a
-#define action_intptr_args$ void * a
-#define func_uint64_intptr_args$ void * a
-#define func_int32_intptr_args$ void * a
-#define func_string_intptr_args$ void * a
-#define func_uint32_intptr_args$ void * a
-#define func_intptr_intptr_args$ void * a
-#define action_uint64_uint64_args$ uint64_t a, uint64_t b
-#define func_uint64_uint64_uint64_args$ uint64_t a, uint64_t b
-#define func_int32_uint64_uint64_args$ uint64_t a, uint64_t b
-#define func_string_uint64_uint64_args$ uint64_t a, uint64_t b
-#define func_uint32_uint64_uint64_args$ uint64_t a, uint64_t b
-#define func_intptr_uint64_uint64_args$ uint64_t a, uint64_t b
+#define action_uint32_int32_args$ uint32_t a, int32_t b
+#define action_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
+#define action_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
+#define action_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
+#define action_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
+#define action_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
+#define action_uint32_intptr_args$ uint32_t a, void * b
+#define action_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
+#define action_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
+#define action_uint32_intptr_string_args$ uint32_t a, void * b, char * c
+#define action_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
+#define action_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
+#define action_uint32_string_args$ uint32_t a, char * b
+#define action_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
+#define action_uint32_string_intptr_args$ uint32_t a, char * b, void * c
+#define action_uint32_string_string_args$ uint32_t a, char * b, char * c
+#define action_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
+#define action_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
+#define action_uint32_uint32_args$ uint32_t a, uint32_t b
+#define action_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
+#define action_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
+#define action_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
+#define action_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
+#define action_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
+#define action_uint32_uint64_args$ uint32_t a, uint64_t b
+#define action_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
+#define action_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
+#define action_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
+#define action_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
+#define action_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
+#define action_uint64_args$ uint64_t a
 #define action_uint64_int32_args$ uint64_t a, int32_t b
-#define func_uint64_uint64_int32_args$ uint64_t a, int32_t b
-#define func_int32_uint64_int32_args$ uint64_t a, int32_t b
-#define func_string_uint64_int32_args$ uint64_t a, int32_t b
-#define func_uint32_uint64_int32_args$ uint64_t a, int32_t b
-#define func_intptr_uint64_int32_args$ uint64_t a, int32_t b
+#define action_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
+#define action_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
+#define action_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
+#define action_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
+#define action_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
+#define action_uint64_intptr_args$ uint64_t a, void * b
+#define action_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
+#define action_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
+#define action_uint64_intptr_string_args$ uint64_t a, void * b, char * c
+#define action_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
+#define action_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
 #define action_uint64_string_args$ uint64_t a, char * b
-#define func_uint64_uint64_string_args$ uint64_t a, char * b
-#define func_int32_uint64_string_args$ uint64_t a, char * b
-#define func_string_uint64_string_args$ uint64_t a, char * b
-#define func_uint32_uint64_string_args$ uint64_t a, char * b
-#define func_intptr_uint64_string_args$ uint64_t a, char * b
+#define action_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
+#define action_uint64_string_intptr_args$ uint64_t a, char * b, void * c
+#define action_uint64_string_string_args$ uint64_t a, char * b, char * c
+#define action_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
+#define action_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
 #define action_uint64_uint32_args$ uint64_t a, uint32_t b
-#define func_uint64_uint64_uint32_args$ uint64_t a, uint32_t b
-#define func_int32_uint64_uint32_args$ uint64_t a, uint32_t b
-#define func_string_uint64_uint32_args$ uint64_t a, uint32_t b
-#define func_uint32_uint64_uint32_args$ uint64_t a, uint32_t b
-#define func_intptr_uint64_uint32_args$ uint64_t a, uint32_t b
-#define action_uint64_intptr_args$ uint64_t a, void * b
-#define func_uint64_uint64_intptr_args$ uint64_t a, void * b
-#define func_int32_uint64_intptr_args$ uint64_t a, void * b
-#define func_string_uint64_intptr_args$ uint64_t a, void * b
-#define func_uint32_uint64_intptr_args$ uint64_t a, void * b
-#define func_intptr_uint64_intptr_args$ uint64_t a, void * b
-#define action_int32_uint64_args$ int32_t a, uint64_t b
-#define func_uint64_int32_uint64_args$ int32_t a, uint64_t b
-#define func_int32_int32_uint64_args$ int32_t a, uint64_t b
-#define func_string_int32_uint64_args$ int32_t a, uint64_t b
-#define func_uint32_int32_uint64_args$ int32_t a, uint64_t b
-#define func_intptr_int32_uint64_args$ int32_t a, uint64_t b
-#define action_int32_int32_args$ int32_t a, int32_t b
-#define func_uint64_int32_int32_args$ int32_t a, int32_t b
+#define action_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
+#define action_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
+#define action_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
+#define action_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
+#define action_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
+#define action_uint64_uint64_args$ uint64_t a, uint64_t b
+#define action_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
+#define action_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
+#define action_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
+#define action_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
+#define action_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
+#define func_int32_args$ 
+#define func_int32_int32_args$ int32_t a
 #define func_int32_int32_int32_args$ int32_t a, int32_t b
-#define func_string_int32_int32_args$ int32_t a, int32_t b
-#define func_uint32_int32_int32_args$ int32_t a, int32_t b
-#define func_intptr_int32_int32_args$ int32_t a, int32_t b
-#define action_int32_string_args$ int32_t a, char * b
-#define func_uint64_int32_string_args$ int32_t a, char * b
+#define func_int32_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
+#define func_int32_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
+#define func_int32_int32_int32_string_args$ int32_t a, int32_t b, char * c
+#define func_int32_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
+#define func_int32_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
+#define func_int32_int32_intptr_args$ int32_t a, void * b
+#define func_int32_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
+#define func_int32_int32_intptr_intptr_args$ int32_t a, void * b, void * c
+#define func_int32_int32_intptr_string_args$ int32_t a, void * b, char * c
+#define func_int32_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
+#define func_int32_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
 #define func_int32_int32_string_args$ int32_t a, char * b
-#define func_string_int32_string_args$ int32_t a, char * b
-#define func_uint32_int32_string_args$ int32_t a, char * b
-#define func_intptr_int32_string_args$ int32_t a, char * b
-#define action_int32_uint32_args$ int32_t a, uint32_t b
-#define func_uint64_int32_uint32_args$ int32_t a, uint32_t b
+#define func_int32_int32_string_int32_args$ int32_t a, char * b, int32_t c
+#define func_int32_int32_string_intptr_args$ int32_t a, char * b, void * c
+#define func_int32_int32_string_string_args$ int32_t a, char * b, char * c
+#define func_int32_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
+#define func_int32_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
 #define func_int32_int32_uint32_args$ int32_t a, uint32_t b
-#define func_string_int32_uint32_args$ int32_t a, uint32_t b
-#define func_uint32_int32_uint32_args$ int32_t a, uint32_t b
-#define func_intptr_int32_uint32_args$ int32_t a, uint32_t b
-#define action_int32_intptr_args$ int32_t a, void * b
-#define func_uint64_int32_intptr_args$ int32_t a, void * b
-#define func_int32_int32_intptr_args$ int32_t a, void * b
-#define func_string_int32_intptr_args$ int32_t a, void * b
-#define func_uint32_int32_intptr_args$ int32_t a, void * b
-#define func_intptr_int32_intptr_args$ int32_t a, void * b
-#define action_string_uint64_args$ char * a, uint64_t b
-#define func_uint64_string_uint64_args$ char * a, uint64_t b
-#define func_int32_string_uint64_args$ char * a, uint64_t b
-#define func_string_string_uint64_args$ char * a, uint64_t b
-#define func_uint32_string_uint64_args$ char * a, uint64_t b
-#define func_intptr_string_uint64_args$ char * a, uint64_t b
-#define action_string_int32_args$ char * a, int32_t b
-#define func_uint64_string_int32_args$ char * a, int32_t b
+#define func_int32_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
+#define func_int32_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
+#define func_int32_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
+#define func_int32_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
+#define func_int32_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
+#define func_int32_int32_uint64_args$ int32_t a, uint64_t b
+#define func_int32_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
+#define func_int32_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
+#define func_int32_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
+#define func_int32_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
+#define func_int32_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
+#define func_int32_intptr_args$ void * a
+#define func_int32_intptr_int32_args$ void * a, int32_t b
+#define func_int32_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
+#define func_int32_intptr_int32_intptr_args$ void * a, int32_t b, void * c
+#define func_int32_intptr_int32_string_args$ void * a, int32_t b, char * c
+#define func_int32_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
+#define func_int32_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
+#define func_int32_intptr_intptr_args$ void * a, void * b
+#define func_int32_intptr_intptr_int32_args$ void * a, void * b, int32_t c
+#define func_int32_intptr_intptr_intptr_args$ void * a, void * b, void * c
+#define func_int32_intptr_intptr_string_args$ void * a, void * b, char * c
+#define func_int32_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
+#define func_int32_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
+#define func_int32_intptr_string_args$ void * a, char * b
+#define func_int32_intptr_string_int32_args$ void * a, char * b, int32_t c
+#define func_int32_intptr_string_intptr_args$ void * a, char * b, void * c
+#define func_int32_intptr_string_string_args$ void * a, char * b, char * c
+#define func_int32_intptr_string_uint32_args$ void * a, char * b, uint32_t c
+#define func_int32_intptr_string_uint64_args$ void * a, char * b, uint64_t c
+#define func_int32_intptr_uint32_args$ void * a, uint32_t b
+#define func_int32_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
+#define func_int32_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
+#define func_int32_intptr_uint32_string_args$ void * a, uint32_t b, char * c
+#define func_int32_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
+#define func_int32_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
+#define func_int32_intptr_uint64_args$ void * a, uint64_t b
+#define func_int32_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
+#define func_int32_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
+#define func_int32_intptr_uint64_string_args$ void * a, uint64_t b, char * c
+#define func_int32_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
+#define func_int32_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
+#define func_int32_string_args$ char * a
 #define func_int32_string_int32_args$ char * a, int32_t b
-#define func_string_string_int32_args$ char * a, int32_t b
-#define func_uint32_string_int32_args$ char * a, int32_t b
-#define func_intptr_string_int32_args$ char * a, int32_t b
-#define action_string_string_args$ char * a, char * b
-#define func_uint64_string_string_args$ char * a, char * b
+#define func_int32_string_int32_int32_args$ char * a, int32_t b, int32_t c
+#define func_int32_string_int32_intptr_args$ char * a, int32_t b, void * c
+#define func_int32_string_int32_string_args$ char * a, int32_t b, char * c
+#define func_int32_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
+#define func_int32_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
+#define func_int32_string_intptr_args$ char * a, void * b
+#define func_int32_string_intptr_int32_args$ char * a, void * b, int32_t c
+#define func_int32_string_intptr_intptr_args$ char * a, void * b, void * c
+#define func_int32_string_intptr_string_args$ char * a, void * b, char * c
+#define func_int32_string_intptr_uint32_args$ char * a, void * b, uint32_t c
+#define func_int32_string_intptr_uint64_args$ char * a, void * b, uint64_t c
 #define func_int32_string_string_args$ char * a, char * b
-#define func_string_string_string_args$ char * a, char * b
-#define func_uint32_string_string_args$ char * a, char * b
-#define func_intptr_string_string_args$ char * a, char * b
-#define action_string_uint32_args$ char * a, uint32_t b
-#define func_uint64_string_uint32_args$ char * a, uint32_t b
+#define func_int32_string_string_int32_args$ char * a, char * b, int32_t c
+#define func_int32_string_string_intptr_args$ char * a, char * b, void * c
+#define func_int32_string_string_string_args$ char * a, char * b, char * c
+#define func_int32_string_string_uint32_args$ char * a, char * b, uint32_t c
+#define func_int32_string_string_uint64_args$ char * a, char * b, uint64_t c
 #define func_int32_string_uint32_args$ char * a, uint32_t b
-#define func_string_string_uint32_args$ char * a, uint32_t b
-#define func_uint32_string_uint32_args$ char * a, uint32_t b
-#define func_intptr_string_uint32_args$ char * a, uint32_t b
-#define action_string_intptr_args$ char * a, void * b
-#define func_uint64_string_intptr_args$ char * a, void * b
-#define func_int32_string_intptr_args$ char * a, void * b
-#define func_string_string_intptr_args$ char * a, void * b
-#define func_uint32_string_intptr_args$ char * a, void * b
-#define func_intptr_string_intptr_args$ char * a, void * b
-#define action_uint32_uint64_args$ uint32_t a, uint64_t b
-#define func_uint64_uint32_uint64_args$ uint32_t a, uint64_t b
-#define func_int32_uint32_uint64_args$ uint32_t a, uint64_t b
-#define func_string_uint32_uint64_args$ uint32_t a, uint64_t b
-#define func_uint32_uint32_uint64_args$ uint32_t a, uint64_t b
-#define func_intptr_uint32_uint64_args$ uint32_t a, uint64_t b
-#define action_uint32_int32_args$ uint32_t a, int32_t b
-#define func_uint64_uint32_int32_args$ uint32_t a, int32_t b
+#define func_int32_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
+#define func_int32_string_uint32_intptr_args$ char * a, uint32_t b, void * c
+#define func_int32_string_uint32_string_args$ char * a, uint32_t b, char * c
+#define func_int32_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
+#define func_int32_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
+#define func_int32_string_uint64_args$ char * a, uint64_t b
+#define func_int32_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
+#define func_int32_string_uint64_intptr_args$ char * a, uint64_t b, void * c
+#define func_int32_string_uint64_string_args$ char * a, uint64_t b, char * c
+#define func_int32_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
+#define func_int32_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
+#define func_int32_uint32_args$ uint32_t a
 #define func_int32_uint32_int32_args$ uint32_t a, int32_t b
-#define func_string_uint32_int32_args$ uint32_t a, int32_t b
-#define func_uint32_uint32_int32_args$ uint32_t a, int32_t b
-#define func_intptr_uint32_int32_args$ uint32_t a, int32_t b
-#define action_uint32_string_args$ uint32_t a, char * b
-#define func_uint64_uint32_string_args$ uint32_t a, char * b
+#define func_int32_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
+#define func_int32_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
+#define func_int32_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
+#define func_int32_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
+#define func_int32_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
+#define func_int32_uint32_intptr_args$ uint32_t a, void * b
+#define func_int32_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
+#define func_int32_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
+#define func_int32_uint32_intptr_string_args$ uint32_t a, void * b, char * c
+#define func_int32_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
+#define func_int32_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
 #define func_int32_uint32_string_args$ uint32_t a, char * b
-#define func_string_uint32_string_args$ uint32_t a, char * b
-#define func_uint32_uint32_string_args$ uint32_t a, char * b
-#define func_intptr_uint32_string_args$ uint32_t a, char * b
-#define action_uint32_uint32_args$ uint32_t a, uint32_t b
-#define func_uint64_uint32_uint32_args$ uint32_t a, uint32_t b
+#define func_int32_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
+#define func_int32_uint32_string_intptr_args$ uint32_t a, char * b, void * c
+#define func_int32_uint32_string_string_args$ uint32_t a, char * b, char * c
+#define func_int32_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
+#define func_int32_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
 #define func_int32_uint32_uint32_args$ uint32_t a, uint32_t b
-#define func_string_uint32_uint32_args$ uint32_t a, uint32_t b
-#define func_uint32_uint32_uint32_args$ uint32_t a, uint32_t b
-#define func_intptr_uint32_uint32_args$ uint32_t a, uint32_t b
-#define action_uint32_intptr_args$ uint32_t a, void * b
-#define func_uint64_uint32_intptr_args$ uint32_t a, void * b
-#define func_int32_uint32_intptr_args$ uint32_t a, void * b
-#define func_string_uint32_intptr_args$ uint32_t a, void * b
-#define func_uint32_uint32_intptr_args$ uint32_t a, void * b
-#define func_intptr_uint32_intptr_args$ uint32_t a, void * b
-#define action_intptr_uint64_args$ void * a, uint64_t b
-#define func_uint64_intptr_uint64_args$ void * a, uint64_t b
-#define func_int32_intptr_uint64_args$ void * a, uint64_t b
-#define func_string_intptr_uint64_args$ void * a, uint64_t b
-#define func_uint32_intptr_uint64_args$ void * a, uint64_t b
-#define func_intptr_intptr_uint64_args$ void * a, uint64_t b
-#define action_intptr_int32_args$ void * a, int32_t b
-#define func_uint64_intptr_int32_args$ void * a, int32_t b
-#define func_int32_intptr_int32_args$ void * a, int32_t b
-#define func_string_intptr_int32_args$ void * a, int32_t b
-#define func_uint32_intptr_int32_args$ void * a, int32_t b
-#define func_intptr_intptr_int32_args$ void * a, int32_t b
-#define action_intptr_string_args$ void * a, char * b
-#define func_uint64_intptr_string_args$ void * a, char * b
-#define func_int32_intptr_string_args$ void * a, char * b
-#define func_string_intptr_string_args$ void * a, char * b
-#define func_uint32_intptr_string_args$ void * a, char * b
-#define func_intptr_intptr_string_args$ void * a, char * b
-#define action_intptr_uint32_args$ void * a, uint32_t b
-#define func_uint64_intptr_uint32_args$ void * a, uint32_t b
-#define func_int32_intptr_uint32_args$ void * a, uint32_t b
-#define func_string_intptr_uint32_args$ void * a, uint32_t b
-#define func_uint32_intptr_uint32_args$ void * a, uint32_t b
-#define func_intptr_intptr_uint32_args$ void * a, uint32_t b
-#define action_intptr_intptr_args$ void * a, void * b
-#define func_uint64_intptr_intptr_args$ void * a, void * b
-#define func_int32_intptr_intptr_args$ void * a, void * b
-#define func_string_intptr_intptr_args$ void * a, void * b
-#define func_uint32_intptr_intptr_args$ void * a, void * b
-#define func_intptr_intptr_intptr_args$ void * a, void * b
-#define action_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
-#define func_uint64_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
-#define func_int32_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
-#define func_string_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
-#define func_uint32_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
-#define func_intptr_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
-#define action_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
-#define func_uint64_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
-#define func_int32_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
-#define func_string_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
-#define func_uint32_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
-#define func_intptr_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
-#define action_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
-#define func_uint64_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
-#define func_int32_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
-#define func_string_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
-#define func_uint32_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
-#define func_intptr_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
-#define action_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
-#define func_uint64_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
-#define func_int32_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
-#define func_string_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
-#define func_uint32_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
-#define func_intptr_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
-#define action_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
-#define func_uint64_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
-#define func_int32_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
-#define func_string_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
-#define func_uint32_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
-#define func_intptr_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
-#define action_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
-#define func_uint64_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
-#define func_int32_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
-#define func_string_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
-#define func_uint32_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
-#define func_intptr_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
-#define action_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
-#define func_uint64_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
+#define func_int32_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
+#define func_int32_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
+#define func_int32_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
+#define func_int32_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
+#define func_int32_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
+#define func_int32_uint32_uint64_args$ uint32_t a, uint64_t b
+#define func_int32_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
+#define func_int32_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
+#define func_int32_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
+#define func_int32_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
+#define func_int32_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
+#define func_int32_uint64_args$ uint64_t a
+#define func_int32_uint64_int32_args$ uint64_t a, int32_t b
 #define func_int32_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
-#define func_string_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
-#define func_uint32_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
-#define func_intptr_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
-#define action_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
-#define func_uint64_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
+#define func_int32_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
 #define func_int32_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
-#define func_string_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
-#define func_uint32_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
-#define func_intptr_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
-#define action_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
-#define func_uint64_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
 #define func_int32_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
-#define func_string_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
-#define func_uint32_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
-#define func_intptr_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
-#define action_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
-#define func_uint64_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
-#define func_int32_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
-#define func_string_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
-#define func_uint32_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
-#define func_intptr_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
-#define action_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
-#define func_uint64_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
-#define func_int32_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
-#define func_string_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
-#define func_uint32_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
-#define func_intptr_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
-#define action_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
-#define func_uint64_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
+#define func_int32_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
+#define func_int32_uint64_intptr_args$ uint64_t a, void * b
+#define func_int32_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
+#define func_int32_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
+#define func_int32_uint64_intptr_string_args$ uint64_t a, void * b, char * c
+#define func_int32_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
+#define func_int32_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
+#define func_int32_uint64_string_args$ uint64_t a, char * b
 #define func_int32_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
-#define func_string_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
-#define func_uint32_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
-#define func_intptr_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
-#define action_uint64_string_string_args$ uint64_t a, char * b, char * c
-#define func_uint64_uint64_string_string_args$ uint64_t a, char * b, char * c
+#define func_int32_uint64_string_intptr_args$ uint64_t a, char * b, void * c
 #define func_int32_uint64_string_string_args$ uint64_t a, char * b, char * c
-#define func_string_uint64_string_string_args$ uint64_t a, char * b, char * c
-#define func_uint32_uint64_string_string_args$ uint64_t a, char * b, char * c
-#define func_intptr_uint64_string_string_args$ uint64_t a, char * b, char * c
-#define action_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
-#define func_uint64_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
 #define func_int32_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
-#define func_string_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
-#define func_uint32_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
-#define func_intptr_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
-#define action_uint64_string_intptr_args$ uint64_t a, char * b, void * c
-#define func_uint64_uint64_string_intptr_args$ uint64_t a, char * b, void * c
-#define func_int32_uint64_string_intptr_args$ uint64_t a, char * b, void * c
-#define func_string_uint64_string_intptr_args$ uint64_t a, char * b, void * c
-#define func_uint32_uint64_string_intptr_args$ uint64_t a, char * b, void * c
-#define func_intptr_uint64_string_intptr_args$ uint64_t a, char * b, void * c
-#define action_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
-#define func_uint64_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
-#define func_int32_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
-#define func_string_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
-#define func_uint32_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
-#define func_intptr_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
-#define action_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
-#define func_uint64_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
+#define func_int32_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
+#define func_int32_uint64_uint32_args$ uint64_t a, uint32_t b
 #define func_int32_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
-#define func_string_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
-#define func_uint32_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
-#define func_intptr_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
-#define action_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
-#define func_uint64_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
+#define func_int32_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
 #define func_int32_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
-#define func_string_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
-#define func_uint32_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
-#define func_intptr_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
-#define action_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
-#define func_uint64_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
 #define func_int32_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
-#define func_string_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
-#define func_uint32_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
-#define func_intptr_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
-#define action_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
-#define func_uint64_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
-#define func_int32_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
-#define func_string_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
-#define func_uint32_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
-#define func_intptr_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
-#define action_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
-#define func_uint64_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
-#define func_int32_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
-#define func_string_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
-#define func_uint32_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
-#define func_intptr_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
-#define action_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
-#define func_uint64_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
-#define func_int32_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
-#define func_string_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
-#define func_uint32_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
-#define func_intptr_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
-#define action_uint64_intptr_string_args$ uint64_t a, void * b, char * c
-#define func_uint64_uint64_intptr_string_args$ uint64_t a, void * b, char * c
-#define func_int32_uint64_intptr_string_args$ uint64_t a, void * b, char * c
-#define func_string_uint64_intptr_string_args$ uint64_t a, void * b, char * c
-#define func_uint32_uint64_intptr_string_args$ uint64_t a, void * b, char * c
-#define func_intptr_uint64_intptr_string_args$ uint64_t a, void * b, char * c
-#define action_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
-#define func_uint64_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
-#define func_int32_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
-#define func_string_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
-#define func_uint32_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
-#define func_intptr_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
-#define action_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
-#define func_uint64_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
-#define func_int32_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
-#define func_string_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
-#define func_uint32_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
+#define func_int32_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
+#define func_int32_uint64_uint64_args$ uint64_t a, uint64_t b
+#define func_int32_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
+#define func_int32_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
+#define func_int32_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
+#define func_int32_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
+#define func_int32_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
+#define func_intptr_args$ 
+#define func_intptr_int32_args$ int32_t a
+#define func_intptr_int32_int32_args$ int32_t a, int32_t b
+#define func_intptr_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
+#define func_intptr_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
+#define func_intptr_int32_int32_string_args$ int32_t a, int32_t b, char * c
+#define func_intptr_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
+#define func_intptr_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
+#define func_intptr_int32_intptr_args$ int32_t a, void * b
+#define func_intptr_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
+#define func_intptr_int32_intptr_intptr_args$ int32_t a, void * b, void * c
+#define func_intptr_int32_intptr_string_args$ int32_t a, void * b, char * c
+#define func_intptr_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
+#define func_intptr_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
+#define func_intptr_int32_string_args$ int32_t a, char * b
+#define func_intptr_int32_string_int32_args$ int32_t a, char * b, int32_t c
+#define func_intptr_int32_string_intptr_args$ int32_t a, char * b, void * c
+#define func_intptr_int32_string_string_args$ int32_t a, char * b, char * c
+#define func_intptr_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
+#define func_intptr_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
+#define func_intptr_int32_uint32_args$ int32_t a, uint32_t b
+#define func_intptr_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
+#define func_intptr_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
+#define func_intptr_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
+#define func_intptr_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
+#define func_intptr_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
+#define func_intptr_int32_uint64_args$ int32_t a, uint64_t b
+#define func_intptr_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
+#define func_intptr_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
+#define func_intptr_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
+#define func_intptr_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
+#define func_intptr_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
+#define func_intptr_intptr_args$ void * a
+#define func_intptr_intptr_int32_args$ void * a, int32_t b
+#define func_intptr_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
+#define func_intptr_intptr_int32_intptr_args$ void * a, int32_t b, void * c
+#define func_intptr_intptr_int32_string_args$ void * a, int32_t b, char * c
+#define func_intptr_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
+#define func_intptr_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
+#define func_intptr_intptr_intptr_args$ void * a, void * b
+#define func_intptr_intptr_intptr_int32_args$ void * a, void * b, int32_t c
+#define func_intptr_intptr_intptr_intptr_args$ void * a, void * b, void * c
+#define func_intptr_intptr_intptr_string_args$ void * a, void * b, char * c
+#define func_intptr_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
+#define func_intptr_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
+#define func_intptr_intptr_string_args$ void * a, char * b
+#define func_intptr_intptr_string_int32_args$ void * a, char * b, int32_t c
+#define func_intptr_intptr_string_intptr_args$ void * a, char * b, void * c
+#define func_intptr_intptr_string_string_args$ void * a, char * b, char * c
+#define func_intptr_intptr_string_uint32_args$ void * a, char * b, uint32_t c
+#define func_intptr_intptr_string_uint64_args$ void * a, char * b, uint64_t c
+#define func_intptr_intptr_uint32_args$ void * a, uint32_t b
+#define func_intptr_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
+#define func_intptr_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
+#define func_intptr_intptr_uint32_string_args$ void * a, uint32_t b, char * c
+#define func_intptr_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
+#define func_intptr_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
+#define func_intptr_intptr_uint64_args$ void * a, uint64_t b
+#define func_intptr_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
+#define func_intptr_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
+#define func_intptr_intptr_uint64_string_args$ void * a, uint64_t b, char * c
+#define func_intptr_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
+#define func_intptr_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
+#define func_intptr_string_args$ char * a
+#define func_intptr_string_int32_args$ char * a, int32_t b
+#define func_intptr_string_int32_int32_args$ char * a, int32_t b, int32_t c
+#define func_intptr_string_int32_intptr_args$ char * a, int32_t b, void * c
+#define func_intptr_string_int32_string_args$ char * a, int32_t b, char * c
+#define func_intptr_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
+#define func_intptr_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
+#define func_intptr_string_intptr_args$ char * a, void * b
+#define func_intptr_string_intptr_int32_args$ char * a, void * b, int32_t c
+#define func_intptr_string_intptr_intptr_args$ char * a, void * b, void * c
+#define func_intptr_string_intptr_string_args$ char * a, void * b, char * c
+#define func_intptr_string_intptr_uint32_args$ char * a, void * b, uint32_t c
+#define func_intptr_string_intptr_uint64_args$ char * a, void * b, uint64_t c
+#define func_intptr_string_string_args$ char * a, char * b
+#define func_intptr_string_string_int32_args$ char * a, char * b, int32_t c
+#define func_intptr_string_string_intptr_args$ char * a, char * b, void * c
+#define func_intptr_string_string_string_args$ char * a, char * b, char * c
+#define func_intptr_string_string_uint32_args$ char * a, char * b, uint32_t c
+#define func_intptr_string_string_uint64_args$ char * a, char * b, uint64_t c
+#define func_intptr_string_uint32_args$ char * a, uint32_t b
+#define func_intptr_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
+#define func_intptr_string_uint32_intptr_args$ char * a, uint32_t b, void * c
+#define func_intptr_string_uint32_string_args$ char * a, uint32_t b, char * c
+#define func_intptr_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
+#define func_intptr_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
+#define func_intptr_string_uint64_args$ char * a, uint64_t b
+#define func_intptr_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
+#define func_intptr_string_uint64_intptr_args$ char * a, uint64_t b, void * c
+#define func_intptr_string_uint64_string_args$ char * a, uint64_t b, char * c
+#define func_intptr_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
+#define func_intptr_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
+#define func_intptr_uint32_args$ uint32_t a
+#define func_intptr_uint32_int32_args$ uint32_t a, int32_t b
+#define func_intptr_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
+#define func_intptr_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
+#define func_intptr_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
+#define func_intptr_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
+#define func_intptr_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
+#define func_intptr_uint32_intptr_args$ uint32_t a, void * b
+#define func_intptr_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
+#define func_intptr_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
+#define func_intptr_uint32_intptr_string_args$ uint32_t a, void * b, char * c
+#define func_intptr_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
+#define func_intptr_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
+#define func_intptr_uint32_string_args$ uint32_t a, char * b
+#define func_intptr_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
+#define func_intptr_uint32_string_intptr_args$ uint32_t a, char * b, void * c
+#define func_intptr_uint32_string_string_args$ uint32_t a, char * b, char * c
+#define func_intptr_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
+#define func_intptr_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
+#define func_intptr_uint32_uint32_args$ uint32_t a, uint32_t b
+#define func_intptr_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
+#define func_intptr_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
+#define func_intptr_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
+#define func_intptr_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
+#define func_intptr_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
+#define func_intptr_uint32_uint64_args$ uint32_t a, uint64_t b
+#define func_intptr_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
+#define func_intptr_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
+#define func_intptr_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
+#define func_intptr_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
+#define func_intptr_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
+#define func_intptr_uint64_args$ uint64_t a
+#define func_intptr_uint64_int32_args$ uint64_t a, int32_t b
+#define func_intptr_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
+#define func_intptr_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
+#define func_intptr_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
+#define func_intptr_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
+#define func_intptr_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
+#define func_intptr_uint64_intptr_args$ uint64_t a, void * b
+#define func_intptr_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
 #define func_intptr_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
-#define action_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
-#define func_uint64_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
-#define func_int32_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
-#define func_string_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
-#define func_uint32_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
-#define func_intptr_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
-#define action_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
-#define func_uint64_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
-#define func_int32_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
-#define func_string_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
-#define func_uint32_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
-#define func_intptr_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
-#define action_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
-#define func_uint64_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
-#define func_int32_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
-#define func_string_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
-#define func_uint32_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
-#define func_intptr_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
-#define action_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
-#define func_uint64_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
-#define func_int32_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
-#define func_string_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
-#define func_uint32_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
-#define func_intptr_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
-#define action_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
-#define func_uint64_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
-#define func_int32_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
-#define func_string_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
-#define func_uint32_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
-#define func_intptr_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
-#define action_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
-#define func_uint64_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
-#define func_int32_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
-#define func_string_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
-#define func_uint32_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
-#define func_intptr_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
-#define action_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
-#define func_uint64_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
-#define func_int32_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
+#define func_intptr_uint64_intptr_string_args$ uint64_t a, void * b, char * c
+#define func_intptr_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
+#define func_intptr_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
+#define func_intptr_uint64_string_args$ uint64_t a, char * b
+#define func_intptr_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
+#define func_intptr_uint64_string_intptr_args$ uint64_t a, char * b, void * c
+#define func_intptr_uint64_string_string_args$ uint64_t a, char * b, char * c
+#define func_intptr_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
+#define func_intptr_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
+#define func_intptr_uint64_uint32_args$ uint64_t a, uint32_t b
+#define func_intptr_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
+#define func_intptr_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
+#define func_intptr_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
+#define func_intptr_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
+#define func_intptr_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
+#define func_intptr_uint64_uint64_args$ uint64_t a, uint64_t b
+#define func_intptr_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
+#define func_intptr_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
+#define func_intptr_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
+#define func_intptr_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
+#define func_intptr_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
+#define func_string_args$ 
+#define func_string_int32_args$ int32_t a
+#define func_string_int32_int32_args$ int32_t a, int32_t b
 #define func_string_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
-#define func_uint32_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
-#define func_intptr_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
-#define action_int32_int32_string_args$ int32_t a, int32_t b, char * c
-#define func_uint64_int32_int32_string_args$ int32_t a, int32_t b, char * c
-#define func_int32_int32_int32_string_args$ int32_t a, int32_t b, char * c
+#define func_string_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
 #define func_string_int32_int32_string_args$ int32_t a, int32_t b, char * c
-#define func_uint32_int32_int32_string_args$ int32_t a, int32_t b, char * c
-#define func_intptr_int32_int32_string_args$ int32_t a, int32_t b, char * c
-#define action_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
-#define func_uint64_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
-#define func_int32_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
 #define func_string_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
-#define func_uint32_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
-#define func_intptr_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
-#define action_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
-#define func_uint64_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
-#define func_int32_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
-#define func_string_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
-#define func_uint32_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
-#define func_intptr_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
-#define action_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
-#define func_uint64_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
-#define func_int32_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
-#define func_string_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
-#define func_uint32_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
-#define func_intptr_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
-#define action_int32_string_int32_args$ int32_t a, char * b, int32_t c
-#define func_uint64_int32_string_int32_args$ int32_t a, char * b, int32_t c
-#define func_int32_int32_string_int32_args$ int32_t a, char * b, int32_t c
+#define func_string_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
+#define func_string_int32_intptr_args$ int32_t a, void * b
+#define func_string_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
+#define func_string_int32_intptr_intptr_args$ int32_t a, void * b, void * c
+#define func_string_int32_intptr_string_args$ int32_t a, void * b, char * c
+#define func_string_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
+#define func_string_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
+#define func_string_int32_string_args$ int32_t a, char * b
 #define func_string_int32_string_int32_args$ int32_t a, char * b, int32_t c
-#define func_uint32_int32_string_int32_args$ int32_t a, char * b, int32_t c
-#define func_intptr_int32_string_int32_args$ int32_t a, char * b, int32_t c
-#define action_int32_string_string_args$ int32_t a, char * b, char * c
-#define func_uint64_int32_string_string_args$ int32_t a, char * b, char * c
-#define func_int32_int32_string_string_args$ int32_t a, char * b, char * c
+#define func_string_int32_string_intptr_args$ int32_t a, char * b, void * c
 #define func_string_int32_string_string_args$ int32_t a, char * b, char * c
-#define func_uint32_int32_string_string_args$ int32_t a, char * b, char * c
-#define func_intptr_int32_string_string_args$ int32_t a, char * b, char * c
-#define action_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
-#define func_uint64_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
-#define func_int32_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
 #define func_string_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
-#define func_uint32_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
-#define func_intptr_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
-#define action_int32_string_intptr_args$ int32_t a, char * b, void * c
-#define func_uint64_int32_string_intptr_args$ int32_t a, char * b, void * c
-#define func_int32_int32_string_intptr_args$ int32_t a, char * b, void * c
-#define func_string_int32_string_intptr_args$ int32_t a, char * b, void * c
-#define func_uint32_int32_string_intptr_args$ int32_t a, char * b, void * c
-#define func_intptr_int32_string_intptr_args$ int32_t a, char * b, void * c
-#define action_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
-#define func_uint64_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
-#define func_int32_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
-#define func_string_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
-#define func_uint32_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
-#define func_intptr_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
-#define action_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
-#define func_uint64_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
-#define func_int32_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
+#define func_string_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
+#define func_string_int32_uint32_args$ int32_t a, uint32_t b
 #define func_string_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
-#define func_uint32_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
-#define func_intptr_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
-#define action_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
-#define func_uint64_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
-#define func_int32_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
+#define func_string_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
 #define func_string_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
-#define func_uint32_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
-#define func_intptr_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
-#define action_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
-#define func_uint64_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
-#define func_int32_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
 #define func_string_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
-#define func_uint32_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
-#define func_intptr_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
-#define action_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
-#define func_uint64_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
-#define func_int32_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
-#define func_string_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
-#define func_uint32_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
-#define func_intptr_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
-#define action_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
-#define func_uint64_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
-#define func_int32_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
-#define func_string_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
-#define func_uint32_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
-#define func_intptr_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
-#define action_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
-#define func_uint64_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
-#define func_int32_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
-#define func_string_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
-#define func_uint32_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
-#define func_intptr_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
-#define action_int32_intptr_string_args$ int32_t a, void * b, char * c
-#define func_uint64_int32_intptr_string_args$ int32_t a, void * b, char * c
-#define func_int32_int32_intptr_string_args$ int32_t a, void * b, char * c
-#define func_string_int32_intptr_string_args$ int32_t a, void * b, char * c
-#define func_uint32_int32_intptr_string_args$ int32_t a, void * b, char * c
-#define func_intptr_int32_intptr_string_args$ int32_t a, void * b, char * c
-#define action_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
-#define func_uint64_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
-#define func_int32_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
-#define func_string_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
-#define func_uint32_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
-#define func_intptr_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
-#define action_int32_intptr_intptr_args$ int32_t a, void * b, void * c
-#define func_uint64_int32_intptr_intptr_args$ int32_t a, void * b, void * c
-#define func_int32_int32_intptr_intptr_args$ int32_t a, void * b, void * c
-#define func_string_int32_intptr_intptr_args$ int32_t a, void * b, void * c
-#define func_uint32_int32_intptr_intptr_args$ int32_t a, void * b, void * c
-#define func_intptr_int32_intptr_intptr_args$ int32_t a, void * b, void * c
-#define action_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
-#define func_uint64_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
-#define func_int32_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
-#define func_string_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
-#define func_uint32_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
-#define func_intptr_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
-#define action_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
-#define func_uint64_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
-#define func_int32_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
-#define func_string_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
-#define func_uint32_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
-#define func_intptr_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
-#define action_string_uint64_string_args$ char * a, uint64_t b, char * c
-#define func_uint64_string_uint64_string_args$ char * a, uint64_t b, char * c
-#define func_int32_string_uint64_string_args$ char * a, uint64_t b, char * c
-#define func_string_string_uint64_string_args$ char * a, uint64_t b, char * c
-#define func_uint32_string_uint64_string_args$ char * a, uint64_t b, char * c
-#define func_intptr_string_uint64_string_args$ char * a, uint64_t b, char * c
-#define action_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
-#define func_uint64_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
-#define func_int32_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
-#define func_string_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
-#define func_uint32_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
-#define func_intptr_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
-#define action_string_uint64_intptr_args$ char * a, uint64_t b, void * c
-#define func_uint64_string_uint64_intptr_args$ char * a, uint64_t b, void * c
-#define func_int32_string_uint64_intptr_args$ char * a, uint64_t b, void * c
-#define func_string_string_uint64_intptr_args$ char * a, uint64_t b, void * c
-#define func_uint32_string_uint64_intptr_args$ char * a, uint64_t b, void * c
-#define func_intptr_string_uint64_intptr_args$ char * a, uint64_t b, void * c
-#define action_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
-#define func_uint64_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
-#define func_int32_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
-#define func_string_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
-#define func_uint32_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
-#define func_intptr_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
-#define action_string_int32_int32_args$ char * a, int32_t b, int32_t c
-#define func_uint64_string_int32_int32_args$ char * a, int32_t b, int32_t c
-#define func_int32_string_int32_int32_args$ char * a, int32_t b, int32_t c
+#define func_string_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
+#define func_string_int32_uint64_args$ int32_t a, uint64_t b
+#define func_string_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
+#define func_string_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
+#define func_string_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
+#define func_string_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
+#define func_string_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
+#define func_string_intptr_args$ void * a
+#define func_string_intptr_int32_args$ void * a, int32_t b
+#define func_string_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
+#define func_string_intptr_int32_intptr_args$ void * a, int32_t b, void * c
+#define func_string_intptr_int32_string_args$ void * a, int32_t b, char * c
+#define func_string_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
+#define func_string_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
+#define func_string_intptr_intptr_args$ void * a, void * b
+#define func_string_intptr_intptr_int32_args$ void * a, void * b, int32_t c
+#define func_string_intptr_intptr_intptr_args$ void * a, void * b, void * c
+#define func_string_intptr_intptr_string_args$ void * a, void * b, char * c
+#define func_string_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
+#define func_string_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
+#define func_string_intptr_string_args$ void * a, char * b
+#define func_string_intptr_string_int32_args$ void * a, char * b, int32_t c
+#define func_string_intptr_string_intptr_args$ void * a, char * b, void * c
+#define func_string_intptr_string_string_args$ void * a, char * b, char * c
+#define func_string_intptr_string_uint32_args$ void * a, char * b, uint32_t c
+#define func_string_intptr_string_uint64_args$ void * a, char * b, uint64_t c
+#define func_string_intptr_uint32_args$ void * a, uint32_t b
+#define func_string_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
+#define func_string_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
+#define func_string_intptr_uint32_string_args$ void * a, uint32_t b, char * c
+#define func_string_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
+#define func_string_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
+#define func_string_intptr_uint64_args$ void * a, uint64_t b
+#define func_string_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
+#define func_string_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
+#define func_string_intptr_uint64_string_args$ void * a, uint64_t b, char * c
+#define func_string_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
+#define func_string_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
+#define func_string_string_args$ char * a
+#define func_string_string_int32_args$ char * a, int32_t b
 #define func_string_string_int32_int32_args$ char * a, int32_t b, int32_t c
-#define func_uint32_string_int32_int32_args$ char * a, int32_t b, int32_t c
-#define func_intptr_string_int32_int32_args$ char * a, int32_t b, int32_t c
-#define action_string_int32_string_args$ char * a, int32_t b, char * c
-#define func_uint64_string_int32_string_args$ char * a, int32_t b, char * c
-#define func_int32_string_int32_string_args$ char * a, int32_t b, char * c
+#define func_string_string_int32_intptr_args$ char * a, int32_t b, void * c
 #define func_string_string_int32_string_args$ char * a, int32_t b, char * c
-#define func_uint32_string_int32_string_args$ char * a, int32_t b, char * c
-#define func_intptr_string_int32_string_args$ char * a, int32_t b, char * c
-#define action_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
-#define func_uint64_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
-#define func_int32_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
 #define func_string_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
-#define func_uint32_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
-#define func_intptr_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
-#define action_string_int32_intptr_args$ char * a, int32_t b, void * c
-#define func_uint64_string_int32_intptr_args$ char * a, int32_t b, void * c
-#define func_int32_string_int32_intptr_args$ char * a, int32_t b, void * c
-#define func_string_string_int32_intptr_args$ char * a, int32_t b, void * c
-#define func_uint32_string_int32_intptr_args$ char * a, int32_t b, void * c
-#define func_intptr_string_int32_intptr_args$ char * a, int32_t b, void * c
-#define action_string_string_uint64_args$ char * a, char * b, uint64_t c
-#define func_uint64_string_string_uint64_args$ char * a, char * b, uint64_t c
-#define func_int32_string_string_uint64_args$ char * a, char * b, uint64_t c
-#define func_string_string_string_uint64_args$ char * a, char * b, uint64_t c
-#define func_uint32_string_string_uint64_args$ char * a, char * b, uint64_t c
-#define func_intptr_string_string_uint64_args$ char * a, char * b, uint64_t c
-#define action_string_string_int32_args$ char * a, char * b, int32_t c
-#define func_uint64_string_string_int32_args$ char * a, char * b, int32_t c
-#define func_int32_string_string_int32_args$ char * a, char * b, int32_t c
+#define func_string_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
+#define func_string_string_intptr_args$ char * a, void * b
+#define func_string_string_intptr_int32_args$ char * a, void * b, int32_t c
+#define func_string_string_intptr_intptr_args$ char * a, void * b, void * c
+#define func_string_string_intptr_string_args$ char * a, void * b, char * c
+#define func_string_string_intptr_uint32_args$ char * a, void * b, uint32_t c
+#define func_string_string_intptr_uint64_args$ char * a, void * b, uint64_t c
+#define func_string_string_string_args$ char * a, char * b
 #define func_string_string_string_int32_args$ char * a, char * b, int32_t c
-#define func_uint32_string_string_int32_args$ char * a, char * b, int32_t c
-#define func_intptr_string_string_int32_args$ char * a, char * b, int32_t c
-#define action_string_string_string_args$ char * a, char * b, char * c
-#define func_uint64_string_string_string_args$ char * a, char * b, char * c
-#define func_int32_string_string_string_args$ char * a, char * b, char * c
+#define func_string_string_string_intptr_args$ char * a, char * b, void * c
 #define func_string_string_string_string_args$ char * a, char * b, char * c
-#define func_uint32_string_string_string_args$ char * a, char * b, char * c
-#define func_intptr_string_string_string_args$ char * a, char * b, char * c
-#define action_string_string_uint32_args$ char * a, char * b, uint32_t c
-#define func_uint64_string_string_uint32_args$ char * a, char * b, uint32_t c
-#define func_int32_string_string_uint32_args$ char * a, char * b, uint32_t c
 #define func_string_string_string_uint32_args$ char * a, char * b, uint32_t c
-#define func_uint32_string_string_uint32_args$ char * a, char * b, uint32_t c
-#define func_intptr_string_string_uint32_args$ char * a, char * b, uint32_t c
-#define action_string_string_intptr_args$ char * a, char * b, void * c
-#define func_uint64_string_string_intptr_args$ char * a, char * b, void * c
-#define func_int32_string_string_intptr_args$ char * a, char * b, void * c
-#define func_string_string_string_intptr_args$ char * a, char * b, void * c
-#define func_uint32_string_string_intptr_args$ char * a, char * b, void * c
-#define func_intptr_string_string_intptr_args$ char * a, char * b, void * c
-#define action_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
-#define func_uint64_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
-#define func_int32_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
-#define func_string_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
-#define func_uint32_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
-#define func_intptr_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
-#define action_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
-#define func_uint64_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
-#define func_int32_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
+#define func_string_string_string_uint64_args$ char * a, char * b, uint64_t c
+#define func_string_string_uint32_args$ char * a, uint32_t b
 #define func_string_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
-#define func_uint32_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
-#define func_intptr_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
-#define action_string_uint32_string_args$ char * a, uint32_t b, char * c
-#define func_uint64_string_uint32_string_args$ char * a, uint32_t b, char * c
-#define func_int32_string_uint32_string_args$ char * a, uint32_t b, char * c
+#define func_string_string_uint32_intptr_args$ char * a, uint32_t b, void * c
 #define func_string_string_uint32_string_args$ char * a, uint32_t b, char * c
-#define func_uint32_string_uint32_string_args$ char * a, uint32_t b, char * c
-#define func_intptr_string_uint32_string_args$ char * a, uint32_t b, char * c
-#define action_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
-#define func_uint64_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
-#define func_int32_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
 #define func_string_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
-#define func_uint32_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
-#define func_intptr_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
-#define action_string_uint32_intptr_args$ char * a, uint32_t b, void * c
-#define func_uint64_string_uint32_intptr_args$ char * a, uint32_t b, void * c
-#define func_int32_string_uint32_intptr_args$ char * a, uint32_t b, void * c
-#define func_string_string_uint32_intptr_args$ char * a, uint32_t b, void * c
-#define func_uint32_string_uint32_intptr_args$ char * a, uint32_t b, void * c
-#define func_intptr_string_uint32_intptr_args$ char * a, uint32_t b, void * c
-#define action_string_intptr_uint64_args$ char * a, void * b, uint64_t c
-#define func_uint64_string_intptr_uint64_args$ char * a, void * b, uint64_t c
-#define func_int32_string_intptr_uint64_args$ char * a, void * b, uint64_t c
-#define func_string_string_intptr_uint64_args$ char * a, void * b, uint64_t c
-#define func_uint32_string_intptr_uint64_args$ char * a, void * b, uint64_t c
-#define func_intptr_string_intptr_uint64_args$ char * a, void * b, uint64_t c
-#define action_string_intptr_int32_args$ char * a, void * b, int32_t c
-#define func_uint64_string_intptr_int32_args$ char * a, void * b, int32_t c
-#define func_int32_string_intptr_int32_args$ char * a, void * b, int32_t c
-#define func_string_string_intptr_int32_args$ char * a, void * b, int32_t c
-#define func_uint32_string_intptr_int32_args$ char * a, void * b, int32_t c
-#define func_intptr_string_intptr_int32_args$ char * a, void * b, int32_t c
-#define action_string_intptr_string_args$ char * a, void * b, char * c
-#define func_uint64_string_intptr_string_args$ char * a, void * b, char * c
-#define func_int32_string_intptr_string_args$ char * a, void * b, char * c
-#define func_string_string_intptr_string_args$ char * a, void * b, char * c
-#define func_uint32_string_intptr_string_args$ char * a, void * b, char * c
-#define func_intptr_string_intptr_string_args$ char * a, void * b, char * c
-#define action_string_intptr_uint32_args$ char * a, void * b, uint32_t c
-#define func_uint64_string_intptr_uint32_args$ char * a, void * b, uint32_t c
-#define func_int32_string_intptr_uint32_args$ char * a, void * b, uint32_t c
-#define func_string_string_intptr_uint32_args$ char * a, void * b, uint32_t c
-#define func_uint32_string_intptr_uint32_args$ char * a, void * b, uint32_t c
-#define func_intptr_string_intptr_uint32_args$ char * a, void * b, uint32_t c
-#define action_string_intptr_intptr_args$ char * a, void * b, void * c
-#define func_uint64_string_intptr_intptr_args$ char * a, void * b, void * c
-#define func_int32_string_intptr_intptr_args$ char * a, void * b, void * c
-#define func_string_string_intptr_intptr_args$ char * a, void * b, void * c
+#define func_string_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
+#define func_string_string_uint64_args$ char * a, uint64_t b
+#define func_string_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
+#define func_string_string_uint64_intptr_args$ char * a, uint64_t b, void * c
+#define func_string_string_uint64_string_args$ char * a, uint64_t b, char * c
+#define func_string_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
+#define func_string_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
+#define func_string_uint32_args$ uint32_t a
+#define func_string_uint32_int32_args$ uint32_t a, int32_t b
+#define func_string_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
+#define func_string_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
+#define func_string_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
+#define func_string_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
+#define func_string_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
+#define func_string_uint32_intptr_args$ uint32_t a, void * b
+#define func_string_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
+#define func_string_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
+#define func_string_uint32_intptr_string_args$ uint32_t a, void * b, char * c
+#define func_string_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
+#define func_string_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
+#define func_string_uint32_string_args$ uint32_t a, char * b
+#define func_string_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
+#define func_string_uint32_string_intptr_args$ uint32_t a, char * b, void * c
+#define func_string_uint32_string_string_args$ uint32_t a, char * b, char * c
+#define func_string_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
+#define func_string_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
+#define func_string_uint32_uint32_args$ uint32_t a, uint32_t b
+#define func_string_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
+#define func_string_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
+#define func_string_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
+#define func_string_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
+#define func_string_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
+#define func_string_uint32_uint64_args$ uint32_t a, uint64_t b
+#define func_string_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
+#define func_string_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
+#define func_string_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
+#define func_string_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
+#define func_string_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
+#define func_string_uint64_args$ uint64_t a
+#define func_string_uint64_int32_args$ uint64_t a, int32_t b
+#define func_string_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
+#define func_string_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
+#define func_string_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
+#define func_string_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
+#define func_string_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
+#define func_string_uint64_intptr_args$ uint64_t a, void * b
+#define func_string_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
+#define func_string_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
+#define func_string_uint64_intptr_string_args$ uint64_t a, void * b, char * c
+#define func_string_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
+#define func_string_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
+#define func_string_uint64_string_args$ uint64_t a, char * b
+#define func_string_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
+#define func_string_uint64_string_intptr_args$ uint64_t a, char * b, void * c
+#define func_string_uint64_string_string_args$ uint64_t a, char * b, char * c
+#define func_string_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
+#define func_string_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
+#define func_string_uint64_uint32_args$ uint64_t a, uint32_t b
+#define func_string_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
+#define func_string_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
+#define func_string_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
+#define func_string_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
+#define func_string_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
+#define func_string_uint64_uint64_args$ uint64_t a, uint64_t b
+#define func_string_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
+#define func_string_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
+#define func_string_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
+#define func_string_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
+#define func_string_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
+#define func_uint32_args$ 
+#define func_uint32_int32_args$ int32_t a
+#define func_uint32_int32_int32_args$ int32_t a, int32_t b
+#define func_uint32_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
+#define func_uint32_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
+#define func_uint32_int32_int32_string_args$ int32_t a, int32_t b, char * c
+#define func_uint32_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
+#define func_uint32_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
+#define func_uint32_int32_intptr_args$ int32_t a, void * b
+#define func_uint32_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
+#define func_uint32_int32_intptr_intptr_args$ int32_t a, void * b, void * c
+#define func_uint32_int32_intptr_string_args$ int32_t a, void * b, char * c
+#define func_uint32_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
+#define func_uint32_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
+#define func_uint32_int32_string_args$ int32_t a, char * b
+#define func_uint32_int32_string_int32_args$ int32_t a, char * b, int32_t c
+#define func_uint32_int32_string_intptr_args$ int32_t a, char * b, void * c
+#define func_uint32_int32_string_string_args$ int32_t a, char * b, char * c
+#define func_uint32_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
+#define func_uint32_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
+#define func_uint32_int32_uint32_args$ int32_t a, uint32_t b
+#define func_uint32_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
+#define func_uint32_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
+#define func_uint32_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
+#define func_uint32_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
+#define func_uint32_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
+#define func_uint32_int32_uint64_args$ int32_t a, uint64_t b
+#define func_uint32_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
+#define func_uint32_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
+#define func_uint32_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
+#define func_uint32_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
+#define func_uint32_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
+#define func_uint32_intptr_args$ void * a
+#define func_uint32_intptr_int32_args$ void * a, int32_t b
+#define func_uint32_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
+#define func_uint32_intptr_int32_intptr_args$ void * a, int32_t b, void * c
+#define func_uint32_intptr_int32_string_args$ void * a, int32_t b, char * c
+#define func_uint32_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
+#define func_uint32_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
+#define func_uint32_intptr_intptr_args$ void * a, void * b
+#define func_uint32_intptr_intptr_int32_args$ void * a, void * b, int32_t c
+#define func_uint32_intptr_intptr_intptr_args$ void * a, void * b, void * c
+#define func_uint32_intptr_intptr_string_args$ void * a, void * b, char * c
+#define func_uint32_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
+#define func_uint32_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
+#define func_uint32_intptr_string_args$ void * a, char * b
+#define func_uint32_intptr_string_int32_args$ void * a, char * b, int32_t c
+#define func_uint32_intptr_string_intptr_args$ void * a, char * b, void * c
+#define func_uint32_intptr_string_string_args$ void * a, char * b, char * c
+#define func_uint32_intptr_string_uint32_args$ void * a, char * b, uint32_t c
+#define func_uint32_intptr_string_uint64_args$ void * a, char * b, uint64_t c
+#define func_uint32_intptr_uint32_args$ void * a, uint32_t b
+#define func_uint32_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
+#define func_uint32_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
+#define func_uint32_intptr_uint32_string_args$ void * a, uint32_t b, char * c
+#define func_uint32_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
+#define func_uint32_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
+#define func_uint32_intptr_uint64_args$ void * a, uint64_t b
+#define func_uint32_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
+#define func_uint32_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
+#define func_uint32_intptr_uint64_string_args$ void * a, uint64_t b, char * c
+#define func_uint32_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
+#define func_uint32_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
+#define func_uint32_string_args$ char * a
+#define func_uint32_string_int32_args$ char * a, int32_t b
+#define func_uint32_string_int32_int32_args$ char * a, int32_t b, int32_t c
+#define func_uint32_string_int32_intptr_args$ char * a, int32_t b, void * c
+#define func_uint32_string_int32_string_args$ char * a, int32_t b, char * c
+#define func_uint32_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
+#define func_uint32_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
+#define func_uint32_string_intptr_args$ char * a, void * b
+#define func_uint32_string_intptr_int32_args$ char * a, void * b, int32_t c
 #define func_uint32_string_intptr_intptr_args$ char * a, void * b, void * c
-#define func_intptr_string_intptr_intptr_args$ char * a, void * b, void * c
-#define action_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
-#define func_uint64_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
-#define func_int32_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
-#define func_string_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
-#define func_uint32_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
-#define func_intptr_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
-#define action_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
-#define func_uint64_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
-#define func_int32_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
-#define func_string_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
-#define func_uint32_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
-#define func_intptr_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
-#define action_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
-#define func_uint64_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
-#define func_int32_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
-#define func_string_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
-#define func_uint32_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
-#define func_intptr_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
-#define action_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
-#define func_uint64_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
-#define func_int32_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
-#define func_string_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
-#define func_uint32_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
-#define func_intptr_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
-#define action_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
-#define func_uint64_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
-#define func_int32_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
-#define func_string_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
-#define func_uint32_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
-#define func_intptr_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
-#define action_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
-#define func_uint64_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
-#define func_int32_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
-#define func_string_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
-#define func_uint32_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
-#define func_intptr_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
-#define action_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
-#define func_uint64_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
-#define func_int32_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
-#define func_string_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
+#define func_uint32_string_intptr_string_args$ char * a, void * b, char * c
+#define func_uint32_string_intptr_uint32_args$ char * a, void * b, uint32_t c
+#define func_uint32_string_intptr_uint64_args$ char * a, void * b, uint64_t c
+#define func_uint32_string_string_args$ char * a, char * b
+#define func_uint32_string_string_int32_args$ char * a, char * b, int32_t c
+#define func_uint32_string_string_intptr_args$ char * a, char * b, void * c
+#define func_uint32_string_string_string_args$ char * a, char * b, char * c
+#define func_uint32_string_string_uint32_args$ char * a, char * b, uint32_t c
+#define func_uint32_string_string_uint64_args$ char * a, char * b, uint64_t c
+#define func_uint32_string_uint32_args$ char * a, uint32_t b
+#define func_uint32_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
+#define func_uint32_string_uint32_intptr_args$ char * a, uint32_t b, void * c
+#define func_uint32_string_uint32_string_args$ char * a, uint32_t b, char * c
+#define func_uint32_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
+#define func_uint32_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
+#define func_uint32_string_uint64_args$ char * a, uint64_t b
+#define func_uint32_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
+#define func_uint32_string_uint64_intptr_args$ char * a, uint64_t b, void * c
+#define func_uint32_string_uint64_string_args$ char * a, uint64_t b, char * c
+#define func_uint32_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
+#define func_uint32_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
+#define func_uint32_uint32_args$ uint32_t a
+#define func_uint32_uint32_int32_args$ uint32_t a, int32_t b
 #define func_uint32_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
-#define func_intptr_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
-#define action_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
-#define func_uint64_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
-#define func_int32_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
-#define func_string_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
+#define func_uint32_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
 #define func_uint32_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
-#define func_intptr_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
-#define action_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
-#define func_uint64_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
-#define func_int32_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
-#define func_string_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
 #define func_uint32_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
-#define func_intptr_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
-#define action_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
-#define func_uint64_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
-#define func_int32_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
-#define func_string_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
-#define func_uint32_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
-#define func_intptr_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
-#define action_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
-#define func_uint64_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
-#define func_int32_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
-#define func_string_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
-#define func_uint32_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
-#define func_intptr_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
-#define action_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
-#define func_uint64_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
-#define func_int32_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
-#define func_string_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
+#define func_uint32_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
+#define func_uint32_uint32_intptr_args$ uint32_t a, void * b
+#define func_uint32_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
+#define func_uint32_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
+#define func_uint32_uint32_intptr_string_args$ uint32_t a, void * b, char * c
+#define func_uint32_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
+#define func_uint32_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
+#define func_uint32_uint32_string_args$ uint32_t a, char * b
 #define func_uint32_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
-#define func_intptr_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
-#define action_uint32_string_string_args$ uint32_t a, char * b, char * c
-#define func_uint64_uint32_string_string_args$ uint32_t a, char * b, char * c
-#define func_int32_uint32_string_string_args$ uint32_t a, char * b, char * c
-#define func_string_uint32_string_string_args$ uint32_t a, char * b, char * c
+#define func_uint32_uint32_string_intptr_args$ uint32_t a, char * b, void * c
 #define func_uint32_uint32_string_string_args$ uint32_t a, char * b, char * c
-#define func_intptr_uint32_string_string_args$ uint32_t a, char * b, char * c
-#define action_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
-#define func_uint64_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
-#define func_int32_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
-#define func_string_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
 #define func_uint32_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
-#define func_intptr_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
-#define action_uint32_string_intptr_args$ uint32_t a, char * b, void * c
-#define func_uint64_uint32_string_intptr_args$ uint32_t a, char * b, void * c
-#define func_int32_uint32_string_intptr_args$ uint32_t a, char * b, void * c
-#define func_string_uint32_string_intptr_args$ uint32_t a, char * b, void * c
-#define func_uint32_uint32_string_intptr_args$ uint32_t a, char * b, void * c
-#define func_intptr_uint32_string_intptr_args$ uint32_t a, char * b, void * c
-#define action_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
-#define func_uint64_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
-#define func_int32_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
-#define func_string_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
-#define func_uint32_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
-#define func_intptr_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
-#define action_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
-#define func_uint64_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
-#define func_int32_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
-#define func_string_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
+#define func_uint32_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
+#define func_uint32_uint32_uint32_args$ uint32_t a, uint32_t b
 #define func_uint32_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
-#define func_intptr_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
-#define action_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
-#define func_uint64_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
-#define func_int32_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
-#define func_string_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
+#define func_uint32_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
 #define func_uint32_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
-#define func_intptr_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
-#define action_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
-#define func_uint64_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
-#define func_int32_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
-#define func_string_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
 #define func_uint32_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
-#define func_intptr_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
-#define action_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
-#define func_uint64_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
-#define func_int32_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
-#define func_string_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
-#define func_uint32_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
-#define func_intptr_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
-#define action_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
-#define func_uint64_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
-#define func_int32_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
-#define func_string_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
-#define func_uint32_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
-#define func_intptr_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
-#define action_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
-#define func_uint64_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
-#define func_int32_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
-#define func_string_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
-#define func_uint32_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
-#define func_intptr_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
-#define action_uint32_intptr_string_args$ uint32_t a, void * b, char * c
-#define func_uint64_uint32_intptr_string_args$ uint32_t a, void * b, char * c
-#define func_int32_uint32_intptr_string_args$ uint32_t a, void * b, char * c
-#define func_string_uint32_intptr_string_args$ uint32_t a, void * b, char * c
-#define func_uint32_uint32_intptr_string_args$ uint32_t a, void * b, char * c
-#define func_intptr_uint32_intptr_string_args$ uint32_t a, void * b, char * c
-#define action_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
-#define func_uint64_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
-#define func_int32_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
-#define func_string_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
-#define func_uint32_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
-#define func_intptr_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
-#define action_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
-#define func_uint64_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
-#define func_int32_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
-#define func_string_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
-#define func_uint32_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
-#define func_intptr_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
-#define action_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
-#define func_uint64_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
-#define func_int32_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
-#define func_string_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
-#define func_uint32_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
-#define func_intptr_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
-#define action_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
-#define func_uint64_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
-#define func_int32_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
-#define func_string_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
-#define func_uint32_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
-#define func_intptr_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
-#define action_intptr_uint64_string_args$ void * a, uint64_t b, char * c
-#define func_uint64_intptr_uint64_string_args$ void * a, uint64_t b, char * c
-#define func_int32_intptr_uint64_string_args$ void * a, uint64_t b, char * c
-#define func_string_intptr_uint64_string_args$ void * a, uint64_t b, char * c
-#define func_uint32_intptr_uint64_string_args$ void * a, uint64_t b, char * c
-#define func_intptr_intptr_uint64_string_args$ void * a, uint64_t b, char * c
-#define action_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
-#define func_uint64_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
-#define func_int32_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
-#define func_string_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
-#define func_uint32_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
-#define func_intptr_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
-#define action_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
-#define func_uint64_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
-#define func_int32_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
-#define func_string_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
-#define func_uint32_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
-#define func_intptr_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
-#define action_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
-#define func_uint64_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
-#define func_int32_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
-#define func_string_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
-#define func_uint32_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
-#define func_intptr_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
-#define action_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
+#define func_uint32_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
+#define func_uint32_uint32_uint64_args$ uint32_t a, uint64_t b
+#define func_uint32_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
+#define func_uint32_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
+#define func_uint32_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
+#define func_uint32_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
+#define func_uint32_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
+#define func_uint32_uint64_args$ uint64_t a
+#define func_uint32_uint64_int32_args$ uint64_t a, int32_t b
+#define func_uint32_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
+#define func_uint32_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
+#define func_uint32_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
+#define func_uint32_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
+#define func_uint32_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
+#define func_uint32_uint64_intptr_args$ uint64_t a, void * b
+#define func_uint32_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
+#define func_uint32_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
+#define func_uint32_uint64_intptr_string_args$ uint64_t a, void * b, char * c
+#define func_uint32_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
+#define func_uint32_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
+#define func_uint32_uint64_string_args$ uint64_t a, char * b
+#define func_uint32_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
+#define func_uint32_uint64_string_intptr_args$ uint64_t a, char * b, void * c
+#define func_uint32_uint64_string_string_args$ uint64_t a, char * b, char * c
+#define func_uint32_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
+#define func_uint32_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
+#define func_uint32_uint64_uint32_args$ uint64_t a, uint32_t b
+#define func_uint32_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
+#define func_uint32_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
+#define func_uint32_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
+#define func_uint32_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
+#define func_uint32_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
+#define func_uint32_uint64_uint64_args$ uint64_t a, uint64_t b
+#define func_uint32_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
+#define func_uint32_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
+#define func_uint32_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
+#define func_uint32_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
+#define func_uint32_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
+#define func_uint64_args$ 
+#define func_uint64_int32_args$ int32_t a
+#define func_uint64_int32_int32_args$ int32_t a, int32_t b
+#define func_uint64_int32_int32_int32_args$ int32_t a, int32_t b, int32_t c
+#define func_uint64_int32_int32_intptr_args$ int32_t a, int32_t b, void * c
+#define func_uint64_int32_int32_string_args$ int32_t a, int32_t b, char * c
+#define func_uint64_int32_int32_uint32_args$ int32_t a, int32_t b, uint32_t c
+#define func_uint64_int32_int32_uint64_args$ int32_t a, int32_t b, uint64_t c
+#define func_uint64_int32_intptr_args$ int32_t a, void * b
+#define func_uint64_int32_intptr_int32_args$ int32_t a, void * b, int32_t c
+#define func_uint64_int32_intptr_intptr_args$ int32_t a, void * b, void * c
+#define func_uint64_int32_intptr_string_args$ int32_t a, void * b, char * c
+#define func_uint64_int32_intptr_uint32_args$ int32_t a, void * b, uint32_t c
+#define func_uint64_int32_intptr_uint64_args$ int32_t a, void * b, uint64_t c
+#define func_uint64_int32_string_args$ int32_t a, char * b
+#define func_uint64_int32_string_int32_args$ int32_t a, char * b, int32_t c
+#define func_uint64_int32_string_intptr_args$ int32_t a, char * b, void * c
+#define func_uint64_int32_string_string_args$ int32_t a, char * b, char * c
+#define func_uint64_int32_string_uint32_args$ int32_t a, char * b, uint32_t c
+#define func_uint64_int32_string_uint64_args$ int32_t a, char * b, uint64_t c
+#define func_uint64_int32_uint32_args$ int32_t a, uint32_t b
+#define func_uint64_int32_uint32_int32_args$ int32_t a, uint32_t b, int32_t c
+#define func_uint64_int32_uint32_intptr_args$ int32_t a, uint32_t b, void * c
+#define func_uint64_int32_uint32_string_args$ int32_t a, uint32_t b, char * c
+#define func_uint64_int32_uint32_uint32_args$ int32_t a, uint32_t b, uint32_t c
+#define func_uint64_int32_uint32_uint64_args$ int32_t a, uint32_t b, uint64_t c
+#define func_uint64_int32_uint64_args$ int32_t a, uint64_t b
+#define func_uint64_int32_uint64_int32_args$ int32_t a, uint64_t b, int32_t c
+#define func_uint64_int32_uint64_intptr_args$ int32_t a, uint64_t b, void * c
+#define func_uint64_int32_uint64_string_args$ int32_t a, uint64_t b, char * c
+#define func_uint64_int32_uint64_uint32_args$ int32_t a, uint64_t b, uint32_t c
+#define func_uint64_int32_uint64_uint64_args$ int32_t a, uint64_t b, uint64_t c
+#define func_uint64_intptr_args$ void * a
+#define func_uint64_intptr_int32_args$ void * a, int32_t b
 #define func_uint64_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
-#define func_int32_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
-#define func_string_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
-#define func_uint32_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
-#define func_intptr_intptr_int32_int32_args$ void * a, int32_t b, int32_t c
-#define action_intptr_int32_string_args$ void * a, int32_t b, char * c
+#define func_uint64_intptr_int32_intptr_args$ void * a, int32_t b, void * c
 #define func_uint64_intptr_int32_string_args$ void * a, int32_t b, char * c
-#define func_int32_intptr_int32_string_args$ void * a, int32_t b, char * c
-#define func_string_intptr_int32_string_args$ void * a, int32_t b, char * c
-#define func_uint32_intptr_int32_string_args$ void * a, int32_t b, char * c
-#define func_intptr_intptr_int32_string_args$ void * a, int32_t b, char * c
-#define action_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
 #define func_uint64_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
-#define func_int32_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
-#define func_string_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
-#define func_uint32_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
-#define func_intptr_intptr_int32_uint32_args$ void * a, int32_t b, uint32_t c
-#define action_intptr_int32_intptr_args$ void * a, int32_t b, void * c
-#define func_uint64_intptr_int32_intptr_args$ void * a, int32_t b, void * c
-#define func_int32_intptr_int32_intptr_args$ void * a, int32_t b, void * c
-#define func_string_intptr_int32_intptr_args$ void * a, int32_t b, void * c
-#define func_uint32_intptr_int32_intptr_args$ void * a, int32_t b, void * c
-#define func_intptr_intptr_int32_intptr_args$ void * a, int32_t b, void * c
-#define action_intptr_string_uint64_args$ void * a, char * b, uint64_t c
-#define func_uint64_intptr_string_uint64_args$ void * a, char * b, uint64_t c
-#define func_int32_intptr_string_uint64_args$ void * a, char * b, uint64_t c
-#define func_string_intptr_string_uint64_args$ void * a, char * b, uint64_t c
-#define func_uint32_intptr_string_uint64_args$ void * a, char * b, uint64_t c
-#define func_intptr_intptr_string_uint64_args$ void * a, char * b, uint64_t c
-#define action_intptr_string_int32_args$ void * a, char * b, int32_t c
+#define func_uint64_intptr_int32_uint64_args$ void * a, int32_t b, uint64_t c
+#define func_uint64_intptr_intptr_args$ void * a, void * b
+#define func_uint64_intptr_intptr_int32_args$ void * a, void * b, int32_t c
+#define func_uint64_intptr_intptr_intptr_args$ void * a, void * b, void * c
+#define func_uint64_intptr_intptr_string_args$ void * a, void * b, char * c
+#define func_uint64_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
+#define func_uint64_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
+#define func_uint64_intptr_string_args$ void * a, char * b
 #define func_uint64_intptr_string_int32_args$ void * a, char * b, int32_t c
-#define func_int32_intptr_string_int32_args$ void * a, char * b, int32_t c
-#define func_string_intptr_string_int32_args$ void * a, char * b, int32_t c
-#define func_uint32_intptr_string_int32_args$ void * a, char * b, int32_t c
-#define func_intptr_intptr_string_int32_args$ void * a, char * b, int32_t c
-#define action_intptr_string_string_args$ void * a, char * b, char * c
+#define func_uint64_intptr_string_intptr_args$ void * a, char * b, void * c
 #define func_uint64_intptr_string_string_args$ void * a, char * b, char * c
-#define func_int32_intptr_string_string_args$ void * a, char * b, char * c
-#define func_string_intptr_string_string_args$ void * a, char * b, char * c
-#define func_uint32_intptr_string_string_args$ void * a, char * b, char * c
-#define func_intptr_intptr_string_string_args$ void * a, char * b, char * c
-#define action_intptr_string_uint32_args$ void * a, char * b, uint32_t c
 #define func_uint64_intptr_string_uint32_args$ void * a, char * b, uint32_t c
-#define func_int32_intptr_string_uint32_args$ void * a, char * b, uint32_t c
-#define func_string_intptr_string_uint32_args$ void * a, char * b, uint32_t c
-#define func_uint32_intptr_string_uint32_args$ void * a, char * b, uint32_t c
-#define func_intptr_intptr_string_uint32_args$ void * a, char * b, uint32_t c
-#define action_intptr_string_intptr_args$ void * a, char * b, void * c
-#define func_uint64_intptr_string_intptr_args$ void * a, char * b, void * c
-#define func_int32_intptr_string_intptr_args$ void * a, char * b, void * c
-#define func_string_intptr_string_intptr_args$ void * a, char * b, void * c
-#define func_uint32_intptr_string_intptr_args$ void * a, char * b, void * c
-#define func_intptr_intptr_string_intptr_args$ void * a, char * b, void * c
-#define action_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
-#define func_uint64_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
-#define func_int32_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
-#define func_string_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
-#define func_uint32_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
-#define func_intptr_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
-#define action_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
+#define func_uint64_intptr_string_uint64_args$ void * a, char * b, uint64_t c
+#define func_uint64_intptr_uint32_args$ void * a, uint32_t b
 #define func_uint64_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
-#define func_int32_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
-#define func_string_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
-#define func_uint32_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
-#define func_intptr_intptr_uint32_int32_args$ void * a, uint32_t b, int32_t c
-#define action_intptr_uint32_string_args$ void * a, uint32_t b, char * c
+#define func_uint64_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
 #define func_uint64_intptr_uint32_string_args$ void * a, uint32_t b, char * c
-#define func_int32_intptr_uint32_string_args$ void * a, uint32_t b, char * c
-#define func_string_intptr_uint32_string_args$ void * a, uint32_t b, char * c
-#define func_uint32_intptr_uint32_string_args$ void * a, uint32_t b, char * c
-#define func_intptr_intptr_uint32_string_args$ void * a, uint32_t b, char * c
-#define action_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
 #define func_uint64_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
-#define func_int32_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
-#define func_string_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
-#define func_uint32_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
-#define func_intptr_intptr_uint32_uint32_args$ void * a, uint32_t b, uint32_t c
-#define action_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
-#define func_uint64_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
-#define func_int32_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
-#define func_string_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
-#define func_uint32_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
-#define func_intptr_intptr_uint32_intptr_args$ void * a, uint32_t b, void * c
-#define action_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
-#define func_uint64_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
-#define func_int32_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
-#define func_string_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
-#define func_uint32_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
-#define func_intptr_intptr_intptr_uint64_args$ void * a, void * b, uint64_t c
-#define action_intptr_intptr_int32_args$ void * a, void * b, int32_t c
-#define func_uint64_intptr_intptr_int32_args$ void * a, void * b, int32_t c
-#define func_int32_intptr_intptr_int32_args$ void * a, void * b, int32_t c
-#define func_string_intptr_intptr_int32_args$ void * a, void * b, int32_t c
-#define func_uint32_intptr_intptr_int32_args$ void * a, void * b, int32_t c
-#define func_intptr_intptr_intptr_int32_args$ void * a, void * b, int32_t c
-#define action_intptr_intptr_string_args$ void * a, void * b, char * c
-#define func_uint64_intptr_intptr_string_args$ void * a, void * b, char * c
-#define func_int32_intptr_intptr_string_args$ void * a, void * b, char * c
-#define func_string_intptr_intptr_string_args$ void * a, void * b, char * c
-#define func_uint32_intptr_intptr_string_args$ void * a, void * b, char * c
-#define func_intptr_intptr_intptr_string_args$ void * a, void * b, char * c
-#define action_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
-#define func_uint64_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
-#define func_int32_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
-#define func_string_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
-#define func_uint32_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
-#define func_intptr_intptr_intptr_uint32_args$ void * a, void * b, uint32_t c
-#define action_intptr_intptr_intptr_args$ void * a, void * b, void * c
-#define func_uint64_intptr_intptr_intptr_args$ void * a, void * b, void * c
-#define func_int32_intptr_intptr_intptr_args$ void * a, void * b, void * c
-#define func_string_intptr_intptr_intptr_args$ void * a, void * b, void * c
-#define func_uint32_intptr_intptr_intptr_args$ void * a, void * b, void * c
-#define func_intptr_intptr_intptr_intptr_args$ void * a, void * b, void * c
-#define action_args$ 
-#define func_uint64_args$ 
-#define func_int32_args$ 
-#define func_string_args$ 
-#define func_uint32_args$ 
-#define func_intptr_args$ 
+#define func_uint64_intptr_uint32_uint64_args$ void * a, uint32_t b, uint64_t c
+#define func_uint64_intptr_uint64_args$ void * a, uint64_t b
+#define func_uint64_intptr_uint64_int32_args$ void * a, uint64_t b, int32_t c
+#define func_uint64_intptr_uint64_intptr_args$ void * a, uint64_t b, void * c
+#define func_uint64_intptr_uint64_string_args$ void * a, uint64_t b, char * c
+#define func_uint64_intptr_uint64_uint32_args$ void * a, uint64_t b, uint32_t c
+#define func_uint64_intptr_uint64_uint64_args$ void * a, uint64_t b, uint64_t c
+#define func_uint64_string_args$ char * a
+#define func_uint64_string_int32_args$ char * a, int32_t b
+#define func_uint64_string_int32_int32_args$ char * a, int32_t b, int32_t c
+#define func_uint64_string_int32_intptr_args$ char * a, int32_t b, void * c
+#define func_uint64_string_int32_string_args$ char * a, int32_t b, char * c
+#define func_uint64_string_int32_uint32_args$ char * a, int32_t b, uint32_t c
+#define func_uint64_string_int32_uint64_args$ char * a, int32_t b, uint64_t c
+#define func_uint64_string_intptr_args$ char * a, void * b
+#define func_uint64_string_intptr_int32_args$ char * a, void * b, int32_t c
+#define func_uint64_string_intptr_intptr_args$ char * a, void * b, void * c
+#define func_uint64_string_intptr_string_args$ char * a, void * b, char * c
+#define func_uint64_string_intptr_uint32_args$ char * a, void * b, uint32_t c
+#define func_uint64_string_intptr_uint64_args$ char * a, void * b, uint64_t c
+#define func_uint64_string_string_args$ char * a, char * b
+#define func_uint64_string_string_int32_args$ char * a, char * b, int32_t c
+#define func_uint64_string_string_intptr_args$ char * a, char * b, void * c
+#define func_uint64_string_string_string_args$ char * a, char * b, char * c
+#define func_uint64_string_string_uint32_args$ char * a, char * b, uint32_t c
+#define func_uint64_string_string_uint64_args$ char * a, char * b, uint64_t c
+#define func_uint64_string_uint32_args$ char * a, uint32_t b
+#define func_uint64_string_uint32_int32_args$ char * a, uint32_t b, int32_t c
+#define func_uint64_string_uint32_intptr_args$ char * a, uint32_t b, void * c
+#define func_uint64_string_uint32_string_args$ char * a, uint32_t b, char * c
+#define func_uint64_string_uint32_uint32_args$ char * a, uint32_t b, uint32_t c
+#define func_uint64_string_uint32_uint64_args$ char * a, uint32_t b, uint64_t c
+#define func_uint64_string_uint64_args$ char * a, uint64_t b
+#define func_uint64_string_uint64_int32_args$ char * a, uint64_t b, int32_t c
+#define func_uint64_string_uint64_intptr_args$ char * a, uint64_t b, void * c
+#define func_uint64_string_uint64_string_args$ char * a, uint64_t b, char * c
+#define func_uint64_string_uint64_uint32_args$ char * a, uint64_t b, uint32_t c
+#define func_uint64_string_uint64_uint64_args$ char * a, uint64_t b, uint64_t c
+#define func_uint64_uint32_args$ uint32_t a
+#define func_uint64_uint32_int32_args$ uint32_t a, int32_t b
+#define func_uint64_uint32_int32_int32_args$ uint32_t a, int32_t b, int32_t c
+#define func_uint64_uint32_int32_intptr_args$ uint32_t a, int32_t b, void * c
+#define func_uint64_uint32_int32_string_args$ uint32_t a, int32_t b, char * c
+#define func_uint64_uint32_int32_uint32_args$ uint32_t a, int32_t b, uint32_t c
+#define func_uint64_uint32_int32_uint64_args$ uint32_t a, int32_t b, uint64_t c
+#define func_uint64_uint32_intptr_args$ uint32_t a, void * b
+#define func_uint64_uint32_intptr_int32_args$ uint32_t a, void * b, int32_t c
+#define func_uint64_uint32_intptr_intptr_args$ uint32_t a, void * b, void * c
+#define func_uint64_uint32_intptr_string_args$ uint32_t a, void * b, char * c
+#define func_uint64_uint32_intptr_uint32_args$ uint32_t a, void * b, uint32_t c
+#define func_uint64_uint32_intptr_uint64_args$ uint32_t a, void * b, uint64_t c
+#define func_uint64_uint32_string_args$ uint32_t a, char * b
+#define func_uint64_uint32_string_int32_args$ uint32_t a, char * b, int32_t c
+#define func_uint64_uint32_string_intptr_args$ uint32_t a, char * b, void * c
+#define func_uint64_uint32_string_string_args$ uint32_t a, char * b, char * c
+#define func_uint64_uint32_string_uint32_args$ uint32_t a, char * b, uint32_t c
+#define func_uint64_uint32_string_uint64_args$ uint32_t a, char * b, uint64_t c
+#define func_uint64_uint32_uint32_args$ uint32_t a, uint32_t b
+#define func_uint64_uint32_uint32_int32_args$ uint32_t a, uint32_t b, int32_t c
+#define func_uint64_uint32_uint32_intptr_args$ uint32_t a, uint32_t b, void * c
+#define func_uint64_uint32_uint32_string_args$ uint32_t a, uint32_t b, char * c
+#define func_uint64_uint32_uint32_uint32_args$ uint32_t a, uint32_t b, uint32_t c
+#define func_uint64_uint32_uint32_uint64_args$ uint32_t a, uint32_t b, uint64_t c
+#define func_uint64_uint32_uint64_args$ uint32_t a, uint64_t b
+#define func_uint64_uint32_uint64_int32_args$ uint32_t a, uint64_t b, int32_t c
+#define func_uint64_uint32_uint64_intptr_args$ uint32_t a, uint64_t b, void * c
+#define func_uint64_uint32_uint64_string_args$ uint32_t a, uint64_t b, char * c
+#define func_uint64_uint32_uint64_uint32_args$ uint32_t a, uint64_t b, uint32_t c
+#define func_uint64_uint32_uint64_uint64_args$ uint32_t a, uint64_t b, uint64_t c
+#define func_uint64_uint64_args$ uint64_t a
+#define func_uint64_uint64_int32_args$ uint64_t a, int32_t b
+#define func_uint64_uint64_int32_int32_args$ uint64_t a, int32_t b, int32_t c
+#define func_uint64_uint64_int32_intptr_args$ uint64_t a, int32_t b, void * c
+#define func_uint64_uint64_int32_string_args$ uint64_t a, int32_t b, char * c
+#define func_uint64_uint64_int32_uint32_args$ uint64_t a, int32_t b, uint32_t c
+#define func_uint64_uint64_int32_uint64_args$ uint64_t a, int32_t b, uint64_t c
+#define func_uint64_uint64_intptr_args$ uint64_t a, void * b
+#define func_uint64_uint64_intptr_int32_args$ uint64_t a, void * b, int32_t c
+#define func_uint64_uint64_intptr_intptr_args$ uint64_t a, void * b, void * c
+#define func_uint64_uint64_intptr_string_args$ uint64_t a, void * b, char * c
+#define func_uint64_uint64_intptr_uint32_args$ uint64_t a, void * b, uint32_t c
+#define func_uint64_uint64_intptr_uint64_args$ uint64_t a, void * b, uint64_t c
+#define func_uint64_uint64_string_args$ uint64_t a, char * b
+#define func_uint64_uint64_string_int32_args$ uint64_t a, char * b, int32_t c
+#define func_uint64_uint64_string_intptr_args$ uint64_t a, char * b, void * c
+#define func_uint64_uint64_string_string_args$ uint64_t a, char * b, char * c
+#define func_uint64_uint64_string_uint32_args$ uint64_t a, char * b, uint32_t c
+#define func_uint64_uint64_string_uint64_args$ uint64_t a, char * b, uint64_t c
+#define func_uint64_uint64_uint32_args$ uint64_t a, uint32_t b
+#define func_uint64_uint64_uint32_int32_args$ uint64_t a, uint32_t b, int32_t c
+#define func_uint64_uint64_uint32_intptr_args$ uint64_t a, uint32_t b, void * c
+#define func_uint64_uint64_uint32_string_args$ uint64_t a, uint32_t b, char * c
+#define func_uint64_uint64_uint32_uint32_args$ uint64_t a, uint32_t b, uint32_t c
+#define func_uint64_uint64_uint32_uint64_args$ uint64_t a, uint32_t b, uint64_t c
+#define func_uint64_uint64_uint64_args$ uint64_t a, uint64_t b
+#define func_uint64_uint64_uint64_int32_args$ uint64_t a, uint64_t b, int32_t c
+#define func_uint64_uint64_uint64_intptr_args$ uint64_t a, uint64_t b, void * c
+#define func_uint64_uint64_uint64_string_args$ uint64_t a, uint64_t b, char * c
+#define func_uint64_uint64_uint64_uint32_args$ uint64_t a, uint64_t b, uint32_t c
+#define func_uint64_uint64_uint64_uint64_args$ uint64_t a, uint64_t b, uint64_t c
 
 #endif
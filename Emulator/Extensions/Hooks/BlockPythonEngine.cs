@@ -27,24 +27,29 @@ namespace Emul8.Hooks
             Hook = (pc) =>
             {
                 Scope.SetVariable("pc", pc);
-                Source.Value.Execute(Scope);
+                Execute(Code.Value);
             };
 
             HookWithSize = (pc, size) =>
             {
                 Scope.SetVariable("pc", pc);
                 Scope.SetVariable("size", size);
-                Source.Value.Execute(Scope);
+                Execute(Code.Value);
             };
         }
 
+        protected override object ProfilingOwner
+        {
+            get { return CPU; }
+        }
+
         [PostDeserialization]
         private void InnerInit()
         {
             Scope.SetVariable(Machine.MachineKeyword, Machine);
             Scope.SetVariable("cpu", CPU);
             Scope.SetVariable("self", CPU);
-            Source = new Lazy<ScriptSource>(() => Engine.CreateScriptSourceFromString(Script));
+            Code = new Lazy<CompiledCode>(() => GetCompiledCode(Script));
         }
 
         public Action<uint> Hook { get; private set; }
@@ -52,7 +57,7 @@ namespace Emul8.Hooks
         public Action<uint, uint> HookWithSize { get; private set; }
 
         [Transient]
-        private Lazy<ScriptSource> Source;
+        private Lazy<CompiledCode> Code;
         private readonly string Script;
         private readonly ICPUWithHooks CPU;
         private readonly Machine Machine;
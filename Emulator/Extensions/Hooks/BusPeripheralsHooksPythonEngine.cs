@@ -31,7 +31,7 @@ namespace Emul8.Hooks
                     {
                         Scope.SetVariable("value", valueToWrite);
                         Scope.SetVariable("offset", offset);
-                        WriteSource.Value.Execute(Scope);
+                        Execute(WriteCode.Value);
                         return (uint)Scope.GetVariable("value");
                     });
             }
@@ -42,12 +42,17 @@ namespace Emul8.Hooks
                     {
                         Scope.SetVariable("value", readValue);
                         Scope.SetVariable("offset", offset);
-                        ReadSource.Value.Execute(Scope);
+                        Execute(ReadCode.Value);
                         return (uint)Scope.GetVariable("value");
                     });
             }
         }
 
+        protected override object ProfilingOwner
+        {
+            get { return Peripheral; }
+        }
+
         [PostDeserialization]
         private void InnerInit()
         {
@@ -55,8 +60,8 @@ namespace Emul8.Hooks
             Scope.SetVariable("sysbus", Sysbus);
             Scope.SetVariable(Machine.MachineKeyword, Sysbus.Machine);
 
-            ReadSource = new Lazy<ScriptSource>(() => Engine.CreateScriptSourceFromString(ReadScript));
-            WriteSource = new Lazy<ScriptSource>(() => Engine.CreateScriptSourceFromString(WriteScript));
+            ReadCode = new Lazy<CompiledCode>(() => GetCompiledCode(ReadScript));
+            WriteCode = new Lazy<CompiledCode>(() => GetCompiledCode(WriteScript));
         }
 
         public Func<uint, long, uint> WriteHook { get; private set; }
@@ -68,9 +73,9 @@ namespace Emul8.Hooks
         private readonly SystemBus Sysbus;
 
         [Transient]
-        private Lazy<ScriptSource> ReadSource;
+        private Lazy<CompiledCode> ReadCode;
         [Transient]
-        private Lazy<ScriptSource> WriteSource;
+        private Lazy<CompiledCode> WriteCode;
     }
 }
 
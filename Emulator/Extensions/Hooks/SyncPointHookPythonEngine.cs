@@ -24,15 +24,20 @@ namespace Emul8.Hooks
             Hook = new Action<long>(syncCount =>
             {   
                 Scope.SetVariable("syncCount", syncCount);
-                Source.Value.Execute(Scope);
+                Execute(Code.Value);
             });
         }
 
+        protected override object ProfilingOwner
+        {
+            get { return emulation; }
+        }
+
         [PostDeserialization]
         private void InnerInit()
         {
             Scope.SetVariable("self", emulation);
-            Source = new Lazy<ScriptSource>(() => Engine.CreateScriptSourceFromString(script));
+            Code = new Lazy<CompiledCode>(() => GetCompiledCode(script));
         }
 
         public Action<long> Hook { get; private set; }
@@ -41,7 +46,7 @@ namespace Emul8.Hooks
         private readonly Emulation emulation;
 
         [Transient]
-        private Lazy<ScriptSource> Source;
+        private Lazy<CompiledCode> Code;
     }
 }
 
@@ -33,6 +33,18 @@ namespace Emul8.Hooks
             var engine = new WatchpointHookPythonEngine(sysbus, pythonScript);
             sysbus.AddWatchpointHook(address, width, access, true, engine.Hook);
         }
+
+        public static void AddWatchpointHook(this SystemBus sysbus, Range range, Width width, Access access, string pythonScript)
+        {
+            var engine = new WatchpointHookPythonEngine(sysbus, pythonScript);
+            sysbus.AddWatchpointHook(range, width, access, true, engine.Hook);
+        }
+
+        public static void AddMaskedWatchpointHook(this SystemBus sysbus, long value, long mask, Width width, Access access, string pythonScript)
+        {
+            var engine = new WatchpointHookPythonEngine(sysbus, pythonScript);
+            sysbus.AddMaskedWatchpointHook(value, mask, width, access, true, engine.Hook);
+        }
     }
 }
 
@@ -27,23 +27,28 @@ namespace Emul8.Hooks
             Hook = line =>
             {
                 Scope.SetVariable("line", line);
-                Source.Value.Execute(Scope);
+                Execute(Code.Value);
             };
         }
 
+        protected override object ProfilingOwner
+        {
+            get { return Uart; }
+        }
+
         [PostDeserialization]
         private void InnerInit()
         {
             Scope.SetVariable(Machine.MachineKeyword, Machine);
             Scope.SetVariable("uart", Uart);
             Scope.SetVariable("self", Uart);
-            Source = new Lazy<ScriptSource>(() => Engine.CreateScriptSourceFromString(Script));
+            Code = new Lazy<CompiledCode>(() => GetCompiledCode(Script));
         }
 
         public Action<string> Hook { get; private set; }
 
         [Transient]
-        private Lazy<ScriptSource> Source;
+        private Lazy<CompiledCode> Code;
         private readonly string Script;
         private readonly IUART Uart;
         private readonly Machine Machine;
@@ -25,22 +25,27 @@ namespace Emul8.Hooks
             Hook = state =>
             {
                 Scope.SetVariable("state", state);
-                Source.Value.Execute(Scope);
+                Execute(Code.Value);
             };
         }
 
+        protected override object ProfilingOwner
+        {
+            get { return Machine; }
+        }
+
         [PostDeserialization]
         private void InnerInit()
         {
             Scope.SetVariable(Machine.MachineKeyword, Machine);
             Scope.SetVariable("self", Machine);
-            Source = new Lazy<ScriptSource>(() => Engine.CreateScriptSourceFromString(Script));
+            Code = new Lazy<CompiledCode>(() => GetCompiledCode(Script));
         }
 
         public Action<string> Hook { get; private set; }
 
         [Transient]
-        private Lazy<ScriptSource> Source;
+        private Lazy<CompiledCode> Code;
         private readonly string Script;
         private readonly Machine Machine;
     }
@@ -25,22 +25,27 @@ namespace Emul8.Hooks
             {
                 Scope.SetVariable("address", address);
                 Scope.SetVariable("width", width);
-                source.Value.Execute(Scope);
+                Execute(code.Value);
             };
         }
 
         public Action<long, Width> Hook { get; private set; }
 
+        protected override object ProfilingOwner
+        {
+            get { return sysbus; }
+        }
+
         [PostDeserialization]
         private void InnerInit()
         {
             Scope.SetVariable("self", sysbus);
 
-            source = new Lazy<ScriptSource>(() => Engine.CreateScriptSourceFromString(script));
+            code = new Lazy<CompiledCode>(() => GetCompiledCode(script));
         }
 
         [Transient]
-        private Lazy<ScriptSource> source;
+        private Lazy<CompiledCode> code;
 
         private readonly string script;
         private readonly object sysbus;
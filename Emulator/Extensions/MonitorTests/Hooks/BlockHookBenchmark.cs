@@ -0,0 +1,54 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Diagnostics;
+using Emul8.Core;
+using Emul8.Hooks;
+using NUnit.Framework;
+
+namespace MonitorTests.Hooks
+{
+    [TestFixture]
+    public class BlockHookBenchmark
+    {
+        [Test, Explicit("Benchmark, run manually to compare per-event hook overhead between builds.")]
+        public void MeasureBlockHookOverhead()
+        {
+            var machine = new Machine();
+            var engine = new BlockPythonEngine(machine, null, Script);
+            // the first event compiles the script
+            engine.Hook(0);
+
+            var stopwatch = Stopwatch.StartNew();
+            for(var pc = 0u; pc < EventsCount; pc++)
+            {
+                engine.Hook(pc);
+            }
+            stopwatch.Stop();
+            Console.WriteLine("Block hook: {0:0.000} us per event", stopwatch.Elapsed.TotalMilliseconds * 1000 / EventsCount);
+
+            stopwatch = Stopwatch.StartNew();
+            for(var i = 0; i < EnginesCount; i++)
+            {
+                new BlockPythonEngine(machine, null, Script).HookWithSize(0, 4);
+            }
+            stopwatch.Stop();
+            Console.WriteLine("Block hook installation: {0:0.000} ms per engine", stopwatch.Elapsed.TotalMilliseconds / EnginesCount);
+        }
+
+        [SetUp]
+        public void SetUp()
+        {
+            EmulationManager.Instance.Clear();
+        }
+
+        private const int EventsCount = 100000;
+        private const int EnginesCount = 100;
+        private const string Script = "if pc & 0xFFF == 0:\n\tlast_page = pc";
+    }
+}
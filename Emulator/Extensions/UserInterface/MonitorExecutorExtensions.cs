@@ -41,16 +41,23 @@ namespace Emul8.UserInterface
         {
             public ExecutorPythonEngine(Machine machine, string script)
             {
+                this.machine = machine;
                 Scope.SetVariable(Machine.MachineKeyword, machine);
                 Scope.SetVariable("self", machine);
 
-                source = new Lazy<ScriptSource>(() => Engine.CreateScriptSourceFromString(script));
-                Action = () => source.Value.Execute(Scope);
+                code = new Lazy<CompiledCode>(() => GetCompiledCode(script));
+                Action = () => Execute(code.Value);
             }
 
             public Action Action { get; private set; }
 
-            private Lazy<ScriptSource> source;
+            protected override object ProfilingOwner
+            {
+                get { return machine; }
+            }
+
+            private Lazy<CompiledCode> code;
+            private readonly Machine machine;
         }
 
         private sealed class PeriodicEventsRegister
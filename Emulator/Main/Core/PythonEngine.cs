@@ -13,7 +13,9 @@ using System.Collections.Generic;
 using System.Linq;
 using IronPython.Runtime;
 using System;
+using System.Diagnostics;
 using Antmicro.Migrant;
+using Emul8.Utilities;
 
 namespace Emul8.Core
 {
@@ -24,6 +26,9 @@ namespace Emul8.Core
         private static readonly ScriptEngine _Engine = Python.CreateEngine();
         protected ScriptEngine Engine { get { return PythonEngine._Engine; } }
 
+        private const int CompiledScriptsCacheSize = 256;
+        private static readonly LRUCache<string, CompiledCode> CompiledScripts = new LRUCache<string, CompiledCode>(CompiledScriptsCacheSize);
+
         #endregion
 
         [Transient]
@@ -74,8 +79,7 @@ namespace Emul8.Core
             Scope = Engine.CreateScope();
             PythonTime.localtime();
 
-            var imports = Engine.CreateScriptSourceFromString(Aggregate(Imports));
-            imports.Execute(Scope);
+            GetCompiledCode(Aggregate(Imports)).Execute(Scope);
         }
 
         protected virtual void Init()
@@ -83,6 +87,63 @@ namespace Emul8.Core
             InnerInit();
         }
 
+        #region Profiling
+
+        /// <summary>
+        /// Object the scripts are run for, used to name the engine in profiling statistics.
+        /// </summary>
+        protected internal virtual object ProfilingOwner { get { return null; } }
+
+        protected void Execute(CompiledCode code)
+        {
+            if(!PythonEngineProfiler.Enabled)
+            {
+                code.Execute(Scope);
+                return;
+            }
+            ProfiledExecute(code);
+        }
+
+        // kept apart from Execute, so that the closure is allocated only when profiling is enabled
+        private void ProfiledExecute(CompiledCode code)
+        {
+            Profile(() => code.Execute(Scope));
+        }
+
+        protected void Profile(Action action)
+        {
+            Profile(() =>
+            {
+                action();
+                return true;
+            });
+        }
+
+        protected T Profile<T>(Func<T> function)
+        {
+            if(counters == null)
+            {
+                counters = PythonEngineProfiler.Register(this);
+            }
+            var startTimestamp = Stopwatch.GetTimestamp();
+            var succeeded = false;
+            try
+            {
+                var result = function();
+                succeeded = true;
+                return result;
+            }
+            finally
+            {
+                counters.Record(startTimestamp, succeeded);
+            }
+        }
+
+        [Transient]
+        private PythonEngineCounters counters;
+
+        #endregion
+
         #region Serialization
 
         [PreSerialization]
@@ -124,6 +185,28 @@ namespace Emul8.Core
 
         #region Helper methods
 
+        /// <summary>
+        /// Returns the script compiled for the shared engine. Compiled code does not depend on a scope,
+        /// so the same script text installed for many machines, CPUs or peripherals is compiled only once.
+        /// </summary>
+        protected static CompiledCode GetCompiledCode(string script)
+        {
+            CompiledCode result;
+            if(CompiledScripts.TryGetValue(script, out result))
+            {
+                return result;
+            }
+            lock(CompiledScripts)
+            {
+                if(!CompiledScripts.TryGetValue(script, out result))
+                {
+                    result = _Engine.CreateScriptSourceFromString(script).Compile();
+                    CompiledScripts.Add(script, result);
+                }
+                return result;
+            }
+        }
+
         protected static string Aggregate(string[] array)
         {
             return array.Aggregate((prev, curr) => string.Format("{0}{1}{2}", prev, Environment.NewLine, curr));
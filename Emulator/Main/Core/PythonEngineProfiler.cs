@@ -0,0 +1,138 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+
+namespace Emul8.Core
+{
+    /// <summary>
+    /// Collects execution statistics of scripts run by Python hooks and peripherals.
+    /// When disabled, engines only check the <see cref="Enabled"/> flag before running a script.
+    /// </summary>
+    public static class PythonEngineProfiler
+    {
+        public static bool Enabled { get; set; }
+
+        public static PythonEngineCounters[] GetCounters()
+        {
+            lock(counters)
+            {
+                return counters.OrderByDescending(x => x.TotalTime).ToArray();
+            }
+        }
+
+        public static void Reset()
+        {
+            lock(counters)
+            {
+                // counters of engines that no longer exist would never change again
+                counters.RemoveAll(x => !x.IsAlive);
+                foreach(var entry in counters)
+                {
+                    entry.Reset();
+                }
+            }
+        }
+
+        internal static PythonEngineCounters Register(PythonEngine engine)
+        {
+            var result = new PythonEngineCounters(engine);
+            lock(counters)
+            {
+                counters.Add(result);
+            }
+            return result;
+        }
+
+        private static readonly List<PythonEngineCounters> counters = new List<PythonEngineCounters>();
+    }
+
+    public sealed class PythonEngineCounters
+    {
+        public string Kind { get; private set; }
+
+        public string Name
+        {
+            get
+            {
+                PythonEngine engine;
+                string name;
+                if(!this.engine.TryGetTarget(out engine))
+                {
+                    return lastKnownName ?? "(removed)";
+                }
+                if(EmulationManager.Instance.CurrentEmulation.TryGetEmulationElementName(engine.ProfilingOwner, out name))
+                {
+                    lastKnownName = name;
+                }
+                return name ?? lastKnownName ?? "-";
+            }
+        }
+
+        public long Invocations { get { lock(locker) { return invocations; } } }
+
+        public long Exceptions { get { lock(locker) { return exceptions; } } }
+
+        public TimeSpan TotalTime { get { lock(locker) { return TimeSpan.FromSeconds((double)totalTicks / Stopwatch.Frequency); } } }
+
+        public TimeSpan MaxTime { get { lock(locker) { return TimeSpan.FromSeconds((double)maxTicks / Stopwatch.Frequency); } } }
+
+        internal PythonEngineCounters(PythonEngine engine)
+        {
+            this.engine = new WeakReference<PythonEngine>(engine);
+            Kind = engine.GetType().Name;
+            locker = new object();
+        }
+
+        internal void Record(long startTimestamp, bool succeeded)
+        {
+            var ticks = Stopwatch.GetTimestamp() - startTimestamp;
+            lock(locker)
+            {
+                invocations++;
+                totalTicks += ticks;
+                maxTicks = Math.Max(maxTicks, ticks);
+                if(!succeeded)
+                {
+                    exceptions++;
+                }
+            }
+        }
+
+        internal void Reset()
+        {
+            lock(locker)
+            {
+                invocations = 0;
+                exceptions = 0;
+                totalTicks = 0;
+                maxTicks = 0;
+            }
+        }
+
+        internal bool IsAlive
+        {
+            get
+            {
+                PythonEngine target;
+                return engine.TryGetTarget(out target);
+            }
+        }
+
+        private long invocations;
+        private long exceptions;
+        private long totalTicks;
+        private long maxTicks;
+        private string lastKnownName;
+
+        private readonly WeakReference<PythonEngine> engine;
+        private readonly object locker;
+    }
+}
@@ -106,6 +106,46 @@ namespace Emul8.Logging
             }
         }
 
+        public static bool IsLogLevelEnabled(this IEmulationElement e, LogLevel level)
+        {
+            var effectiveLevel = GetEffectiveLogLevel(e);
+            return effectiveLevel != null && level >= effectiveLevel;
+        }
+
+        // returns the lowest level that any backend would log for the given object, or null if there are no backends
+        public static LogLevel GetEffectiveLogLevel(object o)
+        {
+            var emulationManager = EmulationManager.Instance;
+            int sourceId = -1;
+            var hasSourceId = emulationManager != null && o != null
+                && emulationManager.CurrentEmulation.CurrentLogger.TryGetSourceId(o, out sourceId);
+
+            LogLevel result = null;
+            var allBackends = backends.Items;
+            for(var i = 0; i < allBackends.Length; i++)
+            {
+                LogLevel level = null;
+                if(hasSourceId)
+                {
+                    var loggerBackend = allBackends[i] as LoggerBackend;
+                    if(loggerBackend != null)
+                    {
+                        level = loggerBackend.GetCustomLogLevel(sourceId);
+                    }
+                    else
+                    {
+                        allBackends[i].GetCustomLogLevels().TryGetValue(sourceId, out level);
+                    }
+                }
+                level = level ?? allBackends[i].GetLogLevel();
+                if(result == null || level < result)
+                {
+                    result = level;
+                }
+            }
+            return result;
+        }
+
         public static void Trace(this IEmulationElement e, LogLevel type, string message = "", 
             [CallerLineNumber] int lineNumber = 0,
             [CallerMemberName] string caller = null,
@@ -54,8 +54,8 @@ namespace Emul8.Peripherals.Bus
             binaryFingerprints = new List<BinaryFingerprint>();
             cpuById = new Dictionary<int, ICPU>();
             idByCpu = new Dictionary<ICPU, int>();
-            hooksOnRead = new Dictionary<long, List<BusHookHandler>>();
-            hooksOnWrite = new Dictionary<long, List<BusHookHandler>>();
+            hooksOnRead = new WatchpointIndex();
+            hooksOnWrite = new WatchpointIndex();
             InitStructures();
             this.Log(LogLevel.Info, "System bus created.");
         }
@@ -651,83 +651,84 @@ namespace Emul8.Peripherals.Bus
 
         public void AddWatchpointHook(long address, Width width, Access access, bool updateContext, Action<long, Width> hook)
         {
-            if(!Enum.IsDefined(typeof(Access), access))
+            AddWatchpointHook(new Range(address, 1), width, access, updateContext, hook);
+        }
+
+        /// <summary>
+        /// Adds a hook invoked on accesses at any address within the range.
+        /// </summary>
+        public void AddWatchpointHook(Range range, Width width, Access access, bool updateContext, Action<long, Width> hook)
+        {
+            var handler = CreateWatchpointHandler(width, access, updateContext, hook);
+            foreach(var index in GetWatchpointIndexes(access))
             {
-                throw new RecoverableException("Undefined access value.");
+                index.AddRange(range.StartAddress, range.EndAddress, handler);
             }
-            if(((((int)width) & 15) != (int)width) || width == 0)
+            foreach(var page in GetWatchedPages(memory => WatchpointIndex.GetRangeBlocks(range.StartAddress, range.EndAddress, memory, WatchpointPageGranularity)))
             {
-                throw new RecoverableException("Undefined width value.");
+                SetPageAccessViaIo(page);
             }
+        }
 
-            Action updateContextHandler = updateContext ? 
-                () =>
-                {
-                    foreach(var cpu in cpuById.Values)
-                    {
-                        cpu.UpdateContext();
-                    }
-                } :
-                (Action)null;
-            
-            var handler = new BusHookHandler(hook, width, updateContextHandler);
-
-            var dictionariesToUpdate = new List<Dictionary<long, List<BusHookHandler>>>();
-
-            if((access & Access.Read) != 0)
-            {
-                dictionariesToUpdate.Add(hooksOnRead);
-            }
-            if((access & Access.Write) != 0)
+        /// <summary>
+        /// Adds a hook invoked on accesses at addresses for which `address &amp; mask == value`.
+        /// </summary>
+        public void AddMaskedWatchpointHook(long value, long mask, Width width, Access access, bool updateContext, Action<long, Width> hook)
+        {
+            var handler = CreateWatchpointHandler(width, access, updateContext, hook);
+            foreach(var index in GetWatchpointIndexes(access))
             {
-                dictionariesToUpdate.Add(hooksOnWrite);
+                index.AddPattern(value, mask, handler);
             }
-            foreach(var dictionary in dictionariesToUpdate)
+            foreach(var page in GetWatchedPages(memory => WatchpointIndex.GetPatternBlocks(value, mask, memory, WatchpointPageGranularity)))
             {
-                if(dictionary.ContainsKey(address))
-                {
-                    dictionary[address].Add(handler);
-                }
-                else
-                {
-                    dictionary[address] = new List<BusHookHandler> { handler };
-                }
+                SetPageAccessViaIo(page);
             }
-            UpdatePageAccesses();
         }
 
         public void RemoveWatchpointHook(long address, Action<long, Width> hook)
         {
-            foreach(var hookDictionary in new [] { hooksOnRead, hooksOnWrite })
+            RemoveWatchpointHook(new Range(address, 1), hook);
+        }
+
+        public void RemoveWatchpointHook(Range range, Action<long, Width> hook)
+        {
+            UpdatePageAccesses(() =>
             {
-                List<BusHookHandler> handlers;
-                if(hookDictionary.TryGetValue(address, out handlers))
-                {
-                    handlers.RemoveAll(x => x.ContainsAction(hook));
-                    if(handlers.Count == 0)
-                    {
-                        hookDictionary.Remove(address);
-                    }
-                }
-            }
+                hooksOnRead.RemoveRange(range.StartAddress, range.EndAddress, hook);
+                hooksOnWrite.RemoveRange(range.StartAddress, range.EndAddress, hook);
+            });
+        }
 
-            ClearPageAccessViaIo(address);
-            UpdatePageAccesses();
+        public void RemoveMaskedWatchpointHook(long value, long mask, Action<long, Width> hook)
+        {
+            UpdatePageAccesses(() =>
+            {
+                hooksOnRead.RemovePattern(value, mask, hook);
+                hooksOnWrite.RemovePattern(value, mask, hook);
+            });
         }
 
         public void RemoveAllWatchpointHooks(long address)
         {
-            hooksOnRead.Remove(address);
-            hooksOnWrite.Remove(address);
-            ClearPageAccessViaIo(address);
-            UpdatePageAccesses();
+            RemoveWatchpointHook(new Range(address, 1), null);
+        }
+
+        public void RemoveAllWatchpointHooks(Range range)
+        {
+            RemoveWatchpointHook(range, null);
+        }
+
+        public void RemoveAllMaskedWatchpointHooks(long value, long mask)
+        {
+            RemoveMaskedWatchpointHook(value, mask, null);
         }
 
         public bool IsWatchpointAt(long address, Access access)
         {
             if(access == Access.ReadAndWrite || access == Access.Read)
             {
-                if(hooksOnRead.ContainsKey(address))
+                if(hooksOnRead.Contains(address))
                 {
                     return true;
                 }
@@ -736,7 +737,7 @@ namespace Emul8.Peripherals.Bus
                     return false;
                 }
             }
-            return hooksOnWrite.ContainsKey(address);
+            return hooksOnWrite.Contains(address);
         }
 
         public IEnumerable<BusRangeRegistration> GetRegistrationPoints(IBusPeripheral peripheral)
@@ -752,6 +753,11 @@ namespace Emul8.Peripherals.Bus
 
         public void Tag(Range range, string tag, uint defaultValue = 0, bool pausing = false)
         {
+            var valueTagIndex = FindValueTagIndex(range.EndAddress);
+            if(valueTagIndex >= 0 && valueTags[valueTagIndex].Range.Intersects(range))
+            {
+                throw new RecoverableException(string.Format("Given range intersects with tag {0}.", valueTags[valueTagIndex].Name));
+            }
             var intersectings = tags.Where(x => x.Key.Intersects(range)).ToArray();
             if(intersectings.Length == 0)
             {
@@ -792,10 +798,33 @@ namespace Emul8.Peripherals.Bus
             Tag(range, string.Format("{0}/{1}", parentName, tag), defaultValue, pausing);
         }
 
+        public void TagValues(long address, uint[] values, string tag)
+        {
+            // consecutive double words with individual values, named `tag_ADDRESS`; kept sorted for binary search
+            if(values.Length == 0)
+            {
+                return;
+            }
+            var range = new Range(address, values.Length * 4);
+            var index = FindValueTagIndex(range.EndAddress);
+            if(index >= 0 && valueTags[index].Range.Intersects(range))
+            {
+                throw new RecoverableException(string.Format("Given range intersects with tag {0}.", valueTags[index].Name));
+            }
+            var intersecting = tags.FirstOrDefault(x => x.Key.Intersects(range));
+            if(intersecting.Key != Range.Empty)
+            {
+                throw new RecoverableException(string.Format("Given range intersects with tag {0}.", intersecting.Value.Name));
+            }
+            valueTags.Insert(index + 1, new ValueTagEntry { Range = range, Name = tag, Values = values });
+        }
+
         public void RemoveTag(long address)
         {
             var tagsToRemove = tags.Where(x => x.Key.Contains(address)).ToArray();
-            if(tagsToRemove.Length == 0)
+            var valueTagIndex = FindValueTagIndex(address);
+            var valueTagFound = valueTagIndex >= 0 && valueTags[valueTagIndex].Range.Contains(address);
+            if(tagsToRemove.Length == 0 && !valueTagFound)
             {
                 throw new RecoverableException(string.Format("There is no tag at address 0x{0:X}.", address));
             }
@@ -804,6 +833,10 @@ namespace Emul8.Peripherals.Bus
                 tags.Remove(tag.Key);
                 pausingTags.Remove(tag.Value.Name);
             }
+            if(valueTagFound)
+            {
+                RemoveValueTagWord(valueTagIndex, address);
+            }
         }
 
         public void Clear()
@@ -1129,6 +1162,8 @@ namespace Emul8.Peripherals.Bus
                     var segments = mappedPeripheral.MappedSegments;
                     var mappings = segments.Select(x => FromRegistrationPointToSegmentWrapper(x, registrationPoint)).Where(x => x != null);
                     AddMappings(mappings, peripheral);
+                    // watchpoints can cover the newly mapped memory
+                    UpdatePageAccesses();
                 }
                 machine.RegisterAsAChildOf(this, peripheral, registrationPoint);
             }
@@ -1188,24 +1223,83 @@ namespace Emul8.Peripherals.Bus
             }
         }
 
+        private BusHookHandler CreateWatchpointHandler(Width width, Access access, bool updateContext, Action<long, Width> hook)
+        {
+            if(!Enum.IsDefined(typeof(Access), access))
+            {
+                throw new RecoverableException("Undefined access value.");
+            }
+            if(((((int)width) & 15) != (int)width) || width == 0)
+            {
+                throw new RecoverableException("Undefined width value.");
+            }
+
+            Action updateContextHandler = updateContext ? 
+                () =>
+                {
+                    foreach(var cpu in cpuById.Values)
+                    {
+                        cpu.UpdateContext();
+                    }
+                } :
+                (Action)null;
+            
+            return new BusHookHandler(hook, width, updateContextHandler);
+        }
+
+        private IEnumerable<WatchpointIndex> GetWatchpointIndexes(Access access)
+        {
+            if((access & Access.Read) != 0)
+            {
+                yield return hooksOnRead;
+            }
+            if((access & Access.Write) != 0)
+            {
+                yield return hooksOnWrite;
+            }
+        }
+
+        private void UpdatePageAccesses(Action removal)
+        {
+            var previouslyWatched = GetAllWatchedPages();
+            removal();
+            var watched = GetAllWatchedPages();
+            foreach(var page in previouslyWatched.Where(x => !watched.Contains(x)))
+            {
+                ClearPageAccessViaIo(page);
+            }
+            foreach(var page in watched)
+            {
+                SetPageAccessViaIo(page);
+            }
+        }
+
         private void UpdatePageAccesses()
         {
-            foreach(var address in hooksOnRead.Select(x => x.Key).Union(hooksOnWrite.Select(x => x.Key)))
+            foreach(var page in GetAllWatchedPages())
             {
-                SetPageAccessViaIo(address);
+                SetPageAccessViaIo(page);
             }
         }
 
-        private static void InvokeWatchpointHooks(Dictionary<long, List<BusHookHandler>> dictionary, long address, Width width)
+        private HashSet<long> GetAllWatchedPages()
         {
-            List<BusHookHandler> handlers;
-            if(dictionary.TryGetValue(address, out handlers))
+            if(hooksOnRead.IsEmpty && hooksOnWrite.IsEmpty)
             {
-                foreach(var handler in handlers)
-                {
-                    handler.Invoke(address, width);
-                }
+                return new HashSet<long>();
             }
+            return GetWatchedPages(memory => hooksOnRead.GetWatchedBlocks(memory, WatchpointPageGranularity).Concat(hooksOnWrite.GetWatchedBlocks(memory, WatchpointPageGranularity)));
+        }
+
+        private HashSet<long> GetWatchedPages(Func<Range, IEnumerable<long>> blocksInMemory)
+        {
+            // only accesses to mapped memory can bypass the bus, so pages of other peripherals need not be marked
+            var result = new HashSet<long>();
+            foreach(var memory in peripherals.Peripherals.Where(x => x.Peripheral is IMapped))
+            {
+                result.UnionWith(blocksInMemory(memory.RegistrationPoint.Range));
+            }
+            return result;
         }
 
         private static ELF<uint> GetELFFromFile(string fileName)
@@ -1268,6 +1362,7 @@ namespace Emul8.Peripherals.Bus
             peripherals = new PeripheralCollection(this);
             mappingsForPeripheral = new Dictionary<IBusPeripheral, List<MappedSegmentWrapper>>();
             tags = new Dictionary<Range, TagEntry>();
+            valueTags = new List<ValueTagEntry>();
             svdDevices = new List<SVDParser>();
             pausingTags = new HashSet<string>();
         }
@@ -1322,6 +1417,14 @@ namespace Emul8.Peripherals.Bus
 
         private string TryGetTag(long address, out uint defaultValue)
         {
+            var valueTagIndex = FindValueTagIndex(address);
+            if(valueTagIndex >= 0 && valueTags[valueTagIndex].Range.Contains(address))
+            {
+                var valueTag = valueTags[valueTagIndex];
+                var wordIndex = (address - valueTag.Range.StartAddress) / 4;
+                defaultValue = valueTag.Values[wordIndex];
+                return string.Format("{0}_{1:X8}", valueTag.Name, valueTag.Range.StartAddress + wordIndex * 4);
+            }
             var tag = tags.FirstOrDefault(x => x.Key.Contains(address));
             defaultValue = default(uint);
             if(tag.Key == Range.Empty)
@@ -1332,6 +1435,43 @@ namespace Emul8.Peripherals.Bus
             return tag.Value.Name;
         }
 
+        private void RemoveValueTagWord(int index, long address)
+        {
+            // each double word of a value tag is a separate tag, so the block is split around the removed one
+            var entry = valueTags[index];
+            var wordIndex = (int)((address - entry.Range.StartAddress) / 4);
+            valueTags.RemoveAt(index);
+            var wordsAfter = entry.Values.Length - wordIndex - 1;
+            if(wordsAfter > 0)
+            {
+                valueTags.Insert(index, new ValueTagEntry { Range = new Range(entry.Range.StartAddress + (wordIndex + 1) * 4, wordsAfter * 4), Name = entry.Name, Values = entry.Values.Skip(wordIndex + 1).ToArray() });
+            }
+            if(wordIndex > 0)
+            {
+                valueTags.Insert(index, new ValueTagEntry { Range = new Range(entry.Range.StartAddress, wordIndex * 4), Name = entry.Name, Values = entry.Values.Take(wordIndex).ToArray() });
+            }
+        }
+
+        // returns index of the last value tag starting at or below the address, -1 if there is none
+        private int FindValueTagIndex(long address)
+        {
+            var low = 0;
+            var high = valueTags.Count - 1;
+            while(low <= high)
+            {
+                var middle = low + (high - low) / 2;
+                if(valueTags[middle].Range.StartAddress <= address)
+                {
+                    low = middle + 1;
+                }
+                else
+                {
+                    high = middle - 1;
+                }
+            }
+            return high;
+        }
+
         private string EnterTag(string str, long address, out bool tagEntered, out uint defaultValue)
         {
             // TODO: also pausing here in a bit hacky way
@@ -1454,13 +1594,14 @@ namespace Emul8.Peripherals.Bus
         private Endianess endianess;
         private readonly Dictionary<ICPU, int> idByCpu;
         private readonly Dictionary<int, ICPU> cpuById;
-        private readonly Dictionary<long, List<BusHookHandler>> hooksOnRead;
-        private readonly Dictionary<long, List<BusHookHandler>> hooksOnWrite;
+        private readonly WatchpointIndex hooksOnRead;
+        private readonly WatchpointIndex hooksOnWrite;
 
         [Constructor]
         private ThreadLocal<int> cachedCpuId;
         private object cpuSync;
         private Dictionary<Range, TagEntry> tags;
+        private List<ValueTagEntry> valueTags;
         private List<SVDParser> svdDevices;
         private HashSet<string> pausingTags;
         private readonly List<BinaryFingerprint> binaryFingerprints;
@@ -1470,6 +1611,8 @@ namespace Emul8.Peripherals.Bus
         private const string IOExceptionMessage = "I/O error while loading ELF: {0}.";
         private const string CantFindCpuIdMessage = "Can't verify current CPU in the given context.";
         private const bool Overlap = true;
+        // the smallest page of supported cores; marking the same page several times is harmless
+        private const long WatchpointPageGranularity = 1 << 10;
         // TODO
 
         private int unexpectedReads;
@@ -1489,6 +1632,13 @@ namespace Emul8.Peripherals.Bus
             public uint DefaultValue;
         }
 
+        private struct ValueTagEntry
+        {
+            public Range Range;
+            public string Name;
+            public uint[] Values;
+        }
+
         private class MappedSegmentWrapper : IMappedSegment
         {
             public MappedSegmentWrapper(IMappedSegment wrappedSegment, long peripheralOffset, long maximumSize)
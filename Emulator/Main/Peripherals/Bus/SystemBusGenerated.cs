@@ -22,7 +22,7 @@ namespace Emul8.Peripherals.Bus
         {
             long startAddress, endAddress;
 
-            InvokeWatchpointHooks(hooksOnRead, address, Width.Byte);
+            hooksOnRead.Invoke(address, Width.Byte);
 
             var accessMethods = peripherals.FindAccessMethods(address, out startAddress, out endAddress);
             if (accessMethods == null)
@@ -56,7 +56,7 @@ namespace Emul8.Peripherals.Bus
             if (accessMethods == null)
             {
                 ReportNonExistingWrite(address, value, "Byte");
-                InvokeWatchpointHooks(hooksOnWrite, address, Width.Byte);
+                hooksOnWrite.Invoke(address, Width.Byte);
                 return;
             }
             var lockTaken = false;
@@ -68,7 +68,7 @@ namespace Emul8.Peripherals.Bus
                     accessMethods.SetAbsoluteAddress(address);
                 }
                 accessMethods.WriteByte(address - startAddress, value);
-                InvokeWatchpointHooks(hooksOnWrite, address, Width.Byte);
+                hooksOnWrite.Invoke(address, Width.Byte);
             }
             finally
             {
@@ -83,7 +83,7 @@ namespace Emul8.Peripherals.Bus
         {
             long startAddress, endAddress;
 
-            InvokeWatchpointHooks(hooksOnRead, address, Width.Word);
+            hooksOnRead.Invoke(address, Width.Word);
 
             var accessMethods = peripherals.FindAccessMethods(address, out startAddress, out endAddress);
             if (accessMethods == null)
@@ -117,7 +117,7 @@ namespace Emul8.Peripherals.Bus
             if (accessMethods == null)
             {
                 ReportNonExistingWrite(address, value, "Word");
-                InvokeWatchpointHooks(hooksOnWrite, address, Width.Word);
+                hooksOnWrite.Invoke(address, Width.Word);
                 return;
             }
             var lockTaken = false;
@@ -129,7 +129,7 @@ namespace Emul8.Peripherals.Bus
                     accessMethods.SetAbsoluteAddress(address);
                 }
                 accessMethods.WriteWord(address - startAddress, value);
-                InvokeWatchpointHooks(hooksOnWrite, address, Width.Word);
+                hooksOnWrite.Invoke(address, Width.Word);
             }
             finally
             {
@@ -144,7 +144,7 @@ namespace Emul8.Peripherals.Bus
         {
             long startAddress, endAddress;
 
-            InvokeWatchpointHooks(hooksOnRead, address, Width.DoubleWord);
+            hooksOnRead.Invoke(address, Width.DoubleWord);
 
             var accessMethods = peripherals.FindAccessMethods(address, out startAddress, out endAddress);
             if (accessMethods == null)
@@ -178,7 +178,7 @@ namespace Emul8.Peripherals.Bus
             if (accessMethods == null)
             {
                 ReportNonExistingWrite(address, value, "DoubleWord");
-                InvokeWatchpointHooks(hooksOnWrite, address, Width.DoubleWord);
+                hooksOnWrite.Invoke(address, Width.DoubleWord);
                 return;
             }
             var lockTaken = false;
@@ -190,7 +190,7 @@ namespace Emul8.Peripherals.Bus
                     accessMethods.SetAbsoluteAddress(address);
                 }
                 accessMethods.WriteDoubleWord(address - startAddress, value);
-                InvokeWatchpointHooks(hooksOnWrite, address, Width.DoubleWord);
+                hooksOnWrite.Invoke(address, Width.DoubleWord);
             }
             finally
             {
@@ -0,0 +1,310 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Emul8.Core;
+
+namespace Emul8.Peripherals.Bus
+{
+    /// <summary>
+    /// Stores watchpoints on address ranges and on address patterns (addresses for which `address &amp; mask == value`).
+    /// Ranges are split into disjoint segments, so that a lookup is a binary search; patterns are expected to be few and are checked one by one.
+    /// The lookup structure is rebuilt by the first lookup after a modification and swapped atomically, so that adding many watchpoints is cheap
+    /// and lookups take a lock only when they rebuild.
+    /// </summary>
+    internal class WatchpointIndex
+    {
+        public WatchpointIndex()
+        {
+            ranges = new List<RangeEntry>();
+            patterns = new List<PatternEntry>();
+            sync = new object();
+            lookup = Lookup.Empty;
+        }
+
+        public static IEnumerable<long> GetRangeBlocks(long start, long end, Range range, long blockSize)
+        {
+            var blockMask = ~(blockSize - 1);
+            var first = Math.Max(start, range.StartAddress) & blockMask;
+            var last = Math.Min(end, range.EndAddress);
+            for(var block = first; block <= last && block >= first; block += blockSize)
+            {
+                yield return block;
+            }
+        }
+
+        public static IEnumerable<long> GetPatternBlocks(long value, long mask, Range range, long blockSize)
+        {
+            // a block can contain a matching address if it agrees with the pattern on bits above the block offset
+            var blockMask = ~(blockSize - 1);
+            var blockPatternMask = mask & blockMask;
+            var first = range.StartAddress & blockMask;
+            for(var block = first; block <= range.EndAddress && block >= first; block += blockSize)
+            {
+                if((block & blockPatternMask) == (value & blockPatternMask))
+                {
+                    yield return block;
+                }
+            }
+        }
+
+        public void AddRange(long start, long end, BusHookHandler handler)
+        {
+            lock(sync)
+            {
+                ranges.Add(new RangeEntry { Start = start, End = end, Handler = handler });
+                lookup = null;
+            }
+        }
+
+        public void AddPattern(long value, long mask, BusHookHandler handler)
+        {
+            lock(sync)
+            {
+                patterns.Add(new PatternEntry { Value = value & mask, Mask = mask, Handler = handler });
+                lookup = null;
+            }
+        }
+
+        /// <summary>
+        /// Removes handlers of the given action (or all handlers if it is null) registered for exactly this range.
+        /// </summary>
+        public void RemoveRange(long start, long end, Action<long, Width> action)
+        {
+            lock(sync)
+            {
+                ranges.RemoveAll(x => x.Start == start && x.End == end && (action == null || x.Handler.ContainsAction(action)));
+                lookup = null;
+            }
+        }
+
+        public void RemovePattern(long value, long mask, Action<long, Width> action)
+        {
+            lock(sync)
+            {
+                patterns.RemoveAll(x => x.Value == (value & mask) && x.Mask == mask && (action == null || x.Handler.ContainsAction(action)));
+                lookup = null;
+            }
+        }
+
+        public void Clear()
+        {
+            lock(sync)
+            {
+                ranges.Clear();
+                patterns.Clear();
+                lookup = Lookup.Empty;
+            }
+        }
+
+        public bool Contains(long address)
+        {
+            var current = lookup ?? Rebuild();
+            // the common case of an access far from any watchpoint costs two comparisons
+            if(address < current.LowestAddress || address > current.HighestAddress)
+            {
+                return false;
+            }
+            if(current.FindSegment(address) != null)
+            {
+                return true;
+            }
+            foreach(var pattern in current.Patterns)
+            {
+                if((address & pattern.Mask) == pattern.Value)
+                {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        public void Invoke(long address, Width width)
+        {
+            var current = lookup ?? Rebuild();
+            if(address < current.LowestAddress || address > current.HighestAddress)
+            {
+                return;
+            }
+            var handlers = current.FindSegment(address);
+            if(handlers != null)
+            {
+                foreach(var handler in handlers)
+                {
+                    handler.Invoke(address, width);
+                }
+            }
+            foreach(var pattern in current.Patterns)
+            {
+                if((address & pattern.Mask) == pattern.Value)
+                {
+                    pattern.Handler.Invoke(address, width);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Returns starts of all blocks of the given size, within the given range, that contain a watched address.
+        /// </summary>
+        public IEnumerable<long> GetWatchedBlocks(Range range, long blockSize)
+        {
+            lock(sync)
+            {
+                return ranges.SelectMany(x => GetRangeBlocks(x.Start, x.End, range, blockSize))
+                    .Concat(patterns.SelectMany(x => GetPatternBlocks(x.Value, x.Mask, range, blockSize))).ToList();
+            }
+        }
+
+        public bool IsEmpty
+        {
+            get
+            {
+                lock(sync)
+                {
+                    return ranges.Count == 0 && patterns.Count == 0;
+                }
+            }
+        }
+
+        private Lookup Rebuild()
+        {
+            lock(sync)
+            {
+                if(lookup == null)
+                {
+                    lookup = BuildLookup();
+                }
+                return lookup;
+            }
+        }
+
+        private Lookup BuildLookup()
+        {
+            var result = new Lookup();
+            result.Patterns = patterns.ToArray();
+
+            // boundaries of disjoint segments, each of them covered by the same set of ranges
+            var boundaries = new SortedSet<long>();
+            foreach(var range in ranges)
+            {
+                boundaries.Add(range.Start);
+                if(range.End != long.MaxValue)
+                {
+                    boundaries.Add(range.End + 1);
+                }
+            }
+            // stable sorting keeps handlers of the same range in the order of registration
+            var byStart = ranges.OrderBy(x => x.Start).ToList();
+            var active = new List<RangeEntry>();
+            var starts = new List<long>();
+            var ends = new List<long>();
+            var handlers = new List<BusHookHandler[]>();
+            var points = boundaries.ToArray();
+            var next = 0;
+            for(var i = 0; i < points.Length; i++)
+            {
+                var position = points[i];
+                active.RemoveAll(x => x.End < position);
+                while(next < byStart.Count && byStart[next].Start == position)
+                {
+                    active.Add(byStart[next++]);
+                }
+                if(active.Count == 0)
+                {
+                    continue;
+                }
+                starts.Add(position);
+                ends.Add(i + 1 < points.Length ? points[i + 1] - 1 : long.MaxValue);
+                handlers.Add(active.Select(x => x.Handler).ToArray());
+            }
+            result.SegmentStarts = starts.ToArray();
+            result.SegmentEnds = ends.ToArray();
+            result.SegmentHandlers = handlers.ToArray();
+
+            result.LowestAddress = long.MaxValue;
+            result.HighestAddress = long.MinValue;
+            if(starts.Count > 0)
+            {
+                result.LowestAddress = starts[0];
+                result.HighestAddress = ends[ends.Count - 1];
+            }
+            foreach(var pattern in patterns)
+            {
+                // the lowest matching address has all other bits cleared, the highest one has them set
+                result.LowestAddress = Math.Min(result.LowestAddress, pattern.Value);
+                result.HighestAddress = Math.Max(result.HighestAddress, pattern.Value | (~pattern.Mask & long.MaxValue));
+            }
+            return result;
+        }
+
+        private volatile Lookup lookup;
+        private readonly List<RangeEntry> ranges;
+        private readonly List<PatternEntry> patterns;
+        private readonly object sync;
+
+        private class Lookup
+        {
+            public static readonly Lookup Empty = new Lookup
+            {
+                LowestAddress = long.MaxValue,
+                HighestAddress = long.MinValue,
+                SegmentStarts = new long[0],
+                SegmentEnds = new long[0],
+                SegmentHandlers = new BusHookHandler[0][],
+                Patterns = new PatternEntry[0]
+            };
+
+            public BusHookHandler[] FindSegment(long address)
+            {
+                // index of the last segment starting at or before the address
+                var low = 0;
+                var high = SegmentStarts.Length - 1;
+                while(low <= high)
+                {
+                    var middle = low + ((high - low) >> 1);
+                    if(SegmentStarts[middle] <= address)
+                    {
+                        low = middle + 1;
+                    }
+                    else
+                    {
+                        high = middle - 1;
+                    }
+                }
+                var index = high;
+                if(index < 0 || address > SegmentEnds[index])
+                {
+                    return null;
+                }
+                return SegmentHandlers[index];
+            }
+
+            public long LowestAddress;
+            public long HighestAddress;
+            public long[] SegmentStarts;
+            public long[] SegmentEnds;
+            public BusHookHandler[][] SegmentHandlers;
+            public PatternEntry[] Patterns;
+        }
+
+        private class RangeEntry
+        {
+            public long Start;
+            public long End;
+            public BusHookHandler Handler;
+        }
+
+        private class PatternEntry
+        {
+            public long Value;
+            public long Mask;
+            public BusHookHandler Handler;
+        }
+    }
+}
@@ -11,6 +11,7 @@ using Emul8.Peripherals.Bus;
 using Antmicro.Migrant.Hooks;
 using Antmicro.Migrant;
 using System.Linq;
+using System.Text.RegularExpressions;
 using Emul8.Core;
 
 namespace Emul8.Peripherals.Python
@@ -35,18 +36,37 @@ namespace Emul8.Peripherals.Python
             "size",
             "logger",
             "LogLevel",
+            ReadHandlerName,
+            WriteHandlerName,
+            InitHandlerName,
+            "log",
+            "is_enabled",
             Machine.MachineKeyword
         };
 
+        // message is formatted only if it is going to be logged
+        private readonly static string[] LoggingHelpers =
+        {
+            "def is_enabled(level):",
+            "    return self.IsLogLevelEnabled(level)",
+            "def log(level, message, *args):",
+            "    if self.IsLogLevelEnabled(level):",
+            "        self.Log(level, message % args if args else message)",
+        };
+
         private void InitScope(ScriptSource script)
         {
             Request = new PythonRequest();
 
             Scope.SetVariable("request", Request);
-            Scope.SetVariable("self", peripheral);
+            Scope.SetVariable("self", peripheral.Owner);
             Scope.SetVariable("size", peripheral.Size);
+            GetCompiledCode(Aggregate(LoggingHelpers)).Execute(Scope);
 
             source = script;
+            compiledCode = null;
+            handlersLoaded = false;
+            HasRequestHandlers = RequestHandlerDefinition.IsMatch(source.GetCode());
         }
 
         public PeripheralPythonEngine(PythonPeripheral peripheral)
@@ -71,7 +91,73 @@ namespace Emul8.Peripherals.Python
 
         public void ExecuteCode()
         {
-            source.Execute(Scope);
+            // the script is compiled lazily, so that syntax errors are reported on access as before
+            if(compiledCode == null)
+            {
+                compiledCode = source.Compile();
+            }
+            Execute(compiledCode);
+        }
+
+        public void LoadRequestHandlers()
+        {
+            if(handlersLoaded)
+            {
+                return;
+            }
+            // module body of a script with request handlers is executed only once, to define them
+            ExecuteCode();
+            Scope.TryGetVariable(ReadHandlerName, out readHandler);
+            Scope.TryGetVariable(WriteHandlerName, out writeHandler);
+            Scope.TryGetVariable(InitHandlerName, out initHandler);
+            handlersLoaded = true;
+        }
+
+        public void CallInitHandler()
+        {
+            LoadRequestHandlers();
+            if(initHandler == null)
+            {
+                return;
+            }
+            if(!PythonEngineProfiler.Enabled)
+            {
+                initHandler();
+                return;
+            }
+            Profile(initHandler);
+        }
+
+        public uint CallReadHandler(long offset, int length)
+        {
+            LoadRequestHandlers();
+            if(readHandler == null)
+            {
+                return 0;
+            }
+            return ToUInt32(PythonEngineProfiler.Enabled ? ProfiledRead(offset, length) : readHandler(offset, length));
+        }
+
+        public void CallWriteHandler(long offset, int length, uint value)
+        {
+            LoadRequestHandlers();
+            if(writeHandler == null)
+            {
+                return;
+            }
+            if(!PythonEngineProfiler.Enabled)
+            {
+                writeHandler(offset, length, value);
+                return;
+            }
+            ProfiledWrite(offset, length, value);
+        }
+
+        public bool HasRequestHandlers { get; private set; }
+
+        protected internal override object ProfilingOwner
+        {
+            get { return peripheral.Owner; }
         }
 
         public void SetSysbusAndMachine(SystemBus bus)
@@ -80,14 +166,45 @@ namespace Emul8.Peripherals.Python
             Scope.SetVariable(Machine.MachineKeyword, bus.Machine);
         }
 
+        // profiled calls are separate methods, as closures over the arguments would be allocated on every access otherwise
+        private object ProfiledRead(long offset, int length)
+        {
+            return Profile(() => readHandler(offset, length));
+        }
+
+        private void ProfiledWrite(long offset, int length, uint value)
+        {
+            Profile(() => writeHandler(offset, length, value));
+        }
+
         [Transient]
         private ScriptSource source;
 
+        [Transient]
+        private CompiledCode compiledCode;
+
+        [Transient]
+        private Func<long, int, object> readHandler;
+
+        [Transient]
+        private Action<long, int, long> writeHandler;
+
+        [Transient]
+        private Action initHandler;
+
+        [Transient]
+        private bool handlersLoaded;
+
         protected override void Init()
         {
             base.Init();
             InitScope(Engine.CreateScriptSourceFromString(codeContent));
             codeContent = null;
+            if(HasRequestHandlers)
+            {
+                // handlers have to be defined before the serialized state of the script is restored over them
+                LoadRequestHandlers();
+            }
         }
 
         #region Serialization
@@ -123,8 +240,19 @@ namespace Emul8.Peripherals.Python
             }
         }
 
+        private uint ToUInt32(object value)
+        {
+            // python integers can be either Int32 or BigInteger, depending on their value
+            return value == null ? 0 : unchecked((uint)Engine.Operations.ConvertTo<long>(value));
+        }
+
         private readonly PythonPeripheral peripheral;
 
+        private const string ReadHandlerName = "on_read";
+        private const string WriteHandlerName = "on_write";
+        private const string InitHandlerName = "on_init";
+        private static readonly Regex RequestHandlerDefinition = new Regex(@"^def\s+on_(read|write|init)\s*\(", RegexOptions.Multiline);
+
         // naming convention here is pythonic
         public class PythonRequest
         {
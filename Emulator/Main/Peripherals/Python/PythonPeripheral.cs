@@ -39,13 +39,34 @@ namespace Emul8.Peripherals.Python
                 @this.SetLocalName(pyDev, name);
             }
         }
+
+        public static void PyDevFromRegisterMap(this Machine @this, string path, long address, int size, string scriptPath = null, bool initable = false, string name = null, long offset = 0)
+        {
+            if(!File.Exists(path))
+            {
+                throw new ConstructionException(string.Format("Could not find register map file: {0}.", path));
+            }
+            var pyDev = new RegisterMapPeripheral(size, File.ReadAllText(path), filename: scriptPath, initable: initable);
+            @this.SystemBus.Register(pyDev, new BusPointRegistration(address, offset));
+            if(!string.IsNullOrEmpty(name))
+            {
+                @this.SetLocalName(pyDev, name);
+            }
+        }
     }
 
     [Icon("python")]
     public class PythonPeripheral : IBytePeripheral, IWordPeripheral, IDoubleWordPeripheral, IKnownSize, IAbsoluteAddressAware
     {
-        public PythonPeripheral(int size, bool initable = false, string script = null, string filename = null) 
+        public PythonPeripheral(int size, bool initable = false, string script = null, string filename = null) : this(size, initable, script, filename, null)
+        {
+        }
+
+        /// <param name="owner">Peripheral registered on the machine on behalf of which the script runs; its machine is available to the script
+        /// and it is the source of logged messages.</param>
+        internal PythonPeripheral(int size, bool initable, string script, string filename, IPeripheral owner)
         {
+            this.owner = owner ?? this;
             this.size = size;
             this.initable = initable;
             this.script = script;
@@ -76,41 +97,32 @@ namespace Emul8.Peripherals.Python
 
         public byte ReadByte(long offset)
         {
-            pythonRunner.Request.length = 1;
-            HandleRead(offset);
-            return unchecked((byte)pythonRunner.Request.value);
+            return unchecked((byte)HandleRead(offset, 1));
         }
 
         public void WriteByte(long offset, byte value)
         {
-            pythonRunner.Request.length = 1;
-            HandleWrite(offset, value);
+            HandleWrite(offset, 1, value);
         }
 
         public uint ReadDoubleWord(long offset)
         {
-            pythonRunner.Request.length = 4;
-            HandleRead(offset);
-            return unchecked(pythonRunner.Request.value);
+            return HandleRead(offset, 4);
         }
 
         public void WriteDoubleWord(long offset, uint value)
         {
-            pythonRunner.Request.length = 4;
-            HandleWrite(offset, value);
+            HandleWrite(offset, 4, value);
         }
 
         public ushort ReadWord(long offset)
         {
-            pythonRunner.Request.length = 2;
-            HandleRead(offset);
-            return unchecked((ushort)pythonRunner.Request.value);
+            return unchecked((ushort)HandleRead(offset, 2));
         }
 
         public void WriteWord(long offset, ushort value)
         {
-            pythonRunner.Request.length = 2;
-            HandleWrite(offset, value);
+            HandleWrite(offset, 2, value);
         }
 
         public void Reset()
@@ -129,7 +141,7 @@ namespace Emul8.Peripherals.Python
             if(!inited)
             {
                 Machine mach;
-                if(EmulationManager.Instance.CurrentEmulation.TryGetMachineForPeripheral(this, out mach))
+                if(EmulationManager.Instance.CurrentEmulation.TryGetMachineForPeripheral(owner, out mach))
                 {
                     pythonRunner.SetSysbusAndMachine(mach.SystemBus);
                 }
@@ -139,6 +151,14 @@ namespace Emul8.Peripherals.Python
             }
         }
 
+        internal IPeripheral Owner
+        {
+            get
+            {
+                return owner;
+            }
+        }
+
         public string Code
         {
             get
@@ -149,27 +169,67 @@ namespace Emul8.Peripherals.Python
 
         private void Init()
         {
-            if(initable)
+            if(pythonRunner.HasRequestHandlers)
+            {
+                try
+                {
+                    pythonRunner.CallInitHandler();
+                }
+                catch(Exception e) when(IsScriptError(e))
+                {
+                    LogScriptError(e);
+                }
+            }
+            else if(initable)
             {
                 pythonRunner.Request.type = PeripheralPythonEngine.PythonRequest.RequestType.INIT;
                 Execute();
             }
         }
 
-        private void HandleRead(long offset)
+        private uint HandleRead(long offset, byte length)
         {
             EnsureInit();
 
+            if(pythonRunner.HasRequestHandlers)
+            {
+                try
+                {
+                    return pythonRunner.CallReadHandler(offset, length);
+                }
+                catch(Exception e) when(IsScriptError(e))
+                {
+                    LogScriptError(e);
+                    return 0;
+                }
+            }
+
+            pythonRunner.Request.length = length;
             pythonRunner.Request.value = 0;
             pythonRunner.Request.type = PeripheralPythonEngine.PythonRequest.RequestType.READ;
             pythonRunner.Request.offset = offset;
             Execute();
+            return pythonRunner.Request.value;
         }
 
-        private void HandleWrite(long offset, uint value)
+        private void HandleWrite(long offset, byte length, uint value)
         {
             EnsureInit();
 
+            if(pythonRunner.HasRequestHandlers)
+            {
+                try
+                {
+                    pythonRunner.CallWriteHandler(offset, length, value);
+                }
+                catch(Exception e) when(IsScriptError(e))
+                {
+                    LogScriptError(e);
+                }
+                return;
+            }
+
+            pythonRunner.Request.length = length;
             pythonRunner.Request.value = value;
             pythonRunner.Request.type = PeripheralPythonEngine.PythonRequest.RequestType.WRITE;
             pythonRunner.Request.offset = offset;
@@ -182,22 +242,26 @@ namespace Emul8.Peripherals.Python
             {
                 pythonRunner.ExecuteCode();
             }
-            catch(Exception e)
+            catch(Exception e) when(IsScriptError(e))
             {
-                if(e is SyntaxErrorException || e is UnboundNameException || e is MissingMemberException)
-                {
-                    this.Log(LogLevel.Error, "Python peripheral error: " + e.Message);
-                }
-                else
-                {
-                    throw;
-                }
+                LogScriptError(e);
             }
         }
 
+        private static bool IsScriptError(Exception e)
+        {
+            return e is SyntaxErrorException || e is UnboundNameException || e is MissingMemberException;
+        }
+
+        private void LogScriptError(Exception e)
+        {
+            owner.Log(LogLevel.Error, "Python peripheral error: " + e.Message);
+        }
+
         private bool inited;
 
         private readonly PeripheralPythonEngine pythonRunner;
+        private readonly IPeripheral owner;
         private readonly bool initable;
         private readonly int size;
         private readonly string script;
@@ -0,0 +1,315 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+using Emul8.Exceptions;
+using Emul8.Logging;
+using Emul8.Peripherals.Bus;
+using Emul8.UserInterface;
+
+namespace Emul8.Peripherals.Python
+{
+    /// <summary>
+    /// Serves registers described by a register map directly, without calling the Python interpreter.
+    /// Each line of the map describes one register:
+    ///     OFFSET WIDTH RESET [read_mask=MASK] [write_mask=MASK] [w1c_mask=MASK] [scripted]
+    /// Accesses to registers marked as `scripted` are passed to a Python script, as in <see cref="PythonPeripheral"/>.
+    /// Accesses wider than the rest of the register are truncated to the register.
+    /// Empty lines and lines starting with '#' are ignored.
+    /// </summary>
+    [Icon("python")]
+    public class RegisterMapPeripheral : IBytePeripheral, IWordPeripheral, IDoubleWordPeripheral, IKnownSize, IAbsoluteAddressAware
+    {
+        public RegisterMapPeripheral(int size, string registerMap, string script = null, string filename = null, bool initable = false)
+        {
+            this.size = size;
+            var registers = ParseRegisterMap(registerMap).OrderBy(x => x.Offset).ToArray();
+            for(var i = 1; i < registers.Length; i++)
+            {
+                if(registers[i - 1].Offset + registers[i - 1].Width > registers[i].Offset)
+                {
+                    throw new ConstructionException(string.Format("Register at offset 0x{0:X} overlaps with the previous one.", registers[i].Offset));
+                }
+            }
+
+            // registers are kept in parallel arrays sorted by offset
+            offsets = registers.Select(x => x.Offset).ToArray();
+            widths = registers.Select(x => x.Width).ToArray();
+            widthMasks = registers.Select(x => x.Width == 4 ? uint.MaxValue : (1u << (8 * x.Width)) - 1).ToArray();
+            resetValues = registers.Select((x, i) => x.ResetValue & widthMasks[i]).ToArray();
+            readMasks = registers.Select(x => x.ReadMask).ToArray();
+            writeMasks = registers.Select(x => x.WriteMask).ToArray();
+            writeOneToClearMasks = registers.Select(x => x.WriteOneToClearMask).ToArray();
+            scripted = registers.Select(x => x.Scripted).ToArray();
+            values = new uint[registers.Length];
+            Array.Copy(resetValues, values, values.Length);
+
+            if(scripted.Any(x => x))
+            {
+                if(script == null && filename == null)
+                {
+                    throw new ConstructionException("Register map contains scripted registers, but no script was given.");
+                }
+                scriptedPeripheral = new PythonPeripheral(size, initable, script, filename, this);
+            }
+        }
+
+        public void SetAbsoluteAddress(long address)
+        {
+            if(scriptedPeripheral != null)
+            {
+                scriptedPeripheral.SetAbsoluteAddress(address);
+            }
+        }
+
+        public byte ReadByte(long offset)
+        {
+            int index;
+            if(!TryFindRegister(offset, out index))
+            {
+                this.LogUnhandledRead(offset);
+                return 0;
+            }
+            return unchecked((byte)(scripted[index] ? scriptedPeripheral.ReadByte(offset) & GetAccessMask(index, offset) : Read(index, offset)));
+        }
+
+        public void WriteByte(long offset, byte value)
+        {
+            int index;
+            if(!TryFindRegister(offset, out index))
+            {
+                this.LogUnhandledWrite(offset, value);
+                return;
+            }
+            if(scripted[index])
+            {
+                scriptedPeripheral.WriteByte(offset, unchecked((byte)(value & GetAccessMask(index, offset))));
+                return;
+            }
+            Write(index, offset, 1, value);
+        }
+
+        public ushort ReadWord(long offset)
+        {
+            int index;
+            if(!TryFindRegister(offset, out index))
+            {
+                this.LogUnhandledRead(offset);
+                return 0;
+            }
+            return unchecked((ushort)(scripted[index] ? scriptedPeripheral.ReadWord(offset) & GetAccessMask(index, offset) : Read(index, offset)));
+        }
+
+        public void WriteWord(long offset, ushort value)
+        {
+            int index;
+            if(!TryFindRegister(offset, out index))
+            {
+                this.LogUnhandledWrite(offset, value);
+                return;
+            }
+            if(scripted[index])
+            {
+                scriptedPeripheral.WriteWord(offset, unchecked((ushort)(value & GetAccessMask(index, offset))));
+                return;
+            }
+            Write(index, offset, 2, value);
+        }
+
+        public uint ReadDoubleWord(long offset)
+        {
+            int index;
+            if(!TryFindRegister(offset, out index))
+            {
+                this.LogUnhandledRead(offset);
+                return 0;
+            }
+            return scripted[index] ? scriptedPeripheral.ReadDoubleWord(offset) & GetAccessMask(index, offset) : Read(index, offset);
+        }
+
+        public void WriteDoubleWord(long offset, uint value)
+        {
+            int index;
+            if(!TryFindRegister(offset, out index))
+            {
+                this.LogUnhandledWrite(offset, value);
+                return;
+            }
+            if(scripted[index])
+            {
+                scriptedPeripheral.WriteDoubleWord(offset, value & GetAccessMask(index, offset));
+                return;
+            }
+            Write(index, offset, 4, value);
+        }
+
+        public void Reset()
+        {
+            Array.Copy(resetValues, values, values.Length);
+            if(scriptedPeripheral != null)
+            {
+                scriptedPeripheral.Reset();
+            }
+        }
+
+        public long Size
+        {
+            get { return size; }
+        }
+
+        private uint Read(int index, long offset)
+        {
+            return (values[index] & readMasks[index] & widthMasks[index]) >> (int)(8 * (offset - offsets[index]));
+        }
+
+        private void Write(int index, long offset, int length, uint value)
+        {
+            var shift = (int)(8 * (offset - offsets[index]));
+            // bytes of the access beyond the register are dropped, they do not spill into the next one
+            var accessMask = ((length == 4 ? uint.MaxValue : (1u << (8 * length)) - 1) << shift) & widthMasks[index];
+            var shiftedValue = (value << shift) & accessMask;
+            var clearMask = shiftedValue & writeOneToClearMasks[index];
+            var writableMask = writeMasks[index] & ~writeOneToClearMasks[index] & accessMask;
+            values[index] = ((values[index] & ~writableMask) | (shiftedValue & writableMask)) & ~clearMask;
+        }
+
+        /// <summary>
+        /// Returns the mask of bits of an access at the given offset that fall within the register.
+        /// </summary>
+        private uint GetAccessMask(int index, long offset)
+        {
+            return widthMasks[index] >> (int)(8 * (offset - offsets[index]));
+        }
+
+        private bool TryFindRegister(long offset, out int index)
+        {
+            index = Array.BinarySearch(offsets, offset);
+            if(index < 0)
+            {
+                // the register containing the offset is the one starting right below it
+                index = ~index - 1;
+                if(index < 0 || offset >= offsets[index] + widths[index])
+                {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        private static IEnumerable<RegisterDefinition> ParseRegisterMap(string registerMap)
+        {
+            var lineNumber = 0;
+            foreach(var rawLine in registerMap.Split('\n'))
+            {
+                lineNumber++;
+                var line = rawLine.Trim();
+                if(line.Length == 0 || line.StartsWith("#", StringComparison.Ordinal))
+                {
+                    continue;
+                }
+                var tokens = line.Split(new[] { ' ', '\t' }, StringSplitOptions.RemoveEmptyEntries);
+                if(tokens.Length < 3)
+                {
+                    throw new ConstructionException(string.Format("Line {0} of the register map should contain at least offset, width and reset value.", lineNumber));
+                }
+                var offset = ParseNumber(tokens[0], lineNumber);
+                if(offset < 0)
+                {
+                    throw new ConstructionException(string.Format("Line {0} of the register map: offset cannot be negative.", lineNumber));
+                }
+                var width = ParseNumber(tokens[1], lineNumber);
+                if(width != 1 && width != 2 && width != 4)
+                {
+                    throw new ConstructionException(string.Format("Line {0} of the register map: width has to be 1, 2 or 4.", lineNumber));
+                }
+                var register = new RegisterDefinition
+                {
+                    Offset = offset,
+                    Width = (int)width,
+                    ResetValue = ParseValue(tokens[2], lineNumber),
+                    ReadMask = uint.MaxValue,
+                    WriteMask = uint.MaxValue
+                };
+                if(width < 4 && register.ResetValue >> (int)(8 * width) != 0)
+                {
+                    throw new ConstructionException(string.Format("Line {0} of the register map: reset value '{1}' does not fit in {2} bytes.", lineNumber, tokens[2], width));
+                }
+                foreach(var option in tokens.Skip(3))
+                {
+                    var parts = option.Split('=');
+                    switch(parts[0])
+                    {
+                    case "scripted":
+                        register.Scripted = true;
+                        break;
+                    case "read_mask":
+                        register.ReadMask = ParseValue(parts.Last(), lineNumber);
+                        break;
+                    case "write_mask":
+                        register.WriteMask = ParseValue(parts.Last(), lineNumber);
+                        break;
+                    case "w1c_mask":
+                        register.WriteOneToClearMask = ParseValue(parts.Last(), lineNumber);
+                        break;
+                    default:
+                        throw new ConstructionException(string.Format("Line {0} of the register map: unknown option '{1}'.", lineNumber, option));
+                    }
+                }
+                yield return register;
+            }
+        }
+
+        private static long ParseNumber(string token, int lineNumber)
+        {
+            long result;
+            var parsed = token.StartsWith("0x", StringComparison.OrdinalIgnoreCase)
+                ? long.TryParse(token.Substring(2), NumberStyles.HexNumber, CultureInfo.InvariantCulture, out result)
+                : long.TryParse(token, NumberStyles.Integer, CultureInfo.InvariantCulture, out result);
+            if(!parsed)
+            {
+                throw new ConstructionException(string.Format("Line {0} of the register map: could not parse number '{1}'.", lineNumber, token));
+            }
+            return result;
+        }
+
+        private static uint ParseValue(string token, int lineNumber)
+        {
+            var result = ParseNumber(token, lineNumber);
+            if(result < 0 || result > uint.MaxValue)
+            {
+                throw new ConstructionException(string.Format("Line {0} of the register map: value '{1}' does not fit in 32 bits.", lineNumber, token));
+            }
+            return (uint)result;
+        }
+
+        private readonly long[] offsets;
+        private readonly int[] widths;
+        private readonly uint[] widthMasks;
+        private readonly uint[] resetValues;
+        private readonly uint[] readMasks;
+        private readonly uint[] writeMasks;
+        private readonly uint[] writeOneToClearMasks;
+        private readonly bool[] scripted;
+        private readonly uint[] values;
+        private readonly PythonPeripheral scriptedPeripheral;
+        private readonly int size;
+
+        private struct RegisterDefinition
+        {
+            public long Offset;
+            public int Width;
+            public uint ResetValue;
+            public uint ReadMask;
+            public uint WriteMask;
+            public uint WriteOneToClearMask;
+            public bool Scripted;
+        }
+    }
+}
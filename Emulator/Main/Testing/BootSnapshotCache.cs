@@ -0,0 +1,221 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.RegularExpressions;
+using System.Threading;
+using Emul8.Core;
+using Emul8.Exceptions;
+using Emul8.Logging;
+using Emul8.Peripherals.UART;
+using Emul8.Utilities;
+
+namespace Emul8.Testing
+{
+    /// <summary>
+    /// Stores snapshots of emulations booted up to a given point, so that tests booting the same scenario
+    /// can start from the snapshot instead of booting again.
+    /// Snapshots are keyed by contents of the scenario, all files it references (binaries, platforms, included scripts)
+    /// and the emulator binaries, so they are invalidated automatically when any of these change.
+    /// </summary>
+    public class BootSnapshotCache
+    {
+        public BootSnapshotCache(string directory)
+        {
+            this.directory = directory;
+            Directory.CreateDirectory(directory);
+        }
+
+        public string ComputeKey(string scenarioPath)
+        {
+            var builder = new StringBuilder();
+            builder.AppendLine(EmulationManager.Instance.VersionString);
+            // serialized state depends on the layout of all emulator types, so any rebuild invalidates snapshots
+            var binaries = Directory.GetFiles(AppDomain.CurrentDomain.BaseDirectory);
+            Array.Sort(binaries, StringComparer.Ordinal);
+            foreach(var binary in binaries)
+            {
+                if(binary.EndsWith(".dll", StringComparison.Ordinal) || binary.EndsWith(".exe", StringComparison.Ordinal))
+                {
+                    var info = new FileInfo(binary);
+                    builder.AppendFormat("{0}:{1}:{2}\n", info.Name, info.Length, info.LastWriteTimeUtc.Ticks);
+                }
+            }
+            AppendInputs(Path.GetFullPath(scenarioPath), builder, new HashSet<string>());
+            using(var sha = SHA1.Create())
+            {
+                return BitConverter.ToString(sha.ComputeHash(Encoding.UTF8.GetBytes(builder.ToString()))).Replace("-", string.Empty);
+            }
+        }
+
+        public bool TryLoad(string name, string key)
+        {
+            var path = GetSnapshotPath(name, key);
+            if(!File.Exists(path))
+            {
+                return false;
+            }
+            try
+            {
+                EmulationManager.Instance.Load(path);
+                return true;
+            }
+            catch(Exception e)
+            {
+                // a snapshot that cannot be restored is of no use, the scenario will be booted again
+                Logger.Log(LogLevel.Warning, "Could not restore snapshot {0}: {1}", path, e.Message);
+                File.Delete(path);
+                EmulationManager.Instance.Clear();
+                return false;
+            }
+        }
+
+        public void Save(string name, string key)
+        {
+            var path = GetSnapshotPath(name, key);
+            foreach(var stale in Directory.GetFiles(directory, name + "-*" + SnapshotExtension))
+            {
+                // keys have a fixed length, so snapshots of other names sharing the prefix are left alone
+                if(Path.GetFileName(stale).Length == Path.GetFileName(path).Length)
+                {
+                    File.Delete(stale);
+                }
+            }
+            // suites running in parallel can save the same snapshot, so it is moved into place only when complete
+            var temporaryPath = string.Format("{0}.{1}.tmp", path, Guid.NewGuid());
+            EmulationManager.Instance.Save(temporaryPath);
+            try
+            {
+                File.Move(temporaryPath, path);
+            }
+            catch(IOException)
+            {
+                File.Delete(temporaryPath);
+            }
+        }
+
+        /// <summary>
+        /// Starts the emulation and pauses it after a line containing the marker is printed on the UART.
+        /// The emulation is paused by the CPU writing the end of the line, so that it stops right after that write
+        /// and snapshots of the same scenario are taken at the same point (for machines with a single CPU).
+        /// </summary>
+        public static bool BootUntilLine(Emulation emulation, IUART uart, string marker, TimeSpan timeout)
+        {
+            var line = new StringBuilder();
+            var reached = new ManualResetEventSlim();
+            Action<byte> handler = x =>
+            {
+                if(reached.IsSet)
+                {
+                    return;
+                }
+                if(x == 10 || x == 13)
+                {
+                    if(line.ToString().Contains(marker))
+                    {
+                        emulation.PauseAll();
+                        reached.Set();
+                    }
+                    line.Clear();
+                    return;
+                }
+                line.Append((char)x);
+            };
+            // the handler is removed before the emulation is saved, so it does not end up in the snapshot
+            uart.CharReceived += handler;
+            try
+            {
+                emulation.StartAll();
+                if(!reached.Wait(timeout))
+                {
+                    emulation.PauseAll();
+                    return false;
+                }
+                return true;
+            }
+            finally
+            {
+                uart.CharReceived -= handler;
+            }
+        }
+
+        private void AppendInputs(string path, StringBuilder builder, HashSet<string> visited)
+        {
+            if(!visited.Add(path))
+            {
+                return;
+            }
+            byte[] content;
+            try
+            {
+                content = File.ReadAllBytes(path);
+            }
+            catch(IOException e)
+            {
+                throw new RecoverableException(string.Format("Could not read {0}: {1}", path, e.Message));
+            }
+            using(var sha = SHA1.Create())
+            {
+                builder.AppendFormat("{0}:{1}\n", Path.GetFileName(path), BitConverter.ToString(sha.ComputeHash(content)));
+            }
+            // binaries are hashed only, scripts and platform descriptions are also searched for referenced files
+            if(Array.IndexOf(content, (byte)0) != -1)
+            {
+                return;
+            }
+            foreach(Match reference in FileReference.Matches(Encoding.UTF8.GetString(content)))
+            {
+                var value = reference.Groups[1].Value;
+                if(value.StartsWith("http://", StringComparison.Ordinal) || value.StartsWith("https://", StringComparison.Ordinal))
+                {
+                    // remote binaries are versioned by their names
+                    builder.AppendLine(value);
+                    continue;
+                }
+                string resolved;
+                if(TryResolve(value, Path.GetDirectoryName(path), out resolved))
+                {
+                    AppendInputs(resolved, builder, visited);
+                }
+            }
+        }
+
+        private static bool TryResolve(string reference, string currentDirectory, out string resolved)
+        {
+            string emul8Directory;
+            var candidates = new List<string> { reference, Path.Combine(currentDirectory, reference) };
+            if(Misc.TryGetEmul8Directory(out emul8Directory))
+            {
+                candidates.Add(Path.Combine(emul8Directory, reference));
+            }
+            foreach(var candidate in candidates)
+            {
+                if(File.Exists(candidate))
+                {
+                    resolved = Path.GetFullPath(candidate);
+                    return true;
+                }
+            }
+            resolved = null;
+            return false;
+        }
+
+        private string GetSnapshotPath(string name, string key)
+        {
+            return Path.Combine(directory, string.Format("{0}-{1}{2}", name, key, SnapshotExtension));
+        }
+
+        private readonly string directory;
+
+        private const string SnapshotExtension = ".snapshot";
+        private static readonly Regex FileReference = new Regex(@"@([^\s""'<>]+)");
+    }
+}
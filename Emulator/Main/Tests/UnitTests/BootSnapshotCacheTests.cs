@@ -0,0 +1,54 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System.IO;
+using Emul8.Testing;
+using NUnit.Framework;
+
+namespace UnitTests
+{
+    [TestFixture]
+    public class BootSnapshotCacheTests
+    {
+        [Test]
+        public void ShouldChangeKeyOnlyWhenReferencedFilesChange()
+        {
+            var scenario = Path.Combine(directory, "scenario");
+            var platform = Path.Combine(directory, "platform");
+            var binary = Path.Combine(directory, "binary");
+            File.WriteAllText(scenario, "mach create\ninclude @platform\nsysbus LoadELF @binary\n");
+            File.WriteAllText(platform, "cpu: CPU.ARMv7A @ sysbus\n");
+            File.WriteAllBytes(binary, new byte[] { 0x7F, 0x45, 0x4C, 0x46, 0x0, 0x1 });
+
+            var cache = new BootSnapshotCache(Path.Combine(directory, "snapshots"));
+            var key = cache.ComputeKey(scenario);
+            Assert.AreEqual(key, cache.ComputeKey(scenario));
+
+            File.WriteAllBytes(binary, new byte[] { 0x7F, 0x45, 0x4C, 0x46, 0x0, 0x2 });
+            var binaryChangedKey = cache.ComputeKey(scenario);
+            Assert.AreNotEqual(key, binaryChangedKey);
+
+            File.AppendAllText(platform, "uart: UART.PL011 @ sysbus 0x1000\n");
+            Assert.AreNotEqual(binaryChangedKey, cache.ComputeKey(scenario));
+        }
+
+        [SetUp]
+        public void SetUp()
+        {
+            directory = Path.Combine(Path.GetTempPath(), Path.GetRandomFileName());
+            Directory.CreateDirectory(directory);
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            Directory.Delete(directory, true);
+        }
+
+        private string directory;
+    }
+}
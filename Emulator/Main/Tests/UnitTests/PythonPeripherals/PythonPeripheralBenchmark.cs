@@ -0,0 +1,73 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Diagnostics;
+using Emul8.Core;
+using Emul8.Peripherals.Python;
+using NUnit.Framework;
+
+namespace UnitTests.PythonPeripherals
+{
+    [TestFixture]
+    public class PythonPeripheralBenchmark
+    {
+        [Test, Explicit("Benchmark, run manually to compare Python peripheral access throughput between builds.")]
+        public void MeasureAccessThroughput([Values(RequestScript, HandlersScript)] string script)
+        {
+            var pyDev = new PythonPeripheral(0x10, true, script: script);
+            // the first access compiles the script
+            pyDev.ReadDoubleWord(0);
+
+            var stopwatch = Stopwatch.StartNew();
+            for(var i = 0; i < AccessesCount; i++)
+            {
+                pyDev.WriteDoubleWord(0, (uint)i);
+                pyDev.ReadDoubleWord(0);
+            }
+            stopwatch.Stop();
+            Console.WriteLine("{0}: {1:0} accesses per second", script == RequestScript ? "request object" : "request handlers", 2 * AccessesCount / stopwatch.Elapsed.TotalSeconds);
+            Assert.AreEqual(2 * AccessesCount + 1, pyDev.ReadDoubleWord(0));
+        }
+
+        [SetUp]
+        public void SetUp()
+        {
+            EmulationManager.Instance.Clear();
+        }
+
+        private const int AccessesCount = 100000;
+
+        // the same counter as in scripts/pydev/counter.py, written in both supported styles
+        private const string RequestScript = @"
+if request.isInit:
+    lastVal = -1
+elif request.isRead:
+    lastVal += 1
+    request.value = lastVal
+elif request.isWrite:
+    lastVal += 1
+";
+
+        private const string HandlersScript = @"
+lastVal = -1
+
+def on_init():
+    global lastVal
+    lastVal = -1
+
+def on_read(offset, length):
+    global lastVal
+    lastVal += 1
+    return lastVal
+
+def on_write(offset, length, value):
+    global lastVal
+    lastVal += 1
+";
+    }
+}
@@ -0,0 +1,146 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using Emul8.Core;
+using Emul8.Exceptions;
+using Emul8.Peripherals.Bus;
+using Emul8.Peripherals.Memory;
+using Emul8.Peripherals.Python;
+using NUnit.Framework;
+
+namespace UnitTests.PythonPeripherals
+{
+    [TestFixture]
+    public class RegisterMapTests
+    {
+        [Test]
+        public void ShouldApplyMasksAndResetValues()
+        {
+            var map = @"
+# offset width reset
+0x0 4 0x12345678
+0x4 4 0x0 write_mask=0x0000FFFF
+0x8 4 0xFF w1c_mask=0xFF
+0xC 2 0xABCD read_mask=0x00FF
+";
+            var pyDev = new RegisterMapPeripheral(0x10, map);
+            Assert.AreEqual(0x12345678, pyDev.ReadDoubleWord(0x0));
+            Assert.AreEqual(0x34, pyDev.ReadByte(0x2));
+
+            pyDev.WriteDoubleWord(0x4, 0xFFFFFFFF);
+            Assert.AreEqual(0x0000FFFF, pyDev.ReadDoubleWord(0x4));
+
+            pyDev.WriteDoubleWord(0x8, 0x0F);
+            Assert.AreEqual(0xF0, pyDev.ReadDoubleWord(0x8));
+
+            Assert.AreEqual(0xCD, pyDev.ReadWord(0xC));
+
+            pyDev.WriteByte(0x1, 0x00);
+            Assert.AreEqual(0x12340078, pyDev.ReadDoubleWord(0x0));
+            pyDev.Reset();
+            Assert.AreEqual(0x12345678, pyDev.ReadDoubleWord(0x0));
+            Assert.AreEqual(0xFF, pyDev.ReadDoubleWord(0x8));
+        }
+
+        [Test]
+        public void ShouldPassScriptedRegistersToPython()
+        {
+            var map = @"
+0x0 4 0x1
+0x4 4 0x0 scripted
+";
+            var source = @"
+def on_read(offset, length):
+	return 0x100 + offset
+";
+            var pyDev = new RegisterMapPeripheral(0x10, map, script: source);
+            Assert.AreEqual(0x1, pyDev.ReadDoubleWord(0x0));
+            Assert.AreEqual(0x104, pyDev.ReadDoubleWord(0x4));
+            Assert.AreEqual(0x0, pyDev.ReadDoubleWord(0x8));
+        }
+
+        [Test]
+        public void ShouldTruncateAccessesWiderThanRegister()
+        {
+            var map = @"
+0x0 2 0x12345678
+0x2 2 0x0 write_mask=0x0
+0x4 1 0x0 scripted
+";
+            var source = @"
+written = 0xFFFFFFFF
+
+def on_read(offset, length):
+	return written
+
+def on_write(offset, length, value):
+	global written
+	written = value
+";
+            var pyDev = new RegisterMapPeripheral(0x10, map, script: source);
+            Assert.AreEqual(0x5678, pyDev.ReadDoubleWord(0x0));
+
+            pyDev.WriteDoubleWord(0x0, 0xAAAABBBB);
+            Assert.AreEqual(0xBBBB, pyDev.ReadDoubleWord(0x0));
+            Assert.AreEqual(0xBB, pyDev.ReadWord(0x1));
+            Assert.AreEqual(0x0, pyDev.ReadWord(0x2));
+
+            Assert.AreEqual(0xFF, pyDev.ReadDoubleWord(0x4));
+            pyDev.WriteWord(0x4, 0x1234);
+            Assert.AreEqual(0x34, pyDev.ReadDoubleWord(0x4));
+        }
+
+        [Test]
+        public void ShouldProvideMachineToScriptedRegisters()
+        {
+            var machine = new Machine();
+            EmulationManager.Instance.CurrentEmulation.AddMachine(machine, "machine");
+            var map = @"
+0x0 4 0x0 scripted
+";
+            var source = @"
+def on_read(offset, length):
+	return sysbus.ReadDoubleWord(0x1000) if machine is not None else 0
+";
+            var pyDev = new RegisterMapPeripheral(0x10, map, script: source);
+            machine.SystemBus.Register(new MappedMemory(0x1000), new BusRangeRegistration(0x1000, 0x1000));
+            machine.SystemBus.Register(pyDev, new BusRangeRegistration(0x0, 0x10));
+            machine.SystemBus.WriteDoubleWord(0x1000, 0x1234);
+
+            Assert.AreEqual(0x1234, machine.SystemBus.ReadDoubleWord(0x0));
+        }
+
+        [Test]
+        public void ShouldNotAllowOverlappingRegisters()
+        {
+            Assert.Throws<ConstructionException>(() => new RegisterMapPeripheral(0x10, "0x0 4 0x0\n0x2 2 0x0"));
+        }
+
+        [Test]
+        public void ShouldNotAllowValuesOutsideOf32Bits()
+        {
+            Assert.Throws<ConstructionException>(() => new RegisterMapPeripheral(0x10, "0x0 4 0x1FFFFFFFF"));
+            Assert.Throws<ConstructionException>(() => new RegisterMapPeripheral(0x10, "0x0 4 -1"));
+            Assert.Throws<ConstructionException>(() => new RegisterMapPeripheral(0x10, "0x0 4 0x0 read_mask=0x100000000"));
+            Assert.Throws<ConstructionException>(() => new RegisterMapPeripheral(0x10, "0x0 4 0x0 w1c_mask=-2"));
+        }
+
+        [Test]
+        public void ShouldNotAllowResetValuesWiderThanRegister()
+        {
+            Assert.Throws<ConstructionException>(() => new RegisterMapPeripheral(0x10, "0x0 2 0x10000"));
+            Assert.Throws<ConstructionException>(() => new RegisterMapPeripheral(0x10, "0x0 1 0x100"));
+            Assert.DoesNotThrow(() => new RegisterMapPeripheral(0x10, "0x0 2 0xFFFF"));
+        }
+
+        [SetUp]
+        public void SetUp()
+        {
+            EmulationManager.Instance.Clear();
+        }
+    }
+}
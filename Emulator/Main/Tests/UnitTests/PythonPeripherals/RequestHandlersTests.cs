@@ -0,0 +1,112 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System.Linq;
+using Emul8.Core;
+using Emul8.Peripherals.Python;
+using NUnit.Framework;
+
+namespace UnitTests.PythonPeripherals
+{
+    [TestFixture]
+    public class RequestHandlersTests
+    {
+        [Test]
+        public void ShouldCallReadAndWriteHandlers()
+        {
+            var source = @"
+values = {}
+
+def on_read(offset, length):
+	return values.get(offset, 0) + length
+
+def on_write(offset, length, value):
+	values[offset] = value
+";
+            var pyDev = new PythonPeripheral(100, script: source);
+            Assert.AreEqual(4, pyDev.ReadDoubleWord(0x10));
+            pyDev.WriteDoubleWord(0x10, 0x100);
+            Assert.AreEqual(0x104, pyDev.ReadDoubleWord(0x10));
+            Assert.AreEqual(0x101, pyDev.ReadByte(0x10));
+        }
+
+        [Test]
+        public void ShouldCallInitHandlerOnReset()
+        {
+            var source = @"
+value = 0
+
+def on_init():
+	global value
+	value = 0xFFFFFFFF
+
+def on_read(offset, length):
+	global value
+	value -= 1
+	return value
+";
+            var pyDev = new PythonPeripheral(100, true, script: source);
+            Assert.AreEqual(0xFFFFFFFE, pyDev.ReadDoubleWord(0));
+            Assert.AreEqual(0xFFFFFFFD, pyDev.ReadDoubleWord(0));
+            pyDev.Reset();
+            Assert.AreEqual(0xFFFFFFFE, pyDev.ReadDoubleWord(0));
+        }
+
+        [Test]
+        public void ShouldExecuteRequestStyleScriptOnEveryAccess()
+        {
+            var source = @"
+if request.isInit:
+	value = 1
+elif request.isRead:
+	value *= 2
+	request.value = value
+";
+            var pyDev = new PythonPeripheral(100, true, script: source);
+            Assert.AreEqual(2, pyDev.ReadDoubleWord(0));
+            Assert.AreEqual(4, pyDev.ReadDoubleWord(0));
+        }
+
+        [Test]
+        public void ShouldCountHandlerCallsWhenProfiling()
+        {
+            var source = @"
+def on_read(offset, length):
+	if offset == 0x10:
+		raise Exception('invalid offset')
+	return offset
+";
+            var pyDev = new PythonPeripheral(100, script: source);
+            // the first access runs the module body, which would be counted too
+            pyDev.ReadDoubleWord(0x0);
+            PythonEngineProfiler.Enabled = true;
+            try
+            {
+                pyDev.ReadDoubleWord(0x0);
+                pyDev.ReadDoubleWord(0x4);
+                // exceptions raised by the script are not script errors handled by the peripheral, they reach the caller
+                Assert.Catch(() => pyDev.ReadDoubleWord(0x10));
+            }
+            finally
+            {
+                PythonEngineProfiler.Enabled = false;
+            }
+            var counters = PythonEngineProfiler.GetCounters().Single(x => x.Kind == "PeripheralPythonEngine" && x.Invocations > 0);
+            Assert.AreEqual(3, counters.Invocations);
+            Assert.AreEqual(1, counters.Exceptions);
+
+            PythonEngineProfiler.Reset();
+            Assert.AreEqual(0, counters.Invocations);
+        }
+
+        [SetUp]
+        public void SetUp()
+        {
+            EmulationManager.Instance.Clear();
+        }
+    }
+}
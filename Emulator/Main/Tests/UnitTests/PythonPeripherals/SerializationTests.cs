@@ -92,6 +92,27 @@ if request.isRead:
             Assert.AreEqual(9, sysbus.ReadByte(0x100));
         }
 
+        [Test]
+        public void ShouldSerializePyDevWithRequestHandlers()
+        {
+            var source = @"
+counter = 0
+
+def on_init():
+	global counter
+	counter = 10
+
+def on_read(offset, length):
+	global counter
+	counter += 1
+	return counter
+";
+            var pyDev = new PythonPeripheral(100, true, script: source);
+            Assert.AreEqual(11, pyDev.ReadDoubleWord(0));
+            var copy = Serializer.DeepClone(pyDev);
+            Assert.AreEqual(12, copy.ReadDoubleWord(0));
+        }
+
         [SetUp]
         public void SetUp()
         {
@@ -18,6 +18,7 @@ using Range = Emul8.Core.Range;
 using System.Linq;
 using System.Collections.Generic;
 using Emul8.Peripherals.Memory;
+using Emul8.Exceptions;
 
 namespace UnitTests
 {
@@ -310,6 +311,77 @@ namespace UnitTests
             });
         }
 
+        [Test]
+        public void ShouldReturnValuesFromValueTags()
+        {
+            sysbus.TagValues(0x2000, new uint[] { 0x11, 0x22 }, "second");
+            sysbus.TagValues(0x1000, new uint[] { 0xAA, 0xBB, 0xCC }, "first");
+            Assert.AreEqual(0xAA, sysbus.ReadDoubleWord(0x1000));
+            Assert.AreEqual(0xCC, sysbus.ReadDoubleWord(0x1008));
+            Assert.AreEqual(0x22, sysbus.ReadDoubleWord(0x2004));
+            Assert.AreEqual(0, sysbus.ReadDoubleWord(0x100C));
+
+            Assert.AreEqual(0x11, sysbus.ReadDoubleWord(0x2000));
+        }
+
+        [Test]
+        public void ShouldRemoveSingleWordOfValueTag()
+        {
+            sysbus.TagValues(0x1000, new uint[] { 0xAA, 0xBB, 0xCC }, "first");
+            sysbus.RemoveTag(0x1004);
+            Assert.AreEqual(0xAA, sysbus.ReadDoubleWord(0x1000));
+            Assert.AreEqual(0, sysbus.ReadDoubleWord(0x1004));
+            Assert.AreEqual(0xCC, sysbus.ReadDoubleWord(0x1008));
+
+            sysbus.RemoveTag(0x1000);
+            Assert.AreEqual(0, sysbus.ReadDoubleWord(0x1000));
+            Assert.AreEqual(0xCC, sysbus.ReadDoubleWord(0x1008));
+            Assert.Throws<RecoverableException>(() => sysbus.RemoveTag(0x1004));
+        }
+
+        [Test]
+        public void ShouldNotAllowIntersectingValueTags()
+        {
+            sysbus.TagValues(0x1000, new uint[] { 1, 2, 3, 4 }, "first");
+            Assert.Throws<RecoverableException>(() => sysbus.TagValues(0xFFC, new uint[] { 5, 6 }, "second"));
+        }
+
+        [Test]
+        public void ShouldNotAllowValueTagsIntersectingTags()
+        {
+            sysbus.Tag(new Range(0x1000, 0x100), "registers", 0x55);
+            Assert.Throws<RecoverableException>(() => sysbus.TagValues(0x10FC, new uint[] { 1, 2 }, "values"));
+            sysbus.TagValues(0x2000, new uint[] { 1, 2 }, "values");
+            Assert.Throws<RecoverableException>(() => sysbus.Tag(new Range(0x1F00, 0x104), "other"));
+            Assert.AreEqual(0x55, sysbus.ReadDoubleWord(0x10FC));
+            Assert.AreEqual(1, sysbus.ReadDoubleWord(0x2000));
+        }
+
+        [Test]
+        public void ShouldInvokeRangeAndMaskedWatchpoints()
+        {
+            var hits = new List<long>();
+            Action<long, Width> hook = (address, width) => hits.Add(address);
+            sysbus.AddWatchpointHook(0x1000.By(0x100), Width.DoubleWord, Access.Write, false, hook);
+            sysbus.AddMaskedWatchpointHook(0x2004, 0xFFFFF00F, Width.DoubleWord, Access.Read, false, hook);
+
+            sysbus.WriteDoubleWord(0xFFC, 0);
+            sysbus.WriteDoubleWord(0x1000, 0);
+            sysbus.WriteDoubleWord(0x10FC, 0);
+            sysbus.WriteDoubleWord(0x1100, 0);
+            sysbus.ReadDoubleWord(0x1000);
+            sysbus.ReadDoubleWord(0x2A04);
+            sysbus.ReadDoubleWord(0x2A08);
+            CollectionAssert.AreEqual(new long[] { 0x1000, 0x10FC, 0x2A04 }, hits);
+            Assert.IsTrue(sysbus.IsWatchpointAt(0x1080, Access.Write));
+            Assert.IsFalse(sysbus.IsWatchpointAt(0x1080, Access.Read));
+
+            sysbus.RemoveWatchpointHook(0x1000.By(0x100), hook);
+            sysbus.RemoveAllMaskedWatchpointHooks(0x2004, 0xFFFFF00F);
+            Assert.IsFalse(sysbus.IsWatchpointAt(0x1080, Access.ReadAndWrite));
+            Assert.IsFalse(sysbus.IsWatchpointAt(0x2A04, Access.ReadAndWrite));
+        }
+
         private void CreateMachineAndExecute(Action<SystemBus> action)
         {
             using(var machine = new Machine())
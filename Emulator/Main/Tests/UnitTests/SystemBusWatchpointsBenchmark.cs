@@ -0,0 +1,48 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Diagnostics;
+using Emul8.Core;
+using Emul8.Peripherals.Bus;
+using Emul8.Peripherals.Memory;
+using NUnit.Framework;
+
+namespace UnitTests
+{
+    [TestFixture]
+    public class SystemBusWatchpointsBenchmark
+    {
+        [Test, Explicit("Benchmark, run manually to compare bus access overhead of watchpoints between builds.")]
+        public void MeasureBusAccessThroughput([Values(0, 10, 10000)] int watchpointsCount)
+        {
+            using(var machine = new Machine())
+            {
+                var sysbus = machine.SystemBus;
+                sysbus.Register(new MappedMemory(MemorySize), 0.By(MemorySize));
+                // watchpoints are placed after the accessed area, so only the cost of lookups is measured
+                for(var i = 0; i < watchpointsCount; i++)
+                {
+                    sysbus.AddWatchpointHook((MemorySize / 2 + i * 8).By(4), Width.DoubleWord, Access.ReadAndWrite, false, (address, width) => {});
+                }
+
+                var stopwatch = Stopwatch.StartNew();
+                for(var i = 0; i < AccessesCount; i++)
+                {
+                    var address = (i * 4) % (MemorySize / 2);
+                    sysbus.WriteDoubleWord(address, (uint)i);
+                    sysbus.ReadDoubleWord(address);
+                }
+                stopwatch.Stop();
+                Console.WriteLine("{0} watchpoints: {1:0.0} million accesses per second", watchpointsCount, 2 * AccessesCount / stopwatch.Elapsed.TotalSeconds / 1e6);
+            }
+        }
+
+        private const int AccessesCount = 10000000;
+        private const int MemorySize = 0x100000;
+    }
+}
@@ -55,16 +55,19 @@ namespace Emul8.Debug
                 throw;
             }
 
+            // parameters are materialized once, traced functions can be called very often
+            var parametersList = parameters.ToList();
             var traceInfo = new TraceInfo();
             traceInfo.Begin = symbol.Start;
-            traceInfo.BeginCallback = (pc) => EvaluateTraceCallback(pc, name, parameters, callback);
+            traceInfo.BeginCallback = (pc) => EvaluateTraceCallback(pc, name, parametersList, callback);
 
             cpu.AddHook(traceInfo.Begin, traceInfo.BeginCallback);
             if(returnCallback != null && returnParameter.HasValue)
             {
                 traceInfo.HasEnd = true;
                 traceInfo.End = (uint)(symbol.End - (symbol.IsThumbSymbol ? 2 : 4));
-                traceInfo.EndCallback = (pc) => EvaluateTraceCallback(pc, name, new[] { returnParameter.Value }, returnCallback);
+                var returnParameters = new List<FunctionCallParameter> { returnParameter.Value };
+                traceInfo.EndCallback = (pc) => EvaluateTraceCallback(pc, name, returnParameters, returnCallback);
                 cpu.Log(LogLevel.Debug, "Address is @ 0x{0:X}, end is @ 0x{1:X}.", traceInfo.Begin, traceInfo.End);
                 cpu.AddHook(traceInfo.End, traceInfo.EndCallback);
             }
@@ -94,10 +97,9 @@ namespace Emul8.Debug
             }
         }
 
-        private void EvaluateTraceCallback(uint pc, string name, IEnumerable<FunctionCallParameter> parameters, Action<TranslationCPU, uint, string, List<object>> callback)
+        private void EvaluateTraceCallback(uint pc, string name, List<FunctionCallParameter> paramList, Action<TranslationCPU, uint, string, List<object>> callback)
         {
-            var regs = new List<object>();
-            var paramList = parameters.ToList();
+            var regs = new List<object>(paramList.Count);
             //works only for 0-4 parameters!
             for(int i = 0; i < Math.Min(paramList.Count, 4); i++)
             {
@@ -0,0 +1,343 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Text;
+using System.Threading;
+using Emul8.Debug;
+using Emul8.Logging;
+
+namespace Emul8.Plugins.TracePlugin
+{
+    /// <summary>
+    /// Records traced calls as fixed-size binary records in a preallocated ring buffer, flushed to a file by a background thread.
+    /// Producers (CPU threads) reserve slots with a compare-and-swap and never block: when the buffer is full, records are dropped
+    /// and the number of dropped records is written to the file. The file can be decoded with Tools/scripts/trace_decode.py.
+    /// </summary>
+    public class BinaryTraceWriter : IDisposable
+    {
+        public BinaryTraceWriter(string path, int capacity = DefaultCapacity)
+        {
+            if(capacity < 2 || (capacity & (capacity - 1)) != 0)
+            {
+                throw new ArgumentException("Capacity of the trace buffer must be a power of two greater than one.", "capacity");
+            }
+            this.capacity = capacity;
+            mask = capacity - 1;
+            sequences = new long[capacity];
+            for(var i = 0; i < capacity; i++)
+            {
+                sequences[i] = i;
+            }
+            timestamps = new long[capacity];
+            cpus = new int[capacity];
+            pcs = new uint[capacity];
+            functions = new int[capacity];
+            kinds = new byte[capacity];
+            argumentsCounts = new byte[capacity];
+            arguments = new uint[capacity * MaxArguments];
+            definitions = new ConcurrentQueue<Action<BinaryWriter>>();
+            functionIds = new Dictionary<string, int>();
+            cpuNames = new HashSet<int>();
+            flushRequested = new AutoResetEvent(false);
+
+            writer = new BinaryWriter(new FileStream(path, FileMode.Create, FileAccess.Write, FileShare.Read, FileBufferSize));
+            writer.Write(Encoding.ASCII.GetBytes(Magic));
+            writer.Write(FormatVersion);
+            writer.Write(Stopwatch.Frequency);
+
+            writerThread = new Thread(WriterLoop)
+            {
+                IsBackground = true,
+                Name = "Binary trace writer"
+            };
+            writerThread.Start();
+        }
+
+        /// <summary>
+        /// Returns an identifier of the function used in records, writing its definition to the file on the first call.
+        /// </summary>
+        public int RegisterFunction(string name, IEnumerable<FunctionCallParameter> parameters, FunctionCallParameter? returnParameter)
+        {
+            lock(functionIds)
+            {
+                int id;
+                if(functionIds.TryGetValue(name, out id))
+                {
+                    return id;
+                }
+                id = functionIds.Count;
+                functionIds[name] = id;
+                var types = new List<string>();
+                foreach(var parameter in parameters)
+                {
+                    types.Add(parameter.Type.ToString());
+                }
+                var returnType = returnParameter.HasValue ? returnParameter.Value.Type.ToString() : string.Empty;
+                definitions.Enqueue(x =>
+                {
+                    x.Write(FunctionDefinitionTag);
+                    x.Write(id);
+                    WriteString(x, name);
+                    x.Write((byte)types.Count);
+                    foreach(var type in types)
+                    {
+                        WriteString(x, type);
+                    }
+                    WriteString(x, returnType);
+                });
+                return id;
+            }
+        }
+
+        public void RegisterCpu(int cpu, string name)
+        {
+            lock(cpuNames)
+            {
+                if(!cpuNames.Add(cpu))
+                {
+                    return;
+                }
+            }
+            definitions.Enqueue(x =>
+            {
+                x.Write(CpuDefinitionTag);
+                x.Write(cpu);
+                WriteString(x, name);
+            });
+        }
+
+        /// <summary>
+        /// Records a call or a return. Values of the arguments must be boxed unsigned integers, as passed by CPUTracer
+        /// for parameters of the UInt32 type. Arguments above MaxArguments are not recorded.
+        /// </summary>
+        public void Write(TraceRecordKind kind, int cpu, uint pc, int function, IList<object> values)
+        {
+            if(disposed)
+            {
+                return;
+            }
+            long ticket;
+            while(true)
+            {
+                ticket = Volatile.Read(ref head);
+                var sequence = Volatile.Read(ref sequences[ticket & mask]);
+                if(sequence < ticket)
+                {
+                    // the writer thread has not flushed the slot yet
+                    Interlocked.Increment(ref dropped);
+                    return;
+                }
+                if(sequence == ticket && Interlocked.CompareExchange(ref head, ticket + 1, ticket) == ticket)
+                {
+                    break;
+                }
+            }
+
+            // the timestamp is taken after the slot is reserved, so that records of different CPUs are stored roughly in time order
+            var slot = (int)(ticket & mask);
+            timestamps[slot] = Stopwatch.GetTimestamp();
+            cpus[slot] = cpu;
+            pcs[slot] = pc;
+            functions[slot] = function;
+            kinds[slot] = (byte)kind;
+            var count = Math.Min(values.Count, MaxArguments);
+            argumentsCounts[slot] = (byte)count;
+            for(var i = 0; i < count; i++)
+            {
+                arguments[slot * MaxArguments + i] = values[i] is uint ? (uint)values[i] : 0;
+            }
+            Volatile.Write(ref sequences[slot], ticket + 1);
+
+            if((ticket & (capacity / 2 - 1)) == 0)
+            {
+                // waking the writer every half of the buffer keeps it from overflowing without a syscall per record
+                flushRequested.Set();
+            }
+        }
+
+        public void Dispose()
+        {
+            if(disposed)
+            {
+                return;
+            }
+            disposed = true;
+            flushRequested.Set();
+            writerThread.Join();
+            writer.Dispose();
+        }
+
+        public long DroppedRecords
+        {
+            get
+            {
+                return Interlocked.Read(ref dropped);
+            }
+        }
+
+        public const int MaxArguments = 8;
+
+        private void WriterLoop()
+        {
+            var reportedDropped = 0L;
+            while(true)
+            {
+                var finishing = disposed;
+                // records committed before the definitions are drained can only reference functions already registered
+                var committed = CountCommitted();
+                Action<BinaryWriter> definition;
+                while(definitions.TryDequeue(out definition))
+                {
+                    definition(writer);
+                }
+                for(var i = 0L; i < committed; i++)
+                {
+                    if(chunkPosition > chunk.Length - MaxRecordSize)
+                    {
+                        FlushChunk();
+                    }
+                    WriteRecord();
+                }
+                FlushChunk();
+                var currentDropped = Interlocked.Read(ref dropped);
+                if(currentDropped != reportedDropped)
+                {
+                    if(reportedDropped == 0)
+                    {
+                        Logger.Log(LogLevel.Warning, "Trace buffer overflow, records are being dropped. The total number will be stored in the trace file.");
+                    }
+                    writer.Write(DroppedTag);
+                    writer.Write(currentDropped - reportedDropped);
+                    reportedDropped = currentDropped;
+                }
+                if(finishing)
+                {
+                    break;
+                }
+                if(committed == 0)
+                {
+                    writer.Flush();
+                    flushRequested.WaitOne(FlushInterval);
+                }
+            }
+            // producers that passed the disposed check may have reserved slots that were not committed in time for the last drain;
+            // they will never be written, so they are stored as dropped to keep the total in the file accurate
+            var uncommitted = Volatile.Read(ref head) - tail;
+            if(uncommitted > 0)
+            {
+                Interlocked.Add(ref dropped, uncommitted);
+                writer.Write(DroppedTag);
+                writer.Write(uncommitted);
+            }
+            writer.Flush();
+        }
+
+        private long CountCommitted()
+        {
+            var count = 0L;
+            while(count < capacity && Volatile.Read(ref sequences[(tail + count) & mask]) == tail + count + 1)
+            {
+                count++;
+            }
+            return count;
+        }
+
+        private void WriteRecord()
+        {
+            // records are serialized by hand, writing them field by field through the BinaryWriter is several times slower
+            var slot = (int)(tail & mask);
+            chunk[chunkPosition++] = kinds[slot];
+            PutUInt64((ulong)timestamps[slot]);
+            PutUInt32((uint)cpus[slot]);
+            PutUInt32(pcs[slot]);
+            PutUInt32((uint)functions[slot]);
+            var count = argumentsCounts[slot];
+            chunk[chunkPosition++] = count;
+            for(var i = 0; i < count; i++)
+            {
+                PutUInt32(arguments[slot * MaxArguments + i]);
+            }
+            // the slot is handed back to producers for the next lap of the buffer
+            Volatile.Write(ref sequences[slot], tail + capacity);
+            tail++;
+        }
+
+        private void PutUInt32(uint value)
+        {
+            chunk[chunkPosition] = (byte)value;
+            chunk[chunkPosition + 1] = (byte)(value >> 8);
+            chunk[chunkPosition + 2] = (byte)(value >> 16);
+            chunk[chunkPosition + 3] = (byte)(value >> 24);
+            chunkPosition += 4;
+        }
+
+        private void PutUInt64(ulong value)
+        {
+            PutUInt32((uint)value);
+            PutUInt32((uint)(value >> 32));
+        }
+
+        private void FlushChunk()
+        {
+            writer.Write(chunk, 0, chunkPosition);
+            chunkPosition = 0;
+        }
+
+        private static void WriteString(BinaryWriter writer, string value)
+        {
+            var bytes = Encoding.UTF8.GetBytes(value);
+            writer.Write((ushort)bytes.Length);
+            writer.Write(bytes);
+        }
+
+        private int chunkPosition;
+        private long head;
+        private long tail;
+        private long dropped;
+        private volatile bool disposed;
+
+        private readonly int capacity;
+        private readonly long mask;
+        private readonly long[] sequences;
+        private readonly long[] timestamps;
+        private readonly int[] cpus;
+        private readonly uint[] pcs;
+        private readonly int[] functions;
+        private readonly byte[] kinds;
+        private readonly byte[] argumentsCounts;
+        private readonly uint[] arguments;
+        private readonly byte[] chunk = new byte[ChunkSize];
+        private readonly ConcurrentQueue<Action<BinaryWriter>> definitions;
+        private readonly Dictionary<string, int> functionIds;
+        private readonly HashSet<int> cpuNames;
+        private readonly AutoResetEvent flushRequested;
+        private readonly BinaryWriter writer;
+        private readonly Thread writerThread;
+
+        private const int DefaultCapacity = 1 << 16;
+        private const int FileBufferSize = 1 << 20;
+        private const int ChunkSize = 1 << 16;
+        private const int MaxRecordSize = 1 + 8 + 4 + 4 + 4 + 1 + 4 * MaxArguments;
+        private const int FlushInterval = 100;
+        private const string Magic = "EMUL8TRC";
+        private const ushort FormatVersion = 1;
+        private const byte FunctionDefinitionTag = 0;
+        private const byte CpuDefinitionTag = 1;
+        private const byte DroppedTag = 4;
+    }
+
+    public enum TraceRecordKind : byte
+    {
+        Call = 2,
+        Return = 3
+    }
+}
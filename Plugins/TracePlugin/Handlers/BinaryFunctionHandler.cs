@@ -0,0 +1,59 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Emul8.Debug;
+using Emul8.Peripherals.CPU;
+
+namespace Emul8.Plugins.TracePlugin.Handlers
+{
+    /// <summary>
+    /// Records calls in a BinaryTraceWriter instead of formatting them with the logger.
+    /// Arguments are always fetched as raw register or stack values; declared types are stored in the trace file
+    /// and applied by the decoder, so strings and arrays are recorded as pointers.
+    /// </summary>
+    public class BinaryFunctionHandler : BaseFunctionHandler, IFunctionHandler
+    {
+        public BinaryFunctionHandler(TranslationCPU cpu, BinaryTraceWriter writer, string functionName, IEnumerable<FunctionCallParameter> callParameters, FunctionCallParameter? returnParameter) : base(cpu)
+        {
+            this.writer = writer;
+            var declaredParameters = callParameters.ToList();
+            functionId = writer.RegisterFunction(functionName, declaredParameters, returnParameter);
+            CallParameters = declaredParameters.Select(x => RawParameter).ToList();
+            ReturnParameter = returnParameter.HasValue ? RawParameter : (FunctionCallParameter?)null;
+        }
+
+        public void CallHandler(TranslationCPU cpu, uint pc, string functionName, IEnumerable<object> arguments)
+        {
+            writer.Write(TraceRecordKind.Call, cpu.Slot, pc, functionId, arguments as IList<object> ?? arguments.ToList());
+        }
+
+        public void ReturnHandler(TranslationCPU cpu, uint pc, string functionName, IEnumerable<object> argument)
+        {
+            writer.Write(TraceRecordKind.Return, cpu.Slot, pc, functionId, argument as IList<object> ?? argument.ToList());
+        }
+
+        public IEnumerable<FunctionCallParameter> CallParameters
+        {
+            get;
+            private set;
+        }
+
+        public FunctionCallParameter? ReturnParameter
+        {
+            get;
+            private set;
+        }
+
+        private readonly BinaryTraceWriter writer;
+        private readonly int functionId;
+
+        private static readonly FunctionCallParameter RawParameter = new FunctionCallParameter { Type = FunctionCallParameterType.UInt32 };
+    }
+}
@@ -6,6 +6,7 @@
 // Full license details are defined in the 'LICENSE' file.
 //
 using System;
+using System.IO;
 using Emul8.UserInterface.Commands;
 using Emul8.UserInterface;
 using AntShell.Commands;
@@ -46,6 +47,13 @@ namespace Emul8.Plugins.TracePlugin
             writer.WriteLine("- to disable tracing of a function:");
             writer.WriteLine("{0} {1} cpuName \"functionName\"".FormatWith(Name, TraceDisableCommand));
             writer.WriteLine();
+            writer.WriteLine("- to record calls of functions traced without a handler in a binary file instead of the log:");
+            writer.WriteLine("{0} {1} @path".FormatWith(Name, TraceBinaryCommand));
+            writer.WriteLine("(Decode the file with Tools/scripts/trace_decode.py. Functions recorded in the file must be disabled before switching to another file or back to the log.)");
+            writer.WriteLine();
+            writer.WriteLine("- to close the binary file and log calls of functions traced from now on:");
+            writer.WriteLine("{0} {1}".FormatWith(Name, TraceTextCommand));
+            writer.WriteLine();
             writer.WriteLine("Handlers available for functions:");
             writer.WriteLine(handlers.Keys.Select(x => "- " + x).Stringify("\r\n"));
             writer.WriteLine();
@@ -65,9 +73,36 @@ namespace Emul8.Plugins.TracePlugin
                 var cpu = (Arm)monitor.ConvertValueOrThrowRecoverable(cpuToken.Value, typeof(Arm));
                 var cpuTracer = EnsureTracer(cpu);
                 cpuTracer.RemoveTracing(functionName.Value);
+                HashSet<string> functions;
+                if(binaryTracedFunctions.TryGetValue(cpu, out functions))
+                {
+                    functions.Remove(functionName.Value);
+                }
             }
         }
 
+        [Runnable]
+        public void Run(ICommandInteraction writer, [Values(TraceBinaryCommand)] LiteralToken mode, PathToken path)
+        {
+            EnsureNoBinaryHandlers();
+            CloseBinaryOutput();
+            try
+            {
+                binaryWriter = new BinaryTraceWriter(path.Value);
+            }
+            catch(Exception e) when(e is IOException || e is UnauthorizedAccessException)
+            {
+                throw new RecoverableException("Could not open the trace file: {0}".FormatWith(e.Message));
+            }
+        }
+
+        [Runnable]
+        public void Run(ICommandInteraction writer, [Values(TraceTextCommand)] LiteralToken mode)
+        {
+            EnsureNoBinaryHandlers();
+            CloseBinaryOutput();
+        }
+
         [Runnable]
         public void Run(ICommandInteraction writer, [Values(TraceEnableCommand)] LiteralToken enable, LiteralToken cpuToken, StringToken functionName, BooleanToken traceReturn)
         {
@@ -85,7 +120,6 @@ namespace Emul8.Plugins.TracePlugin
         {
             var cpu = (Arm)monitor.ConvertValueOrThrowRecoverable(cpuToken.Value, typeof(Arm));
             var cpuTracer = EnsureTracer(cpu);
-            var handler = new DefaultFunctionHandler(cpu);
             var paramList = new List<FunctionCallParameter>();
             foreach(var parameter in types)
             {
@@ -96,17 +130,9 @@ namespace Emul8.Plugins.TracePlugin
                 }
                 paramList.Add(new FunctionCallParameter{ Type = paramType });
             }
-            handler.CallParameters = paramList.Take(paramList.Count - (traceReturn.Value ? 1 : 0));
-            handler.ReturnParameter = traceReturn.Value ? paramList.Last() : (FunctionCallParameter?)null;
-            if(traceReturn.Value)
-            {
-                cpuTracer.TraceFunction(functionName.Value, handler.CallParameters, handler.CallHandler, handler.ReturnParameter, handler.ReturnHandler);
-            }
-            else
-            {
-                cpuTracer.TraceFunction(functionName.Value, handler.CallParameters, handler.CallHandler);
-            }
-            
+            var handler = CreateDefaultHandler(cpu, functionName.Value, paramList.Take(paramList.Count - (traceReturn.Value ? 1 : 0)),
+                traceReturn.Value ? paramList.Last() : (FunctionCallParameter?)null);
+            InstallHandler(cpu, cpuTracer, functionName.Value, handler, traceReturn.Value);
         }
 
         public void RegisterFunctionName(string function, Type callbackType)
@@ -118,6 +144,15 @@ namespace Emul8.Plugins.TracePlugin
             handlers[function] = callbackType;
         }
 
+        public void CloseBinaryOutput()
+        {
+            if(binaryWriter != null)
+            {
+                binaryWriter.Dispose();
+                binaryWriter = null;
+            }
+        }
+
         public TraceCommand(Monitor monitor) : base(monitor, "trace", "Hooks up watches for some interesting methods.")
         {
            
@@ -126,16 +161,38 @@ namespace Emul8.Plugins.TracePlugin
                 { "printk", typeof(PrintfHandler) },
                 { "printf", typeof(PrintfHandler) }
             };
+            binaryTracedFunctions = new Dictionary<Arm, HashSet<string>>();
         }
 
         private string FindTracerName(Arm cpu)
+        {
+            return "{0}-{1}".FormatWith(FindCpuName(cpu), TracerName);
+        }
+
+        private string FindCpuName(Arm cpu)
         {
             string cpuName;
             if(!cpu.Bus.Machine.TryGetAnyName(cpu, out cpuName))
             {
                 throw new Exception("This should never have happened!");
             }
-            return "{0}.{1}-{2}".FormatWith(EmulationManager.Instance.CurrentEmulation[cpu.Bus.Machine], cpuName, TracerName);
+            return "{0}.{1}".FormatWith(EmulationManager.Instance.CurrentEmulation[cpu.Bus.Machine], cpuName);
+        }
+
+        private IFunctionHandler CreateDefaultHandler(Arm cpu, string functionName, IEnumerable<FunctionCallParameter> callParameters, FunctionCallParameter? returnParameter)
+        {
+            if(binaryWriter != null)
+            {
+                string cpuName;
+                cpu.Bus.Machine.TryGetAnyName(cpu, out cpuName);
+                binaryWriter.RegisterCpu(cpu.Slot, cpuName ?? "cpu{0}".FormatWith(cpu.Slot));
+                return new BinaryFunctionHandler(cpu, binaryWriter, functionName, callParameters, returnParameter);
+            }
+            return new DefaultFunctionHandler(cpu)
+            {
+                CallParameters = callParameters,
+                ReturnParameter = returnParameter
+            };
         }
 
         private void Execute(ICommandInteraction writer, LiteralToken cpuToken, String functionName, bool traceReturn, int? numberOfParameters)
@@ -160,10 +217,7 @@ namespace Emul8.Plugins.TracePlugin
                     {
                         returnParameter = new FunctionCallParameter{ Type = FunctionCallParameterType.UInt32 };
                     }
-                    var defHandler = new DefaultFunctionHandler(cpu);
-                    defHandler.CallParameters = paramList;
-                    defHandler.ReturnParameter = returnParameter;
-                    handler = defHandler;
+                    handler = CreateDefaultHandler(cpu, functionName, paramList, returnParameter);
                 }
                 else
                 {
@@ -174,6 +228,11 @@ namespace Emul8.Plugins.TracePlugin
             {
                 handler = Dynamic.InvokeConstructor(handlerType, cpu);
             }
+            InstallHandler(cpu, cpuTracer, functionName, handler, traceReturn);
+        }
+
+        private void InstallHandler(Arm cpu, CPUTracer cpuTracer, string functionName, IFunctionHandler handler, bool traceReturn)
+        {
             if(traceReturn)
             {
                 cpuTracer.TraceFunction(functionName, handler.CallParameters, handler.CallHandler, handler.ReturnParameter, handler.ReturnHandler);
@@ -182,6 +241,33 @@ namespace Emul8.Plugins.TracePlugin
             {
                 cpuTracer.TraceFunction(functionName, handler.CallParameters, handler.CallHandler);
             }
+            if(handler is BinaryFunctionHandler)
+            {
+                HashSet<string> functions;
+                if(!binaryTracedFunctions.TryGetValue(cpu, out functions))
+                {
+                    functions = new HashSet<string>();
+                    binaryTracedFunctions[cpu] = functions;
+                }
+                functions.Add(functionName);
+            }
+        }
+
+        private void EnsureNoBinaryHandlers()
+        {
+            // handlers of CPUs of machines removed from the emulation are gone with them
+            var machines = EmulationManager.Instance.CurrentEmulation.Machines.ToList();
+            foreach(var cpu in binaryTracedFunctions.Keys.Where(x => !machines.Contains(x.Bus.Machine)).ToList())
+            {
+                binaryTracedFunctions.Remove(cpu);
+            }
+            // closing the file under installed handlers would silently stop recording their calls
+            var traced = binaryTracedFunctions.SelectMany(x => x.Value.Select(y => "{0} on {1}".FormatWith(y, FindCpuName(x.Key)))).ToList();
+            if(traced.Count > 0)
+            {
+                throw new RecoverableException("Calls of {0} are recorded in the binary trace file, disable tracing of these functions before switching the output."
+                    .FormatWith(traced.Stringify(", ")));
+            }
         }
 
         private CPUTracer EnsureTracer(Arm cpu)
@@ -200,9 +286,13 @@ namespace Emul8.Plugins.TracePlugin
         }
 
         private readonly Dictionary<String, Type> handlers;
+        private readonly Dictionary<Arm, HashSet<string>> binaryTracedFunctions;
+        private BinaryTraceWriter binaryWriter;
 
         private const string TracerName = "tracealyzerTracer";
         private const string TraceEnableCommand = "enable";
         private const string TraceDisableCommand = "disable";
+        private const string TraceBinaryCommand = "binary";
+        private const string TraceTextCommand = "text";
     }
 }
\ No newline at end of file
@@ -23,6 +23,7 @@ namespace Emul8.Plugins.TracePlugin
         public void Dispose()
         {
             monitor.UnregisterCommand(traceCommand);
+            traceCommand.CloseBinaryOutput();
         }
 
         private readonly TraceCommand traceCommand;
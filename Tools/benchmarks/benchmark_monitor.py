@@ -0,0 +1,48 @@
+# Monitor commands used by Tools/scripts/benchmarks_provider.py.
+# The file is included into the monitor after a benchmarked scenario, so it runs in the monitor's python scope.
+
+def benchmark_write_result(result_path, values):
+    # the harness polls for the result file, so it is written under a temporary name first
+    temporary_path = result_path + ".tmp"
+    with open(temporary_path, "w") as output:
+        # json is not a part of the monitor's python, repr of longs would end with 'L'
+        output.write("{%s}\n" % ", ".join('"%s": %s' % (key, repr(value) if isinstance(value, float) else "%d" % value) for key, value in sorted(values.items())))
+    System.IO.File.Move(temporary_path, result_path)
+
+def count_instructions(machine):
+    instructions = 0
+    for cpu in machine.SystemBus.GetCPUs():
+        instructions += getattr(cpu, "ExecutedInstructions", 0)
+    return instructions
+
+def mc_benchmark_run(uart_name, marker, result_path):
+    machine = self.Machine
+    # find_peripheral comes from scripts/monitor.py
+    uart = find_peripheral(machine, uart_name)
+    if uart is None:
+        print "No UART named %s" % uart_name
+        return False
+    state = {"done": False}
+    stopwatch = System.Diagnostics.Stopwatch()
+    # a scenario restored from a boot snapshot has already executed some instructions
+    start_instructions = count_instructions(machine)
+    start_virtual_time = machine.ElapsedVirtualTime.TotalSeconds
+
+    def on_marker(line):
+        if state["done"]:
+            return
+        state["done"] = True
+        stopwatch.Stop()
+        instructions = count_instructions(machine) - start_instructions
+        wall_time = stopwatch.Elapsed.TotalSeconds
+        benchmark_write_result(result_path, {
+            "wall_time": wall_time,
+            "virtual_time": machine.ElapsedVirtualTime.TotalSeconds - start_virtual_time,
+            "instructions": long(instructions),
+            "instructions_per_second": instructions / wall_time if wall_time > 0 else 0.0,
+            "peak_rss": long(System.Diagnostics.Process.GetCurrentProcess().PeakWorkingSet64)
+        })
+
+    Emul8.Hooks.UartHooksExtensions.AddLineHook(uart, System.Func[str, bool](lambda line: marker in line), System.Action[str](on_marker))
+    stopwatch.Start()
+    Emul8.Core.EmulationManager.Instance.CurrentEmulation.StartAll()
@@ -0,0 +1,187 @@
+# pylint: disable=C0301,C0103,C0111
+from __future__ import print_function
+from sys import platform
+import os
+import json
+import time
+import socket
+import threading
+import subprocess
+
+this_path = os.path.abspath(os.path.dirname(__file__))
+root_path = os.path.abspath(os.path.join(this_path, '..', '..'))
+monitor_commands_path = os.path.join(root_path, 'Tools', 'benchmarks', 'benchmark_monitor.py')
+# metrics compared against the baseline: 1 if a higher value is worse, -1 if a lower one is
+compared_metrics = {'wall_time': 1, 'instructions_per_second': -1}
+
+def install_cli_arguments(parser):
+    parser.add_argument("--benchmark-baseline", dest="benchmark_baseline", action="store", default=None, help="Json file with baseline results of benchmarks (benchmark_baseline.json in the results directory by default).")
+    parser.add_argument("--benchmark-threshold", dest="benchmark_threshold", action="store", type=float, default=10.0, help="Percentage by which a benchmark can be worse than its baseline before it fails (10 by default).")
+    parser.add_argument("--update-baseline", dest="update_baseline", action="store_true", default=False, help="Store results of benchmarks as the new baseline.")
+
+def handle_options(options):
+    # resolved before parallel workers get their own results directories
+    if options.benchmark_baseline is None:
+        options.benchmark_baseline = os.path.join(options.results_directory, 'benchmark_baseline.json')
+
+def read_definition(path):
+    """Returns values of a benchmark definition file, consisting of `key = value` lines.
+
+    With `boot_marker`, the scenario is booted until that marker in a snapshot cached between runs,
+    and only the part of the boot from there to `marker` is measured."""
+    definition = {'timeout': '600'}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            key, _, value = line.partition('=')
+            definition[key.strip()] = value.strip()
+    return definition
+
+def find_console(scenario_path):
+    # the first analyzer shown by a demo scenario is its console
+    with open(scenario_path) as f:
+        for line in f:
+            tokens = line.split()
+            if len(tokens) > 1 and tokens[0] == 'showAnalyzer':
+                return tokens[1]
+    return None
+
+def read_peak_rss(pid):
+    # more accurate than the value reported by the runtime, but available on linux only
+    try:
+        with open('/proc/{0}/status'.format(pid)) as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except IOError:
+        pass
+    return None
+
+def find_free_port():
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.bind(('127.0.0.1', 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+def compare(result, baseline, threshold):
+    """Returns a list of descriptions of metrics that are worse than in the baseline by more than threshold percent."""
+    regressions = []
+    for metric, direction in sorted(compared_metrics.items()):
+        old = baseline.get(metric)
+        if not old:
+            continue
+        change = 100.0 * (result[metric] - old) / old
+        if change * direction > threshold:
+            regressions.append('{0}: {1:.3f} -> {2:.3f} ({3:+.1f}%)'.format(metric, old, result[metric], change))
+    return regressions
+
+class BenchmarkSuite(object):
+    """Boots a demo scenario until a marker appears on its console and compares the measurements against a baseline."""
+    emulator_path = os.path.join(root_path, 'target', 'bin', '{0}', 'CLI.exe')
+    instances_count = 0
+    results = {}
+    baseline = None
+    lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+
+    def prepare(self, options):
+        if not os.path.isdir(options.results_directory):
+            os.makedirs(options.results_directory)
+        with BenchmarkSuite.lock:
+            BenchmarkSuite.instances_count += 1
+            if BenchmarkSuite.baseline is None:
+                BenchmarkSuite.baseline = {}
+                if os.path.isfile(options.benchmark_baseline):
+                    with open(options.benchmark_baseline) as f:
+                        BenchmarkSuite.baseline = json.load(f)
+        return 0
+
+    def run(self, options):
+        print('Running benchmark ' + self.name)
+        definition = read_definition(self.path)
+        scenario_path = os.path.join(root_path, definition['scenario'])
+        console = definition.get('console') or find_console(scenario_path)
+        if console is None:
+            print('Could not find console of {0}, set it with `console = NAME`.'.format(scenario_path))
+            return False
+
+        result_path = os.path.join(options.results_directory, 'benchmark_{0}.json'.format(self.name))
+        if os.path.isfile(result_path):
+            os.remove(result_path)
+        script_path = os.path.join(options.results_directory, 'benchmark_{0}.emul8'.format(self.name))
+        with open(script_path, 'w') as script:
+            if 'boot_marker' in definition:
+                # the part of the boot before the measured one is restored from a snapshot, see `snapshot_boot` in scripts/monitor.py
+                script.write('snapshot_boot "benchmark_{0}" "{1}" "{2}" "{3}" {4}\n'.format(self.name, scenario_path.replace('\\', '/'), console, definition['boot_marker'], definition['timeout']))
+            else:
+                script.write('include @{0}\n'.format(scenario_path))
+            script.write('include @{0}\n'.format(monitor_commands_path))
+            script.write('benchmark_run "{0}" "{1}" "{2}"\n'.format(console, definition['marker'], result_path.replace('\\', '/')))
+
+        args = [BenchmarkSuite.emulator_path.format(options.configuration), '--disable-xwt', '--hide-log', '-P', str(find_free_port()), script_path]
+        if platform.startswith("linux") or platform == "darwin":
+            args.insert(0, 'mono')
+        with open(os.path.join(options.results_directory, 'benchmark_{0}.log'.format(self.name)), 'w') as log:
+            process = subprocess.Popen(args, cwd=root_path, stdout=log, stderr=subprocess.STDOUT)
+            peak_rss = self._wait_for_result(process, result_path, float(definition['timeout']))
+        if peak_rss is False:
+            print('Benchmark {0} did not reach `{1}` on {2}, see its log for details.'.format(self.name, definition['marker'], console))
+            return False
+
+        with open(result_path) as f:
+            result = json.load(f)
+        if peak_rss is not None:
+            result['peak_rss'] = peak_rss
+        result['timestamp'] = time.time()
+        print('{0}: {1:.2f}s wall, {2:.2f}s virtual, {3:.2f} MIPS, {4:.1f} MB peak RSS'.format(self.name, result['wall_time'], result['virtual_time'], result['instructions_per_second'] / 1e6, result['peak_rss'] / 1048576.0))
+        with BenchmarkSuite.lock:
+            BenchmarkSuite.results[self.name] = result
+            baseline = BenchmarkSuite.baseline.get(self.name)
+        if baseline is None or options.update_baseline:
+            return True
+        regressions = compare(result, baseline, options.benchmark_threshold)
+        for regression in regressions:
+            print('{0} regressed by more than {1}%: {2}'.format(self.name, options.benchmark_threshold, regression))
+        return not regressions
+
+    def _wait_for_result(self, process, result_path, timeout):
+        # returns peak RSS of the emulator (None if unknown), or False if the marker was not reached
+        deadline = time.time() + timeout
+        reached = False
+        while time.time() < deadline and process.poll() is None:
+            if os.path.isfile(result_path):
+                reached = True
+                break
+            time.sleep(0.1)
+        peak_rss = read_peak_rss(process.pid) if reached else None
+        if process.poll() is None:
+            process.terminate()
+            for _ in range(100):
+                if process.poll() is not None:
+                    break
+                time.sleep(0.1)
+            else:
+                process.kill()
+                process.wait()
+        return peak_rss if reached else False
+
+    def cleanup(self, options):
+        with BenchmarkSuite.lock:
+            BenchmarkSuite.instances_count -= 1
+            if BenchmarkSuite.instances_count != 0 or not BenchmarkSuite.results:
+                return
+            output = os.path.join(options.results_directory, 'benchmark_results.json')
+            with open(output, 'w') as f:
+                json.dump(BenchmarkSuite.results, f, indent=1, sort_keys=True)
+            print('Benchmark results: {}'.format(output))
+            if options.update_baseline:
+                BenchmarkSuite.baseline.update(BenchmarkSuite.results)
+                with open(options.benchmark_baseline, 'w') as f:
+                    json.dump(BenchmarkSuite.baseline, f, indent=1, sort_keys=True)
+                print('Baseline updated: {}'.format(options.benchmark_baseline))
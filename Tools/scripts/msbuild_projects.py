@@ -0,0 +1,97 @@
+# pylint: disable=C0301,C0103,C0111
+from __future__ import print_function
+import os
+import glob
+import hashlib
+import xml.etree.ElementTree
+
+msbuild_namespace = '{http://schemas.microsoft.com/developer/msbuild/2003}'
+input_items = ['Compile', 'EmbeddedResource', 'None', 'Content']
+ignored_directories = ['bin', 'obj', '.git']
+
+def _resolve(project_path, include):
+    return os.path.normpath(os.path.join(os.path.dirname(project_path), include.replace('\\', os.sep)))
+
+def _parse(project_path):
+    return xml.etree.ElementTree.parse(project_path).getroot()
+
+def project_references(project_path):
+    """Returns paths of projects directly referenced by the project."""
+    root = _parse(project_path)
+    return [_resolve(project_path, item.attrib['Include']) for item in root.iter(msbuild_namespace + 'ProjectReference')]
+
+def project_closure(project_path):
+    """Returns paths of the project and all projects it transitively references."""
+    result = []
+    to_visit = [os.path.normpath(project_path)]
+    while to_visit:
+        path = to_visit.pop()
+        if path in result or not os.path.isfile(path):
+            continue
+        result.append(path)
+        to_visit.extend(project_references(path))
+    return result
+
+def project_assemblies(project_path):
+    """Returns file names of assemblies built from the project and projects it transitively references, and of assemblies they reference by path."""
+    names = set()
+    for project in project_closure(project_path):
+        root = _parse(project)
+        assembly_name = root.find('.//' + msbuild_namespace + 'AssemblyName')
+        output_type = root.find('.//' + msbuild_namespace + 'OutputType')
+        if assembly_name is not None and assembly_name.text:
+            is_executable = output_type is not None and output_type.text.strip().lower() in ('exe', 'winexe')
+            names.add(assembly_name.text.strip() + ('.exe' if is_executable else '.dll'))
+        for hint in root.iter(msbuild_namespace + 'HintPath'):
+            names.add(os.path.basename(hint.text.strip().replace('\\', os.sep)))
+    return sorted(names)
+
+def project_inputs(project_path):
+    """Returns paths of files the project is built from, not including referenced projects."""
+    root = _parse(project_path)
+    inputs = set([os.path.normpath(project_path)])
+    for item_type in input_items:
+        for item in root.iter(msbuild_namespace + item_type):
+            pattern = _resolve(project_path, item.attrib['Include'])
+            inputs.update(glob.glob(pattern) if '*' in pattern else [pattern])
+    for hint in root.iter(msbuild_namespace + 'HintPath'):
+        inputs.add(_resolve(project_path, hint.text.strip()))
+    for imported in root.iter(msbuild_namespace + 'Import'):
+        if '$(' not in imported.attrib['Project']:
+            inputs.add(_resolve(project_path, imported.attrib['Project']))
+    # projects with custom build steps (e.g. native translation libraries) can use any file from their directory
+    if any(True for target in root.iter(msbuild_namespace + 'Target') for task in target if task.tag in (msbuild_namespace + 'MSBuild', msbuild_namespace + 'Exec')):
+        for directory, subdirectories, files in os.walk(os.path.dirname(os.path.abspath(project_path))):
+            subdirectories[:] = [d for d in subdirectories if d not in ignored_directories]
+            inputs.update(os.path.join(directory, f) for f in files)
+    return sorted(inputs)
+
+class FilesHasher(object):
+    """Computes hashes of sets of files, reusing hashes of files whose size and modification time did not change."""
+
+    def __init__(self, known_hashes=None):
+        self.known_hashes = known_hashes if known_hashes is not None else {}
+
+    def file_hash(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return 'missing'
+        stamp = [stat.st_size, stat.st_mtime]
+        known = self.known_hashes.get(path)
+        if known is not None and known[0] == stamp:
+            return known[1]
+        content_hash = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                content_hash.update(block)
+        self.known_hashes[path] = [stamp, content_hash.hexdigest()]
+        return content_hash.hexdigest()
+
+    def files_hash(self, paths, extra=None):
+        result = hashlib.sha1()
+        for path in sorted(paths):
+            result.update('{0}:{1}\n'.format(path, self.file_hash(path)).encode('utf-8'))
+        for value in extra or []:
+            result.update('{0}\n'.format(value).encode('utf-8'))
+        return result.hexdigest()
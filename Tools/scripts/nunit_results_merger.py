@@ -2,44 +2,88 @@
 from __future__ import print_function
 import sys
 import argparse
+import xml.sax
+import xml.sax.handler
+import xml.sax.saxutils
+import xml.sax.xmlreader
 import xml.etree.ElementTree
 
-def merge(files, output):
-    base_xml = xml.etree.ElementTree.parse(files[0])
-    base_root = base_xml.getroot()
+ids = ['total', 'errors', 'failures', 'not-run', 'inconclusive', 'ignored', 'skipped', 'invalid']
 
-    base_root.attrib['name'] = 'Merged results'
+def read_root_attributes(path):
+    # only the opening tag of the root element is parsed
+    with open(path, 'rb') as f:
+        for _, element in xml.etree.ElementTree.iterparse(f, events=('start',)):
+            return dict(element.attrib)
 
-    ids = ['total', 'errors', 'failures', 'not-run', 'inconclusive', 'ignored', 'skipped', 'invalid']
-    stats = {}
+class SubtreesCopier(xml.sax.handler.ContentHandler):
+    """Passes children of the root element to the generator, optionally only those with a given tag."""
 
-    # read statistics from base file
-    for i in ids:
-        stats[i] = int(base_root.attrib[i])
+    def __init__(self, generator, tag=None):
+        xml.sax.handler.ContentHandler.__init__(self)
+        self.generator = generator
+        self.tag = tag
+        self.depth = 0
+        self.copying = False
+
+    def startElement(self, name, attrs):
+        self.depth += 1
+        if self.depth == 2:
+            self.copying = self.tag is None or name == self.tag
+        if self.copying:
+            self.generator.startElement(name, attrs)
+
+    def endElement(self, name):
+        if self.copying:
+            self.generator.endElement(name)
+        if self.depth == 2:
+            self.copying = False
+        self.depth -= 1
+
+    def characters(self, content):
+        if self.copying:
+            self.generator.characters(content)
 
-    for curr_root in (xml.etree.ElementTree.parse(f).getroot() for f in files[1:]):
-        # update statistics
+    def ignorableWhitespace(self, whitespace):
+        self.characters(whitespace)
+
+def merge(files, output):
+    # the first pass reads statistics only, so that the merged root element can be written before its children
+    base_attributes = read_root_attributes(files[0])
+    stats = dict((i, 0) for i in ids)
+    for f in files:
+        attributes = read_root_attributes(f)
         for i in ids:
-            stats[i] += int(curr_root.attrib[i])
-        # copy all top level test-suite elements
-        for ts in curr_root.findall('test-suite'):
-            base_root.append(ts)
+            stats[i] += int(attributes[i])
 
-    # update statistics
+    base_attributes['name'] = 'Merged results'
     for i in ids:
-        base_root.attrib[i] = str(stats[i])
+        base_attributes[i] = str(stats[i])
 
-    base_xml.write(output)
+    with open(output, 'wb') as out:
+        generator = xml.sax.saxutils.XMLGenerator(out, 'utf-8')
+        generator.startDocument()
+        generator.startElement('test-results', xml.sax.xmlreader.AttributesImpl(base_attributes))
+        # copy everything from the first file and all top level test-suite elements from the rest
+        for i, path in enumerate(files):
+            with open(path, 'rb') as f:
+                xml.sax.parse(f, SubtreesCopier(generator, None if i == 0 else 'test-suite'))
+        generator.endElement('test-results')
+        generator.endDocument()
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("files", help="Xml files to merge", nargs='*')
     parser.add_argument("-o", "--output", dest="output", help="Output file name", default='output.xml')
+    parser.add_argument("-l", "--files-from", dest="files_from", help="File with a list of xml files to merge, one per line", default=None)
     options = parser.parse_args()
 
+    if options.files_from is not None:
+        with open(options.files_from) as f:
+            options.files += [line.strip() for line in f if line.strip()]
+
     if len(options.files) < 2:
         print("You must provide at least two files to merge", file=sys.stderr)
         sys.exit(1)
 
     merge(options.files, options.output)
-
@@ -0,0 +1,114 @@
+//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Net;
+using System.Net.Sockets;
+using System.Text;
+using NUnit.ConsoleRunner;
+using NUnit.Util;
+
+namespace Emul8.Testing
+{
+    /// <summary>
+    /// Runs nunit-console on requests received over a local socket, so that the runtime is started
+    /// and test assemblies are loaded and compiled once for many runs.
+    /// A request consists of the `run` line followed by nunit-console arguments, one per line, and an empty line.
+    /// Output of the run is streamed back, followed by a line with the exit code.
+    /// The `quit` request stops the server.
+    /// </summary>
+    public static class NUnitServer
+    {
+        public static int Main(string[] args)
+        {
+            if(args.Length != 1)
+            {
+                Console.Error.WriteLine("Usage: nunit_server.exe PORT_FILE");
+                return 1;
+            }
+            var listener = new TcpListener(IPAddress.Loopback, 0);
+            listener.Start();
+            // the file is moved into place when complete, so that the client never reads a partial port number
+            var temporaryPortFile = args[0] + ".tmp";
+            File.WriteAllText(temporaryPortFile, ((IPEndPoint)listener.LocalEndpoint).Port.ToString());
+            File.Move(temporaryPortFile, args[0]);
+
+            var standardOutput = Console.Out;
+            var standardError = Console.Error;
+            while(true)
+            {
+                try
+                {
+                    if(!HandleClient(listener, standardOutput, standardError))
+                    {
+                        return 0;
+                    }
+                }
+                catch(Exception e) when(e is IOException || e is SocketException)
+                {
+                    // a client that disconnected or timed out in the middle of a run must not take the server down
+                    standardError.WriteLine("Connection with the client lost: {0}", e.Message);
+                }
+            }
+        }
+
+        private static bool HandleClient(TcpListener listener, TextWriter standardOutput, TextWriter standardError)
+        {
+            using(var client = listener.AcceptTcpClient())
+            using(var stream = client.GetStream())
+            {
+                var reader = new StreamReader(stream, Encoding.UTF8);
+                var command = reader.ReadLine();
+                if(command == QuitCommand)
+                {
+                    return false;
+                }
+                if(command != RunCommand)
+                {
+                    // e.g. a client that disconnected before sending a request
+                    return true;
+                }
+                var arguments = new List<string>();
+                string line;
+                while(!string.IsNullOrEmpty(line = reader.ReadLine()))
+                {
+                    arguments.Add(line);
+                }
+
+                var writer = new StreamWriter(stream, new UTF8Encoding(false)) { AutoFlush = true };
+                Console.SetOut(writer);
+                Console.SetError(writer);
+                int result;
+                try
+                {
+                    result = Runner.Main(arguments.ToArray());
+                }
+                catch(Exception e)
+                {
+                    writer.WriteLine(e);
+                    result = UnexpectedErrorExitCode;
+                }
+                finally
+                {
+                    // the runner registers its services on every run
+                    ServiceManager.Services.ClearServices();
+                    Console.SetOut(standardOutput);
+                    Console.SetError(standardError);
+                }
+                writer.WriteLine("{0}{1}", ExitCodeMarker, result);
+                return true;
+            }
+        }
+
+        private const string RunCommand = "run";
+        private const string QuitCommand = "quit";
+        private const string ExitCodeMarker = "##nunit-server-exit-code:";
+        private const int UnexpectedErrorExitCode = -100;
+    }
+}
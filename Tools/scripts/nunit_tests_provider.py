@@ -2,32 +2,470 @@
 from __future__ import print_function
 from sys import platform
 import os
+import re
+import json
+import time
+import shutil
+import socket
+import hashlib
+import threading
+import xml.etree.ElementTree
 import subprocess
+import msbuild_projects
+import output_pump
 import nunit_results_merger
 
 this_path = os.path.abspath(os.path.dirname(__file__))
+# comments, strings and characters are removed before looking for declarations, as they can contain braces
+noise_pattern = re.compile(r'//[^\n]*|/\*.*?\*/|@"(?:[^"]|"")*"|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])+\'', re.DOTALL)
+declaration_pattern = re.compile(r'(\[[^\[\]]*\])|\bnamespace\s+([\w.]+)|\b(class|struct|interface|enum)\s+(\w+)|([{};])')
+fixture_attribute_pattern = re.compile(r'\bTestFixture(?:Attribute)?\b')
+test_attribute_names = set(['Test', 'TestCase', 'TestCaseSource', 'Theory'])
+generic_arguments_pattern = re.compile(r'<[^<>]*>')
 
 def install_cli_arguments(parser):
     parser.add_argument("--properties-file", action="store", help="Location of properties file.")
+    parser.add_argument("--force-build", dest="force_build", action="store_true", default=False, help="Build test projects even if their inputs did not change since the last build.")
+    parser.add_argument("--suite-logs", dest="suite_logs", action="store_true", default=False, help="Additionally write output of each suite to a log file in the results directory.")
+    parser.add_argument("--shards", dest="shards", action="store", type=int, default=1, help="Split fixtures of each assembly into a number of shards run in separate nunit processes.")
+    parser.add_argument("--warm-runner", dest="warm_runner", action="store_true", default=False, help="Run tests in long-lived nunit processes that load assemblies once, instead of starting nunit-console for every run. Useful with -n.")
+    parser.add_argument("--no-cache", dest="use_results_cache", action="store_false", default=True, help="Run suites even if they already passed with identical assemblies, dependencies and fixture filter.")
+
+def handle_options(options):
+    # shared by all parallel workers, so that a cached result does not depend on which worker ran the suite
+    options.results_cache_directory = os.path.join(options.results_directory, 'results_cache')
+
+def is_interesting_line(line):
+    return not line.isspace() and 'GLib-' not in line
+
+def is_test_attribute(attribute):
+    # an attribute list can hold several attributes, e.g. `[Timeout(10), Test]`
+    names = re.sub(r'\([^()]*\)', '', attribute[1:-1]).split(',')
+    for name in names:
+        name = name.strip().split('.')[-1]
+        if name.endswith('Attribute'):
+            name = name[:-len('Attribute')]
+        if name in test_attribute_names:
+            return True
+    return False
+
+def parse_base_types(declaration):
+    """Returns simple names of types listed after the colon of a type declaration, e.g. `Base` for ` : Base<int>, IDisposable where T : new()`."""
+    while generic_arguments_pattern.search(declaration):
+        declaration = generic_arguments_pattern.sub('', declaration)
+    declaration = declaration.split(' where ')[0].strip()
+    if not declaration.startswith(':'):
+        return []
+    return [name.strip().split('.')[-1] for name in declaration[1:].split(',') if name.strip()]
+
+def scan_source_classes(content):
+    """Returns classes declared in the C# source, as dictionaries with the full name, simple names of base types
+    and whether the class is abstract, generic, marked with `[TestFixture]` or directly contains test methods."""
+    content = noise_pattern.sub(lambda m: '' if m.group(0).startswith('/') else '""', content)
+    classes = []
+    # each frame is a (kind, name, details) tuple for a pair of braces
+    stack = []
+    declaration_start = 0
+    pending = None
+    for match in declaration_pattern.finditer(content):
+        attribute, namespace, keyword, type_name, delimiter = match.groups()
+        if attribute:
+            if stack and stack[-1][0] == 'class' and is_test_attribute(attribute):
+                stack[-1][2]['tests'] = True
+        elif namespace:
+            pending = ('namespace', namespace, None)
+        elif type_name:
+            prefix = content[declaration_start:match.start()]
+            pending = ('class', type_name, {'keyword': keyword, 'name_end': match.end(), 'fixture': fixture_attribute_pattern.search(prefix) is not None, 'abstract': re.search(r'\babstract\b', prefix) is not None, 'tests': False})
+        elif delimiter == '{':
+            if pending and pending[0] == 'class':
+                declaration = content[pending[2]['name_end']:match.start()]
+                pending[2]['generic'] = declaration.lstrip().startswith('<')
+                pending[2]['bases'] = parse_base_types(' '.join(declaration.split()))
+            stack.append(pending or ('block', None, None))
+            pending = None
+            declaration_start = match.end()
+        elif delimiter == '}':
+            if stack:
+                kind, name, details = stack.pop()
+                if kind == 'class' and details['keyword'] == 'class':
+                    namespaces = '.'.join(frame[1] for frame in stack if frame[0] == 'namespace')
+                    # NUnit separates nested classes with `+`
+                    classes_path = '+'.join([frame[1] for frame in stack if frame[0] == 'class'] + [name])
+                    classes.append({
+                        'full_name': namespaces + '.' + classes_path if namespaces else classes_path,
+                        'name': name,
+                        'bases': details['bases'],
+                        'abstract': details['abstract'],
+                        'generic': details['generic'],
+                        'tests': details['fixture'] or details['tests']
+                    })
+            pending = None
+            declaration_start = match.end()
+        else:
+            pending = None
+            declaration_start = match.end()
+    return classes
+
+def resolve_fixtures(classes):
+    """Returns full names of fixtures among the classes and whether the list is complete.
+
+    NUnit runs classes marked with `[TestFixture]`, classes containing test methods and classes inheriting test methods,
+    so base classes are looked up among the given ones. The list is incomplete if a class derives from a base class
+    that may contain tests but cannot be told apart from other classes of the same name, or from a test class declared
+    elsewhere; fixtures of generic classes are named by their type arguments, so they also make the list incomplete.
+    """
+    declared = {}
+    for entry in classes:
+        # parts of a partial class share the full name
+        declared.setdefault(entry['name'], {}).setdefault(entry['full_name'], []).append(entry)
+    state = {'complete': True}
+    resolved = {}
+
+    def has_tests(full_name, visiting):
+        if full_name in resolved:
+            return resolved[full_name]
+        if full_name in visiting:
+            return False
+        visiting.add(full_name)
+        parts = declared[full_name.split('.')[-1].split('+')[-1]][full_name]
+        result = any(part['tests'] for part in parts)
+        for base in [base for part in parts for base in part['bases']]:
+            candidates = declared.get(base)
+            if candidates is None:
+                # types from other assemblies are not expected to hold tests, unless they are named like test classes
+                if 'Test' in base or 'Fixture' in base:
+                    state['complete'] = False
+                continue
+            with_tests = [candidate for candidate in candidates if has_tests(candidate, visiting)]
+            if with_tests and len(candidates) > 1:
+                state['complete'] = False
+            result = result or bool(with_tests)
+        visiting.discard(full_name)
+        resolved[full_name] = result
+        return result
+
+    fixtures = []
+    for entry in classes:
+        full_name = entry['full_name']
+        if full_name in fixtures or not has_tests(full_name, set()):
+            continue
+        parts = declared[entry['name']][full_name]
+        if any(part['abstract'] for part in parts):
+            continue
+        if any(part['generic'] for part in parts):
+            state['complete'] = False
+            continue
+        fixtures.append(full_name)
+    return fixtures, state['complete']
+
+def find_source_fixtures(content):
+    """Returns full names of test fixtures declared in the C# source and whether the list is complete."""
+    return resolve_fixtures(scan_source_classes(content))
+
+def find_fixtures(project_path):
+    """Returns full names of test fixtures compiled into the project, found by scanning its sources, or None if they cannot be reliably determined."""
+    project_directory = os.path.dirname(project_path)
+    classes = []
+    for item in xml.etree.ElementTree.parse(project_path).getroot().iter(msbuild_projects.msbuild_namespace + 'Compile'):
+        source_path = os.path.join(project_directory, item.attrib['Include'].replace('\\', os.sep))
+        if not os.path.isfile(source_path):
+            continue
+        with open(source_path, 'rb') as source:
+            classes.extend(scan_source_classes(source.read().decode('utf-8', 'replace')))
+    # fixtures can inherit tests from classes declared in other files
+    fixtures, complete = resolve_fixtures(classes)
+    if not complete:
+        print('Could not determine all fixtures declared in {0}, not splitting the project into shards.'.format(project_path))
+        return None
+    return fixtures
+
+def copy_missing_files(source, destination):
+    for directory, _, files in os.walk(source):
+        target = os.path.join(destination, os.path.relpath(directory, source))
+        if not os.path.isdir(target):
+            os.makedirs(target)
+        for name in files:
+            if not os.path.isfile(os.path.join(target, name)):
+                shutil.copy2(os.path.join(directory, name), target)
+
+def project_files(project_path):
+    """Returns paths of all files the project and projects it references are built from."""
+    inputs = set()
+    for project in msbuild_projects.project_closure(project_path):
+        inputs.update(msbuild_projects.project_inputs(project))
+    return sorted(inputs)
+
+def read_fixture_durations(results_path):
+    """Returns a dictionary of fixture full names and their durations, read from a nunit xml results file."""
+    durations = {}
+    try:
+        root = xml.etree.ElementTree.parse(results_path).getroot()
+    except (IOError, xml.etree.ElementTree.ParseError):
+        return durations
+    stack = [(root, '')]
+    while stack:
+        element, prefix = stack.pop()
+        for suite in element.findall('test-suite') + element.findall('results/test-suite'):
+            suite_type = suite.attrib.get('type')
+            if suite_type == 'TestFixture':
+                durations[prefix + suite.attrib['name']] = float(suite.attrib.get('time', 0))
+            elif suite_type == 'Namespace':
+                stack.append((suite, prefix + suite.attrib['name'] + '.'))
+            else:
+                stack.append((suite, prefix))
+    return durations
+
+class BuildCache(object):
+    """Remembers hashes of inputs of projects successfully built to a given output directory."""
+    file_name = 'build_cache.json'
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, BuildCache.file_name)
+        self.projects = {}
+        files = {}
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path) as f:
+                    content = json.load(f)
+                self.projects = content['projects']
+                files = content['files']
+            except (ValueError, KeyError):
+                pass
+        self.hasher = msbuild_projects.FilesHasher(files)
+
+    def inputs_hash(self, project_path, options):
+        inputs = set(project_files(project_path))
+        if options.properties_file:
+            inputs.add(os.path.abspath(options.properties_file))
+        return self.hasher.files_hash(inputs, [options.configuration])
+
+    def is_up_to_date(self, project_path, inputs_hash):
+        return self.projects.get(project_path) == inputs_hash
+
+    def store(self, project_path, inputs_hash):
+        self.projects[project_path] = inputs_hash
+        with open(self.path, 'w') as f:
+            json.dump({'projects': self.projects, 'files': self.hasher.known_hashes}, f)
+
+class ResultsCache(object):
+    """Remembers xml results of suites that passed, keyed by hashes of everything the run depended on."""
+    file_name = 'results_cache.json'
+    lock = threading.Lock()
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, ResultsCache.file_name)
+        self.suites = {}
+        files = {}
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path) as f:
+                    content = json.load(f)
+                self.suites = content['suites']
+                files = content['files']
+            except (ValueError, KeyError):
+                pass
+        self.hasher = msbuild_projects.FilesHasher(files)
+
+    def key(self, project_path, options):
+        # the built assembly with its dependency closure stands for everything nunit loads,
+        # inputs of the projects cover data files read by tests at runtime
+        assemblies = [os.path.join(options.results_directory, name) for name in msbuild_projects.project_assemblies(project_path)]
+        assemblies = [path for path in assemblies if os.path.isfile(path)]
+        with ResultsCache.lock:
+            assemblies_hash = hashlib.sha1()
+            for path in sorted(assemblies):
+                assemblies_hash.update('{0}:{1}\n'.format(os.path.basename(path), self.hasher.file_hash(path)).encode('utf-8'))
+            inputs_hash = self.hasher.files_hash(project_files(project_path))
+        return self.hasher.files_hash([], [assemblies_hash.hexdigest(), inputs_hash, options.configuration, options.test_type, options.fixture or ''])
+
+    def lookup(self, suite_id, key):
+        """Returns path of the cached xml results of the suite, or None if it has not passed with the given key."""
+        with ResultsCache.lock:
+            entry = self.suites.get(suite_id)
+        if entry is None or entry['key'] != key:
+            return None
+        path = os.path.join(self.directory, entry['results'])
+        return path if os.path.isfile(path) else None
+
+    def store(self, suite_id, key, results_path):
+        with ResultsCache.lock:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            results = hashlib.sha1(suite_id.encode('utf-8')).hexdigest() + '.xml'
+            shutil.copyfile(results_path, os.path.join(self.directory, results))
+            self.suites[suite_id] = {'key': key, 'results': results}
+            self._save()
+
+    def invalidate(self, suite_id):
+        with ResultsCache.lock:
+            if self.suites.pop(suite_id, None) is not None:
+                self._save()
+
+    def _save(self):
+        with open(self.path, 'w') as f:
+            json.dump({'suites': self.suites, 'files': self.hasher.known_hashes}, f)
+
+class WarmRunner(object):
+    """Long-lived nunit process running tests on request, see nunit_server.cs."""
+    source_path = os.path.join(this_path, 'nunit_server.cs')
+    exit_code_marker = '##nunit-server-exit-code:'
+    start_timeout = 60
+    compile_lock = threading.Lock()
+    failed_directories = set()
+
+    def __init__(self, directory, name, debug_mode):
+        self.directory = directory
+        self.name = name
+        self.debug_mode = debug_mode
+        self.process = None
+        self.port = None
+
+    @staticmethod
+    def compile(directory):
+        """Builds the server next to the copied nunit binaries, returns its path or None if it cannot be built."""
+        executable = os.path.join(directory, 'nunit_server.exe')
+        with WarmRunner.compile_lock:
+            if directory in WarmRunner.failed_directories:
+                return None
+            if os.path.isfile(executable) and os.path.getmtime(executable) >= os.path.getmtime(WarmRunner.source_path):
+                return executable
+            references = []
+            for root, _, files in os.walk(directory):
+                references.extend(os.path.join(root, f) for f in files if f in ('nunit-console-runner.dll', 'nunit.util.dll', 'nunit.core.dll', 'nunit.core.interfaces.dll'))
+            compiler = 'csc.exe' if platform == "win32" else 'mcs'
+            try:
+                result = subprocess.call([compiler, '-nologo', '-out:' + executable] + ['-r:' + r for r in sorted(references)] + [WarmRunner.source_path])
+            except OSError:
+                result = -1
+            if result != 0:
+                print('Could not build the warm nunit runner, falling back to nunit-console.')
+                WarmRunner.failed_directories.add(directory)
+                return None
+            # the server needs the same assembly probing paths as nunit-console
+            config = os.path.join(directory, 'nunit-console.exe.config')
+            if os.path.isfile(config):
+                shutil.copyfile(config, executable + '.config')
+            return executable
+
+    def run(self, args, output, line_filter, log_path):
+        """Runs nunit-console with the given arguments in the server, starting it first if needed."""
+        if self.process is None and not self._start():
+            return False
+        exit_code = [None]
+        def filter_output(line):
+            if line.startswith(WarmRunner.exit_code_marker):
+                exit_code[0] = int(line[len(WarmRunner.exit_code_marker):])
+                return False
+            return line_filter(line)
+        try:
+            connection = socket.create_connection(('127.0.0.1', self.port))
+            connection.sendall(('\n'.join(['run'] + args) + '\n\n').encode('utf-8'))
+        except socket.error as e:
+            print('Could not connect to the warm nunit runner: {0}'.format(e))
+            self.stop()
+            return False
+        output_pump.OutputPump(output, filter_output, log_path).run(RemoteRun(connection, exit_code))
+        if exit_code[0] != 0:
+            # a crashed server is not usable anymore and failed tests can leave emulator in an unknown state
+            self.stop()
+        return exit_code[0] == 0
+
+    def stop(self):
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            try:
+                connection = socket.create_connection(('127.0.0.1', self.port))
+                connection.sendall(b'quit\n')
+                connection.close()
+                for _ in range(50):
+                    if self.process.poll() is not None:
+                        break
+                    time.sleep(0.1)
+            except socket.error:
+                pass
+            if self.process.poll() is None:
+                self.process.kill()
+            self.process.wait()
+        self.log.close()
+        self.process = None
+
+    def _start(self):
+        executable = WarmRunner.compile(self.directory)
+        if executable is None:
+            return False
+        port_file = os.path.join(self.directory, '{0}.port'.format(self.name))
+        if os.path.isfile(port_file):
+            os.remove(port_file)
+        args = [executable, port_file]
+        if platform.startswith("linux") or platform == "darwin":
+            args = ['mono'] + (['--debug'] if self.debug_mode else []) + args
+        # output written outside of runs, e.g. by threads left by tests, goes to the log only
+        self.log = open(os.path.join(self.directory, '{0}.log'.format(self.name)), 'w')
+        self.process = subprocess.Popen(args, cwd=self.directory, stdout=self.log, stderr=subprocess.STDOUT)
+        deadline = time.time() + WarmRunner.start_timeout
+        while not os.path.isfile(port_file):
+            if self.process.poll() is not None or time.time() > deadline:
+                print('Warm nunit runner did not start, see {0} for details.'.format(self.log.name))
+                self.stop()
+                return False
+            time.sleep(0.05)
+        with open(port_file) as f:
+            self.port = int(f.read())
+        return True
+
+class RemoteRun(object):
+    """Presents a run in the warm runner as a process to the output pump."""
+
+    def __init__(self, connection, exit_code):
+        self.stdout = connection
+        self.exit_code = exit_code
+
+    def wait(self):
+        # missing exit code means the server died during the run
+        return self.exit_code[0] if self.exit_code[0] is not None else -1
 
 class NUnitTestSuite(object):
     nunit_path = os.path.join(this_path, './../../External/Tools/nunit-console.exe')
     output_files = []
     instances_count = 0
+    # referenced projects share their intermediate directories, so concurrent builds would race on them
+    build_lock = threading.Lock()
+    build_caches = {}
+    results_caches = {}
+    warm_runners = {}
+    warm_runners_lock = threading.Lock()
 
     def __init__(self, path):
         #super(NUnitTestSuite, self).__init__(path)
         self.path = path
+        # set when the last run replayed cached results instead of running tests, so that its duration is not recorded
+        self.result_cached = False
 
     def prepare(self, options):
-        NUnitTestSuite.instances_count += 1
-        print("Building {0}".format(self.path))
-        if platform == "win32":
-            builder = 'MSBuild.exe'
-        else:
-            builder = 'xbuild'
+        with NUnitTestSuite.build_lock:
+            NUnitTestSuite.instances_count += 1
+            if options.results_directory not in NUnitTestSuite.build_caches:
+                NUnitTestSuite.build_caches[options.results_directory] = BuildCache(options.results_directory)
+            cache = NUnitTestSuite.build_caches[options.results_directory]
+            project_path = os.path.abspath(self.path)
+            inputs_hash = cache.inputs_hash(project_path, options)
+            built_assembly = os.path.join(options.results_directory, os.path.split(self.path)[1].replace('csproj', 'dll'))
+            if not options.force_build and os.path.isfile(built_assembly) and cache.is_up_to_date(project_path, inputs_hash):
+                print("Skipping build of {0}, nothing changed".format(self.path))
+                return 0
+
+            print("Building {0}".format(self.path))
+            if platform == "win32":
+                builder = 'MSBuild.exe'
+            else:
+                builder = 'xbuild'
 
-        result = subprocess.call([builder, '/p:PropertiesLocation={0}'.format(options.properties_file), '/p:OutputPath={0}'.format(options.results_directory), '/nologo', '/verbosity:quiet', '/p:OutputDir=tests_output', '/p:Configuration={0}'.format(options.configuration), self.path])
+            result = subprocess.call([builder, '/p:PropertiesLocation={0}'.format(options.properties_file), '/p:OutputPath={0}'.format(options.results_directory), '/nologo', '/verbosity:quiet', '/p:OutputDir=tests_output', '/p:Configuration={0}'.format(options.configuration), self.path])
+            if result == 0:
+                cache.store(project_path, inputs_hash)
 
         if result != 0:
             print("Building project `{}` failed with error code: {}".format(self.path, result))
@@ -35,14 +473,101 @@ class NUnitTestSuite(object):
 
     def run(self, options):
         print('Running ' + self.path)
+        self.result_cached = False
         # copying nunit console binaries seems to be necessary in order to use -domain:None switch; otherwise it is not needed
         copied_nunit_path = os.path.join(options.results_directory, 'nunit-console.exe')
         if not os.path.isfile(copied_nunit_path):
-            subprocess.call(['bash', '-c', 'cp -r \'{0}/\'* \'{1}\''.format(os.path.dirname(NUnitTestSuite.nunit_path), options.results_directory)])
+            copy_missing_files(os.path.dirname(NUnitTestSuite.nunit_path), options.results_directory)
 
         project_file = os.path.split(self.path)[1]
         output_file = project_file.replace('csproj', 'xml')
-        args = [copied_nunit_path, '-domain:None', '-noshadow', '-nologo', '-labels', '-xml:{}'.format(output_file), project_file.replace("csproj", "dll")]
+        NUnitTestSuite.output_files.append(os.path.join(options.results_directory, output_file))
+
+        cache = self._results_cache(options)
+        if cache is None:
+            return self._run(options, copied_nunit_path, project_file, output_file)
+        suite_id = '{0}|{1}'.format(os.path.abspath(self.path), options.fixture or '')
+        key = cache.key(os.path.abspath(self.path), options)
+        cached_results = cache.lookup(suite_id, key)
+        if cached_results is not None:
+            print('Skipping {0}, it already passed with identical assemblies'.format(self.path))
+            shutil.copyfile(cached_results, os.path.join(options.results_directory, output_file))
+            self.result_cached = True
+            return True
+        result = self._run(options, copied_nunit_path, project_file, output_file)
+        if result and os.path.isfile(os.path.join(options.results_directory, output_file)):
+            cache.store(suite_id, key, os.path.join(options.results_directory, output_file))
+        else:
+            cache.invalidate(suite_id)
+        return result
+
+    def _results_cache(self, options):
+        # repeated and debugged runs are meant to actually execute tests
+        if not options.use_results_cache or options.repeat_count != 1 or options.port is not None:
+            return None
+        with ResultsCache.lock:
+            if options.results_cache_directory not in NUnitTestSuite.results_caches:
+                NUnitTestSuite.results_caches[options.results_cache_directory] = ResultsCache(options.results_cache_directory)
+            return NUnitTestSuite.results_caches[options.results_cache_directory]
+
+    def _run(self, options, copied_nunit_path, project_file, output_file):
+        shards = self._split_into_shards(options, output_file)
+        if len(shards) < 2:
+            result = self._run_nunit(options, copied_nunit_path, output_file, [options.fixture] if options.fixture else None, 0)
+            self._record_fixture_durations(options, output_file)
+            return result
+
+        print('Running {0} fixtures of {1} in {2} shards'.format(sum(len(shard) for shard in shards), project_file, len(shards)))
+        shard_files = [output_file.replace('.xml', '.shard{0}.xml'.format(i)) for i in range(len(shards))]
+        results = [False] * len(shards)
+        def run_shard(i):
+            results[i] = self._run_nunit(options, copied_nunit_path, shard_files[i], shards[i], i)
+        threads = [threading.Thread(target=run_shard, args=(i,)) for i in range(len(shards))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        existing_files = [os.path.join(options.results_directory, f) for f in shard_files if os.path.isfile(os.path.join(options.results_directory, f))]
+        if existing_files:
+            nunit_results_merger.merge(existing_files, os.path.join(options.results_directory, output_file))
+            self._record_fixture_durations(options, output_file)
+        return all(results)
+
+    def _record_fixture_durations(self, options, output_file):
+        for fixture, duration in read_fixture_durations(os.path.join(options.results_directory, output_file)).items():
+            options.timings.record_fixture(fixture, duration)
+
+    def _split_into_shards(self, options, output_file):
+        # sharding is pointless when running a single fixture and impossible with a single debugger port
+        if options.shards < 2 or options.fixture or options.port is not None:
+            return []
+        fixtures = find_fixtures(self.path)
+        if fixtures is None or len(fixtures) < 2:
+            return []
+        # balance shards using durations from previous runs: longest fixture goes to the least loaded shard
+        durations = dict((fixture, options.timings.fixture_duration(fixture)) for fixture in fixtures)
+        known_durations = [d for d in durations.values() if d is not None]
+        default_duration = sum(known_durations) / len(known_durations) if known_durations else 1.0
+        for fixture in fixtures:
+            if durations[fixture] is None:
+                durations[fixture] = default_duration
+        shards = [{'fixtures': [], 'load': 0.0} for _ in range(min(options.shards, len(fixtures)))]
+        for fixture in sorted(fixtures, key=lambda f: durations[f], reverse=True):
+            shard = min(shards, key=lambda s: s['load'])
+            shard['fixtures'].append(fixture)
+            shard['load'] += durations[fixture]
+        return [shard['fixtures'] for shard in shards]
+
+    def _run_nunit(self, options, copied_nunit_path, output_file, fixtures, slot):
+        args = [copied_nunit_path, '-domain:None', '-noshadow', '-nologo', '-labels', '-xml:{}'.format(output_file), os.path.split(self.path)[1].replace("csproj", "dll")]
+        if fixtures:
+            args.append('-run:' + ','.join(fixtures))
+        log_path = os.path.join(options.results_directory, output_file.replace('.xml', '.log')) if options.suite_logs else None
+
+        # attaching a debugger is only supported with a fresh process
+        if options.warm_runner and options.port is None and WarmRunner.compile(options.results_directory) is not None:
+            return self._warm_runner(options, slot).run(args[1:], options.output, is_interesting_line, log_path)
         if platform.startswith("linux") or platform == "darwin":
             args.insert(0, 'mono')
 
@@ -53,22 +578,23 @@ class NUnitTestSuite(object):
             args.insert(2, '--debugger-agent=transport=dt_socket,server=y,suspend={0},address=127.0.0.1:{1}'.format('y' if options.suspend else 'n', options.port))
         elif options.debug_mode:
             args.insert(1, '--debug')
-        if options.fixture:
-            args.append('-run:' + options.fixture)
 
-        NUnitTestSuite.output_files.append(os.path.join(options.results_directory, output_file))
         process = subprocess.Popen(args, cwd=options.results_directory, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        while True:
-            line = process.stdout.readline()
-            ret = process.poll()
-            if ret is not None:
-                return ret == 0
-            if line and not line.isspace() and 'GLib-' not in line:
-                options.output.write(line)
+        return output_pump.OutputPump(options.output, is_interesting_line, log_path).run(process) == 0
+
+    def _warm_runner(self, options, slot):
+        # concurrently running shards need separate servers
+        key = (options.results_directory, slot)
+        with NUnitTestSuite.warm_runners_lock:
+            if key not in NUnitTestSuite.warm_runners:
+                NUnitTestSuite.warm_runners[key] = WarmRunner(options.results_directory, 'nunit_server{0}'.format(slot), options.debug_mode)
+            return NUnitTestSuite.warm_runners[key]
 
     def cleanup(self, options):
         NUnitTestSuite.instances_count -= 1
         if NUnitTestSuite.instances_count == 0:
+            for runner in NUnitTestSuite.warm_runners.values():
+                runner.stop()
             # merge nunit results
             print("Aggregating all nunit results")
             output = os.path.join(options.results_directory, 'nunit_output.xml')
@@ -0,0 +1,69 @@
+# pylint: disable=C0301,C0103,C0111
+from __future__ import print_function
+import os
+import codecs
+import threading
+
+# shared by all pumps, so that batches of lines from concurrently running suites do not interleave
+output_lock = threading.Lock()
+
+class OutputPump(object):
+    """Copies output of a process to a stream (and optionally a log file) in filtered batches of whole lines."""
+    chunk_size = 64 * 1024
+    # a line longer than this is written out in parts instead of growing the buffer
+    max_pending = 1024 * 1024
+
+    def __init__(self, output, line_filter=None, log_path=None):
+        self.output = output
+        self.line_filter = line_filter
+        self.log_path = log_path
+        self.pending = ''
+        # on python 2 output is written as raw bytes, exactly as it was read
+        self.decoder = None if bytes is str else codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def run(self, process):
+        """Pumps the whole output of the process and returns its exit code."""
+        log = open(self.log_path, 'w') if self.log_path is not None else None
+        try:
+            read = OutputPump._reader(process.stdout)
+            while True:
+                # returns as soon as any data is available, at most chunk_size bytes
+                chunk = read(OutputPump.chunk_size)
+                if not chunk:
+                    break
+                self._write(self._decode(chunk), log, False)
+            self._write(self._decode(b'', True), log, True)
+        finally:
+            process.stdout.close()
+            if log is not None:
+                log.close()
+        return process.wait()
+
+    @staticmethod
+    def _reader(stream):
+        if hasattr(stream, 'recv'):
+            # output of the warm runner comes from a socket, which is not a file descriptor on Windows
+            return stream.recv
+        descriptor = stream.fileno()
+        return lambda size: os.read(descriptor, size)
+
+    def _decode(self, chunk, final=False):
+        return chunk if self.decoder is None else self.decoder.decode(chunk, final)
+
+    def _write(self, text, log, final):
+        self.pending += text
+        if final or len(self.pending) > OutputPump.max_pending:
+            lines, self.pending = self.pending, ''
+        else:
+            end = self.pending.rfind('\n') + 1
+            lines, self.pending = self.pending[:end], self.pending[end:]
+        if not lines:
+            return
+        batch = ''.join(line for line in lines.splitlines(True) if self.line_filter is None or self.line_filter(line))
+        if not batch:
+            return
+        with output_lock:
+            self.output.write(batch)
+            self.output.flush()
+        if log is not None:
+            log.write(batch)
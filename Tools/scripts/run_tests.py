@@ -1,7 +1,9 @@
 #!/usr/bin/python
 # pylint: disable=C0301,C0103,C0111
 import nunit_tests_provider
+import benchmarks_provider
 import tests_engine
 
-tests_engine.register_handler('nunit', 'csproj', nunit_tests_provider.NUnitTestSuite, nunit_tests_provider.install_cli_arguments)
+tests_engine.register_handler('nunit', 'csproj', nunit_tests_provider.NUnitTestSuite, nunit_tests_provider.install_cli_arguments, nunit_tests_provider.handle_options, inputs=nunit_tests_provider.project_files)
+tests_engine.register_handler('benchmark', 'benchmark', benchmarks_provider.BenchmarkSuite, benchmarks_provider.install_cli_arguments, benchmarks_provider.handle_options)
 tests_engine.run()
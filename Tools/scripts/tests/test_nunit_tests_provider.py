@@ -0,0 +1,152 @@
+# pylint: disable=C0301,C0103,C0111
+"""Tests of fixture detection used to split nunit suites into shards.
+
+Run with: python -m unittest discover Tools/scripts/tests
+"""
+from __future__ import print_function
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import nunit_tests_provider
+
+project_template = """<?xml version="1.0" encoding="utf-8"?>
+<Project DefaultTargets="Build" ToolsVersion="4.0" xmlns="http://schemas.microsoft.com/developer/msbuild/2003">
+  <ItemGroup>
+{0}
+  </ItemGroup>
+</Project>
+"""
+
+class FindFixturesTests(unittest.TestCase):
+    def test_should_find_fixtures_without_attribute(self):
+        fixtures, complete = nunit_tests_provider.find_source_fixtures("""
+namespace Emul8.UnitTests
+{
+    public class MachineTests
+    {
+        [Test]
+        public void ShouldWork()
+        {
+            var x = new[] { 1 };
+        }
+    }
+
+    [TestFixture]
+    public class MarkedTests
+    {
+    }
+
+    public class Helper
+    {
+        [Obsolete]
+        public void NotATest() {}
+    }
+}
+""")
+        self.assertTrue(complete)
+        self.assertEqual(['Emul8.UnitTests.MachineTests', 'Emul8.UnitTests.MarkedTests'], fixtures)
+
+    def test_should_find_nested_fixtures_and_ignore_comments_and_strings(self):
+        fixtures, complete = nunit_tests_provider.find_source_fixtures("""
+namespace UnitTests
+{
+    // class Commented { [Test] void A() {} }
+    public class Outer
+    {
+        [TestCase("}")]
+        public void ShouldWork(string s) {}
+
+        public class Inner
+        {
+            [Test, Timeout(100)]
+            public void ShouldWorkToo() { var c = '{'; }
+        }
+    }
+}
+""")
+        self.assertTrue(complete)
+        self.assertEqual(['UnitTests.Outer+Inner', 'UnitTests.Outer'], fixtures)
+
+    def test_should_find_fixtures_inheriting_tests(self):
+        fixtures, complete = nunit_tests_provider.find_source_fixtures("""
+namespace UnitTests
+{
+    public abstract class AbstractTests
+    {
+        [Test]
+        public void ShouldWork() {}
+    }
+
+    public class BaseTests
+    {
+        [Timeout(10), Test]
+        public void ShouldWorkToo() {}
+    }
+
+    public class DerivedTests : BaseTests, IDisposable
+    {
+        public void Dispose() {}
+    }
+
+    public sealed class ConcreteTests : UnitTests.AbstractTests
+    {
+    }
+}
+""")
+        self.assertTrue(complete)
+        self.assertEqual(['UnitTests.BaseTests', 'UnitTests.DerivedTests', 'UnitTests.ConcreteTests'], fixtures)
+
+    def test_should_list_partial_fixtures_once(self):
+        fixtures, complete = nunit_tests_provider.find_source_fixtures("""
+namespace UnitTests
+{
+    public partial class SplitTests
+    {
+        [NUnit.Framework.TestAttribute]
+        public void ShouldWork() {}
+    }
+
+    public partial class SplitTests
+    {
+        [TestCase(1), TestCase(2)]
+        public void ShouldWorkToo(int x) {}
+    }
+}
+""")
+        self.assertTrue(complete)
+        self.assertEqual(['UnitTests.SplitTests'], fixtures)
+
+    def test_should_report_unresolved_fixtures_as_incomplete(self):
+        for source in [
+            'namespace A { public class GenericTests<T> { [Test] public void T() {} } }',
+            'namespace A { public class Derived : ExternalTestBase { } }',
+            'namespace A { public class Base { [Test] public void T() {} } } namespace B { public class Base { } public class Derived : Base { } }'
+        ]:
+            _, complete = nunit_tests_provider.find_source_fixtures(source)
+            self.assertFalse(complete, source)
+
+    def test_should_find_fixtures_of_project(self):
+        directory = tempfile.mkdtemp()
+        try:
+            sources = {
+                'Marked.cs': 'namespace A { [TestFixture] public class Marked { [Test] public void T() {} } }',
+                'Derived.cs': 'namespace A { public class Derived : Marked { } }',
+                os.path.join('Collections', 'Unmarked.cs'): 'namespace A.Collections { public class Unmarked { [Test] public void T() {} } }'
+            }
+            os.makedirs(os.path.join(directory, 'Collections'))
+            for name, content in sources.items():
+                with open(os.path.join(directory, name), 'w') as f:
+                    f.write(content)
+            project_path = os.path.join(directory, 'Tests.csproj')
+            with open(project_path, 'w') as f:
+                f.write(project_template.format('\n'.join('    <Compile Include="{0}" />'.format(name.replace(os.sep, '\\')) for name in sorted(sources))))
+            self.assertEqual(['A.Collections.Unmarked', 'A.Derived', 'A.Marked'], sorted(nunit_tests_provider.find_fixtures(project_path)))
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+# pylint: disable=C0301,C0103,C0111
+"""Tests of copying output of local and remote test runs.
+
+Run with: python -m unittest discover Tools/scripts/tests
+"""
+from __future__ import print_function
+import os
+import sys
+import socket
+import subprocess
+import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import output_pump
+
+class RemoteRun(object):
+    def __init__(self, connection):
+        self.stdout = connection
+
+    def wait(self):
+        return 0
+
+class OutputPumpTests(unittest.TestCase):
+    def test_should_copy_output_of_process(self):
+        process = subprocess.Popen([sys.executable, '-c', 'print("first"); print("second")'], stdout=subprocess.PIPE)
+        output = StringIO()
+        exit_code = output_pump.OutputPump(output, lambda line: line.startswith('second')).run(process)
+
+        self.assertEqual(0, exit_code)
+        self.assertEqual('second\n', output.getvalue().replace('\r\n', '\n'))
+
+    def test_should_copy_output_from_socket(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        client = socket.create_connection(server.getsockname())
+        connection, _ = server.accept()
+        server.close()
+        connection.sendall(b'first\nsecond')
+        connection.close()
+        output = StringIO()
+        output_pump.OutputPump(output).run(RemoteRun(client))
+
+        self.assertEqual('first\nsecond', output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# pylint: disable=C0301,C0103,C0111
+"""Tests of decoding binary trace files written by the TracePlugin.
+
+Run with: python -m unittest discover Tools/scripts/tests
+"""
+from __future__ import print_function
+import io
+import os
+import sys
+import struct
+import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import trace_decode
+
+frequency = 1000000
+
+def string(value):
+    data = value.encode('utf-8')
+    return struct.pack('<H', len(data)) + data
+
+class TraceBuilder(object):
+    """Lays out entries the same way as BinaryTraceWriter."""
+
+    def __init__(self):
+        self.data = trace_decode.magic + struct.pack('<Hq', trace_decode.supported_version, frequency)
+
+    def function(self, identifier, name, parameters, return_type=''):
+        self.data += struct.pack('<Bi', trace_decode.function_definition_tag, identifier) + string(name)
+        self.data += struct.pack('<B', len(parameters)) + b''.join(string(x) for x in parameters) + string(return_type)
+
+    def cpu(self, cpu, name):
+        self.data += struct.pack('<Bi', trace_decode.cpu_definition_tag, cpu) + string(name)
+
+    def record(self, kind, timestamp, cpu, pc, function, values):
+        self.data += struct.pack('<B', kind) + trace_decode.record_header.pack(timestamp, cpu, pc, function, len(values))
+        self.data += struct.pack('<{0}I'.format(len(values)), *values)
+
+    def dropped(self, count):
+        self.data += struct.pack('<Bq', trace_decode.dropped_tag, count)
+
+    def reader(self):
+        return trace_decode.TraceReader(io.BytesIO(self.data))
+
+class TraceDecodeTests(unittest.TestCase):
+    def setUp(self):
+        self.trace = TraceBuilder()
+        self.trace.function(0, 'uart_send', ['Int32', 'String'], 'Int16')
+        self.trace.cpu(0, 'machine-0.cpu')
+
+    def test_should_decode_records(self):
+        self.trace.record(trace_decode.call_tag, 100, 0, 0x8000, 0, [0xFFFFFFFF, 0x20001000])
+        self.trace.record(trace_decode.return_tag, 150, 0, 0x8010, 0, [0x1FFFF])
+        reader = self.trace.reader()
+        records = list(reader)
+
+        self.assertEqual(2, len(records))
+        self.assertEqual(trace_decode.call_tag, records[0].kind)
+        self.assertEqual(0x8000, records[0].pc)
+        self.assertEqual(['-1', '0x20001000'], reader.format_values(records[0]))
+        self.assertEqual(['-1'], reader.format_values(records[1]))
+        self.assertEqual('uart_send', reader.function_name(0))
+        self.assertEqual('machine-0.cpu', reader.cpu_name(0))
+        self.assertEqual(frequency, reader.frequency)
+        self.assertEqual(0, reader.dropped)
+
+    def test_should_count_records_dropped_on_overflow(self):
+        # the writer stores the number of records dropped since the previous flush after the records it managed to keep
+        self.trace.record(trace_decode.call_tag, 100, 0, 0x8000, 0, [1, 2])
+        self.trace.dropped(3)
+        self.trace.record(trace_decode.call_tag, 300, 0, 0x8000, 0, [3, 4])
+        self.trace.dropped(2)
+        reader = self.trace.reader()
+        records = list(reader)
+
+        self.assertEqual([100, 300], [x.timestamp for x in records])
+        self.assertEqual(5, reader.dropped)
+        output = StringIO()
+        statistics = trace_decode.Statistics()
+        for record in records:
+            statistics.add(record, float(record.timestamp) / reader.frequency)
+        statistics.report(reader, output)
+        self.assertIn("5 records were dropped", output.getvalue())
+
+    def test_should_measure_intervals_and_durations(self):
+        self.trace.record(trace_decode.call_tag, 0, 0, 0x8000, 0, [0, 0])
+        self.trace.record(trace_decode.call_tag, 10, 0, 0x8000, 0, [0, 0])
+        self.trace.record(trace_decode.return_tag, 15, 0, 0x8010, 0, [0])
+        self.trace.record(trace_decode.return_tag, 40, 0, 0x8010, 0, [0])
+        reader = self.trace.reader()
+        statistics = trace_decode.Statistics()
+        for record in reader:
+            statistics.add(record, float(record.timestamp) / reader.frequency)
+
+        entry = statistics.functions[0]
+        self.assertEqual(2, entry['calls'])
+        self.assertEqual(2, entry['returns'])
+        self.assertAlmostEqual(10e-6, entry['intervals'].total)
+        # the inner call returns first
+        self.assertAlmostEqual(5e-6, entry['durations'].minimum)
+        self.assertAlmostEqual(40e-6, entry['durations'].maximum)
+
+    def test_should_report_truncated_record(self):
+        self.trace.record(trace_decode.call_tag, 100, 0, 0x8000, 0, [1, 2])
+        self.trace.data = self.trace.data[:-3]
+        with self.assertRaises(trace_decode.TraceFormatError):
+            list(self.trace.reader())
+
+    def test_should_reject_other_files(self):
+        with self.assertRaises(trace_decode.TraceFormatError):
+            trace_decode.TraceReader(io.BytesIO(b'not a trace file'))
+
+if __name__ == '__main__':
+    unittest.main()
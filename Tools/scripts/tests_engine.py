@@ -3,11 +3,17 @@
 from __future__ import print_function
 import os
 import sys
+import copy
+import time
 import argparse
+import threading
 import subprocess
+import multiprocessing
+import tests_timings
 
 this_path = os.path.abspath(os.path.dirname(__file__))
 registered_handlers = []
+snapshot_cache_variable = 'EMUL8_SNAPSHOT_CACHE'
 
 def prepare_parser():
     parser = argparse.ArgumentParser()
@@ -21,7 +27,13 @@ def prepare_parser():
     parser.add_argument("-p", "--port",     dest="port",        action="store",       default=None,  help="Debug port.")
     parser.add_argument("-s", "--suspend",  dest="suspend",     action="store_true",  default=False, help="Suspend test waiting for a debugger.")
     parser.add_argument("-T", "--type",     dest="test_type",   action="store",       default="all", help="Type of test to execute (all by default)")
+    parser.add_argument("-j", "--jobs",     dest="jobs",        nargs="?", type=int, const=multiprocessing.cpu_count(), default=1, help="Number of suites to run in parallel (no-flag: 1, no-value: number of cores)")
     parser.add_argument("-r", "--results-dir",  dest="results_directory",  action="store", default=os.path.join(this_path, 'tests'),  help="Location where test results should be stored.")
+    parser.add_argument("--changed-since",  dest="changed_since",  action="store", default=None, metavar="REV", help="Run only suites affected by files changed since the given git revision.")
+    parser.add_argument("--report-slowest", dest="report_slowest", action="store", type=int, default=0, metavar="K", help="Print K slowest suites and fixtures of this run.")
+    parser.add_argument("--trend-runs",     dest="trend_runs",     action="store", type=int, default=5, metavar="N", help="Number of previous runs the slowest tests report is compared against (5 by default).")
+    parser.add_argument("--snapshot-cache", dest="snapshot_cache", action="store", default=None, metavar="DIR", help="Directory of snapshots of booted scenarios reused by tests (`snapshots` in the results directory by default).")
+    parser.add_argument("--no-snapshots",   dest="no_snapshots",   action="store_true", default=False, help="Always boot scenarios instead of restoring their snapshots.")
     return parser
 
 def call_or_die(to_call, error_message):
@@ -51,10 +63,88 @@ def handle_options(options):
         print("Testing fixture: " + options.fixture)
     if options.tests_file is not None and not options.tests:
         options.tests = [line.rstrip() for line in open(options.tests_file)]
+    if options.jobs < 1:
+        print('Number of jobs must be a positive number.')
+        sys.exit(1)
     options.configuration = 'Debug' if options.debug_mode else 'Release'
+    # passed to the emulator processes started by suites, see `snapshot_boot` in scripts/monitor.py
+    if options.no_snapshots:
+        os.environ[snapshot_cache_variable] = 'off'
+    else:
+        os.environ[snapshot_cache_variable] = os.path.abspath(options.snapshot_cache or os.path.join(options.results_directory, 'snapshots'))
+
+def register_handler(handler_type, extension, creator, before_parsing=None, after_parsing=None, inputs=None):
+    registered_handlers.append({'type': handler_type, 'extension': extension, 'creator': creator, 'before_parsing': before_parsing, 'after_parsing': after_parsing, 'inputs': inputs})
+
+def get_changed_files(revision):
+    try:
+        root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel']).decode('utf-8').strip()
+        changed = subprocess.check_output(['git', 'diff', '--name-only', revision], cwd=root).decode('utf-8').splitlines()
+        changed += subprocess.check_output(['git', 'ls-files', '--others', '--exclude-standard'], cwd=root).decode('utf-8').splitlines()
+    except subprocess.CalledProcessError:
+        print('Could not list files changed since {0}.'.format(revision))
+        sys.exit(1)
+    return [os.path.normpath(os.path.join(root, path)) for path in changed if path]
 
-def register_handler(handler_type, extension, creator, before_parsing=None, after_parsing=None):
-    registered_handlers.append({'type': handler_type, 'extension': extension, 'creator': creator, 'before_parsing': before_parsing, 'after_parsing': after_parsing})
+def is_affected(inputs, changed_files):
+    # a changed path can also be a whole submodule directory
+    inputs = set(os.path.abspath(path) for path in inputs)
+    for changed in changed_files:
+        if changed in inputs or any(path.startswith(changed + os.sep) for path in inputs):
+            return True
+    return False
+
+def create_workers(options, tests_suites):
+    # longest suites go first, so that they do not set the critical path at the end of a run
+    known_durations = [d for d in (options.timings.suite_duration(suite.path) for suite in tests_suites) if d is not None]
+    default_duration = sum(known_durations) / len(known_durations) if known_durations else 1.0
+    durations = {}
+    for suite in tests_suites:
+        duration = options.timings.suite_duration(suite.path)
+        durations[suite] = duration if duration is not None else default_duration
+    tests_suites = sorted(tests_suites, key=lambda suite: durations[suite], reverse=True)
+
+    if options.jobs == 1 or len(tests_suites) < 2:
+        return [{'options': options, 'suites': tests_suites, 'failed': False}]
+    workers = []
+    for i in range(min(options.jobs, len(tests_suites))):
+        # each worker gets its own results directory, so that copied binaries and xml outputs do not collide
+        worker_options = copy.copy(options)
+        worker_options.results_directory = os.path.join(options.results_directory, 'worker{0}'.format(i))
+        if not os.path.isdir(worker_options.results_directory):
+            os.makedirs(worker_options.results_directory)
+        workers.append({'options': worker_options, 'suites': [], 'failed': False, 'load': 0.0})
+    for suite in tests_suites:
+        worker = min(workers, key=lambda w: w['load'])
+        worker['suites'].append(suite)
+        worker['load'] += durations[suite]
+    return workers
+
+def run_workers(workers, action):
+    if len(workers) == 1:
+        action(workers[0])
+        return
+    threads = [threading.Thread(target=action, args=(worker,)) for worker in workers]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        # joining with a timeout keeps the main thread responsive to Ctrl-C
+        while thread.is_alive():
+            thread.join(1)
+
+def prepare_suites(worker):
+    for suite in worker['suites']:
+        suite.prepare(worker['options'])
+
+def run_suites(worker):
+    for suite in worker['suites']:
+        start = time.time()
+        if not suite.run(worker['options']):
+            worker['failed'] = True
+        # a suite skipped thanks to cached results would look like the shortest one in scheduling and trends
+        if not getattr(suite, 'result_cached', False):
+            worker['options'].timings.record_suite(suite.path, time.time() - start)
 
 def run():
     parser = prepare_parser()
@@ -64,6 +154,7 @@ def run():
 
     options = parser.parse_args()
     handle_options(options)
+    options.timings = tests_timings.TimingsDatabase(options.results_directory)
     for handler in registered_handlers:
         if 'after_parsing' in handler and handler['after_parsing'] is not None:
             handler['after_parsing'](options)
@@ -75,6 +166,11 @@ def run():
         except Exception as e:
             print("Failed to open output file. Falling back to STDOUT.")
 
+    changed_files = None
+    if options.changed_since is not None:
+        changed_files = get_changed_files(options.changed_since)
+        print("Found {0} files changed since {1}".format(len(changed_files), options.changed_since))
+
     print("Preparing suites")
     tests_suites = []
     for path in options.tests:
@@ -82,23 +178,29 @@ def run():
             continue
         for handler in registered_handlers:
             if (options.test_type == 'all' or handler['type'] == options.test_type) and path.endswith(handler['extension']):
-                suite = handler['creator'](path)
-                suite.prepare(options)
-                tests_suites.append(suite)
+                # suites that cannot tell their inputs are always run
+                if changed_files is not None and handler['inputs'] is not None and not is_affected(handler['inputs'](path), changed_files):
+                    print("Skipping {0}, not affected by changes".format(path))
+                    continue
+                tests_suites.append(handler['creator'](path))
+    workers = create_workers(options, tests_suites)
+    run_workers(workers, prepare_suites)
 
     print("Starting suites")
-    tests_failed = False
     counter = 0
     while options.repeat_count == 0 or counter < options.repeat_count:
         counter += 1
-        for suite in tests_suites:
-            if not suite.run(options):
-                tests_failed = True
+        run_workers(workers, run_suites)
+    tests_failed = any(worker['failed'] for worker in workers)
 
     print("Cleaning up suites")
     for suite in tests_suites:
         suite.cleanup(options)
 
+    if options.report_slowest > 0:
+        options.timings.report_slowest(options.report_slowest, options.trend_runs)
+    options.timings.save()
+
     options.output.flush()
     if options.output is not sys.stdout:
         options.output.close()
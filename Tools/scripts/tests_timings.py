@@ -0,0 +1,71 @@
+# pylint: disable=C0301,C0103,C0111
+from __future__ import print_function
+import os
+import json
+import time
+import threading
+
+class TimingsDatabase(object):
+    """Stores durations of suites and fixtures from consecutive test runs."""
+    file_name = 'timings.json'
+    max_runs = 50
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, TimingsDatabase.file_name)
+        self.lock = threading.Lock()
+        self.runs = []
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path) as f:
+                    self.runs = json.load(f)['runs']
+            except (ValueError, KeyError):
+                print("Timings database {0} is corrupted, starting a new one.".format(self.path))
+        self.current = {'timestamp': time.time(), 'suites': {}, 'fixtures': {}}
+
+    def record_suite(self, name, duration):
+        with self.lock:
+            self.current['suites'][name] = duration
+
+    def record_fixture(self, name, duration):
+        with self.lock:
+            self.current['fixtures'][name] = duration
+
+    def suite_duration(self, name):
+        return self._last_known('suites', name)
+
+    def fixture_duration(self, name):
+        return self._last_known('fixtures', name)
+
+    def save(self):
+        with self.lock:
+            if not self.current['suites'] and not self.current['fixtures']:
+                return
+            self.runs.append(self.current)
+            self.runs = self.runs[-TimingsDatabase.max_runs:]
+            if not os.path.isdir(os.path.dirname(self.path)):
+                os.makedirs(os.path.dirname(self.path))
+            with open(self.path, 'w') as f:
+                json.dump({'runs': self.runs}, f, indent=1, sort_keys=True)
+
+    def report_slowest(self, count, trend_runs):
+        # call before `save`, so that the current run is compared against previous ones only
+        previous_runs = self.runs[-trend_runs:] if trend_runs > 0 else []
+        for kind in ['suites', 'fixtures']:
+            entries = sorted(self.current[kind].items(), key=lambda entry: entry[1], reverse=True)[:count]
+            if not entries:
+                continue
+            print("Slowest {0} (trend against {1} previous runs):".format(kind, len(previous_runs)))
+            for name, duration in entries:
+                history = [run[kind][name] for run in previous_runs if name in run[kind]]
+                if history:
+                    average = sum(history) / len(history)
+                    trend = "{0:+9.2f}s ({1:+.0f}%)".format(duration - average, 100.0 * (duration - average) / average if average else 0)
+                else:
+                    trend = "      new"
+                print("  {0:10.2f}s {1} {2}".format(duration, trend, name))
+
+    def _last_known(self, kind, name):
+        for run in reversed(self.runs):
+            if name in run[kind]:
+                return run[kind][name]
+        return None
@@ -0,0 +1,225 @@
+# pylint: disable=C0301,C0103,C0111
+"""Decodes binary trace files written by the TracePlugin (`trace binary @file`) to text or CSV
+and summarizes call counts, intervals between consecutive calls and call durations."""
+from __future__ import print_function
+import sys
+import csv
+import struct
+import argparse
+
+magic = b'EMUL8TRC'
+supported_version = 1
+
+function_definition_tag = 0
+cpu_definition_tag = 1
+call_tag = 2
+return_tag = 3
+dropped_tag = 4
+
+record_header = struct.Struct('<qiIiB')
+pointer_types = set(['String', 'Int32Array', 'UInt32Array', 'ByteArray'])
+
+class TraceFormatError(Exception):
+    pass
+
+class Function(object):
+    def __init__(self, name, parameters, return_type):
+        self.name = name
+        self.parameters = parameters
+        self.return_type = return_type
+
+class Record(object):
+    def __init__(self, kind, timestamp, cpu, pc, function, values):
+        self.kind = kind
+        self.timestamp = timestamp
+        self.cpu = cpu
+        self.pc = pc
+        self.function = function
+        self.values = values
+
+class TraceReader(object):
+    """Iterates over records of a trace file, collecting function and CPU definitions on the way."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        if self._read(len(magic)) != magic:
+            raise TraceFormatError("Not a binary trace file.")
+        version, = struct.unpack('<H', self._read(2))
+        if version != supported_version:
+            raise TraceFormatError("Unsupported trace format version {0}.".format(version))
+        self.frequency, = struct.unpack('<q', self._read(8))
+        self.functions = {}
+        self.cpus = {}
+        self.dropped = 0
+
+    def __iter__(self):
+        while True:
+            tag = self.stream.read(1)
+            if not tag:
+                return
+            tag = ord(tag)
+            if tag == function_definition_tag:
+                identifier, = struct.unpack('<i', self._read(4))
+                name = self._read_string()
+                count = ord(self._read(1))
+                parameters = [self._read_string() for _ in range(count)]
+                self.functions[identifier] = Function(name, parameters, self._read_string() or None)
+            elif tag == cpu_definition_tag:
+                cpu, = struct.unpack('<i', self._read(4))
+                self.cpus[cpu] = self._read_string()
+            elif tag in (call_tag, return_tag):
+                timestamp, cpu, pc, function, count = record_header.unpack(self._read(record_header.size))
+                values = struct.unpack('<{0}I'.format(count), self._read(4 * count))
+                yield Record(tag, timestamp, cpu, pc, function, values)
+            elif tag == dropped_tag:
+                count, = struct.unpack('<q', self._read(8))
+                self.dropped += count
+            else:
+                raise TraceFormatError("Unknown entry tag {0}, the file is corrupted.".format(tag))
+
+    def function_name(self, identifier):
+        function = self.functions.get(identifier)
+        return function.name if function else "function{0}".format(identifier)
+
+    def cpu_name(self, cpu):
+        return self.cpus.get(cpu, "cpu{0}".format(cpu))
+
+    def format_values(self, record):
+        function = self.functions.get(record.function)
+        if function is None:
+            types = []
+        elif record.kind == call_tag:
+            types = function.parameters
+        else:
+            types = [function.return_type]
+        result = []
+        for i, value in enumerate(record.values):
+            value_type = types[i] if i < len(types) else 'UInt32'
+            if value_type == 'Ignore':
+                continue
+            result.append(format_value(value, value_type))
+        return result
+
+    def _read(self, count):
+        data = self.stream.read(count)
+        if len(data) != count:
+            # the writer can be stopped in the middle of a record, e.g. when the emulator is killed
+            raise TraceFormatError("Unexpected end of the trace file.")
+        return data
+
+    def _read_string(self):
+        length, = struct.unpack('<H', self._read(2))
+        return self._read(length).decode('utf-8')
+
+def format_value(value, value_type):
+    if value_type == 'Int32':
+        return str(value - (1 << 32) if value & 0x80000000 else value)
+    if value_type == 'Int16':
+        value &= 0xFFFF
+        return str(value - (1 << 16) if value & 0x8000 else value)
+    if value_type == 'UInt16':
+        return str(value & 0xFFFF)
+    if value_type == 'Byte':
+        return str(value & 0xFF)
+    if value_type in pointer_types:
+        return "0x{0:X}".format(value)
+    return str(value)
+
+class Aggregate(object):
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def __str__(self):
+        if not self.count:
+            return "-"
+        return "{0:.3f}/{1:.3f}/{2:.3f}".format(self.minimum * 1e6, self.total / self.count * 1e6, self.maximum * 1e6)
+
+class Statistics(object):
+    """Aggregates per function call counts, intervals between consecutive calls on the same CPU and durations of calls with traced returns."""
+
+    def __init__(self):
+        self.functions = {}
+        self.last_calls = {}
+        self.pending = {}
+
+    def add(self, record, seconds):
+        entry = self.functions.setdefault(record.function, {'calls': 0, 'returns': 0, 'intervals': Aggregate(), 'durations': Aggregate()})
+        key = (record.cpu, record.function)
+        if record.kind == call_tag:
+            entry['calls'] += 1
+            if key in self.last_calls:
+                entry['intervals'].add(seconds - self.last_calls[key])
+            self.last_calls[key] = seconds
+            # recursive calls are matched with returns in the reverse order
+            self.pending.setdefault(key, []).append(seconds)
+        else:
+            entry['returns'] += 1
+            starts = self.pending.get(key)
+            if starts:
+                entry['durations'].add(seconds - starts.pop())
+
+    def report(self, reader, output):
+        rows = sorted(self.functions.items(), key=lambda item: item[1]['calls'], reverse=True)
+        width = max([len(reader.function_name(identifier)) for identifier, _ in rows] + [len("function")])
+        line = "{0:<{1}} {2:>10} {3:>10}  {4:<32} {5}\n"
+        output.write(line.format("function", width, "calls", "returns", "interval min/avg/max [us]", "duration min/avg/max [us]"))
+        for identifier, entry in rows:
+            output.write(line.format(reader.function_name(identifier), width, entry['calls'], entry['returns'], str(entry['intervals']), str(entry['durations'])))
+        if reader.dropped:
+            output.write("{0} records were dropped because the trace buffer overflowed.\n".format(reader.dropped))
+
+def main():
+    parser = argparse.ArgumentParser(description="Decodes binary trace files written by the TracePlugin.")
+    parser.add_argument("trace", help="Path of the trace file.")
+    parser.add_argument("-f", "--format", dest="format", choices=['text', 'csv', 'none'], default='text', help="Format of decoded records, 'none' prints the summary only.")
+    parser.add_argument("-s", "--summary", dest="summary", action="store_true", default=False, help="Print call counts and timing statistics of traced functions.")
+    parser.add_argument("-o", "--output", dest="output", action="store", default=None, help="Write decoded records to the file instead of the standard output.")
+    options = parser.parse_args()
+
+    output = open(options.output, 'w') if options.output else sys.stdout
+    statistics = Statistics()
+    try:
+        with open(options.trace, 'rb') as stream:
+            reader = TraceReader(stream)
+            writer = None
+            if options.format == 'csv':
+                writer = csv.writer(output, lineterminator='\n')
+                writer.writerow(['time_us', 'cpu', 'event', 'function', 'pc', 'values'])
+            start = None
+            try:
+                for record in reader:
+                    if start is None:
+                        start = record.timestamp
+                    seconds = float(record.timestamp - start) / reader.frequency
+                    if options.summary:
+                        statistics.add(record, seconds)
+                    if options.format == 'none':
+                        continue
+                    values = reader.format_values(record)
+                    if writer is not None:
+                        writer.writerow(["{0:.3f}".format(seconds * 1e6), reader.cpu_name(record.cpu), 'call' if record.kind == call_tag else 'return', reader.function_name(record.function), "0x{0:X}".format(record.pc), ' '.join(values)])
+                    else:
+                        output.write("{0:14.3f} {1}: {2} {3} @ 0x{4:X} ({5})\n".format(seconds * 1e6, reader.cpu_name(record.cpu), "call" if record.kind == call_tag else "return from", reader.function_name(record.function), record.pc, ', '.join(values)))
+            except TraceFormatError as e:
+                print("{0}: {1}".format(options.trace, e), file=sys.stderr)
+    except (IOError, TraceFormatError) as e:
+        print("{0}: {1}".format(options.trace, e), file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if options.summary:
+        statistics.report(reader, sys.stdout)
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,28 @@
-# Maximum number of parameters in function
+# pylint: disable=C0301,C0103,C0111
+"""Generates C typedefs and C# delegates used to bind native callbacks with the managed code.
+
+Only the signatures referenced in the C and C# sources are generated; `--all` brings back
+every combination of `types` up to `max_params` parameters. `--check` verifies that the generated
+files contain all referenced signatures instead of writing them.
+"""
+from __future__ import print_function
+import os
+import re
+import sys
+import json
+import argparse
+import itertools
+
+this_path = os.path.abspath(os.path.dirname(__file__))
+root_path = os.path.abspath(os.path.join(this_path, '..', '..'))
+header_path = os.path.join(root_path, 'Emulator', 'Cores', 'emul8', 'include', 'emul8_imports_generated.h')
+csharp_path = os.path.join(root_path, 'Emulator', 'Main', 'Utilities', 'Binding', 'BindingTypes.Generated.cs')
+cache_path = os.path.join(root_path, 'output', 'types_generate_cache.json')
+# the translation libraries declare most of the imports, each of them needs a delegate at bind time
+tlib_path = os.path.join(root_path, 'Emulator', 'Cores', 'tlib')
+ignored_directories = set(['.git', 'bin', 'obj', 'target', 'output', 'External'])
+
+# Maximum number of parameters in function, used with --all only
 max_params = 3
 
 # Dictionary: key is the C# type, value - a C one
@@ -9,102 +33,255 @@ types["IntPtr"] = "void *"
 types["String"] = "char *"
 types["UInt64"] = "uint64_t"
 
-import itertools
+lower_types = dict((t.lower(), t) for t in types)
+type_names = '|'.join(sorted(types, key=len, reverse=True))
+c_pattern = re.compile(r'\b(action|func)((?:_(?:{0}))*)\b'.format('|'.join(sorted(lower_types, key=len, reverse=True))))
+csharp_pattern = re.compile(r'\b(?:Attach)?(Action|Func)((?:{0})*)\b'.format(type_names))
+csharp_type_pattern = re.compile(type_names)
 
-typedefs = []
-csharpdefs = []
-rets = []
-vars = []
-args = []
-keywords = []
-typedef_to_delegates = {}
+header_prologue = """#ifndef EMUL8_IMPORTS_GENERATED_H_
+#define EMUL8_IMPORTS_GENERATED_H_
 
-def make_delegate_name(args, return_type):
-	return ("Action" if return_type == "void" else "Func%s" % return_type) + ("" if not args else reduce(lambda x, y: x + y, args))
+#include <stdint.h>
 
-def make_csharp_def(args, return_type):
-	cs_name = make_delegate_name(args, return_type)
-	number_iterator = range(i).__iter__()
-	cs_args = map(lambda x: "%s param%d" % (x, number_iterator.next()), args)
-	csharpdef = "[UnmanagedFunctionPointer(CallingConvention.Cdecl)]\npublic delegate %s %s(%s);" % (return_type, cs_name, "" if not cs_args else reduce(lambda x, y: x + ", " + y, cs_args))
-	attacherdef = "[UnmanagedFunctionPointer(CallingConvention.Cdecl)]\npublic delegate void Attach%s(%s param);" % (cs_name, cs_name)
-	return (csharpdef, attacherdef)
+/*
+ * This is automatically generated contents. You are advised not to change
+ * it manually. You can recreate it (with given parameter types)
+ * using Tools/scripts/types_generate.py.
+ */
+"""
+
+csharp_prologue = """//
+// Copyright (c) Antmicro
+// Copyright (c) Realtime Embedded
+//
+// This file is part of the Emul8 project.
+// Full license details are defined in the 'LICENSE' file.
+//
+using System;
+using System.Runtime.InteropServices;
+
+namespace Emul8.Utilities.Binding
+{
+"""
+
+def make_delegate_name(args, return_type):
+    return ("Action" if return_type == "void" else "Func%s" % return_type) + ''.join(args)
 
 def make_typedef_name(args, return_type):
-	return ("action" if return_type == "void" else "func_%s" % return_type.lower()) + ("" if not args else ("_" + reduce(lambda x, y: x + "_" + y, map(lambda t: t.lower(), args))))
+    return '_'.join(["action" if return_type == "void" else "func_%s" % return_type.lower()] + [a.lower() for a in args])
 
 def make_c_def(args, return_type):
-	c_name = make_typedef_name(args, return_type)
-	if(c_name.endswith("_")):
-		c_name = c_name[0:len(c_name)-1]
-	c_args = map(lambda x: types[x], args)
-	typedef = "typedef %s (*%s)(%s);" % ("void" if return_type == "void" else types[return_type], c_name, "void" if not c_args else reduce(lambda x, y: x + ", " + y, c_args))
-	return typedef
-
-for i in range(1, max_params + 1):
-	product = itertools.product(types, repeat = i)
-	# C# delegate definition
-	for p in product:
-		# actions first
-		typedefs.append(make_c_def(p, "void"))
-		csharpdefs.append(make_csharp_def(p, "void"))
-                typedef_name = make_typedef_name(p, "void")
-		typedef_to_delegates[typedef_name] = make_delegate_name(p, "void")
-		keywords.append("#define %s_keyword$"%typedef_name)
-                rets.append("#define %s_return$ void"%typedef_name)
-                vars.append("#define %s_vars$ %s"%(typedef_name, ', '.join([chr(x + 97) for x in range(0, len(p))])))
-                args.append("#define %s_args$ %s"%(typedef_name, ', '.join([str("%s %c"%(types[p[x]], chr(x + 97))) for x in range(0, len(p))])))
-		# functions then
-		for t in types:
-                        typedef_name = make_typedef_name(p, t)
-			typedefs.append(make_c_def(p, t))
-			csharpdefs.append(make_csharp_def(p, t))
-			typedef_to_delegates[typedef_name] = make_delegate_name(p, t)
-		        keywords.append("#define %s_keyword$ return"%typedef_name)
-                        vars.append("#define %s_vars$ %s"%(typedef_name, ', '.join([chr(x + 97) for x in range(0, len(p))])))
-                        rets.append("#define %s_return$ %s"%(typedef_name, types[t]))
-                        args.append("#define %s_args$ %s"%(typedef_name, ', '.join([str("%s %c"%(types[p[x]], chr(x + 97))) for x in range(0, len(p))])))
-# and the special case, function and action with no args TODO
-typedefs.append(make_c_def([], "void"))
-typedef_to_delegates["action"] = "Action"
-keywords.append("#define action_keyword$")
-rets.append("#define action_return$ void")
-vars.append("#define action_vars$ ")
-args.append("#define action_args$ ")
-# C# has predefined Action, but not the attacher
-csharpdefs.append(("", "public delegate void AttachAction(System.Action param);"))
-for t in types:
-        typedef_name = make_typedef_name([], t)
-	typedefs.append(make_c_def([], t))
-	csharpdefs.append(make_csharp_def([], t))
-	typedef_to_delegates[typedef_name] = make_delegate_name([], t)
-        keywords.append("#define %s_keyword$ return"%typedef_name)
-        rets.append("#define %s_return$ %s" % (typedef_name, types[t]))
-        vars.append("#define %s_vars$ " % typedef_name)
-        args.append("#define %s_args$ " % typedef_name)
-
-for key in typedef_to_delegates:
-	print "#define EMUL8_EXT_TYPE_%s %s" % (key,typedef_to_delegates[key])
-
-for t in typedefs:
-	print t
-
-for r in rets:
-        print r
-
-for k in keywords:
-        print k
-
-for v in vars:
-        print v
-
-for a in args:
-        print a
-
-print ""
-print "---------------------------------"
-print ""
-
-for (d, a) in csharpdefs:
-	print d
-	print a
+    c_args = [types[a] for a in args]
+    return "typedef %s (*%s)(%s);" % ("void" if return_type == "void" else types[return_type], make_typedef_name(args, return_type), ', '.join(c_args) if c_args else "void")
+
+def make_csharp_def(args, return_type):
+    cs_name = make_delegate_name(args, return_type)
+    attacherdef = "  [UnmanagedFunctionPointer(CallingConvention.Cdecl)]\n  public delegate void Attach%s(%s param);" % (cs_name, cs_name)
+    if not args and return_type == "void":
+        # C# has predefined Action, but not the attacher
+        return "  public delegate void AttachAction(System.Action param);"
+    cs_args = ', '.join("%s param%d" % (a, i) for i, a in enumerate(args))
+    csharpdef = "  [UnmanagedFunctionPointer(CallingConvention.Cdecl)]\n  public delegate %s %s(%s);" % (return_type, cs_name, cs_args)
+    return csharpdef + "\n" + attacherdef
+
+def find_c_signatures(content):
+    result = set()
+    for kind, args in c_pattern.findall(content):
+        args = [lower_types[a] for a in args.split('_')[1:]]
+        if kind == 'action':
+            result.add((tuple(args), 'void'))
+        elif args:
+            result.add((tuple(args[1:]), args[0]))
+    return result
+
+def find_csharp_signatures(content):
+    result = set()
+    for kind, args in csharp_pattern.findall(content):
+        args = csharp_type_pattern.findall(args)
+        if kind == 'Action':
+            # bare Action is the one from System, the attacher is always generated anyway
+            if args:
+                result.add((tuple(args), 'void'))
+        elif args:
+            result.add((tuple(args[1:]), args[0]))
+    return result
+
+def scan_sources(roots, excluded, cache):
+    """Returns signatures referenced in C and C# sources under roots, reusing results cached for unchanged files."""
+    signatures = set()
+    files = {}
+    for root in roots:
+        for directory, directories, names in os.walk(root):
+            directories[:] = sorted(d for d in directories if d not in ignored_directories)
+            for name in sorted(names):
+                path = os.path.join(directory, name)
+                if name.endswith(('.c', '.h')):
+                    finder = find_c_signatures
+                elif name.endswith('.cs'):
+                    finder = find_csharp_signatures
+                else:
+                    continue
+                if os.path.abspath(path) in excluded:
+                    continue
+                stat = os.stat(path)
+                stamp = [stat.st_size, stat.st_mtime]
+                entry = cache.get(path)
+                if entry is None or entry['stamp'] != stamp:
+                    with open(path, 'rb') as f:
+                        content = f.read().decode('utf-8', 'replace')
+                    entry = {'stamp': stamp, 'signatures': sorted([list(a), r] for a, r in finder(content))}
+                files[path] = entry
+                signatures.update((tuple(a), r) for a, r in entry['signatures'])
+    return signatures, files
+
+def all_signatures():
+    result = set()
+    for i in range(0, max_params + 1):
+        for p in itertools.product(sorted(types), repeat=i):
+            result.add((p, 'void'))
+            for t in types:
+                result.add((p, t))
+    return result
+
+def parse_signature(name):
+    found = find_c_signatures(name) | find_csharp_signatures(name)
+    if not found:
+        raise ValueError("Unknown signature '{0}', expected a typedef name like func_uint32_int32 or a delegate name like FuncUInt32Int32.".format(name))
+    return found
+
+def generate_header(signatures):
+    # sorted by typedef name, so the output only changes when the set of signatures does
+    ordered = sorted(signatures, key=lambda s: make_typedef_name(*s))
+    lines = [header_prologue]
+    for args, ret in ordered:
+        lines.append("#define EMUL8_EXT_TYPE_%s %s" % (make_typedef_name(args, ret), make_delegate_name(args, ret)))
+    lines.append("")
+    for args, ret in ordered:
+        lines.append(make_c_def(args, ret))
+    lines.append("")
+    for args, ret in ordered:
+        lines.append("#define %s_return$ %s" % (make_typedef_name(args, ret), "void" if ret == "void" else types[ret]))
+    for args, ret in ordered:
+        lines.append(("#define %s_keyword$" + ("" if ret == "void" else " return")) % make_typedef_name(args, ret))
+    for args, ret in ordered:
+        lines.append("#define %s_vars$ %s" % (make_typedef_name(args, ret), ', '.join(chr(x + 97) for x in range(len(args)))))
+    for args, ret in ordered:
+        lines.append("#define %s_args$ %s" % (make_typedef_name(args, ret), ', '.join("%s %c" % (types[a], chr(x + 97)) for x, a in enumerate(args))))
+    lines.append("")
+    lines.append("#endif")
+    return '\n'.join(lines) + '\n'
+
+def generate_csharp(signatures):
+    ordered = sorted(signatures, key=lambda s: make_delegate_name(*s))
+    return csharp_prologue + '\n'.join(make_csharp_def(args, ret) for args, ret in ordered) + '\n}\n'
+
+def find_missing_sources(roots):
+    """Returns a description of sources that would be left out of the scan, or None if all of them are available."""
+    tlib_directory = os.path.abspath(tlib_path)
+    scanned = any(tlib_directory == os.path.abspath(r) or tlib_directory.startswith(os.path.abspath(r) + os.sep) for r in roots)
+    if scanned and not os.path.isfile(os.path.join(tlib_directory, 'callbacks.c')):
+        return "The tlib submodule ({0}) is not checked out, imports it declares cannot be found. Run `git submodule update --init` or use --all.".format(tlib_directory)
+    return None
+
+def read_file(path):
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+def check(signatures, header, csharp):
+    """Returns descriptions of differences between the generated files and the signatures they should contain."""
+    header_content = read_file(header)
+    csharp_content = read_file(csharp)
+    if header_content is None or csharp_content is None:
+        return ["{0} does not exist.".format(path) for path, content in ((header, header_content), (csharp, csharp_content)) if content is None]
+    problems = []
+    generated = find_c_signatures(header_content)
+    for args, ret in sorted(signatures - generated):
+        problems.append("{0} is used in the sources, but it is not generated.".format(make_typedef_name(args, ret)))
+    # additional signatures are harmless, but the files must be the output of the script for the signatures they hold
+    if header_content != generate_header(generated):
+        problems.append("{0} was not generated by this script or was edited by hand.".format(header))
+    if csharp_content != generate_csharp(generated):
+        problems.append("{0} does not match signatures of {1}.".format(csharp, header))
+    return problems
+
+def write_if_changed(path, content):
+    # keeping the old file untouched spares rebuilding everything that depends on it
+    if os.path.isfile(path):
+        with open(path, 'rb') as f:
+            if f.read().decode('utf-8') == content:
+                return False
+    with open(path, 'wb') as f:
+        f.write(content.encode('utf-8'))
+    return True
+
+def load_cache(path):
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    # results depend on the script itself, e.g. on the list of types
+    if cache.get('types') != sorted(types):
+        return {}
+    return cache.get('files', {})
+
+def save_cache(path, files):
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(path, 'w') as f:
+        json.dump({'types': sorted(types), 'files': files}, f, sort_keys=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates C typedefs and C# delegates for signatures of native callbacks referenced in the sources.")
+    parser.add_argument("roots", nargs="*", default=[os.path.join(root_path, d) for d in ('Emulator', 'Plugins')], help="Directories to scan for C and C# sources (Emulator and Plugins by default).")
+    parser.add_argument("--all", dest="all", action="store_true", default=False, help="Generate all combinations of types with up to {0} parameters instead of the referenced ones.".format(max_params))
+    parser.add_argument("--extra", dest="extra", action="append", default=[], help="Additional signature to generate, e.g. for sources outside of the tree (func_uint32_int32 or FuncUInt32Int32).")
+    parser.add_argument("--header", dest="header", action="store", default=header_path, help="Path of the generated C header.")
+    parser.add_argument("--csharp", dest="csharp", action="store", default=csharp_path, help="Path of the generated C# file.")
+    parser.add_argument("--cache", dest="cache", action="store", default=cache_path, help="Path of the file caching signatures found in sources.")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false", default=True, help="Scan all sources, ignoring the cache.")
+    parser.add_argument("--check", dest="check", action="store_true", default=False, help="Do not write the files, fail if they lack any of the signatures or differ from the output of the script.")
+    options = parser.parse_args()
+
+    signatures = set([((), 'void')])
+    for extra in options.extra:
+        try:
+            signatures.update(parse_signature(extra))
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+    if options.all:
+        signatures.update(all_signatures())
+    else:
+        # generating from a partial checkout would drop delegates the native libraries still need
+        missing_sources = find_missing_sources(options.roots)
+        if missing_sources is not None:
+            print(missing_sources)
+            sys.exit(1)
+        cache = load_cache(options.cache) if options.use_cache else {}
+        excluded = set(os.path.abspath(p) for p in (options.header, options.csharp))
+        found, files = scan_sources(options.roots, excluded, cache)
+        signatures.update(found)
+        if options.use_cache:
+            save_cache(options.cache, files)
+
+    if options.check:
+        problems = check(signatures, options.header, options.csharp)
+        for problem in problems:
+            print(problem)
+        if problems:
+            print("Run Tools/scripts/types_generate.py to update the generated files.")
+            sys.exit(1)
+        print("Generated files contain all {0} required signatures.".format(len(signatures)))
+        return
+
+    for path, content in ((options.header, generate_header(signatures)), (options.csharp, generate_csharp(signatures))):
+        print("{0}: {1}".format(path, "updated" if write_if_changed(path, content) else "up to date"))
+    print("{0} signatures".format(len(signatures)))
+
+if __name__ == '__main__':
+    main()
@@ -68,6 +68,11 @@ fi
 
 pushd "${ROOT_PATH:=.}/Tools/scripts" > /dev/null
 ./check_weak_implementations.sh
+# delegates for imports of the native libraries are generated, see doc/source/native_managed_bindings.rst
+if [ -x "$(command -v python)" ]
+then
+    python types_generate.py --check
+fi
 popd > /dev/null
 
 # Build CCTask in Release configuration
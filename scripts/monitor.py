@@ -1,4 +1,10 @@
+import re
 from time import sleep
+try:
+    import csv
+except ImportError:
+    # without the standard library, the writer comes from the module built into IronPython
+    import _csv as csv
 
 current_value = 0
 
@@ -23,65 +29,414 @@ def mc_echo(*value):
         return
     print "usage: echo [-n] [string]"
 
-def mc_dump(mem_start_val, mem_count_val, wid_val = 16):
+dump_chunk_size = 64 * 1024
+# Latin-1 decoding maps every byte to a single character; non-printable ones are then replaced with dots
+dump_printable = "".join(chr(c) if 0x20 <= c < 0x7F else "." for c in range(256))
+
+def mc_dump(mem_start_val, mem_count_val, wid_val = 16, group_val = 1, squeeze = False, filename = None):
     wid = int(wid_val)
+    group = int(group_val)
     sysbus = self.Machine["sysbus"]
     mem_start = int(mem_start_val)
-    mem_count = int(mem_count_val)
-    for a in range(mem_start, mem_start + mem_count, wid):
-        data = sysbus.ReadBytes(a, wid)
-        print "0x%08X |" % a,
-        for b in range(0, wid):
-            print "%02X" % data[b] ,
-        print "| " ,
-        for b in range(0, wid):
-            c = data[b]
-            if not ((c < 0x20) or (c > 127)):
-                print "%c%c" % (chr(8), chr(c)) ,
-            else:
-                print "%c." % chr(8) ,
-        print
+    mem_end = mem_start + int(mem_count_val)
+    chunk_size = max(wid, dump_chunk_size - dump_chunk_size % wid)
+    data = System.Array.CreateInstance(System.Byte, chunk_size)
+    latin1 = System.Text.Encoding.GetEncoding(28591)
+    hex_width = 2 * wid + (wid + group - 1) // group - 1
+    output = open(filename, "w") if filename is not None else sys.stdout
+    previous_row = None
+    skipping = False
+    try:
+        for chunk_start in range(mem_start, mem_end, chunk_size):
+            count = min(chunk_size, mem_end - chunk_start)
+            sysbus.ReadBytes(chunk_start, count, data, 0)
+            lines = []
+            for offset in range(0, count, wid):
+                length = min(wid, count - offset)
+                row = System.BitConverter.ToString(data, offset, length)
+                address = chunk_start + offset
+                if squeeze and row == previous_row and address + length < mem_end:
+                    if not skipping:
+                        lines.append("*\n")
+                        skipping = True
+                    continue
+                previous_row = row
+                skipping = False
+                if group == 1:
+                    hex_row = row.replace("-", " ")
+                else:
+                    row = row.replace("-", "")
+                    hex_row = " ".join(row[i:i + 2 * group] for i in range(0, len(row), 2 * group))
+                ascii_row = latin1.GetString(data, offset, length).translate(dump_printable)
+                lines.append("0x%08X | %s | %s\n" % (address, hex_row.ljust(hex_width), ascii_row))
+            output.write("".join(lines))
+    finally:
+        if output is not sys.stdout:
+            output.close()
 
 def mc_uboot_dump_load(filename):
     sysbus = self.Machine["sysbus"]
+    tag_name = filename.split("/")[-1]
+    # contiguous words are merged into blocks, each installed as a single value tag
+    blocks = 0
+    words = 0
+    block_start = None
+    block_values = []
     fl = System.IO.StreamReader(filename)
-    line = fl.ReadToEnd()
-    arr = line.split("\n")
-    for line in arr:
-        data = line.split(":")
-        if data[0] == "":
-            continue
-        if data[0][0] == "#":
-            continue
-        try:
-            addr = System.Convert.ToUInt32(data[0], 16)
-        except:
-            continue
-        count = 0
-        print "addr: 0x%08X, writing" % addr ,
-        bts = data[1].split(" ")
-        for b in bts:
-            if b.Length != 8:
+    try:
+        while True:
+            line = fl.ReadLine()
+            if line is None:
+                break
+            data = line.split(":")
+            if data[0] == "" or data[0][0] == "#" or len(data) < 2:
                 continue
             try:
-                val = System.Convert.ToUInt32(b, 16)
-            except:
+                addr = int(data[0], 16)
+            except ValueError:
                 continue
-            print "...." ,
-            tn = filename.split("/")[-1]
-            sysbus.Tag(Emul8.Core.Range((addr+count), 4), "%s_%08X" % (tn,addr+count), val)
-            count += 4
-        print
-    fl.Close()
+            if block_start is not None and addr != block_start + 4 * len(block_values):
+                sysbus.TagValues(block_start, System.Array[System.UInt32](block_values), tag_name)
+                blocks += 1
+                block_start = None
+                block_values = []
+            for b in data[1].split(" "):
+                if len(b) != 8:
+                    continue
+                try:
+                    val = int(b, 16)
+                except ValueError:
+                    continue
+                if block_start is None:
+                    block_start = addr
+                block_values.append(val)
+                words += 1
+        if block_start is not None:
+            sysbus.TagValues(block_start, System.Array[System.UInt32](block_values), tag_name)
+            blocks += 1
+    finally:
+        fl.Close()
+    print "Loaded %d words in %d ranges from %s" % (words, blocks, filename)
 
-def mc_dump_file(mem_start_val, mem_count_val, filename):
+find_chunk_size = 1024 * 1024
+
+def find_pattern_bytes(pattern, big_endian):
+    # returns a list of (value, mask) pairs, one per byte of the pattern
+    if not isinstance(pattern, str):
+        value, mask = int(pattern), 0xFFFFFFFF
+    elif pattern.startswith("word:"):
+        value, _, mask = pattern[5:].partition("/")
+        value, mask = int(value, 0), int(mask, 0) if mask else 0xFFFFFFFF
+    elif pattern.startswith("hex:"):
+        digits = pattern[4:].replace(" ", "")
+        return [(0, 0) if digits[i:i + 2] == "??" else (int(digits[i:i + 2], 16), 0xFF) for i in range(0, len(digits), 2)]
+    else:
+        return [(ord(c), 0xFF) for c in pattern]
+    shifts = [24, 16, 8, 0] if big_endian else [0, 8, 16, 24]
+    return [((value >> s) & 0xFF, (mask >> s) & 0xFF) for s in shifts]
+
+def find_byte_regex(value, mask):
+    if mask == 0xFF:
+        return "\\x%02x" % value
+    if mask == 0:
+        return "[\\x00-\\xff]"
+    return "[%s]" % "".join("\\x%02x" % c for c in range(256) if c & mask == value & mask)
+
+def find_in_memory(mem_start_val, mem_count_val, args, default_max_hits):
+    sysbus = self.Machine["sysbus"]
+    mem_start = int(mem_start_val)
+    mem_end = mem_start + int(mem_count_val)
+    alignment = 1
+    max_hits = default_max_hits
+    patterns = []
+    big_endian = str(sysbus.Endianess) == "BigEndian"
+    for arg in args:
+        if isinstance(arg, str) and arg.startswith("align="):
+            alignment = int(arg[6:], 0)
+        elif isinstance(arg, str) and arg.startswith("max="):
+            max_hits = int(arg[4:], 0)
+        elif arg != "":
+            patterns.append(find_pattern_bytes(arg, big_endian))
+    if not patterns:
+        print "usage: find[_all] <start> <count> <pattern>... [align=N] [max=N]"
+        print "pattern: number (bus-endian word), \"word:VALUE/MASK\", \"hex:DE??BEEF\" or a string"
+        return
+    # all patterns are searched for in one pass; the lookahead reports overlapping matches too
+    regex = re.compile("(?=(%s))" % "|".join("".join(find_byte_regex(v, m) for v, m in p) for p in patterns))
+    overlap = max(len(p) for p in patterns) - 1
+    data = System.Array.CreateInstance(System.Byte, find_chunk_size + overlap)
+    latin1 = System.Text.Encoding.GetEncoding(28591)
+    hits = 0
+    for chunk_start in range(mem_start, mem_end, find_chunk_size):
+        count = min(find_chunk_size + overlap, mem_end - chunk_start)
+        sysbus.ReadBytes(chunk_start, count, data, 0)
+        for match in regex.finditer(latin1.GetString(data, 0, count)):
+            # matches starting in the overlap are reported with the next chunk
+            if match.start() >= find_chunk_size:
+                break
+            address = chunk_start + match.start()
+            if address % alignment != 0:
+                continue
+            print "0x%08X: %s" % (address, " ".join("%02X" % ord(c) for c in match.group(1)))
+            hits += 1
+            if max_hits > 0 and hits >= max_hits:
+                return
+    if hits == 0:
+        print "Pattern not found"
+
+def mc_find(mem_start_val, mem_count_val, *args):
+    find_in_memory(mem_start_val, mem_count_val, args, 1)
+
+def mc_find_all(mem_start_val, mem_count_val, *args):
+    find_in_memory(mem_start_val, mem_count_val, args, 0)
+
+file_chunk_size = 1024 * 1024
+file_page_size = 4096
+file_zero_page = "\0" * file_page_size
+
+def open_dump_file(filename, mode, access, compress):
+    if compress is None:
+        compress = filename.endswith(".gz")
+    stream = System.IO.FileStream(filename, mode, access)
+    if not compress:
+        return stream
+    direction = System.IO.Compression.CompressionMode.Compress if access == System.IO.FileAccess.Write else System.IO.Compression.CompressionMode.Decompress
+    return System.IO.Compression.GZipStream(stream, direction)
+
+def mc_dump_file(mem_start_val, mem_count_val, filename, compress = None):
     sysbus = self.Machine["sysbus"]
     mem_start = int(mem_start_val)
     mem_count = int(mem_count_val)
-    tab = sysbus.ReadBytes(mem_start, mem_count)
-    fl = System.IO.FileStream(filename, System.IO.FileMode.Create, System.IO.FileAccess.Write)
-    fl.Write(tab, 0, mem_count)
-    fl.Close()
+    data = System.Array.CreateInstance(System.Byte, max(1, min(file_chunk_size, mem_count)))
+    latin1 = System.Text.Encoding.GetEncoding(28591)
+    fl = open_dump_file(filename, System.IO.FileMode.Create, System.IO.FileAccess.Write, compress)
+    # zero pages are skipped, leaving holes in the file; compressed streams cannot seek, but compress zeros well anyway
+    sparse = fl.CanSeek
+    try:
+        for position in range(0, mem_count, data.Length):
+            count = min(data.Length, mem_count - position)
+            sysbus.ReadBytes(mem_start + position, count, data, 0)
+            if not sparse:
+                fl.Write(data, 0, count)
+                continue
+            for offset in range(0, count, file_page_size):
+                length = min(file_page_size, count - offset)
+                if length == file_page_size and latin1.GetString(data, offset, length) == file_zero_page:
+                    fl.Seek(length, System.IO.SeekOrigin.Current)
+                else:
+                    fl.Write(data, offset, length)
+        if sparse:
+            # trailing holes are not allocated until the file length is set explicitly
+            fl.SetLength(mem_count)
+    finally:
+        fl.Close()
+
+def mc_load_file(filename, mem_start_val, compress = None):
+    sysbus = self.Machine["sysbus"]
+    mem_start = int(mem_start_val)
+    data = System.Array.CreateInstance(System.Byte, file_chunk_size)
+    fl = open_dump_file(filename, System.IO.FileMode.Open, System.IO.FileAccess.Read, compress)
+    position = 0
+    try:
+        while True:
+            count = fl.Read(data, 0, data.Length)
+            if count == 0:
+                break
+            sysbus.WriteBytes(data, mem_start + position, 0, count)
+            position += count
+    finally:
+        fl.Close()
+    print "Loaded 0x%X bytes at 0x%08X" % (position, mem_start)
+
+memsnap_page_size = 4096
+memsnap_budget = 256 * 1024 * 1024
+# snapshots in the order they were taken; each keeps hashes of all pages and contents of pages changed since the previous one
+memsnaps = []
+
+def memsnap_find(name):
+    for snap in memsnaps:
+        if snap["name"] == name:
+            return snap
+    return None
+
+def memsnap_size(snap):
+    return len(snap["hashes"]) * 48 + sum(page.Length for page in snap["pages"].values())
+
+def memsnap_read(sysbus, start, count, callback):
+    # calls callback(index, data, offset, length) for each page of the range
+    chunk_size = max(memsnap_page_size, file_chunk_size - file_chunk_size % memsnap_page_size)
+    data = System.Array.CreateInstance(System.Byte, chunk_size)
+    index = 0
+    for chunk_start in range(start, start + count, chunk_size):
+        length = min(chunk_size, start + count - chunk_start)
+        sysbus.ReadBytes(chunk_start, length, data, 0)
+        for offset in range(0, length, memsnap_page_size):
+            callback(index, data, offset, min(memsnap_page_size, length - offset))
+            index += 1
+
+def memsnap_copy(data, offset, length):
+    page = System.Array.CreateInstance(System.Byte, length)
+    System.Array.Copy(data, offset, page, 0, length)
+    return page
+
+def mc_memsnap(name, mem_start_val, mem_count_val):
+    sysbus = self.Machine["sysbus"]
+    start = int(mem_start_val)
+    count = int(mem_count_val)
+    previous = None
+    for snap in memsnaps:
+        if snap["start"] == start and snap["count"] == count:
+            previous = snap
+    md5 = System.Security.Cryptography.MD5.Create()
+    snap = {"name": name, "start": start, "count": count, "hashes": [], "pages": {}}
+    def add_page(index, data, offset, length):
+        page_hash = System.BitConverter.ToString(md5.ComputeHash(data, offset, length))
+        snap["hashes"].append(page_hash)
+        if previous is not None and previous["hashes"][index] != page_hash:
+            snap["pages"][index] = memsnap_copy(data, offset, length)
+    memsnap_read(sysbus, start, count, add_page)
+    old = memsnap_find(name)
+    if old is not None:
+        memsnaps.remove(old)
+    memsnaps.append(snap)
+    # the newest snapshot is never evicted
+    while len(memsnaps) > 1 and sum(memsnap_size(s) for s in memsnaps) > memsnap_budget:
+        print "Evicting snapshot %s" % memsnaps[0]["name"]
+        memsnaps.pop(0)
+    print "Snapshot %s: %d pages, %d changed since %s" % (name, len(snap["hashes"]), len(snap["pages"]), previous["name"] if previous is not None else "-")
+
+def memsnap_changed_ranges(base, length, old_page, new_page):
+    # byte granular ranges, if contents of both versions of the page are known
+    if old_page is None or new_page is None:
+        return [(base, base + length)]
+    ranges = []
+    begin = None
+    for i in range(min(old_page.Length, new_page.Length)):
+        if old_page[i] != new_page[i]:
+            if begin is None:
+                begin = i
+        elif begin is not None:
+            ranges.append((base + begin, base + i))
+            begin = None
+    if begin is not None:
+        ranges.append((base + begin, base + min(old_page.Length, new_page.Length)))
+    return ranges
+
+def mc_memdiff(name, other = None):
+    snap = memsnap_find(name)
+    if snap is None:
+        print "No snapshot named %s" % name
+        return
+    ranges = []
+    if other is not None:
+        other_snap = memsnap_find(other)
+        if other_snap is None or other_snap["start"] != snap["start"] or other_snap["count"] != snap["count"]:
+            print "No snapshot named %s of the same range" % other
+            return
+        for index, (old_hash, new_hash) in enumerate(zip(snap["hashes"], other_snap["hashes"])):
+            if old_hash != new_hash:
+                offset = index * memsnap_page_size
+                ranges += memsnap_changed_ranges(snap["start"] + offset, min(memsnap_page_size, snap["count"] - offset), snap["pages"].get(index), other_snap["pages"].get(index))
+    else:
+        md5 = System.Security.Cryptography.MD5.Create()
+        def compare_page(index, data, offset, length):
+            if System.BitConverter.ToString(md5.ComputeHash(data, offset, length)) != snap["hashes"][index]:
+                ranges.extend(memsnap_changed_ranges(snap["start"] + index * memsnap_page_size, length, snap["pages"].get(index), memsnap_copy(data, offset, length)))
+        memsnap_read(self.Machine["sysbus"], snap["start"], snap["count"], compare_page)
+    # adjacent ranges are printed as one
+    merged = []
+    for begin, end in ranges:
+        if merged and merged[-1][1] == begin:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((begin, end))
+    for begin, end in merged:
+        print "0x%08X - 0x%08X (0x%X bytes)" % (begin, end - 1, end - begin)
+    print "%d changed ranges" % len(merged)
+
+def mc_memsnap_list():
+    for snap in memsnaps:
+        print "%s: 0x%08X, 0x%X bytes, %d stored pages, %d bytes used" % (snap["name"], snap["start"], snap["count"], len(snap["pages"]), memsnap_size(snap))
+
+def mc_memsnap_drop(name):
+    snap = memsnap_find(name)
+    if snap is not None:
+        memsnaps.remove(snap)
+
+def mc_memsnap_budget(budget_val):
+    global memsnap_budget
+    memsnap_budget = int(budget_val)
+
+def pyprofile_rows():
+    for counters in Emul8.Core.PythonEngineProfiler.GetCounters():
+        yield counters.Kind, counters.Name, counters.Invocations, counters.TotalTime.TotalMilliseconds, counters.MaxTime.TotalMilliseconds, counters.Exceptions
+
+def pyprofile_json_string(value):
+    return '"%s"' % value.replace("\\", "\\\\").replace('"', '\\"')
+
+def mc_pyprofile(action = "show", arg = None):
+    profiler = Emul8.Core.PythonEngineProfiler
+    if action == "on" or action == "off":
+        profiler.Enabled = action == "on"
+    elif action == "reset":
+        profiler.Reset()
+    elif action == "show":
+        rows = list(pyprofile_rows())[:int(arg) if arg is not None else 20]
+        print "%-26s %-32s %10s %12s %10s %10s %6s" % ("Kind", "Name", "Calls", "Total [ms]", "Avg [us]", "Max [ms]", "Errors")
+        for kind, name, calls, total, maximum, errors in rows:
+            print "%-26s %-32s %10d %12.3f %10.3f %10.3f %6d" % (kind, name, calls, total, 1000.0 * total / calls if calls else 0, maximum, errors)
+        if not profiler.Enabled:
+            print "Profiling is disabled, enable it with `pyprofile on`."
+    elif action == "export" and arg is not None:
+        with open(arg, "w") as output:
+            if arg.endswith(".json"):
+                entries = ['{"kind": %s, "name": %s, "calls": %d, "total_ms": %f, "max_ms": %f, "errors": %d}' % (pyprofile_json_string(kind), pyprofile_json_string(name), calls, total, maximum, errors) for kind, name, calls, total, maximum, errors in pyprofile_rows()]
+                output.write("[\n  %s\n]\n" % ",\n  ".join(entries))
+            else:
+                # names are script paths or hook descriptions, they can contain separators and quotes
+                writer = csv.writer(output, lineterminator="\n")
+                writer.writerow(["kind", "name", "calls", "total_ms", "max_ms", "errors"])
+                for kind, name, calls, total, maximum, errors in pyprofile_rows():
+                    writer.writerow([kind, name, calls, "%f" % total, "%f" % maximum, errors])
+    else:
+        print "usage: pyprofile [on|off|show [count]|reset|export file.(csv|json)]"
+
+# shared with monitor scripts included later, e.g. Tools/benchmarks/benchmark_monitor.py
+def find_peripheral(machine, name):
+    for candidate in [name, "sysbus." + name]:
+        try:
+            return machine[candidate]
+        except Exception:
+            pass
+    return None
+
+# set by the tests engine; "off" disables snapshots, so that scenarios are always booted
+snapshot_cache_variable = "EMUL8_SNAPSHOT_CACHE"
+
+def mc_snapshot_boot(name, scenario, console, marker, timeout_val = 600):
+    emulation_manager = Emul8.Core.EmulationManager.Instance
+    directory = System.Environment.GetEnvironmentVariable(snapshot_cache_variable)
+    if directory is None:
+        directory = System.IO.Path.Combine(System.IO.Path.GetTempPath(), "emul8-snapshots")
+    cache = Emul8.Testing.BootSnapshotCache(directory) if directory != "off" else None
+    key = cache.ComputeKey(scenario) if cache is not None else None
+    if cache is not None and cache.TryLoad(name, key):
+        # restored emulation is paused, just like a freshly booted one
+        self.Machine = list(emulation_manager.CurrentEmulation.Machines)[0]
+        print "Restored %s from snapshot" % name
+        return
+    if not monitor.TryExecuteScript(scenario):
+        return False
+    uart = find_peripheral(self.Machine, console)
+    if uart is None:
+        print "No UART named %s" % console
+        return False
+    if not Emul8.Testing.BootSnapshotCache.BootUntilLine(emulation_manager.CurrentEmulation, uart, marker, System.TimeSpan.FromSeconds(float(timeout_val))):
+        print "%s did not print `%s` in %s seconds" % (console, marker, timeout_val)
+        return False
+    if cache is not None:
+        cache.Save(name, key)
+        print "Booted %s and saved its snapshot" % name
 
 def mc_get_environ(variable):
     v = System.Environment.GetEnvironmentVariable(variable)
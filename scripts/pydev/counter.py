@@ -1,7 +1,16 @@
-if request.isInit:
+lastVal = -1
+
+def on_init():
+    global lastVal
     lastVal = -1
-else:
-    request.value = lastVal + 1
+
+def on_read(offset, length):
+    global lastVal
     lastVal += 1
+    log(LogLevel.Debug, "READ COUNTER 0x%x val 0x%x", offset, lastVal)
+    return lastVal
 
-self.DebugLog("%s COUNTER 0x%x val 0x%x" % (str(request.type), request.offset, request.value))
+def on_write(offset, length, value):
+    global lastVal
+    lastVal += 1
+    log(LogLevel.Debug, "WRITE COUNTER 0x%x val 0x%x", offset, lastVal)
@@ -1,6 +1,18 @@
-if request.isInit:
+lastVal = 0
+
+def on_init():
+	global lastVal
 	lastVal = 0
-else:
+
+def on_read(offset, length):
+	global lastVal
 	lastVal = 1 - lastVal
-	request.value = lastVal * 0xFFFFFFFF
-self.NoisyLog("%s FLIPFLOP 0x%x val 0x%x" % (str(request.type), request.offset, request.value))
+	value = lastVal * 0xFFFFFFFF
+	log(LogLevel.Noisy, "READ FLIPFLOP 0x%x val 0x%x", offset, value)
+	return value
+
+def on_write(offset, length, value):
+	global lastVal
+	lastVal = 1 - lastVal
+	if is_enabled(LogLevel.Noisy):
+		log(LogLevel.Noisy, "WRITE FLIPFLOP 0x%x val 0x%x", offset, lastVal * 0xFFFFFFFF)
@@ -1,6 +1,12 @@
-if request.isInit:
+lastVal = 0
+
+def on_init():
+    global lastVal
     lastVal = 0
-elif request.isRead:
-    request.value = lastVal
-elif request.isWrite:
-    lastVal = request.value
+
+def on_read(offset, length):
+    return lastVal
+
+def on_write(offset, length, value):
+    global lastVal
+    lastVal = value
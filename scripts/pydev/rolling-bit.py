@@ -1,8 +1,16 @@
-if request.isInit:
+lastVal = 0
+
+def on_init():
+	global lastVal
 	lastVal = 0
-else:
-        if lastVal == 0:
-            lastVal = 1
-        else:
-            lastVal = (lastVal << 1) & 0xFFFFFFFF
-        request.value = lastVal
+
+def on_read(offset, length):
+	global lastVal
+	if lastVal == 0:
+		lastVal = 1
+	else:
+		lastVal = (lastVal << 1) & 0xFFFFFFFF
+	return lastVal
+
+def on_write(offset, length, value):
+	on_read(offset, length)